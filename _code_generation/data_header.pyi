@@ -0,0 +1,14 @@
+# NOTE: This file is auto-generated by _code_generation/rcsb_data_classes.py. Do not edit directly.
+# Type stub for `rcsb.data`: the schema classes are built lazily at runtime from `_data_schema.TYPES`.
+from ._batching import AdaptiveBatchSize as AdaptiveBatchSize
+from ._cache import ResponseCache as ResponseCache
+from ._compiled import CompiledQuery as CompiledQuery
+from ._estimate import QueryEstimate as QueryEstimate, SizeHistory as SizeHistory
+from ._http import AsyncClient as AsyncClient, Client as Client, get_client as get_client, set_client as set_client
+from ._json import JSONDecoder as JSONDecoder
+from ._node import RCSB_ARGUMENT_TYPES as RCSB_ARGUMENT_TYPES, QueryNode as QueryNode, ScalarNode as ScalarNode
+from ._ratelimit import RateLimiter as RateLimiter
+from ._retry import RetryPolicy as RetryPolicy
+
+# --- Generated Schema Classes ---
+
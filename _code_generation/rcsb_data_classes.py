@@ -4,11 +4,16 @@ import keyword
 import pathlib
 
 INPUT_FILE = "resources/data_api_schema.json"
-OUTPUT_FILE = "src/rcsb/data.py"
+SCHEMA_FILE = "src/rcsb/_data_schema.py"
+STUB_FILE = "src/rcsb/data.pyi"
 
-HEADER_FILE = "_code_generation/data_header.py"
+HEADER_FILE = "_code_generation/data_header.pyi"
+
+QUERY_ROOT = "Query"
 
 def make_code():
+    """Write the compact schema table `data.py` builds classes from lazily,
+    and the `data.pyi` stub that gives IDEs the full class definitions."""
     with open(INPUT_FILE, "r") as f:
         data = json.load(f)
 
@@ -18,48 +23,124 @@ def make_code():
 
     class_map, parent_map = first_pass(types)
 
+    schema_lines = make_schema(class_map)
+    with open(SCHEMA_FILE, "w", encoding="utf-8") as f:
+        f.write("\n".join(schema_lines))
+    print(f"Generated {SCHEMA_FILE}")
+
     with open(HEADER_FILE, 'r') as f:
         lines = [f.read()]
-    
-    query_root = "Query"
-    
+
     for name, t_def in class_map.items():
         parent_cls = parent_map.get(name, "QueryNode")
-        if name == query_root:
+        if name == QUERY_ROOT:
             parent_cls = "QueryNode"
-        
+
         lines.extend(make_class(name, t_def))
         lines.extend(make_end_property(parent_cls))
-        
-
-        fields = t_def.get("fields", [])
-        if not fields:
-            lines.append("\tpass")
 
-        for f in fields:
-            f_target = get_type_name(f["type"])
-            is_scalar = f_target not in class_map
-            config = {
-                "f_name": f["name"],
-                "f_doc": clean_doc(f.get("description")),
-                "f_target": f_target,
-                "ret_type": f_target if not is_scalar else name,
-                "is_scalar": is_scalar
-            }
-            
-            has_args = len(f.get("args", [])) > 0
-            if has_args:
+        for config in field_configs(name, t_def, class_map):
+            if config.pop("has_args"):
                 lines.extend(make_method(**config))
             else:
                 lines.extend(make_property(**config))
-                
+
         lines.append("")
 
-    lines.extend(make_querybuilder(query_root))
+    lines.extend(make_querybuilder(QUERY_ROOT))
 
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+    with open(STUB_FILE, "w", encoding="utf-8") as f:
         f.write("\n".join(lines))
-    print(f"Generated {OUTPUT_FILE}")
+    print(f"Generated {STUB_FILE}")
+
+
+def field_configs(name: str, t_def: dict, class_map: dict) -> list:
+    configs = []
+    for f in t_def.get("fields", []):
+        f_target = get_type_name(f["type"])
+        is_scalar = f_target not in class_map
+        configs.append({
+            "f_name": f["name"],
+            "f_doc": clean_doc(f.get("description")),
+            "f_target": f_target,
+            "ret_type": f_target if not is_scalar else name,
+            "is_scalar": is_scalar,
+            "has_args": len(f.get("args", [])) > 0,
+        })
+    return configs
+
+
+def make_schema(class_map: dict) -> list:
+    """Schema table: type name -> (docstring, fields), where each field is
+    (name, target type or `None` for scalars, takes arguments, docstring)."""
+    lines = [
+        "# NOTE: This file is auto-generated by _code_generation/rcsb_data_classes.py. Do not edit directly.",
+        "",
+        f"ROOT = {QUERY_ROOT!r}",
+        "",
+        "TYPES = {",
+    ]
+    for name, t_def in class_map.items():
+        lines.append(f"    {name!r}: ({clean_doc(t_def.get('description'))!r}, (")
+        for config in field_configs(name, t_def, class_map):
+            target = None if config["is_scalar"] else config["f_target"]
+            lines.append(f"        ({config['f_name']!r}, {target!r}, {config['has_args']!r}, {config['f_doc']!r}),")
+        lines.append("    )),")
+    lines.append("}")
+    lines.append("")
+    lines.extend(make_arguments(class_map))
+    lines.extend(make_list_fields(class_map))
+    return lines
+
+
+def make_list_fields(class_map: dict) -> list:
+    """Fields that return lists, per type; used to estimate response sizes."""
+    lines = ["LIST_FIELDS = {"]
+    for name, t_def in class_map.items():
+        fields = tuple(f["name"] for f in t_def.get("fields", []) if is_list(f["type"]))
+        if fields:
+            lines.append(f"    {name!r}: {fields!r},")
+    lines.append("}")
+    lines.append("")
+    return lines
+
+
+def is_list(t) -> bool:
+    while t.get("kind") == "NON_NULL":
+        t = t["ofType"]
+    return t.get("kind") == "LIST"
+
+
+def make_arguments(class_map: dict) -> list:
+    """Argument index used for client-side validation:
+    type name -> field -> argument -> (GraphQL type, required)."""
+    lines = [
+        "ARGUMENTS = {",
+    ]
+    for name, t_def in class_map.items():
+        fields = [f for f in t_def.get("fields", []) if f.get("args")]
+        if not fields:
+            continue
+        lines.append(f"    {name!r}: {{")
+        for f in fields:
+            args = {
+                a["name"]: (type_string(a["type"]), a["type"].get("kind") == "NON_NULL" and a.get("defaultValue") is None)
+                for a in f["args"]
+            }
+            lines.append(f"        {f['name']!r}: {args!r},")
+        lines.append("    },")
+    lines.append("}")
+    lines.append("")
+    return lines
+
+
+def type_string(t) -> str:
+    """GraphQL type reference as written in a query, e.g. `[String!]!`."""
+    if t.get("kind") == "NON_NULL":
+        return type_string(t["ofType"]) + "!"
+    if t.get("kind") == "LIST":
+        return f"[{type_string(t['ofType'])}]"
+    return t.get("name") or "Any"
 
 
 def clean_doc(desc):
@@ -115,39 +196,27 @@ def make_end_property(parent_cls):
     lines.append(f"\t@property")
     lines.append(f"\tdef end(self) -> '{parent_cls}':")
     lines.append(f"\t\t\"\"\"Return to parent ({parent_cls})\"\"\"")
-    lines.append(f"\t\treturn self._parent if self._parent else self")
     return lines
 
 
-def make_method(f_name: str, f_doc: str, f_target: str, ret_type: str, is_scalar: str):
-    """Generates a method for fields that require arguments."""
-    lines = [
+def make_method(f_name: str, f_doc: str, f_target: str, ret_type: str, is_scalar: bool) -> list:
+    """Generates a method stub for fields that require arguments."""
+    f_name = f"{f_name}_" if keyword.iskeyword(f_name) else f_name
+    return [
         f"\tdef {f_name}(self, **kwargs) -> '{ret_type}':",
         f"\t\t\"\"\"{f_doc}\"\"\""
     ]
-    if is_scalar:
-        lines.append(f"\t\tself._enter('{f_name}', QueryNode, **kwargs)")
-        lines.append(f"\t\treturn self")
-    else:
-        lines.append(f"\t\treturn self._enter('{f_name}', {f_target}, **kwargs)")
-    return lines
 
 
 def make_property(f_name: str, f_doc: str, f_target: str, ret_type: str, is_scalar: bool) -> list:
-    """Generates a property for fields without arguments."""
+    """Generates a property stub for fields without arguments."""
     f_name = f"{f_name}_" if keyword.iskeyword(f_name) else f_name # class is a property 
 
-    lines = [
+    return [
         f"\t@property",
         f"\tdef {f_name}(self) -> '{ret_type}':",
         f"\t\t\"\"\"{f_doc}\"\"\""
     ]
-    if is_scalar:
-        lines.append(f"\t\tself._enter('{f_name}', Query)")
-        lines.append(f"\t\treturn self")
-    else:
-        lines.append(f"\t\treturn self._enter('{f_name}', {f_target})")
-    return lines
 
 
 def make_querybuilder(query_root: str) -> list:
@@ -155,7 +224,7 @@ def make_querybuilder(query_root: str) -> list:
     return [
         f"def QueryBuilder() -> {query_root}:",
         f"\t\"\"\"Initializes a new GraphQL query builder root.\"\"\"",
-        f"\treturn {query_root}(name=None)"
+        ""
     ]
 
 if __name__ == "__main__":
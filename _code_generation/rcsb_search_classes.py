@@ -1,22 +1,36 @@
 import json
+import keyword
 import os
 import sys
 
 INPUT_FILE = "resources/structure_schema.json"
-HEADER_FILE = "_code_generation/search_header.py"
-OUTPUT_FILE = "src/rcsb/search.py"
+HEADER_FILE = "_code_generation/search_header.pyi"
+SCHEMA_FILE = "src/rcsb/_search_schema.py"
+STUB_FILE = "src/rcsb/search.pyi"
 
 
 def get_class_name(path):
     if not path: return "AttributesRoot"
     return "Attr_" + ''.join(p.capitalize() for p in path.split('.')[-1].split('_'))
 
+def attribute_name(key, path):
+    """Python identifier for field `key` of the object at `path`: keywords get a
+    trailing `_` (`class_`), names starting with a digit are prefixed with the first
+    word of their parent (`em_3d_fitting_list.3d_fitting_id` -> `em_3d_fitting_id`)."""
+    if keyword.iskeyword(key):
+        return f"{key}_"
+    if key[:1].isdigit():
+        return f"{path.split('.')[-1].split('_')[0]}_{key}"
+    return key
+
 def clean_doc(s):
     if not s: return ""
     # Escape triple quotes to prevent syntax errors in the generated python file
     return s.replace('"', "'").replace('\\', '/').replace('\n', ' ').strip()
 
 def run_generator():
+    """Write the deduplicated shape table `search.py` builds its attribute tree from,
+    and the `search.pyi` stub with one class per shape for IDEs."""
     if not os.path.exists(INPUT_FILE):
         print(f"Error: {INPUT_FILE} not found.")
         return
@@ -25,10 +39,9 @@ def run_generator():
     with open(INPUT_FILE, "r", encoding='utf-8') as f:
         schema = json.load(f)
 
-    with open(HEADER_FILE, 'r') as header:
-        generated_code = [header.read()]
-
-    seen_classes = {}
+    shapes = [] # (class name, doc, ((attribute, JSON key, child shape index or None, doc), ...))
+    shape_index = {} # (doc, fields) -> index; identical subtrees share one shape
+    class_names = {}
 
     def walk(node, path=""):
         # Merge properties from current node and branches
@@ -45,19 +58,10 @@ def run_generator():
         if not props:
             return None
 
-        # Class Generation
-        raw_name = get_class_name(path)
-        cls_name = f"{raw_name}_{abs(hash(path))}"
-        
-        if path in seen_classes:
-            return seen_classes[path]
-
-        lines = [f"class {cls_name}:"]
-        lines.append(f"    \"\"\"{clean_doc(node.get('description', ''))}\"\"\"")
-
+        fields = []
         for key, val in props.items():
             full_path = f"{path}.{key}" if path else key
-            
+
             # Heuristic: Object vs Attribute
             is_obj = False
             if val.get("type") == "object": is_obj = True
@@ -65,33 +69,63 @@ def run_generator():
             elif val.get("properties") or any(b in val for b in ["oneOf", "anyOf", "allOf"]): is_obj = True
 
             doc = clean_doc(val.get("description", ""))
+            name = attribute_name(key, path)
 
             if is_obj:
-                child_cls = walk(val, full_path)
-                if child_cls:
-                    lines.append(f"    @property")
-                    lines.append(f"    def {key}(self) -> '{child_cls}':")
-                    lines.append(f"        \"\"\"{doc}\"\"\"")
-                    lines.append(f"        return {child_cls}()")
+                child = walk(val, full_path)
+                if child is not None:
+                    fields.append((name, key, child, doc))
             else:
-                lines.append(f"    @property")
-                lines.append(f"    def {key}(self):")
-                lines.append(f"        \"\"\"{doc}\"\"\"")
-                lines.append(f"        return Attribute('{full_path}')")
-
-        generated_code.append("\n".join(lines))
-        seen_classes[path] = cls_name
-        return cls_name
+                fields.append((name, key, None, doc))
+
+        doc = clean_doc(node.get('description', ''))
+        key = (doc, tuple(fields))
+        if key not in shape_index:
+            raw_name = get_class_name(path)
+            count = class_names[raw_name] = class_names.get(raw_name, 0) + 1
+            cls_name = raw_name if count == 1 else f"{raw_name}_{count}"
+            shape_index[key] = len(shapes)
+            shapes.append((cls_name, doc, tuple(fields)))
+        return shape_index[key]
 
     print("Traversing schema tree...")
-    root_cls = walk(schema)
-
-    print(f"Writing {OUTPUT_FILE}...")
-    with open(OUTPUT_FILE, "w", encoding='utf-8') as f:
+    root = walk(schema)
+
+    print(f"Writing {SCHEMA_FILE}...")
+    lines = [
+        "# NOTE: This file is auto-generated by _code_generation/rcsb_search_classes.py. Do not edit directly.",
+        "# Shape: (class name, doc, ((attribute, JSON key, child shape index or None for attributes, doc), ...))",
+        "",
+        f"ROOT = {root}",
+        "",
+        "SHAPES = (",
+    ]
+    for cls_name, doc, fields in shapes:
+        lines.append(f"    ({cls_name!r}, {doc!r}, (")
+        for field in fields:
+            lines.append(f"        {field!r},")
+        lines.append("    )),")
+    lines.append(")")
+    with open(SCHEMA_FILE, "w", encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+
+    print(f"Writing {STUB_FILE}...")
+    with open(HEADER_FILE, 'r') as header:
+        generated_code = [header.read()]
+    for cls_name, doc, fields in shapes:
+        lines = [f"class {cls_name}(AttributeGroup):"]
+        lines.append(f"    \"\"\"{doc}\"\"\"")
+        for name, key, child, f_doc in fields:
+            ret_type = shapes[child][0] if child is not None else "Attribute"
+            lines.append(f"    @property")
+            lines.append(f"    def {name}(self) -> '{ret_type}':")
+            lines.append(f"        \"\"\"{f_doc}\"\"\"")
+        generated_code.append("\n".join(lines))
+    with open(STUB_FILE, "w", encoding='utf-8') as f:
         f.write("\n\n".join(generated_code) + "\n\n")
-        f.write(f"attrs = {root_cls}()\n")
+        f.write(f"attrs: {shapes[root][0]}\n")
     
-    print("Done!")
+    print(f"Done! {len(shapes)} shapes")
 
 if __name__ == "__main__":
     run_generator()
@@ -0,0 +1,18 @@
+# NOTE: This file is auto-generated by _code_generation/rcsb_search_classes.py. Do not edit directly.
+# Type stub for `rcsb.search`: the attribute tree is built lazily at runtime from `_search_schema.SHAPES`.
+from ._search import (
+    Attribute as Attribute,
+    AttributeField as AttributeField,
+    AttributeGroup as AttributeGroup,
+    ChemicalQuery as ChemicalQuery,
+    FullTextQuery as FullTextQuery,
+    GroupNode as GroupNode,
+    MotifQuery as MotifQuery,
+    SearchNode as SearchNode,
+    SearchRequest as SearchRequest,
+    SequenceQuery as SequenceQuery,
+    StructureMotifQuery as StructureMotifQuery,
+    TerminalNode as TerminalNode,
+)
+
+# --- Generated Classes ---
@@ -0,0 +1,79 @@
+"""Query builder construction benchmark.
+
+Builds wide trees (many scalar fields under one node) and deep trees (long
+chains of nested nodes), then re-requests every field to exercise
+deduplication in `QueryNode._enter`. Time per field should stay flat as the
+trees grow. Also reports the memory held by each tree.
+
+    python benchmarks/bench_builder.py
+"""
+import time
+import tracemalloc
+
+from rcsb.data import Query, QueryNode, ScalarNode
+
+
+def build_wide(n_fields: int) -> QueryNode:
+    root = Query()
+    node = root.entries(entry_ids="$ids")
+    for i in range(n_fields):
+        node._enter(f"field_{i}", ScalarNode)
+    for i in range(n_fields): # dedup hits
+        node._enter(f"field_{i}", ScalarNode)
+    return root
+
+
+def build_deep(depth: int, width: int = 10) -> QueryNode:
+    root = Query()
+    node = root.entries(entry_ids="$ids")
+    for d in range(depth):
+        for i in range(width):
+            node._enter(f"field_{i}", ScalarNode)
+        node = node._enter(f"level_{d}", QueryNode)
+    return root
+
+
+def timeit(fn, *args, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def memory(fn, *args) -> int:
+    tracemalloc.start()
+    tree = fn(*args)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return size
+
+
+def time_render(root: QueryNode, repeat: int = 5) -> float:
+    # The synthetic field names are not in the schema, so time the tree walk that
+    # `render` does after validation.
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        root._render_node(indent=2)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    print(f"{'tree':<6} {'size':>6} {'build ms':>10} {'us/field':>10} {'render ms':>10} {'KiB':>10}")
+    for n in (100, 1000, 5000, 20000):
+        seconds = timeit(build_wide, n)
+        render = time_render(build_wide(n))
+        kib = memory(build_wide, n) / 1024
+        print(f"{'wide':<6} {n:>6} {seconds * 1e3:>10.2f} {seconds / (2 * n) * 1e6:>10.2f} {render * 1e3:>10.2f} {kib:>10.1f}")
+    for depth in (10, 100, 500):
+        seconds = timeit(build_deep, depth)
+        kib = memory(build_deep, depth) / 1024
+        print(f"{'deep':<6} {depth:>6} {seconds * 1e3:>10.2f} {seconds / (11 * depth) * 1e6:>10.2f} {'':>10} {kib:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
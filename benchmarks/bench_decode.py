@@ -0,0 +1,106 @@
+"""Response decoding benchmark.
+
+Decodes batch response bodies with every installed `JSONDecoder` backend and
+reports throughput, then compares buffering a body against streaming it in
+64 KB chunks (`process(..., stream=True)`): time until the first entry is
+available, total time, and peak memory. Pass files holding recorded Data API
+responses (e.g. saved `response.content` of `process` batches); without
+arguments, a synthetic `entries` response of the same shape is used.
+
+    python benchmarks/bench_decode.py [response.json ...]
+"""
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from rcsb._http import STREAM_CHUNK_BYTES
+from rcsb._json import JSONDecoder, available_backends
+
+
+def synthetic_response(n_entries: int = 200, n_features: int = 40) -> bytes:
+    # Mirrors `entries { rcsb_id struct { title } polymer_entities { ... features } }`.
+    rng = random.Random(0)
+
+    def feature(i):
+        return {
+            "type": rng.choice(["SHEET", "HELIX_P", "UNASSIGNED_SEC_STRUCT"]),
+            "name": f"feature {i}",
+            "provenance_source": "PROMOTIF",
+            "feature_positions": [{"beg_seq_id": rng.randint(1, 500), "end_seq_id": rng.randint(1, 500), "values": [rng.random() for _ in range(4)]}],
+        }
+
+    def entry(i):
+        return {
+            "rcsb_id": f"{i:04X}",
+            "struct": {"title": "CRYSTAL STRUCTURE OF A PROTEIN COMPLEX " * 2},
+            "rcsb_entry_info": {"resolution_combined": [rng.uniform(1, 4)], "polymer_entity_count": 2},
+            "polymer_entities": [
+                {
+                    "rcsb_id": f"{i:04X}_{e}",
+                    "entity_poly": {"pdbx_seq_one_letter_code_can": "".join(rng.choice("ACDEFGHIKLMNPQRSTVWY") for _ in range(300))},
+                    "polymer_entity_instances": [{"rcsb_polymer_instance_feature": [feature(f) for f in range(n_features)]}],
+                }
+                for e in range(1, 3)
+            ],
+        }
+
+    return json.dumps({"data": {"entries": [entry(i) for i in range(n_entries)]}}).encode()
+
+
+def bench(decoder: JSONDecoder, body: bytes, repeat: int) -> float:
+    for _ in range(repeat):
+        decoder.decode(body)
+    return decoder.mb_per_second
+
+
+def consume(chunks: list, streamed: bool):
+    """Returns (seconds to first entry, total seconds)."""
+    decoder = JSONDecoder()
+    started = time.perf_counter()
+    first = None
+    if streamed:
+        entries = decoder.iter_array(iter(chunks), ("data", "entries"))
+    else:
+        entries = decoder.decode(b"".join(chunks))["data"]["entries"]
+    for entry in entries:
+        if first is None:
+            first = time.perf_counter() - started
+    return first, time.perf_counter() - started
+
+
+def peak_memory(chunks: list, streamed: bool) -> int:
+    tracemalloc.start()
+    consume(chunks, streamed)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    if len(sys.argv) > 1:
+        bodies = [(path, Path(path).read_bytes()) for path in sys.argv[1:]]
+    else:
+        bodies = [("synthetic", synthetic_response())]
+
+    backends = available_backends()
+    print(f"{'response':<24} {'size':>9} " + " ".join(f"{b + ' MB/s':>13}" for b in backends) + f" {'speedup':>8}")
+    for name, body in bodies:
+        repeat = max(3, int(50e6 // len(body)))
+        rates = [bench(JSONDecoder(backend), body, repeat) for backend in backends]
+        speedup = rates[0] / rates[-1]
+        print(f"{Path(name).name[:24]:<24} {len(body) / 1e6:>7.1f}MB " + " ".join(f"{r:>13.0f}" for r in rates) + f" {speedup:>7.1f}x")
+
+    print(f"\n{'response':<24} {'mode':<9} {'first entry':>12} {'total':>9} {'peak MB':>8}")
+    for name, body in bodies:
+        chunks = [body[i:i + STREAM_CHUNK_BYTES] for i in range(0, len(body), STREAM_CHUNK_BYTES)]
+        for mode, streamed in (("buffered", False), ("streamed", True)):
+            first, total = min(consume(chunks, streamed) for _ in range(5))
+            peak = peak_memory(chunks, streamed)
+            print(f"{Path(name).name[:24]:<24} {mode:<9} {first * 1e3:>10.1f}ms {total * 1e3:>7.1f}ms {peak / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Import-time benchmark for `rcsb.data` and `rcsb.search`.
+
+Each measurement is a fresh interpreter, so it reflects what every worker
+process and CLI invocation pays. Bytecode is written to a temporary pycache
+prefix and warmed once, matching an installed package.
+
+The same cases are timed against a baseline revision (by default the first
+commit, whose `data.py` defines every schema class eagerly), exported from
+git into a temporary directory, so the table shows the comparison directly.
+Cases the baseline cannot run are shown as n/a.
+
+    python benchmarks/bench_import.py [--baseline REV]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+SRC = os.path.join(ROOT, "src")
+
+CASES = {
+    "import rcsb.data": "import rcsb.data",
+    "first query": "from rcsb.data import QueryBuilder; QueryBuilder().entries(entry_ids='$ids').rcsb_id.struct.title.end.end.render()",
+    "all classes": "import rcsb.data as d; [getattr(d, n) for n in dir(d)]",
+    "import rcsb.search": "import rcsb.search",
+    "first filter": "from rcsb.search import attrs; attrs.rcsb_entry_info.resolution_combined.less_than(2.0).to_dict()",
+}
+
+
+def run(code: str, env: dict) -> float:
+    """Wall seconds of `code` in a fresh interpreter, less interpreter startup."""
+    timed = f"import time; t = time.perf_counter(); {code}; print(time.perf_counter() - t)"
+    out = subprocess.run([sys.executable, "-c", timed], env=env, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def median_ms(code: str, env: dict, repeat: int):
+    """Median milliseconds of `code`, or `None` if it fails (e.g. not in the baseline)."""
+    try:
+        run(code, env) # warm the bytecode cache
+        return statistics.median(run(code, env) for _ in range(repeat)) * 1e3
+    except subprocess.CalledProcessError:
+        return None
+
+
+def export_src(rev: str, dest: str) -> str:
+    """Write `src/` as of git revision `rev` into `dest` and return its path."""
+    archive = subprocess.run(["git", "-C", ROOT, "archive", rev, "src"], capture_output=True, check=True)
+    subprocess.run(["tar", "-x", "-C", dest], input=archive.stdout, check=True)
+    return os.path.join(dest, "src")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    first_commit = subprocess.run(
+        ["git", "-C", ROOT, "rev-list", "--max-parents=0", "HEAD"], capture_output=True, text=True, check=True,
+    ).stdout.split()[0]
+    parser.add_argument("--baseline", default=first_commit, help="git revision to compare against")
+    parser.add_argument("--repeat", type=int, default=15)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        envs = {}
+        for label, src in (("baseline", export_src(args.baseline, tmp)), ("current", SRC)):
+            env = dict(os.environ, PYTHONPATH=src, PYTHONPYCACHEPREFIX=os.path.join(tmp, "pycache", label))
+            env.pop("PYTHONDONTWRITEBYTECODE", None)
+            envs[label] = env
+
+        print(f"baseline: {args.baseline[:12]}   (median ms over {args.repeat} fresh interpreters)")
+        print(f"{'case':<18} {'baseline':>10} {'current':>10} {'speedup':>8}")
+        for name, code in CASES.items():
+            before = median_ms(code, envs["baseline"], args.repeat)
+            after = median_ms(code, envs["current"], args.repeat)
+            speedup = f"{before / after:>7.1f}x" if before and after else f"{'-':>8}"
+            cells = [f"{ms:>10.1f}" if ms is not None else f"{'n/a':>10}" for ms in (before, after)]
+            print(f"{name:<18} {cells[0]} {cells[1]} {speedup}")
+
+
+if __name__ == "__main__":
+    main()
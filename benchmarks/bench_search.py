@@ -0,0 +1,44 @@
+"""Search attribute tree access benchmark.
+
+Times repeated access to nested attributes of `rcsb.search.attrs` and the
+memory allocated by doing so. Children are cached, so after the first access
+walking the same path should allocate nothing.
+
+    python benchmarks/bench_search.py
+"""
+import time
+import tracemalloc
+
+from rcsb.search import attrs
+
+N = 100_000
+
+
+def access():
+    return attrs.rcsb_entry_info.resolution_combined
+
+
+def deep_access():
+    return attrs.rcsb_polymer_instance_feature.feature_positions.beg_seq_id
+
+
+def main():
+    print(f"{'case':<14} {'ns/access':>10} {'bytes/access':>13}")
+    for name, fn in (("2 levels", access), ("3 levels", deep_access)):
+        fn() # build the classes and cache the children
+        started = time.perf_counter()
+        for _ in range(N):
+            fn()
+        seconds = time.perf_counter() - started
+
+        tracemalloc.start()
+        kept = [fn() for _ in range(1000)]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del kept
+        per_access = max(0, size - 1000 * 8) / 1000 # less the list slots
+        print(f"{name:<14} {seconds / N * 1e9:>10.0f} {per_access:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,11 @@
 from ._query import unwrap_query
+from ._batching import AdaptiveBatchSize
+from ._cache import ResponseCache
+from ._compiled import CompiledQuery
+from ._estimate import QueryEstimate, SizeHistory, get_size_history, set_size_history
+from ._http import AsyncClient, Client, get_client, set_client
+from ._json import JSONDecoder
+from ._ratelimit import RateLimiter
+from ._retry import RetryPolicy
 
-__all__ = ["unwrap_query"]
+__all__ = ["unwrap_query", "AdaptiveBatchSize", "AsyncClient", "Client", "CompiledQuery", "JSONDecoder", "QueryEstimate", "RateLimiter", "ResponseCache", "RetryPolicy", "SizeHistory", "get_client", "get_size_history", "set_client", "set_size_history"]
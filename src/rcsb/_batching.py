@@ -0,0 +1,137 @@
+import threading
+from typing import Optional, Union
+
+SPLIT_STATUSES = (413,)
+OVERLOAD_STATUSES = (429, 503) # the server is shedding load; smaller batches won't help
+MAX_RESPONSE_BYTES = 50_000_000 # default upper bound on the expected size of one response
+
+
+class FixedBatchSize:
+    """Constant batch size; the default sizing strategy of `QueryNode.process`."""
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {size}")
+        self.size = size
+
+    def next_size(self) -> int:
+        return self.size
+
+    def record(self, size: int, seconds: Optional[float] = None, nbytes: Optional[int] = None, error: bool = False):
+        pass
+
+
+class AdaptiveBatchSize:
+    """Batch size controller that aims for a target per-request latency.
+
+    After every request the observed seconds and bytes per input are folded
+    into exponential moving averages, and the next batch is sized so that a
+    request should take about `target_latency` seconds and return at most
+    `max_bytes`. Growth is capped at 2x per observation; a failed request
+    halves the size, and a high recent error rate keeps it smaller.
+
+    Args:
+        - target_latency: Desired seconds per request.
+        - initial: Size of the first batches, before anything is observed.
+        - min_size: Smallest batch ever sent.
+        - max_size: Largest batch ever sent.
+        - max_bytes: Upper bound on the expected response size. `None` for no bound.
+        - smoothing: Weight of the newest observation in the moving averages (0-1].
+    """
+    def __init__(
+        self,
+        target_latency: float = 10.0,
+        initial: int = 50,
+        min_size: int = 1,
+        max_size: int = 1000,
+        max_bytes: Optional[int] = MAX_RESPONSE_BYTES,
+        smoothing: float = 0.3,
+    ):
+        if not 1 <= min_size <= max_size:
+            raise ValueError(f"Expected 1 <= min_size <= max_size, got {min_size}, {max_size}")
+        self.target_latency = target_latency
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.smoothing = smoothing
+        self.size = self._clamp(initial)
+        self.seconds_per_input = None
+        self.bytes_per_input = None
+        self.error_rate = 0.0
+        self._lock = threading.Lock()
+
+    def _clamp(self, size: float) -> int:
+        return int(max(self.min_size, min(self.max_size, size)))
+
+    def _average(self, current: Optional[float], value: float) -> float:
+        if current is None:
+            return value
+        return self.smoothing * value + (1 - self.smoothing) * current
+
+    def next_size(self) -> int:
+        with self._lock:
+            return self.size
+
+    def record(self, size: int, seconds: Optional[float] = None, nbytes: Optional[int] = None, error: bool = False):
+        """Fold one finished request of `size` inputs into the controller."""
+        with self._lock:
+            self.error_rate = self._average(self.error_rate, 1.0 if error else 0.0)
+            if error:
+                self.size = self._clamp(min(self.size, size) // 2)
+                return
+            if size < 1 or seconds is None:
+                return
+
+            self.seconds_per_input = self._average(self.seconds_per_input, seconds / size)
+            ideal = self.target_latency / max(self.seconds_per_input, 1e-9)
+            if nbytes is not None:
+                self.bytes_per_input = self._average(self.bytes_per_input, nbytes / size)
+                if self.max_bytes is not None and self.bytes_per_input > 0:
+                    ideal = min(ideal, self.max_bytes / self.bytes_per_input)
+            ideal *= 1 - self.error_rate
+            self.size = self._clamp(min(ideal, 2 * self.size))
+
+
+def is_split_error(exc: BaseException) -> bool:
+    """Whether a failed batch may succeed if sent as smaller batches.
+
+    Timeouts, 5xx responses and 413 (payload too large) usually mean the batch
+    was too heavy, or contains an entry the server cannot render in time.
+    429 and 503 mean the server is overloaded, which splitting would only worsen.
+    """
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    if status is not None:
+        if status in OVERLOAD_STATUSES:
+            return False
+        return status in SPLIT_STATUSES or status >= 500
+    import requests
+    if isinstance(exc, requests.Timeout):
+        return True
+    return type(exc).__name__.endswith("Timeout") # e.g. httpx.ReadTimeout
+
+
+def failure_kind(exc: BaseException):
+    """HTTP status of a failed request, else the exception's type name. When both
+    halves of a split batch fail with the same kind, the failure does not depend on
+    the inputs (e.g. the server is down), so the batch is reported instead of split further."""
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if status is not None else type(exc).__name__
+
+
+def make_batch_sizer(batch_size: Union[int, str, None, FixedBatchSize, AdaptiveBatchSize], n_inputs: int, bytes_per_input: Optional[float] = None):
+    """Normalize the `batch_size` argument of `process` into a sizing strategy.
+    `bytes_per_input`, an estimated response size per input, keeps the default
+    and the initial adaptive size from asking for more than `MAX_RESPONSE_BYTES`."""
+    if batch_size is None:
+        size = min(n_inputs, 200)
+        if bytes_per_input:
+            size = min(size, int(MAX_RESPONSE_BYTES // bytes_per_input))
+        return FixedBatchSize(max(1, size))
+    if batch_size == "auto":
+        sizer = AdaptiveBatchSize()
+        if bytes_per_input:
+            sizer.bytes_per_input = bytes_per_input
+            sizer.size = sizer._clamp(min(sizer.size, sizer.max_bytes / bytes_per_input))
+        return sizer
+    if isinstance(batch_size, int):
+        return FixedBatchSize(batch_size)
+    return batch_size
@@ -0,0 +1,232 @@
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Optional, Union
+
+# hashlib, datetime, pathlib and sqlite3 are imported where used, so that
+# `import rcsb` stays cheap for code that never touches the cache.
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def default_cache_dir() -> "Path":
+    """`$XDG_CACHE_HOME/rcsb`, falling back to `~/.cache/rcsb`."""
+    from pathlib import Path
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "rcsb"
+
+
+RELEASE_WEEKDAY = 2 # RCSB PDB releases new and updated entries weekly, Wednesdays 00:00 UTC
+
+
+def next_release(now: Optional[float] = None) -> float:
+    """Timestamp of the next weekly PDB release boundary after `now`."""
+    from datetime import datetime, timedelta, timezone
+    now = datetime.fromtimestamp(time.time() if now is None else now, timezone.utc)
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    days = (RELEASE_WEEKDAY - now.weekday()) % 7
+    boundary = midnight + timedelta(days=days)
+    if boundary <= now:
+        boundary += timedelta(days=7)
+    return boundary.timestamp()
+
+
+def request_key(rendered_query: str, variables: Optional[dict]) -> str:
+    """Stable hash of a rendered query and its variables."""
+    import hashlib
+    payload = json.dumps([rendered_query, variables or {}], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def entity_key(root_signature: str, rcsb_id: str) -> str:
+    """Hash of a root field signature and one entity ID, for caching single entries."""
+    import hashlib
+    payload = f"entity\0{root_signature}\0{str(rcsb_id).upper()}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class CachedResponse:
+    """Minimal stand-in for an HTTP response served from a `ResponseCache`."""
+    from_cache = True
+    status_code = 200
+    request_seconds = None
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        pass
+
+
+class ResponseCache:
+    """Persistent SQLite cache of Data API response bodies.
+
+    Responses are keyed on a hash of (rendered query, variables). Entries older
+    than `ttl` are treated as misses, and once the stored bodies exceed
+    `max_bytes` the least recently used entries are evicted. Safe to share
+    between threads and between processes using the same file.
+
+    The cache also keeps a negative cache of IDs the API returned nothing for
+    (obsolete or nonexistent), which `process` leaves out of its requests.
+
+    Args:
+        - path: SQLite file. Defaults to `responses.sqlite` in `default_cache_dir()`.
+        - ttl: Seconds an entry stays valid. `None` for no expiry.
+        - max_bytes: Upper bound on the total size of stored bodies.
+        - missing_ttl: Seconds a known-missing ID is remembered. Defaults to `None`,
+            which expires them at the next weekly release boundary, when they may
+            be released.
+    """
+    def __init__(
+        self,
+        path: Union[str, os.PathLike, None] = None,
+        ttl: Optional[float] = 7 * 24 * 3600,
+        max_bytes: int = 1 << 30,
+        missing_ttl: Optional[float] = None,
+    ):
+        if path is None:
+            path = default_cache_dir() / "responses.sqlite"
+        from pathlib import Path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = str(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.missing_ttl = missing_ttl
+        self._lock = threading.Lock()
+        import sqlite3
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, body BLOB NOT NULL, size INTEGER NOT NULL,"
+            " created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS missing (key TEXT PRIMARY KEY, expires REAL NOT NULL)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS missing_expires ON missing (expires)")
+        # Running estimate of stored bytes; recounted before evicting, since other
+        # processes may write to the same file.
+        self._total = self._stored_bytes()
+
+    def _stored_bytes(self) -> int:
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the stored body for `key`, or `None` if absent or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT body, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            body, created = row
+            if self.ttl is not None and now - created > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        return body
+
+    def get_many(self, keys: list) -> dict:
+        """Return `{key: body}` for the keys that are present and not expired."""
+        now = time.time()
+        found = {}
+        expired = []
+        with self._lock:
+            for i in range(0, len(keys), 500): # stay under SQLite's parameter limit
+                chunk = keys[i:i + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(f"SELECT key, body, created FROM responses WHERE key IN ({marks})", chunk)
+                for key, body, created in rows:
+                    if self.ttl is not None and now - created > self.ttl:
+                        expired.append((key,))
+                    else:
+                        found[key] = body
+            if expired:
+                self._conn.executemany("DELETE FROM responses WHERE key = ?", expired)
+            if found:
+                self._conn.executemany("UPDATE responses SET accessed = ? WHERE key = ?", [(now, key) for key in found])
+        return found
+
+    def set(self, key: str, body: bytes):
+        """Store `body` under `key`, evicting least recently used entries if over `max_bytes`."""
+        self.set_many({key: body})
+
+    def set_many(self, items: dict):
+        """Store several `{key: body}` pairs in one transaction."""
+        now = time.time()
+        rows = [(key, body, len(body), now, now) for key, body in items.items() if len(body) <= self.max_bytes]
+        if not rows:
+            return
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO responses (key, body, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+            self._total += sum(row[2] for row in rows)
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        self._total = self._stored_bytes()
+        if self._total <= self.max_bytes:
+            return
+        excess = self._total - self.max_bytes
+        freed = 0
+        stale = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            stale.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+        self._total -= freed
+
+    def add_missing(self, keys: list):
+        """Remember `keys` as known-missing until `missing_ttl` (or the next release).
+        Expired keys are purged at the same time, so the table doesn't keep growing."""
+        if not keys:
+            return
+        now = time.time()
+        expires = now + self.missing_ttl if self.missing_ttl is not None else next_release(now)
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.execute("DELETE FROM missing WHERE expires <= ?", (now,))
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO missing (key, expires) VALUES (?, ?)",
+                    [(key, expires) for key in keys],
+                )
+
+    def get_missing(self, keys: list) -> set:
+        """Subset of `keys` currently known to be missing."""
+        now = time.time()
+        found = set()
+        with self._lock:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(f"SELECT key FROM missing WHERE key IN ({marks}) AND expires > ?", (*chunk, now))
+                found.update(key for (key,) in rows)
+        return found
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.execute("DELETE FROM missing")
+            self._total = 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
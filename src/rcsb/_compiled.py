@@ -0,0 +1,67 @@
+import json
+from typing import Optional
+
+
+class CompiledQuery:
+    """Immutable, picklable snapshot of a query tree produced by `QueryNode.compile()`.
+
+    Holds everything needed to send the query without walking the tree again:
+    the rendered query string, variable types, the plural root's result key and
+    batching variable, and a pre-encoded request body prefix. Safe to share
+    between threads and cheap to ship to worker processes.
+
+    Attributes:
+        - query: Rendered GraphQL query string.
+        - variables: Mapping of variable name to GraphQL type.
+        - result_key: Name of the root field (key of the response `data`).
+        - batch_var: Variable `process` batches over, or `None` if there is none.
+        - root_signature: Root field name and literal arguments, used as cache namespace.
+        - selection_json: Selection set below the root field, JSON encoded.
+    """
+    __slots__ = ("query", "variables", "result_key", "batch_var", "root_signature", "selection_json", "_body_prefix")
+
+    def __init__(
+        self,
+        query: str,
+        variables: dict,
+        result_key: Optional[str] = None,
+        batch_var: Optional[str] = None,
+        root_signature: Optional[str] = None,
+        selection_json: str = "{}",
+    ):
+        set_ = object.__setattr__
+        set_(self, "query", query)
+        set_(self, "variables", dict(variables))
+        set_(self, "result_key", result_key)
+        set_(self, "batch_var", batch_var)
+        set_(self, "root_signature", root_signature)
+        set_(self, "selection_json", selection_json)
+        # Byte for byte what `json.dumps({"query": ..., "variables": ...})` produces.
+        set_(self, "_body_prefix", b'{"query": ' + json.dumps(query).encode() + b', "variables": ')
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (type(self), (self.query, self.variables, self.result_key, self.batch_var, self.root_signature, self.selection_json))
+
+    def __eq__(self, other):
+        return isinstance(other, CompiledQuery) and self.__reduce__() == other.__reduce__()
+
+    def __hash__(self):
+        return hash(self.query)
+
+    def __repr__(self):
+        return f"CompiledQuery(result_key={self.result_key!r}, batch_var={self.batch_var!r}, variables={self.variables!r})"
+
+    @property
+    def selection(self) -> dict:
+        """A fresh copy of the selection set below the root field."""
+        return json.loads(self.selection_json)
+
+    def body(self, variables: Optional[dict] = None) -> bytes:
+        """Encoded JSON request body for `variables`, reusing the pre-encoded query."""
+        return self._body_prefix + json.dumps(variables or {}).encode() + b"}"
@@ -0,0 +1,3173 @@
+# NOTE: This file is auto-generated by _code_generation/rcsb_data_classes.py. Do not edit directly.
+
+ROOT = 'Query'
+
+TYPES = {
+    'AuditAuthor': ('', (
+        ('identifier_ORCID', None, False, 'The Open Researcher and Contributor ID (ORCID).  Examples: 0000-0002-6681-547X '),
+        ('name', None, False, "The name of an author of this data block. If there are multiple  authors, _audit_author.name is looped with _audit_author.address.  The family name(s), followed by a comma and including any  dynastic components, precedes the first name(s) or initial(s).  Examples: Jones, T.J., Bleary, Percival R., O'Neil, F.K., Van den Bossche, G., Yang, D.-L., Simonov, Yu.A "),
+        ('pdbx_ordinal', None, False, "This data item defines the order of the author's name in the  list of audit authors."),
+    )),
+    'Cell': ('', (
+        ('Z_PDB', None, False, 'The number of the polymeric chains in a unit cell. In the case  of heteropolymers, Z is the number of occurrences of the most  populous chain.   This data item is provided for compatibility with the original  Protein Data Bank format, and only for that purpose.'),
+        ('angle_alpha', None, False, 'Unit-cell angle alpha of the reported structure in degrees.'),
+        ('angle_beta', None, False, 'Unit-cell angle beta of the reported structure in degrees.'),
+        ('angle_gamma', None, False, 'Unit-cell angle gamma of the reported structure in degrees.'),
+        ('formula_units_Z', None, False, 'The number of the formula units in the unit cell as specified  by _chemical_formula.structural, _chemical_formula.moiety or  _chemical_formula.sum.'),
+        ('length_a', None, False, 'Unit-cell length a corresponding to the structure reported in angstroms.'),
+        ('length_b', None, False, 'Unit-cell length b corresponding to the structure reported in  angstroms.'),
+        ('length_c', None, False, 'Unit-cell length c corresponding to the structure reported in angstroms.'),
+        ('pdbx_unique_axis', None, False, "To further identify unique axis if necessary.  E.g., P 21 with  an unique C axis will have 'C' in this field."),
+        ('volume', None, False, 'Cell volume V in angstroms cubed.   V = a b c (1 - cos^2^~alpha~ - cos^2^~beta~ - cos^2^~gamma~             + 2 cos~alpha~ cos~beta~ cos~gamma~)^1/2^   a     = _cell.length_a  b     = _cell.length_b  c     = _cell.length_c  alpha = _cell.angle_alpha  beta  = _cell.angle_beta  gamma = _cell.angle_gamma'),
+    )),
+    'ChemComp': ('', (
+        ('formula', None, False, "The formula for the chemical component. Formulae are written  according to the following rules:   (1) Only recognized element symbols may be used.   (2) Each element symbol is followed by a 'count' number. A count     of '1' may be omitted.   (3) A space or parenthesis must separate each cluster of     (element symbol + count), but in general parentheses are     not used.   (4) The order of elements depends on whether carbon is     present or not. If carbon is present, the order should be:     C, then H, then the other elements in alphabetical order     of their symbol. If carbon is not present, the elements     are listed purely in alphabetic order of their symbol. This     is the 'Hill' system used by Chemical Abstracts.  Examples: C18 H19 N7 O8 S "),
+        ('formula_weight', None, False, 'Formula mass of the chemical component.  Examples: null, null '),
+        ('id', None, False, 'The value of _chem_comp.id must uniquely identify each item in  the CHEM_COMP list.   For protein polymer entities, this is the three-letter code for  the amino acid.   For nucleic acid polymer entities, this is the one-letter code  for the base.  Examples: ALA, VAL, DG, C '),
+        ('mon_nstd_parent_comp_id', None, False, 'The identifier for the parent component of the nonstandard  component. May be be a comma separated list if this component  is derived from multiple components.   Items in this indirectly point to _chem_comp.id in  the CHEM_COMP category.'),
+        ('name', None, False, 'The full name of the component.  Examples: alanine, valine, adenine, cytosine '),
+        ('one_letter_code', None, False, "For standard polymer components, the one-letter code for  the component.   For non-standard polymer components, the  one-letter code for parent component if this exists;  otherwise, the one-letter code should be given as 'X'.   Components that derived from multiple parents components  are described by a sequence of one-letter-codes.  Examples: A, B, R, N, D, C, Q, E, Z, G, H, I, L, K, M, F, P, S, T, W, Y, V, U, O, X "),
+        ('pdbx_ambiguous_flag', None, False, 'A preliminary classification used by PDB to indicate  that the chemistry of this component while described  as clearly as possible is still ambiguous.  Software  tools may not be able to process this component  definition.'),
+        ('pdbx_formal_charge', None, False, 'The net integer charge assigned to this component. This is the  formal charge assignment normally found in chemical diagrams.'),
+        ('pdbx_initial_date', None, False, 'Date component was added to database.'),
+        ('pdbx_modified_date', None, False, 'Date component was last modified.'),
+        ('pdbx_processing_site', None, False, 'This data item identifies the deposition site that processed  this chemical component defintion.  Allowable values: EBI, PDBC, PDBE, PDBJ, RCSB '),
+        ('pdbx_release_status', None, False, 'This data item holds the current release status for the component.  Allowable values: DEL, HOLD, HPUB, OBS, REF_ONLY, REL '),
+        ('pdbx_replaced_by', None, False, 'Identifies the _chem_comp.id of the component that  has replaced this component.  Examples: q11, tvx '),
+        ('pdbx_replaces', None, False, "Identifies the _chem_comp.id's of the components  which have been replaced by this component.  Multiple id codes should be separated by commas.  Examples: q11, tvx,atv "),
+        ('pdbx_subcomponent_list', None, False, 'The list of subcomponents contained in this component.  Examples: TSM DPH HIS CHF EMR '),
+        ('three_letter_code', None, False, "For standard polymer components, the common three-letter code for  the component.   Non-standard polymer components and non-polymer  components are also assigned three-letter-codes.   For ambiguous polymer components three-letter code should  be given as 'UNK'.  Ambiguous ions are assigned the code 'UNX'.  Ambiguous non-polymer components are assigned the code 'UNL'.  Examples: ALA, ARG, ASN, ASP, ASX, CYS, GLN, GLU, GLY, GLX, HIS, ILE, LEU, LYS, MET, PHE, PRO, SER, THR, TRP, TYR, VAL, 1MA, 5MC, OMC, 1MG, 2MG, M2G, 7MG, 0MG, H2U, 5MU, PSU, ACE, FOR, HOH, UNK "),
+        ('type', None, False, "For standard polymer components, the type of the monomer.  Note that monomers that will form polymers are of three types:  linking monomers, monomers with some type of N-terminal (or 5')  cap and monomers with some type of C-terminal (or 3') cap.  Allowable values: D-beta-peptide, C-gamma linking, D-gamma-peptide, C-delta linking, D-peptide COOH carboxy terminus, D-peptide NH3 amino terminus, D-peptide linking, D-saccharide, D-saccharide, alpha linking, D-saccharide, beta linking, DNA OH 3 prime terminus, DNA OH 5 prime terminus, DNA linking, L-DNA linking, L-RNA linking, L-beta-peptide, C-gamma linking, L-gamma-peptide, C-delta linking, L-peptide COOH carboxy terminus, L-peptide NH3 amino terminus, L-peptide linking, L-saccharide, L-saccharide, alpha linking, L-saccharide, beta linking, RNA OH 3 prime terminus, RNA OH 5 prime terminus, RNA linking, non-polymer, other, peptide linking, peptide-like, saccharide "),
+    )),
+    'Citation': ('', (
+        ('book_id_ISBN', None, False, 'The International Standard Book Number (ISBN) code assigned to  the book cited; relevant for books or book chapters.'),
+        ('book_publisher', None, False, 'The name of the publisher of the citation; relevant  for books or book chapters.  Examples: John Wiley and Sons '),
+        ('book_publisher_city', None, False, 'The location of the publisher of the citation; relevant  for books or book chapters.  Examples: London '),
+        ('book_title', None, False, 'The title of the book in which the citation appeared; relevant  for books or book chapters.'),
+        ('coordinate_linkage', None, False, "_citation.coordinate_linkage states whether this citation  is concerned with precisely the set of coordinates given in the  data block. If, for instance, the publication described the same  structure, but the coordinates had undergone further refinement  prior to the creation of the data block, the value of this data  item would be 'no'.  Allowable values: n, no, y, yes "),
+        ('country', None, False, 'The country/region of publication; relevant for books  and book chapters.'),
+        ('id', None, False, "The value of _citation.id must uniquely identify a record in the  CITATION list.   The _citation.id 'primary' should be used to indicate the  citation that the author(s) consider to be the most pertinent to  the contents of the data block.   Note that this item need not be a number; it can be any unique  identifier.  Examples: primary, 1, 2 "),
+        ('journal_abbrev', None, False, 'Abbreviated name of the cited journal as given in the  Chemical Abstracts Service Source Index.  Examples: J.Mol.Biol., J. Mol. Biol. '),
+        ('journal_full', None, False, 'Full name of the cited journal; relevant for journal articles.  Examples: Journal of Molecular Biology '),
+        ('journal_id_ASTM', None, False, 'The American Society for Testing and Materials (ASTM) code  assigned to the journal cited (also referred to as the CODEN  designator of the Chemical Abstracts Service); relevant for  journal articles.'),
+        ('journal_id_CSD', None, False, 'The Cambridge Structural Database (CSD) code assigned to the  journal cited; relevant for journal articles. This is also the  system used at the Protein Data Bank (PDB).  Examples: 0070 '),
+        ('journal_id_ISSN', None, False, 'The International Standard Serial Number (ISSN) code assigned to  the journal cited; relevant for journal articles.'),
+        ('journal_issue', None, False, 'Issue number of the journal cited; relevant for journal  articles.  Examples: 2 '),
+        ('journal_volume', None, False, 'Volume number of the journal cited; relevant for journal  articles.  Examples: 174 '),
+        ('language', None, False, 'Language in which the cited article is written.  Examples: German '),
+        ('page_first', None, False, 'The first page of the citation; relevant for journal  articles, books and book chapters.'),
+        ('page_last', None, False, 'The last page of the citation; relevant for journal  articles, books and book chapters.'),
+        ('pdbx_database_id_DOI', None, False, 'Document Object Identifier used by doi.org to uniquely  specify bibliographic entry.  Examples: 10.2345/S1384107697000225 '),
+        ('pdbx_database_id_PubMed', None, False, 'Ascession number used by PubMed to categorize a specific  bibliographic entry.'),
+        ('rcsb_authors', None, False, 'Names of the authors of the citation; relevant for journal  articles, books and book chapters.  Names are separated by vertical bars.   The family name(s), followed by a comma and including any  dynastic components, precedes the first name(s) or initial(s).'),
+        ('rcsb_is_primary', None, False, 'Flag to indicate a primary citation.  Allowable values: N, Y '),
+        ('rcsb_journal_abbrev', None, False, 'Normalized journal abbreviation.  Examples: Nat Struct Mol Biol '),
+        ('title', None, False, 'The title of the citation; relevant for journal articles, books  and book chapters.  Examples: Structure of diferric duck ovotransferrin                                   at 2.35 Angstroms resolution. '),
+        ('unpublished_flag', None, False, 'Flag to indicate that this citation will not be published.  Allowable values: N, Y '),
+        ('year', None, False, 'The year of the citation; relevant for journal articles, books  and book chapters.'),
+    )),
+    'ClustersMembers': ('', (
+        ('asym_id', None, False, 'Internal chain ID used in mmCIF files to uniquely identify structural elements in the asymmetric unit.'),
+        ('pdbx_struct_oper_list_ids', None, False, 'Optional list of operator ids (pdbx_struct_oper_list.id) as appears in pdbx_struct_assembly_gen.oper_expression.'),
+    )),
+    'CoreAssembly': ('', (
+        ('branched_entity_instances', 'CoreBranchedEntityInstance', False, 'Get a list of branched entity instances (sugars) that constitute this assembly.'),
+        ('entry', 'CoreEntry', False, 'Get entry that includes this assembly.'),
+        ('interfaces', 'CoreInterface', False, 'Get all pairwise polymer interfaces for this assembly.'),
+        ('nonpolymer_entity_instances', 'CoreNonpolymerEntityInstance', False, 'Get a list of non-polymer entity instances (ligands) that constitute this assembly.'),
+        ('pdbx_struct_assembly', 'PdbxStructAssembly', False, ''),
+        ('pdbx_struct_assembly_auth_evidence', 'PdbxStructAssemblyAuthEvidence', False, ''),
+        ('pdbx_struct_assembly_gen', 'PdbxStructAssemblyGen', False, ''),
+        ('pdbx_struct_assembly_prop', 'PdbxStructAssemblyProp', False, ''),
+        ('pdbx_struct_oper_list', 'PdbxStructOperList', False, ''),
+        ('polymer_entity_instances', 'CorePolymerEntityInstance', False, 'Get a list of polymer entity instances (chains) that constitute this assembly.'),
+        ('rcsb_assembly_annotation', 'RcsbAssemblyAnnotation', False, ''),
+        ('rcsb_assembly_container_identifiers', 'RcsbAssemblyContainerIdentifiers', False, ''),
+        ('rcsb_assembly_feature', 'RcsbAssemblyFeature', False, ''),
+        ('rcsb_assembly_info', 'RcsbAssemblyInfo', False, ''),
+        ('rcsb_id', None, False, 'A unique identifier for each object in this assembly container formed by  a dash separated concatenation of entry and assembly identifiers.  Examples: 1KIP-1 '),
+        ('rcsb_latest_revision', 'RcsbLatestRevision', False, ''),
+        ('rcsb_struct_symmetry', 'RcsbStructSymmetry', False, ''),
+        ('rcsb_struct_symmetry_lineage', 'RcsbStructSymmetryLineage', False, ''),
+        ('rcsb_struct_symmetry_provenance_code', None, False, 'The title and version of software package used for symmetry calculations.'),
+    )),
+    'CoreBranchedEntity': ('', (
+        ('branched_entity_instances', 'CoreBranchedEntityInstance', False, 'Get all unique branched instances (chains) for this molecular entity.'),
+        ('chem_comp_monomers', 'CoreChemComp', False, 'Get all unique monomers described in this branched entity.'),
+        ('entry', 'CoreEntry', False, 'Get entry that contains this branched entity.'),
+        ('pdbx_entity_branch', 'PdbxEntityBranch', False, ''),
+        ('pdbx_entity_branch_descriptor', 'PdbxEntityBranchDescriptor', False, ''),
+        ('prd', 'CoreChemComp', False, 'Get a BIRD chemical components described in this branched entity.'),
+        ('rcsb_branched_entity', 'RcsbBranchedEntity', False, ''),
+        ('rcsb_branched_entity_annotation', 'RcsbBranchedEntityAnnotation', False, ''),
+        ('rcsb_branched_entity_container_identifiers', 'RcsbBranchedEntityContainerIdentifiers', False, ''),
+        ('rcsb_branched_entity_feature', 'RcsbBranchedEntityFeature', False, ''),
+        ('rcsb_branched_entity_feature_summary', 'RcsbBranchedEntityFeatureSummary', False, ''),
+        ('rcsb_branched_entity_keywords', 'RcsbBranchedEntityKeywords', False, ''),
+        ('rcsb_branched_entity_name_com', 'RcsbBranchedEntityNameCom', False, ''),
+        ('rcsb_branched_entity_name_sys', 'RcsbBranchedEntityNameSys', False, ''),
+        ('rcsb_id', None, False, 'A unique identifier for each object in this entity container formed by  an underscore separated concatenation of entry and entity identifiers.  Examples: 2HYV_2 '),
+        ('rcsb_latest_revision', 'RcsbLatestRevision', False, ''),
+    )),
+    'CoreBranchedEntityInstance': ('', (
+        ('branched_entity', 'CoreBranchedEntity', False, 'Get branched entity for this branched entity instance.'),
+        ('pdbx_struct_special_symmetry', 'PdbxStructSpecialSymmetry', False, ''),
+        ('rcsb_branched_entity_instance_container_identifiers', 'RcsbBranchedEntityInstanceContainerIdentifiers', False, ''),
+        ('rcsb_branched_instance_annotation', 'RcsbBranchedInstanceAnnotation', False, ''),
+        ('rcsb_branched_instance_feature', 'RcsbBranchedInstanceFeature', False, ''),
+        ('rcsb_branched_instance_feature_summary', 'RcsbBranchedInstanceFeatureSummary', False, ''),
+        ('rcsb_branched_struct_conn', 'RcsbBranchedStructConn', False, ''),
+        ('rcsb_id', None, False, "A unique identifier for each object in this entity instance container formed by  an 'dot' (.) separated concatenation of entry and entity instance identifiers.  Examples: 1KIP.A "),
+        ('rcsb_latest_revision', 'RcsbLatestRevision', False, ''),
+        ('rcsb_ligand_neighbors', 'RcsbLigandNeighbors', False, ''),
+        ('struct_asym', 'StructAsym', False, ''),
+    )),
+    'CoreChemComp': ('', (
+        ('chem_comp', 'ChemComp', False, ''),
+        ('drugbank', 'CoreDrugbank', False, 'Get DrubBank entry associated with this chemical component.'),
+        ('pdbx_chem_comp_audit', 'PdbxChemCompAudit', False, ''),
+        ('pdbx_chem_comp_descriptor', 'PdbxChemCompDescriptor', False, ''),
+        ('pdbx_chem_comp_feature', 'PdbxChemCompFeature', False, ''),
+        ('pdbx_chem_comp_identifier', 'PdbxChemCompIdentifier', False, ''),
+        ('pdbx_family_prd_audit', 'PdbxFamilyPrdAudit', False, ''),
+        ('pdbx_prd_audit', 'PdbxPrdAudit', False, ''),
+        ('pdbx_reference_entity_list', 'PdbxReferenceEntityList', False, ''),
+        ('pdbx_reference_entity_poly', 'PdbxReferenceEntityPoly', False, ''),
+        ('pdbx_reference_entity_poly_link', 'PdbxReferenceEntityPolyLink', False, ''),
+        ('pdbx_reference_entity_poly_seq', 'PdbxReferenceEntityPolySeq', False, ''),
+        ('pdbx_reference_entity_sequence', 'PdbxReferenceEntitySequence', False, ''),
+        ('pdbx_reference_entity_src_nat', 'PdbxReferenceEntitySrcNat', False, ''),
+        ('pdbx_reference_molecule', 'PdbxReferenceMolecule', False, ''),
+        ('pdbx_reference_molecule_annotation', 'PdbxReferenceMoleculeAnnotation', False, ''),
+        ('pdbx_reference_molecule_details', 'PdbxReferenceMoleculeDetails', False, ''),
+        ('pdbx_reference_molecule_family', 'PdbxReferenceMoleculeFamily', False, ''),
+        ('pdbx_reference_molecule_features', 'PdbxReferenceMoleculeFeatures', False, ''),
+        ('pdbx_reference_molecule_list', 'PdbxReferenceMoleculeList', False, ''),
+        ('pdbx_reference_molecule_related_structures', 'PdbxReferenceMoleculeRelatedStructures', False, ''),
+        ('pdbx_reference_molecule_synonyms', 'PdbxReferenceMoleculeSynonyms', False, ''),
+        ('rcsb_bird_citation', 'RcsbBirdCitation', False, ''),
+        ('rcsb_chem_comp_annotation', 'RcsbChemCompAnnotation', False, ''),
+        ('rcsb_chem_comp_container_identifiers', 'RcsbChemCompContainerIdentifiers', False, ''),
+        ('rcsb_chem_comp_descriptor', 'RcsbChemCompDescriptor', False, ''),
+        ('rcsb_chem_comp_info', 'RcsbChemCompInfo', False, ''),
+        ('rcsb_chem_comp_related', 'RcsbChemCompRelated', False, ''),
+        ('rcsb_chem_comp_synonyms', 'RcsbChemCompSynonyms', False, ''),
+        ('rcsb_chem_comp_target', 'RcsbChemCompTarget', False, ''),
+        ('rcsb_id', None, False, 'A unique identifier for the chemical definition in this container.  Examples: ATP, PRD_000010 '),
+        ('rcsb_schema_container_identifiers', 'RcsbSchemaContainerIdentifiers', False, ''),
+    )),
+    'CoreDrugbank': ('', (
+        ('drugbank_container_identifiers', 'DrugbankContainerIdentifiers', False, ''),
+        ('drugbank_info', 'DrugbankInfo', False, ''),
+        ('drugbank_target', 'DrugbankTarget', False, ''),
+    )),
+    'CoreEntityAlignmentsAlignedRegions': ('', (
+        ('length', None, False, 'Aligned region length'),
+        ('query_begin', None, False, 'Entity seqeunce start position'),
+        ('target_begin', None, False, 'NCBI sequence start position'),
+    )),
+    'CoreEntityAlignmentsCoreEntityIdentifiers': ('', (
+        ('entity_id', None, False, ''),
+        ('entry_id', None, False, ''),
+    )),
+    'CoreEntityAlignmentsScores': ('', (
+        ('query_coverage', None, False, ''),
+        ('query_length', None, False, ''),
+        ('target_coverage', None, False, ''),
+        ('target_length', None, False, ''),
+    )),
+    'CoreEntry': ('', (
+        ('assemblies', 'CoreAssembly', False, 'Get all assemblies for this entry.'),
+        ('audit_author', 'AuditAuthor', False, ''),
+        ('branched_entities', 'CoreBranchedEntity', False, 'Get all branched entities for this entry.'),
+        ('cell', 'Cell', False, ''),
+        ('citation', 'Citation', False, ''),
+        ('database_2', 'Database2', False, ''),
+        ('diffrn', 'Diffrn', False, ''),
+        ('diffrn_detector', 'DiffrnDetector', False, ''),
+        ('diffrn_radiation', 'DiffrnRadiation', False, ''),
+        ('diffrn_source', 'DiffrnSource', False, ''),
+        ('em_2d_crystal_entity', 'Em2dCrystalEntity', False, ''),
+        ('em_3d_crystal_entity', 'Em3dCrystalEntity', False, ''),
+        ('em_3d_fitting', 'Em3dFitting', False, ''),
+        ('em_3d_fitting_list', 'Em3dFittingList', False, ''),
+        ('em_3d_reconstruction', 'Em3dReconstruction', False, ''),
+        ('em_ctf_correction', 'EmCtfCorrection', False, ''),
+        ('em_diffraction', 'EmDiffraction', False, ''),
+        ('em_diffraction_shell', 'EmDiffractionShell', False, ''),
+        ('em_diffraction_stats', 'EmDiffractionStats', False, ''),
+        ('em_embedding', 'EmEmbedding', False, ''),
+        ('em_entity_assembly', 'EmEntityAssembly', False, ''),
+        ('em_experiment', 'EmExperiment', False, ''),
+        ('em_helical_entity', 'EmHelicalEntity', False, ''),
+        ('em_image_recording', 'EmImageRecording', False, ''),
+        ('em_imaging', 'EmImaging', False, ''),
+        ('em_particle_selection', 'EmParticleSelection', False, ''),
+        ('em_single_particle_entity', 'EmSingleParticleEntity', False, ''),
+        ('em_software', 'EmSoftware', False, ''),
+        ('em_specimen', 'EmSpecimen', False, ''),
+        ('em_staining', 'EmStaining', False, ''),
+        ('em_vitrification', 'EmVitrification', False, ''),
+        ('entry', 'Entry', False, ''),
+        ('entry_groups', 'GroupEntry', False, 'Get all groups for this entry.'),
+        ('exptl', 'Exptl', False, ''),
+        ('exptl_crystal', 'ExptlCrystal', False, ''),
+        ('exptl_crystal_grow', 'ExptlCrystalGrow', False, ''),
+        ('ihm_entry_collection_mapping', 'IhmEntryCollectionMapping', False, ''),
+        ('ihm_external_reference_info', 'IhmExternalReferenceInfo', False, ''),
+        ('ma_data', 'MaData', False, ''),
+        ('nonpolymer_entities', 'CoreNonpolymerEntity', False, 'Get all non-polymer (non-solvent) entities for this entry.'),
+        ('pdbx_SG_project', 'PdbxSGProject', False, ''),
+        ('pdbx_audit_revision_category', 'PdbxAuditRevisionCategory', False, ''),
+        ('pdbx_audit_revision_details', 'PdbxAuditRevisionDetails', False, ''),
+        ('pdbx_audit_revision_group', 'PdbxAuditRevisionGroup', False, ''),
+        ('pdbx_audit_revision_history', 'PdbxAuditRevisionHistory', False, ''),
+        ('pdbx_audit_revision_item', 'PdbxAuditRevisionItem', False, ''),
+        ('pdbx_audit_support', 'PdbxAuditSupport', False, ''),
+        ('pdbx_database_PDB_obs_spr', 'PdbxDatabasePDBObsSpr', False, ''),
+        ('pdbx_database_related', 'PdbxDatabaseRelated', False, ''),
+        ('pdbx_database_status', 'PdbxDatabaseStatus', False, ''),
+        ('pdbx_deposit_group', 'PdbxDepositGroup', False, ''),
+        ('pdbx_initial_refinement_model', 'PdbxInitialRefinementModel', False, ''),
+        ('pdbx_molecule_features', 'PdbxMoleculeFeatures', False, ''),
+        ('pdbx_nmr_details', 'PdbxNmrDetails', False, ''),
+        ('pdbx_nmr_ensemble', 'PdbxNmrEnsemble', False, ''),
+        ('pdbx_nmr_exptl', 'PdbxNmrExptl', False, ''),
+        ('pdbx_nmr_exptl_sample_conditions', 'PdbxNmrExptlSampleConditions', False, ''),
+        ('pdbx_nmr_refine', 'PdbxNmrRefine', False, ''),
+        ('pdbx_nmr_representative', 'PdbxNmrRepresentative', False, ''),
+        ('pdbx_nmr_sample_details', 'PdbxNmrSampleDetails', False, ''),
+        ('pdbx_nmr_software', 'PdbxNmrSoftware', False, ''),
+        ('pdbx_nmr_spectrometer', 'PdbxNmrSpectrometer', False, ''),
+        ('pdbx_reflns_twin', 'PdbxReflnsTwin', False, ''),
+        ('pdbx_related_exp_data_set', 'PdbxRelatedExpDataSet', False, ''),
+        ('pdbx_serial_crystallography_data_reduction', 'PdbxSerialCrystallographyDataReduction', False, ''),
+        ('pdbx_serial_crystallography_measurement', 'PdbxSerialCrystallographyMeasurement', False, ''),
+        ('pdbx_serial_crystallography_sample_delivery', 'PdbxSerialCrystallographySampleDelivery', False, ''),
+        ('pdbx_serial_crystallography_sample_delivery_fixed_target', 'PdbxSerialCrystallographySampleDeliveryFixedTarget', False, ''),
+        ('pdbx_serial_crystallography_sample_delivery_injection', 'PdbxSerialCrystallographySampleDeliveryInjection', False, ''),
+        ('pdbx_soln_scatter', 'PdbxSolnScatter', False, ''),
+        ('pdbx_soln_scatter_model', 'PdbxSolnScatterModel', False, ''),
+        ('pdbx_vrpt_summary', 'PdbxVrptSummary', False, ''),
+        ('pdbx_vrpt_summary_diffraction', 'PdbxVrptSummaryDiffraction', False, ''),
+        ('pdbx_vrpt_summary_em', 'PdbxVrptSummaryEm', False, ''),
+        ('pdbx_vrpt_summary_geometry', 'PdbxVrptSummaryGeometry', False, ''),
+        ('pdbx_vrpt_summary_nmr', 'PdbxVrptSummaryNmr', False, ''),
+        ('polymer_entities', 'CorePolymerEntity', False, 'Get all polymer entities for this entry.'),
+        ('pubmed', 'CorePubmed', False, 'Get literature information from PubMed database.'),
+        ('rcsb_accession_info', 'RcsbAccessionInfo', False, ''),
+        ('rcsb_associated_holdings', 'CurrentEntry', False, 'The list of content types associated with this entry.'),
+        ('rcsb_binding_affinity', 'RcsbBindingAffinity', False, ''),
+        ('rcsb_comp_model_provenance', 'RcsbCompModelProvenance', False, ''),
+        ('rcsb_entry_container_identifiers', 'RcsbEntryContainerIdentifiers', False, ''),
+        ('rcsb_entry_group_membership', 'RcsbEntryGroupMembership', False, ''),
+        ('rcsb_entry_info', 'RcsbEntryInfo', False, ''),
+        ('rcsb_external_references', 'RcsbExternalReferences', False, ''),
+        ('rcsb_id', None, False, 'A unique identifier for each object in this entry container.  Examples: 1KIP '),
+        ('rcsb_ihm_dataset_list', 'RcsbIhmDatasetList', False, ''),
+        ('rcsb_ihm_dataset_source_db_reference', 'RcsbIhmDatasetSourceDbReference', False, ''),
+        ('rcsb_ma_qa_metric_global', 'RcsbMaQaMetricGlobal', False, ''),
+        ('rcsb_primary_citation', 'RcsbPrimaryCitation', False, ''),
+        ('refine', 'Refine', False, ''),
+        ('refine_analyze', 'RefineAnalyze', False, ''),
+        ('refine_hist', 'RefineHist', False, ''),
+        ('refine_ls_restr', 'RefineLsRestr', False, ''),
+        ('reflns', 'Reflns', False, ''),
+        ('reflns_shell', 'ReflnsShell', False, ''),
+        ('software', 'Software', False, ''),
+        ('struct', 'Struct', False, ''),
+        ('struct_keywords', 'StructKeywords', False, ''),
+        ('symmetry', 'Symmetry', False, ''),
+    )),
+    'CoreInterface': ('', (
+        ('rcsb_id', None, False, ''),
+        ('rcsb_interface_container_identifiers', 'RcsbInterfaceContainerIdentifiers', False, ''),
+        ('rcsb_interface_info', 'RcsbInterfaceInfo', False, ''),
+        ('rcsb_interface_operator', None, False, 'List of operations for each interface partner.'),
+        ('rcsb_interface_partner', 'RcsbInterfacePartner', False, ''),
+        ('rcsb_latest_revision', 'RcsbLatestRevision', False, ''),
+    )),
+    'CoreNonpolymerEntity': ('', (
+        ('entry', 'CoreEntry', False, 'Get entry that contains this non-polymer entity.'),
+        ('nonpolymer_comp', 'CoreChemComp', False, 'Get a non-polymer chemical components described in this molecular entity.'),
+        ('nonpolymer_entity_instances', 'CoreNonpolymerEntityInstance', False, 'Get all unique non-polymer instances (chains) for this non-polymer entity.'),
+        ('pdbx_entity_nonpoly', 'PdbxEntityNonpoly', False, ''),
+        ('prd', 'CoreChemComp', False, 'Get a BIRD chemical components described in this molecular entity.'),
+        ('rcsb_id', None, False, 'A unique identifier for each object in this entity container formed by  an underscore separated concatenation of entry and entity identifiers.  Examples: 6EL3_1 '),
+        ('rcsb_latest_revision', 'RcsbLatestRevision', False, ''),
+        ('rcsb_nonpolymer_entity', 'RcsbNonpolymerEntity', False, ''),
+        ('rcsb_nonpolymer_entity_annotation', 'RcsbNonpolymerEntityAnnotation', False, ''),
+        ('rcsb_nonpolymer_entity_container_identifiers', 'RcsbNonpolymerEntityContainerIdentifiers', False, ''),
+        ('rcsb_nonpolymer_entity_feature', 'RcsbNonpolymerEntityFeature', False, ''),
+        ('rcsb_nonpolymer_entity_feature_summary', 'RcsbNonpolymerEntityFeatureSummary', False, ''),
+        ('rcsb_nonpolymer_entity_keywords', 'RcsbNonpolymerEntityKeywords', False, ''),
+        ('rcsb_nonpolymer_entity_name_com', 'RcsbNonpolymerEntityNameCom', False, ''),
+    )),
+    'CoreNonpolymerEntityInstance': ('', (
+        ('nonpolymer_entity', 'CoreNonpolymerEntity', False, 'Get non-polymer entity for this non-polymer entity instance.'),
+        ('pdbx_struct_special_symmetry', 'PdbxStructSpecialSymmetry', False, ''),
+        ('pdbx_vrpt_summary_entity_fit_to_map', 'PdbxVrptSummaryEntityFitToMap', False, ''),
+        ('pdbx_vrpt_summary_entity_geometry', 'PdbxVrptSummaryEntityGeometry', False, ''),
+        ('rcsb_id', None, False, "A unique identifier for each object in this entity instance container formed by  an 'dot' (.) separated concatenation of entry and entity instance identifiers.  Examples: 1KIP.A "),
+        ('rcsb_latest_revision', 'RcsbLatestRevision', False, ''),
+        ('rcsb_nonpolymer_entity_instance_container_identifiers', 'RcsbNonpolymerEntityInstanceContainerIdentifiers', False, ''),
+        ('rcsb_nonpolymer_instance_annotation', 'RcsbNonpolymerInstanceAnnotation', False, ''),
+        ('rcsb_nonpolymer_instance_feature', 'RcsbNonpolymerInstanceFeature', False, ''),
+        ('rcsb_nonpolymer_instance_feature_summary', 'RcsbNonpolymerInstanceFeatureSummary', False, ''),
+        ('rcsb_nonpolymer_instance_validation_score', 'RcsbNonpolymerInstanceValidationScore', False, ''),
+        ('rcsb_nonpolymer_struct_conn', 'RcsbNonpolymerStructConn', False, ''),
+        ('rcsb_target_neighbors', 'RcsbTargetNeighbors', False, ''),
+        ('struct_asym', 'StructAsym', False, ''),
+    )),
+    'CorePfam': ('', (
+        ('rcsb_id', None, False, 'Accession number of Pfam entry.'),
+        ('rcsb_pfam_accession', None, False, 'The unique accession code of protein families and domains in the Pfam database.  Examples: PF00621, PF00637, PF00656 '),
+        ('rcsb_pfam_clan_id', None, False, 'Details of the Pfam clan to which the entity belongs.'),
+        ('rcsb_pfam_comment', None, False, 'Textual description of the family.'),
+        ('rcsb_pfam_container_identifiers', 'RcsbPfamContainerIdentifiers', False, ''),
+        ('rcsb_pfam_description', None, False, 'A human-readable name of protein families and domains.  Examples: Lectin like domain, Cell division control protein 24, OB domain 2, Protein of unknown function (DUF722) '),
+        ('rcsb_pfam_identifier', None, False, 'The unique identifier of protein families and domains in the Pfam database.  Examples: RhoGEF, Clathrin, Peptidase_C14 '),
+        ('rcsb_pfam_provenance_code', None, False, 'Pfam-A is the manually curated portion of the Pfam database.  Allowable values: Pfam-A '),
+        ('rcsb_pfam_seed_source', None, False, 'Pfam entries are classified into six different categories, depending on the length and nature of the sequence regions included in the entry: family, domain, repeats, motifs, coiled-coil, and disordered.  Allowable values: Family, Domain, Repeat, Motif, Disordered, Coiled-coil '),
+    )),
+    'CorePolymerEntity': ('', (
+        ('chem_comp_monomers', 'CoreChemComp', False, 'Get all unique monomers described in this molecular entity.'),
+        ('chem_comp_nstd_monomers', 'CoreChemComp', False, 'Get all unique non-standard monomers described in this molecular entity.'),
+        ('entity_poly', 'EntityPoly', False, ''),
+        ('entity_src_gen', 'EntitySrcGen', False, ''),
+        ('entity_src_nat', 'EntitySrcNat', False, ''),
+        ('entry', 'CoreEntry', False, 'Get entry that contains this molecular entity.'),
+        ('pdbx_entity_src_syn', 'PdbxEntitySrcSyn', False, ''),
+        ('pfams', 'CorePfam', False, 'Get all unique Pfam annotations associated with this molecular entity.'),
+        ('polymer_entity_groups', 'GroupPolymerEntity', False, 'Get all groups for this entity.'),
+        ('polymer_entity_instances', 'CorePolymerEntityInstance', False, 'Get all unique polymer instances (chains) for this molecular entity.'),
+        ('prd', 'CoreChemComp', False, 'Get a BIRD chemical components described in this molecular entity.'),
+        ('rcsb_cluster_flexibility', 'RcsbClusterFlexibility', False, ''),
+        ('rcsb_cluster_membership', 'RcsbClusterMembership', False, ''),
+        ('rcsb_entity_host_organism', 'RcsbEntityHostOrganism', False, ''),
+        ('rcsb_entity_source_organism', 'RcsbEntitySourceOrganism', False, ''),
+        ('rcsb_genomic_lineage', 'RcsbGenomicLineage', False, ''),
+        ('rcsb_id', None, False, 'A unique identifier for each object in this entity container formed by  an underscore separated concatenation of entry and entity identifiers.  Examples: 6EL3_1 '),
+        ('rcsb_latest_revision', 'RcsbLatestRevision', False, ''),
+        ('rcsb_membrane_lineage', 'RcsbMembraneLineage', False, ''),
+        ('rcsb_membrane_lineage_provenance_code', None, False, 'Mpstruc keyword denotes original annotation, Homology keyword denotes annotation inferred by homology.  Allowable values: Homology, Mpstruc '),
+        ('rcsb_polymer_entity', 'RcsbPolymerEntity', False, ''),
+        ('rcsb_polymer_entity_align', 'RcsbPolymerEntityAlign', False, ''),
+        ('rcsb_polymer_entity_annotation', 'RcsbPolymerEntityAnnotation', False, ''),
+        ('rcsb_polymer_entity_container_identifiers', 'RcsbPolymerEntityContainerIdentifiers', False, ''),
+        ('rcsb_polymer_entity_feature', 'RcsbPolymerEntityFeature', False, ''),
+        ('rcsb_polymer_entity_feature_summary', 'RcsbPolymerEntityFeatureSummary', False, ''),
+        ('rcsb_polymer_entity_group_membership', 'RcsbPolymerEntityGroupMembership', False, ''),
+        ('rcsb_polymer_entity_keywords', 'RcsbPolymerEntityKeywords', False, ''),
+        ('rcsb_polymer_entity_name_com', 'RcsbPolymerEntityNameCom', False, ''),
+        ('rcsb_polymer_entity_name_sys', 'RcsbPolymerEntityNameSys', False, ''),
+        ('rcsb_related_target_references', 'RcsbRelatedTargetReferences', False, ''),
+        ('rcsb_target_cofactors', 'RcsbTargetCofactors', False, ''),
+        ('uniprots', 'CoreUniprot', False, 'Get all unique UniProt KB annotations associated with this molecular entity.'),
+    )),
+    'CorePolymerEntityInstance': ('', (
+        ('pdbx_struct_special_symmetry', 'PdbxStructSpecialSymmetry', False, ''),
+        ('pdbx_vrpt_summary_entity_fit_to_map', 'PdbxVrptSummaryEntityFitToMap', False, ''),
+        ('pdbx_vrpt_summary_entity_geometry', 'PdbxVrptSummaryEntityGeometry', False, ''),
+        ('polymer_entity', 'CorePolymerEntity', False, 'Get polymer entity for this polymer entity instance.'),
+        ('rcsb_id', None, False, "A unique identifier for each object in this entity instance container formed by  an 'dot' (.) separated concatenation of entry and entity instance identifiers.  Examples: 1KIP.A "),
+        ('rcsb_latest_revision', 'RcsbLatestRevision', False, ''),
+        ('rcsb_ligand_neighbors', 'RcsbLigandNeighbors', False, ''),
+        ('rcsb_polymer_entity_instance_container_identifiers', 'RcsbPolymerEntityInstanceContainerIdentifiers', False, ''),
+        ('rcsb_polymer_instance_annotation', 'RcsbPolymerInstanceAnnotation', False, ''),
+        ('rcsb_polymer_instance_feature', 'RcsbPolymerInstanceFeature', False, ''),
+        ('rcsb_polymer_instance_feature_summary', 'RcsbPolymerInstanceFeatureSummary', False, ''),
+        ('rcsb_polymer_instance_info', 'RcsbPolymerInstanceInfo', False, ''),
+        ('rcsb_polymer_struct_conn', 'RcsbPolymerStructConn', False, ''),
+        ('struct_asym', 'StructAsym', False, ''),
+    )),
+    'CorePubmed': ('', (
+        ('rcsb_id', None, False, 'Unique integer value assigned to each PubMed record.'),
+        ('rcsb_pubmed_abstract_text', None, False, 'A concise, accurate and factual mini-version of the paper contents.'),
+        ('rcsb_pubmed_affiliation_info', None, False, 'The institution(s) that the author is affiliated with. Multiple affiliations per author are allowed.'),
+        ('rcsb_pubmed_central_id', None, False, 'Unique integer value assigned to each PubMed Central record.'),
+        ('rcsb_pubmed_container_identifiers', 'RcsbPubmedContainerIdentifiers', False, ''),
+        ('rcsb_pubmed_doi', None, False, 'Persistent identifier used to provide a link to an article location on the Internet.'),
+        ('rcsb_pubmed_mesh_descriptors', None, False, 'NLM controlled vocabulary, Medical Subject Headings (MeSH), is used to characterize the content of the articles represented by MEDLINE citations.'),
+        ('rcsb_pubmed_mesh_descriptors_lineage', 'RcsbPubmedMeshDescriptorsLineage', False, 'Members of the MeSH classification lineage.'),
+    )),
+    'CoreUniprot': ('', (
+        ('rcsb_id', None, False, 'Primary accession number of a given UniProtKB entry.'),
+        ('rcsb_uniprot_accession', None, False, 'List of UniProtKB accession numbers where original accession numbers are retained as ‘secondary’ accession numbers.'),
+        ('rcsb_uniprot_alignments', 'RcsbUniprotAlignments', False, 'UniProt pairwise sequence alignments.'),
+        ('rcsb_uniprot_annotation', 'RcsbUniprotAnnotation', False, ''),
+        ('rcsb_uniprot_container_identifiers', 'RcsbUniprotContainerIdentifiers', False, ''),
+        ('rcsb_uniprot_entry_name', None, False, 'A list of unique identifiers (former IDs), often containing biologically relevant information.'),
+        ('rcsb_uniprot_external_reference', 'RcsbUniprotExternalReference', False, ''),
+        ('rcsb_uniprot_feature', 'RcsbUniprotFeature', False, ''),
+        ('rcsb_uniprot_keyword', 'RcsbUniprotKeyword', False, 'Keywords constitute a controlled vocabulary that summarises the content of a UniProtKB entry.'),
+        ('rcsb_uniprot_protein', 'RcsbUniprotProtein', False, ''),
+    )),
+    'CurrentEntry': ('', (
+        ('rcsb_id', None, False, 'The RCSB entry identifier.  Examples: 1KIP '),
+        ('rcsb_repository_holdings_current', 'RcsbRepositoryHoldingsCurrent', False, ''),
+        ('rcsb_repository_holdings_current_entry_container_identifiers', 'RcsbRepositoryHoldingsCurrentEntryContainerIdentifiers', False, ''),
+    )),
+    'Database2': ('', (
+        ('database_code', None, False, 'The code assigned by the database identified in  _database_2.database_id.  Examples: 4HHB, 3LTQ '),
+        ('database_id', None, False, 'An abbreviation that identifies the database.  Allowable values: AlphaFoldDB, BMRB, EBI, EMDB, MODBASE, ModelArchive, NDB, PDB, PDB-Dev, PDBE, PDB_ACC, RCSB, SWISS-MODEL_REPOSITORY, WWPDB '),
+        ('pdbx_DOI', None, False, 'Document Object Identifier (DOI) for this entry registered with http://crossref.org.  Examples: 10.2210/pdb6lu7/pdb '),
+        ('pdbx_database_accession', None, False, 'Extended accession code issued for for _database_2.database_code assigned by the database identified in  _database_2.database_id.  Examples: pdb_00006lu7 '),
+    )),
+    'Diffrn': ('', (
+        ('ambient_pressure', None, False, 'The mean hydrostatic pressure in kilopascals at which the  intensities were measured.'),
+        ('ambient_temp', None, False, 'The mean temperature in kelvins at which the intensities were  measured.'),
+        ('ambient_temp_details', None, False, 'A description of special aspects of temperature control during  data collection.'),
+        ('crystal_id', None, False, 'This data item is a pointer to _exptl_crystal.id in the  EXPTL_CRYSTAL category.'),
+        ('crystal_support', None, False, 'The physical device used to support the crystal during data  collection.  Examples: glass capillary, quartz capillary, fiber, metal loop '),
+        ('details', None, False, 'Special details of the diffraction measurement process. Should  include information about source instability, crystal motion,  degradation and so on.'),
+        ('id', None, False, 'This data item uniquely identifies a set of diffraction  data.'),
+        ('pdbx_serial_crystal_experiment', None, False, 'Y/N if using serial crystallography experiment in which multiple crystals contribute to each diffraction frame in the experiment.  Allowable values: N, Y '),
+    )),
+    'DiffrnDetector': ('', (
+        ('details', None, False, 'A description of special aspects of the radiation detector.'),
+        ('detector', None, False, 'The general class of the radiation detector.  Examples: photographic film, scintillation counter, CCD plate, BF~3~ counter '),
+        ('diffrn_id', None, False, 'This data item is a pointer to _diffrn.id in the DIFFRN  category.'),
+        ('pdbx_collection_date', None, False, 'The date of data collection.  Examples: 1996-12-25 '),
+        ('pdbx_frequency', None, False, 'The operating frequency of the detector (Hz) used in data collection.'),
+        ('type', None, False, 'The make, model or name of the detector device used.  Examples: DECTRIS PILATUS 12M, RAYONIX MX-325 '),
+    )),
+    'DiffrnRadiation': ('', (
+        ('collimation', None, False, 'The collimation or focusing applied to the radiation.  Examples: 0.3 mm double-pinhole, 0.5 mm, focusing mirrors '),
+        ('diffrn_id', None, False, 'This data item is a pointer to _diffrn.id in the DIFFRN  category.'),
+        ('monochromator', None, False, 'The method used to obtain monochromatic radiation. If a mono-  chromator crystal is used, the material and the indices of the  Bragg reflection are specified.  Examples: Zr filter, Ge 220, none, equatorial mounted graphite '),
+        ('pdbx_diffrn_protocol', None, False, 'SINGLE WAVELENGTH, LAUE, or MAD.  Examples: SINGLE WAVELENGTH, MONOCHROMATIC, LAUE, MAD, OTHER '),
+        ('pdbx_monochromatic_or_laue_m_l', None, False, 'Monochromatic or Laue.  Allowable values: L, M '),
+        ('pdbx_scattering_type', None, False, 'The radiation scattering type for this diffraction data set.  Allowable values: electron, neutron, x-ray '),
+        ('pdbx_wavelength', None, False, 'Wavelength of radiation.'),
+        ('pdbx_wavelength_list', None, False, 'Comma separated list of wavelengths or wavelength range.'),
+        ('type', None, False, 'The nature of the radiation. This is typically a description  of the X-ray wavelength in Siegbahn notation.  Examples: CuK\\a, Cu K\\a~1~, Cu K-L~2,3~, white-beam '),
+        ('wavelength_id', None, False, 'This data item is a pointer to _diffrn_radiation_wavelength.id  in the DIFFRN_RADIATION_WAVELENGTH category.'),
+    )),
+    'DiffrnSource': ('', (
+        ('details', None, False, 'A description of special aspects of the radiation source used.'),
+        ('diffrn_id', None, False, 'This data item is a pointer to _diffrn.id in the DIFFRN  category.'),
+        ('pdbx_synchrotron_beamline', None, False, 'Synchrotron beamline.  Examples: 17-ID-1, 19-ID '),
+        ('pdbx_synchrotron_site', None, False, 'Synchrotron site.  Examples: APS, NSLS-II '),
+        ('pdbx_wavelength', None, False, 'Wavelength of radiation.'),
+        ('pdbx_wavelength_list', None, False, 'Comma separated list of wavelengths or wavelength range.  Examples: 0.987 or 0.987, 0.988, 1.0 or 0.99-1.5 '),
+        ('source', None, False, 'The general class of the radiation source.  Examples: sealed X-ray tube, nuclear reactor, spallation source, electron microscope, rotating-anode X-ray tube, synchrotron '),
+        ('type', None, False, 'The make, model or name of the source of radiation.  Examples: NSLS beamline X8C, Rigaku RU200 '),
+    )),
+    'DrugbankContainerIdentifiers': ('', (
+        ('drugbank_id', None, False, 'The DrugBank accession code'),
+    )),
+    'DrugbankInfo': ('', (
+        ('affected_organisms', None, False, 'The DrugBank drug affected organisms.'),
+        ('atc_codes', None, False, 'The Anatomical Therapeutic Chemical Classification System (ATC) codes.'),
+        ('brand_names', None, False, 'DrugBank drug brand names.'),
+        ('cas_number', None, False, 'The DrugBank assigned Chemical Abstracts Service identifier.  Examples: 56-65-5 '),
+        ('description', None, False, 'The DrugBank drug description.'),
+        ('drug_categories', None, False, 'The DrugBank drug categories.'),
+        ('drug_groups', None, False, 'The DrugBank drug groups determine their drug development status.  Allowable values: approved, experimental, illicit, investigational, nutraceutical, vet_approved, withdrawn '),
+        ('drug_products', 'DrugbankInfoDrugProducts', False, ''),
+        ('drugbank_id', None, False, 'The DrugBank accession code'),
+        ('indication', None, False, 'The DrugBank drug indication.  Examples: For nutritional supplementation, also for treating dietary shortage or imbalance '),
+        ('mechanism_of_action', None, False, 'The DrugBank drug mechanism of actions.  Examples: ATP is able to store and transport chemical energy within cells. '),
+        ('name', None, False, 'The DrugBank drug name.'),
+        ('pharmacology', None, False, "The DrugBank drug pharmacology.  Examples: Adenosine triphosphate (ATP) is the nucleotide known in biochemistry as the 'molecular currency' of intracellular energy transfer; that is, ATP is able to store and transport chemical energy within cells. ATP also plays an important role in the synthesis of nucleic acids. The total quantity of ATP in the human body is about 0.1 mole. The energy used by human cells requires the hydrolysis of 200 to 300 moles of ATP daily. This means that each ATP molecule is recycled 2000 to 3000 times during a single day. ATP cannot be stored, hence its consumption must closely follow its synthesis. "),
+        ('synonyms', None, False, 'DrugBank drug name synonyms.'),
+    )),
+    'DrugbankInfoDrugProducts': ('', (
+        ('approved', None, False, 'Indicates whether this drug has been approved by the regulating government.  Allowable values: N, Y '),
+        ('country', None, False, 'The country where this commercially available drug has been approved.  Allowable values: Canada, EU, US '),
+        ('ended_marketing_on', None, False, 'The ending date for market approval.  Examples: 2003-07-30 '),
+        ('name', None, False, 'The proprietary name(s) provided by the manufacturer for any commercially available products containing this drug.  Examples: Hivid Tab 0.375mg '),
+        ('source', None, False, 'Source of this product information. For example, a value of DPD indicates this information was retrieved from the Canadian Drug Product Database.  Allowable values: DPD, EMA, FDA NDC '),
+        ('started_marketing_on', None, False, 'The starting date for market approval.  Examples: 1992-12-31 '),
+    )),
+    'DrugbankTarget': ('', (
+        ('interaction_type', None, False, 'The type of target interaction.'),
+        ('name', None, False, 'The target name.'),
+        ('ordinal', None, False, 'The value of _drugbank_target.ordinal distinguishes  related examples for each chemical component.'),
+        ('organism_common_name', None, False, 'The organism common name.'),
+        ('reference_database_accession_code', None, False, 'The reference identifier code for the target interaction reference.  Examples: Q9HD40 '),
+        ('reference_database_name', None, False, 'The reference database name for the target interaction.  Allowable values: UniProt '),
+        ('seq_one_letter_code', None, False, 'Target sequence expressed as string of one-letter amino acid codes.  Examples: MAKQRSG... '),
+        ('target_actions', None, False, 'The actions of the target interaction.'),
+    )),
+    'Em2dCrystalEntity': ('', (
+        ('angle_gamma', None, False, 'Unit-cell angle gamma in degrees.'),
+        ('c_sampling_length', None, False, 'Length used to sample the reciprocal lattice lines in the c-direction.'),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('image_processing_id', None, False, 'pointer to _em_image_processing.id in the EM_IMAGE_PROCESSING category.'),
+        ('length_a', None, False, 'Unit-cell length a in angstroms.  Examples: null '),
+        ('length_b', None, False, 'Unit-cell length b in angstroms.  Examples: null '),
+        ('length_c', None, False, 'Thickness of 2D crystal  Examples: null '),
+        ('space_group_name_H_M', None, False, "There are 17 plane groups classified as oblique, rectangular, square, and hexagonal.  To describe the symmetry of 2D crystals of biological molecules,  plane groups are expanded to equivalent noncentrosymmetric space groups.  The 2D crystal plane corresponds to the 'ab' plane of the space group.   Enumerated space group descriptions include the plane group number in parentheses,  the H-M plane group symbol, and the plane group class.  Allowable values: C 1 2, C 2 2 2, P 1, P 1 2, P 1 21, P 2, P 2 2 2, P 2 2 21, P 2 21 21, P 3, P 3 1 2, P 3 2 1, P 4, P 4 2 2, P 4 21 2, P 6, P 6 2 2 "),
+    )),
+    'Em3dCrystalEntity': ('', (
+        ('angle_alpha', None, False, 'Unit-cell angle alpha in degrees.  Examples: null '),
+        ('angle_beta', None, False, 'Unit-cell angle beta in degrees.  Examples: null '),
+        ('angle_gamma', None, False, 'Unit-cell angle gamma in degrees.  Examples: null '),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('image_processing_id', None, False, 'pointer to _em_image_processing.id in the EM_IMAGE_PROCESSING category.'),
+        ('length_a', None, False, 'Unit-cell length a in angstroms.  Examples: null '),
+        ('length_b', None, False, 'Unit-cell length b in angstroms.  Examples: null '),
+        ('length_c', None, False, 'Unit-cell length c in angstroms.  Examples: null '),
+        ('space_group_name', None, False, 'Space group name.  Examples: P 1, P 21 21 2, I 4, H 3 '),
+        ('space_group_num', None, False, 'Space group number.'),
+    )),
+    'Em3dFitting': ('', (
+        ('details', None, False, 'Any additional details regarding fitting of atomic coordinates into  the 3DEM volume, including data and considerations from other  methods used in computation of the model.  Examples: Initial local fitting was done using Chimera and then NMFF was used for flexible fitting. '),
+        ('id', None, False, 'The value of _em_3d_fitting.id must uniquely identify  a fitting procedure of atomic coordinates  into 3dem reconstructed map volume.'),
+        ('method', None, False, 'The method used to fit atomic coordinates  into the 3dem reconstructed map.'),
+        ('overall_b_value', None, False, 'The overall B (temperature factor) value for the 3d-em volume.'),
+        ('ref_protocol', None, False, 'The refinement protocol used.  Allowable values: AB INITIO MODEL, BACKBONE TRACE, FLEXIBLE FIT, OTHER, RIGID BODY FIT '),
+        ('ref_space', None, False, 'A flag to indicate whether fitting was carried out in real  or reciprocal refinement space.  Allowable values: REAL, RECIPROCAL '),
+        ('target_criteria', None, False, 'The measure used to assess quality of fit of the atomic coordinates in the  3DEM map volume.  Examples: Cross-correlation coefficient '),
+    )),
+    'Em3dFittingList': ('', (
+        ('_3d_fitting_id', None, False, 'The value of _em_3d_fitting_list.3d_fitting_id is a pointer  to  _em_3d_fitting.id in the 3d_fitting category'),
+        ('details', None, False, 'Details about the model used in fitting.  Examples: The initial model consisted of the complete biological assembly for PDB entry 2GTL. '),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('pdb_chain_id', None, False, 'The ID of the biopolymer chain used for fitting, e.g., A.  Please note that only one chain can be specified per instance.  If all chains of a particular structure have been used for fitting, this field can be left blank.  Examples: The ID of the biopolymer chain used for fitting, e.g., A. Please note that only one chain can be specified per instance. If all chains of a particular structure have been used for fitting, this field can be left blank. '),
+        ('pdb_chain_residue_range', None, False, 'Residue range for the identified chain.'),
+        ('pdb_entry_id', None, False, 'The PDB code for the entry used in fitting.  Examples: 1EHZ '),
+    )),
+    'Em3dReconstruction': ('', (
+        ('actual_pixel_size', None, False, 'The actual pixel size of the projection set of images in Angstroms.  Examples: null, null '),
+        ('algorithm', None, False, 'The reconstruction algorithm/technique used to generate the map.'),
+        ('details', None, False, 'Any additional details used in the 3d reconstruction.  Examples: a modified version of SPIDER program was used for the reconstruction '),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('image_processing_id', None, False, 'Foreign key to the EM_IMAGE_PROCESSING category'),
+        ('magnification_calibration', None, False, 'The magnification calibration method for the 3d reconstruction.  Examples: TMV images '),
+        ('method', None, False, 'The algorithm method used for the 3d-reconstruction.  Examples: cross-common lines, polar Fourier transform (PFT) '),
+        ('nominal_pixel_size', None, False, 'The nominal pixel size of the projection set of images in Angstroms.  Examples: null, null '),
+        ('num_class_averages', None, False, 'The number of classes used in the final 3d reconstruction'),
+        ('num_particles', None, False, 'The number of 2D projections or 3D subtomograms used in the 3d reconstruction'),
+        ('refinement_type', None, False, 'Indicates details on how the half-map used for resolution determination (usually by FSC) have been generated.  Allowable values: HALF-MAPS REFINED AGAINST SAME DATA, HALF-MAPS REFINED INDEPENDENTLY, HALF-MAPS REFINED INDEPENDENTLY WITH FREQUENCY RANGE OMITTED, HALF-MAPS REFINED WITH FREQUENCY RANGE OMITTED, OTHER '),
+        ('resolution', None, False, 'The final resolution (in angstroms) of the 3D reconstruction.  Examples: null, null '),
+        ('resolution_method', None, False, 'The  method used to determine the final resolution  of the 3d reconstruction.  The Fourier Shell Correlation criterion as a measure of  resolution is based on the concept of splitting the (2D)  data set into two halves; averaging each and comparing them  using the Fourier Ring Correlation (FRC) technique.  Examples: FSC at 0.5 cut-off '),
+        ('symmetry_type', None, False, 'The type of symmetry applied to the reconstruction  Allowable values: 2D CRYSTAL, 3D CRYSTAL, HELICAL, POINT '),
+    )),
+    'EmCtfCorrection': ('', (
+        ('details', None, False, 'Any additional details about CTF correction  Examples: CTF amplitude correction was performed following 3D reconstruction '),
+        ('em_image_processing_id', None, False, 'Foreign key to the EM_IMAGE_PROCESSING category'),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('type', None, False, 'Type of CTF correction applied'),
+    )),
+    'EmDiffraction': ('', (
+        ('camera_length', None, False, 'The camera length (in millimeters). The camera length is the  product of the objective focal length and the combined magnification  of the intermediate and projector lenses when the microscope is  operated in the diffraction mode.'),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('imaging_id', None, False, 'Foreign key to the EM_IMAGING category'),
+        ('tilt_angle_list', None, False, 'Comma-separated list of tilt angles (in degrees) used in the electron diffraction experiment.  Examples: 20,40,50,55 '),
+    )),
+    'EmDiffractionShell': ('', (
+        ('em_diffraction_stats_id', None, False, 'Pointer to EM CRYSTALLOGRAPHY STATS'),
+        ('fourier_space_coverage', None, False, 'Completeness of the structure factor data within this resolution shell, in percent  Examples: null '),
+        ('high_resolution', None, False, 'High resolution limit for this shell (angstroms)  Examples: null '),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('low_resolution', None, False, 'Low resolution limit for this shell (angstroms)  Examples: null '),
+        ('multiplicity', None, False, 'Multiplicity (average number of measurements) for the structure factors in this resolution shell  Examples: null '),
+        ('num_structure_factors', None, False, 'Number of measured structure factors in this resolution shell'),
+        ('phase_residual', None, False, 'Phase residual for this resolution shell, in degrees  Examples: null '),
+    )),
+    'EmDiffractionStats': ('', (
+        ('details', None, False, 'Any addition details about the structure factor measurements  Examples: Phases were obtained from micrograph images of the 2D crystals '),
+        ('fourier_space_coverage', None, False, 'Completeness of the structure factor data within the defined space group  at the reported resolution (percent).  Examples: null '),
+        ('high_resolution', None, False, 'High resolution limit of the structure factor data, in angstroms  Examples: null '),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('image_processing_id', None, False, 'Pointer to _em_image_processing.id'),
+        ('num_intensities_measured', None, False, 'Total number of diffraction intensities measured (before averaging)'),
+        ('num_structure_factors', None, False, 'Number of structure factors obtained (merged amplitudes + phases)'),
+        ('overall_phase_error', None, False, 'Overall phase error in degrees  Examples: null '),
+        ('overall_phase_residual', None, False, 'Overall phase residual in degrees  Examples: null '),
+        ('phase_error_rejection_criteria', None, False, 'Criteria used to reject phases  Examples: Structure factors with phase errors higher than 20 degrees were omitted from refinement '),
+        ('r_merge', None, False, 'Rmerge value (percent)  Examples: null '),
+        ('r_sym', None, False, 'Rsym value (percent)  Examples: null '),
+    )),
+    'EmEmbedding': ('', (
+        ('details', None, False, 'Staining procedure used in the specimen preparation.  Examples: The crystal suspension was injected into the lens of a drop of buffer containing   1 % tannin sitting on a carbon film supported by a molybdenum grid.  An equal volume   of 1% glucose was then added and the solution thoroughly but gently mixed.  The grid   was then blotted, air dried, and frozen in LN2. '),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('material', None, False, 'The embedding  material.  Examples: tannin and glucose '),
+        ('specimen_id', None, False, 'Foreign key relationship to the EM SPECIMEN category'),
+    )),
+    'EmEntityAssembly': ('', (
+        ('details', None, False, 'Additional details about the sample or sample subcomponent.  Examples: Fab fragment generated by proteolytic cleavage of LA2 IgG antibody. '),
+        ('entity_id_list', None, False, 'macromolecules associated with this component, if defined  as comma separated list of entity ids (integers).'),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('name', None, False, 'The name of the sample or sample subcomponent.  Examples: Ternary complex of alpha-tubulin with tubulin folding cofactors TBCE and TBCB, 80S Ribosome bound to emetine, messenger RNA, initiation factor 2, GroEL, antibody Fab fragment '),
+        ('oligomeric_details', None, False, 'oligomeric details'),
+        ('parent_id', None, False, 'The parent of this assembly.  This data item is an internal category pointer to _em_entity_assembly.id.  By convention, the full assembly (top of hierarchy) is assigned parent id 0 (zero).'),
+        ('source', None, False, 'The type of source (e.g., natural source) for the component (sample or sample subcomponent)  Allowable values: MULTIPLE SOURCES, NATURAL, RECOMBINANT, SYNTHETIC '),
+        ('synonym', None, False, 'Alternative name of the component.  Examples: FADV-1 '),
+        ('type', None, False, 'The general type of the sample or sample subcomponent.'),
+    )),
+    'EmExperiment': ('', (
+        ('aggregation_state', None, False, 'The aggregation/assembly state of the imaged specimen.  Allowable values: 2D ARRAY, 3D ARRAY, CELL, FILAMENT, HELICAL ARRAY, PARTICLE, TISSUE '),
+        ('entity_assembly_id', None, False, 'Foreign key to the EM_ENTITY_ASSEMBLY category'),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('reconstruction_method', None, False, 'The reconstruction method used in the EM experiment.  Allowable values: CRYSTALLOGRAPHY, HELICAL, SINGLE PARTICLE, SUBTOMOGRAM AVERAGING, TOMOGRAPHY '),
+    )),
+    'EmHelicalEntity': ('', (
+        ('angular_rotation_per_subunit', None, False, 'The angular rotation per helical subunit in degrees. Negative values indicate left-handed helices; positive values indicate right handed helices.  Examples: null '),
+        ('axial_rise_per_subunit', None, False, 'The axial rise per subunit in the helical assembly.  Examples: null '),
+        ('axial_symmetry', None, False, 'Symmetry of the helical axis, either cyclic (Cn) or dihedral (Dn), where n>=1.  Examples: C1, D2, C7 '),
+        ('details', None, False, 'Any other details regarding the helical assembly  Examples: Dihedral symmetry '),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('image_processing_id', None, False, 'This data item is a pointer to _em_image_processing.id.'),
+    )),
+    'EmImageRecording': ('', (
+        ('average_exposure_time', None, False, 'The average exposure time for each image.  Examples: null '),
+        ('avg_electron_dose_per_image', None, False, 'The electron dose received by the specimen per image (electrons per square angstrom).  Examples: null '),
+        ('details', None, False, 'Any additional details about image recording.  Examples: Images were collected in movie-mode at 17 frames per second '),
+        ('detector_mode', None, False, 'The detector mode used during image recording.  Allowable values: COUNTING, INTEGRATING, OTHER, SUPER-RESOLUTION '),
+        ('film_or_detector_model', None, False, 'The detector type used for recording images.  Usually film , CCD camera or direct electron detector.'),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('imaging_id', None, False, 'This data item the id of the microscopy settings used in the imaging.'),
+        ('num_diffraction_images', None, False, 'The number of diffraction images collected.'),
+        ('num_grids_imaged', None, False, 'Number of grids in the microscopy session'),
+        ('num_real_images', None, False, 'The number of micrograph images collected.'),
+    )),
+    'EmImaging': ('', (
+        ('accelerating_voltage', None, False, 'A value of accelerating voltage (in kV) used for imaging.'),
+        ('alignment_procedure', None, False, 'The type of procedure used to align the microscope electron beam.  Allowable values: BASIC, COMA FREE, NONE, OTHER, ZEMLIN TABLEAU '),
+        ('astigmatism', None, False, 'astigmatism'),
+        ('c2_aperture_diameter', None, False, 'The open diameter of the c2 condenser lens,  in microns.'),
+        ('calibrated_defocus_max', None, False, 'The maximum calibrated defocus value of the objective lens (in nanometers) used  to obtain the recorded images. Negative values refer to overfocus.'),
+        ('calibrated_defocus_min', None, False, 'The minimum calibrated defocus value of the objective lens (in nanometers) used  to obtain the recorded images. Negative values refer to overfocus.'),
+        ('calibrated_magnification', None, False, 'The magnification value obtained for a known standard just  prior to, during or just after the imaging experiment.'),
+        ('cryogen', None, False, 'Cryogen type used to maintain the specimen stage temperature during imaging  in the microscope.  Allowable values: HELIUM, NITROGEN '),
+        ('date', None, False, 'Date (YYYY-MM-DD) of imaging experiment or the date at which  a series of experiments began.  Examples: 2001-05-08 '),
+        ('details', None, False, 'Any additional imaging details.  Examples: Preliminary grid screening was performed manually. '),
+        ('detector_distance', None, False, 'The camera length (in millimeters). The camera length is the  product of the objective focal length and the combined magnification  of the intermediate and projector lenses when the microscope is  operated in the diffraction mode.'),
+        ('electron_beam_tilt_params', None, False, 'electron beam tilt params'),
+        ('electron_source', None, False, 'The source of electrons. The electron gun.'),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('illumination_mode', None, False, 'The mode of illumination.  Allowable values: FLOOD BEAM, OTHER, SPOT SCAN '),
+        ('microscope_model', None, False, 'The name of the model of microscope.  Allowable values: FEI MORGAGNI, FEI POLARA 300, FEI TALOS ARCTICA, FEI TECNAI 10, FEI TECNAI 12, FEI TECNAI 20, FEI TECNAI ARCTICA, FEI TECNAI F20, FEI TECNAI F30, FEI TECNAI SPHERA, FEI TECNAI SPIRIT, FEI TITAN, FEI TITAN KRIOS, FEI/PHILIPS CM10, FEI/PHILIPS CM12, FEI/PHILIPS CM120T, FEI/PHILIPS CM200FEG, FEI/PHILIPS CM200FEG/SOPHIE, FEI/PHILIPS CM200FEG/ST, FEI/PHILIPS CM200FEG/UT, FEI/PHILIPS CM200T, FEI/PHILIPS CM300FEG/HE, FEI/PHILIPS CM300FEG/ST, FEI/PHILIPS CM300FEG/T, FEI/PHILIPS EM400, FEI/PHILIPS EM420, HITACHI EF2000, HITACHI EF3000, HITACHI H-9500SD, HITACHI H3000 UHVEM, HITACHI H7600, HITACHI HF2000, HITACHI HF3000, JEOL 1000EES, JEOL 100B, JEOL 100CX, JEOL 1010, JEOL 1200, JEOL 1200EX, JEOL 1200EXII, JEOL 1230, JEOL 1400, JEOL 1400/HR + YPS FEG, JEOL 2000EX, JEOL 2000EXII, JEOL 2010, JEOL 2010F, JEOL 2010HC, JEOL 2010HT, JEOL 2010UHR, JEOL 2011, JEOL 2100, JEOL 2100F, JEOL 2200FS, JEOL 2200FSC, JEOL 3000SFF, JEOL 3100FEF, JEOL 3100FFC, JEOL 3200FS, JEOL 3200FSC, JEOL 4000, JEOL 4000EX, JEOL CRYO ARM 200, JEOL CRYO ARM 300, JEOL KYOTO-3000SFF, SIEMENS SULEIKA, TFS GLACIOS, TFS KRIOS, TFS TALOS, TFS TALOS F200C, TFS TALOS L120C, TFS TITAN THEMIS, TFS TUNDRA, ZEISS LEO912, ZEISS LIBRA120PLUS '),
+        ('mode', None, False, 'The mode of imaging.  Allowable values: 4D-STEM, BRIGHT FIELD, DARK FIELD, DIFFRACTION, OTHER '),
+        ('nominal_cs', None, False, 'The spherical aberration coefficient (Cs) in millimeters,  of the objective lens.  Examples: null '),
+        ('nominal_defocus_max', None, False, 'The maximum defocus value of the objective lens (in nanometers) used  to obtain the recorded images. Negative values refer to overfocus.'),
+        ('nominal_defocus_min', None, False, 'The minimum defocus value of the objective lens (in nanometers) used  to obtain the recorded images. Negative values refer to overfocus.'),
+        ('nominal_magnification', None, False, 'The magnification indicated by the microscope readout.'),
+        ('recording_temperature_maximum', None, False, 'The specimen temperature maximum (kelvin) for the duration  of imaging.'),
+        ('recording_temperature_minimum', None, False, 'The specimen temperature minimum (kelvin) for the duration  of imaging.'),
+        ('residual_tilt', None, False, 'Residual tilt of the electron beam (in miliradians)'),
+        ('specimen_holder_model', None, False, 'The name of the model of specimen holder used during imaging.  Allowable values: FEI TITAN KRIOS AUTOGRID HOLDER, FISCHIONE 2550, FISCHIONE INSTRUMENTS DUAL AXIS TOMOGRAPHY HOLDER, GATAN 626 SINGLE TILT LIQUID NITROGEN CRYO TRANSFER HOLDER, GATAN 910 MULTI-SPECIMEN SINGLE TILT CRYO TRANSFER HOLDER, GATAN 914 HIGH TILT LIQUID NITROGEN CRYO TRANSFER TOMOGRAPHY HOLDER, GATAN 915 DOUBLE TILT LIQUID NITROGEN CRYO TRANSFER HOLDER, GATAN CHDT 3504 DOUBLE TILT HIGH RESOLUTION NITROGEN COOLING HOLDER, GATAN CT3500 SINGLE TILT LIQUID NITROGEN CRYO TRANSFER HOLDER, GATAN CT3500TR SINGLE TILT ROTATION LIQUID NITROGEN CRYO TRANSFER HOLDER, GATAN ELSA 698 SINGLE TILT LIQUID NITROGEN CRYO TRANSFER HOLDER, GATAN HC 3500 SINGLE TILT HEATING/NITROGEN COOLING HOLDER, GATAN HCHDT 3010 DOUBLE TILT HIGH RESOLUTION HELIUM COOLING HOLDER, GATAN HCHST 3008 SINGLE TILT HIGH RESOLUTION HELIUM COOLING HOLDER, GATAN HELIUM, GATAN LIQUID NITROGEN, GATAN UHRST 3500 SINGLE TILT ULTRA HIGH RESOLUTION NITROGEN COOLING HOLDER, GATAN ULTDT ULTRA LOW TEMPERATURE DOUBLE TILT HELIUM COOLING HOLDER, GATAN ULTST ULTRA LOW TEMPERATURE SINGLE TILT HELIUM COOLING HOLDER, HOME BUILD, JEOL, JEOL 3200FSC CRYOHOLDER, JEOL CRYOSPECPORTER, OTHER, PHILIPS ROTATION HOLDER, SIDE ENTRY, EUCENTRIC '),
+        ('specimen_holder_type', None, False, 'The type of specimen holder used during imaging.  Examples: cryo '),
+        ('specimen_id', None, False, 'Foreign key to the EM_SPECIMEN category'),
+        ('temperature', None, False, 'The mean specimen stage temperature (in kelvin) during imaging  in the microscope.'),
+        ('tilt_angle_max', None, False, 'The maximum angle at which the specimen was tilted to obtain  recorded images.'),
+        ('tilt_angle_min', None, False, 'The minimum angle at which the specimen was tilted to obtain  recorded images.'),
+    )),
+    'EmParticleSelection': ('', (
+        ('details', None, False, 'Additional detail such as description of filters used, if selection was manual or automated, and/or template details.  Examples: negative monitor contrast facilitated particle picking '),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('image_processing_id', None, False, 'The value of _em_particle_selection.image_processing_id points to  the EM_IMAGE_PROCESSING category.'),
+        ('num_particles_selected', None, False, 'The number of particles selected from the projection set of images.'),
+    )),
+    'EmSingleParticleEntity': ('', (
+        ('id', None, False, 'PRIMARY KEY'),
+        ('image_processing_id', None, False, 'pointer to _em_image_processing.id.'),
+        ('point_symmetry', None, False, 'Point symmetry symbol, either Cn, Dn, T, O, or I  Examples: C1, C5, C4 '),
+    )),
+    'EmSoftware': ('', (
+        ('category', None, False, 'The purpose of the software.  Allowable values: CLASSIFICATION, CRYSTALLOGRAPHY MERGING, CTF CORRECTION, DIFFRACTION INDEXING, EWALD SPHERE CORRECTION, FINAL EULER ASSIGNMENT, IMAGE ACQUISITION, INITIAL EULER ASSIGNMENT, LATTICE DISTORTION CORRECTION, LAYERLINE INDEXING, MASKING, MODEL FITTING, MODEL REFINEMENT, MOLECULAR REPLACEMENT, OTHER, PARTICLE SELECTION, RECONSTRUCTION, SERIES ALIGNMENT, SYMMETRY DETERMINATION, VOLUME SELECTION '),
+        ('details', None, False, 'Details about the software used.  Examples: EMAN2 e2boxer.py was used to automatically select particle images. '),
+        ('fitting_id', None, False, 'pointer to _em_3d_fitting.id in the EM_3D_FITTING category.'),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('image_processing_id', None, False, 'pointer to _em_image_processing.id in the EM_IMAGE_PROCESSING category.'),
+        ('imaging_id', None, False, 'pointer to _em_imaging.id in the EM_IMAGING category.'),
+        ('name', None, False, 'The name of the software package used, e.g., RELION.  Depositors are strongly   encouraged to provide a value in this field.  Examples: EMAN, Imagic, Spider, Bsoft, UCSF-Chimera '),
+        ('version', None, False, 'The version of the software.  Examples: 9.03, 2.1 '),
+    )),
+    'EmSpecimen': ('', (
+        ('concentration', None, False, 'The concentration (in milligrams per milliliter, mg/ml)  of the complex in the sample.  Examples: null '),
+        ('details', None, False, 'A description of any additional details of the specimen preparation.  Examples: This sample was monodisperse., Au was deposited at a 30 degree angle to 15 nm thickness., Colloidal gold particles were deposited by dipping into dilute solution., The specimen was frozen at high pressure using the bal-tec hpm 010 instrument., The embedded sample was sectioned at 100 K to 50 nm final thickness. '),
+        ('embedding_applied', None, False, "'YES' indicates that the specimen has been embedded.  Allowable values: NO, YES "),
+        ('experiment_id', None, False, 'Pointer to _em_experiment.id.'),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('shadowing_applied', None, False, "'YES' indicates that the specimen has been shadowed.  Allowable values: NO, YES "),
+        ('staining_applied', None, False, "'YES' indicates that the specimen has been stained.  Allowable values: NO, YES "),
+        ('vitrification_applied', None, False, "'YES' indicates that the specimen was vitrified by cryopreservation.  Allowable values: NO, YES "),
+    )),
+    'EmStaining': ('', (
+        ('details', None, False, 'Staining procedure used in the specimen preparation.  Examples: Negatively stained EM specimens were prepared using a carbon-sandwich technique   and uranyl-formate stain. '),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('material', None, False, 'The staining  material.  Examples: Uranyl Acetate '),
+        ('specimen_id', None, False, 'Foreign key relationship to the EM SPECIMEN category'),
+        ('type', None, False, 'type of staining  Allowable values: NEGATIVE, NONE, POSITIVE '),
+    )),
+    'EmVitrification': ('', (
+        ('chamber_temperature', None, False, 'The temperature (in kelvin) of the sample just prior to vitrification.'),
+        ('cryogen_name', None, False, 'This is the name of the cryogen.  Allowable values: ETHANE, ETHANE-PROPANE, FREON 12, FREON 22, HELIUM, METHANE, NITROGEN, OTHER, PROPANE '),
+        ('details', None, False, 'Any additional details relating to vitrification.  Examples: Vitrification carried out in argon atmosphere. '),
+        ('humidity', None, False, 'Relative humidity (%) of air surrounding the specimen just prior to vitrification.'),
+        ('id', None, False, 'PRIMARY KEY'),
+        ('instrument', None, False, 'The type of instrument used in the vitrification process.  Allowable values: CRYOSOL VITROJET, EMS-002 RAPID IMMERSION FREEZER, FEI VITROBOT MARK I, FEI VITROBOT MARK II, FEI VITROBOT MARK III, FEI VITROBOT MARK IV, GATAN CRYOPLUNGE 3, HOMEMADE PLUNGER, LEICA EM CPC, LEICA EM GP, LEICA KF80, LEICA PLUNGER, REICHERT-JUNG PLUNGER, SPOTITON, SPT LABTECH CHAMELEON, ZEISS PLUNGE FREEZER CRYOBOX '),
+        ('method', None, False, 'The procedure for vitrification.  Examples: plunge freezing '),
+        ('specimen_id', None, False, 'This data item is a pointer to _em_specimen.id'),
+        ('temp', None, False, 'The vitrification temperature (in kelvin), e.g.,   temperature of the plunge instrument cryogen bath.'),
+        ('time_resolved_state', None, False, 'The length of time after an event effecting the sample that  vitrification was induced and a description of the event.  Examples: plunge 30 msec after spraying with effector '),
+    )),
+    'EntityPoly': ('', (
+        ('nstd_linkage', None, False, 'A flag to indicate whether the polymer contains at least  one monomer-to-monomer link different from that implied by  _entity_poly.type.  Allowable values: n, no, y, yes '),
+        ('nstd_monomer', None, False, 'A flag to indicate whether the polymer contains at least  one monomer that is not considered standard.  Allowable values: n, no, y, yes '),
+        ('pdbx_seq_one_letter_code', None, False, "Sequence of protein or nucleic acid polymer in standard one-letter                codes of amino acids or nucleotides. Non-standard amino                acids/nucleotides are represented by their Chemical                Component Dictionary (CCD) codes in                parenthesis. Deoxynucleotides are represented by the                specially-assigned 2-letter CCD codes in parenthesis,                with 'D' prefix added to their ribonucleotide                counterparts. For hybrid polymer, each residue is                represented by the code of its individual type. A                cyclic polymer is represented in linear sequence from                the chosen start to end.  A for Alanine or Adenosine-5'-monophosphate C for Cysteine or Cytidine-5'-monophosphate D for Aspartic acid E for Glutamic acid F for Phenylalanine G for Glycine or Guanosine-5'-monophosphate H for Histidine I for Isoleucine or Inosinic Acid L for Leucine K for Lysine M for Methionine N for Asparagine  or Unknown ribonucleotide O for Pyrrolysine P for Proline Q for Glutamine R for Arginine S for Serine T for Threonine U for Selenocysteine or Uridine-5'-monophosphate V for Valine W for Tryptophan Y for Tyrosine (DA) for 2'-deoxyadenosine-5'-monophosphate (DC) for 2'-deoxycytidine-5'-monophosphate (DG) for 2'-deoxyguanosine-5'-monophosphate (DT) for Thymidine-5'-monophosphate (MSE) for Selenomethionine (SEP) for Phosphoserine (TPO) for Phosphothreonine (PTR) for Phosphotyrosine (PCA) for Pyroglutamic acid (UNK) for Unknown amino acid (ACE) for Acetylation cap (NH2) for Amidation cap  Examples: HHHH(MSE)AKQRSG or AUCGGAAU, (MSE)SHHWGYGKHNGPEHWHKDFPIAKGERQSPVDIDTHTAKYDPSLKPLSVSYDQATSLRILNNGAAFNVEFD "),
+        ('pdbx_seq_one_letter_code_can', None, False, "Canonical sequence of protein or nucleic acid polymer in standard                one-letter codes of amino acids or nucleotides,                corresponding to the sequence in                _entity_poly.pdbx_seq_one_letter_code. Non-standard                amino acids/nucleotides are represented by the codes of                their parents if parent is specified in                _chem_comp.mon_nstd_parent_comp_id, or by letter 'X' if                parent is not specified. Deoxynucleotides are                represented by their canonical one-letter codes of A,                C, G, or T.                 For modifications with several parent amino acids, \t       all corresponding parent amino acid codes will be listed \t       (ex. chromophores).  Examples: MSHHWGYGKHNGPEHWHKDFPIAKGERQSPVDIDTHTAKYDPSLKPLSVSYDQATSLRILNNGAAFNVEFD "),
+        ('pdbx_sequence_evidence_code', None, False, 'Evidence for the assignment of the polymer sequence.  Allowable values: depositor provided, derived from coordinates '),
+        ('pdbx_strand_id', None, False, 'The PDB strand/chain id(s) corresponding to this polymer entity.  Examples: A,B, A, B, A,B,C '),
+        ('pdbx_target_identifier', None, False, "For Structural Genomics entries, the sequence's target identifier registered at the TargetTrack database.  Examples: JCSG-11211, 356560 "),
+        ('rcsb_artifact_monomer_count', None, False, 'Number of regions in the sample sequence identified as expression tags, linkers, or  cloning artifacts.'),
+        ('rcsb_conflict_count', None, False, 'Number of monomer conflicts relative to the reference sequence.'),
+        ('rcsb_deletion_count', None, False, 'Number of monomer deletions relative to the reference sequence.'),
+        ('rcsb_entity_polymer_type', None, False, 'A coarse-grained polymer entity type.  Allowable values: DNA, NA-hybrid, Other, Protein, RNA '),
+        ('rcsb_insertion_count', None, False, 'Number of monomer insertions relative to the reference sequence.'),
+        ('rcsb_mutation_count', None, False, 'Number of engineered mutations engineered in the sample sequence.'),
+        ('rcsb_non_std_monomer_count', None, False, 'Number of non-standard monomers in the sample sequence.'),
+        ('rcsb_non_std_monomers', None, False, 'Unique list of non-standard monomer chemical component identifiers in the sample sequence.'),
+        ('rcsb_prd_id', None, False, 'For polymer BIRD molecules the BIRD identifier for the entity.'),
+        ('rcsb_sample_sequence_length', None, False, 'The monomer length of the sample sequence.'),
+        ('type', None, False, 'The type of the polymer.  Allowable values: cyclic-pseudo-peptide, other, peptide nucleic acid, polydeoxyribonucleotide, polydeoxyribonucleotide/polyribonucleotide hybrid, polypeptide(D), polypeptide(L), polyribonucleotide '),
+    )),
+    'EntitySrcGen': ('', (
+        ('expression_system_id', None, False, 'A unique identifier for the expression system. This  should be extracted from a local list of expression  systems.'),
+        ('gene_src_common_name', None, False, 'The common name of the natural organism from which the gene was  obtained.  Examples: man, yeast, bacteria '),
+        ('gene_src_details', None, False, 'A description of special aspects of the natural organism from  which the gene was obtained.'),
+        ('gene_src_genus', None, False, 'The genus of the natural organism from which the gene was  obtained.  Examples: Homo, Saccharomyces, Escherichia '),
+        ('gene_src_species', None, False, 'The species of the natural organism from which the gene was  obtained.  Examples: sapiens, cerevisiae, coli '),
+        ('gene_src_strain', None, False, 'The strain of the natural organism from which the gene was  obtained, if relevant.  Examples: DH5a, BMH 71-18 '),
+        ('gene_src_tissue', None, False, 'The tissue of the natural organism from which the gene was  obtained.  Examples: heart, liver, eye lens '),
+        ('gene_src_tissue_fraction', None, False, 'The subcellular fraction of the tissue of the natural organism  from which the gene was obtained.  Examples: mitochondria, nucleus, membrane '),
+        ('host_org_common_name', None, False, 'The common name of the organism that served as host for the  production of the entity.  Where full details of the protein  production are available it would be expected that this item  be derived from _entity_src_gen_express.host_org_common_name  or via _entity_src_gen_express.host_org_tax_id  Examples: yeast, bacteria '),
+        ('host_org_details', None, False, 'A description of special aspects of the organism that served as  host for the production of the entity. Where full details of  the protein production are available it would be expected that  this item would derived from _entity_src_gen_express.host_org_details'),
+        ('host_org_genus', None, False, 'The genus of the organism that served as host for the production  of the entity.  Examples: Saccharomyces, Escherichia '),
+        ('host_org_species', None, False, 'The species of the organism that served as host for the  production of the entity.  Examples: cerevisiae, coli '),
+        ('pdbx_alt_source_flag', None, False, 'This data item identifies cases in which an alternative source  modeled.  Allowable values: model, sample '),
+        ('pdbx_beg_seq_num', None, False, 'The beginning polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category.'),
+        ('pdbx_description', None, False, 'Information on the source which is not given elsewhere.'),
+        ('pdbx_end_seq_num', None, False, 'The ending polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category.'),
+        ('pdbx_gene_src_atcc', None, False, 'American Type Culture Collection tissue culture number.  Examples: 6051 '),
+        ('pdbx_gene_src_cell', None, False, 'Cell type.  Examples: ENDOTHELIAL '),
+        ('pdbx_gene_src_cell_line', None, False, 'The specific line of cells.  Examples: HELA CELLS '),
+        ('pdbx_gene_src_cellular_location', None, False, 'Identifies the location inside (or outside) the cell.  Examples: CYTOPLASM, NUCLEUS '),
+        ('pdbx_gene_src_fragment', None, False, 'A domain or fragment of the molecule.  Examples: CYTOPLASM, NUCLEUS '),
+        ('pdbx_gene_src_gene', None, False, 'Identifies the gene.'),
+        ('pdbx_gene_src_ncbi_taxonomy_id', None, False, 'NCBI Taxonomy identifier for the gene source organism.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18.'),
+        ('pdbx_gene_src_organ', None, False, 'Organized group of tissues that carries on a specialized function.  Examples: KIDNEY, LIVER, PANCREAS '),
+        ('pdbx_gene_src_organelle', None, False, 'Organized structure within cell.  Examples: MITOCHONDRIA '),
+        ('pdbx_gene_src_scientific_name', None, False, 'Scientific name of the organism.  Examples: Homo sapiens, Saccharomyces Cerevisiae '),
+        ('pdbx_gene_src_variant', None, False, 'Identifies the variant.  Examples: DELTAH1DELTATRP '),
+        ('pdbx_host_org_atcc', None, False, 'Americal Tissue Culture Collection of the expression system. Where  full details of the protein production are available it would  be expected that this item  would be derived from  _entity_src_gen_express.host_org_culture_collection'),
+        ('pdbx_host_org_cell', None, False, 'Cell type from which the gene is derived. Where  entity.target_id is provided this should be derived from  details of the target.  Examples: ENDOTHELIAL '),
+        ('pdbx_host_org_cell_line', None, False, 'A specific line of cells used as the expression system. Where  full details of the protein production are available it would  be expected that this item would be derived from  entity_src_gen_express.host_org_cell_line  Examples: HELA '),
+        ('pdbx_host_org_cellular_location', None, False, 'Identifies the location inside (or outside) the cell which  expressed the molecule.  Examples: CYTOPLASM, NUCLEUS '),
+        ('pdbx_host_org_culture_collection', None, False, 'Culture collection of the expression system. Where  full details of the protein production are available it would  be expected that this item  would be derived somehwere, but  exactly where is not clear.'),
+        ('pdbx_host_org_gene', None, False, 'Specific gene which expressed the molecule.  Examples: HIV-1 POL, GLNS7, U1A (2-98, Y31H, Q36R) '),
+        ('pdbx_host_org_ncbi_taxonomy_id', None, False, 'NCBI Taxonomy identifier for the expression system organism.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18.'),
+        ('pdbx_host_org_organ', None, False, 'Specific organ which expressed the molecule.  Examples: KIDNEY '),
+        ('pdbx_host_org_organelle', None, False, 'Specific organelle which expressed the molecule.  Examples: MITOCHONDRIA '),
+        ('pdbx_host_org_scientific_name', None, False, 'The scientific name of the organism that served as host for the  production of the entity. Where full details of the protein  production are available it would be expected that this item  would be derived from _entity_src_gen_express.host_org_scientific_name  or via _entity_src_gen_express.host_org_tax_id  Examples: ESCHERICHIA COLI, SACCHAROMYCES CEREVISIAE '),
+        ('pdbx_host_org_strain', None, False, 'The strain of the organism in which the entity was expressed.  Examples: AR120 '),
+        ('pdbx_host_org_tissue', None, False, 'The specific tissue which expressed the molecule. Where full details  of the protein production are available it would be expected that this  item would be derived from _entity_src_gen_express.host_org_tissue  Examples: heart, liver, eye lens '),
+        ('pdbx_host_org_tissue_fraction', None, False, 'The fraction of the tissue which expressed the molecule.  Examples: mitochondria, nucleus, membrane '),
+        ('pdbx_host_org_variant', None, False, 'Variant of the organism used as the expression system. Where  full details of the protein production are available it would  be expected that this item be derived from  entity_src_gen_express.host_org_variant or via  _entity_src_gen_express.host_org_tax_id  Examples: TRP-LAC, LAMBDA DE3 '),
+        ('pdbx_host_org_vector', None, False, 'Identifies the vector used. Where full details of the protein  production are available it would be expected that this item  would be derived from _entity_src_gen_clone.vector_name.  Examples: PBIT36, PET15B, PUC18 '),
+        ('pdbx_host_org_vector_type', None, False, 'Identifies the type of vector used (plasmid, virus, or cosmid).  Where full details of the protein production are available it  would be expected that this item would be derived from  _entity_src_gen_express.vector_type.  Examples: COSMID, PLASMID '),
+        ('pdbx_seq_type', None, False, 'This data item povides additional information about the sequence type.  Allowable values: Biological sequence, C-terminal tag, Linker, N-terminal tag '),
+        ('pdbx_src_id', None, False, 'This data item is an ordinal identifier for entity_src_gen data records.'),
+        ('plasmid_details', None, False, 'A description of special aspects of the plasmid that produced the  entity in the host organism. Where full details of the protein  production are available it would be expected that this item  would be derived from _pdbx_construct.details of the construct  pointed to from _entity_src_gen_express.plasmid_id.'),
+        ('plasmid_name', None, False, 'The name of the plasmid that produced the entity in the host  organism. Where full details of the protein production are available  it would be expected that this item would be derived from  _pdbx_construct.name of the construct pointed to from  _entity_src_gen_express.plasmid_id.  Examples: pET3C, pT123sab '),
+    )),
+    'EntitySrcNat': ('', (
+        ('common_name', None, False, 'The common name of the organism from which the entity  was isolated.  Examples: man, yeast, bacteria '),
+        ('details', None, False, 'A description of special aspects of the organism from which the  entity was isolated.'),
+        ('genus', None, False, 'The genus of the organism from which the entity was isolated.  Examples: Homo, Saccharomyces, Escherichia '),
+        ('pdbx_alt_source_flag', None, False, 'This data item identifies cases in which an alternative source  modeled.  Allowable values: model, sample '),
+        ('pdbx_atcc', None, False, 'Americal Tissue Culture Collection number.  Examples: 6051 '),
+        ('pdbx_beg_seq_num', None, False, 'The beginning polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category.'),
+        ('pdbx_cell', None, False, 'A particular cell type.  Examples: BHK-21 '),
+        ('pdbx_cell_line', None, False, 'The specific line of cells.  Examples: HELA '),
+        ('pdbx_cellular_location', None, False, 'Identifies the location inside (or outside) the cell.'),
+        ('pdbx_end_seq_num', None, False, 'The ending polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category.'),
+        ('pdbx_fragment', None, False, 'A domain or fragment of the molecule.'),
+        ('pdbx_ncbi_taxonomy_id', None, False, 'NCBI Taxonomy identifier for the source organism.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18.'),
+        ('pdbx_organ', None, False, 'Organized group of tissues that carries on a specialized function.  Examples: KIDNEY '),
+        ('pdbx_organelle', None, False, 'Organized structure within cell.  Examples: MITOCHONDRIA '),
+        ('pdbx_organism_scientific', None, False, 'Scientific name of the organism of the natural source.  Examples: Bos taurus, BOS TAURUS, SUS SCROFA, ASPERGILLUS ORYZAE '),
+        ('pdbx_plasmid_details', None, False, 'Details about the plasmid.  Examples: PLC28 DERIVATIVE '),
+        ('pdbx_plasmid_name', None, False, 'The plasmid containing the gene.  Examples: pB322 '),
+        ('pdbx_secretion', None, False, 'Identifies the secretion from which the molecule was isolated.  Examples: saliva, urine, venom '),
+        ('pdbx_src_id', None, False, 'This data item is an ordinal identifier for entity_src_nat data records.'),
+        ('pdbx_variant', None, False, 'Identifies the variant.'),
+        ('species', None, False, 'The species of the organism from which the entity was isolated.  Examples: sapiens, cerevisiae, coli '),
+        ('strain', None, False, 'The strain of the organism from which the entity was isolated.  Examples: DH5a, BMH 71-18 '),
+        ('tissue', None, False, 'The tissue of the organism from which the entity was isolated.  Examples: heart, liver, eye lens '),
+        ('tissue_fraction', None, False, 'The subcellular fraction of the tissue of the organism from  which the entity was isolated.  Examples: mitochondria, nucleus, membrane '),
+    )),
+    'Entry': ('', (
+        ('id', None, False, 'The value of _entry.id identifies the data block.   Note that this item need not be a number; it can be any unique  identifier.'),
+        ('ma_collection_id', None, False, 'An identifier for the model collection associated with the entry.'),
+    )),
+    'Exptl': ('', (
+        ('crystals_number', None, False, 'The total number of crystals used in the  measurement of  intensities.'),
+        ('details', None, False, 'Any special information about the experimental work prior to the  intensity measurement. See also _exptl_crystal.preparation.'),
+        ('method', None, False, 'The method used in the experiment.  Allowable values: ELECTRON CRYSTALLOGRAPHY, ELECTRON MICROSCOPY, EPR, FIBER DIFFRACTION, FLUORESCENCE TRANSFER, INFRARED SPECTROSCOPY, NEUTRON DIFFRACTION, POWDER DIFFRACTION, SOLID-STATE NMR, SOLUTION NMR, SOLUTION SCATTERING, THEORETICAL MODEL, X-RAY DIFFRACTION '),
+        ('method_details', None, False, 'A description of special aspects of the experimental method.  Examples: 29 structures, minimized average structure '),
+    )),
+    'ExptlCrystal': ('', (
+        ('colour', None, False, 'The colour of the crystal.  Examples: dark green '),
+        ('density_Matthews', None, False, 'The density of the crystal, expressed as the ratio of the  volume of the asymmetric unit to the molecular mass of a  monomer of the structure, in units of angstroms^3^ per dalton.   Ref: Matthews, B. W. (1968). J. Mol. Biol. 33, 491-497.  Examples: null '),
+        ('density_meas', None, False, 'Density values measured using standard chemical and physical  methods. The units are megagrams per cubic metre (grams per  cubic centimetre).'),
+        ('density_percent_sol', None, False, 'Density value P calculated from the crystal cell and contents,  expressed as per cent solvent.   P = 1 - (1.23 N MMass) / V   N     = the number of molecules in the unit cell  MMass = the molecular mass of each molecule (gm/mole)  V     = the volume of the unit cell (A^3^)  1.23  = a conversion factor evaluated as:           (0.74 cm^3^/g) (10^24^ A^3^/cm^3^)          --------------------------------------               (6.02*10^23^) molecules/mole           where 0.74 is an assumed value for the partial specific          volume of the molecule'),
+        ('description', None, False, 'A description of the quality and habit of the crystal.  The crystal dimensions should not normally be reported here;  use instead the specific items in the EXPTL_CRYSTAL category  relating to size for the gross dimensions of the crystal and  data items in the EXPTL_CRYSTAL_FACE category to describe the  relationship between individual faces.'),
+        ('id', None, False, 'The value of _exptl_crystal.id must uniquely identify a record in  the EXPTL_CRYSTAL list.   Note that this item need not be a number; it can be any unique  identifier.'),
+        ('pdbx_mosaicity', None, False, 'Isotropic approximation of the distribution of mis-orientation angles specified in degrees of all the mosaic domain blocks in the crystal, represented as a standard deviation. Here, a mosaic block is a set of contiguous unit cells assumed to be perfectly aligned. Lower mosaicity indicates better ordered crystals. See for example:  Nave, C. (1998). Acta Cryst. D54, 848-853.  Note that many software packages estimate the mosaic rotation distribution differently and may combine several physical properties of the experiment into a single mosaic term. This term will help fit the modeled spots to the observed spots without necessarily being directly related to the physics of the crystal itself.'),
+        ('pdbx_mosaicity_esd', None, False, 'The uncertainty in the mosaicity estimate for the crystal.'),
+        ('preparation', None, False, 'Details of crystal growth and preparation of the crystal (e.g.  mounting) prior to the intensity measurements.  Examples: mounted in an argon-filled quartz capillary '),
+    )),
+    'ExptlCrystalGrow': ('', (
+        ('crystal_id', None, False, 'This data item is a pointer to _exptl_crystal.id in the  EXPTL_CRYSTAL category.'),
+        ('details', None, False, 'A description of special aspects of the crystal growth.  Examples: Solution 2 was prepared as a well solution and                                   mixed. A droplet containing 2 \\ml of solution                                   1 was delivered onto a cover slip; 2 \\ml of                                   solution 2 was added to the droplet without                                   mixing., Crystal plates were originally stored at room                                   temperature for 1 week but no nucleation                                   occurred. They were then transferred to 4                                   degrees C, at which temperature well formed                                   single crystals grew in 2 days., The dependence on pH for successful crystal                                   growth is very sharp. At pH 7.4 only showers                                   of tiny crystals grew, at pH 7.5 well formed                                   single crystals grew, at pH 7.6 no                                   crystallization occurred at all. '),
+        ('method', None, False, 'The method used to grow the crystals.  Examples: MICROBATCH, VAPOR DIFFUSION, HANGING DROP '),
+        ('pH', None, False, 'The pH at which the crystal was grown. If more than one pH was  employed during the crystallization process, the final pH should  be noted here and the protocol involving multiple pH values  should be described in _exptl_crystal_grow.details.  Examples: null, null, null '),
+        ('pdbx_details', None, False, 'Text description of crystal growth procedure.  Examples: PEG 4000, potassium phosphate, magnesium chloride, cacodylate '),
+        ('pdbx_pH_range', None, False, 'The range of pH values at which the crystal was grown.   Used when  a point estimate of pH is not appropriate.  Examples: 5.6 - 6.4 '),
+        ('temp', None, False, 'The temperature in kelvins at which the crystal was grown.  If more than one temperature was employed during the  crystallization process, the final temperature should be noted  here and the protocol  involving multiple temperatures should be  described in _exptl_crystal_grow.details.'),
+        ('temp_details', None, False, 'A description of special aspects of temperature control during  crystal growth.'),
+    )),
+    'GeneName': ('', (
+        ('type', None, False, 'Allowable values: PRIMARY, SYNONYM, ORDERED_LOCUS, ORF.'),
+        ('value', None, False, ''),
+    )),
+    'GroupEntry': ('', (
+        ('group_provenance', 'GroupProvenance', False, 'Get provenance associated with this group.'),
+        ('rcsb_group_accession_info', 'RcsbGroupAccessionInfo', False, ''),
+        ('rcsb_group_container_identifiers', 'RcsbGroupContainerIdentifiers', False, ''),
+        ('rcsb_group_info', 'RcsbGroupInfo', False, ''),
+        ('rcsb_group_related', 'RcsbGroupRelated', False, ''),
+        ('rcsb_group_statistics', 'RcsbGroupStatistics', False, ''),
+        ('rcsb_id', None, False, 'A unique textual identifier for a group'),
+    )),
+    'GroupMembersAlignmentScores': ('', (
+        ('query_coverage', None, False, ''),
+        ('query_length', None, False, ''),
+        ('target_coverage', None, False, ''),
+        ('target_length', None, False, ''),
+    )),
+    'GroupNonPolymerEntity': ('', (
+        ('rcsb_group_accession_info', 'RcsbGroupAccessionInfo', False, ''),
+        ('rcsb_group_container_identifiers', 'RcsbGroupContainerIdentifiers', False, ''),
+        ('rcsb_group_info', 'RcsbGroupInfo', False, ''),
+        ('rcsb_group_related', 'RcsbGroupRelated', False, ''),
+        ('rcsb_group_statistics', 'RcsbGroupStatistics', False, ''),
+        ('rcsb_id', None, False, 'A unique textual identifier for a group'),
+    )),
+    'GroupPolymerEntity': ('', (
+        ('group_provenance', 'GroupProvenance', False, 'Get provenance associated with this group.'),
+        ('rcsb_group_accession_info', 'RcsbGroupAccessionInfo', False, ''),
+        ('rcsb_group_container_identifiers', 'RcsbGroupContainerIdentifiers', False, ''),
+        ('rcsb_group_info', 'RcsbGroupInfo', False, ''),
+        ('rcsb_group_related', 'RcsbGroupRelated', False, ''),
+        ('rcsb_group_statistics', 'RcsbGroupStatistics', False, ''),
+        ('rcsb_id', None, False, 'A unique textual identifier for a group'),
+        ('rcsb_polymer_entity_group_members_rankings', 'RcsbPolymerEntityGroupMembersRankings', False, ''),
+        ('rcsb_polymer_entity_group_sequence_alignment', 'RcsbPolymerEntityGroupSequenceAlignment', False, ''),
+    )),
+    'GroupProvenance': ('', (
+        ('rcsb_group_aggregation_method', 'RcsbGroupAggregationMethod', False, ''),
+        ('rcsb_group_provenance_container_identifiers', 'RcsbGroupProvenanceContainerIdentifiers', False, ''),
+        ('rcsb_id', None, False, 'A unique textual identifier for a group provenance'),
+    )),
+    'IhmEntryCollectionMapping': ('', (
+        ('collection_id', None, False, 'Identifier for the entry collection.   This data item is a pointer to _ihm_entry_collection.id in the   IHM_ENTRY_COLLECTION category.'),
+    )),
+    'IhmExternalReferenceInfo': ('', (
+        ('associated_url', None, False, 'The Uniform Resource Locator (URL) corresponding to the external reference (DOI).   This URL should link to the corresponding downloadable file or archive and is provided   to enable automated software to download the referenced file or archive.'),
+        ('reference', None, False, 'The external reference or the Digital Object Identifier (DOI).  This field is not relevant for local files.  Examples: 10.5281/zenodo.46266 '),
+        ('reference_provider', None, False, 'The name of the reference provider.  Examples: Zenodo, Figshare, Crossref '),
+    )),
+    'InterfacePartnerFeatureAdditionalProperties': ('', (
+        ('name', None, False, 'The additional property name.  Allowable values: TO_BE_DEFINED '),
+        ('values', None, False, 'The value(s) of the additional property.'),
+    )),
+    'InterfacePartnerFeatureFeaturePositions': ('', (
+        ('beg_seq_id', None, False, 'An identifier for the monomer at which this segment of the feature begins.'),
+        ('end_seq_id', None, False, 'An identifier for the monomer at which this segment of the feature ends.'),
+        ('values', None, False, 'The value(s) of the feature over the monomer segment.'),
+    )),
+    'MaData': ('', (
+        ('content_type', None, False, 'The type of data held in the dataset.  Allowable values: coevolution MSA, input structure, model coordinates, other, polymeric template library, reference database, spatial restraints, target, target-template alignment, template structure '),
+        ('content_type_other_details', None, False, 'Details for other content types.'),
+        ('id', None, False, 'A unique identifier for the data.'),
+        ('name', None, False, 'An author-given name for the content held in the dataset.  Examples: NMR NOE Distances, Target Template Alignment, Coevolution Data '),
+    )),
+    'MethodDetails': ('', (
+        ('description', None, False, 'A description of special aspects of the clustering process'),
+        ('name', None, False, 'Defines the name of the description associated with the clustering process'),
+        ('type', None, False, 'Defines the type of the description associated with the clustering process'),
+        ('value', None, False, 'Defines the value associated with the clustering process'),
+    )),
+    'PdbxAuditRevisionCategory': ('', (
+        ('category', None, False, 'The category updated in the pdbx_audit_revision_category record.  Examples: audit_author, citation '),
+        ('data_content_type', None, False, 'The type of file that the pdbx_audit_revision_history record refers to.  Allowable values: Additional map, Chemical component, EM metadata, FSC, Half map, Image, Mask, NMR restraints, NMR shifts, Primary map, Structure factors, Structure model '),
+        ('ordinal', None, False, 'A unique identifier for the pdbx_audit_revision_category record.'),
+        ('revision_ordinal', None, False, 'A pointer to  _pdbx_audit_revision_history.ordinal'),
+    )),
+    'PdbxAuditRevisionDetails': ('', (
+        ('data_content_type', None, False, 'The type of file that the pdbx_audit_revision_history record refers to.  Allowable values: Additional map, Chemical component, EM metadata, FSC, Half map, Image, Mask, NMR restraints, NMR shifts, Primary map, Structure factors, Structure model '),
+        ('description', None, False, 'Additional details describing the revision.'),
+        ('details', None, False, 'Further details describing the revision.'),
+        ('ordinal', None, False, 'A unique identifier for the pdbx_audit_revision_details record.'),
+        ('provider', None, False, 'The provider of the revision.  Allowable values: author, repository '),
+        ('revision_ordinal', None, False, 'A pointer to  _pdbx_audit_revision_history.ordinal'),
+        ('type', None, False, 'A type classification of the revision  Allowable values: Coordinate replacement, Data added, Data removed, Data updated, Initial release, Obsolete, Remediation '),
+    )),
+    'PdbxAuditRevisionGroup': ('', (
+        ('data_content_type', None, False, 'The type of file that the pdbx_audit_revision_history record refers to.  Allowable values: Additional map, Chemical component, EM metadata, FSC, Half map, Image, Mask, NMR restraints, NMR shifts, Primary map, Structure factors, Structure model '),
+        ('group', None, False, 'The collection of categories updated with this revision.  Allowable values: Advisory, Atomic model, Author supporting evidence, Data collection, Data processing, Database references, Derived calculations, Experimental data, Experimental preparation, Experimental summary, Non-polymer description, Other, Polymer sequence, Refinement description, Source and taxonomy, Structure summary, Version format compliance '),
+        ('ordinal', None, False, 'A unique identifier for the pdbx_audit_revision_group record.'),
+        ('revision_ordinal', None, False, 'A pointer to  _pdbx_audit_revision_history.ordinal'),
+    )),
+    'PdbxAuditRevisionHistory': ('', (
+        ('data_content_type', None, False, 'The type of file that the pdbx_audit_revision_history record refers to.  Allowable values: Additional map, Chemical component, EM metadata, FSC, Half map, Image, Mask, NMR restraints, NMR shifts, Primary map, Structure factors, Structure model '),
+        ('major_revision', None, False, 'The major version number of deposition release.'),
+        ('minor_revision', None, False, 'The minor version number of deposition release.'),
+        ('ordinal', None, False, 'A unique identifier for the pdbx_audit_revision_history record.'),
+        ('revision_date', None, False, 'The release date of the revision  Examples: 2017-03-08 '),
+    )),
+    'PdbxAuditRevisionItem': ('', (
+        ('data_content_type', None, False, 'The type of file that the pdbx_audit_revision_history record refers to.  Allowable values: Additional map, Chemical component, EM metadata, FSC, Half map, Image, Mask, NMR restraints, NMR shifts, Primary map, Structure factors, Structure model '),
+        ('item', None, False, 'A high level explanation the author has provided for submitting a revision.  Examples: _atom_site.type_symbol '),
+        ('ordinal', None, False, 'A unique identifier for the pdbx_audit_revision_item record.'),
+        ('revision_ordinal', None, False, 'A pointer to  _pdbx_audit_revision_history.ordinal'),
+    )),
+    'PdbxAuditSupport': ('', (
+        ('country', None, False, 'The country/region providing the funding support for the entry.  Funding information is optionally provided for entries after June 2016.'),
+        ('funding_organization', None, False, 'The name of the organization providing funding support for the  entry. Funding information is optionally provided for entries  after June 2016.  Examples: National Institutes of Health, Wellcome Trust, National Institutes of Health/National Institute of General Medical Sciences '),
+        ('grant_number', None, False, 'The grant number associated with this source of support.'),
+        ('ordinal', None, False, 'A unique sequential integer identifier for each source of support for this entry.'),
+    )),
+    'PdbxChemCompAudit': ('', (
+        ('action_type', None, False, 'The action associated with this audit record.  Allowable values: Create component, Initial release, Modify PCM, Modify aromatic_flag, Modify atom id, Modify backbone, Modify charge, Modify component atom id, Modify component comp_id, Modify coordinates, Modify descriptor, Modify formal charge, Modify formula, Modify identifier, Modify internal type, Modify leaving atom flag, Modify linking type, Modify model coordinates code, Modify name, Modify one letter code, Modify parent residue, Modify processing site, Modify subcomponent list, Modify synonyms, Modify value order, Obsolete component, Other modification '),
+        ('comp_id', None, False, 'This data item is a pointer to _chem_comp.id in the CHEM_COMP  category.'),
+        ('date', None, False, 'The date associated with this audit record.'),
+        ('details', None, False, 'Additional details decribing this change.  Examples: Added C14 as a leaving atom. '),
+        ('ordinal', None, False, 'This data item is an ordinal index for the  PDBX_CHEM_COMP_AUDIT category.'),
+    )),
+    'PdbxChemCompDescriptor': ('', (
+        ('comp_id', None, False, 'This data item is a pointer to _chem_comp.id in the CHEM_COMP  category.'),
+        ('descriptor', None, False, 'This data item contains the descriptor value for this  component.'),
+        ('program', None, False, 'This data item contains the name of the program  or library used to compute the descriptor.  Examples: OPENEYE, CACTVS, DAYLIGHT, OTHER '),
+        ('program_version', None, False, 'This data item contains the version of the program  or library used to compute the descriptor.'),
+        ('type', None, False, 'This data item contains the descriptor type.  Allowable values: InChI, InChIKey, InChI_CHARGE, InChI_FIXEDH, InChI_ISOTOPE, InChI_MAIN, InChI_MAIN_CONNECT, InChI_MAIN_FORMULA, InChI_MAIN_HATOM, InChI_RECONNECT, InChI_STEREO, SMILES, SMILES_CANNONICAL, SMILES_CANONICAL '),
+    )),
+    'PdbxChemCompFeature': ('', (
+        ('comp_id', None, False, 'The component identifier for this feature.  Examples: ABC, ATP '),
+        ('source', None, False, 'The information source for the component feature.  Examples: PDB, CHEBI, DRUGBANK, PUBCHEM '),
+        ('type', None, False, 'The component feature type.  Allowable values: CARBOHYDRATE ANOMER, CARBOHYDRATE ISOMER, CARBOHYDRATE PRIMARY CARBONYL GROUP, CARBOHYDRATE RING '),
+        ('value', None, False, 'The component feature value.'),
+    )),
+    'PdbxChemCompIdentifier': ('', (
+        ('comp_id', None, False, 'This data item is a pointer to _chem_comp.id in the CHEM_COMP  category.'),
+        ('identifier', None, False, 'This data item contains the identifier value for this  component.'),
+        ('program', None, False, 'This data item contains the name of the program  or library used to compute the identifier.  Examples: OPENEYE, DAYLIGHT, ACD, AUTONOM, PUBCHEM_CID, PUBCHEM_SID, OTHER, NONE '),
+        ('program_version', None, False, 'This data item contains the version of the program  or library used to compute the identifier.'),
+        ('type', None, False, 'This data item contains the identifier type.  Allowable values: CAS REGISTRY NUMBER, COMMON NAME, CONDENSED IUPAC CARB SYMBOL, CONDENSED IUPAC CARBOHYDRATE SYMBOL, IUPAC CARB SYMBOL, IUPAC CARBOHYDRATE SYMBOL, MDL Identifier, PUBCHEM Identifier, SNFG CARB SYMBOL, SNFG CARBOHYDRATE SYMBOL, SYNONYM, SYSTEMATIC NAME '),
+    )),
+    'PdbxDatabasePDBObsSpr': ('', (
+        ('date', None, False, 'The date of replacement.  Examples: 1997-03-30 '),
+        ('details', None, False, 'Details related to the replaced or replacing entry.'),
+        ('id', None, False, 'Identifier for the type of obsolete entry to be added to this entry.  Allowable values: OBSLTE, SPRSDE '),
+        ('pdb_id', None, False, 'The new PDB identifier for the replaced entry.  Examples: 2ABC '),
+        ('replace_pdb_id', None, False, 'The PDB identifier for the replaced (OLD) entry/entries.  Examples: 3ABC '),
+    )),
+    'PdbxDatabaseRelated': ('', (
+        ('content_type', None, False, 'The identifying content type of the related entry.  Allowable values: associated EM volume, associated NMR restraints, associated SAS data, associated structure factors, complete structure, consensus EM volume, derivative structure, ensemble, focused EM volume, minimized average structure, native structure, other, other EM volume, protein target sequence and/or protocol data, re-refinement, representative structure, split, unspecified '),
+        ('db_id', None, False, 'The identifying code in the related database.  Examples: 1ABC, BDL001 '),
+        ('db_name', None, False, 'The name of the database containing the related entry.  Allowable values: BIOISIS, BMCD, BMRB, EMDB, NDB, PDB, PDB-Dev, SASBDB, TargetDB, TargetTrack '),
+        ('details', None, False, 'A description of the related entry.  Examples: 1ABC contains the same protein complexed with Netropsin. '),
+    )),
+    'PdbxDatabaseStatus': ('', (
+        ('SG_entry', None, False, 'This code indicates whether the entry belongs to  Structural Genomics Project.  Allowable values: N, Y '),
+        ('deposit_site', None, False, 'The site where the file was deposited.  Allowable values: BMRB, BNL, NDB, PDBC, PDBE, PDBJ, RCSB '),
+        ('methods_development_category', None, False, 'The methods development category in which this  entry has been placed.  Allowable values: CAPRI, CASD-NMR, CASP, D3R, FoldIt, GPCR Dock, RNA-Puzzles '),
+        ('pdb_format_compatible', None, False, "A flag indicating that the entry is compatible with the PDB format.   A value of 'N' indicates that the no PDB format data file is  corresponding to this entry is available in the PDB archive.  Allowable values: N, Y "),
+        ('process_site', None, False, 'The site where the file was deposited.  Allowable values: BNL, NDB, PDBC, PDBE, PDBJ, RCSB '),
+        ('recvd_initial_deposition_date', None, False, 'The date of initial deposition.  (The first message for  deposition has been received.)  Examples: 1983-02-21 '),
+        ('status_code', None, False, 'Code for status of file.  Allowable values: AUCO, AUTH, BIB, DEL, HOLD, HPUB, OBS, POLC, PROC, REFI, REL, REPL, REV, RMVD, TRSF, UPD, WAIT, WDRN '),
+        ('status_code_cs', None, False, 'Code for status of chemical shift data file.  Allowable values: AUCO, AUTH, HOLD, HPUB, OBS, POLC, PROC, REL, REPL, RMVD, WAIT, WDRN '),
+        ('status_code_mr', None, False, 'Code for status of NMR constraints file.  Allowable values: AUCO, AUTH, HOLD, HPUB, OBS, POLC, PROC, REL, REPL, RMVD, WAIT, WDRN '),
+        ('status_code_sf', None, False, 'Code for status of structure factor file.  Allowable values: AUTH, HOLD, HPUB, OBS, POLC, PROC, REL, REPL, RMVD, WAIT, WDRN '),
+    )),
+    'PdbxDepositGroup': ('', (
+        ('group_description', None, False, 'A description of the contents of entries in the collection.'),
+        ('group_id', None, False, 'A unique identifier for a group of entries deposited as a collection.  Examples: G_1002119, G_1002043 '),
+        ('group_title', None, False, 'A title to describe the group of entries deposited in the collection.'),
+        ('group_type', None, False, 'Text to describe a grouping of entries in multiple collections  Allowable values: changed state, ground state, undefined '),
+    )),
+    'PdbxEntityBranch': ('', (
+        ('rcsb_branched_component_count', None, False, 'Number of constituent chemical components in the branched entity.'),
+        ('type', None, False, 'The type of this branched oligosaccharide.  Allowable values: oligosaccharide '),
+    )),
+    'PdbxEntityBranchDescriptor': ('', (
+        ('descriptor', None, False, 'This data item contains the descriptor value for this  entity.'),
+        ('program', None, False, 'This data item contains the name of the program  or library used to compute the descriptor.  Examples: PDB-CARE, OTHER, GEMS '),
+        ('program_version', None, False, 'This data item contains the version of the program  or library used to compute the descriptor.'),
+        ('type', None, False, 'This data item contains the descriptor type.  Allowable values: Glycam Condensed Core Sequence, Glycam Condensed Sequence, LINUCS, WURCS '),
+    )),
+    'PdbxEntityNonpoly': ('', (
+        ('comp_id', None, False, 'This data item is a pointer to _chem_comp.id in the CHEM_COMP category.'),
+        ('entity_id', None, False, 'This data item is a pointer to _entity.id in the ENTITY category.'),
+        ('name', None, False, 'A name for the non-polymer entity'),
+        ('rcsb_prd_id', None, False, 'For non-polymer BIRD molecules the BIRD identifier for the entity.'),
+    )),
+    'PdbxEntitySrcSyn': ('', (
+        ('details', None, False, 'A description of special aspects of the source for the  synthetic entity.  Examples: This sequence occurs naturally in humans. '),
+        ('ncbi_taxonomy_id', None, False, 'NCBI Taxonomy identifier of the organism from which the sequence of  the synthetic entity was derived.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18.'),
+        ('organism_common_name', None, False, 'The common name of the organism from which the sequence of  the synthetic entity was derived.  Examples: house mouse '),
+        ('organism_scientific', None, False, 'The scientific name of the organism from which the sequence of  the synthetic entity was derived.  Examples: synthetic construct, Mus musculus '),
+        ('pdbx_alt_source_flag', None, False, 'This data item identifies cases in which an alternative source  modeled.  Allowable values: model, sample '),
+        ('pdbx_beg_seq_num', None, False, 'The beginning polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category.'),
+        ('pdbx_end_seq_num', None, False, 'The ending polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category.'),
+        ('pdbx_src_id', None, False, 'This data item is an ordinal identifier for pdbx_entity_src_syn data records.'),
+    )),
+    'PdbxFamilyPrdAudit': ('', (
+        ('action_type', None, False, 'The action associated with this audit record.  Allowable values: Add PRD, Create family, Initial release, Modify annotation, Modify citation, Modify family classification, Modify family name, Modify feature, Modify molecule details, Modify related structures, Modify sequence, Modify synonyms, Obsolete family, Obsolete familyt, Other modification, Remove PRD '),
+        ('annotator', None, False, 'The initials of the annotator creating of modifying the family.  Examples: JO, SJ, KB '),
+        ('date', None, False, 'The date associated with this audit record.'),
+        ('details', None, False, 'Additional details decribing this change.  Examples: Revise molecule sequence. '),
+        ('family_prd_id', None, False, 'This data item is a pointer to _pdbx_reference_molecule_family.family_prd_id in the \t       pdbx_reference_molecule category.'),
+        ('processing_site', None, False, 'An identifier for the wwPDB site creating or modifying the family.  Examples: RCSB, PDBE, PDBJ, BMRB, PDBC '),
+    )),
+    'PdbxInitialRefinementModel': ('', (
+        ('accession_code', None, False, 'This item identifies an accession code of the resource where the initial model  is used'),
+        ('details', None, False, 'A description of special aspects of the initial model'),
+        ('entity_id_list', None, False, 'A comma separated list of entities reflecting the initial model used for refinement'),
+        ('id', None, False, 'A unique identifier for the starting model record.'),
+        ('source_name', None, False, 'This item identifies the resource of initial model used for refinement  Allowable values: AlphaFold, ITasser, InsightII, ModelArchive, Modeller, Other, PDB, PDB-Dev, PHYRE, Robetta, RoseTTAFold, SwissModel '),
+        ('type', None, False, 'This item describes the type of the initial model was generated  Allowable values: experimental model, in silico model, integrative model, other '),
+    )),
+    'PdbxMoleculeFeatures': ('', (
+        ('class', None, False, 'Broadly defines the function of the molecule.  Allowable values: Antagonist, Anthelmintic, Antibiotic, Antibiotic, Anthelmintic, Antibiotic, Antimicrobial, Antibiotic, Antineoplastic, Anticancer, Anticoagulant, Anticoagulant, Antithrombotic, Antifungal, Antigen, Antiinflammatory, Antimicrobial, Antimicrobial, Antiparasitic, Antibiotic, Antimicrobial, Antiretroviral, Antimicrobial, Antitumor, Antineoplastic, Antiparasitic, Antiretroviral, Antithrombotic, Antitumor, Antiviral, CASPASE inhibitor, Chaperone binding, Drug delivery, Enzyme inhibitor, Glycan component, Growth factor, Immunosuppressant, Inducer, Inhibitor, Lantibiotic, Metabolism, Metal transport, Nutrient, Oxidation-reduction, Protein binding, Receptor, Substrate analog, Synthetic opioid, Thrombin inhibitor, Thrombin inhibitor, Trypsin inhibitor, Toxin, Transition state mimetic, Transport activator, Trypsin inhibitor, Unknown, Water retention '),
+        ('details', None, False, 'Additional details describing the molecule.'),
+        ('name', None, False, 'A name of the molecule.  Examples: thiostrepton '),
+        ('prd_id', None, False, 'The value of _pdbx_molecule_features.prd_id is the accession code for this  reference molecule.'),
+        ('type', None, False, 'Defines the structural classification of the molecule.  Allowable values: Amino acid, Aminoglycoside, Ansamycin, Anthracycline, Anthraquinone, Chalkophore, Chalkophore, Polypeptide, Chromophore, Cyclic depsipeptide, Cyclic lipopeptide, Cyclic peptide, Glycopeptide, Heterocyclic, Imino sugar, Keto acid, Lipoglycopeptide, Lipopeptide, Macrolide, Non-polymer, Nucleoside, Oligopeptide, Oligosaccharide, Peptaibol, Peptide-like, Polycyclic, Polypeptide, Polysaccharide, Quinolone, Siderophore, Thiolactone, Thiopeptide, Unknown '),
+    )),
+    'PdbxNmrDetails': ('', (
+        ('text', None, False, 'Additional details describing the NMR experiment.  Examples: This structure was determined using standard 2D homonuclear techniques., The structure was determined using triple-resonance NMR spectroscopy. '),
+    )),
+    'PdbxNmrEnsemble': ('', (
+        ('average_constraint_violations_per_residue', None, False, 'The average number of constraint violations on a per residue basis for  the ensemble.  Examples: null '),
+        ('average_constraints_per_residue', None, False, 'The average number of constraints per residue for the ensemble  Examples: null '),
+        ('average_distance_constraint_violation', None, False, 'The average distance restraint violation for the ensemble.  Examples: null '),
+        ('average_torsion_angle_constraint_violation', None, False, 'The average torsion angle constraint violation for the ensemble.  Examples: null '),
+        ('conformer_selection_criteria', None, False, 'By highlighting the appropriate choice(s), describe how the submitted conformer (models) were selected.  Examples: structures with the lowest energy, structures with the least restraint violations, structures with acceptable covalent geometry, structures with favorable non-bond energy, target function, back calculated data agree with experimental NOESY spectrum, all calculated structures submitted, The submitted conformer models are the 25 structures with the lowest     energy., The submitted conformer models are those with the fewest number of     constraint violations. '),
+        ('conformers_calculated_total_number', None, False, 'The total number of conformer (models) that were calculated in the final round.'),
+        ('conformers_submitted_total_number', None, False, 'The number of conformer (models) that are submitted for the ensemble.'),
+        ('distance_constraint_violation_method', None, False, 'Describe the method used to calculate the distance constraint violation statistics,  i.e. are they calculated over all the distance constraints or calculated for  violations only?  Examples: Statistics were calculated over all of the distance constraints., Statistics were calculated for violations only '),
+        ('maximum_distance_constraint_violation', None, False, 'The maximum distance constraint violation for the ensemble.  Examples: null '),
+        ('maximum_lower_distance_constraint_violation', None, False, 'The maximum lower distance constraint violation for the ensemble.  Examples: null '),
+        ('maximum_torsion_angle_constraint_violation', None, False, 'The maximum torsion angle constraint violation for the ensemble.'),
+        ('maximum_upper_distance_constraint_violation', None, False, 'The maximum upper distance constraint violation for the ensemble.  Examples: null '),
+        ('representative_conformer', None, False, 'The number of the conformer identified as most representative.'),
+        ('torsion_angle_constraint_violation_method', None, False, 'This item describes the method used to calculate the torsion angle constraint violation statistics. i.e. are the entered values based on all torsion angle or calculated for violations only?  Examples: Statistics were calculated over all the torsion angle constraints., Statistics were calculated for torsion angle constraints violations only. '),
+    )),
+    'PdbxNmrExptl': ('', (
+        ('conditions_id', None, False, 'The number to identify the set of sample conditions.  Examples: 1, 2, 3 '),
+        ('experiment_id', None, False, 'A numerical ID for each experiment.  Examples: 1, 2, 3 '),
+        ('sample_state', None, False, 'Physical state of the sample either anisotropic or isotropic.  Allowable values: anisotropic, isotropic '),
+        ('solution_id', None, False, 'The solution_id from the Experimental Sample to identify the sample  that these conditions refer to.   [Remember to save the entries here before returning to the   Experimental Sample form]  Examples: 1, 2, 3 '),
+        ('spectrometer_id', None, False, "Pointer to '_pdbx_nmr_spectrometer.spectrometer_id'"),
+        ('type', None, False, 'The type of NMR experiment.  Examples: 2D NOESY, 3D_15N-separated_NOESY, 3D_13C-separated_NOESY, 4D_13C-separated_NOESY, 4D_13C/15N-separated_NOESY, 3D_15N-separated_ROESY, 3D_13C-separated_ROESY, HNCA-J, HNHA, DQF-COSY, P-COSY, PE-COSY, E-COSY '),
+    )),
+    'PdbxNmrExptlSampleConditions': ('', (
+        ('conditions_id', None, False, 'The condition number as defined above.  Examples: 1, 2, 3 '),
+        ('details', None, False, 'General details describing conditions of both the sample and the environment during measurements.  Examples: The high salinity of the sample may have contributed to overheating of the sample during experiments with long saturation periods like the TOCSY experiments. '),
+        ('ionic_strength', None, False, 'The ionic strength at which the NMR data were collected -in lieu of  this enter the concentration and identity of the salt in the sample.'),
+        ('ionic_strength_err', None, False, 'Estimate of the standard error for the value for the sample ionic strength.  Examples: null '),
+        ('ionic_strength_units', None, False, 'Units for the value of the sample condition ionic strength..  Allowable values: M, Not defined, mM '),
+        ('label', None, False, 'A descriptive label that uniquely identifies this set of sample conditions.  Examples: conditions_1 '),
+        ('pH', None, False, 'The pH at which the NMR data were collected.  Examples: null, null '),
+        ('pH_err', None, False, 'Estimate of the standard error for the value for the sample pH.  Examples: null '),
+        ('pH_units', None, False, 'Units for the value of the sample condition pH.  Allowable values: Not defined, pD, pH, pH* '),
+        ('pressure', None, False, 'The pressure at which NMR data were collected.  Examples: 1, ambient, 1atm '),
+        ('pressure_err', None, False, 'Estimate of the standard error for the value for the sample pressure.  Examples: null '),
+        ('pressure_units', None, False, 'The units of pressure at which NMR data were collected.  Examples: Pa, atm, Torr '),
+        ('temperature', None, False, 'The temperature (in kelvin) at which NMR data were  collected.'),
+        ('temperature_err', None, False, 'Estimate of the standard error for the value for the sample temperature.  Examples: null '),
+        ('temperature_units', None, False, 'Units for the value of the sample condition temperature.  Allowable values: C, K, Not defined '),
+    )),
+    'PdbxNmrRefine': ('', (
+        ('details', None, False, 'Additional details about the NMR refinement.  Examples: Additional comments about the NMR refinement can be placed here, e.g. the structures are based on a total of 3344 restraints, 3167 are NOE-derived distance constraints, 68 dihedral angle restraints,109 distance restraints from hydrogen bonds. '),
+        ('method', None, False, 'The method used to determine the structure.  Examples: simulated annealing, distance geometry   simulated annealing   molecular dynamics   matrix relaxation   torsion angle dynamics '),
+        ('software_ordinal', None, False, 'Pointer to _software.ordinal'),
+    )),
+    'PdbxNmrRepresentative': ('', (
+        ('conformer_id', None, False, 'If a member of the ensemble has been selected as a representative  structure, identify it by its model number.  Examples: 15 '),
+        ('selection_criteria', None, False, 'By highlighting the appropriate choice(s), describe the criteria used to select this structure as a representative structure, or if an average structure has been calculated describe how this was done.  Examples: The structure closest to the average. The structure with the lowest energy was selected. The structure with the fewest number of violations was selected. A minimized average structure was calculated. '),
+    )),
+    'PdbxNmrSampleDetails': ('', (
+        ('contents', None, False, 'A complete description of each NMR sample. Include the concentration and concentration units for each component (include buffers, etc.). For each component describe the isotopic composition, including the % labeling level, if known.  For example: 1. Uniform (random) labeling with 15N: U-15N 2. Uniform (random) labeling with 13C, 15N at known labeling    levels: U-95% 13C;U-98% 15N 3. Residue selective labeling: U-95% 15N-Thymine 4. Site specific labeling: 95% 13C-Ala18, 5. Natural abundance labeling in an otherwise uniformly labeled    biomolecule is designated by NA: U-13C; NA-K,H  Examples: 2mM Ribonuclease  U-15N,13C; 50mM phosphate buffer NA; 90% H2O, 10% D2O '),
+        ('details', None, False, 'Brief description of the sample providing additional information not captured by other items in the category.  Examples: The added glycerol was used to raise the viscosity of the solution to 1.05 poisson. '),
+        ('label', None, False, 'A value that uniquely identifies this sample from the other samples listed in the entry.  Examples: 15N_sample '),
+        ('solution_id', None, False, 'The name (number) of the sample.  Examples: 1, 2, 3 '),
+        ('solvent_system', None, False, 'The solvent system used for this sample.  Examples: 90% H2O, 10% D2O '),
+        ('type', None, False, 'A descriptive term for the sample that defines the general physical properties of the sample.  Allowable values: bicelle, emulsion, fiber, fibrous protein, filamentous virus, gel solid, gel solution, liposome, lyophilized powder, membrane, micelle, oriented membrane film, polycrystalline powder, reverse micelle, single crystal, solid, solution '),
+    )),
+    'PdbxNmrSoftware': ('', (
+        ('authors', None, False, 'The name of the authors of the software used in this  procedure.  Examples: Brunger, Guentert '),
+        ('classification', None, False, 'The purpose of the software.  Examples: collection, processing, data analysis, structure solution, refinement, iterative matrix relaxation '),
+        ('name', None, False, 'The name of the software used for the task.  Examples: ANSIG, AURELIA, AZARA, CHARMM, CoMAND, CORMA, DIANA, DYANA, DSPACE, DISGEO, DGII, DISMAN, DINOSAUR, DISCOVER, FELIX, FT_NMR, GROMOS, IRMA, MARDIGRAS, NMRPipe, SA, UXNMR, VNMR, X-PLOR, XWINNMR '),
+        ('ordinal', None, False, 'An ordinal index for this category'),
+        ('version', None, False, 'The version of the software.  Examples: 940501.3, 2.1 '),
+    )),
+    'PdbxNmrSpectrometer': ('', (
+        ('details', None, False, 'A text description of the NMR spectrometer.'),
+        ('field_strength', None, False, 'The field strength in MHz of the spectrometer'),
+        ('manufacturer', None, False, 'The name of the manufacturer of the spectrometer.  Examples: Varian, Bruker, JEOL, GE '),
+        ('model', None, False, 'The model of the NMR spectrometer.  Examples: AVANCE, AVANCE II, AVANCE III, AVANCE III HD, WH, WM, AC+, Alpha, AM, AMX, AMX II, DMX, DRX, DSX, MSL, OMEGA, OMEGA PSG, GX, GSX, A, AL, EC, EX, LA, ECP, Infinityplus, Mercury, VNMRS, VXR, UNITY, UNITY INOVA, UNITYPLUS, INOVA, home-built '),
+        ('spectrometer_id', None, False, 'Assign a numerical ID to each instrument.  Examples: 1, 2, 3 '),
+        ('type', None, False, 'Select the instrument manufacturer(s) and the model(s) of the NMR(s) used for this work.  Examples: Bruker WH, Bruker WM, Bruker AM, Bruker AMX, Bruker DMX, Bruker DRX, Bruker MSL, Bruker AVANCE, GE Omega, GE Omega PSG, JEOL GX, JEOL GSX, JEOL A, JEOL AL, JEOL EC, JEOL EX, JEOL LA, JEOL ECP, Varian VXRS, Varian UNITY, Varian UNITYplus, Varian INOVA, other '),
+    )),
+    'PdbxPrdAudit': ('', (
+        ('action_type', None, False, 'The action associated with this audit record.  Allowable values: Create molecule, Initial release, Modify audit, Modify class, Modify linkage, Modify molecule name, Modify representation, Modify sequence, Modify taxonomy organism, Modify type, Obsolete molecule, Other modification '),
+        ('annotator', None, False, 'The initials of the annotator creating of modifying the molecule.  Examples: JO, SJ, KB '),
+        ('date', None, False, 'The date associated with this audit record.'),
+        ('details', None, False, 'Additional details decribing this change.  Examples: Revise molecule sequence. '),
+        ('prd_id', None, False, 'This data item is a pointer to _pdbx_reference_molecule.prd_id in the \t       pdbx_reference_molecule category.'),
+        ('processing_site', None, False, 'An identifier for the wwPDB site creating or modifying the molecule.  Allowable values: BMRB, PDBC, PDBE, PDBJ, RCSB '),
+    )),
+    'PdbxReferenceEntityList': ('', (
+        ('component_id', None, False, 'The component number of this entity within the molecule.'),
+        ('details', None, False, 'Additional details about this entity.'),
+        ('prd_id', None, False, 'The value of _pdbx_reference_entity_list.prd_id is a reference  _pdbx_reference_molecule.prd_id in the PDBX_REFERENCE_MOLECULE category.'),
+        ('ref_entity_id', None, False, 'The value of _pdbx_reference_entity_list.ref_entity_id is a unique identifier  the a constituent entity within this reference molecule.'),
+        ('type', None, False, 'Defines the polymer characteristic of the entity.  Allowable values: branched, non-polymer, polymer, polymer-like '),
+    )),
+    'PdbxReferenceEntityPoly': ('', (
+        ('db_code', None, False, 'The database code for this source information'),
+        ('db_name', None, False, 'The database name for this source information'),
+        ('prd_id', None, False, 'The value of _pdbx_reference_entity_poly.prd_id is a reference \t       _pdbx_reference_entity_list.prd_id in the  PDBX_REFERENCE_ENTITY_LIST category.'),
+        ('ref_entity_id', None, False, 'The value of _pdbx_reference_entity_poly.ref_entity_id is a reference  to _pdbx_reference_entity_list.ref_entity_id in PDBX_REFERENCE_ENTITY_LIST category.'),
+        ('type', None, False, 'The type of the polymer.  Allowable values: nucleic-acid-like, oligosaccharide, peptide-like, polysaccharide-like '),
+    )),
+    'PdbxReferenceEntityPolyLink': ('', (
+        ('atom_id_1', None, False, 'The atom identifier/name in the first of the two components making  the linkage.'),
+        ('atom_id_2', None, False, 'The atom identifier/name in the second of the two components making  the linkage.'),
+        ('comp_id_1', None, False, 'The component identifier in the first of the two components making the  linkage.   This data item is a pointer to _pdbx_reference_entity_poly_seq.mon_id  in the PDBX_REFERENCE_ENTITY_POLY_SEQ category.'),
+        ('comp_id_2', None, False, 'The component identifier in the second of the two components making the  linkage.   This data item is a pointer to _pdbx_reference_entity_poly_seq.mon_id  in the PDBX_REFERENCE_ENTITY_POLY_SEQ category.'),
+        ('component_id', None, False, 'The entity component identifier entity containing the linkage.'),
+        ('entity_seq_num_1', None, False, 'For a polymer entity, the sequence number in the first of  the two components making the linkage.   This data item is a pointer to _pdbx_reference_entity_poly_seq.num  in the PDBX_REFERENCE_ENTITY_POLY_SEQ category.'),
+        ('entity_seq_num_2', None, False, 'For a polymer entity, the sequence number in the second of  the two components making the linkage.   This data item is a pointer to _pdbx_reference_entity_poly_seq.num  in the PDBX_REFERENCE_ENTITY_POLY_SEQ category.'),
+        ('link_id', None, False, 'The value of _pdbx_reference_entity_poly_link.link_id uniquely identifies  a linkage within a polymer entity.'),
+        ('prd_id', None, False, 'The value of _pdbx_reference_entity_poly_link.prd_id is a reference  _pdbx_reference_entity_list.prd_id in the PDBX_REFERENCE_ENTITY_POLY category.'),
+        ('ref_entity_id', None, False, 'The reference entity id of the polymer entity containing the linkage.   This data item is a pointer to _pdbx_reference_entity_poly.ref_entity_id  in the PDBX_REFERENCE_ENTITY_POLY category.'),
+        ('value_order', None, False, 'The bond order target for the non-standard linkage.  Allowable values: arom, delo, doub, pi, poly, quad, sing, trip '),
+    )),
+    'PdbxReferenceEntityPolySeq': ('', (
+        ('hetero', None, False, 'A flag to indicate that sequence heterogeneity at this monomer position.  Allowable values: N, Y '),
+        ('mon_id', None, False, 'This data item is the chemical component identifier of monomer.'),
+        ('num', None, False, 'The value of _pdbx_reference_entity_poly_seq.num must uniquely and sequentially  identify a record in the PDBX_REFERENCE_ENTITY_POLY_SEQ list.   This value is conforms to author numbering conventions and does not map directly  to the numbering conventions used for _entity_poly_seq.num.'),
+        ('observed', None, False, 'A flag to indicate that this monomer is observed in the instance example.  Allowable values: N, Y '),
+        ('parent_mon_id', None, False, 'This data item is the chemical component identifier for the parent component corresponding to this monomer.'),
+        ('prd_id', None, False, 'The value of _pdbx_reference_entity_poly_seq.prd_id is a reference \t       _pdbx_reference_entity_poly.prd_id in the  PDBX_REFERENCE_ENTITY_POLY category.'),
+        ('ref_entity_id', None, False, 'The value of _pdbx_reference_entity_poly_seq.ref_entity_id is a reference  to _pdbx_reference_entity_poly.ref_entity_id in PDBX_REFERENCE_ENTITY_POLY category.'),
+    )),
+    'PdbxReferenceEntitySequence': ('', (
+        ('NRP_flag', None, False, 'A flag to indicate a non-ribosomal entity.  Allowable values: N, Y '),
+        ('one_letter_codes', None, False, "The one-letter-code sequence for this entity.  Non-standard monomers are represented as 'X'."),
+        ('prd_id', None, False, 'The value of _pdbx_reference_entity_sequence.prd_id is a reference \t       _pdbx_reference_entity_list.prd_id in the  PDBX_REFERENCE_ENTITY_LIST category.'),
+        ('ref_entity_id', None, False, 'The value of _pdbx_reference_entity_sequence.ref_entity_id is a reference  to _pdbx_reference_entity_list.ref_entity_id in PDBX_REFERENCE_ENTITY_LIST category.'),
+        ('type', None, False, 'The monomer type for the sequence.  Allowable values: peptide-like, saccharide '),
+    )),
+    'PdbxReferenceEntitySrcNat': ('', (
+        ('atcc', None, False, 'The Americal Tissue Culture Collection code for organism from which the entity was isolated.'),
+        ('db_code', None, False, 'The database code for this source information'),
+        ('db_name', None, False, 'The database name for this source information'),
+        ('ordinal', None, False, 'The value of _pdbx_reference_entity_src_nat.ordinal distinguishes \t       source details for this entity.'),
+        ('organism_scientific', None, False, 'The scientific name of the organism from which the entity was isolated.  Examples: Mus musculus '),
+        ('prd_id', None, False, 'The value of _pdbx_reference_entity_src_nat.prd_id is a reference \t       _pdbx_reference_entity_list.prd_id in the  PDBX_REFERENCE_ENTITY_LIST category.'),
+        ('ref_entity_id', None, False, 'The value of _pdbx_reference_entity_src_nat.ref_entity_id is a reference  to _pdbx_reference_entity_list.ref_entity_id in PDBX_REFERENCE_ENTITY_LIST category.'),
+        ('source', None, False, 'The data source for this information.'),
+        ('source_id', None, False, 'A identifier within the data source for this information.'),
+        ('taxid', None, False, 'The NCBI TaxId of the organism from which the entity was isolated.'),
+    )),
+    'PdbxReferenceMolecule': ('', (
+        ('chem_comp_id', None, False, 'For entities represented as single molecules, the identifier  corresponding to the chemical definition for the molecule.  Examples: 0Z3, CD9 '),
+        ('class', None, False, 'Broadly defines the function of the entity.  Allowable values: Antagonist, Anthelmintic, Antibiotic, Antibiotic, Anthelmintic, Antibiotic, Antimicrobial, Antibiotic, Antineoplastic, Anticancer, Anticoagulant, Anticoagulant, Antithrombotic, Antifungal, Antigen, Antiinflammatory, Antimicrobial, Antimicrobial, Antiparasitic, Antibiotic, Antimicrobial, Antiretroviral, Antimicrobial, Antitumor, Antineoplastic, Antiparasitic, Antiretroviral, Antithrombotic, Antitumor, Antiviral, CASPASE inhibitor, Chaperone binding, Drug delivery, Enzyme inhibitor, Glycan component, Growth factor, Immunosuppressant, Inducer, Inhibitor, Lantibiotic, Metabolism, Metal transport, Nutrient, Oxidation-reduction, Protein binding, Receptor, Substrate analog, Synthetic opioid, Thrombin inhibitor, Thrombin inhibitor, Trypsin inhibitor, Toxin, Transition state mimetic, Transport activator, Trypsin inhibitor, Unknown, Water retention '),
+        ('class_evidence_code', None, False, 'Evidence for the assignment of _pdbx_reference_molecule.class'),
+        ('compound_details', None, False, 'Special details about this molecule.'),
+        ('description', None, False, 'Description of this molecule.'),
+        ('formula', None, False, "The formula for the reference entity. Formulae are written  according to the rules:   1. Only recognised element symbols may be used.   2. Each element symbol is followed by a 'count' number. A count     of '1' may be omitted.   3. A space or parenthesis must separate each element symbol and     its count, but in general parentheses are not used.   4. The order of elements depends on whether or not carbon is     present. If carbon is present, the order should be: C, then     H, then the other elements in alphabetical order of their     symbol. If carbon is not present, the elements are listed     purely in alphabetic order of their symbol. This is the     'Hill' system used by Chemical Abstracts.  Examples: C18 H19 N7 O8 S "),
+        ('formula_weight', None, False, 'Formula mass in daltons of the entity.'),
+        ('name', None, False, 'A name of the entity.  Examples: thiostrepton '),
+        ('prd_id', None, False, 'The value of _pdbx_reference_molecule.prd_id is the unique identifier  for the reference molecule in this family.   By convention this ID uniquely identifies the reference molecule in  in the PDB reference dictionary.   The ID has the template form PRD_dddddd (e.g. PRD_000001)  Examples: PRD_000001, PRD_0000010 '),
+        ('release_status', None, False, 'Defines the current PDB release status for this molecule definition.  Allowable values: HOLD, OBS, REL, WAIT '),
+        ('replaced_by', None, False, 'Assigns the identifier of the reference molecule that has replaced this molecule.'),
+        ('replaces', None, False, 'Assigns the identifier for the reference molecule which have been replaced  by this reference molecule.  Multiple molecule identifier codes should be separated by commas.'),
+        ('represent_as', None, False, 'Defines how this entity is represented in PDB data files.  Allowable values: branched, polymer, single molecule '),
+        ('representative_PDB_id_code', None, False, 'The PDB accession code for the entry containing a representative example of this molecule.'),
+        ('type', None, False, 'Defines the structural classification of the entity.  Allowable values: Amino acid, Aminoglycoside, Ansamycin, Anthracycline, Anthraquinone, Chalkophore, Chalkophore, Polypeptide, Chromophore, Cyclic depsipeptide, Cyclic lipopeptide, Cyclic peptide, Glycopeptide, Heterocyclic, Imino sugar, Keto acid, Lipoglycopeptide, Lipopeptide, Macrolide, Non-polymer, Nucleoside, Oligopeptide, Oligosaccharide, Peptaibol, Peptide-like, Polycyclic, Polypeptide, Polysaccharide, Quinolone, Siderophore, Thiolactone, Thiopeptide, Unknown '),
+        ('type_evidence_code', None, False, 'Evidence for the assignment of _pdbx_reference_molecule.type'),
+    )),
+    'PdbxReferenceMoleculeAnnotation': ('', (
+        ('family_prd_id', None, False, 'The value of _pdbx_reference_molecule_annotation.family_prd_id is a reference to  _pdbx_reference_molecule_list.family_prd_id in category PDBX_REFERENCE_MOLECULE_FAMILY_LIST.'),
+        ('ordinal', None, False, 'This data item distinguishes anotations for this entity.'),
+        ('prd_id', None, False, 'This data item is a pointer to _pdbx_reference_molecule.prd_id in the  PDB_REFERENCE_MOLECULE category.'),
+        ('source', None, False, 'The source of the annoation for this entity.  Examples: depositor provided, from UniProt Entry P200311 '),
+        ('text', None, False, 'Text describing the annotation for this entity.  Examples: antigen binding, glucose transporter activity '),
+        ('type', None, False, 'Type of annotation for this entity.  Examples: Function, Use, Pharmacology, Mechanism_of_Action, Biological_Activity, Inhibitor_Class, Therapeutic_Category, Research_Use, Other_annotation '),
+    )),
+    'PdbxReferenceMoleculeDetails': ('', (
+        ('family_prd_id', None, False, "The value of _pdbx_reference_molecule_details.family_prd_id is a reference to  _pdbx_reference_molecule_list.family_prd_id' in category PDBX_REFERENCE_MOLECULE_FAMILY."),
+        ('ordinal', None, False, 'The value of _pdbx_reference_molecule_details.ordinal is an ordinal that  distinguishes each descriptive text for this entity.'),
+        ('source', None, False, 'A data source of this information (e.g. PubMed, Merck Index)'),
+        ('source_id', None, False, 'A identifier within the data source for this information.'),
+        ('text', None, False, 'The text of the description of special aspects of the entity.'),
+    )),
+    'PdbxReferenceMoleculeFamily': ('', (
+        ('family_prd_id', None, False, 'The value of _pdbx_reference_entity.family_prd_id must uniquely identify a record in the  PDBX_REFERENCE_MOLECULE_FAMILY list.   By convention this ID uniquely identifies the reference family in  in the PDB reference dictionary.   The ID has the template form FAM_dddddd (e.g. FAM_000001)'),
+        ('name', None, False, 'The entity family name.  Examples: actinomycin, adriamycin '),
+        ('release_status', None, False, 'Assigns the current PDB release status for this family.  Allowable values: HOLD, OBS, REL, WAIT '),
+        ('replaced_by', None, False, 'Assigns the identifier of the family that has replaced this component.'),
+        ('replaces', None, False, 'Assigns the identifier for the family which have been replaced by this family.  Multiple family identifier codes should be separated by commas.'),
+    )),
+    'PdbxReferenceMoleculeFeatures': ('', (
+        ('family_prd_id', None, False, 'The value of _pdbx_reference_molecule_features.family_prd_id is a reference to  _pdbx_reference_molecule_list.family_prd_id in category PDBX_REFERENCE_MOLECULE_FAMILY_LIST.'),
+        ('ordinal', None, False, 'The value of _pdbx_reference_molecule_features.ordinal distinguishes \t       each feature for this entity.'),
+        ('prd_id', None, False, 'The value of _pdbx_reference_molecule_features.prd_id is a reference \t       _pdbx_reference_molecule.prd_id in the  PDBX_REFERENCE_MOLECULE category.'),
+        ('source', None, False, 'The information source for the component feature.  Examples: PDB, CHEBI, DRUGBANK, PUBCHEM '),
+        ('source_ordinal', None, False, 'The value of _pdbx_reference_molecule_features.source_ordinal provides \t       the priority order of features from a particular source or database.'),
+        ('type', None, False, 'The entity feature type.  Examples: FUNCTION, ENZYME INHIBITED, STRUCTURE IMAGE URL '),
+        ('value', None, False, 'The entity feature value.'),
+    )),
+    'PdbxReferenceMoleculeList': ('', (
+        ('family_prd_id', None, False, "The value of _pdbx_reference_molecule_list.family_prd_id is a reference to  _pdbx_reference_molecule_family.family_prd_id' in category PDBX_REFERENCE_MOLECULE_FAMILY."),
+        ('prd_id', None, False, 'The value of _pdbx_reference_molecule_list.prd_id is the unique identifier  for the reference molecule in this family.   By convention this ID uniquely identifies the reference molecule in  in the PDB reference dictionary.   The ID has the template form PRD_dddddd (e.g. PRD_000001)'),
+    )),
+    'PdbxReferenceMoleculeRelatedStructures': ('', (
+        ('citation_id', None, False, 'A link to related reference information in the citation category.'),
+        ('db_accession', None, False, 'The database accession code for the related structure reference.  Examples: 143108 '),
+        ('db_code', None, False, 'The database identifier code for the related structure reference.  Examples: QEFHUE '),
+        ('db_name', None, False, 'The database name for the related structure reference.  Examples: CCDC '),
+        ('family_prd_id', None, False, 'The value of _pdbx_reference_molecule_related_structures.family_prd_id is a reference to  _pdbx_reference_molecule_list.family_prd_id in category PDBX_REFERENCE_MOLECULE_FAMILY_LIST.'),
+        ('formula', None, False, "The formula for the reference entity. Formulae are written  according to the rules:   1. Only recognised element symbols may be used.   2. Each element symbol is followed by a 'count' number. A count     of '1' may be omitted.   3. A space or parenthesis must separate each element symbol and     its count, but in general parentheses are not used.   4. The order of elements depends on whether or not carbon is     present. If carbon is present, the order should be: C, then     H, then the other elements in alphabetical order of their     symbol. If carbon is not present, the elements are listed     purely in alphabetic order of their symbol. This is the     'Hill' system used by Chemical Abstracts.  Examples: C18 H19 N7 O8 S "),
+        ('name', None, False, 'The chemical name for the structure entry in the related database  Examples: actinomycn '),
+        ('ordinal', None, False, 'The value of _pdbx_reference_molecule_related_structures.ordinal distinguishes  related structural data for each entity.'),
+    )),
+    'PdbxReferenceMoleculeSynonyms': ('', (
+        ('family_prd_id', None, False, 'The value of _pdbx_reference_molecule_synonyms.family_prd_id is a reference to  _pdbx_reference_molecule_list.family_prd_id in category PDBX_REFERENCE_MOLECULE_FAMILY_LIST.'),
+        ('name', None, False, 'A synonym name for the entity.  Examples: thiostrepton '),
+        ('ordinal', None, False, 'The value of _pdbx_reference_molecule_synonyms.ordinal is an ordinal \t       to distinguish synonyms for this entity.'),
+        ('prd_id', None, False, 'The value of _pdbx_reference_molecule_synonyms.prd_id is a reference \t       _pdbx_reference_molecule.prd_id in the  PDBX_REFERENCE_MOLECULE category.'),
+        ('source', None, False, 'The source of this synonym name for the entity.  Examples: CAS '),
+    )),
+    'PdbxReflnsTwin': ('', (
+        ('crystal_id', None, False, 'The crystal identifier.  A reference to  _exptl_crystal.id in category EXPTL_CRYSTAL.'),
+        ('diffrn_id', None, False, 'The diffraction data set identifier.  A reference to  _diffrn.id in category DIFFRN.'),
+        ('domain_id', None, False, 'An identifier for the twin domain.'),
+        ('fraction', None, False, 'The twin fraction or twin factor represents a quantitative parameter for the crystal twinning.  The value 0 represents no twinning, < 0.5 partial twinning,  = 0.5 for perfect twinning.'),
+        ('operator', None, False, 'The possible merohedral or hemihedral twinning operators for different point groups are:  True point group  \tTwin operation  \thkl related to 3                      \t2 along a,b             h,-h-k,-l                        \t2 along a*,b*           h+k,-k,-l                         2 along c               -h,-k,l 4                       2 along a,b,a*,b*       h,-k,-l 6                       2 along a,b,a*,b*       h,-h-k,-l 321                     2 along a*,b*,c         -h,-k,l 312                     2 along a,b,c           -h,-k,l 23                      4 along a,b,c            k,-h,l  References:  Yeates, T.O. (1997) Methods in Enzymology 276, 344-358. Detecting and  Overcoming Crystal Twinning.   and information from the following on-line sites:     CNS site http://cns.csb.yale.edu/v1.1/    CCP4 site http://www.ccp4.ac.uk/dist/html/detwin.html    SHELX site http://shelx.uni-ac.gwdg.de/~rherbst/twin.html  Examples: h,-h-k,-l, h+k,-k,-l, -h,-k,l, h,-k,-l, h,-h-k,-l, -h,-k,l, k,-h,l '),
+        ('type', None, False, 'There are two types of twinning: merohedral or hemihedral                                  non-merohedral or epitaxial  For merohedral twinning the diffraction patterns from the different domains are completely superimposable.   Hemihedral twinning is a special case of merohedral twinning. It only involves two distinct domains.  Pseudo-merohedral twinning is a subclass merohedral twinning in which lattice is coincidentally superimposable.  In the case of non-merohedral or epitaxial twinning  the reciprocal lattices do not superimpose exactly. In this case the  diffraction pattern consists of two (or more) interpenetrating lattices, which can in principle be separated.  Allowable values: epitaxial, hemihedral, merohedral, non-merohedral, pseudo-merohedral, tetartohedral '),
+    )),
+    'PdbxRelatedExpDataSet': ('', (
+        ('data_reference', None, False, 'A DOI reference to the related data set.  Examples: 10.000/10002/image_data/cif '),
+        ('data_set_type', None, False, 'The type of the experimenatal data set.  Examples: diffraction image data, NMR free induction decay data '),
+        ('details', None, False, 'Additional details describing the content of the related data set and its application to  the current investigation.'),
+        ('metadata_reference', None, False, 'A DOI reference to the metadata decribing the related data set.  Examples: 10.000/10002/image_data/txt '),
+    )),
+    'PdbxSGProject': ('', (
+        ('full_name_of_center', None, False, 'The value identifies the full name of center.  Allowable values: Accelerated Technologies Center for Gene to 3D Structure, Assembly, Dynamics and Evolution of Cell-Cell and Cell-Matrix Adhesions, Atoms-to-Animals: The Immune Function Network, Bacterial targets at IGS-CNRS, France, Berkeley Structural Genomics Center, Center for Eukaryotic Structural Genomics, Center for High-Throughput Structural Biology, Center for Membrane Proteins of Infectious Diseases, Center for Structural Biology of Infectious Diseases, Center for Structural Genomics of Infectious Diseases, Center for Structures of Membrane Proteins, Center for the X-ray Structure Determination of Human Transporters, Chaperone-Enabled Studies of Epigenetic Regulation Enzymes, Enzyme Discovery for Natural Product Biosynthesis, GPCR Network, Integrated Center for Structure and Function Innovation, Israel Structural Proteomics Center, Joint Center for Structural Genomics, Marseilles Structural Genomics Program @ AFMB, Medical Structural Genomics of Pathogenic Protozoa, Membrane Protein Structural Biology Consortium, Membrane Protein Structures by Solution NMR, Midwest Center for Macromolecular Research, Midwest Center for Structural Genomics, Mitochondrial Protein Partnership, Montreal-Kingston Bacterial Structural Genomics Initiative, Mycobacterium Tuberculosis Structural Proteomics Project, New York Consortium on Membrane Protein Structure, New York SGX Research Center for Structural Genomics, New York Structural GenomiX Research Consortium, New York Structural Genomics Research Consortium, Northeast Structural Genomics Consortium, Nucleocytoplasmic Transport: a Target for Cellular Control, Ontario Centre for Structural Proteomics, Oxford Protein Production Facility, Paris-Sud Yeast Structural Genomics, Partnership for Nuclear Receptor Signaling Code Biology, Partnership for Stem Cell Biology, Partnership for T-Cell Biology, Program for the Characterization of Secreted Effector Proteins, Protein Structure Factory, RIKEN Structural Genomics/Proteomics Initiative, Scottish Structural Proteomics Facility, Seattle Structural Genomics Center for Infectious Disease, South Africa Structural Targets Annotation Database, Southeast Collaboratory for Structural Genomics, Structural Genomics Consortium, Structural Genomics Consortium for Research on Gene Expression, Structural Genomics of Pathogenic Protozoa Consortium, Structural Proteomics in Europe, Structural Proteomics in Europe 2, Structure 2 Function Project, Structure, Dynamics and Activation Mechanisms of Chemokine Receptors, Structure-Function Analysis of Polymorphic CDI Toxin-Immunity Protein Complexes, Structure-Function Studies of Tight Junction Membrane Proteins, Structures of Mtb Proteins Conferring Susceptibility to Known Mtb Inhibitors, TB Structural Genomics Consortium, Transcontinental EM Initiative for Membrane Protein Structure, Transmembrane Protein Center '),
+        ('id', None, False, 'A unique integer identifier for this center  Allowable values: 1, 2, 3, 4, 5, 6, 7, 8, 9, 10 '),
+        ('initial_of_center', None, False, 'The value identifies the full name of center.  Allowable values: ATCG3D, BIGS, BSGC, BSGI, CEBS, CELLMAT, CESG, CHSAM, CHTSB, CSBID, CSGID, CSMP, GPCR, IFN, ISFI, ISPC, JCSG, MCMR, MCSG, MPID, MPP, MPSBC, MPSbyNMR, MSGP, MSGPP, MTBI, NESG, NHRs, NPCXstals, NYCOMPS, NYSGRC, NYSGXRC, NatPro, OCSP, OPPF, PCSEP, PSF, RSGI, S2F, SASTAD, SECSG, SGC, SGCGES, SGPP, SPINE, SPINE-2, SSGCID, SSPF, STEMCELL, TBSGC, TCELL, TEMIMPS, TJMP, TMPC, TransportPDB, UC4CDI, XMTB, YSG '),
+        ('project_name', None, False, 'The value identifies the Structural Genomics project.  Allowable values: Enzyme Function Initiative, NIAID, National Institute of Allergy and Infectious Diseases, NPPSFA, National Project on Protein Structural and Functional Analyses, PSI, Protein Structure Initiative, PSI:Biology '),
+    )),
+    'PdbxSerialCrystallographyDataReduction': ('', (
+        ('crystal_hits', None, False, 'For experiments in which samples are provided in a  continuous stream, the total number of frames collected  in which the crystal was hit.'),
+        ('diffrn_id', None, False, 'The data item is a pointer to _diffrn.id in the DIFFRN  category.  Examples: 1 '),
+        ('droplet_hits', None, False, 'For experiments in which samples are provided in a  continuous stream, the total number of frames collected  in which a droplet was hit.'),
+        ('frame_hits', None, False, 'For experiments in which samples are provided in a  continuous stream, the total number of data frames collected  in which the sample was hit.'),
+        ('frames_failed_index', None, False, "For experiments in which samples are provided in a  continuous stream, the total number of data frames collected  that contained a 'hit' but failed to index."),
+        ('frames_indexed', None, False, 'For experiments in which samples are provided in a  continuous stream, the total number of data frames collected  that were indexed.'),
+        ('frames_total', None, False, 'The total number of data frames collected for this  data set.'),
+        ('lattices_indexed', None, False, 'For experiments in which samples are provided in a  continuous stream, the total number of lattices indexed.'),
+        ('lattices_merged', None, False, 'For experiments in which samples are provided in a             continuous stream, the total number of crystal lattices             that were merged in the final dataset.  Can be             less than frames_indexed depending on filtering during merging or \t    can be more than frames_indexed if there are multiple lattices. \t    per frame.'),
+        ('xfel_pulse_events', None, False, 'For FEL experiments, the number of pulse events in the dataset.'),
+        ('xfel_run_numbers', None, False, 'For FEL experiments, in which data collection was performed \t       in batches, indicates which subset of the data collected                were used in producing this dataset.'),
+    )),
+    'PdbxSerialCrystallographyMeasurement': ('', (
+        ('collection_time_total', None, False, 'The total number of hours required to measure this data set.  Examples: null '),
+        ('collimation', None, False, 'The collimation or type of focusing optics applied to the radiation.  Examples: Kirkpatrick-Baez mirrors, Beryllium compound refractive lenses, Fresnel zone plates '),
+        ('diffrn_id', None, False, 'The data item is a pointer to _diffrn.id in the DIFFRN  category.  Examples: 1 '),
+        ('focal_spot_size', None, False, 'The focal spot size of the beam  impinging on the sample (micrometres squared).'),
+        ('photons_per_pulse', None, False, 'The photons per pulse measured in  (tera photons (10^(12)^)/pulse units).'),
+        ('pulse_duration', None, False, 'The average duration (femtoseconds) \t       of the pulse energy measured at the sample.'),
+        ('pulse_energy', None, False, 'The energy/pulse of the X-ray pulse impacting the sample measured in microjoules.'),
+        ('pulse_photon_energy', None, False, 'The photon energy of the X-ray pulse measured in KeV.'),
+        ('source_distance', None, False, 'The distance from source to the sample along the optical axis (metres).'),
+        ('source_size', None, False, 'The dimension of the source beam measured at the source (micrometres squared).'),
+        ('xfel_pulse_repetition_rate', None, False, 'For FEL experiments, the pulse repetition rate measured in cycles per seconds.'),
+    )),
+    'PdbxSerialCrystallographySampleDelivery': ('', (
+        ('description', None, False, 'The description of the mechanism by which the specimen in placed in the path  of the source.  Examples: fixed target, electrospin, MESH, CoMESH, gas dynamic virtual nozzle, LCP injector, addressable microarray '),
+        ('diffrn_id', None, False, 'The data item is a pointer to _diffrn.id in the DIFFRN  category.  Examples: 1 '),
+        ('method', None, False, 'The description of the mechanism by which the specimen in placed in the path  of the source.  Allowable values: fixed target, injection '),
+    )),
+    'PdbxSerialCrystallographySampleDeliveryFixedTarget': ('', (
+        ('crystals_per_unit', None, False, 'The number of crystals per dropplet or pore in fixed target'),
+        ('description', None, False, 'For a fixed target sample, a description of sample preparation'),
+        ('details', None, False, 'Any details pertinent to the fixed sample target'),
+        ('diffrn_id', None, False, 'The data item is a pointer to _diffrn.id in the DIFFRN  category.  Examples: 1 '),
+        ('motion_control', None, False, 'Device used to control movement of the fixed sample  Examples: DMC-4080 '),
+        ('sample_dehydration_prevention', None, False, 'Method to prevent dehydration of sample  Examples: seal, humidifed gas, flash freezing '),
+        ('sample_holding', None, False, 'For a fixed target sample, mechanism to hold sample in the beam  Examples: mesh, loop, grid '),
+        ('sample_solvent', None, False, 'The sample solution content and concentration'),
+        ('sample_unit_size', None, False, 'Size of pore in grid supporting sample. Diameter or length in micrometres,  e.g. pore diameter'),
+        ('support_base', None, False, 'Type of base holding the support  Examples: goniometer '),
+        ('velocity_horizontal', None, False, 'Velocity of sample horizontally relative to a perpendicular beam in millimetres/second'),
+        ('velocity_vertical', None, False, 'Velocity of sample vertically relative to a perpendicular beam in millimetres/second'),
+    )),
+    'PdbxSerialCrystallographySampleDeliveryInjection': ('', (
+        ('carrier_solvent', None, False, 'For continuous sample flow experiments, the carrier buffer used  to move the sample into the beam. Should include protein  concentration.  Examples: LCP, grease, liquid '),
+        ('crystal_concentration', None, False, 'For continuous sample flow experiments, the concentration of  crystals in the solution being injected.   The concentration is measured in million crystals/ml.'),
+        ('description', None, False, 'For continuous sample flow experiments, a description of the injector used  to move the sample into the beam.  Examples: microextrusion injector '),
+        ('diffrn_id', None, False, 'The data item is a pointer to _diffrn.id in the DIFFRN  category.  Examples: 1 '),
+        ('filter_size', None, False, 'The size of filter in micrometres in filtering crystals'),
+        ('flow_rate', None, False, 'For continuous sample flow experiments, the flow rate of  solution being injected  measured in ul/min.'),
+        ('injector_diameter', None, False, 'For continuous sample flow experiments, the diameter of the  injector in micrometres.'),
+        ('injector_nozzle', None, False, 'The type of nozzle to deliver and focus sample jet  Examples: gas, GDVN '),
+        ('injector_pressure', None, False, 'For continuous sample flow experiments, the mean pressure  in kilopascals at which the sample is injected into the beam.'),
+        ('injector_temperature', None, False, 'For continuous sample flow experiments, the temperature in  Kelvins of the speciman injected. This may be different from  the temperature of the sample.'),
+        ('jet_diameter', None, False, 'Diameter in micrometres of jet stream of sample delivery'),
+        ('power_by', None, False, 'Sample deliver driving force, e.g. Gas, Electronic Potential  Examples: syringe, gas, electronic potential '),
+        ('preparation', None, False, 'Details of crystal growth and preparation of the crystals  Examples: Crystals transfered to carrier solvent at room temperature '),
+    )),
+    'PdbxSolnScatter': ('', (
+        ('buffer_name', None, False, 'The name of the buffer used for the sample in the solution scattering  experiment.  Examples: acetic acid '),
+        ('concentration_range', None, False, 'The concentration range (mg/mL) of the complex in the  sample used in the solution scattering experiment to  determine the mean radius of structural elongation.  Examples: 0.7 - 14 '),
+        ('data_analysis_software_list', None, False, 'A list of the software used in the data analysis  Examples: SCTPL5 GNOM '),
+        ('data_reduction_software_list', None, False, 'A list of the software used in the data reduction  Examples: OTOKO '),
+        ('detector_specific', None, False, 'The particular radiation detector. In general this will be a   manufacturer, description, model number or some combination of   these.'),
+        ('detector_type', None, False, 'The general class of the radiation detector.'),
+        ('id', None, False, 'The value of _pdbx_soln_scatter.id must  uniquely identify the sample in the category PDBX_SOLN_SCATTER'),
+        ('max_mean_cross_sectional_radii_gyration', None, False, "The maximum mean radius of structural elongation of the sample.  In a given solute-solvent contrast, the radius of gyration  R_G is a measure of structural elongation if the internal  inhomogeneity of scattering densities has no effect. Guiner  analysis at low Q give the R_G and the forward scattering at  zero angle I(0).      lnl(Q) = lnl(0) - R_G^2Q^2/3   where        Q = 4(pi)sin(theta/lamda)        2theta = scattering angle        lamda = wavelength   The above expression is valid in a QR_G range for extended  rod-like particles. The relative I(0)/c values ( where   c = sample concentration) for sample measurements in a  constant buffer for a single sample data session, gives the  relative masses of the protein(s) studied when referenced  against a standard.   see:      O.Glatter & O.Kratky, (1982). Editors of 'Small angle       X-ray Scattering, Academic Press, New York.      O.Kratky. (1963). X-ray small angle scattering with       substances of biological interest in diluted solutions.       Prog. Biophys. Chem., 13, 105-173.      G.D.Wignall & F.S.Bates, (1987). The small-angle approximation       of X-ray and neutron scatter from rigid rods of non-uniform       cross section and finite length. J.Appl. Crystallog., 18, 452-460.   If the structure is elongated, the mean radius of gyration  of the cross-sectional structure R_XS  and the mean cross sectional  intensity at zero angle [I(Q).Q]_Q->0 is obtained from     ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"),
+        ('max_mean_cross_sectional_radii_gyration_esd', None, False, "The estimated standard deviation for the minimum mean radius of structural elongation of the sample. In a given solute-solvent contrast, the radius of gyration R_G is a measure of structural elongation if the internal inhomogeneity of scattering densities has no effect. Guiner analysis at low Q give the R_G and the forward scattering at zero angle I(0).      lnl(Q) = lnl(0) - R_G^2Q^2/3  where       Q = 4(pi)sin(theta/lamda)       2theta = scattering angle       lamda = wavelength  The above expression is valid in a QR_G range for extended rod-like particles. The relative I(0)/c values ( where  c = sample concentration) for sample measurements in a constant buffer for a single sample data session, gives the relative masses of the protein(s) studied when referenced against a standard.  see:     O.Glatter & O.Kratky, (1982). Editors of 'Small angle      X-ray Scattering, Academic Press, New York.     O.Kratky. (1963). X-ray small angle scattering with      substances of biological interest in diluted solutions.      Prog. Biophys. Chem., 13, 105-173.     G.D.Wignall & F.S.Bates, (1987). The small-angle approximation      of X-ray and neutron scatter from rigid rods of non-uniform      cross section and finite length. J.Appl. Crystallog., 18, 452-460.  If the structure is elongated, the mean radius of gyration of the cross-sectional structure R_XS  and the mean cross sectional intensity at zero angle [I(Q).Q]_Q->0 is obtained from    ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"),
+        ('mean_guiner_radius', None, False, "The mean radius of structural elongation of the sample.  In a given solute-solvent contrast, the radius of gyration  R_G is a measure of structural elongation if the internal  inhomogeneity of scattering densities has no effect. Guiner  analysis at low Q gives the R_G and the forward scattering at  zero angle I(0).       lnl(Q) = lnl(0) - R_G^2Q^2/3   where        Q = 4(pi)sin(theta/lamda)        2theta = scattering angle        lamda = wavelength   The above expression is valid in a QR_G range for extended  rod-like particles. The relative I(0)/c values ( where   c = sample concentration) for sample measurements in a  constant buffer for a single sample data session, gives the  relative masses of the protein(s) studied when referenced  against a standard.   see: O.Glatter & O.Kratky, (1982). Editors of 'Small angle       X-ray Scattering, Academic Press, New York.       O.Kratky. (1963). X-ray small angle scattering with       substances of biological interest in diluted solutions.       Prog. Biophys. Chem., 13, 105-173.        G.D.Wignall & F.S.Bates, (1987). The small-angle approximation       of X-ray and neutron scatter from rigid rods of non-uniform       cross section and finite length. J.Appl. Crystallog., 18, 452-460.   If the structure is elongated, the mean radius of gyration  of the cross-sectional structure R_XS  and the mean cross sectional  intensity at zero angle [I(Q).Q]_Q->0 is obtained from      ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"),
+        ('mean_guiner_radius_esd', None, False, "The estimated standard deviation for the  mean radius of structural elongation of the sample.  In a given solute-solvent contrast, the radius of gyration  R_G is a measure of structural elongation if the internal  inhomogeneity of scattering densities has no effect. Guiner  analysis at low Q give the R_G and the forward scattering at  zero angle I(0).       lnl(Q) = lnl(0) - R_G^2Q^2/3   where        Q = 4(pi)sin(theta/lamda)        2theta = scattering angle        lamda = wavelength   The above expression is valid in a QR_G range for extended  rod-like particles. The relative I(0)/c values ( where   c = sample concentration) for sample measurements in a  constant buffer for a single sample data session, gives the  relative masses of the protein(s) studied when referenced  against a standard.   see:      O.Glatter & O.Kratky, (1982). Editors of 'Small angle       X-ray Scattering, Academic Press, New York.      O.Kratky. (1963). X-ray small angle scattering with       substances of biological interest in diluted solutions.       Prog. Biophys. Chem., 13, 105-173.      G.D.Wignall & F.S.Bates, (1987). The small-angle approximation       of X-ray and neutron scatter from rigid rods of non-uniform       cross section and finite length. J.Appl. Crystallog., 18, 452-460.   If the structure is elongated, the mean radius of gyration  of the cross-sectional structure R_XS  and the mean cross sectional  intensity at zero angle [I(Q).Q]_Q->0 is obtained from     ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"),
+        ('min_mean_cross_sectional_radii_gyration', None, False, "The minimum mean radius of structural elongation of the sample. In a given solute-solvent contrast, the radius of gyration R_G is a measure of structural elongation if the internal inhomogeneity of scattering densities has no effect. Guiner analysis at low Q give the R_G and the forward scattering at zero angle I(0).      lnl(Q) = lnl(0) - R_G^2Q^2/3  where       Q = 4(pi)sin(theta/lamda)       2theta = scattering angle       lamda = wavelength  The above expression is valid in a QR_G range for extended rod-like particles. The relative I(0)/c values ( where  c = sample concentration) for sample measurements in a constant buffer for a single sample data session, gives the relative masses of the protein(s) studied when referenced against a standard.  see:     O.Glatter & O.Kratky, (1982). Editors of 'Small angle      X-ray Scattering, Academic Press, New York.     O.Kratky. (1963). X-ray small angle scattering with      substances of biological interest in diluted solutions.      Prog. Biophys. Chem., 13, 105-173.     G.D.Wignall & F.S.Bates, (1987). The small-angle approximation      of X-ray and neutron scatter from rigid rods of non-uniform      cross section and finite length. J.Appl. Crystallog., 18, 452-460.  If the structure is elongated, the mean radius of gyration of the cross-sectional structure R_XS  and the mean cross sectional intensity at zero angle [I(Q).Q]_Q->0 is obtained from    ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"),
+        ('min_mean_cross_sectional_radii_gyration_esd', None, False, "The estimated standard deviation for the minimum mean radius of structural elongation of the sample. In a given solute-solvent contrast, the radius of gyration R_G is a measure of structural elongation if the internal inhomogeneity of scattering densities has no effect. Guiner analysis at low Q give the R_G and the forward scattering at zero angle I(0).     lnl(Q) = lnl(0) - R_G^2Q^2/3  where       Q = 4(pi)sin(theta/lamda)       2theta = scattering angle       lamda = wavelength  The above expression is valid in a QR_G range for extended rod-like particles. The relative I(0)/c values ( where  c = sample concentration) for sample measurements in a constant buffer for a single sample data session, gives the relative masses of the protein(s) studied when referenced against a standard.  see:     O.Glatter & O.Kratky, (1982). Editors of 'Small angle      X-ray Scattering, Academic Press, New York.     O.Kratky. (1963). X-ray small angle scattering with      substances of biological interest in diluted solutions.      Prog. Biophys. Chem., 13, 105-173.     G.D.Wignall & F.S.Bates, (1987). The small-angle approximation      of X-ray and neutron scatter from rigid rods of non-uniform      cross section and finite length. J.Appl. Crystallog., 18, 452-460.  If the structure is elongated, the mean radius of gyration of the cross-sectional structure R_XS  and the mean cross sectional intensity at zero angle [I(Q).Q]_Q->0 is obtained from     ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"),
+        ('num_time_frames', None, False, 'The number of time frame solution scattering images used.'),
+        ('protein_length', None, False, 'The length (or range) of the protein sample under study. If the solution structure is approximated as an elongated elliptical cyclinder the length L is determined from,    L = sqrt [12( (R_G)^2  -  (R_XS)^2 ) ]  The length should also be given by    L = pi I(0) / [ I(Q).Q]_Q->0'),
+        ('sample_pH', None, False, 'The pH value of the buffered sample.'),
+        ('source_beamline', None, False, 'The beamline name used for the experiment'),
+        ('source_beamline_instrument', None, False, 'The instrumentation used on the beamline'),
+        ('source_class', None, False, 'The general class of the radiation source.  Examples: neutron source, synchrotron '),
+        ('source_type', None, False, 'The make, model, name or beamline of the source of radiation.'),
+        ('temperature', None, False, 'The temperature in kelvins at which the experiment  was conducted'),
+        ('type', None, False, 'The type of solution scattering experiment carried out  Allowable values: modelling, neutron, x-ray '),
+    )),
+    'PdbxSolnScatterModel': ('', (
+        ('conformer_selection_criteria', None, False, 'A description of the conformer selection criteria  used.  Examples: The modelled scattering curves were assessed by calculation of the    RG, RSX-1 and RXS-2 values in the same Q ranges    used in the experimental Guinier fits. models were    then ranked using a goodness-of-fit R-factor    defined by analogy with protein crystallography    and based on the experimental curves in the Q range    extending to 1.4 nm-1. '),
+        ('details', None, False, 'A description of any additional details concerning the experiment.  Examples: Homology models were built for     the 17 SCR domains and energy minimisations were     performed to improve the connectivity in the fh model.     triantennary complex-type carbohydrate structures     (MAN3GLCNAC6GAL3FUC3NEUNAC1) were added to each of the     N-linked glycosylation sites. a library of linker peptide     conformations was used in domain modelling constrained     by the solution scattering fits. modelling with the     scattering data was also carried out by rotational     search methods. the x-ray and neutron scattering curve     I(Q) was calculated assuming a uniform scattering density     for the spheres using the debye equation as adapted to     spheres. x-ray curves were calculated from the hydrated     sphere models without corrections for wavelength spread or     beam divergence, while these corrections were applied for     the neutron curves but now using unhydrated models. '),
+        ('entry_fitting_list', None, False, 'A list of the entries used to fit the model  to the scattering data  Examples: PDB CODE 1HFI, 1HCC, 1HFH, 1VCC '),
+        ('id', None, False, 'The value of _pdbx_soln_scatter_model.id must  uniquely identify the sample in the category PDBX_SOLN_SCATTER_MODEL'),
+        ('method', None, False, 'A description of the methods used in the modelling  Examples: Constrained scattering fitting of homology models '),
+        ('num_conformers_calculated', None, False, 'The number of model conformers calculated.'),
+        ('num_conformers_submitted', None, False, 'The number of model conformers submitted in the entry'),
+        ('representative_conformer', None, False, 'The index of the representative conformer among the submitted conformers for the entry'),
+        ('scatter_id', None, False, 'This data item is a pointer to  _pdbx_soln_scatter.id in the  PDBX_SOLN_SCATTER category.'),
+        ('software_author_list', None, False, 'A list of the software authors  Examples: MSI '),
+        ('software_list', None, False, 'A list of the software used in the modeeling  Examples: INSIGHT II, HOMOLOGY, DISCOVERY, BIOPOLYMER, DELPHI '),
+    )),
+    'PdbxStructAssembly': ('', (
+        ('details', None, False, "A description of special aspects of the macromolecular assembly.                 In the PDB, 'representative helical assembly', 'complete point assembly', \t       'complete icosahedral assembly', 'software_defined_assembly', 'author_defined_assembly', \t       and 'author_and_software_defined_assembly' are considered 'biologically relevant assemblies.  Examples: The icosahedral virus particle. "),
+        ('id', None, False, 'The value of _pdbx_struct_assembly.id must uniquely identify a record in  the PDBX_STRUCT_ASSEMBLY list.'),
+        ('method_details', None, False, 'Provides details of the method used to determine or  compute the assembly.'),
+        ('oligomeric_count', None, False, 'The number of polymer molecules in the assembly.'),
+        ('oligomeric_details', None, False, 'Provides the details of the oligomeric state of the assembly.  Examples: monomer, octameric, tetradecameric, eicosameric, 21-meric, 60-meric, 180-meric, helical '),
+        ('rcsb_candidate_assembly', None, False, "Candidate macromolecular assembly.   Excludes the following cases classified in pdbx_struct_asembly.details:   'crystal asymmetric unit', 'crystal asymmetric unit, crystal frame', 'helical asymmetric unit',  'helical asymmetric unit, std helical frame','icosahedral 23 hexamer', 'icosahedral asymmetric unit',  'icosahedral asymmetric unit, std point frame','icosahedral pentamer', 'pentasymmetron capsid unit',  'point asymmetric unit', 'point asymmetric unit, std point frame','trisymmetron capsid unit',   and 'deposited_coordinates'.  Allowable values: N, Y "),
+        ('rcsb_details', None, False, 'A filtered description of the macromolecular assembly.  Allowable values: author_and_software_defined_assembly, author_defined_assembly, software_defined_assembly '),
+    )),
+    'PdbxStructAssemblyAuthEvidence': ('', (
+        ('assembly_id', None, False, 'This item references an assembly in pdbx_struct_assembly'),
+        ('details', None, False, 'Provides any additional information regarding the evidence of this assembly  Examples: Homology to bacteriorhodopsin, Helical filament was observed by negative staining and Cryo-EM '),
+        ('experimental_support', None, False, 'Provides the experimental method to determine the state of this assembly  Allowable values: NMR Distance Restraints, NMR relaxation study, SAXS, assay for oligomerization, cross-linking, electron microscopy, equilibrium centrifugation, fluorescence resonance energy transfer, gel filtration, homology, immunoprecipitation, isothermal titration calorimetry, light scattering, mass spectrometry, microscopy, native gel electrophoresis, none, scanning transmission electron microscopy, surface plasmon resonance '),
+        ('id', None, False, 'Identifies a unique record in pdbx_struct_assembly_auth_evidence.'),
+    )),
+    'PdbxStructAssemblyGen': ('', (
+        ('assembly_id', None, False, 'This data item is a pointer to _pdbx_struct_assembly.id in the  PDBX_STRUCT_ASSEMBLY category.'),
+        ('asym_id_list', None, False, 'This data item is a pointer to _struct_asym.id in  the STRUCT_ASYM category.   This item may be expressed as a comma separated list of identifiers.'),
+        ('oper_expression', None, False, 'Identifies the operation of collection of operations  from category PDBX_STRUCT_OPER_LIST.   Operation expressions may have the forms:    (1)        the single operation 1   (1,2,5)    the operations 1, 2, 5   (1-4)      the operations 1,2,3 and 4   (1,2)(3,4) the combinations of operations              3 and 4 followed by 1 and 2 (i.e.              the cartesian product of parenthetical              groups applied from right to left)  Examples: (1), (1,2,5), (1-60), (1-60)(61) '),
+        ('ordinal', None, False, 'This data item is an ordinal index for the  PDBX_STRUCT_ASSEMBLY category.'),
+    )),
+    'PdbxStructAssemblyProp': ('', (
+        ('assembly_id', None, False, 'The identifier for the assembly used in category PDBX_STRUCT_ASSEMBLY.'),
+        ('biol_id', None, False, 'The identifier for the assembly used in category PDBX_STRUCT_ASSEMBLY.'),
+        ('type', None, False, 'The property type for the assembly.  Allowable values: ABSA (A^2), MORE, SSA (A^2) '),
+        ('value', None, False, 'The value of the assembly property.'),
+    )),
+    'PdbxStructOperList': ('', (
+        ('id', None, False, 'This identifier code must uniquely identify a  record in the PDBX_STRUCT_OPER_LIST list.'),
+        ('matrix_1_1', None, False, 'The [1][1] element of the 3x3 matrix component of the  transformation operation.'),
+        ('matrix_1_2', None, False, 'The [1][2] element of the 3x3 matrix component of the  transformation operation.'),
+        ('matrix_1_3', None, False, 'The [1][3] element of the 3x3 matrix component of the  transformation operation.'),
+        ('matrix_2_1', None, False, 'The [2][1] element of the 3x3 matrix component of the  transformation operation.'),
+        ('matrix_2_2', None, False, 'The [2][2] element of the 3x3 matrix component of the  transformation operation.'),
+        ('matrix_2_3', None, False, 'The [2][3] element of the 3x3 matrix component of the  transformation operation.'),
+        ('matrix_3_1', None, False, 'The [3][1] element of the 3x3 matrix component of the  transformation operation.'),
+        ('matrix_3_2', None, False, 'The [3][2] element of the 3x3 matrix component of the  transformation operation.'),
+        ('matrix_3_3', None, False, 'The [3][3] element of the 3x3 matrix component of the  transformation operation.'),
+        ('name', None, False, 'A descriptive name for the transformation operation.  Examples: 1_555, two-fold rotation '),
+        ('symmetry_operation', None, False, 'The symmetry operation corresponding to the transformation operation.  Examples: x,y,z, x+1/2,y,-z '),
+        ('type', None, False, 'A code to indicate the type of operator.  Allowable values: 2D crystal symmetry operation, 3D crystal symmetry operation, build 2D crystal asymmetric unit, build 3D crystal asymmetric unit, build helical asymmetric unit, build point asymmetric unit, crystal symmetry operation, helical symmetry operation, identity operation, point symmetry operation, transform to 2D crystal frame, transform to 3D crystal frame, transform to crystal frame, transform to helical frame, transform to point frame '),
+        ('vector_1', None, False, 'The [1] element of the three-element vector component of the  transformation operation.'),
+        ('vector_2', None, False, 'The [2] element of the three-element vector component of the  transformation operation.'),
+        ('vector_3', None, False, 'The [3] element of the three-element vector component of the  transformation operation.'),
+    )),
+    'PdbxStructSpecialSymmetry': ('', (
+        ('PDB_model_num', None, False, 'Part of the identifier for the molecular component.  This data item is a pointer to _atom_site.pdbx_PDB_model_num in the ATOM_SITE category.'),
+        ('auth_seq_id', None, False, 'Part of the identifier for the molecular component.   This data item is a pointer to _atom_site.auth_seq_id in the  ATOM_SITE category.'),
+        ('id', None, False, 'The value of _pdbx_struct_special_symmetry.id must uniquely identify  each item in the PDBX_STRUCT_SPECIAL_SYMMETRY list.   This is an integer serial number.'),
+        ('label_asym_id', None, False, 'Part of the identifier for the molecular component.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category.'),
+        ('label_comp_id', None, False, 'Part of the identifier for the molecular component.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category.'),
+    )),
+    'PdbxVrptSummary': ('', (
+        ('RNA_suiteness', None, False, 'The MolProbity conformer-match quality parameter for RNA structures. Low values are worse. Specific to structures that contain RNA polymers.  Examples: null '),
+        ('attempted_validation_steps', None, False, "The steps that were attempted by the validation pipeline software.  A step typically involves running a 3rd party validation tool, for instance 'mogul' Each step will be enumerated in _pdbx_vrpt_software category."),
+        ('ligands_for_buster_report', None, False, 'A flag indicating if there are ligands in the model used for detailed Buster analysis.  Allowable values: N, Y '),
+        ('report_creation_date', None, False, 'The date, time and time-zone that the validation report  was created.  The string will be formatted like yyyy-mm-dd:hh:mm in GMT time.'),
+        ('restypes_notchecked_for_bond_angle_geometry', None, False, "This is a comma separated list of the residue types whose bond lengths and bond angles have  not been checked against 'standard geometry' using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996)"),
+    )),
+    'PdbxVrptSummaryDiffraction': ('', (
+        ('B_factor_type', None, False, 'An indicator if isotropic B factors are partial or full values.  Allowable values: FULL, PARTIAL '),
+        ('Babinet_b', None, False, "REFMAC scaling parameter as reported in log output line starting 'bulk solvent: scale'. X-ray entry specific, obtained in the EDS step from REFMAC calculation."),
+        ('Babinet_k', None, False, "REFMAC scaling parameter as reported in log output line starting 'bulk solvent: scale'. X-ray entry specific, obtained in the EDS step from REFMAC calculation."),
+        ('CCP4_version', None, False, 'The version of CCP4 suite used in the analysis.'),
+        ('DCC_R', None, False, 'The overall R-factor from a DCC recalculation of an electron density map. Currently value is rounded to 2 decimal places. X-ray entry specific, obtained from the DCC program.'),
+        ('DCC_Rfree', None, False, 'Rfree as calculated by DCC.'),
+        ('EDS_R', None, False, 'The overall R factor from the EDS REFMAC calculation (no free set is used in this). Currently value is rounded to 2 decimal places. X-ray entry specific, obtained in the eds step from REFMAC calculation.'),
+        ('EDS_R_warning', None, False, 'Warning message when EDS calculated R vs reported R is higher than a threshold'),
+        ('EDS_res_high', None, False, 'The data high resolution diffraction limit, in Angstroms, found in the input structure factor file. X-ray entry specific, obtained in the EDS step.'),
+        ('EDS_res_low', None, False, 'The data low resolution diffraction limit, in Angstroms, found in the input structure factor file. X-ray entry specific, obtained in the EDS step.'),
+        ('Fo_Fc_correlation', None, False, 'Fo,Fc correlation: The difference between the observed structure factors (Fo) and the  calculated structure factors (Fc) measures the correlation between the model and the experimental data.  X-ray entry specific, obtained in the eds step from REFMAC calculation.'),
+        ('I_over_sigma', None, False, 'Each reflection has an intensity (I) and an uncertainty in measurement  (sigma(I)), so I/sigma(I) is the signal-to-noise ratio. This ratio decreases at higher resolution. <I/sigma(I)> is the mean of individual I/sigma(I) values. Value for outer resolution shell is given in parentheses. In case structure factor amplitudes are deposited, Xtriage estimates the intensities first and then calculates this metric. When intensities are available in the deposited file, these are converted to amplitudes and then back to intensity estimate before calculating the metric.   X-ray entry specific, calculated by Phenix Xtriage program.'),
+        ('Padilla_Yeates_L2_mean', None, False, 'Padilla and Yeates twinning parameter <|L**2|>. Theoretical values is 0.333 in the untwinned case, and 0.2 in the perfectly twinned case. X-ray entry specific, obtained from the Xtriage program.'),
+        ('Padilla_Yeates_L_mean', None, False, 'Padilla and Yeates twinning parameter <|L|>. Theoretical values is 0.5 in the untwinned case, and 0.375 in the perfectly twinned case. X-ray entry specific, obtained from the Xtriage program.'),
+        ('Q_score', None, False, 'The overall Q-score of the fit of coordinates to the electron map. The Q-score is defined in Pintilie, GH. et al., Nature Methods, 17, 328-334 (2020)'),
+        ('Wilson_B_aniso', None, False, 'Result of absolute likelihood based Wilson scaling,  The anisotropic B value of the data is determined using a likelihood based approach.  The resulting B tensor is reported, the 3 diagonal values are given first, followed by the 3 off diagonal values. A large spread in (especially the diagonal) values indicates anisotropy.  X-ray entry specific, calculated by Phenix Xtriage program.'),
+        ('Wilson_B_estimate', None, False, 'An estimate of the overall B-value of the structure, calculated from the diffraction data.  Units Angstroms squared. It serves as an indicator of the degree of order in the crystal and the value is usually  not hugely different from the average B-value calculated from the model. X-ray entry specific, calculated by Phenix Xtriage program.'),
+        ('acentric_outliers', None, False, "The number of acentric reflections that Xtriage identifies as outliers on the basis  of Wilson statistics. Note that if pseudo translational symmetry is present,  a large number of 'outliers' will be present. X-ray entry specific, calculated by Phenix Xtriage program."),
+        ('bulk_solvent_b', None, False, 'REFMAC scaling parameter as reported in log output file. X-ray entry specific, obtained in the EDS step from REFMAC calculation.'),
+        ('bulk_solvent_k', None, False, 'REFMAC reported scaling parameter. X-ray entry specific, obtained in the EDS step from REFMAC calculation.'),
+        ('centric_outliers', None, False, 'The number of centric reflections that Xtriage identifies as outliers. X-ray entry specific, calculated by Phenix Xtriage program.'),
+        ('data_anisotropy', None, False, 'The ratio (Bmax - Bmin) / Bmean where Bmax, Bmin and Bmean are computed from the B-values  associated with the principal axes of the anisotropic thermal ellipsoid.  This ratio is usually less than 0.5; for only 1% of PDB entries it is more than 1.0 (Read et al., 2011). X-ray entry specific, obtained from the Xtriage program.'),
+        ('data_completeness', None, False, 'The percent completeness of diffraction data.'),
+        ('density_fitness_version', None, False, 'The version of density-fitness suite programs used in the analysis.'),
+        ('exp_method', None, False, 'Experimental method for statistics'),
+        ('num_miller_indices', None, False, 'The number of Miller Indices reported by the Xtriage program. This should be the same as the number of _refln in the input structure factor file. X-ray entry specific, calculated by Phenix Xtriage program.'),
+        ('number_reflns_R_free', None, False, 'The number of reflections in the free set as defined in the input structure factor file supplied to the validation pipeline.  X-ray entry specific, obtained from the DCC program.'),
+        ('percent_RSRZ_outliers', None, False, 'The percent of RSRZ outliers.'),
+        ('percent_free_reflections', None, False, 'A percentage, Normally percent proportion of the total number. Between 0% and 100%.'),
+        ('servalcat_version', None, False, 'The version of Servalcat program used in the analysis.'),
+        ('trans_NCS_details', None, False, "A sentence giving the result of Xtriage's analysis on translational NCS. X-ray entry specific, obtained from the Xtriage program.  Examples: The largest off-origin peak in the Patterson function is 8.82% of the height of the origin peak. No significant pseudotranslation is detected. "),
+        ('twin_fraction', None, False, 'Estimated twinning fraction for operators as identified by Xtriage. A semicolon separated list of operators with fractions is givens  X-ray entry specific, obtained from the Xtriage program.  Examples: h,h-k,h-l:0.477;-h,-h+k,-l:0.020;-h,-k,-h+l:0.017 '),
+    )),
+    'PdbxVrptSummaryEm': ('', (
+        ('Q_score', None, False, 'The overall Q-score of the fit of coordinates to the electron map. The Q-score is defined in Pintilie, GH. et al., Nature Methods, 17, 328-334 (2020)'),
+        ('atom_inclusion_all_atoms', None, False, 'The proportion of all non hydrogen atoms within density.'),
+        ('atom_inclusion_backbone', None, False, 'The proportion of backbone atoms within density.'),
+        ('author_provided_fsc_resolution_by_cutoff_halfbit', None, False, 'The resolution from the intersection of the author provided fsc and the indicator curve halfbit.'),
+        ('author_provided_fsc_resolution_by_cutoff_onebit', None, False, 'The resolution from the intersection of the author provided fsc and the indicator curve onebit.'),
+        ('author_provided_fsc_resolution_by_cutoff_pt_143', None, False, 'The resolution from the intersection of the author provided fsc and the indicator curve 0.143.'),
+        ('author_provided_fsc_resolution_by_cutoff_pt_333', None, False, 'The resolution from the intersection of the author provided fsc and the indicator curve 0.333.'),
+        ('author_provided_fsc_resolution_by_cutoff_pt_5', None, False, 'The resolution from the intersection of the author provided fsc and the indicator curve 0.5.'),
+        ('author_provided_fsc_resolution_by_cutoff_threesigma', None, False, 'The resolution from the intersection of the author provided fsc and the indicator curve threesigma.'),
+        ('calculated_fsc_resolution_by_cutoff_halfbit', None, False, 'The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve halfbit.'),
+        ('calculated_fsc_resolution_by_cutoff_onebit', None, False, 'The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve onebit.'),
+        ('calculated_fsc_resolution_by_cutoff_pt_143', None, False, 'The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve 0.143.'),
+        ('calculated_fsc_resolution_by_cutoff_pt_333', None, False, 'The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve 0.333.'),
+        ('calculated_fsc_resolution_by_cutoff_pt_5', None, False, 'The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve 0.5.'),
+        ('calculated_fsc_resolution_by_cutoff_threesigma', None, False, 'The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve threesigma.'),
+        ('contour_level_primary_map', None, False, 'The recommended contour level for the primary map of this deposition.'),
+        ('exp_method', None, False, 'Experimental method for statistics'),
+    )),
+    'PdbxVrptSummaryEntityFitToMap': ('', (
+        ('PDB_model_num', None, False, 'The unique model number from _atom_site.pdbx_PDB_model_num.'),
+        ('Q_score', None, False, 'The calculated average Q-score.'),
+        ('average_residue_inclusion', None, False, 'The average of the residue inclusions for all residues in this instance'),
+    )),
+    'PdbxVrptSummaryEntityGeometry': ('', (
+        ('PDB_model_num', None, False, 'The unique model number from _atom_site.pdbx_PDB_model_num.'),
+        ('angles_RMSZ', None, False, "The overall root mean square of the Z-score for deviations of bond angles in comparison to  'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996)."),
+        ('average_residue_inclusion', None, False, 'The average of the residue inclusions for all residues in this instance'),
+        ('bonds_RMSZ', None, False, "The overall root mean square of the Z-score for deviations of bond lengths in comparison to  'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996)."),
+        ('num_angles_RMSZ', None, False, "The number of bond angles compared to 'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996)."),
+        ('num_bonds_RMSZ', None, False, "The number of bond lengths compared to 'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996)."),
+    )),
+    'PdbxVrptSummaryGeometry': ('', (
+        ('angles_RMSZ', None, False, "The overall root mean square of the Z-score for deviations of bond angles in comparison to  'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996). This value is for all chains in the structure."),
+        ('bonds_RMSZ', None, False, "The overall root mean square of the Z-score for deviations of bond lengths in comparison to  'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996). This value is for all chains in the structure."),
+        ('clashscore', None, False, 'This score is derived from the number of pairs of atoms in the PDB_model_num that are unusually close to each other.  It is calculated by the MolProbity pdbx_vrpt_software and expressed as the number or such clashes per thousand atoms. For structures determined by NMR the clashscore value here will only consider label_atom_id pairs in the  well-defined (core) residues from ensemble analysis.'),
+        ('clashscore_full_length', None, False, 'Only given for structures determined by NMR. The MolProbity pdbx_vrpt_instance_clashes score for all label_atom_id pairs.'),
+        ('num_H_reduce', None, False, 'This is the number of hydrogen atoms added and optimized by the MolProbity reduce pdbx_vrpt_software as part of the all-atom clashscore.'),
+        ('num_angles_RMSZ', None, False, "The number of bond angles compared to 'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996). This value is for all chains in the structure."),
+        ('num_bonds_RMSZ', None, False, "The number of bond lengths compared to 'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996). This value is for all chains in the structure."),
+        ('percent_ramachandran_outliers', None, False, 'The percentage of residues with Ramachandran outliers.'),
+        ('percent_ramachandran_outliers_full_length', None, False, 'Only given for structures determined by NMR. The MolProbity Ramachandran outlier score for all atoms in the structure rather than just the well-defined (core) residues.'),
+        ('percent_rotamer_outliers', None, False, "The MolProbity sidechain outlier score (a percentage). Protein sidechains mostly adopt certain (combinations of) preferred torsion angle values  (called rotamers or rotameric conformers), much like their backbone torsion angles  (as assessed in the Ramachandran analysis). MolProbity considers the sidechain conformation  of a residue to be an outlier if its set of torsion angles is not similar to any preferred  combination. The sidechain outlier score is calculated as the percentage of residues  with an unusual sidechain conformation with respect to the total number of residues for  which the assessment is available. Example: percent-rota-outliers='2.44'. Specific to structure that contain protein chains and have sidechains modelled. For NMR structures only the  well-defined (core) residues from ensemble analysis will be considered. The percentage of residues with rotamer outliers."),
+        ('percent_rotamer_outliers_full_length', None, False, 'Only given for structures determined by NMR. The MolProbity sidechain outlier score for all atoms in the structure rather than just the well-defined (core) residues.'),
+    )),
+    'PdbxVrptSummaryNmr': ('', (
+        ('chemical_shift_completeness', None, False, 'Overall completeness of the chemical shift assignments for the well-defined  regions of the structure.'),
+        ('chemical_shift_completeness_full_length', None, False, 'Overall completeness of the chemical shift assignments for the full  macromolecule or complex as suggested by the molecular description of an entry (whether some portion of it is modelled or not).'),
+        ('cyrange_error', None, False, 'Diagnostic message from the wrapper of Cyrange software which identifies the  well-defined cores (domains) of NMR protein structures.'),
+        ('cyrange_number_of_domains', None, False, 'Total number of well-defined cores (domains) identified by Cyrange'),
+        ('exp_method', None, False, 'Experimental method for statistics'),
+        ('medoid_model', None, False, "For each Cyrange well-defined core ('cyrange_domain') the id of the PDB_model_num which is most  similar to other models as measured by pairwise RMSDs over the domain.  For the whole entry ('Entry'), the medoid PDB_model_num of the largest core is taken as an overall representative of the structure."),
+        ('nmr_models_consistency_flag', None, False, "A flag indicating if all models in the NMR ensemble contain the exact  same atoms ('True') or if the models differ in this respect ('False')."),
+        ('nmrclust_error', None, False, 'Diagnostic message from the wrapper of NMRClust software which clusters NMR models.'),
+        ('nmrclust_number_of_clusters', None, False, 'Total number of clusters in the NMR ensemble identified by NMRClust.'),
+        ('nmrclust_number_of_models', None, False, 'Number of models analysed by NMRClust - should in almost all cases be the same as the number of models in the NMR ensemble.'),
+        ('nmrclust_number_of_outliers', None, False, 'Number of models that do not belong to any cluster as deemed by NMRClust.'),
+        ('nmrclust_representative_model', None, False, 'Overall representative PDB_model_num of the NMR ensemble as identified by NMRClust.'),
+    )),
+    'Query': ('Query root', (
+        ('polymer_entity_instance', 'CorePolymerEntityInstance', True, "Get a polymer entity instance (chain), given the ENTRY ID and ENTITY INSTANCE ID. Here ENTITY INSTANCE ID identifies structural element in the asymmetric unit, e.g. 'A', 'B', etc."),
+        ('chem_comps', 'CoreChemComp', True, "Get a list of chemical components given the list of CHEMICAL COMPONENT ID, e.g. 'CFF', 'HEM', 'FE'.For nucleic acid polymer entities, use the one-letter code for the base."),
+        ('nonpolymer_entity_groups', 'GroupNonPolymerEntity', True, 'Given a list of group IDs get a list of group objects formed by aggregating non-polymer entities that share a degree of similarity'),
+        ('polymer_entity_groups', 'GroupPolymerEntity', True, 'Given a list of group IDs get a list of group objects formed by aggregating polymer entities that share a degree of similarity'),
+        ('interface', 'CoreInterface', True, 'Get a pairwise polymeric interface given the ENTRY ID, ASSEMBLY ID and INTERFACE ID.'),
+        ('nonpolymer_entities', 'CoreNonpolymerEntity', True, "Get a list of non-polymer entities given a list of ENTITY IDs. Here ENTITY ID is a compound identifier that includes entry_id and entity_id separated by '_', e.g. 1XXX_1. Note that the ENTRY ID part must be upper case."),
+        ('polymer_entities', 'CorePolymerEntity', True, "Get a list of polymer entities given a list of ENTITY IDs. Here ENTITY ID is a compound identifier that includes entry_id and entity_id separated by '_', e.g. 1XXX_1. Note that the ENTRY ID part must be upper case."),
+        ('polymer_entity', 'CorePolymerEntity', True, "Get a polymer entity, given the ENTRY ID and ENTITY ID. Here ENTITY ID is a '1', '2', '3', etc."),
+        ('entry_group', 'GroupEntry', True, 'Given a group ID get a group object formed by aggregating individual structures that share a degree of similarity'),
+        ('pubmed', 'CorePubmed', True, 'Get literature information from PubMed database given the PubMed identifier.'),
+        ('assembly', 'CoreAssembly', True, "Get an assembly given the ENTRY ID and ASSEMBLY ID. Here ASSEMBLY ID is '1', '2', '3', etc. or 'deposited' for deposited coordinates."),
+        ('branched_entity_instances', 'CoreBranchedEntityInstance', True, "Get a list of branched entity instances (chains), given the list of ENTITY INSTANCE IDs. Here ENTITY INSTANCE ID identifies structural element in the asymmetric unit, e.g. 'A', 'B', etc."),
+        ('group_provenance', 'GroupProvenance', True, 'Given a group provenance ID get an object that describes aggregation method used to create groups'),
+        ('polymer_entity_instances', 'CorePolymerEntityInstance', True, "Get a list of polymer entity instances (chains), given the list of ENTITY INSTANCE IDs. Here ENTITY INSTANCE ID identifies structural element in the asymmetric unit, e.g. 'A', 'B', etc."),
+        ('interfaces', 'CoreInterface', True, 'Get a list of pairwise polymeric interfaces given a list of INTERFACE IDs. Here INTERFACE ID is a compound identifier that includes entry_id, assembly_id and interface_id e.g. 1XXX-1.1. Note that the ENTRY ID part must be upper case.'),
+        ('nonpolymer_entity_group', 'GroupNonPolymerEntity', True, 'Given a group ID get a group object formed by aggregating non-polymer entities that share a degree of similarity'),
+        ('assemblies', 'CoreAssembly', True, "Get a list of assemblies given the list of ASSEMBLY IDs. Here an ASSEMBLY ID is a compound identifier that includes entry_id and assembly_id separated by '-', e.g. 1XXX-1."),
+        ('branched_entity', 'CoreBranchedEntity', True, "Get a branched entity, given the ENTRY ID and ENTITY ID. Here ENTITY ID is a '1', '2', '3', etc."),
+        ('polymer_entity_group', 'GroupPolymerEntity', True, 'Given a group ID get a group object formed by aggregating polymer entities that share a degree of similarity'),
+        ('branched_entity_instance', 'CoreBranchedEntityInstance', True, "Get a branched entity instance (chain), given the ENTRY ID and ENTITY INSTANCE ID. Here ENTITY INSTANCE ID identifies structural element in the asymmetric unit, e.g. 'A', 'B', etc."),
+        ('nonpolymer_entity_instance', 'CoreNonpolymerEntityInstance', True, "Get a non-polymer entity instance (chain), given the ENTRY ID and ENTITY INSTANCE ID. Here ENTITY INSTANCE ID identifies structural element in the asymmetric unit, e.g. 'A', 'B', etc."),
+        ('chem_comp', 'CoreChemComp', True, "Get a chemical component given the CHEMICAL COMPONENT ID, e.g. 'CFF', 'HEM', 'FE'.For nucleic acid polymer entities, use the one-letter code for the base."),
+        ('entry', 'CoreEntry', True, 'Get entry given the id.'),
+        ('entries', 'CoreEntry', True, 'Get a list of entries given a list of IDs.'),
+        ('entry_groups', 'GroupEntry', True, 'Given a list of group IDs get a list of group objects formed by aggregating structures that share a degree of similarity'),
+        ('branched_entities', 'CoreBranchedEntity', True, "Get a list of branched entities given a list of ENTITY IDs. Here ENTITY ID is a compound identifier that includes entry_id and entity_id separated by '_', e.g. 1XXX_1. Note that the ENTRY ID part must be upper case."),
+        ('uniprot', 'CoreUniprot', True, 'Get UniProt KB entry given the UniProt primary accession.'),
+        ('nonpolymer_entity_instances', 'CoreNonpolymerEntityInstance', True, "Get a list of non-polymer entity instances (chains), given the list of ENTITY INSTANCE IDs. Here ENTITY INSTANCE ID identifies structural element in the asymmetric unit, e.g. 'A', 'B', etc."),
+        ('nonpolymer_entity', 'CoreNonpolymerEntity', True, "Get a non-polymer entity, given the ENTRY ID and ENTITY ID. Here ENTITY ID is a '1', '2', '3', etc."),
+    )),
+    'RcsbAccessionInfo': ('', (
+        ('deposit_date', None, False, 'The entry deposition date.  Examples: 2020-07-11, 2013-10-01 '),
+        ('has_released_experimental_data', None, False, 'A code indicating the current availibility of experimental data in the repository.  Allowable values: N, Y '),
+        ('initial_release_date', None, False, 'The entry initial release date.  Examples: 2020-01-10, 2018-01-23 '),
+        ('major_revision', None, False, 'The latest entry major revision number.'),
+        ('minor_revision', None, False, 'The latest entry minor revision number.'),
+        ('revision_date', None, False, 'The latest entry revision date.  Examples: 2020-02-11, 2018-10-23 '),
+        ('status_code', None, False, 'The release status for the entry.  Allowable values: AUCO, AUTH, HOLD, HPUB, POLC, PROC, REFI, REL, REPL, WAIT, WDRN '),
+    )),
+    'RcsbAssemblyAnnotation': ('', (
+        ('additional_properties', 'RcsbAssemblyAnnotationAdditionalProperties', False, ''),
+        ('annotation_id', None, False, 'An identifier for the annotation.'),
+        ('assignment_version', None, False, 'Identifies the version of the annotation assignment.'),
+        ('description', None, False, 'A description for the annotation.'),
+        ('name', None, False, 'A name for the annotation.'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that assigned the annotation.  Examples: MCSA '),
+        ('type', None, False, 'A type or category of the annotation.  Allowable values: MCSA '),
+    )),
+    'RcsbAssemblyAnnotationAdditionalProperties': ('', (
+        ('name', None, False, 'The additional property name.  Allowable values: MCSA_MOTIF_COMPATIBILITY '),
+        ('values', None, False, 'The value(s) of the additional property.'),
+    )),
+    'RcsbAssemblyContainerIdentifiers': ('', (
+        ('assembly_id', None, False, 'Assembly identifier for the container.  Examples: 1, 5 '),
+        ('entry_id', None, False, 'Entry identifier for the container.'),
+        ('interface_ids', None, False, 'List of binary interface Ids within the assembly (it points to interface id collection).'),
+        ('rcsb_id', None, False, 'A unique identifier for each object in this assembly container formed by  a dash separated concatenation of entry and assembly identifiers.  Examples: 1KIP-1 '),
+    )),
+    'RcsbAssemblyFeature': ('', (
+        ('additional_properties', 'RcsbAssemblyFeatureAdditionalProperties', False, ''),
+        ('assignment_version', None, False, 'Identifies the version of the feature assignment.'),
+        ('description', None, False, 'A description for the feature.'),
+        ('feature_id', None, False, 'An identifier for the feature.'),
+        ('feature_positions', 'RcsbAssemblyFeatureFeaturePositions', False, ''),
+        ('name', None, False, 'A name for the feature.'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that assigned the feature.  Examples: MCSA '),
+        ('type', None, False, 'A type or category of the feature.  Allowable values: MCSA '),
+    )),
+    'RcsbAssemblyFeatureAdditionalProperties': ('', (
+        ('name', None, False, 'The additional property name.  Allowable values: MCSA_MOTIF_COMPATIBILITY '),
+        ('values', None, False, 'The value(s) of the additional property.'),
+    )),
+    'RcsbAssemblyFeatureFeaturePositions': ('', (
+        ('asym_id', None, False, 'An identifier of polymer chain (label_asym_id) corresponding to the feature assignment.  Examples: A, B '),
+        ('beg_seq_id', None, False, 'An identifier for the monomer at which this segment of the feature begins.'),
+        ('end_seq_id', None, False, 'An identifier for the monomer at which this segment of the feature ends.'),
+        ('struct_oper_list', None, False, 'Identifies the list of operations from the category pdbx_struct_oper_list. One item in array per operator applied. The order follows how operators are applied.'),
+        ('values', None, False, 'The value(s) of the feature over the monomer segment.'),
+    )),
+    'RcsbAssemblyInfo': ('', (
+        ('assembly_id', None, False, 'Entity identifier for the container.'),
+        ('atom_count', None, False, 'The assembly non-hydrogen atomic coordinate count.'),
+        ('branched_atom_count', None, False, 'The assembly non-hydrogen branched entity atomic coordinate count.'),
+        ('branched_entity_count', None, False, 'The number of distinct branched entities in the generated assembly.'),
+        ('branched_entity_instance_count', None, False, 'The number of branched instances in the generated assembly data set.  This is the total count of branched entity instances generated in the assembly coordinate data.'),
+        ('deuterated_water_count', None, False, 'The assembly deuterated water molecule count.'),
+        ('entry_id', None, False, 'The PDB entry accession code.  Examples: 1KIP '),
+        ('hydrogen_atom_count', None, False, 'The assembly hydrogen atomic coordinate count.'),
+        ('modeled_polymer_monomer_count', None, False, 'The number of modeled polymer monomers in the assembly coordinate data.  This is the total count of monomers with reported coordinate data for all polymer  entity instances in the generated assembly coordinate data.'),
+        ('na_polymer_entity_types', None, False, 'Nucleic acid polymer entity type categories describing the generated assembly.  Allowable values: DNA (only), DNA/RNA (only), NA-hybrid (only), Other, RNA (only) '),
+        ('nonpolymer_atom_count', None, False, 'The assembly non-hydrogen non-polymer entity atomic coordinate count.'),
+        ('nonpolymer_entity_count', None, False, 'The number of distinct non-polymer entities in the generated assembly exclusive of solvent.'),
+        ('nonpolymer_entity_instance_count', None, False, 'The number of non-polymer instances in the generated assembly data set exclusive of solvent.  This is the total count of non-polymer entity instances generated in the assembly coordinate data.'),
+        ('num_heterologous_interface_entities', None, False, 'Number of heterologous (both binding sites are different) interface entities'),
+        ('num_heteromeric_interface_entities', None, False, 'Number of heteromeric (both partners are different polymeric entities) interface entities'),
+        ('num_homomeric_interface_entities', None, False, 'Number of homomeric (both partners are the same polymeric entity) interface entities'),
+        ('num_interface_entities', None, False, 'Number of polymer-polymer interface entities, grouping equivalent interfaces at the entity level (i.e. same entity_ids on either side, with similar but not identical binding sites)'),
+        ('num_interfaces', None, False, 'Number of geometrically equivalent (i.e. same asym_ids on either side) polymer-polymer interfaces in the assembly'),
+        ('num_isologous_interface_entities', None, False, 'Number of isologous (both binding sites are same, i.e. interface is symmetric) interface entities'),
+        ('num_na_interface_entities', None, False, 'Number of nucleic acid-nucleic acid interface entities'),
+        ('num_prot_na_interface_entities', None, False, 'Number of protein-nucleic acid interface entities'),
+        ('num_protein_interface_entities', None, False, 'Number of protein-protein interface entities'),
+        ('polymer_atom_count', None, False, 'The assembly non-hydrogen polymer entity atomic coordinate count.'),
+        ('polymer_composition', None, False, 'Categories describing the polymer entity composition for the generated assembly.  Allowable values: DNA, DNA/RNA, NA-hybrid, NA/oligosaccharide, RNA, heteromeric protein, homomeric protein, oligosaccharide, other, other type composition, other type pair, protein/NA, protein/NA/oligosaccharide, protein/oligosaccharide '),
+        ('polymer_entity_count', None, False, 'The number of distinct polymer entities in the generated assembly.'),
+        ('polymer_entity_count_DNA', None, False, 'The number of distinct DNA polymer entities in the generated assembly.'),
+        ('polymer_entity_count_RNA', None, False, 'The number of distinct RNA polymer entities in the generated assembly.'),
+        ('polymer_entity_count_nucleic_acid', None, False, 'The number of distinct nucleic acid polymer entities (DNA or RNA) in the generated assembly.'),
+        ('polymer_entity_count_nucleic_acid_hybrid', None, False, 'The number of distinct hybrid nucleic acid polymer entities in the generated assembly.'),
+        ('polymer_entity_count_protein', None, False, 'The number of distinct protein polymer entities in the generated assembly.'),
+        ('polymer_entity_instance_count', None, False, 'The number of polymer instances in the generated assembly data set.  This is the total count of polymer entity instances generated in the assembly coordinate data.'),
+        ('polymer_entity_instance_count_DNA', None, False, 'The number of DNA polymer instances in the generated assembly data set.  This is the total count of DNA polymer entity instances generated in the assembly coordinate data.'),
+        ('polymer_entity_instance_count_RNA', None, False, 'The number of RNA polymer instances in the generated assembly data set.  This is the total count of RNA polymer entity instances generated in the assembly coordinate data.'),
+        ('polymer_entity_instance_count_nucleic_acid', None, False, 'The number of nucleic acid polymer instances in the generated assembly data set.  This is the total count of nucleic acid polymer entity instances generated in the assembly coordinate data.'),
+        ('polymer_entity_instance_count_nucleic_acid_hybrid', None, False, 'The number of hybrid nucleic acide polymer instances in the generated assembly data set.  This is the total count of hybrid nucleic acid polymer entity instances generated in the assembly coordinate data.'),
+        ('polymer_entity_instance_count_protein', None, False, 'The number of protein polymer instances in the generated assembly data set.  This is the total count of protein polymer entity instances generated in the assembly coordinate data.'),
+        ('polymer_monomer_count', None, False, 'The number of polymer monomers in sample entity instances comprising the assembly data set.  This is the total count of monomers for all polymer entity instances  in the generated assembly coordinate data.'),
+        ('selected_polymer_entity_types', None, False, 'Selected polymer entity type categories describing the generated assembly.  Allowable values: Nucleic acid (only), Other, Protein (only), Protein/NA '),
+        ('solvent_atom_count', None, False, 'The assembly non-hydrogen solvent atomic coordinate count.'),
+        ('solvent_entity_count', None, False, 'The number of distinct solvent entities in the generated assembly.'),
+        ('solvent_entity_instance_count', None, False, 'The number of solvent instances in the generated assembly data set.  This is the total count of solvent entity instances generated in the assembly coordinate data.'),
+        ('total_assembly_buried_surface_area', None, False, 'Total buried surface area calculated as the sum of buried surface areas over all interfaces'),
+        ('total_number_interface_residues', None, False, 'Total number of interfacing residues in the assembly, calculated as the sum of interfacing residues over all interfaces'),
+        ('unmodeled_polymer_monomer_count', None, False, 'The number of unmodeled polymer monomers in the assembly coordinate data. This is  the total count of monomers with unreported coordinate data for all polymer  entity instances in the generated assembly coordinate data.'),
+    )),
+    'RcsbBindingAffinity': ('', (
+        ('comp_id', None, False, 'Ligand identifier.  Examples: 0WE, SPE, CL '),
+        ('link', None, False, 'Link to external resource referencing the data.'),
+        ('provenance_code', None, False, 'The resource name for the related binding affinity reference.  Allowable values: Binding MOAD, BindingDB, PDBBind '),
+        ('reference_sequence_identity', None, False, 'Data point provided by BindingDB. Percent identity between PDB sequence and reference sequence.'),
+        ('symbol', None, False, 'Binding affinity symbol indicating approximate or precise strength of the binding.  Examples: ~, =, >, <, >=, <= '),
+        ('type', None, False, 'Binding affinity measurement given in one of the following types:  The concentration constants: IC50: the concentration of ligand that reduces enzyme activity by 50%;  EC50: the concentration of compound that generates a half-maximal response;  The binding constant:  Kd: dissociation constant;  Ka: association constant;  Ki: enzyme inhibition constant;  The thermodynamic parameters:  delta G: Gibbs free energy of binding (for association reaction);  delta H: change in enthalpy associated with a chemical reaction;  delta S: change in entropy associated with a chemical reaction.  Allowable values: &Delta;G, &Delta;H, -T&Delta;S, EC50, IC50, Ka, Kd, Ki '),
+        ('unit', None, False, 'Binding affinity unit.  Dissociation constant Kd is normally in molar units (or millimolar , micromolar, nanomolar, etc).  Association constant Ka is normally expressed in inverse molar units (e.g. M-1).  Examples: nM, kJ/mol '),
+        ('value', None, False, 'Binding affinity value between a ligand and its target molecule.'),
+    )),
+    'RcsbBirdCitation': ('', (
+        ('id', None, False, 'The value of _rcsb_bird_citation.id must uniquely identify a record in the  rcsb_bird_citation list.  Examples: 1, 2 '),
+        ('journal_abbrev', None, False, 'Abbreviated name of the cited journal as given in the  Chemical Abstracts Service Source Index.  Examples: J.Mol.Biol., J. Mol. Biol. '),
+        ('journal_volume', None, False, 'Volume number of the journal cited; relevant for journal  articles.  Examples: 174 '),
+        ('page_first', None, False, 'The first page of the rcsb_bird_citation; relevant for journal  articles, books and book chapters.'),
+        ('page_last', None, False, 'The last page of the rcsb_bird_citation; relevant for journal  articles, books and book chapters.'),
+        ('pdbx_database_id_DOI', None, False, 'Document Object Identifier used by doi.org to uniquely  specify bibliographic entry.  Examples: 10.2345/S1384107697000225 '),
+        ('pdbx_database_id_PubMed', None, False, 'Ascession number used by PubMed to categorize a specific  bibliographic entry.'),
+        ('rcsb_authors', None, False, 'Names of the authors of the citation; relevant for journal  articles, books and book chapters.  Names are separated by vertical bars.   The family name(s), followed by a comma and including any  dynastic components, precedes the first name(s) or initial(s).'),
+        ('title', None, False, 'The title of the rcsb_bird_citation; relevant for journal articles, books  and book chapters.  Examples: Structure of diferric duck ovotransferrin                                   at 2.35 Angstroms resolution. '),
+        ('year', None, False, 'The year of the rcsb_bird_citation; relevant for journal articles, books  and book chapters.'),
+    )),
+    'RcsbBranchedEntity': ('', (
+        ('details', None, False, 'A description of special aspects of the branched entity.'),
+        ('formula_weight', None, False, 'Formula mass (KDa) of the branched entity.  Examples: null, null '),
+        ('pdbx_description', None, False, 'A description of the branched entity.  Examples: alpha-D-glucopyranose-(1-6)-beta-D-glucopyranose, beta-D-xylopyranose-(1-4)-beta-D-xylopyranose '),
+        ('pdbx_number_of_molecules', None, False, 'The number of molecules of the branched entity in the entry.'),
+    )),
+    'RcsbBranchedEntityAnnotation': ('', (
+        ('annotation_id', None, False, 'An identifier for the annotation.'),
+        ('annotation_lineage', 'RcsbBranchedEntityAnnotationAnnotationLineage', False, ''),
+        ('assignment_version', None, False, 'Identifies the version of the annotation assignment.  Examples: V4_0_2 '),
+        ('description', None, False, 'A description for the annotation.'),
+        ('name', None, False, 'A name for the annotation.'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that  assigned the annotation.  Examples: PDB '),
+        ('type', None, False, 'A type or category of the annotation.'),
+    )),
+    'RcsbBranchedEntityAnnotationAnnotationLineage': ('', (
+        ('depth', None, False, 'Members of the annotation lineage as parent lineage depth (1-N)'),
+        ('id', None, False, 'Members of the annotation lineage as parent class identifiers.'),
+        ('name', None, False, 'Members of the annotation lineage as parent class names.'),
+    )),
+    'RcsbBranchedEntityContainerIdentifiers': ('', (
+        ('asym_ids', None, False, 'Instance identifiers corresponding to copies of the entity in this container.'),
+        ('auth_asym_ids', None, False, 'Author instance identifiers corresponding to copies of the entity in this container.'),
+        ('chem_comp_monomers', None, False, 'Unique list of monomer chemical component identifiers in the entity in this container.'),
+        ('chem_ref_def_id', None, False, 'The chemical reference definition identifier for the entity in this container.  Examples: PRD_000010 '),
+        ('entity_id', None, False, 'Entity identifier for the container.  Examples: 1, 2 '),
+        ('entry_id', None, False, 'Entry identifier for the container.  Examples: 1B5F, 2HYV '),
+        ('prd_id', None, False, 'The BIRD identifier for the entity in this container.  Examples: PRD_000010 '),
+        ('rcsb_id', None, False, 'A unique identifier for each object in this entity container formed by  an underscore separated concatenation of entry and entity identifiers.  Examples: 2HYV_2 '),
+        ('reference_identifiers', 'RcsbBranchedEntityContainerIdentifiersReferenceIdentifiers', False, ''),
+    )),
+    'RcsbBranchedEntityContainerIdentifiersReferenceIdentifiers': ('', (
+        ('provenance_source', None, False, 'Source of the reference resource assignment  Allowable values: PDB, RCSB '),
+        ('resource_accession', None, False, 'Reference resource accession code  Examples: G07411ON, G42666HT '),
+        ('resource_name', None, False, 'Reference resource name  Allowable values: GlyCosmos, GlyGen, GlyTouCan '),
+    )),
+    'RcsbBranchedEntityFeature': ('', (
+        ('additional_properties', 'RcsbBranchedEntityFeatureAdditionalProperties', False, ''),
+        ('assignment_version', None, False, 'Identifies the version of the feature assignment.  Examples: V4_0_2 '),
+        ('description', None, False, 'A description for the feature.'),
+        ('feature_id', None, False, 'An identifier for the feature.'),
+        ('feature_positions', 'RcsbBranchedEntityFeatureFeaturePositions', False, ''),
+        ('name', None, False, 'A name for the feature.'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that  assigned the feature.  Examples: PDB '),
+        ('reference_scheme', None, False, 'Code residue coordinate system for the assigned feature.  Allowable values: PDB entity '),
+        ('type', None, False, 'A type or category of the feature.  Allowable values: mutation '),
+    )),
+    'RcsbBranchedEntityFeatureAdditionalProperties': ('', (
+        ('name', None, False, 'The additional property name.'),
+        ('values', None, False, 'The value(s) of the additional property.'),
+    )),
+    'RcsbBranchedEntityFeatureFeaturePositions': ('', (
+        ('beg_comp_id', None, False, 'An identifier for the leading monomer corresponding to the feature assignment.  Examples: NAG, MAN '),
+        ('beg_seq_id', None, False, 'An identifier for the leading monomer position of the feature.'),
+        ('end_seq_id', None, False, 'An identifier for the leading monomer position of the feature.'),
+        ('value', None, False, 'The value for the feature at this monomer.  Examples: null, null '),
+    )),
+    'RcsbBranchedEntityFeatureSummary': ('', (
+        ('count', None, False, 'The feature count.'),
+        ('coverage', None, False, 'The fractional feature coverage relative to the full branched entity.  Examples: null, null '),
+        ('maximum_length', None, False, 'The maximum feature length.'),
+        ('maximum_value', None, False, 'The maximum feature value.  Examples: null, null '),
+        ('minimum_length', None, False, 'The minimum feature length.'),
+        ('minimum_value', None, False, 'The minimum feature value.  Examples: null, null '),
+        ('type', None, False, 'Type or category of the feature.  Allowable values: mutation '),
+    )),
+    'RcsbBranchedEntityInstanceContainerIdentifiers': ('', (
+        ('asym_id', None, False, 'Instance identifier for this container.'),
+        ('auth_asym_id', None, False, 'Author instance identifier for this container.'),
+        ('entity_id', None, False, 'Entity identifier for the container.'),
+        ('entry_id', None, False, 'Entry identifier for the container.'),
+        ('rcsb_id', None, False, "A unique identifier for each object in this entity instance container formed by  an 'dot' (.) separated concatenation of entry and entity instance identifiers.  Examples: 1KIP.A "),
+    )),
+    'RcsbBranchedEntityKeywords': ('', (
+        ('text', None, False, 'Keywords describing this branched entity.'),
+    )),
+    'RcsbBranchedEntityNameCom': ('', (
+        ('name', None, False, 'A common name for the branched entity.  Examples: HIV protease monomer, hemoglobin alpha chain '),
+    )),
+    'RcsbBranchedEntityNameSys': ('', (
+        ('name', None, False, 'The systematic name for the branched entity.'),
+        ('system', None, False, 'The system used to generate the systematic name of the branched entity.'),
+    )),
+    'RcsbBranchedInstanceAnnotation': ('', (
+        ('annotation_id', None, False, 'An identifier for the annotation.'),
+        ('annotation_lineage', 'RcsbBranchedInstanceAnnotationAnnotationLineage', False, ''),
+        ('assignment_version', None, False, 'Identifies the version of the annotation assignment.  Examples: V4_0_2 '),
+        ('comp_id', None, False, 'Chemical component identifier.  Examples: ATP '),
+        ('description', None, False, 'A description for the annotation.'),
+        ('name', None, False, 'A name for the annotation.'),
+        ('ordinal', None, False, 'Ordinal identifier for this category'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that  assigned the annotation.  Examples: PDB '),
+        ('type', None, False, 'A type or category of the annotation.  Allowable values: CATH, SCOP '),
+    )),
+    'RcsbBranchedInstanceAnnotationAnnotationLineage': ('', (
+        ('depth', None, False, 'Members of the annotation lineage as parent lineage depth (1-N)'),
+        ('id', None, False, 'Members of the annotation lineage as parent class identifiers.'),
+        ('name', None, False, 'Members of the annotation lineage as parent class names.'),
+    )),
+    'RcsbBranchedInstanceFeature': ('', (
+        ('additional_properties', 'RcsbBranchedInstanceFeatureAdditionalProperties', False, ''),
+        ('assignment_version', None, False, 'Identifies the version of the feature assignment.  Examples: V4_0_2 '),
+        ('description', None, False, 'A description for the feature.'),
+        ('feature_id', None, False, 'An identifier for the feature.'),
+        ('feature_positions', 'RcsbBranchedInstanceFeatureFeaturePositions', False, ''),
+        ('feature_value', 'RcsbBranchedInstanceFeatureFeatureValue', False, ''),
+        ('name', None, False, 'A name for the feature.'),
+        ('ordinal', None, False, 'Ordinal identifier for this category'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that  assigned the feature.  Examples: PDB '),
+        ('reference_scheme', None, False, 'Code residue coordinate system for the assigned feature.  Allowable values: PDB entity, PDB entry '),
+        ('type', None, False, 'A type or category of the feature.  Allowable values: BINDING_SITE, CATH, ECOD, MOGUL_ANGLE_OUTLIER, MOGUL_BOND_OUTLIER, RSCC_OUTLIER, RSRZ_OUTLIER, SCOP, STEREO_OUTLIER, UNOBSERVED_ATOM_XYZ, UNOBSERVED_RESIDUE_XYZ, ZERO_OCCUPANCY_ATOM_XYZ, ZERO_OCCUPANCY_RESIDUE_XYZ '),
+    )),
+    'RcsbBranchedInstanceFeatureAdditionalProperties': ('', (
+        ('name', None, False, 'The additional property name.  Examples: bond_distance, bond_angle '),
+        ('values', None, False, 'The value(s) of the additional property.'),
+    )),
+    'RcsbBranchedInstanceFeatureFeaturePositions': ('', (
+        ('beg_comp_id', None, False, 'An identifier for the monomer(s) corresponding to the feature assignment.  Examples: NAG, MAN '),
+        ('beg_seq_id', None, False, 'An identifier for the leading monomer feature position.'),
+        ('end_seq_id', None, False, 'An identifier for the terminal monomer feature position.'),
+        ('value', None, False, 'The value of the feature at the monomer position.  Examples: null, null '),
+        ('values', None, False, 'The value(s) of the feature at the monomer position.'),
+    )),
+    'RcsbBranchedInstanceFeatureFeatureValue': ('', (
+        ('comp_id', None, False, 'The chemical component identifier for the instance of the feature value.  Examples: ATP,, STN '),
+        ('details', None, False, 'Specific details about the feature.  Examples: C1,C2, C1,C2,C3 '),
+        ('reference', None, False, 'The reference value of the feature.  Examples: null, null '),
+        ('reported', None, False, 'The reported value of the feature.  Examples: null, null '),
+        ('uncertainty_estimate', None, False, 'The estimated uncertainty of the reported feature value.  Examples: null, null '),
+        ('uncertainty_estimate_type', None, False, 'The type of estimated uncertainty for the reported feature value.  Allowable values: Z-Score '),
+    )),
+    'RcsbBranchedInstanceFeatureSummary': ('', (
+        ('count', None, False, 'The feature count.'),
+        ('coverage', None, False, 'The fractional feature coverage relative to the full branched entity.  Examples: null, null '),
+        ('maximum_length', None, False, 'The maximum feature length.'),
+        ('maximum_value', None, False, 'The maximum feature value.  Examples: null, null '),
+        ('minimum_length', None, False, 'The minimum feature length.'),
+        ('minimum_value', None, False, 'The minimum feature value.  Examples: null, null '),
+        ('type', None, False, 'Type or category of the feature.  Allowable values: BINDING_SITE, CATH, MOGUL_ANGLE_OUTLIER, MOGUL_BOND_OUTLIER, RSCC_OUTLIER, RSRZ_OUTLIER, SCOP, STEREO_OUTLIER, UNOBSERVED_ATOM_XYZ, UNOBSERVED_RESIDUE_XYZ, ZERO_OCCUPANCY_ATOM_XYZ, ZERO_OCCUPANCY_RESIDUE_XYZ '),
+    )),
+    'RcsbBranchedStructConn': ('', (
+        ('connect_partner', 'RcsbBranchedStructConnConnectPartner', False, ''),
+        ('connect_target', 'RcsbBranchedStructConnConnectTarget', False, ''),
+        ('connect_type', None, False, 'The connection type.  Allowable values: covalent bond, hydrogen bond, ionic interaction, metal coordination, mismatched base pairs '),
+        ('description', None, False, 'A description of special details of the connection.  Examples: Watson-Crick base pair '),
+        ('dist_value', None, False, 'Distance value for this contact.'),
+        ('id', None, False, 'The value of _rcsb_branched_struct_conn.id is an identifier for connection.'),
+        ('ordinal_id', None, False, 'The value of _rcsb_branched_struct_conn.id must uniquely identify a record in  the rcsb_branched_struct_conn list.'),
+        ('role', None, False, 'The chemical or structural role of the interaction  Allowable values: C-Mannosylation, N-Glycosylation, O-Glycosylation '),
+        ('value_order', None, False, 'The chemical bond order associated with the specified atoms in  this contact.  Allowable values: doub, quad, sing, trip '),
+    )),
+    'RcsbBranchedStructConnConnectPartner': ('', (
+        ('label_alt_id', None, False, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category.'),
+        ('label_asym_id', None, False, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category.'),
+        ('label_atom_id', None, False, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _chem_comp_atom.atom_id in the  CHEM_COMP_ATOM category.'),
+        ('label_comp_id', None, False, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category.'),
+        ('label_seq_id', None, False, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_seq_id in the  ATOM_SITE category.'),
+        ('symmetry', None, False, 'Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_branched_struct_conn.connect_partner_label* to generate the  partner in the structure connection.  Examples: 1_555, 7_645 '),
+    )),
+    'RcsbBranchedStructConnConnectTarget': ('', (
+        ('auth_asym_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_asym_id in the  ATOM_SITE category.'),
+        ('auth_seq_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_seq_id in the  ATOM_SITE category.'),
+        ('label_alt_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category.'),
+        ('label_asym_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category.'),
+        ('label_atom_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_atom_id in the  ATOM_SITE category.'),
+        ('label_comp_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category.'),
+        ('label_seq_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.connect_target_label_seq_id in the  ATOM_SITE category.'),
+        ('symmetry', None, False, 'Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_branched_struct_conn.label* to generate the  target of the structure connection.  Examples: 1_555, 7_645 '),
+    )),
+    'RcsbChemCompAnnotation': ('', (
+        ('annotation_id', None, False, 'An identifier for the annotation.'),
+        ('annotation_lineage', 'RcsbChemCompAnnotationAnnotationLineage', False, ''),
+        ('assignment_version', None, False, 'Identifies the version of the annotation assignment.  Examples: V4_0_2 '),
+        ('description', None, False, 'A description for the annotation.'),
+        ('name', None, False, 'A name for the annotation.'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that  assigned the annotation.  Examples: RESID, UniProt, PDB '),
+        ('type', None, False, 'A type or category of the annotation.  Allowable values: ATC, Carbohydrate Anomer, Carbohydrate Isomer, Carbohydrate Primary Carbonyl Group, Carbohydrate Ring, Generating Enzyme, Modification Type, PSI-MOD '),
+    )),
+    'RcsbChemCompAnnotationAnnotationLineage': ('', (
+        ('depth', None, False, 'Members of the annotation lineage as parent lineage depth (1-N)'),
+        ('id', None, False, 'Members of the annotation lineage as parent class identifiers.'),
+        ('name', None, False, 'Members of the annotation lineage as parent class names.'),
+    )),
+    'RcsbChemCompContainerIdentifiers': ('', (
+        ('atc_codes', None, False, 'The Anatomical Therapeutic Chemical (ATC) Classification System identifiers corresponding  to the chemical component.'),
+        ('comp_id', None, False, 'The chemical component identifier.  Examples: ATP, STI '),
+        ('drugbank_id', None, False, 'The DrugBank identifier corresponding to the chemical component.  Examples: DB00781, DB15263 '),
+        ('prd_id', None, False, 'The BIRD definition identifier.  Examples: PRD_000010 '),
+        ('rcsb_id', None, False, 'A unique identifier for the chemical definition in this container.  Examples: ATP, PRD_000010 '),
+        ('subcomponent_ids', None, False, 'The list of subcomponents contained in this component.'),
+    )),
+    'RcsbChemCompDescriptor': ('', (
+        ('InChI', None, False, 'Standard IUPAC International Chemical Identifier (InChI) descriptor for the chemical component.     InChI, the IUPAC International Chemical Identifier,    by Stephen R Heller, Alan McNaught, Igor Pletnev, Stephen Stein and Dmitrii Tchekhovskoi,    Journal of Cheminformatics, 2015, 7:23;  Examples: InChI=1S/C3H6FO6P/c4-1-2(3(5)6)10-11(7,8)9/h2H,1H2,(H,5,6)(H2,7,8,9)/t2-/m0/s1 '),
+        ('InChIKey', None, False, 'Standard IUPAC International Chemical Identifier (InChI) descriptor key  for the chemical component   InChI, the IUPAC International Chemical Identifier,  by Stephen R Heller, Alan McNaught, Igor Pletnev, Stephen Stein and Dmitrii Tchekhovskoi,  Journal of Cheminformatics, 2015, 7:23  Examples: BNOCDEBUFVJMQI-REOHCLBHSA-N '),
+        ('SMILES', None, False, "Simplified molecular-input line-entry system (SMILES) descriptor for the chemical component.     Weininger D (February 1988). 'SMILES, a chemical language and information system. 1.    Introduction to methodology and encoding rules'. Journal of Chemical Information and Modeling. 28 (1): 31-6.     Weininger D, Weininger A, Weininger JL (May 1989).    'SMILES. 2. Algorithm for generation of unique SMILES notation',    Journal of Chemical Information and Modeling. 29 (2): 97-101.  Examples: OC(=O)[CH](CF)O[P](O)(O)=O "),
+        ('SMILES_stereo', None, False, "Simplified molecular-input line-entry system (SMILES) descriptor for the chemical  component including stereochemical features.   Weininger D (February 1988). 'SMILES, a chemical language and information system. 1.  Introduction to methodology and encoding rules'.  Journal of Chemical Information and Modeling. 28 (1): 31-6.   Weininger D, Weininger A, Weininger JL (May 1989).  'SMILES. 2. Algorithm for generation of unique SMILES notation'.  Journal of Chemical Information and Modeling. 29 (2): 97-101.  Examples: OC(=O)[C@H](CF)O[P](O)(O)=O "),
+        ('comp_id', None, False, 'The chemical component identifier.'),
+    )),
+    'RcsbChemCompInfo': ('', (
+        ('atom_count', None, False, 'Chemical component total atom count'),
+        ('atom_count_chiral', None, False, 'Chemical component chiral atom count'),
+        ('atom_count_heavy', None, False, 'Chemical component heavy atom count'),
+        ('bond_count', None, False, 'Chemical component total bond count'),
+        ('bond_count_aromatic', None, False, 'Chemical component aromatic bond count'),
+        ('comp_id', None, False, 'The chemical component identifier.'),
+        ('initial_deposition_date', None, False, 'The date the chemical definition was first deposited in the PDB repository.  Examples: 2016-09-11 '),
+        ('initial_release_date', None, False, 'The initial date the chemical definition was released in the PDB repository.  Examples: 2016-09-11 '),
+        ('release_status', None, False, 'The release status of the chemical definition.  Allowable values: DEL, HOLD, HPUB, OBS, REF_ONLY, REL '),
+        ('revision_date', None, False, 'The date of last revision of the chemical definition.  Examples: 2016-10-12 '),
+    )),
+    'RcsbChemCompRelated': ('', (
+        ('comp_id', None, False, 'The value of _rcsb_chem_comp_related.comp_id is a reference to  a chemical component definition.'),
+        ('ordinal', None, False, 'The value of _rcsb_chem_comp_related.ordinal distinguishes  related examples for each chemical component.'),
+        ('related_mapping_method', None, False, 'The method used to establish the resource correspondence.  Allowable values: assigned by DrugBank resource, assigned by PDB, assigned by PubChem resource, matching ChEMBL ID in Pharos, matching InChIKey in DrugBank, matching InChIKey in PubChem, matching InChIKey-prefix in DrugBank, matching by RESID resource '),
+        ('resource_accession_code', None, False, 'The resource identifier code for the related chemical reference.  Examples: 124832 '),
+        ('resource_name', None, False, 'The resource name for the related chemical reference.  Allowable values: CAS, CCDC/CSD, COD, ChEBI, ChEMBL, DrugBank, Pharos, PubChem, RESID '),
+    )),
+    'RcsbChemCompSynonyms': ('', (
+        ('comp_id', None, False, 'The chemical component to which this synonym applies.'),
+        ('name', None, False, 'The synonym of this particular chemical component.  Examples: Ursonic acid, Talotrexin, 4-oxodecanedioic acid '),
+        ('ordinal', None, False, 'This data item is an ordinal index for the  RCSB_CHEM_COMP_SYNONYMS category.'),
+        ('provenance_source', None, False, 'The provenance of this synonym.  Allowable values: ACDLabs, Author, ChEBI, ChEMBL, DrugBank, GMML, Lexichem, OpenEye OEToolkits, OpenEye/Lexichem, PDB Reference Data, PDB Reference Data (Preferred), PDB-CARE, PubChem, RESID '),
+        ('type', None, False, 'This data item contains the synonym type.  Allowable values: Brand Name, Common Name, Condensed IUPAC Carbohydrate Symbol, IUPAC Carbohydrate Symbol, Preferred Common Name, Preferred Name, Preferred Synonym, SNFG Carbohydrate Symbol, Synonym, Systematic Name '),
+    )),
+    'RcsbChemCompTarget': ('', (
+        ('comp_id', None, False, 'The value of _rcsb_chem_comp_target.comp_id is a reference to  a chemical component definition.'),
+        ('interaction_type', None, False, 'The type of target interaction.'),
+        ('name', None, False, 'The chemical component target name.'),
+        ('ordinal', None, False, 'The value of _rcsb_chem_comp_target.ordinal distinguishes  related examples for each chemical component.'),
+        ('provenance_source', None, False, 'A code indicating the provenance of the target interaction assignment  Allowable values: DrugBank, PDB Primary Data '),
+        ('reference_database_accession_code', None, False, 'The reference identifier code for the target interaction reference.  Examples: Q9HD40 '),
+        ('reference_database_name', None, False, 'The reference database name for the target interaction.  Allowable values: UniProt '),
+        ('target_actions', None, False, 'The mechanism of action of the chemical component - target interaction.'),
+    )),
+    'RcsbClusterFlexibility': ('', (
+        ('avg_rmsd', None, False, 'Average RMSD refer to average pairwise RMSD (Root Mean Square Deviation of C-alpha atoms) between structures in the cluster (95% sequence identity) where a given entity belongs.'),
+        ('label', None, False, 'Structural flexibility in the cluster (95% sequence identity) where a given entity belongs.'),
+        ('link', None, False, 'Link to the associated PDBFlex database entry.'),
+        ('max_rmsd', None, False, 'Maximal RMSD refer to maximal pairwise RMSD (Root Mean Square Deviation of C-alpha atoms) between structures in the cluster (95% sequence identity) where a given entity belongs.'),
+        ('provenance_code', None, False, 'Provenance code indicating the origin of the flexibility data.  Allowable values: PDBFlex '),
+    )),
+    'RcsbClusterMembership': ('', (
+        ('cluster_id', None, False, 'Identifier for a cluster at the specified level of sequence identity within the cluster data set.'),
+        ('identity', None, False, 'Sequence identity expressed as an integer percent value.'),
+    )),
+    'RcsbCompModelProvenance': ('', (
+        ('entry_id', None, False, 'Entry identifier corresponding to the computed structure model.  Examples: AF-P60325-F1, ma-bak-cepc-0019 '),
+        ('source_db', None, False, 'Source database for the computed structure model.  Allowable values: AlphaFoldDB, ModelArchive '),
+        ('source_filename', None, False, 'Source filename for the computed structure model.'),
+        ('source_pae_url', None, False, 'Source URL for computed structure model predicted aligned error (PAE) json file.'),
+        ('source_url', None, False, 'Source URL for computed structure model file.'),
+    )),
+    'RcsbEntityHostOrganism': ('', (
+        ('beg_seq_num', None, False, 'The beginning polymer sequence position for the polymer section corresponding  to this host organism.   A reference to the sequence position in the entity_poly category.'),
+        ('common_name', None, False, 'The common name of the host organism'),
+        ('end_seq_num', None, False, 'The ending polymer sequence position for the polymer section corresponding  to this host organism.   A reference to the sequence position in the entity_poly category.'),
+        ('ncbi_common_names', None, False, 'Common names associated with this taxonomy code obtained from NCBI Taxonomy Database.    These names correspond to the taxonomy identifier assigned by the PDB depositor.  References:  Sayers EW, Barrett T, Benson DA, Bryant SH, Canese K, Chetvernin V, Church DM, DiCuccio M, Edgar R, Federhen S, Feolo M, Geer LY, Helmberg W, Kapustin Y, Landsman D, Lipman DJ, Madden TL, Maglott DR, Miller V, Mizrachi I, Ostell J, Pruitt KD, Schuler GD, Sequeira E, Sherry ST, Shumway M, Sirotkin K, Souvorov A, Starchenko G, Tatusova TA, Wagner L, Yaschenko E, Ye J (2009). Database resources of the National Center for Biotechnology Information. Nucleic Acids Res. 2009 Jan;37(Database issue):D5-15. Epub 2008 Oct 21.  Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Sayers EW (2009). GenBank. Nucleic Acids Res. 2009 Jan;37(Database issue):D26-31. Epub 2008 Oct 21.'),
+        ('ncbi_parent_scientific_name', None, False, 'The parent scientific name in the NCBI taxonomy hierarchy (depth=1) associated with this taxonomy code.  References:  Sayers EW, Barrett T, Benson DA, Bryant SH, Canese K, Chetvernin V, Church DM, DiCuccio M, Edgar R, Federhen S, Feolo M, Geer LY, Helmberg W, Kapustin Y, Landsman D, Lipman DJ, Madden TL, Maglott DR, Miller V, Mizrachi I, Ostell J, Pruitt KD, Schuler GD, Sequeira E, Sherry ST, Shumway M, Sirotkin K, Souvorov A, Starchenko G, Tatusova TA, Wagner L, Yaschenko E, Ye J (2009). Database resources of the National Center for Biotechnology Information. Nucleic Acids Res. 2009 Jan;37(Database issue):D5-15. Epub 2008 Oct 21.  Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Sayers EW (2009). GenBank. Nucleic Acids Res. 2009 Jan;37(Database issue):D26-31. Epub 2008 Oct 21.'),
+        ('ncbi_scientific_name', None, False, 'The scientific name associated with this taxonomy code aggregated by the NCBI Taxonomy Database.    This name corresponds to the taxonomy identifier assigned by the PDB depositor.   References:  Sayers EW, Barrett T, Benson DA, Bryant SH, Canese K, Chetvernin V, Church DM, DiCuccio M, Edgar R, Federhen S, Feolo M, Geer LY, Helmberg W, Kapustin Y, Landsman D, Lipman DJ, Madden TL, Maglott DR, Miller V, Mizrachi I, Ostell J, Pruitt KD, Schuler GD, Sequeira E, Sherry ST, Shumway M, Sirotkin K, Souvorov A, Starchenko G, Tatusova TA, Wagner L, Yaschenko E, Ye J (2009). Database resources of the National Center for Biotechnology Information. Nucleic Acids Res. 2009 Jan;37(Database issue):D5-15. Epub 2008 Oct 21.  Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Sayers EW (2009). GenBank. Nucleic Acids Res. 2009 Jan;37(Database issue):D26-31. Epub 2008 Oct 21.'),
+        ('ncbi_taxonomy_id', None, False, 'NCBI Taxonomy identifier for the host organism.    Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18.'),
+        ('pdbx_src_id', None, False, 'An identifier for an entity segment.'),
+        ('provenance_source', None, False, 'A code indicating the provenance of the host organism.  Allowable values: PDB Primary Data, Primary Data '),
+        ('scientific_name', None, False, 'The scientific name of the host organism'),
+        ('taxonomy_lineage', 'RcsbEntityHostOrganismTaxonomyLineage', False, ''),
+    )),
+    'RcsbEntityHostOrganismTaxonomyLineage': ('', (
+        ('depth', None, False, 'Members of the NCBI Taxonomy lineage as parent taxonomy lineage depth (1-N)'),
+        ('id', None, False, 'Members of the NCBI Taxonomy lineage as parent taxonomy idcodes.  Examples: 469008, 10469 '),
+        ('name', None, False, 'Members of the NCBI Taxonomy lineage as parent taxonomy names.  Examples: Escherichia coli BL21(DE3), Baculovirus '),
+    )),
+    'RcsbEntitySourceOrganism': ('', (
+        ('beg_seq_num', None, False, 'The beginning polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category.'),
+        ('common_name', None, False, 'The common name for the source organism assigned by the PDB depositor.'),
+        ('end_seq_num', None, False, 'The ending polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category.'),
+        ('ncbi_common_names', None, False, 'Common names associated with this taxonomy code aggregated by the NCBI Taxonomy Database.    These name correspond to the taxonomy identifier assigned by the PDB depositor.  References:  Sayers EW, Barrett T, Benson DA, Bryant SH, Canese K, Chetvernin V, Church DM, DiCuccio M, Edgar R, Federhen S, Feolo M, Geer LY, Helmberg W, Kapustin Y, Landsman D, Lipman DJ, Madden TL, Maglott DR, Miller V, Mizrachi I, Ostell J, Pruitt KD, Schuler GD, Sequeira E, Sherry ST, Shumway M, Sirotkin K, Souvorov A, Starchenko G, Tatusova TA, Wagner L, Yaschenko E, Ye J (2009). Database resources of the National Center for Biotechnology Information. Nucleic Acids Res. 2009 Jan;37(Database issue):D5-15. Epub 2008 Oct 21.  Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Sayers EW (2009). GenBank. Nucleic Acids Res. 2009 Jan;37(Database issue):D26-31. Epub 2008 Oct 21.'),
+        ('ncbi_parent_scientific_name', None, False, 'A parent scientific name in the NCBI taxonomy hierarchy of the source organism assigned by the PDB depositor.   For cellular organism this corresponds to a superkingdom (e.g., Archaea, Bacteria, Eukaryota).  For viruses this   corresponds to a clade (e.g.  Adnaviria, Bicaudaviridae, Clavaviridae). For other and unclassified entries this   corresponds to the first level of any taxonomic rank below the root level.  References:  Sayers EW, Barrett T, Benson DA, Bryant SH, Canese K, Chetvernin V, Church DM, DiCuccio M, Edgar R, Federhen S, Feolo M, Geer LY, Helmberg W, Kapustin Y, Landsman D, Lipman DJ, Madden TL, Maglott DR, Miller V, Mizrachi I, Ostell J, Pruitt KD, Schuler GD, Sequeira E, Sherry ST, Shumway M, Sirotkin K, Souvorov A, Starchenko G, Tatusova TA, Wagner L, Yaschenko E, Ye J (2009). Database resources of the National Center for Biotechnology Information. Nucleic Acids Res. 2009 Jan;37(Database issue):D5-15. Epub 2008 Oct 21.  Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Sayers EW (2009). GenBank. Nucleic Acids Res. 2009 Jan;37(Database issue):D26-31. Epub 2008 Oct 21.  Examples: Archaea, Bacteria, Eukaryota, Adnaviria, Bicaudaviridae, Clavaviridae, Duplodnaviria '),
+        ('ncbi_scientific_name', None, False, 'The scientific name associated with this taxonomy code aggregated by the NCBI Taxonomy Database.    This name corresponds to the taxonomy identifier assigned by the PDB depositor.   References:  Sayers EW, Barrett T, Benson DA, Bryant SH, Canese K, Chetvernin V, Church DM, DiCuccio M, Edgar R, Federhen S, Feolo M, Geer LY, Helmberg W, Kapustin Y, Landsman D, Lipman DJ, Madden TL, Maglott DR, Miller V, Mizrachi I, Ostell J, Pruitt KD, Schuler GD, Sequeira E, Sherry ST, Shumway M, Sirotkin K, Souvorov A, Starchenko G, Tatusova TA, Wagner L, Yaschenko E, Ye J (2009). Database resources of the National Center for Biotechnology Information. Nucleic Acids Res. 2009 Jan;37(Database issue):D5-15. Epub 2008 Oct 21.  Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Sayers EW (2009). GenBank. Nucleic Acids Res. 2009 Jan;37(Database issue):D26-31. Epub 2008 Oct 21.'),
+        ('ncbi_taxonomy_id', None, False, 'NCBI Taxonomy identifier for the gene source organism assigned by the PDB depositor.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18.'),
+        ('pdbx_src_id', None, False, 'An identifier for the entity segment.'),
+        ('provenance_source', None, False, 'Reference to the provenance of the source organism details for the entity.   Primary data indicates information obtained from the same source as the structural model.  UniProt and NCBI are provided as alternate sources of provenance for organism details.  Allowable values: NCBI, PDB Primary Data, Primary Data, UniProt '),
+        ('rcsb_gene_name', 'RcsbEntitySourceOrganismRcsbGeneName', False, ''),
+        ('scientific_name', None, False, 'The scientific name of the source organism assigned by the PDB depositor.'),
+        ('source_type', None, False, 'The source type for the entity  Allowable values: genetically engineered, natural, synthetic '),
+        ('taxonomy_lineage', 'RcsbEntitySourceOrganismTaxonomyLineage', False, ''),
+    )),
+    'RcsbEntitySourceOrganismRcsbGeneName': ('', (
+        ('provenance_source', None, False, 'A code indicating the provenance of the source organism details for the entity  Allowable values: NCBI, PDB Primary Data, Primary Data, UniProt '),
+        ('value', None, False, 'Gene name.  Examples: lacA, hemH '),
+    )),
+    'RcsbEntitySourceOrganismTaxonomyLineage': ('', (
+        ('depth', None, False, 'Members of the NCBI Taxonomy lineage as parent taxonomy lineage depth (1-N)'),
+        ('id', None, False, 'Members of the NCBI Taxonomy lineage as parent taxonomy idcodes.  Examples: 9606, 10090 '),
+        ('name', None, False, 'Memebers of the NCBI Taxonomy lineage as parent taxonomy names.  Examples: Homo sapiens, Mus musculus '),
+    )),
+    'RcsbEntryContainerIdentifiers': ('', (
+        ('assembly_ids', None, False, 'List of identifiers for assemblies generated from the entry.'),
+        ('branched_entity_ids', None, False, 'List of identifiers for the branched entity constituents for the entry.'),
+        ('emdb_ids', None, False, 'List of EMDB identifiers for the 3D electron microscopy density maps  used in the production of the structure model.'),
+        ('entity_ids', None, False, 'List of identifiers or the entity constituents for the entry.'),
+        ('entry_id', None, False, 'Entry identifier for the container.  Examples: 4HHB, AF_AFP60325F1, MA_MABAKCEPC0019 '),
+        ('model_ids', None, False, 'List of PDB model identifiers for the entry.'),
+        ('non_polymer_entity_ids', None, False, 'List of identifiers for the non-polymer entity constituents for the entry.'),
+        ('polymer_entity_ids', None, False, 'List of identifiers for the polymer entity constituents for the entry.'),
+        ('pubmed_id', None, False, 'Unique integer value assigned to each PubMed record.'),
+        ('rcsb_id', None, False, 'A unique identifier for each object in this entry container.  Examples: 1KIP '),
+        ('related_emdb_ids', None, False, 'List of EMDB identifiers for the 3D electron microscopy density maps  related to the structure model.'),
+        ('water_entity_ids', None, False, 'List of identifiers for the solvent/water entity constituents for the entry.'),
+    )),
+    'RcsbEntryGroupMembership': ('', (
+        ('aggregation_method', None, False, 'Method used to establish group membership  Allowable values: matching_deposit_group_id '),
+        ('group_id', None, False, 'A unique identifier for a group of entries  Examples: G_1001001 '),
+    )),
+    'RcsbEntryInfo': ('', (
+        ('assembly_count', None, False, 'The number of assemblies defined for this entry including the deposited assembly.'),
+        ('branched_entity_count', None, False, 'The number of distinct branched entities in the structure entry.'),
+        ('branched_molecular_weight_maximum', None, False, 'The maximum molecular mass (KDa) of a branched entity in the deposited structure entry.  Examples: null, null '),
+        ('branched_molecular_weight_minimum', None, False, 'The minimum molecular mass (KDa) of a branched entity in the deposited structure entry.  Examples: null, null '),
+        ('cis_peptide_count', None, False, 'The number of cis-peptide linkages per deposited structure model.'),
+        ('deposited_atom_count', None, False, 'The number of heavy atom coordinates records per deposited structure model.'),
+        ('deposited_deuterated_water_count', None, False, 'The number of deuterated water molecules per deposited structure model.'),
+        ('deposited_hydrogen_atom_count', None, False, 'The number of hydrogen atom coordinates records per deposited structure model.'),
+        ('deposited_model_count', None, False, 'The number of model structures deposited.'),
+        ('deposited_modeled_polymer_monomer_count', None, False, 'The number of modeled polymer monomers in the deposited coordinate data.  This is the total count of monomers with reported coordinate data for all polymer  entity instances in the deposited coordinate data.'),
+        ('deposited_nonpolymer_entity_instance_count', None, False, 'The number of non-polymer instances in the deposited data set.  This is the total count of non-polymer entity instances reported  per deposited structure model.'),
+        ('deposited_polymer_entity_instance_count', None, False, 'The number of polymer instances in the deposited data set.  This is the total count of polymer entity instances reported  per deposited structure model.'),
+        ('deposited_polymer_monomer_count', None, False, 'The number of polymer monomers in sample entity instances in the deposited data set.  This is the total count of monomers for all polymer entity instances reported  per deposited structure model.'),
+        ('deposited_solvent_atom_count', None, False, 'The number of heavy solvent atom coordinates records per deposited structure model.'),
+        ('deposited_unmodeled_polymer_monomer_count', None, False, 'The number of unmodeled polymer monomers in the deposited coordinate data. This is  the total count of monomers with unreported coordinate data for all polymer  entity instances per deposited structure model.'),
+        ('diffrn_radiation_wavelength_maximum', None, False, 'The maximum radiation wavelength in angstroms.'),
+        ('diffrn_radiation_wavelength_minimum', None, False, 'The minimum radiation wavelength in angstroms.'),
+        ('diffrn_resolution_high', 'RcsbEntryInfoDiffrnResolutionHigh', False, ''),
+        ('disulfide_bond_count', None, False, 'The number of disulfide bonds per deposited structure model.'),
+        ('entity_count', None, False, 'The number of distinct polymer, non-polymer, branched molecular, and solvent entities per deposited structure model.'),
+        ('experimental_method', None, False, 'The category of experimental method(s) used to determine the structure entry.  Allowable values: EM, Integrative, Multiple methods, NMR, Neutron, Other, X-ray '),
+        ('experimental_method_count', None, False, 'The number of experimental methods contributing data to the structure determination.'),
+        ('ihm_multi_scale_flag', None, False, 'Multi-scale modeling flag for integrative structures.  Allowable values: N, Y '),
+        ('ihm_multi_state_flag', None, False, 'Multi-state modeling flag for integrative structures.  Allowable values: N, Y '),
+        ('ihm_ordered_state_flag', None, False, 'Ordered-state modeling flag for integrative structures.  Allowable values: N, Y '),
+        ('ihm_structure_description', None, False, 'Description of the integrative structure.'),
+        ('inter_mol_covalent_bond_count', None, False, 'The number of intermolecular covalent bonds.'),
+        ('inter_mol_metalic_bond_count', None, False, 'The number of intermolecular metalic bonds.'),
+        ('molecular_weight', None, False, 'The molecular mass (KDa) of polymer and non-polymer entities (exclusive of solvent) in the deposited structure entry.  Examples: null, null '),
+        ('na_polymer_entity_types', None, False, 'Nucleic acid polymer entity type categories describing the entry.  Allowable values: DNA (only), DNA/RNA (only), NA-hybrid (only), Other, RNA (only) '),
+        ('ndb_struct_conf_na_feature_combined', None, False, 'This data item identifies secondary structure  features of nucleic acids in the entry.  Allowable values: a-form double helix, b-form double helix, bulge loop, double helix, four-way junction, hairpin loop, internal loop, mismatched base pair, other right-handed double helix, parallel strands, quadruple helix, tetraloop, three-way junction, triple helix, two-way junction, z-form double helix '),
+        ('nonpolymer_bound_components', None, False, 'Bound nonpolymer components in this entry.'),
+        ('nonpolymer_entity_count', None, False, 'The number of distinct non-polymer entities in the structure entry exclusive of solvent.'),
+        ('nonpolymer_molecular_weight_maximum', None, False, 'The maximum molecular mass (KDa) of a non-polymer entity in the deposited structure entry.  Examples: null, null '),
+        ('nonpolymer_molecular_weight_minimum', None, False, 'The minimum molecular mass (KDa) of a non-polymer entity in the deposited structure entry.  Examples: null, null '),
+        ('polymer_composition', None, False, 'Categories describing the polymer entity composition for the entry.  Allowable values: DNA, DNA/RNA, NA-hybrid, NA/oligosaccharide, RNA, heteromeric protein, homomeric protein, oligosaccharide, other, other type composition, other type pair, protein/NA, protein/NA/oligosaccharide, protein/oligosaccharide '),
+        ('polymer_entity_count', None, False, 'The number of distinct polymer entities in the structure entry.'),
+        ('polymer_entity_count_DNA', None, False, 'The number of distinct DNA polymer entities.'),
+        ('polymer_entity_count_RNA', None, False, 'The number of distinct RNA polymer entities.'),
+        ('polymer_entity_count_nucleic_acid', None, False, 'The number of distinct nucleic acid polymer entities (DNA or RNA).'),
+        ('polymer_entity_count_nucleic_acid_hybrid', None, False, 'The number of distinct hybrid nucleic acid polymer entities.'),
+        ('polymer_entity_count_protein', None, False, 'The number of distinct protein polymer entities.'),
+        ('polymer_entity_taxonomy_count', None, False, 'The number of distinct taxonomies represented among the polymer entities in the entry.'),
+        ('polymer_molecular_weight_maximum', None, False, 'The maximum molecular mass (KDa) of a polymer entity in the deposited structure entry.  Examples: null, null '),
+        ('polymer_molecular_weight_minimum', None, False, 'The minimum molecular mass (KDa) of a polymer entity in the deposited structure entry.  Examples: null, null '),
+        ('polymer_monomer_count_maximum', None, False, 'The maximum monomer count of a polymer entity per deposited structure model.'),
+        ('polymer_monomer_count_minimum', None, False, 'The minimum monomer count of a polymer entity per deposited structure model.'),
+        ('representative_model', None, False, 'The chosen representative model.'),
+        ('resolution_combined', None, False, "Combined estimates of experimental resolution contributing to the refined structural model.  Resolution reported in 'refine.ls_d_res_high' is used for X-RAY DIFFRACTION, FIBER DIFFRACTION,   POWDER DIFFRACTION, ELECTRON CRYSTALLOGRAPHY, and NEUTRON DIFFRACTION as identified in  'refine.pdbx_refine_id'.   Resolution reported in 'em_3d_reconstruction.resolution' is used for ELECTRON MICROSCOPY.   The best value corresponding to 'em_3d_reconstruction.resolution_method' == 'FSC 0.143 CUT-OFF'   is used, if available. If not, the best 'em_3d_reconstruction.resolution' value is used.   For structures that are not obtained from diffraction-based methods, the resolution values in   'refine.ls_d_res_high' are ignored.  Multiple values are reported only if multiple methods are used in the structure determination."),
+        ('selected_polymer_entity_types', None, False, 'Selected polymer entity type categories describing the entry.  Allowable values: Nucleic acid (only), Oligosaccharide (only), Other, Protein (only), Protein/NA, Protein/Oligosaccharide '),
+        ('software_programs_combined', None, False, 'Combined list of software programs names reported in connection with the production of this entry.'),
+        ('solvent_entity_count', None, False, 'The number of distinct solvent entities per deposited structure model.'),
+        ('structure_determination_methodology', None, False, 'Indicates if the structure was determined using experimental or computational methods.  Allowable values: computational, experimental, integrative '),
+        ('structure_determination_methodology_priority', None, False, "Indicates the priority of the value in _rcsb_entry_info.structure_determination_methodology.  The lower the number the higher the priority.  Priority values for 'experimental' structures is currently set to 10 and  the values for 'computational' structures is set to 100."),
+    )),
+    'RcsbEntryInfoDiffrnResolutionHigh': ('', (
+        ('provenance_source', None, False, 'The provenence source for the high resolution limit of data collection.  Allowable values: Depositor assigned, From refinement resolution cutoff, From the high resolution shell '),
+        ('value', None, False, 'The high resolution limit of data collection.'),
+    )),
+    'RcsbExternalReferences': ('', (
+        ('id', None, False, 'ID (accession) from external resource linked to this entry.  Examples: 1BMR '),
+        ('link', None, False, 'Link to this entry in external resource'),
+        ('type', None, False, 'Internal identifier for external resources  Allowable values: BMRB, EM DATA RESOURCE, NAKB, NDB, OLDERADO, PROTEIN DIFFRACTION, SB GRID '),
+    )),
+    'RcsbGenomicLineage': ('', (
+        ('depth', None, False, 'Classification hierarchy depth.'),
+        ('id', None, False, 'Automatically assigned ID that uniquely identifies taxonomy, chromosome or gene in the Genome Location Browser.  Examples: 9606, 568815441, 414325 '),
+        ('name', None, False, 'A human-readable term name.  Examples: Homo sapiens, 8, defensin beta 103A '),
+    )),
+    'RcsbGroupAccessionInfo': ('', (
+        ('version', None, False, 'Identifies the version of the groups solution'),
+    )),
+    'RcsbGroupAggregationMethod': ('', (
+        ('method', 'RcsbGroupAggregationMethodMethod', False, 'The details on a method used to calculate cluster solutions'),
+        ('similarity_criteria', 'RcsbGroupAggregationMethodSimilarityCriteria', False, ''),
+        ('type', None, False, 'Specifies the type of similarity criteria used to aggregate members into higher levels in the hierarchy  Allowable values: sequence_identity, matching_uniprot_accession, matching_deposit_group_id, matching_chemical_component_id '),
+    )),
+    'RcsbGroupAggregationMethodMethod': ('', (
+        ('details', 'MethodDetails', False, 'Additional details describing the clustering process'),
+        ('name', None, False, 'The name of the software or the method used to calculate cluster solutions  Allowable values: mmseqs2, matching_reference_identity '),
+        ('version', None, False, 'The version of the software.  Examples: v1.0, 3.1-2, unknown '),
+    )),
+    'RcsbGroupAggregationMethodSimilarityCriteria': ('', (
+        ('similarity_function', None, False, 'A function or similarity measure that quantifies the similarity between two members  Allowable values: rmsd, sequence_identity '),
+    )),
+    'RcsbGroupContainerIdentifiers': ('', (
+        ('group_id', None, False, 'A unique textual identifier for a group'),
+        ('group_member_ids', None, False, 'Member identifiers representing a group'),
+        ('group_provenance_id', None, False, 'A unique group provenance identifier  Allowable values: provenance_sequence_identity, provenance_matching_uniprot_accession, provenance_matching_deposit_group_id, provenance_matching_chemical_component_id '),
+        ('parent_member_ids', None, False, 'Member identifiers representing a higher level in the groping hierarchy that has parent-child relationship'),
+    )),
+    'RcsbGroupInfo': ('', (
+        ('group_description', None, False, ''),
+        ('group_members_count', None, False, ''),
+        ('group_members_granularity', None, False, 'Granularity of group members identifiers  Allowable values: assembly, entry, polymer_entity, non_polymer_entity, polymer_entity_instance '),
+        ('group_name', None, False, ''),
+    )),
+    'RcsbGroupProvenanceContainerIdentifiers': ('', (
+        ('group_provenance_id', None, False, 'A unique group provenance identifier  Allowable values: provenance_sequence_identity, provenance_matching_uniprot_accession, provenance_matching_deposit_group_id, provenance_matching_chemical_component_id '),
+    )),
+    'RcsbGroupRelated': ('', (
+        ('resource_accession_code', None, False, 'A unique code assigned to a reference related the group  Examples: P69905 '),
+        ('resource_name', None, False, 'Defines the type of the resource describing related references  Examples: UniProt '),
+    )),
+    'RcsbGroupStatistics': ('', (
+        ('similarity_cutoff', None, False, 'The desired lower limit for the similarity between two members that belong to the same group'),
+        ('similarity_score_max', None, False, 'Similarity score between two most similar group members'),
+        ('similarity_score_min', None, False, 'Similarity score between two least similar group members'),
+    )),
+    'RcsbIhmDatasetList': ('', (
+        ('count', None, False, 'Number of input datasets used in integrative modeling.'),
+        ('name', None, False, 'Name of input dataset used in integrative modeling.  Allowable values: 2DEM class average, 3DEM volume, CX-MS data, Comparative model, Crosslinking-MS data, DNA footprinting data, De Novo model, EM raw micrographs, EPR data, Ensemble FRET data, Experimental model, H/D exchange data, Hydroxyl radical footprinting data, Integrative model, Mass Spectrometry data, Mutagenesis data, NMR data, Other, Predicted contacts, Quantitative measurements of genetic interactions, SAS data, Single molecule FRET data, X-ray diffraction data, Yeast two-hybrid screening data '),
+        ('type', None, False, 'Type of input dataset used in integrative modeling.  Allowable values: Computed restraints, Experimental data, Other, Starting model '),
+    )),
+    'RcsbIhmDatasetSourceDbReference': ('', (
+        ('accession_code', None, False, 'Accession code for the input dataset.  Examples: 5FM1, EMD-2799, SASDA82, PXD003381, MA-CO2KC '),
+        ('db_name', None, False, 'Name of the source database for the input dataset.  Allowable values: AlphaFoldDB, BMRB, BMRbig, BioGRID, EMDB, EMPIAR, MASSIVE, ModelArchive, Other, PDB, PDB-Dev, PRIDE, ProXL, ProteomeXchange, SASBDB, iProX, jPOSTrepo '),
+    )),
+    'RcsbInterfaceContainerIdentifiers': ('', (
+        ('assembly_id', None, False, 'This item references an assembly in pdbx_struct_assembly'),
+        ('entry_id', None, False, 'Entry identifier for the container.'),
+        ('interface_entity_id', None, False, 'Identifier for NCS-equivalent interfaces within the assembly (same entity_ids on both sides)  Examples: 1, 2 '),
+        ('interface_id', None, False, 'Identifier for the geometrically equivalent (same asym_ids on either side) interfaces within the assembly  Examples: 1, 2 '),
+        ('rcsb_id', None, False, 'Unique identifier for the document  Examples: 2UZI-1.A.B?1 '),
+    )),
+    'RcsbInterfaceInfo': ('', (
+        ('interface_area', None, False, 'Total interface buried surface area'),
+        ('interface_character', None, False, 'Allowable values: homo, hetero.'),
+        ('num_core_interface_residues', None, False, 'Number of core interface residues, defined as those that bury >90% accessible surface area with respect to the unbound state'),
+        ('num_interface_residues', None, False, 'Number of interface residues, defined as those with burial fraction > 0'),
+        ('polymer_composition', None, False, 'Allowable values: Nucleic acid (only), Protein (only), Protein/NA.'),
+        ('self_jaccard_contact_score', None, False, 'The Jaccard score (intersection over union) of interface contacts in homomeric interfaces, comparing contact sets left-right vs right-left. High values indicate isologous (symmetric) interfaces, with value=1 if perfectly symmetric (e.g. crystallographic symmetry)'),
+    )),
+    'RcsbInterfacePartner': ('', (
+        ('interface_partner_feature', 'RcsbInterfacePartnerInterfacePartnerFeature', False, ''),
+        ('interface_partner_identifier', 'RcsbInterfacePartnerInterfacePartnerIdentifier', False, ''),
+    )),
+    'RcsbInterfacePartnerInterfacePartnerFeature': ('', (
+        ('additional_properties', 'InterfacePartnerFeatureAdditionalProperties', False, ''),
+        ('assignment_version', None, False, 'Identifies the version of the feature assignment.  Examples: V4_0_2 '),
+        ('description', None, False, 'A description for the feature.'),
+        ('feature_id', None, False, 'An identifier for the feature.'),
+        ('feature_positions', 'InterfacePartnerFeatureFeaturePositions', False, ''),
+        ('name', None, False, 'A name for the feature.'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that assigned the feature.  Examples: NACCESS '),
+        ('type', None, False, 'A type or category of the feature.  Allowable values: ASA_UNBOUND, ASA_BOUND '),
+    )),
+    'RcsbInterfacePartnerInterfacePartnerIdentifier': ('', (
+        ('asym_id', None, False, 'Instance identifier for this container.'),
+        ('entity_id', None, False, 'Polymer entity identifier for the container.'),
+    )),
+    'RcsbLatestRevision': ('', (
+        ('major_revision', None, False, 'The major version number of the latest revision.'),
+        ('minor_revision', None, False, 'The minor version number of the latest revision.'),
+        ('revision_date', None, False, 'The release date of the latest revision item.  Examples: 2020-02-11, 2018-10-23 '),
+    )),
+    'RcsbLigandNeighbors': ('', (
+        ('alt_id', None, False, 'Alternate conformer identifier for the target instance.'),
+        ('atom_id', None, False, 'The atom identifier for the target instance.  Examples: O1, N1, C1 '),
+        ('auth_seq_id', None, False, 'The author residue index for the target instance.'),
+        ('comp_id', None, False, 'Component identifier for the target instance.'),
+        ('distance', None, False, 'Distance value for this ligand interaction.'),
+        ('ligand_alt_id', None, False, 'Alternate conformer identifier for the ligand interaction.'),
+        ('ligand_asym_id', None, False, 'The entity instance identifier for the ligand interaction.  Examples: A, B '),
+        ('ligand_atom_id', None, False, 'The atom identifier for the ligand interaction.  Examples: OG, OE1, CD1 '),
+        ('ligand_comp_id', None, False, 'The chemical component identifier for the ligand interaction.  Examples: ASN, TRP, SER '),
+        ('ligand_entity_id', None, False, 'The entity identifier for the ligand of interaction.  Examples: 1, 2 '),
+        ('ligand_is_bound', None, False, 'A flag to indicate the nature of the ligand interaction is covalent or metal-coordination.  Allowable values: N, Y '),
+        ('ligand_model_id', None, False, 'Model identifier for the ligand interaction.'),
+        ('seq_id', None, False, 'The sequence position for the target instance.'),
+    )),
+    'RcsbMaQaMetricGlobal': ('', (
+        ('ma_qa_metric_global', 'RcsbMaQaMetricGlobalMaQaMetricGlobal', False, ''),
+        ('model_id', None, False, 'The model identifier.'),
+    )),
+    'RcsbMaQaMetricGlobalMaQaMetricGlobal': ('', (
+        ('description', None, False, 'Description of the global QA metric.  Examples: confidence score predicting accuracy according to the CA-only Local Distance Difference Test (lDDT-CA) in [0,100] '),
+        ('name', None, False, 'Name of the global QA metric.  Examples: pLDDT '),
+        ('type', None, False, 'The type of global QA metric.  Allowable values: PAE, contact probability, distance, energy, ipTM, normalized score, other, pLDDT, pLDDT all-atom, pLDDT all-atom in [0,1], pLDDT in [0,1], pTM, zscore '),
+        ('type_other_details', None, False, 'Details for other type of global QA metric.'),
+        ('value', None, False, 'Value of the global QA metric.  Examples: null '),
+    )),
+    'RcsbMembraneLineage': ('', (
+        ('depth', None, False, 'Hierarchy depth.'),
+        ('id', None, False, 'Automatically assigned ID for membrane classification term in the Membrane Protein Browser.  Examples: MONOTOPIC MEMBRANE PROTEINS.Oxidases.Monoamine Oxidase A '),
+        ('name', None, False, 'Membrane protein classification term.'),
+    )),
+    'RcsbNonpolymerEntity': ('', (
+        ('details', None, False, 'A description of special aspects of the entity.'),
+        ('formula_weight', None, False, 'Formula mass (KDa) of the entity.'),
+        ('pdbx_description', None, False, 'A description of the nonpolymer entity.'),
+        ('pdbx_number_of_molecules', None, False, 'The number of molecules of the nonpolymer entity in the entry.'),
+    )),
+    'RcsbNonpolymerEntityAnnotation': ('', (
+        ('annotation_id', None, False, 'An identifier for the annotation.'),
+        ('annotation_lineage', 'RcsbNonpolymerEntityAnnotationAnnotationLineage', False, ''),
+        ('assignment_version', None, False, 'Identifies the version of the annotation assignment.  Examples: V4_0_2 '),
+        ('comp_id', None, False, 'Non-polymer(ligand) chemical component identifier for the entity.  Examples: GTP, STN '),
+        ('description', None, False, 'A description for the annotation.'),
+        ('name', None, False, 'A name for the annotation.'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that  assigned the annotation.  Examples: PDB '),
+        ('type', None, False, 'A type or category of the annotation.  Allowable values: SUBJECT_OF_INVESTIGATION '),
+    )),
+    'RcsbNonpolymerEntityAnnotationAnnotationLineage': ('', (
+        ('depth', None, False, 'Members of the annotation lineage as parent lineage depth (1-N)'),
+        ('id', None, False, 'Members of the annotation lineage as parent class identifiers.'),
+        ('name', None, False, 'Members of the annotation lineage as parent class names.'),
+    )),
+    'RcsbNonpolymerEntityContainerIdentifiers': ('', (
+        ('asym_ids', None, False, 'Instance identifiers corresponding to copies of the entity in this container.'),
+        ('auth_asym_ids', None, False, 'Author instance identifiers corresponding to copies of the entity in this container.'),
+        ('chem_ref_def_id', None, False, 'The chemical reference definition identifier for the entity in this container.  Examples: PRD_000010 '),
+        ('entity_id', None, False, 'Entity identifier for the container.  Examples: 1, 2 '),
+        ('entry_id', None, False, 'Entry identifier for the container.  Examples: 4HHB, 1KIP '),
+        ('nonpolymer_comp_id', None, False, 'Non-polymer(ligand) chemical component identifier for the entity in this container.  Examples: GTP, STN '),
+        ('prd_id', None, False, 'The BIRD identifier for the entity in this container.  Examples: PRD_000010 '),
+        ('rcsb_id', None, False, 'A unique identifier for each object in this entity container formed by  an underscore separated concatenation of entry and entity identifiers.  Examples: 6EL3_1 '),
+        ('reference_chemical_identifiers_provenance_source', None, False, 'Source of the reference database assignment  Allowable values: PDB, RCSB '),
+        ('reference_chemical_identifiers_resource_accession', None, False, 'Reference resource accession code'),
+        ('reference_chemical_identifiers_resource_name', None, False, 'Reference resource name  Allowable values: ChEBI, ChEMBL, DrugBank, PubChem '),
+    )),
+    'RcsbNonpolymerEntityFeature': ('', (
+        ('additional_properties', 'RcsbNonpolymerEntityFeatureAdditionalProperties', False, ''),
+        ('assignment_version', None, False, 'Identifies the version of the feature assignment.  Examples: V4_0_2 '),
+        ('comp_id', None, False, 'Non-polymer(ligand) chemical component identifier for the entity.  Examples: GTP, STN '),
+        ('description', None, False, 'A description for the feature.'),
+        ('feature_id', None, False, 'An identifier for the feature.'),
+        ('name', None, False, 'A name for the feature.'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that  assigned the feature.  Examples: PDB '),
+        ('type', None, False, 'A type or category of the feature.  Allowable values: SUBJECT_OF_INVESTIGATION '),
+        ('value', None, False, 'The feature value.'),
+    )),
+    'RcsbNonpolymerEntityFeatureAdditionalProperties': ('', (
+        ('name', None, False, 'The additional property name.'),
+        ('values', None, False, 'The value(s) of the additional property.'),
+    )),
+    'RcsbNonpolymerEntityFeatureSummary': ('', (
+        ('comp_id', None, False, 'Non-polymer(ligand) chemical component identifier for the entity.  Examples: GTP, STN '),
+        ('count', None, False, 'The feature count.'),
+        ('maximum_length', None, False, 'The maximum feature length.'),
+        ('maximum_value', None, False, 'The maximum feature value.  Examples: null, null '),
+        ('minimum_length', None, False, 'The minimum feature length.'),
+        ('minimum_value', None, False, 'The minimum feature value.  Examples: null, null '),
+        ('type', None, False, 'Type or category of the feature.  Allowable values: SUBJECT_OF_INVESTIGATION '),
+    )),
+    'RcsbNonpolymerEntityInstanceContainerIdentifiers': ('', (
+        ('asym_id', None, False, 'Instance identifier for this container.'),
+        ('auth_asym_id', None, False, 'Author instance identifier for this container.'),
+        ('auth_seq_id', None, False, 'Residue number for non-polymer entity instance.'),
+        ('comp_id', None, False, 'Component identifier for non-polymer entity instance.'),
+        ('entity_id', None, False, 'Entity identifier for the container.'),
+        ('entry_id', None, False, 'Entry identifier for the container.'),
+        ('rcsb_id', None, False, "A unique identifier for each object in this entity instance container formed by  an 'dot' (.) separated concatenation of entry and entity instance identifiers.  Examples: 1KIP.A "),
+    )),
+    'RcsbNonpolymerEntityKeywords': ('', (
+        ('text', None, False, 'Keywords describing this non-polymer entity.'),
+    )),
+    'RcsbNonpolymerEntityNameCom': ('', (
+        ('name', None, False, 'A common name for the nonpolymer entity.'),
+    )),
+    'RcsbNonpolymerInstanceAnnotation': ('', (
+        ('annotation_id', None, False, 'An identifier for the annotation.'),
+        ('annotation_lineage', 'RcsbNonpolymerInstanceAnnotationAnnotationLineage', False, ''),
+        ('assignment_version', None, False, 'Identifies the version of the annotation assignment.  Examples: V4_0_2 '),
+        ('comp_id', None, False, 'Non-polymer (ligand) chemical component identifier.  Examples: ATP '),
+        ('description', None, False, 'A description for the annotation.'),
+        ('name', None, False, 'A name for the annotation.'),
+        ('ordinal', None, False, 'Ordinal identifier for this category'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that  assigned the annotation.  Examples: PDB '),
+        ('type', None, False, 'A type or category of the annotation.  Allowable values: HAS_COVALENT_LINKAGE, HAS_METAL_COORDINATION_LINKAGE, HAS_NO_COVALENT_LINKAGE, IS_RSCC_OUTLIER, IS_RSRZ_OUTLIER '),
+    )),
+    'RcsbNonpolymerInstanceAnnotationAnnotationLineage': ('', (
+        ('depth', None, False, 'Members of the annotation lineage as parent lineage depth (1-N)'),
+        ('id', None, False, 'Members of the annotation lineage as parent class identifiers.'),
+        ('name', None, False, 'Members of the annotation lineage as parent class names.'),
+    )),
+    'RcsbNonpolymerInstanceFeature': ('', (
+        ('additional_properties', 'RcsbNonpolymerInstanceFeatureAdditionalProperties', False, ''),
+        ('assignment_version', None, False, 'Identifies the version of the feature assignment.  Examples: V4_0_2 '),
+        ('comp_id', None, False, 'Component identifier for non-polymer entity instance.'),
+        ('description', None, False, 'A description for the feature.'),
+        ('feature_id', None, False, 'An identifier for the feature.'),
+        ('feature_value', 'RcsbNonpolymerInstanceFeatureFeatureValue', False, ''),
+        ('name', None, False, 'A name for the feature.'),
+        ('ordinal', None, False, 'Ordinal identifier for this category'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that  assigned the feature.  Examples: PDB '),
+        ('type', None, False, 'A type or category of the feature.  Allowable values: HAS_COVALENT_LINKAGE, HAS_METAL_COORDINATION_LINKAGE, MODELED_ATOMS, MOGUL_ANGLE_OUTLIER, MOGUL_ANGLE_OUTLIERS, MOGUL_BOND_OUTLIER, MOGUL_BOND_OUTLIERS, MOGUL_RING_OUTLIERS, MOGUL_TORSION_OUTLIERS, RSCC_OUTLIER, RSRZ_OUTLIER, STEREO_OUTLIER, STEREO_OUTLIERS '),
+    )),
+    'RcsbNonpolymerInstanceFeatureAdditionalProperties': ('', (
+        ('name', None, False, 'The additional property name.  Examples: bond_distance, bond_angle '),
+        ('values', None, False, 'The value(s) of the additional property.'),
+    )),
+    'RcsbNonpolymerInstanceFeatureFeatureValue': ('', (
+        ('comp_id', None, False, 'The chemical component identifier for the instance of the feature value.  Examples: ATP,, STN '),
+        ('details', None, False, 'Specific details about the feature.  Examples: C1,C2, C1,C2,C3 '),
+        ('reference', None, False, 'The reference value of the feature.  Examples: null, null '),
+        ('reported', None, False, 'The reported value of the feature.  Examples: null, null '),
+        ('uncertainty_estimate', None, False, 'The estimated uncertainty of the reported feature value.  Examples: null, null '),
+        ('uncertainty_estimate_type', None, False, 'The type of estimated uncertainty for the reported feature value.  Allowable values: Z-Score '),
+    )),
+    'RcsbNonpolymerInstanceFeatureSummary': ('', (
+        ('comp_id', None, False, 'Component identifier for non-polymer entity instance.'),
+        ('count', None, False, 'The feature count.'),
+        ('coverage', None, False, 'The fractional feature coverage relative to the full entity sequence.  Examples: null, null '),
+        ('maximum_length', None, False, 'The maximum feature length.'),
+        ('maximum_value', None, False, 'The maximum feature value.  Examples: null, null '),
+        ('minimum_length', None, False, 'The minimum feature length.'),
+        ('minimum_value', None, False, 'The minimum feature value.  Examples: null, null '),
+        ('type', None, False, 'Type or category of the feature.  Allowable values: HAS_COVALENT_LINKAGE, HAS_METAL_COORDINATION_LINKAGE, MODELED_ATOMS, MOGUL_ANGLE_OUTLIER, MOGUL_ANGLE_OUTLIERS, MOGUL_BOND_OUTLIER, MOGUL_BOND_OUTLIERS, MOGUL_RING_OUTLIERS, MOGUL_TORSION_OUTLIERS, RSCC_OUTLIER, RSRZ_OUTLIER, STEREO_OUTLIER, STEREO_OUTLIERS '),
+    )),
+    'RcsbNonpolymerInstanceValidationScore': ('', (
+        ('RSCC', None, False, 'The real space correlation coefficient (RSCC) for the non-polymer entity instance.  Examples: null, null '),
+        ('RSR', None, False, 'The real space R-value (RSR) for the non-polymer entity instance.  Examples: null, null '),
+        ('alt_id', None, False, 'Alternate conformer identifier for the non-polymer entity instance.'),
+        ('average_occupancy', None, False, 'The average heavy atom occupancy for coordinate records for the non-polymer entity instance.  Examples: null, null '),
+        ('completeness', None, False, 'The reported fraction of atomic coordinate records for the non-polymer entity instance.  Examples: null, null '),
+        ('intermolecular_clashes', None, False, 'The number of intermolecular MolProbity clashes cacluated for reported atomic coordinate records.'),
+        ('is_best_instance', None, False, 'This molecular instance is ranked as the best quality instance of this nonpolymer entity.  Allowable values: N, Y '),
+        ('is_subject_of_investigation', None, False, 'This molecular entity is identified as the subject of the current study.  Allowable values: N, Y '),
+        ('is_subject_of_investigation_provenance', None, False, 'The provenance for the selection of the molecular entity identified as the subject of the current study.  Allowable values: Author, RCSB '),
+        ('mogul_angle_outliers', None, False, 'Number of bond angle outliers obtained from a CCDC Mogul survey of bond angles  in the CSD small    molecule crystal structure database. Outliers are defined as bond angles that have a Z-score    less than -2 or greater than 2.'),
+        ('mogul_angles_RMSZ', None, False, 'The root-mean-square value of the Z-scores of bond angles for the non-polymer instance in degrees obtained from a CCDC Mogul survey of bond angles in the CSD small molecule crystal structure database.  Examples: null, null '),
+        ('mogul_bond_outliers', None, False, 'Number of bond distance outliers obtained from a CCDC Mogul survey of bond lengths in the CSD small    molecule crystal structure database.  Outliers are defined as bond distances that have a Z-score    less than -2 or greater than 2.'),
+        ('mogul_bonds_RMSZ', None, False, 'The root-mean-square value of the Z-scores of bond lengths for the nonpolymer instance in Angstroms obtained from a CCDC Mogul survey of bond lengths in the CSD small molecule crystal structure database.  Examples: null, null '),
+        ('natoms_eds', None, False, 'The number of atoms in the non-polymer instance returned by the EDS software.'),
+        ('num_mogul_angles_RMSZ', None, False, "The number of bond angles compared to 'standard geometry' made using the Mogul program."),
+        ('num_mogul_bonds_RMSZ', None, False, "The number of bond lengths compared to 'standard geometry' made using the Mogul program."),
+        ('ranking_model_fit', None, False, 'The ranking of the model fit score component.  Examples: null, null '),
+        ('ranking_model_geometry', None, False, 'The ranking of the model geometry score component.  Examples: null, null '),
+        ('score_model_fit', None, False, 'The value of the model fit score component.  Examples: null, null '),
+        ('score_model_geometry', None, False, 'The value of the model geometry score component.  Examples: null, null '),
+        ('stereo_outliers', None, False, 'Number of stereochemical/chirality errors.'),
+        ('type', None, False, 'Score type.  Allowable values: RCSB_LIGAND_QUALITY_SCORE_2021 '),
+    )),
+    'RcsbNonpolymerStructConn': ('', (
+        ('connect_partner', 'RcsbNonpolymerStructConnConnectPartner', False, ''),
+        ('connect_target', 'RcsbNonpolymerStructConnConnectTarget', False, ''),
+        ('connect_type', None, False, 'The connection type.  Allowable values: covalent bond, disulfide bridge, hydrogen bond, ionic interaction, metal coordination, mismatched base pairs '),
+        ('description', None, False, 'A description of special details of the connection.  Examples: Watson-Crick base pair '),
+        ('dist_value', None, False, 'Distance value for this contact.'),
+        ('id', None, False, 'The value of _rcsb_nonpolymer_struct_conn.id is an identifier for connection.   Note that this item need not be a number; it can be any unique  identifier.'),
+        ('ordinal_id', None, False, 'The value of _rcsb_nonpolymer_struct_conn.id must uniquely identify a record in  the rcsb_nonpolymer_struct_conn list.'),
+        ('role', None, False, 'The chemical or structural role of the interaction  Allowable values: C-Mannosylation, N-Glycosylation, O-Glycosylation, S-Glycosylation '),
+        ('value_order', None, False, 'The chemical bond order associated with the specified atoms in  this contact.  Allowable values: doub, quad, sing, trip '),
+    )),
+    'RcsbNonpolymerStructConnConnectPartner': ('', (
+        ('label_alt_id', None, False, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category.'),
+        ('label_asym_id', None, False, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category.'),
+        ('label_atom_id', None, False, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _chem_comp_atom.atom_id in the  CHEM_COMP_ATOM category.'),
+        ('label_comp_id', None, False, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category.'),
+        ('label_seq_id', None, False, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_seq_id in the  ATOM_SITE category.'),
+        ('symmetry', None, False, 'Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_nonpolymer_struct_conn.connect_partner_label* to generate the  partner in the structure connection.  Examples: 1_555, 7_645 '),
+    )),
+    'RcsbNonpolymerStructConnConnectTarget': ('', (
+        ('auth_asym_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_asym_id in the  ATOM_SITE category.'),
+        ('auth_seq_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_seq_id in the  ATOM_SITE category.'),
+        ('label_alt_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category.'),
+        ('label_asym_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category.'),
+        ('label_atom_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_atom_id in the  ATOM_SITE category.'),
+        ('label_comp_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category.'),
+        ('label_seq_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.connect_target_label_seq_id in the  ATOM_SITE category.'),
+        ('symmetry', None, False, 'Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_nonpolymer_struct_conn.label* to generate the  target of the structure connection.  Examples: 1_555, 7_645 '),
+    )),
+    'RcsbPfamContainerIdentifiers': ('', (
+        ('pfam_id', None, False, 'Accession number of Pfam entry.'),
+    )),
+    'RcsbPolymerEntity': ('', (
+        ('details', None, False, 'A description of special aspects of the entity.'),
+        ('formula_weight', None, False, 'Formula mass (KDa) of the entity.  Examples: null, null '),
+        ('pdbx_description', None, False, 'A description of the polymer entity.  Examples: Green fluorescent protein, 23S ribosomal RNA, NAD-dependent protein deacylase sirtuin-5, mitochondrial '),
+        ('pdbx_ec', None, False, 'Enzyme Commission (EC) number(s)  Examples: 2.7.7.7 '),
+        ('pdbx_fragment', None, False, 'Polymer entity fragment description(s).  Examples: KLENOW FRAGMENT, REPLICASE OPERATOR HAIRPIN, C-TERMINAL DOMAIN '),
+        ('pdbx_mutation', None, False, 'Details about any polymer entity mutation(s).  Examples: Y31H, DEL(298-323) '),
+        ('pdbx_number_of_molecules', None, False, 'The number of molecules of the entity in the entry.'),
+        ('rcsb_ec_lineage', 'RcsbPolymerEntityRcsbEcLineage', False, ''),
+        ('rcsb_enzyme_class_combined', 'RcsbPolymerEntityRcsbEnzymeClassCombined', False, ''),
+        ('rcsb_macromolecular_names_combined', 'RcsbPolymerEntityRcsbMacromolecularNamesCombined', False, ''),
+        ('rcsb_multiple_source_flag', None, False, 'A code indicating the entity has multiple biological sources.  Allowable values: N, Y '),
+        ('rcsb_polymer_name_combined', 'RcsbPolymerEntityRcsbPolymerNameCombined', False, ''),
+        ('rcsb_source_part_count', None, False, 'The number of biological sources for the polymer entity. Multiple source contributions  may come from the same organism (taxonomy).'),
+        ('rcsb_source_taxonomy_count', None, False, 'The number of distinct source taxonomies for the polymer entity. Commonly used to identify chimeric polymers.'),
+        ('src_method', None, False, 'The method by which the sample for the polymer entity was produced.  Entities isolated directly from natural sources (tissues, soil  samples etc.) are expected to have further information in the  ENTITY_SRC_NAT category. Entities isolated from genetically  manipulated sources are expected to have further information in  the ENTITY_SRC_GEN category.  Allowable values: man, nat, syn '),
+    )),
+    'RcsbPolymerEntityAlign': ('', (
+        ('aligned_regions', 'RcsbPolymerEntityAlignAlignedRegions', False, ''),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that  assigned the reference sequence.  Examples: PDB, SIFTS, RCSB '),
+        ('reference_database_accession', None, False, 'Reference sequence accession code.  Examples: Q9HD40 '),
+        ('reference_database_isoform', None, False, 'Reference sequence isoform identifier.  Examples: P01116-2 '),
+        ('reference_database_name', None, False, 'Reference sequence database name.  Allowable values: EMBL, GenBank, NDB, NORINE, PDB, PIR, PRF, RefSeq, UniProt '),
+    )),
+    'RcsbPolymerEntityAlignAlignedRegions': ('', (
+        ('entity_beg_seq_id', None, False, 'An identifier for the monomer in the entity sequence at which this segment of the alignment begins.'),
+        ('length', None, False, 'The length of this segment of the alignment.'),
+        ('ref_beg_seq_id', None, False, 'An identifier for the monomer in the reference sequence at which this segment of the alignment begins.'),
+    )),
+    'RcsbPolymerEntityAnnotation': ('', (
+        ('additional_properties', 'RcsbPolymerEntityAnnotationAdditionalProperties', False, ''),
+        ('annotation_id', None, False, 'An identifier for the annotation.'),
+        ('annotation_lineage', 'RcsbPolymerEntityAnnotationAnnotationLineage', False, ''),
+        ('assignment_version', None, False, 'Identifies the version of the annotation assignment.  Examples: V4_0_2 '),
+        ('description', None, False, 'A description for the annotation.'),
+        ('name', None, False, 'A name for the annotation.'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that  assigned the annotation.  Examples: PDB, UniProt '),
+        ('type', None, False, 'A type or category of the annotation.  Allowable values: CARD, GO, GlyCosmos, GlyGen, InterPro, MemProtMD, OPM, PDBTM, Pfam, mpstruc '),
+    )),
+    'RcsbPolymerEntityAnnotationAdditionalProperties': ('', (
+        ('name', None, False, 'The additional property name.  Allowable values: CARD_ARO_CATEGORY, CARD_ARO_CVTERM_ID, CARD_ARO_DRUG_CLASS, CARD_ARO_RESISTANCE_MECHANISM '),
+        ('values', None, False, 'The value(s) of the additional property.'),
+    )),
+    'RcsbPolymerEntityAnnotationAnnotationLineage': ('', (
+        ('depth', None, False, 'Members of the annotation lineage as parent lineage depth (1-N)'),
+        ('id', None, False, 'Members of the annotation lineage as parent class identifiers.'),
+        ('name', None, False, 'Members of the annotation lineage as parent class names.'),
+    )),
+    'RcsbPolymerEntityContainerIdentifiers': ('', (
+        ('asym_ids', None, False, 'Instance identifiers corresponding to copies of the entity in this container.'),
+        ('auth_asym_ids', None, False, 'Author instance identifiers corresponding to copies of the entity in this container.'),
+        ('chem_comp_monomers', None, False, 'Unique list of monomer chemical component identifiers in the polymer entity in this container.'),
+        ('chem_comp_nstd_monomers', None, False, 'Unique list of non-standard monomer chemical component identifiers in the polymer entity in this container.'),
+        ('chem_ref_def_id', None, False, 'The chemical reference definition identifier for the entity in this container.  Examples: PRD_000010 '),
+        ('entity_id', None, False, 'Entity identifier for the container.  Examples: 1, 2 '),
+        ('entry_id', None, False, 'Entry identifier for the container.  Examples: 4HHB, 1KIP '),
+        ('prd_id', None, False, 'The BIRD identifier for the entity in this container.  Examples: PRD_000010 '),
+        ('rcsb_id', None, False, 'A unique identifier for each object in this entity container formed by  an underscore separated concatenation of entry and entity identifiers.  Examples: 6EL3_1 '),
+        ('reference_sequence_identifiers', 'RcsbPolymerEntityContainerIdentifiersReferenceSequenceIdentifiers', False, ''),
+        ('uniprot_ids', None, False, 'Uniprot accession codes assigned to polymeric entities.'),
+    )),
+    'RcsbPolymerEntityContainerIdentifiersReferenceSequenceIdentifiers': ('', (
+        ('database_accession', None, False, 'Reference database accession code  Examples: P01116, 55771382 '),
+        ('database_isoform', None, False, 'Reference database identifier for the sequence isoform  Examples: P01116-2 '),
+        ('database_name', None, False, 'Reference database name  Allowable values: EMBL, GenBank, NDB, NORINE, PDB, PIR, PRF, RefSeq, UniProt '),
+        ('entity_sequence_coverage', None, False, 'Indicates what fraction of this polymer entity sequence is covered by the reference sequence.  Examples: null, null '),
+        ('provenance_source', None, False, 'Source of the reference database assignment  Allowable values: PDB, RCSB, SIFTS, UniProt '),
+        ('reference_sequence_coverage', None, False, 'Indicates what fraction of the reference sequence is covered by this polymer entity sequence.  Examples: null, null '),
+    )),
+    'RcsbPolymerEntityFeature': ('', (
+        ('additional_properties', 'RcsbPolymerEntityFeatureAdditionalProperties', False, ''),
+        ('assignment_version', None, False, 'Identifies the version of the feature assignment.  Examples: V4_0_2 '),
+        ('description', None, False, 'A description for the feature.'),
+        ('feature_id', None, False, 'An identifier for the feature.'),
+        ('feature_positions', 'RcsbPolymerEntityFeatureFeaturePositions', False, ''),
+        ('name', None, False, 'A name for the feature.'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that  assigned the feature.  Examples: PDB '),
+        ('reference_scheme', None, False, 'Code residue coordinate system for the assigned feature.  Allowable values: NCBI, PDB entity, UniProt '),
+        ('type', None, False, 'A type or category of the feature.  Allowable values: CARD_MODEL, IMGT_ANTIBODY_DESCRIPTION, IMGT_ANTIBODY_DOMAIN_NAME, IMGT_ANTIBODY_GENE_ALLELE_NAME, IMGT_ANTIBODY_ORGANISM_NAME, IMGT_ANTIBODY_PROTEIN_NAME, IMGT_ANTIBODY_RECEPTOR_DESCRIPTION, IMGT_ANTIBODY_RECEPTOR_TYPE, Pfam, SABDAB_ANTIBODY_ANTIGEN_NAME, SABDAB_ANTIBODY_NAME, SABDAB_ANTIBODY_TARGET, artifact, disorder, disorder_binding, hydropathy, modified_monomer, mutation '),
+    )),
+    'RcsbPolymerEntityFeatureAdditionalProperties': ('', (
+        ('name', None, False, 'The additional property name.  Allowable values: CARD_MODEL_DESCRIPTION, CARD_MODEL_ORGANISM, PARENT_COMP_ID '),
+        ('values', None, False, 'The value(s) of the additional property.'),
+    )),
+    'RcsbPolymerEntityFeatureFeaturePositions': ('', (
+        ('beg_comp_id', None, False, 'An identifier for the leading monomer corresponding to the feature assignment.  Examples: TRP, VAL '),
+        ('beg_seq_id', None, False, 'An identifier for the monomer at which this segment of the feature begins.'),
+        ('end_seq_id', None, False, 'An identifier for the monomer at which this segment of the feature ends.'),
+        ('value', None, False, 'The value for the feature over this monomer segment.  Examples: null, null '),
+        ('values', None, False, 'The value(s) for the feature over this monomer segment.'),
+    )),
+    'RcsbPolymerEntityFeatureSummary': ('', (
+        ('count', None, False, 'The feature count.'),
+        ('coverage', None, False, 'The fractional feature coverage relative to the full entity sequence.  For instance, the fraction of features such as mutations, artifacts or modified monomers  relative to the length of the entity sequence.  Examples: null, null '),
+        ('maximum_length', None, False, 'The maximum feature length.'),
+        ('maximum_value', None, False, 'The maximum feature value.  Examples: null, null '),
+        ('minimum_length', None, False, 'The minimum feature length.'),
+        ('minimum_value', None, False, 'The minimum feature value.  Examples: null, null '),
+        ('type', None, False, 'Type or category of the feature.  Allowable values: CARD_MODEL, IMGT_ANTIBODY_DESCRIPTION, IMGT_ANTIBODY_DOMAIN_NAME, IMGT_ANTIBODY_GENE_ALLELE_NAME, IMGT_ANTIBODY_ORGANISM_NAME, IMGT_ANTIBODY_PROTEIN_NAME, IMGT_ANTIBODY_RECEPTOR_DESCRIPTION, IMGT_ANTIBODY_RECEPTOR_TYPE, Pfam, SABDAB_ANTIBODY_ANTIGEN_NAME, SABDAB_ANTIBODY_NAME, SABDAB_ANTIBODY_TARGET, artifact, modified_monomer, mutation '),
+    )),
+    'RcsbPolymerEntityGroupMembersRankings': ('', (
+        ('group_members', 'RcsbPolymerEntityGroupMembersRankingsGroupMembers', False, ''),
+        ('ranking_criteria_type', None, False, 'Defines ranking option applicable to group members  Allowable values: coverage '),
+    )),
+    'RcsbPolymerEntityGroupMembersRankingsGroupMembers': ('', (
+        ('member_id', None, False, ''),
+        ('original_score', None, False, 'Quantifies the criteria used for ranking'),
+        ('rank', None, False, 'Reflects a relationship between group members such that, for any two members the first is ranked higher (smaller rank value) than the second'),
+    )),
+    'RcsbPolymerEntityGroupMembership': ('', (
+        ('aggregation_method', None, False, 'Method used to establish group membership  Allowable values: matching_uniprot_accession, sequence_identity '),
+        ('aligned_regions', 'RcsbPolymerEntityGroupMembershipAlignedRegions', False, ''),
+        ('group_id', None, False, 'A unique identifier for a group of entities  Examples: 1_100, P00003 '),
+        ('similarity_cutoff', None, False, 'Degree of similarity expressed as a floating-point number'),
+    )),
+    'RcsbPolymerEntityGroupMembershipAlignedRegions': ('', (
+        ('entity_beg_seq_id', None, False, 'An identifier for the monomer in the entity sequence at which this segment of the alignment begins.'),
+        ('length', None, False, 'The length of this segment of the alignment.'),
+        ('ref_beg_seq_id', None, False, 'An identifier for the monomer in the reference sequence at which this segment of the alignment begins.'),
+    )),
+    'RcsbPolymerEntityGroupSequenceAlignment': ('', (
+        ('abstract_reference', 'RcsbPolymerEntityGroupSequenceAlignmentAbstractReference', False, 'Abstract reference where group members can be aligned to generate a MSA'),
+        ('group_members_alignment', 'RcsbPolymerEntityGroupSequenceAlignmentGroupMembersAlignment', False, 'Alignment with a core_entity canonical sequence'),
+    )),
+    'RcsbPolymerEntityGroupSequenceAlignmentAbstractReference': ('', (
+        ('length', None, False, 'Abstract reference length'),
+        ('sequence', None, False, 'Sequence that represents the abstract reference'),
+    )),
+    'RcsbPolymerEntityGroupSequenceAlignmentGroupMembersAlignment': ('', (
+        ('aligned_regions', None, False, 'Alignment region encoded as a triplet [query_begin, target_begin, length]'),
+        ('member_id', None, False, ''),
+        ('scores', 'GroupMembersAlignmentScores', False, 'Alignment scores'),
+    )),
+    'RcsbPolymerEntityInstanceContainerIdentifiers': ('', (
+        ('asym_id', None, False, 'Instance identifier for this container.'),
+        ('auth_asym_id', None, False, 'Author instance identifier for this container.'),
+        ('auth_to_entity_poly_seq_mapping', None, False, "Residue index mappings between author provided and entity polymer sequence positions.   Author residue indices (auth_seq_num) include insertion codes when present.  The array indices correspond to the indices (1-based) of the deposited sample  sequence (entity_poly_seq). Unmodelled residues are represented with a '?' value."),
+        ('entity_id', None, False, 'Entity identifier for the container.'),
+        ('entry_id', None, False, 'Entry identifier for the container.'),
+        ('rcsb_id', None, False, "A unique identifier for each object in this entity instance container formed by  an 'dot' (.) separated concatenation of entry and entity instance identifiers.  Examples: 1KIP.A "),
+    )),
+    'RcsbPolymerEntityKeywords': ('', (
+        ('text', None, False, 'Keywords describing this polymer entity.'),
+    )),
+    'RcsbPolymerEntityNameCom': ('', (
+        ('name', None, False, 'A common name for the polymer entity.  Examples: HIV protease monomer, hemoglobin alpha chain '),
+    )),
+    'RcsbPolymerEntityNameSys': ('', (
+        ('name', None, False, 'The systematic name for the polymer entity.'),
+        ('system', None, False, 'The system used to generate the systematic name of the polymer entity.  Examples: Chemical Abstracts conventions '),
+    )),
+    'RcsbPolymerEntityRcsbEcLineage': ('', (
+        ('depth', None, False, 'Members of the enzyme classification lineage as parent classification hierarchy depth (1-N).'),
+        ('id', None, False, 'Members of the enzyme classification lineage as parent classification codes.  Examples: 2, 2.7.1.153 '),
+        ('name', None, False, 'Members of the enzyme classification lineage as parent classification names.  Examples: Transferases, phosphatidylinositol-4,5-bisphosphate 3-kinase '),
+    )),
+    'RcsbPolymerEntityRcsbEnzymeClassCombined': ('', (
+        ('depth', None, False, 'The enzyme classification hierarchy depth (1-N).'),
+        ('ec', None, False, 'Combined list of enzyme class assignments.'),
+        ('provenance_source', None, False, 'Combined list of enzyme class associated provenance sources.  Allowable values: PDB Primary Data, UniProt '),
+    )),
+    'RcsbPolymerEntityRcsbMacromolecularNamesCombined': ('', (
+        ('name', None, False, 'Combined list of macromolecular names.  Examples: Lysozyme C, Plasmid recombination enzyme, Pyruvate carboxylase '),
+        ('provenance_code', None, False, 'Combined list of macromolecular names associated provenance code.   ECO (https://github.com/evidenceontology/evidenceontology)'),
+        ('provenance_source', None, False, 'Combined list of macromolecular names associated name source.  Allowable values: PDB Preferred Name, PDB Synonym '),
+    )),
+    'RcsbPolymerEntityRcsbPolymerNameCombined': ('', (
+        ('names', None, False, 'Protein name annotated by the UniProtKB or macromolecular name assigned by the PDB.'),
+        ('provenance_source', None, False, 'Provenance source for the combined protein names.  Allowable values: PDB Description, PDB Preferred Name, UniProt Name '),
+    )),
+    'RcsbPolymerInstanceAnnotation': ('', (
+        ('annotation_id', None, False, 'An identifier for the annotation.'),
+        ('annotation_lineage', 'RcsbPolymerInstanceAnnotationAnnotationLineage', False, ''),
+        ('assignment_version', None, False, 'Identifies the version of the annotation assignment.  Examples: V4_0_2 '),
+        ('description', None, False, 'A description for the annotation.'),
+        ('name', None, False, 'A name for the annotation.'),
+        ('ordinal', None, False, 'Ordinal identifier for this category'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that  assigned the annotation.  Examples: PDB '),
+        ('type', None, False, 'A type or category of the annotation.  Allowable values: CATH, ECOD, GlyGen, SCOP, SCOP2 '),
+    )),
+    'RcsbPolymerInstanceAnnotationAnnotationLineage': ('', (
+        ('depth', None, False, 'Members of the annotation lineage as parent lineage depth (1-N)'),
+        ('id', None, False, 'Members of the annotation lineage as parent class identifiers.'),
+        ('name', None, False, 'Members of the annotation lineage as parent class names.'),
+    )),
+    'RcsbPolymerInstanceFeature': ('', (
+        ('additional_properties', 'RcsbPolymerInstanceFeatureAdditionalProperties', False, ''),
+        ('assignment_version', None, False, 'Identifies the version of the feature assignment.  Examples: V4_0_2 '),
+        ('description', None, False, 'A description for the feature.'),
+        ('feature_id', None, False, 'An identifier for the feature.'),
+        ('feature_positions', 'RcsbPolymerInstanceFeatureFeaturePositions', False, ''),
+        ('name', None, False, 'A name for the feature.'),
+        ('ordinal', None, False, 'Ordinal identifier for this category'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that  assigned the feature.  Examples: CATH, SCOP '),
+        ('reference_scheme', None, False, 'Code residue coordinate system for the assigned feature.  Allowable values: NCBI, PDB entity, PDB entry, UniProt '),
+        ('type', None, False, 'A type or category of the feature.  Allowable values: ANGLE_OUTLIER, ANGLE_OUTLIERS, ASA, AVERAGE_OCCUPANCY, BEND, BINDING_SITE, BOND_OUTLIER, BOND_OUTLIERS, C-MANNOSYLATION_SITE, CATH, CHIRAL_OUTLIERS, CIS-PEPTIDE, CLASHES, ECOD, HELIX_P, HELX_LH_PP_P, HELX_RH_3T_P, HELX_RH_AL_P, HELX_RH_PI_P, LIGAND_COVALENT_LINKAGE, LIGAND_INTERACTION, LIGAND_METAL_COORDINATION_LINKAGE, MA_QA_METRIC_LOCAL_TYPE_CONTACT_PROBABILITY, MA_QA_METRIC_LOCAL_TYPE_DISTANCE, MA_QA_METRIC_LOCAL_TYPE_ENERGY, MA_QA_METRIC_LOCAL_TYPE_IPTM, MA_QA_METRIC_LOCAL_TYPE_NORMALIZED_SCORE, MA_QA_METRIC_LOCAL_TYPE_OTHER, MA_QA_METRIC_LOCAL_TYPE_PAE, MA_QA_METRIC_LOCAL_TYPE_PLDDT, MA_QA_METRIC_LOCAL_TYPE_PLDDT_ALL-ATOM, MA_QA_METRIC_LOCAL_TYPE_PLDDT_ALL-ATOM_[0,1], MA_QA_METRIC_LOCAL_TYPE_PLDDT_[0,1], MA_QA_METRIC_LOCAL_TYPE_PTM, MA_QA_METRIC_LOCAL_TYPE_ZSCORE, MEMBRANE_SEGMENT, MOGUL_ANGLE_OUTLIER, MOGUL_ANGLE_OUTLIERS, MOGUL_BOND_OUTLIER, MOGUL_BOND_OUTLIERS, MOGUL_RING_OUTLIERS, MOGUL_TORSION_OUTLIERS, N-GLYCOSYLATION_SITE, NATOMS_EDS, O-GLYCOSYLATION_SITE, OWAB, PLANE_OUTLIERS, Q_SCORE, RAMACHANDRAN_OUTLIER, ROTAMER_OUTLIER, RSCC, RSCC_OUTLIER, RSR, RSRZ, RSRZ_OUTLIER, S-GLYCOSYLATION_SITE, SABDAB_ANTIBODY_HEAVY_CHAIN_SUBCLASS, SABDAB_ANTIBODY_LIGHT_CHAIN_SUBCLASS, SABDAB_ANTIBODY_LIGHT_CHAIN_TYPE, SCOP, SCOP2B_SUPERFAMILY, SCOP2_FAMILY, SCOP2_SUPERFAMILY, SHEET, STEREO_OUTLIER, STRN, SYMM_CLASHES, TURN_TY1_P, UNASSIGNED_SEC_STRUCT, UNOBSERVED_ATOM_XYZ, UNOBSERVED_RESIDUE_XYZ, ZERO_OCCUPANCY_ATOM_XYZ, ZERO_OCCUPANCY_RESIDUE_XYZ '),
+    )),
+    'RcsbPolymerInstanceFeatureAdditionalProperties': ('', (
+        ('name', None, False, 'The additional property name.  Allowable values: CATH_DOMAIN_ID, CATH_NAME, ECOD_DOMAIN_ID, ECOD_FAMILY_NAME, MODELCIF_MODEL_ID, OMEGA_ANGLE, PARTNER_ASYM_ID, PARTNER_BOND_DISTANCE, PARTNER_COMP_ID, PDB_MODEL_NUM, SCOP2_DOMAIN_ID, SCOP2_FAMILY_ID, SCOP2_FAMILY_NAME, SCOP2_SUPERFAMILY_ID, SCOP2_SUPERFAMILY_NAME, SCOP_DOMAIN_ID, SCOP_NAME, SCOP_SUN_ID, SHEET_SENSE '),
+        ('values', None, False, 'The value(s) of the additional property.'),
+    )),
+    'RcsbPolymerInstanceFeatureFeaturePositions': ('', (
+        ('beg_comp_id', None, False, 'An identifier for the monomer(s) corresponding to the feature assignment.  Examples: TRP, VAL '),
+        ('beg_seq_id', None, False, 'An identifier for the monomer at which this segment of the feature begins.'),
+        ('end_seq_id', None, False, 'An identifier for the monomer at which this segment of the feature ends.'),
+        ('value', None, False, 'The value of the feature over the monomer segment.  Examples: null, null '),
+        ('values', None, False, 'The value(s) of the feature over the monomer segment.'),
+    )),
+    'RcsbPolymerInstanceFeatureSummary': ('', (
+        ('count', None, False, 'The feature count per polymer chain.'),
+        ('coverage', None, False, 'The fractional feature coverage relative to the full entity sequence.  Examples: null, null '),
+        ('maximum_length', None, False, 'The maximum feature length.'),
+        ('maximum_value', None, False, 'The maximum feature value.  Examples: null, null '),
+        ('minimum_length', None, False, 'The minimum feature length.'),
+        ('minimum_value', None, False, 'The minimum feature value.  Examples: null, null '),
+        ('type', None, False, 'Type or category of the feature.  Allowable values: ANGLE_OUTLIER, ANGLE_OUTLIERS, AVERAGE_OCCUPANCY, BEND, BINDING_SITE, BOND_OUTLIER, BOND_OUTLIERS, C-MANNOSYLATION_SITE, CATH, CHIRAL_OUTLIERS, CIS-PEPTIDE, CLASHES, ECOD, HELIX_P, HELX_LH_PP_P, HELX_RH_3T_P, HELX_RH_AL_P, HELX_RH_PI_P, LIGAND_COVALENT_LINKAGE, LIGAND_INTERACTION, LIGAND_METAL_COORDINATION_LINKAGE, MA_QA_METRIC_LOCAL_TYPE_CONTACT_PROBABILITY, MA_QA_METRIC_LOCAL_TYPE_DISTANCE, MA_QA_METRIC_LOCAL_TYPE_ENERGY, MA_QA_METRIC_LOCAL_TYPE_IPTM, MA_QA_METRIC_LOCAL_TYPE_NORMALIZED_SCORE, MA_QA_METRIC_LOCAL_TYPE_OTHER, MA_QA_METRIC_LOCAL_TYPE_PAE, MA_QA_METRIC_LOCAL_TYPE_PLDDT, MA_QA_METRIC_LOCAL_TYPE_PLDDT_ALL-ATOM, MA_QA_METRIC_LOCAL_TYPE_PLDDT_ALL-ATOM_[0,1], MA_QA_METRIC_LOCAL_TYPE_PLDDT_[0,1], MA_QA_METRIC_LOCAL_TYPE_PTM, MA_QA_METRIC_LOCAL_TYPE_ZSCORE, MEMBRANE_SEGMENT, MOGUL_ANGLE_OUTLIER, MOGUL_ANGLE_OUTLIERS, MOGUL_BOND_OUTLIER, MOGUL_BOND_OUTLIERS, MOGUL_RING_OUTLIERS, MOGUL_TORSION_OUTLIERS, N-GLYCOSYLATION_SITE, NATOMS_EDS, O-GLYCOSYLATION_SITE, OWAB, PLANE_OUTLIERS, Q_SCORE, RAMACHANDRAN_OUTLIER, ROTAMER_OUTLIER, RSCC, RSCC_OUTLIER, RSR, RSRZ, RSRZ_OUTLIER, S-GLYCOSYLATION_SITE, SABDAB_ANTIBODY_HEAVY_CHAIN_SUBCLASS, SABDAB_ANTIBODY_LIGHT_CHAIN_SUBCLASS, SABDAB_ANTIBODY_LIGHT_CHAIN_TYPE, SCOP, SCOP2B_SUPERFAMILY, SCOP2_FAMILY, SCOP2_SUPERFAMILY, SHEET, STEREO_OUTLIER, STRN, SYMM_CLASHES, TURN_TY1_P, UNASSIGNED_SEC_STRUCT, UNOBSERVED_ATOM_XYZ, UNOBSERVED_RESIDUE_XYZ, ZERO_OCCUPANCY_ATOM_XYZ, ZERO_OCCUPANCY_RESIDUE_XYZ '),
+    )),
+    'RcsbPolymerInstanceInfo': ('', (
+        ('modeled_residue_count', None, False, 'The number of modeled residues in the polymer instance.'),
+    )),
+    'RcsbPolymerStructConn': ('', (
+        ('connect_partner', 'RcsbPolymerStructConnConnectPartner', False, ''),
+        ('connect_target', 'RcsbPolymerStructConnConnectTarget', False, ''),
+        ('connect_type', None, False, 'The connection type.  Allowable values: covalent bond, covalent modification of a nucleotide base, covalent modification of a nucleotide phosphate, covalent modification of a nucleotide sugar, covalent residue modification, disulfide bridge, hydrogen bond, ionic interaction, metal coordination, mismatched base pairs '),
+        ('description', None, False, 'A description of special details of the connection.  Examples: Watson-Crick base pair '),
+        ('dist_value', None, False, 'Distance value for this contact.'),
+        ('id', None, False, 'The value of _rcsb_polymer_struct_conn.id is an identifier for connection.   Note that this item need not be a number; it can be any unique  identifier.'),
+        ('ordinal_id', None, False, 'The value of _rcsb_polymer_struct_conn.id must uniquely identify a record in  the rcsb_polymer_struct_conn list.'),
+        ('role', None, False, 'The chemical or structural role of the interaction  Allowable values: C-Mannosylation, N-Glycosylation, O-Glycosylation, S-Glycosylation '),
+        ('value_order', None, False, 'The chemical bond order associated with the specified atoms in  this contact.  Allowable values: doub, quad, sing, trip '),
+    )),
+    'RcsbPolymerStructConnConnectPartner': ('', (
+        ('label_alt_id', None, False, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category.'),
+        ('label_asym_id', None, False, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category.'),
+        ('label_atom_id', None, False, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _chem_comp_atom.atom_id in the  CHEM_COMP_ATOM category.'),
+        ('label_comp_id', None, False, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category.'),
+        ('label_seq_id', None, False, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_seq_id in the  ATOM_SITE category.'),
+        ('symmetry', None, False, 'Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_polymer_struct_conn.connect_partner_label* to generate the  partner in the structure connection.  Examples: 1_555, 7_645 '),
+    )),
+    'RcsbPolymerStructConnConnectTarget': ('', (
+        ('auth_asym_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_asym_id in the  ATOM_SITE category.'),
+        ('auth_seq_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_seq_id in the  ATOM_SITE category.'),
+        ('label_alt_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category.'),
+        ('label_asym_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category.'),
+        ('label_atom_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_atom_id in the  ATOM_SITE category.'),
+        ('label_comp_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category.'),
+        ('label_seq_id', None, False, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.connect_target_label_seq_id in the  ATOM_SITE category.'),
+        ('symmetry', None, False, 'Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_polymer_struct_conn.label* to generate the  target of the structure connection.  Examples: 1_555, 7_645 '),
+    )),
+    'RcsbPrimaryCitation': ('', (
+        ('book_id_ISBN', None, False, 'The International Standard Book Number (ISBN) code assigned to  the book cited; relevant for books or book chapters.'),
+        ('book_publisher', None, False, 'The name of the publisher of the citation; relevant  for books or book chapters.  Examples: John Wiley and Sons '),
+        ('book_publisher_city', None, False, 'The location of the publisher of the citation; relevant  for books or book chapters.  Examples: London '),
+        ('book_title', None, False, 'The title of the book in which the citation appeared; relevant  for books or book chapters.'),
+        ('coordinate_linkage', None, False, "_rcsb_primary_citation.coordinate_linkage states whether this citation  is concerned with precisely the set of coordinates given in the  data block. If, for instance, the publication described the same  structure, but the coordinates had undergone further refinement  prior to the creation of the data block, the value of this data  item would be 'no'.  Allowable values: n, no, y, yes "),
+        ('country', None, False, 'The country/region of publication; relevant for books  and book chapters.'),
+        ('id', None, False, "The value of _rcsb_primary_citation.id must uniquely identify a record in the  CITATION list.   The _rcsb_primary_citation.id 'primary' should be used to indicate the  citation that the author(s) consider to be the most pertinent to  the contents of the data block.   Note that this item need not be a number; it can be any unique  identifier.  Examples: primary "),
+        ('journal_abbrev', None, False, 'Abbreviated name of the cited journal as given in the  Chemical Abstracts Service Source Index.  Examples: J.Mol.Biol., J. Mol. Biol. '),
+        ('journal_id_ASTM', None, False, 'The American Society for Testing and Materials (ASTM) code  assigned to the journal cited (also referred to as the CODEN  designator of the Chemical Abstracts Service); relevant for  journal articles.'),
+        ('journal_id_CSD', None, False, 'The Cambridge Structural Database (CSD) code assigned to the  journal cited; relevant for journal articles. This is also the  system used at the Protein Data Bank (PDB).  Examples: 0070 '),
+        ('journal_id_ISSN', None, False, 'The International Standard Serial Number (ISSN) code assigned to  the journal cited; relevant for journal articles.'),
+        ('journal_issue', None, False, 'Issue number of the journal cited; relevant for journal  articles.  Examples: 2 '),
+        ('journal_volume', None, False, 'Volume number of the journal cited; relevant for journal  articles.  Examples: 174 '),
+        ('language', None, False, 'Language in which the cited article is written.  Examples: German '),
+        ('page_first', None, False, 'The first page of the citation; relevant for journal  articles, books and book chapters.'),
+        ('page_last', None, False, 'The last page of the citation; relevant for journal  articles, books and book chapters.'),
+        ('pdbx_database_id_DOI', None, False, 'Document Object Identifier used by doi.org to uniquely  specify bibliographic entry.  Examples: 10.2345/S1384107697000225 '),
+        ('pdbx_database_id_PubMed', None, False, 'Ascession number used by PubMed to categorize a specific  bibliographic entry.'),
+        ('rcsb_ORCID_identifiers', None, False, 'The Open Researcher and Contributor ID (ORCID) identifiers for the citation authors.'),
+        ('rcsb_authors', None, False, 'Names of the authors of the citation; relevant for journal  articles, books and book chapters.  Names are separated by vertical bars.   The family name(s), followed by a comma and including any  dynastic components, precedes the first name(s) or initial(s).'),
+        ('rcsb_journal_abbrev', None, False, 'Normalized journal abbreviation.  Examples: Nat Struct Mol Biol '),
+        ('title', None, False, 'The title of the citation; relevant for journal articles, books  and book chapters.  Examples: Structure of diferric duck ovotransferrin                                   at 2.35 Angstroms resolution. '),
+        ('year', None, False, 'The year of the citation; relevant for journal articles, books  and book chapters.'),
+    )),
+    'RcsbPubmedContainerIdentifiers': ('', (
+        ('pubmed_id', None, False, 'UID assigned to each PubMed record.  Examples: null '),
+    )),
+    'RcsbPubmedMeshDescriptorsLineage': ('', (
+        ('depth', None, False, 'Hierarchy depth.'),
+        ('id', None, False, 'Identifier for MeSH classification term.  Examples: E01.370.225.500.388, H01.181 '),
+        ('name', None, False, 'MeSH classification term.  Examples: Chemistry, Mammals, Therapeutic Uses '),
+    )),
+    'RcsbRelatedTargetReferences': ('', (
+        ('aligned_target', 'RcsbRelatedTargetReferencesAlignedTarget', False, ''),
+        ('related_resource_name', None, False, 'The related target data resource name.  Allowable values: ChEMBL, DrugBank, Pharos '),
+        ('related_resource_version', None, False, 'The version of the target data resource.  Examples: 6.11.0 '),
+        ('related_target_id', None, False, 'An identifier for the target sequence in the related data resource.'),
+        ('target_taxonomy_id', None, False, 'NCBI Taxonomy identifier for the target organism.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18.'),
+    )),
+    'RcsbRelatedTargetReferencesAlignedTarget': ('', (
+        ('entity_beg_seq_id', None, False, 'The position of the monomer in the entity sequence at which the alignment begins.'),
+        ('length', None, False, 'The length of the alignment.'),
+        ('target_beg_seq_id', None, False, 'The position of the monomer in the target sequence at which the alignment begins.'),
+    )),
+    'RcsbRepositoryHoldingsCurrent': ('', (
+        ('repository_content_types', None, False, 'The list of content types associated with this entry.  Allowable values: 2fo-fc Map, Combined NMR data (NEF), Combined NMR data (NMR-STAR), FASTA sequence, Map Coefficients, NMR chemical shifts, NMR restraints V1, NMR restraints V2, assembly PDB, assembly mmCIF, entry PDB, entry PDB bundle, entry PDBML, entry mmCIF, fo-fc Map, structure factors, validation 2fo-fc coefficients, validation data mmCIF, validation fo-fc coefficients, validation report, validation slider image '),
+    )),
+    'RcsbRepositoryHoldingsCurrentEntryContainerIdentifiers': ('', (
+        ('assembly_ids', None, False, 'The assembly id codes.'),
+        ('entry_id', None, False, 'The PDB entry accession code.  Examples: 1KIP '),
+        ('rcsb_id', None, False, 'The RCSB entry identifier.  Examples: 1KIP '),
+        ('update_id', None, False, 'Identifier for the current data exchange status record.  Examples: 2018_23 '),
+    )),
+    'RcsbSchemaContainerIdentifiers': ('', (
+        ('collection_name', None, False, 'Collection name associated with the data in the container.'),
+        ('collection_schema_version', None, False, 'Version string for the schema and collection.'),
+        ('schema_name', None, False, 'Schema name associated with the data in the container.'),
+    )),
+    'RcsbStructSymmetry': ('', (
+        ('clusters', 'RcsbStructSymmetryClusters', False, 'Clusters describe grouping of identical subunits.'),
+        ('kind', None, False, "The granularity at which the symmetry calculation is performed. In 'Global Symmetry' all polymeric  subunits in assembly are used. In 'Local Symmetry' only a subset of polymeric subunits is considered.  In 'Pseudo Symmetry' the threshold for subunits similarity is relaxed.  Allowable values: Global Symmetry, Local Symmetry, Pseudo Symmetry "),
+        ('oligomeric_state', None, False, "Oligomeric state refers to a composition of polymeric subunits in quaternary structure.  Quaternary structure may be composed either exclusively of several copies of identical subunits,  in which case they are termed homo-oligomers, or alternatively by at least one copy of different  subunits (hetero-oligomers). Quaternary structure composed of a single subunit is denoted as 'Monomer'.  Examples: Homo 2-mer, Homo 2-mer, Hetero 3-mer "),
+        ('rotation_axes', 'RcsbStructSymmetryRotationAxes', False, 'The orientation of the principal rotation (symmetry) axis.'),
+        ('stoichiometry', None, False, 'Stoichiometry of a complex represents the quantitative description and composition of its subunits.'),
+        ('symbol', None, False, 'Symmetry symbol refers to point group or helical symmetry of identical polymeric subunits in Schoenflies notation.  Contains point group symbol (e.g., C2, C5, D2, T, O, I) or H for helical symmetry.  Examples: C1, D3, N '),
+        ('type', None, False, 'Symmetry type refers to point group or helical symmetry of identical polymeric subunits.  Contains point group types (e.g. Cyclic, Dihedral) or Helical for helical symmetry.  Allowable values: Asymmetric, Cyclic, Dihedral, Helical, Icosahedral, Octahedral, Tetrahedral '),
+    )),
+    'RcsbStructSymmetryClusters': ('', (
+        ('avg_rmsd', None, False, 'Average RMSD between members of a given cluster.'),
+        ('members', 'ClustersMembers', False, 'Subunits that belong to the cluster, identified by asym_id and optionally by assembly operator id(s).'),
+    )),
+    'RcsbStructSymmetryLineage': ('', (
+        ('depth', None, False, 'Hierarchy depth.'),
+        ('id', None, False, 'Automatically assigned ID to uniquely identify the symmetry term in the Protein Symmetry Browser.  Examples: Global Symmetry.Cyclic.C2.Homo 2-mer '),
+        ('name', None, False, 'A human-readable term describing protein symmetry.  Examples: Asymmetric, Global Symmetry, C1, Hetero 3-mer '),
+    )),
+    'RcsbStructSymmetryRotationAxes': ('', (
+        ('end', None, False, 'coordinate'),
+        ('order', None, False, 'The number of times (order of rotation) that a subunit can be repeated by a rotation operation,  being transformed into a new state indistinguishable from its starting state.'),
+        ('start', None, False, 'coordinate'),
+    )),
+    'RcsbTargetCofactors': ('', (
+        ('binding_assay_value', None, False, 'The value measured or determined by the assay.  Examples: null '),
+        ('binding_assay_value_type', None, False, 'The type of measurement or value determined by the assay.  Allowable values: pAC50, pEC50, pIC50, pKd, pKi '),
+        ('cofactor_InChIKey', None, False, 'Standard IUPAC International Chemical Identifier (InChI) descriptor key  for the cofactor.   InChI, the IUPAC International Chemical Identifier,  by Stephen R Heller, Alan McNaught, Igor Pletnev, Stephen Stein and Dmitrii Tchekhovskoi,  Journal of Cheminformatics, 2015, 7:23  Examples: BNOCDEBUFVJMQI-REOHCLBHSA-N '),
+        ('cofactor_SMILES', None, False, "Simplified molecular-input line-entry system (SMILES) descriptor for the cofactor.     Weininger D (February 1988). 'SMILES, a chemical language and information system. 1.    Introduction to methodology and encoding rules'. Journal of Chemical Information and Modeling. 28 (1): 31-6.     Weininger D, Weininger A, Weininger JL (May 1989).    'SMILES. 2. Algorithm for generation of unique SMILES notation',    Journal of Chemical Information and Modeling. 29 (2): 97-101.  Examples: OC(=O)[CH](CF)O[P](O)(O)=O "),
+        ('cofactor_chem_comp_id', None, False, 'The chemical component definition identifier for the cofactor.  Examples: 0Z3, CD9 '),
+        ('cofactor_description', None, False, 'The cofactor description.  Examples: A synthetic naphthoquinone without the isoprenoid side chain and biological activity,   but can be converted to active vitamin K2, menaquinone, after alkylation in vivo. '),
+        ('cofactor_name', None, False, 'The cofactor name.  Examples: Menadione '),
+        ('cofactor_prd_id', None, False, 'The BIRD definition identifier for the cofactor.  Examples: PRD_000010 '),
+        ('cofactor_resource_id', None, False, 'Identifier for the cofactor assigned by the resource.  Examples: CHEMBL1987, DB00170 '),
+        ('mechanism_of_action', None, False, 'Mechanism of action describes the biochemical interaction through which the  cofactor produces a pharmacological effect.  Examples: Menadione (vitamin K3) is involved as a cofactor in the posttranslational gamma-carboxylation of glutamic acid residues of certain proteins i n the body. These proteins include the vitamin K-dependent coagulation factors II (prothrombin), VII (proconvertin), IX (Christmas factor), X (Stuart factor), protein C, protein S, protein Zv and a growth-arrest-specific factor (Gas6). '),
+        ('neighbor_flag', None, False, 'A flag to indicate the cofactor is a structural neighbor of this  entity.  Allowable values: N, Y '),
+        ('patent_nos', None, False, 'Patent numbers reporting the pharmacology or activity data.'),
+        ('pubmed_ids', None, False, 'PubMed identifiers for literature supporting the pharmacology or activity data.'),
+        ('resource_name', None, False, 'Resource providing target and cofactor data.  Allowable values: ChEMBL, DrugBank, Pharos '),
+        ('resource_version', None, False, 'Version of the information distributed by the data resource.  Examples: V4_0_2 '),
+        ('target_resource_id', None, False, 'Identifier for the target assigned by the resource.  Examples: P00734, CHEMBL2242 '),
+    )),
+    'RcsbTargetNeighbors': ('', (
+        ('alt_id', None, False, 'Alternate conformer identifier for the non-polymer entity instance.'),
+        ('atom_id', None, False, 'The atom identifier for the non-polymer entity instance.  Examples: O1, N1, C1 '),
+        ('comp_id', None, False, 'Component identifier for the non-polymer entity instance.'),
+        ('distance', None, False, 'Distance value for this target interaction.'),
+        ('target_asym_id', None, False, 'The entity instance identifier for the target of interaction.  Examples: A, B '),
+        ('target_atom_id', None, False, 'The atom identifier for the target of interaction.  Examples: OG, OE1, CD1 '),
+        ('target_auth_seq_id', None, False, 'The author residue index for the target of interaction.'),
+        ('target_comp_id', None, False, 'The chemical component identifier for the target of interaction.  Examples: ASN, TRP, SER '),
+        ('target_entity_id', None, False, 'The entity identifier for the target of interaction.  Examples: 1, 2 '),
+        ('target_is_bound', None, False, 'A flag to indicate the nature of the target interaction is covalent or metal-coordination.  Allowable values: N, Y '),
+        ('target_model_id', None, False, 'Model identifier for the target of interaction.'),
+        ('target_seq_id', None, False, 'The sequence position for the target of interaction.'),
+    )),
+    'RcsbUniprotAlignments': ('', (
+        ('core_entity_alignments', 'RcsbUniprotAlignmentsCoreEntityAlignments', False, 'List of alignments with core_entity canonical sequences'),
+    )),
+    'RcsbUniprotAlignmentsCoreEntityAlignments': ('', (
+        ('aligned_regions', 'CoreEntityAlignmentsAlignedRegions', False, 'Aligned region'),
+        ('core_entity_identifiers', 'CoreEntityAlignmentsCoreEntityIdentifiers', False, 'core_entity identifiers'),
+        ('scores', 'CoreEntityAlignmentsScores', False, 'Alignment scores'),
+    )),
+    'RcsbUniprotAnnotation': ('', (
+        ('additional_properties', 'RcsbUniprotAnnotationAdditionalProperties', False, ''),
+        ('annotation_id', None, False, 'An identifier for the annotation.'),
+        ('annotation_lineage', 'RcsbUniprotAnnotationAnnotationLineage', False, ''),
+        ('assignment_version', None, False, 'Identifies the version of the annotation assignment.'),
+        ('description', None, False, 'A description for the annotation.'),
+        ('name', None, False, 'A name for the annotation.'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that  assigned the annotation.'),
+        ('type', None, False, 'A type or category of the annotation.  Allowable values: disease, phenotype, GO, InterPro '),
+    )),
+    'RcsbUniprotAnnotationAdditionalProperties': ('', (
+        ('name', None, False, 'The additional property name  Allowable values: INTERPRO_TYPE '),
+        ('values', None, False, 'The value(s) of the additional property'),
+    )),
+    'RcsbUniprotAnnotationAnnotationLineage': ('', (
+        ('depth', None, False, 'Members of the annotation lineage as parent lineage depth (1-N)'),
+        ('id', None, False, 'Members of the annotation lineage as parent class identifiers.'),
+        ('name', None, False, 'Members of the annotation lineage as parent class names.'),
+    )),
+    'RcsbUniprotContainerIdentifiers': ('', (
+        ('reference_sequence_identifiers', 'RcsbUniprotContainerIdentifiersReferenceSequenceIdentifiers', False, ''),
+        ('uniprot_id', None, False, 'Primary accession number of a given UniProtKB entry.'),
+    )),
+    'RcsbUniprotContainerIdentifiersReferenceSequenceIdentifiers': ('', (
+        ('database_accession', None, False, 'Reference database accession code'),
+        ('database_isoform', None, False, 'Reference database identifier for the sequence isoform'),
+        ('database_name', None, False, 'Reference database name'),
+        ('provenance_source', None, False, 'Source of the reference database assignment'),
+    )),
+    'RcsbUniprotExternalReference': ('', (
+        ('provenance_source', None, False, ''),
+        ('reference_id', None, False, ''),
+        ('reference_name', None, False, 'Allowable values: IMPC, GTEX, PHAROS.'),
+    )),
+    'RcsbUniprotFeature': ('', (
+        ('assignment_version', None, False, 'Identifies the version of the feature assignment.'),
+        ('description', None, False, 'A description for the feature.'),
+        ('feature_id', None, False, 'An identifier for the feature.'),
+        ('feature_positions', 'RcsbUniprotFeatureFeaturePositions', False, ''),
+        ('name', None, False, 'A name for the feature.'),
+        ('provenance_source', None, False, 'Code identifying the individual, organization or program that  assigned the feature.'),
+        ('reference_scheme', None, False, 'Code residue coordinate system for the assigned feature.'),
+        ('type', None, False, 'A type or category of the feature.  Allowable values: ACTIVE_SITE, BINDING_SITE, CALCIUM_BINDING_REGION, CHAIN, COMPOSITIONALLY_BIASED_REGION, CROSS_LINK, DNA_BINDING_REGION, DOMAIN, GLYCOSYLATION_SITE, INITIATOR_METHIONINE, LIPID_MOIETY_BINDING_REGION, METAL_ION_BINDING_SITE, MODIFIED_RESIDUE, MUTAGENESIS_SITE, NON_CONSECUTIVE_RESIDUES, NON_TERMINAL_RESIDUE, NUCLEOTIDE_PHOSPHATE_BINDING_REGION, PEPTIDE, PROPEPTIDE, REGION_OF_INTEREST, REPEAT, NON_STANDARD_AMINO_ACID, SEQUENCE_CONFLICT, SEQUENCE_VARIANT, SHORT_SEQUENCE_MOTIF, SIGNAL_PEPTIDE, SITE, SPLICE_VARIANT, TOPOLOGICAL_DOMAIN, TRANSIT_PEPTIDE, TRANSMEMBRANE_REGION, UNSURE_RESIDUE, ZINC_FINGER_REGION, INTRAMEMBRANE_REGION '),
+    )),
+    'RcsbUniprotFeatureFeaturePositions': ('', (
+        ('beg_comp_id', None, False, 'An identifier for the monomer(s) corresponding to the feature assignment.'),
+        ('beg_seq_id', None, False, 'An identifier for the monomer at which this segment of the feature begins.'),
+        ('end_seq_id', None, False, 'An identifier for the monomer at which this segment of the feature ends.'),
+        ('value', None, False, 'The value for the feature over this monomer segment.'),
+        ('values', None, False, 'The value(s) for the feature over this monomer segment.'),
+    )),
+    'RcsbUniprotKeyword': ('', (
+        ('id', None, False, 'A unique keyword identifier.  Examples: KW-0275, KW-0597 '),
+        ('value', None, False, 'Human-readable keyword term.  Examples: Lipid metabolism, Phosphoprotein, Fatty acid biosynthesis '),
+    )),
+    'RcsbUniprotProtein': ('', (
+        ('ec', 'RcsbUniprotProteinEc', False, 'Enzyme Commission (EC) number(s).'),
+        ('function', 'RcsbUniprotProteinFunction', False, ''),
+        ('gene', 'RcsbUniprotProteinGene', False, 'The name(s) of the gene(s) that code for the protein sequence(s) described in the entry.'),
+        ('name', 'RcsbUniprotProteinName', False, ''),
+        ('sequence', None, False, 'Protein sequence data for canonical protein sequence.'),
+        ('source_organism', 'RcsbUniprotProteinSourceOrganism', False, 'Taxonomy information on the organism that is the source of the protein sequence.'),
+    )),
+    'RcsbUniprotProteinEc': ('', (
+        ('number', None, False, ''),
+        ('provenance_code', None, False, 'Historical record of the data attribute.'),
+    )),
+    'RcsbUniprotProteinFunction': ('', (
+        ('details', None, False, 'General function(s) of a protein.'),
+        ('provenance_code', None, False, 'Historical record of the data attribute.'),
+    )),
+    'RcsbUniprotProteinGene': ('', (
+        ('name', 'GeneName', False, ''),
+    )),
+    'RcsbUniprotProteinName': ('', (
+        ('provenance_code', None, False, 'Historical record of the data attribute.'),
+        ('value', None, False, 'Name that allows to unambiguously identify a protein.  Examples: Hemoglobin alpha '),
+    )),
+    'RcsbUniprotProteinSourceOrganism': ('', (
+        ('provenance_code', None, False, 'Historical record of the data attribute.'),
+        ('scientific_name', None, False, 'The scientific name of the organism in which a protein occurs.'),
+        ('taxonomy_id', None, False, 'NCBI Taxonomy identifier for the organism in which a protein occurs.'),
+    )),
+    'Refine': ('', (
+        ('B_iso_max', None, False, 'The maximum isotropic displacement parameter (B value)  found in the coordinate set.'),
+        ('B_iso_mean', None, False, 'The mean isotropic displacement parameter (B value)  for the coordinate set.'),
+        ('B_iso_min', None, False, 'The minimum isotropic displacement parameter (B value)  found in the coordinate set.'),
+        ('aniso_B_1_1', None, False, 'The [1][1] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure.'),
+        ('aniso_B_1_2', None, False, 'The [1][2] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure.'),
+        ('aniso_B_1_3', None, False, 'The [1][3] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure.'),
+        ('aniso_B_2_2', None, False, 'The [2][2] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure.'),
+        ('aniso_B_2_3', None, False, 'The [2][3] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure.'),
+        ('aniso_B_3_3', None, False, 'The [3][3] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure.'),
+        ('correlation_coeff_Fo_to_Fc', None, False, 'The correlation coefficient between the observed and              calculated structure factors for reflections included in              the refinement.               The correlation coefficient is scale-independent and gives              an idea of the quality of the refined model.                            sum~i~(Fo~i~ Fc~i~ - <Fo><Fc>) R~corr~ = ------------------------------------------------------------           SQRT{sum~i~(Fo~i~)^2^-<Fo>^2^} SQRT{sum~i~(Fc~i~)^2^-<Fc>^2^}               Fo = observed structure factors              Fc = calculated structure factors              <>   denotes average value               summation is over reflections included in the refinement'),
+        ('correlation_coeff_Fo_to_Fc_free', None, False, 'The correlation coefficient between the observed and              calculated structure factors for reflections not included              in the refinement (free reflections).                The correlation coefficient is scale-independent and gives               an idea of the quality of the refined model.                            sum~i~(Fo~i~ Fc~i~ - <Fo><Fc>) R~corr~ = ------------------------------------------------------------           SQRT{sum~i~(Fo~i~)^2^-<Fo>^2^} SQRT{sum~i~(Fc~i~)^2^-<Fc>^2^}                Fo  = observed structure factors               Fc  = calculated structure factors               <>    denotes average value                summation is over reflections not included               in the refinement (free reflections)'),
+        ('details', None, False, 'Description of special aspects of the refinement process.  Examples: HYDROGENS HAVE BEEN ADDED IN THE RIDING POSITIONS '),
+        ('ls_R_factor_R_free', None, False, "Residual factor R for reflections that satisfy the resolution  limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low and the observation limit established by  _reflns.observed_criterion, and that were used as the test  reflections (i.e. were excluded from the refinement) when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details.       sum|F~obs~ - F~calc~|  R = ---------------------           sum|F~obs~|   F~obs~  = the observed structure-factor amplitudes  F~calc~ = the calculated structure-factor amplitudes   sum is taken over the specified reflections"),
+        ('ls_R_factor_R_free_error', None, False, 'The estimated error in _refine.ls_R_factor_R_free.  The method used to estimate the error is described in the  item _refine.ls_R_factor_R_free_error_details.'),
+        ('ls_R_factor_R_free_error_details', None, False, 'Special aspects of the method used to estimated the error in  _refine.ls_R_factor_R_free.'),
+        ('ls_R_factor_R_work', None, False, "Residual factor R for reflections that satisfy the resolution  limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low and the observation limit established by  _reflns.observed_criterion, and that were used as the working  reflections (i.e. were included in the refinement)  when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details.   _refine.ls_R_factor_obs should not be confused with  _refine.ls_R_factor_R_work; the former reports the results of a  refinement in which all observed reflections were used, the  latter a refinement in which a subset of the observed  reflections were excluded from refinement for the calculation  of a 'free' R factor. However, it would be meaningful to quote  both values if a 'free' R factor were calculated for most of  the refinement, but all of the observed reflections were used  in the final rounds of refinement; such a protocol should be  explained in _refine.details.       sum|F~obs~ - F~calc~|  R = ---------------------           sum|F~obs~|   F~obs~  = the observed structure-factor amplitudes  F~calc~ = the calculated structure-factor amplitudes   sum is taken over the specified reflections"),
+        ('ls_R_factor_all', None, False, 'Residual factor R for all reflections that satisfy the resolution  limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low.       sum|F~obs~ - F~calc~|  R = ---------------------           sum|F~obs~|   F~obs~  = the observed structure-factor amplitudes  F~calc~ = the calculated structure-factor amplitudes   sum is taken over the specified reflections'),
+        ('ls_R_factor_obs', None, False, "Residual factor R for reflections that satisfy the resolution  limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low and the observation limit established by  _reflns.observed_criterion.   _refine.ls_R_factor_obs should not be confused with  _refine.ls_R_factor_R_work; the former reports the results of a  refinement in which all observed reflections were used, the  latter a refinement in which a subset of the observed  reflections were excluded from refinement for the calculation  of a 'free' R factor. However, it would be meaningful to quote  both values if a 'free' R factor were calculated for most of  the refinement, but all of the observed reflections were used  in the final rounds of refinement; such a protocol should be  explained in _refine.details.       sum|F~obs~ - F~calc~|  R = ---------------------           sum|F~obs~|   F~obs~  = the observed structure-factor amplitudes  F~calc~ = the calculated structure-factor amplitudes   sum is taken over the specified reflections"),
+        ('ls_d_res_high', None, False, 'The smallest value for the interplanar spacings for the  reflection data used in the refinement in angstroms. This is  called the highest resolution.'),
+        ('ls_d_res_low', None, False, 'The largest value for the interplanar spacings for  the reflection data used in the refinement in angstroms.  This is called the lowest resolution.'),
+        ('ls_matrix_type', None, False, 'Type of matrix used to accumulate the least-squares derivatives.  Allowable values: atomblock, diagonal, full, fullcycle, sparse, userblock '),
+        ('ls_number_parameters', None, False, 'The number of parameters refined in the least-squares process.  If possible, this number should include some contribution from  the restrained parameters. The restrained parameters are  distinct from the constrained parameters (where one or more  parameters are linearly dependent on the refined value of  another). Least-squares restraints often depend on geometry or  energy considerations and this makes their direct contribution  to this number, and to the goodness-of-fit calculation,  difficult to assess.'),
+        ('ls_number_reflns_R_free', None, False, "The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low  and the observation limit established by  _reflns.observed_criterion, and that were used as the test  reflections (i.e. were excluded from the refinement) when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details."),
+        ('ls_number_reflns_R_work', None, False, "The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low  and the observation limit established by  _reflns.observed_criterion, and that were used as the working  reflections (i.e. were included in the refinement) when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details."),
+        ('ls_number_reflns_all', None, False, 'The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low.'),
+        ('ls_number_reflns_obs', None, False, 'The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low  and the observation limit established by  _reflns.observed_criterion.'),
+        ('ls_number_restraints', None, False, 'The number of restrained parameters. These are parameters which  are not directly dependent on another refined parameter.  Restrained parameters often involve geometry or energy  dependencies.  See also _atom_site.constraints and _atom_site.refinement_flags.  A general description of refinement constraints may appear in  _refine.details.'),
+        ('ls_percent_reflns_R_free', None, False, "The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low  and the observation limit established by  _reflns.observed_criterion, and that were used as the test  reflections (i.e. were excluded from the refinement) when the  refinement included the calculation of a 'free' R factor,  expressed as a percentage of the number of geometrically  observable reflections that satisfy the resolution limits."),
+        ('ls_percent_reflns_obs', None, False, 'The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low  and the observation limit established by  _reflns.observed_criterion, expressed as a percentage of the  number of geometrically observable reflections that satisfy  the resolution limits.'),
+        ('ls_redundancy_reflns_all', None, False, 'The ratio of the total number of observations of the  reflections that satisfy the resolution limits established by  _refine.ls_d_res_high and _refine.ls_d_res_low to the number  of crystallographically unique reflections that satisfy the  same limits.'),
+        ('ls_redundancy_reflns_obs', None, False, 'The ratio of the total number of observations of the  reflections that satisfy the resolution limits established by  _refine.ls_d_res_high and _refine.ls_d_res_low and the  observation limit established by _reflns.observed_criterion to  the number of crystallographically unique reflections that  satisfy the same limits.'),
+        ('ls_wR_factor_R_free', None, False, "Weighted residual factor wR for reflections that satisfy the  resolution limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low and the observation limit established by  _reflns.observed_criterion, and that were used as the test  reflections (i.e. were excluded from the refinement) when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details.        ( sum|w |Y~obs~ - Y~calc~|^2^| )^1/2^  wR = ( ---------------------------- )       (        sum|w Y~obs~^2^|      )   Y~obs~  = the observed amplitude specified by            _refine.ls_structure_factor_coef  Y~calc~ = the calculated amplitude specified by            _refine.ls_structure_factor_coef  w       = the least-squares weight   sum is taken over the specified reflections"),
+        ('ls_wR_factor_R_work', None, False, "Weighted residual factor wR for reflections that satisfy the  resolution limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low and the observation limit established by  _reflns.observed_criterion, and that were used as the working  reflections (i.e. were included in the refinement) when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details.        ( sum|w |Y~obs~ - Y~calc~|^2^| )^1/2^  wR = ( ---------------------------- )       (        sum|w Y~obs~^2^|      )   Y~obs~  = the observed amplitude specified by            _refine.ls_structure_factor_coef  Y~calc~ = the calculated amplitude specified by            _refine.ls_structure_factor_coef  w       = the least-squares weight   sum is taken over the specified reflections"),
+        ('occupancy_max', None, False, 'The maximum value for occupancy found in the coordinate set.'),
+        ('occupancy_min', None, False, 'The minimum value for occupancy found in the coordinate set.'),
+        ('overall_FOM_free_R_set', None, False, 'Average figure of merit of phases of reflections not included  in the refinement.   This value is derived from the likelihood function.   FOM           = I~1~(X)/I~0~(X)   I~0~, I~1~     = zero- and first-order modified Bessel functions                  of the first kind  X              = sigma~A~ |E~o~| |E~c~|/SIGMA  E~o~, E~c~     = normalized observed and calculated structure                  factors  sigma~A~       = <cos 2 pi s delta~x~> SQRT(Sigma~P~/Sigma~N~)                  estimated using maximum likelihood  Sigma~P~       = sum~{atoms in model}~ f^2^  Sigma~N~       = sum~{atoms in crystal}~ f^2^  f              = form factor of atoms  delta~x~       = expected error  SIGMA          = (sigma~{E;exp}~)^2^ + epsilon [1-(sigma~A~)^2^]  sigma~{E;exp}~ = uncertainties of normalized observed                  structure factors  epsilon       = multiplicity of the diffracting plane   Ref: Murshudov, G. N., Vagin, A. A. & Dodson, E. J. (1997).       Acta Cryst. D53, 240-255.'),
+        ('overall_FOM_work_R_set', None, False, 'Average figure of merit of phases of reflections included in  the refinement.   This value is derived from the likelihood function.   FOM           = I~1~(X)/I~0~(X)   I~0~, I~1~     = zero- and first-order modified Bessel functions                  of the first kind  X              = sigma~A~ |E~o~| |E~c~|/SIGMA  E~o~, E~c~     = normalized observed and calculated structure                  factors  sigma~A~       = <cos 2 pi s delta~x~> SQRT(Sigma~P~/Sigma~N~)                  estimated using maximum likelihood  Sigma~P~       = sum~{atoms in model}~ f^2^  Sigma~N~       = sum~{atoms in crystal}~ f^2^  f              = form factor of atoms  delta~x~       = expected error  SIGMA          = (sigma~{E;exp}~)^2^ + epsilon [1-(sigma~A~)^2^]  sigma~{E;exp}~ = uncertainties of normalized observed                  structure factors  epsilon       = multiplicity of the diffracting plane   Ref: Murshudov, G. N., Vagin, A. A. & Dodson, E. J. (1997).       Acta Cryst. D53, 240-255.'),
+        ('overall_SU_B', None, False, "The overall standard uncertainty (estimated standard deviation)            of the displacement parameters based on a maximum-likelihood            residual.             The overall standard uncertainty (sigma~B~)^2^ gives an idea            of the uncertainty in the B values of averagely defined            atoms (atoms with B values equal to the average B value).                                           N~a~ (sigma~B~)^2^ = 8 ----------------------------------------------                   sum~i~ {[1/Sigma - (E~o~)^2^ (1-m^2^)](SUM_AS)s^4^}             N~a~           = number of atoms            E~o~           = normalized structure factors            m              = figure of merit of phases of reflections                             included in the summation            s              = reciprocal-space vector             SUM_AS         = (sigma~A~)^2^/Sigma^2^            Sigma          = (sigma~{E;exp}~)^2^ + epsilon [1-(sigma~A~)^2^]            sigma~{E;exp}~  = experimental uncertainties of normalized                             structure factors            sigma~A~        = <cos 2 pi s delta~x~> SQRT(Sigma~P~/Sigma~N~)                             estimated using maximum likelihood            Sigma~P~        = sum~{atoms in model}~ f^2^            Sigma~N~        = sum~{atoms in crystal}~ f^2^            f               = atom form factor            delta~x~        = expected error            epsilon         = multiplicity of diffracting plane             summation is over all reflections included in refinement             Ref: (sigma~A~ estimation) 'Refinement of macromolecular                 structures by the maximum-likelihood method',                 Murshudov, G. N., Vagin, A. A. & Dodson, E. J. (1997).                 Acta Cryst. D53, 240-255.                  (SU B estimation) Murshudov, G. N. & Dodson,                 E. J. (1997). Simplified error estimation a la                 Cruickshank in macromolecular crystallography.                 CCP4 Newsletter on Protein Crystallography, No. 33,                 January 1997, pp. 31-39.                 http://www.ccp4.ac.uk/newsletters/newsletter33/murshudov.html"),
+        ('overall_SU_ML', None, False, "The overall standard uncertainty (estimated standard deviation)            of the positional parameters based on a maximum likelihood            residual.             The overall standard uncertainty (sigma~X~)^2^ gives an            idea of the uncertainty in the position of averagely            defined atoms (atoms with B values equal to average B value)                   3                         N~a~ (sigma~X~)^2^  = ---------------------------------------------------------                  8 pi^2^ sum~i~ {[1/Sigma - (E~o~)^2^ (1-m^2^)](SUM_AS)s^2^}             N~a~           = number of atoms            E~o~           = normalized structure factors            m              = figure of merit of phases of reflections                             included in the summation            s              = reciprocal-space vector             SUM_AS         = (sigma~A~)^2^/Sigma^2^            Sigma          = (sigma~{E;exp}~)^2^ + epsilon [1-(sigma~A~)^2^]            sigma~{E;exp}~  = experimental uncertainties of normalized                             structure factors            sigma~A~        = <cos 2 pi s delta~x~> SQRT(Sigma~P~/Sigma~N~)                             estimated using maximum likelihood            Sigma~P~        = sum~{atoms in model}~ f^2^            Sigma~N~        = sum~{atoms in crystal}~ f^2^            f               = atom form factor            delta~x~        = expected error            epsilon         = multiplicity of diffracting plane             summation is over all reflections included in refinement             Ref: (sigma_A estimation) 'Refinement of macromolecular                 structures by the maximum-likelihood method',                 Murshudov, G. N., Vagin, A. A. & Dodson, E. J. (1997).                 Acta Cryst. D53, 240-255.                  (SU ML estimation) Murshudov, G. N. & Dodson,                 E. J. (1997). Simplified error estimation a la                 Cruickshank in macromolecular crystallography.                 CCP4 Newsletter on Protein Crystallography, No. 33,                 January 1997, pp. 31-39.                 http://www.ccp4.ac.uk/newsletters/newsletter33/murshudov.html"),
+        ('overall_SU_R_Cruickshank_DPI', None, False, 'The overall standard uncertainty (estimated standard deviation)  of the displacement parameters based on the crystallographic  R value, expressed in a formalism known as the dispersion  precision indicator (DPI).   The overall standard uncertainty (sigma~B~) gives an idea  of the uncertainty in the B values of averagely defined  atoms (atoms with B values equal to the average B value).                          N~a~  (sigma~B~)^2^ = 0.65 ---------- (R~value~)^2^ (D~min~)^2^ C^-2/3^                       (N~o~-N~p~)    N~a~     = number of atoms included in refinement  N~o~     = number of observations  N~p~     = number of parameters refined  R~value~ = conventional crystallographic R value  D~min~   = maximum resolution  C        = completeness of data   Ref: Cruickshank, D. W. J. (1999). Acta Cryst. D55, 583-601.        Murshudov, G. N. & Dodson,       E. J. (1997). Simplified error estimation a la       Cruickshank in macromolecular crystallography.       CCP4 Newsletter on Protein Crystallography, No. 33,       January 1997, pp. 31-39.       http://www.ccp4.ac.uk/newsletters/newsletter33/murshudov.html'),
+        ('overall_SU_R_free', None, False, 'The overall standard uncertainty (estimated standard deviation)  of the displacement parameters based on the free R value.   The overall standard uncertainty (sigma~B~) gives an idea  of the uncertainty in the B values of averagely defined  atoms (atoms with B values equal to the average B value).                          N~a~  (sigma~B~)^2^ = 0.65 ---------- (R~free~)^2^ (D~min~)^2^ C^-2/3^                       (N~o~-N~p~)    N~a~     = number of atoms included in refinement  N~o~     = number of observations  N~p~     = number of parameters refined  R~free~  = conventional free crystallographic R value calculated           using reflections not included in refinement  D~min~   = maximum resolution  C        = completeness of data   Ref: Cruickshank, D. W. J. (1999). Acta Cryst. D55, 583-601.        Murshudov, G. N. & Dodson,       E. J. (1997). Simplified error estimation a la       Cruickshank in macromolecular crystallography.       CCP4 Newsletter on Protein Crystallography, No. 33,       January 1997, pp. 31-39.       http://www.ccp4.ac.uk/newsletters/newsletter33/murshudov.html'),
+        ('pdbx_R_Free_selection_details', None, False, 'Details of the manner in which the cross validation  reflections were selected.  Examples: Random selection '),
+        ('pdbx_TLS_residual_ADP_flag', None, False, 'A flag for TLS refinements identifying the type of atomic displacement parameters stored  in _atom_site.B_iso_or_equiv.  Allowable values: LIKELY RESIDUAL, UNVERIFIED '),
+        ('pdbx_average_fsc_free', None, False, "Average Fourier Shell Correlation (avgFSC) between model and  observed structure factors for reflections not included in refinement.   The average FSC is a measure of the agreement between observed  and calculated structure factors.                    sum(N~i~ FSC~free-i~)  avgFSC~free~   = ---------------------                   sum(N~i~)    N~i~          = the number of free reflections in the resolution shell i  FSC~free-i~   = FSC for free reflections in the i-th resolution shell calculated as:                  (sum(|F~o~| |F~c~| fom cos(phi~c~-phi~o~)))  FSC~free-i~  = -------------------------------------------                 (sum(|F~o~|^2^) (sum(|F~c~|^2^)))^1/2^   |F~o~|   = amplitude of observed structure factor  |F~c~|   = amplitude of calculated structure factor  phi~o~   = phase of observed structure factor  phi~c~   = phase of calculated structure factor  fom      = figure of merit of the experimental phases.   Summation of FSC~free-i~ is carried over all free reflections in the resolution shell.   Summation of avgFSC~free~ is carried over all resolution shells.    Ref:  Rosenthal P.B., Henderson R.        'Optimal determination of particle orientation, absolute hand,        and contrast loss in single-particle electron cryomicroscopy.        Journal of Molecular Biology. 2003;333(4):721-745, equation (A6)."),
+        ('pdbx_average_fsc_overall', None, False, "Overall average Fourier Shell Correlation (avgFSC) between model and  observed structure factors for all reflections.   The average FSC is a measure of the agreement between observed  and calculated structure factors.              sum(N~i~ FSC~i~)  avgFSC   = ----------------             sum(N~i~)    N~i~     = the number of all reflections in the resolution shell i  FSC~i~   = FSC for all reflections in the i-th resolution shell calculated as:             (sum(|F~o~| |F~c~| fom cos(phi~c~-phi~o~)))  FSC~i~  = -------------------------------------------            (sum(|F~o~|^2^) (sum(|F~c~|^2^)))^1/2^   |F~o~|   = amplitude of observed structure factor  |F~c~|   = amplitude of calculated structure factor  phi~o~   = phase of observed structure factor  phi~c~   = phase of calculated structure factor  fom      = figure of merit of the experimental phases.   Summation of FSC~i~ is carried over all reflections in the resolution shell.   Summation of avgFSC is carried over all resolution shells.    Ref:  Rosenthal P.B., Henderson R.        'Optimal determination of particle orientation, absolute hand,        and contrast loss in single-particle electron cryomicroscopy.        Journal of Molecular Biology. 2003;333(4):721-745, equation (A6)."),
+        ('pdbx_average_fsc_work', None, False, "Average Fourier Shell Correlation (avgFSC) between model and  observed structure factors for reflections included in refinement.   The average FSC is a measure of the agreement between observed  and calculated structure factors.                    sum(N~i~ FSC~work-i~)  avgFSC~work~   = ---------------------                   sum(N~i~)    N~i~          = the number of working reflections in the resolution shell i  FSC~work-i~   = FSC for working reflections in the i-th resolution shell calculated as:                  (sum(|F~o~| |F~c~| fom cos(phi~c~-phi~o~)))  FSC~work-i~  = -------------------------------------------                 (sum(|F~o~|^2^) (sum(|F~c~|^2^)))^1/2^   |F~o~|   = amplitude of observed structure factor  |F~c~|   = amplitude of calculated structure factor  phi~o~   = phase of observed structure factor  phi~c~   = phase of calculated structure factor  fom      = figure of merit of the experimental phases.   Summation of FSC~work-i~ is carried over all working reflections in the resolution shell.   Summation of avgFSC~work~ is carried over all resolution shells.    Ref:  Rosenthal P.B., Henderson R.        'Optimal determination of particle orientation, absolute hand,        and contrast loss in single-particle electron cryomicroscopy.        Journal of Molecular Biology. 2003;333(4):721-745, equation (A6)."),
+        ('pdbx_data_cutoff_high_absF', None, False, "Value of F at 'high end' of data cutoff."),
+        ('pdbx_data_cutoff_high_rms_absF', None, False, 'Value of RMS |F| used as high data cutoff.  Examples: null '),
+        ('pdbx_data_cutoff_low_absF', None, False, "Value of F at 'low end' of data cutoff.  Examples: null "),
+        ('pdbx_diffrn_id', None, False, 'An identifier for the diffraction data set used in this refinement.   Multiple diffraction data sets specified as a comma separated list.'),
+        ('pdbx_isotropic_thermal_model', None, False, 'Whether the structure was refined with indvidual isotropic, anisotropic or overall temperature factor.  Examples: Isotropic, Overall '),
+        ('pdbx_ls_cross_valid_method', None, False, 'Whether the cross validataion method was used through out or only at the end.  Examples: FREE R-VALUE '),
+        ('pdbx_ls_sigma_F', None, False, 'Data cutoff (SIGMA(F))'),
+        ('pdbx_ls_sigma_Fsqd', None, False, 'Data cutoff (SIGMA(F^2))'),
+        ('pdbx_ls_sigma_I', None, False, 'Data cutoff (SIGMA(I))'),
+        ('pdbx_method_to_determine_struct', None, False, 'Method(s) used to determine the structure.  Examples: AB INITIO PHASING, DM, ISAS, ISIR, ISIRAS, MAD, MIR, MIRAS, MR, SIR, SIRAS '),
+        ('pdbx_overall_ESU_R', None, False, 'Overall estimated standard uncertainties of positional  parameters based on R value.'),
+        ('pdbx_overall_ESU_R_Free', None, False, 'Overall estimated standard uncertainties of positional parameters based on R free value.'),
+        ('pdbx_overall_SU_R_Blow_DPI', None, False, 'The overall standard uncertainty (estimated standard deviation)  of the displacement parameters based on the crystallographic  R value, expressed in a formalism known as the dispersion  precision indicator (DPI).   Ref: Blow, D (2002) Acta Cryst. D58, 792-797'),
+        ('pdbx_overall_SU_R_free_Blow_DPI', None, False, 'The overall standard uncertainty (estimated standard deviation)  of the displacement parameters based on the crystallographic  R-free value, expressed in a formalism known as the dispersion  precision indicator (DPI).   Ref: Blow, D (2002) Acta Cryst. D58, 792-797'),
+        ('pdbx_overall_SU_R_free_Cruickshank_DPI', None, False, 'The overall standard uncertainty (estimated standard deviation)  of the displacement parameters based on the crystallographic  R-free value, expressed in a formalism known as the dispersion  precision indicator (DPI).   Ref: Cruickshank, D. W. J. (1999). Acta Cryst. D55, 583-601.'),
+        ('pdbx_overall_phase_error', None, False, 'The overall phase error for all reflections after refinement using  the current refinement target.  Examples: null '),
+        ('pdbx_refine_id', None, False, 'This data item uniquely identifies a refinement within an entry.  _refine.pdbx_refine_id can be used to distinguish the results of  joint refinements.'),
+        ('pdbx_solvent_ion_probe_radii', None, False, 'For bulk solvent mask calculation, the amount that the ionic radii of atoms, which can be ions, are increased used.'),
+        ('pdbx_solvent_shrinkage_radii', None, False, 'For bulk solvent mask calculation, amount mask is shrunk after taking away atoms with new radii and a constant value assigned to this new region.'),
+        ('pdbx_solvent_vdw_probe_radii', None, False, 'For bulk solvent mask calculation, the value by which the vdw radii of non-ion atoms (like carbon) are increased and used.'),
+        ('pdbx_starting_model', None, False, 'Starting model for refinement.  Starting model for  molecular replacement should refer to a previous  structure or experiment.  Examples: 1XYZ, 2XYZ, BDL001 '),
+        ('pdbx_stereochem_target_val_spec_case', None, False, 'Special case of stereochemistry target values used in SHELXL refinement.'),
+        ('pdbx_stereochemistry_target_values', None, False, 'Stereochemistry target values used in refinement.'),
+        ('solvent_model_details', None, False, 'Special aspects of the solvent model used during refinement.'),
+        ('solvent_model_param_bsol', None, False, "The value of the BSOL solvent-model parameter describing  the average isotropic displacement parameter of disordered  solvent atoms.   This is one of the two parameters (the other is  _refine.solvent_model_param_ksol) in Tronrud's method of  modelling the contribution of bulk solvent to the  scattering. The standard scale factor is modified according  to the expression       k0 exp(-B0 * s^2^)[1-KSOL * exp(-BSOL * s^2^)]   where k0 and B0 are the scale factors for the protein.   Ref: Tronrud, D. E. (1997). Methods Enzymol. 277, 243-268."),
+        ('solvent_model_param_ksol', None, False, "The value of the KSOL solvent-model parameter describing  the ratio of the electron density in the bulk solvent to the  electron density in the molecular solute.   This is one of the two parameters (the other is  _refine.solvent_model_param_bsol) in Tronrud's method of  modelling the contribution of bulk solvent to the  scattering. The standard scale factor is modified according  to the expression       k0 exp(-B0 * s^2^)[1-KSOL * exp(-BSOL * s^2^)]   where k0 and B0 are the scale factors for the protein.   Ref: Tronrud, D. E. (1997). Methods Enzymol. 277, 243-268."),
+    )),
+    'RefineAnalyze': ('', (
+        ('Luzzati_coordinate_error_free', None, False, 'The estimated coordinate error obtained from the plot of  the R value versus sin(theta)/lambda for the reflections  treated as a test set during refinement.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810.'),
+        ('Luzzati_coordinate_error_obs', None, False, 'The estimated coordinate error obtained from the plot of  the R value versus sin(theta)/lambda for reflections classified  as observed.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810.'),
+        ('Luzzati_d_res_low_free', None, False, 'The value of the low-resolution cutoff used in constructing the  Luzzati plot for reflections treated as a test set during  refinement.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810.'),
+        ('Luzzati_d_res_low_obs', None, False, 'The value of the low-resolution cutoff used in  constructing the Luzzati plot for reflections classified as  observed.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810.'),
+        ('Luzzati_sigma_a_free', None, False, 'The value of sigma~a~ used in constructing the Luzzati plot for  the reflections treated as a test set during refinement.  Details of the estimation of sigma~a~ can be specified  in _refine_analyze.Luzzati_sigma_a_free_details.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810.'),
+        ('Luzzati_sigma_a_obs', None, False, 'The value of sigma~a~ used in constructing the Luzzati plot for  reflections classified as observed. Details of the  estimation of sigma~a~ can be specified in  _refine_analyze.Luzzati_sigma_a_obs_details.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810.'),
+        ('number_disordered_residues', None, False, 'The number of discretely disordered residues in the refined  model.'),
+        ('occupancy_sum_hydrogen', None, False, 'The sum of the occupancies of the hydrogen atoms in the refined  model.'),
+        ('occupancy_sum_non_hydrogen', None, False, 'The sum of the occupancies of the non-hydrogen atoms in the   refined model.'),
+        ('pdbx_Luzzati_d_res_high_obs', None, False, 'record the high resolution for calculating Luzzati statistics.'),
+        ('pdbx_refine_id', None, False, 'This data item uniquely identifies a refinement within an entry.  _refine_analyze.pdbx_refine_id can be used to distinguish the results  of joint refinements.'),
+    )),
+    'RefineHist': ('', (
+        ('cycle_id', None, False, 'The value of _refine_hist.cycle_id must uniquely identify a  record in the REFINE_HIST list.   Note that this item need not be a number; it can be any unique  identifier.'),
+        ('d_res_high', None, False, 'The lowest value for the interplanar spacings for the  reflection data for this cycle of refinement. This is called  the highest resolution.'),
+        ('d_res_low', None, False, 'The highest value for the interplanar spacings for the  reflection data for this cycle of refinement. This is  called the lowest resolution.'),
+        ('number_atoms_solvent', None, False, 'The number of solvent atoms that were included in the model at  this cycle of the refinement.'),
+        ('number_atoms_total', None, False, 'The total number of atoms that were included in the model at  this cycle of the refinement.'),
+        ('pdbx_B_iso_mean_ligand', None, False, 'Mean isotropic B-value for ligand molecules included in refinement.'),
+        ('pdbx_B_iso_mean_solvent', None, False, 'Mean isotropic B-value for solvent molecules included in refinement.'),
+        ('pdbx_number_atoms_ligand', None, False, 'Number of ligand atoms included in refinement'),
+        ('pdbx_number_atoms_nucleic_acid', None, False, 'Number of nucleic atoms included in refinement'),
+        ('pdbx_number_atoms_protein', None, False, 'Number of protein atoms included in refinement'),
+        ('pdbx_number_residues_total', None, False, 'Total number of polymer residues included in refinement.'),
+        ('pdbx_refine_id', None, False, 'This data item uniquely identifies a refinement within an entry.  _refine_hist.pdbx_refine_id can be used to distinguish the results  of joint refinements.'),
+    )),
+    'RefineLsRestr': ('', (
+        ('dev_ideal', None, False, 'For the given parameter type, the root-mean-square deviation  between the ideal values used as restraints in the least-squares  refinement and the values obtained by refinement. For instance,  bond distances may deviate by 0.018 \\%A (r.m.s.) from ideal  values in the current model.'),
+        ('dev_ideal_target', None, False, 'For the given parameter type, the target root-mean-square  deviation between the ideal values used as restraints in the  least-squares refinement and the values obtained by refinement.'),
+        ('number', None, False, 'The number of parameters of this type subjected to restraint in  least-squares refinement.'),
+        ('pdbx_refine_id', None, False, 'This data item uniquely identifies a refinement within an entry.  _refine_ls_restr.pdbx_refine_id can be used to distinguish the results  of joint refinements.'),
+        ('pdbx_restraint_function', None, False, 'The functional form of the restraint function used in the least-squares  refinement.  Examples: SINUSOIDAL, HARMONIC, SEMIHARMONIC '),
+        ('type', None, False, 'The type of the parameter being restrained.  Explicit sets of data values are provided for the programs  PROTIN/PROLSQ (beginning with p_) and RESTRAIN (beginning with  RESTRAIN_). As computer programs change, these data values  are given as examples, not as an enumeration list. Computer  programs that convert a data block to a refinement table will  expect the exact form of the data values given here to be used.  Examples: p_bond_d, p_angle_d, p_planar_d, p_xhbond_d, p_xhangle_d, p_hydrog_d, p_special_d, p_planar, p_chiral, p_singtor_nbd, p_multtor_nbd, p_xyhbond_nbd, p_xhyhbond_nbd, p_special_tor, p_planar_tor, p_staggered_tor, p_orthonormal_tor, p_mcbond_it, p_mcangle_it, p_scbond_it, p_scangle_it, p_xhbond_it, p_xhangle_it, p_special_it, RESTRAIN_Distances < 2.12, RESTRAIN_Distances 2.12 < D < 2.625, RESTRAIN_Distances > 2.625, RESTRAIN_Peptide Planes, RESTRAIN_Ring and other planes, RESTRAIN_rms diffs for Uiso atoms at dist 1.2-1.4, RESTRAIN_rms diffs for Uiso atoms at dist 1.4-1.6, RESTRAIN_rms diffs for Uiso atoms at dist 1.8-2.0, RESTRAIN_rms diffs for Uiso atoms at dist 2.0-2.2, RESTRAIN_rms diffs for Uiso atoms at dist 2.2-2.4, RESTRAIN_rms diffs for Uiso atoms at dist >2.4 '),
+        ('weight', None, False, 'The weighting value applied to this type of restraint in  the least-squares refinement.'),
+    )),
+    'Reflns': ('', (
+        ('B_iso_Wilson_estimate', None, False, 'The value of the overall isotropic displacement parameter  estimated from the slope of the Wilson plot.'),
+        ('R_free_details', None, False, "A description of the method by which a subset of reflections was  selected for exclusion from refinement so as to be used in the  calculation of a 'free' R factor.  Examples: The data set was sorted with l varying most                                   rapidly and h varying least rapidly. Every                                   10th reflection in this sorted list was                                   excluded from refinement and included in the                                   calculation of a 'free' R factor. "),
+        ('Rmerge_F_all', None, False, 'Residual factor Rmerge for all reflections that satisfy the  resolution limits established by _reflns.d_resolution_high  and _reflns.d_resolution_low.               sum~i~(sum~j~|F~j~ - <F>|)  Rmerge(F) = --------------------------                   sum~i~(sum~j~<F>)   F~j~ = the amplitude of the jth observation of reflection i  <F>  = the mean of the amplitudes of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection'),
+        ('Rmerge_F_obs', None, False, 'Residual factor Rmerge for reflections that satisfy the  resolution limits established by _reflns.d_resolution_high  and _reflns.d_resolution_low and the observation limit  established by _reflns.observed_criterion.               sum~i~(sum~j~|F~j~ - <F>|)  Rmerge(F) = --------------------------                   sum~i~(sum~j~<F>)   F~j~ = the amplitude of the jth observation of reflection i  <F>  = the mean of the amplitudes of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection'),
+        ('d_resolution_high', None, False, 'The smallest value in angstroms for the interplanar spacings  for the reflection data. This is called the highest resolution.'),
+        ('d_resolution_low', None, False, 'The largest value in angstroms for the interplanar spacings  for the reflection data. This is called the lowest resolution.'),
+        ('data_reduction_details', None, False, 'A description of special aspects of the data-reduction  procedures.  Examples: Merging and scaling based on only those                                   reflections with I > sig(I). '),
+        ('data_reduction_method', None, False, 'The method used for data reduction.   Note that this is not the computer program used, which is  described in the SOFTWARE category, but the method  itself.   This data item should be used to describe significant  methodological options used within the data-reduction programs.  Examples: Profile fitting by method of Kabsch (1987).                                   Scaling used spherical harmonic coefficients. '),
+        ('details', None, False, 'A description of reflection data not covered by other data  names. This should include details of the Friedel pairs.'),
+        ('limit_h_max', None, False, 'Maximum value of the Miller index h for the reflection data. This  need not have the same value as _diffrn_reflns.limit_h_max.'),
+        ('limit_h_min', None, False, 'Minimum value of the Miller index h for the reflection data. This  need not have the same value as _diffrn_reflns.limit_h_min.'),
+        ('limit_k_max', None, False, 'Maximum value of the Miller index k for the reflection data. This  need not have the same value as _diffrn_reflns.limit_k_max.'),
+        ('limit_k_min', None, False, 'Minimum value of the Miller index k for the reflection data. This  need not have the same value as _diffrn_reflns.limit_k_min.'),
+        ('limit_l_max', None, False, 'Maximum value of the Miller index l for the reflection data. This  need not have the same value as _diffrn_reflns.limit_l_max.'),
+        ('limit_l_min', None, False, 'Minimum value of the Miller index l for the reflection data. This  need not have the same value as _diffrn_reflns.limit_l_min.'),
+        ('number_all', None, False, 'The total number of reflections in the REFLN list (not the  DIFFRN_REFLN list). This number may contain Friedel-equivalent  reflections according to the nature of the structure and the  procedures used. The item _reflns.details describes the  reflection data.'),
+        ('number_obs', None, False, 'The number of reflections in the REFLN list (not the DIFFRN_REFLN  list) classified as observed (see _reflns.observed_criterion).  This number may contain Friedel-equivalent reflections according  to the nature of the structure and the procedures used.'),
+        ('observed_criterion', None, False, "The criterion used to classify a reflection as 'observed'. This  criterion is usually expressed in terms of a sigma(I) or  sigma(F) threshold.  Examples: >2sigma(I) "),
+        ('observed_criterion_F_max', None, False, "The criterion used to classify a reflection as 'observed'  expressed as an upper limit for the value of F."),
+        ('observed_criterion_F_min', None, False, "The criterion used to classify a reflection as 'observed'  expressed as a lower limit for the value of F."),
+        ('observed_criterion_I_max', None, False, "The criterion used to classify a reflection as 'observed'  expressed as an upper limit for the value of I."),
+        ('observed_criterion_I_min', None, False, "The criterion used to classify a reflection as 'observed'  expressed as a lower limit for the value of I."),
+        ('observed_criterion_sigma_F', None, False, "The criterion used to classify a reflection as 'observed'  expressed as a multiple of the value of sigma(F)."),
+        ('observed_criterion_sigma_I', None, False, "The criterion used to classify a reflection as 'observed'  expressed as a multiple of the value of sigma(I)."),
+        ('pdbx_CC_half', None, False, "The Pearson's correlation coefficient expressed as a decimal value               between the average intensities from randomly selected               half-datasets.  \t      Ref: Karplus & Diederichs (2012), Science 336, 1030-33"),
+        ('pdbx_R_split', None, False, 'R split measures the agreement between the sets of intensities created by merging               odd- and even-numbered images  from the overall data.  \t      Ref: T. A. White, R. A. Kirian, A. V. Martin, A. Aquila, K. Nass, A. Barty               and H. N. Chapman (2012), J. Appl. Cryst. 45, 335-341'),
+        ('pdbx_Rmerge_I_obs', None, False, 'The R value for merging intensities satisfying the observed  criteria in this data set.'),
+        ('pdbx_Rpim_I_all', None, False, 'The precision-indicating merging R factor value Rpim,  for merging all intensities in this data set.          sum~i~ [1/(N~i~ - 1)]1/2^ sum~j~ | I~j~ - <I~i~> |  Rpim = --------------------------------------------------                       sum~i~ ( sum~j~ I~j~ )   I~j~   = the intensity of the jth observation of reflection i  <I~i~> = the mean of the intensities of all observations           of reflection i  N~i~   = the redundancy (the number of times reflection i           has been measured).   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection.   Ref: Diederichs, K. & Karplus, P. A. (1997). Nature Struct.       Biol. 4, 269-275.       Weiss, M. S. & Hilgenfeld, R. (1997). J. Appl. Cryst.       30, 203-205.       Weiss, M. S. (2001). J. Appl. Cryst. 34, 130-135.'),
+        ('pdbx_Rrim_I_all', None, False, 'The redundancy-independent merging R factor value Rrim,               also denoted Rmeas, for merging all intensities in this               data set.                       sum~i~ [N~i~/(N~i~ - 1)]1/2^ sum~j~ | I~j~ - <I~i~> |               Rrim = ----------------------------------------------------                                   sum~i~ ( sum~j~ I~j~ )                I~j~   = the intensity of the jth observation of reflection i               <I~i~> = the mean of the intensities of all observations of                        reflection i \t       N~i~   = the redundancy (the number of times reflection i                        has been measured).                sum~i~ is taken over all reflections               sum~j~ is taken over all observations of each reflection.                Ref: Diederichs, K. & Karplus, P. A. (1997). Nature Struct.                    Biol. 4, 269-275.                    Weiss, M. S. & Hilgenfeld, R. (1997). J. Appl. Cryst.                    30, 203-205.                    Weiss, M. S. (2001). J. Appl. Cryst. 34, 130-135.'),
+        ('pdbx_Rsym_value', None, False, 'The R sym value as a decimal number.  Examples: null '),
+        ('pdbx_chi_squared', None, False, 'Overall  Chi-squared statistic.'),
+        ('pdbx_diffrn_id', None, False, 'An identifier for the diffraction data set for this set of summary statistics.   Multiple diffraction data sets entered as a comma separated list.'),
+        ('pdbx_netI_over_av_sigmaI', None, False, 'The ratio of the average intensity to the average uncertainty,  <I>/<sigma(I)>.'),
+        ('pdbx_netI_over_sigmaI', None, False, 'The mean of the ratio of the intensities to their  standard uncertainties, <I/sigma(I)>.'),
+        ('pdbx_number_measured_all', None, False, 'Total number of measured reflections.'),
+        ('pdbx_ordinal', None, False, 'An ordinal identifier for this set of reflection statistics.'),
+        ('pdbx_redundancy', None, False, 'Overall redundancy for this data set.'),
+        ('pdbx_scaling_rejects', None, False, 'Number of reflections rejected in scaling operations.'),
+        ('percent_possible_obs', None, False, 'The percentage of geometrically possible reflections represented  by reflections that satisfy the resolution limits established  by _reflns.d_resolution_high and _reflns.d_resolution_low and  the observation limit established by  _reflns.observed_criterion.'),
+        ('phase_calculation_details', None, False, 'The value of _reflns.phase_calculation_details describes a  special details about calculation of phases in _refln.phase_calc.  Examples: From model, NCS averaging, Solvent flipping, Solvent flattening, Multiple crystal averaging, Multiple phase modification, Other phase modification '),
+    )),
+    'ReflnsShell': ('', (
+        ('Rmerge_F_all', None, False, 'Residual factor Rmerge for all reflections that satisfy the  resolution limits established by _reflns_shell.d_res_high and  _reflns_shell.d_res_low.               sum~i~(sum~j~|F~j~ - <F>|)  Rmerge(F) = --------------------------                   sum~i~(sum~j~<F>)   F~j~ = the amplitude of the jth observation of reflection i  <F>  = the mean of the amplitudes of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection'),
+        ('Rmerge_F_obs', None, False, 'Residual factor Rmerge for reflections that satisfy the  resolution limits established by _reflns_shell.d_res_high and  _reflns_shell.d_res_low and the observation criterion  established by _reflns.observed_criterion.               sum~i~(sum~j~|F~j~ - <F>|)  Rmerge(F) = --------------------------                   sum~i~(sum~j~<F>)   F~j~ = the amplitude of the jth observation of reflection i  <F>  = the mean of the amplitudes of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection'),
+        ('Rmerge_I_all', None, False, 'The value of Rmerge(I) for all reflections in a given shell.               sum~i~(sum~j~|I~j~ - <I>|)  Rmerge(I) = --------------------------                  sum~i~(sum~j~<I>)   I~j~ = the intensity of the jth observation of reflection i  <I>  = the mean of the intensities of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection'),
+        ('Rmerge_I_obs', None, False, "The value of Rmerge(I) for reflections classified as 'observed'  (see _reflns.observed_criterion) in a given shell.               sum~i~(sum~j~|I~j~ - <I>|)  Rmerge(I) = --------------------------                  sum~i~(sum~j~<I>)   I~j~ = the intensity of the jth observation of reflection i  <I>  = the mean of the intensities of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection"),
+        ('d_res_high', None, False, 'The smallest value in angstroms for the interplanar spacings  for the reflections in this shell. This is called the highest  resolution.'),
+        ('d_res_low', None, False, 'The highest value in angstroms for the interplanar spacings  for the reflections in this shell. This is called the lowest  resolution.'),
+        ('meanI_over_sigI_all', None, False, 'The ratio of the mean of the intensities of all reflections  in this shell to the mean of the standard uncertainties of the  intensities of all reflections in this shell.'),
+        ('meanI_over_sigI_obs', None, False, "The ratio of the mean of the intensities of the reflections  classified as 'observed' (see _reflns.observed_criterion) in  this shell to the mean of the standard uncertainties of the  intensities of the 'observed' reflections in this  shell."),
+        ('meanI_over_uI_all', None, False, 'The ratio of the mean of the intensities of all reflections  in this shell to the mean of the standard uncertainties of the  intensities of all reflections in this shell.'),
+        ('number_measured_all', None, False, 'The total number of reflections measured for this  shell.'),
+        ('number_measured_obs', None, False, "The number of reflections classified as 'observed'  (see _reflns.observed_criterion) for this  shell."),
+        ('number_possible', None, False, 'The number of unique reflections it is possible to measure in  this shell.'),
+        ('number_unique_all', None, False, 'The total number of measured reflections which are symmetry-  unique after merging for this shell.'),
+        ('number_unique_obs', None, False, "The total number of measured reflections classified as 'observed'  (see _reflns.observed_criterion) which are symmetry-unique  after merging for this shell."),
+        ('pdbx_CC_half', None, False, "The Pearson's correlation coefficient expressed as a decimal value               between the average intensities from randomly selected               half-datasets within the resolution shell.  \t      Ref: Karplus & Diederichs (2012), Science 336, 1030-33"),
+        ('pdbx_R_split', None, False, 'R split measures the agreement between the sets of intensities created by merging               odd- and even-numbered images from the data within the resolution shell.  \t      Ref: T. A. White, R. A. Kirian, A. V. Martin, A. Aquila, K. Nass, \t      A. Barty and H. N. Chapman (2012), J. Appl. Cryst. 45, 335-341'),
+        ('pdbx_Rpim_I_all', None, False, 'The precision-indicating merging R factor value Rpim,  for merging all intensities in a given shell.          sum~i~ [1/(N~i~ - 1)]1/2^ sum~j~ | I~j~ - <I~i~> |  Rpim = --------------------------------------------------                       sum~i~ ( sum~j~ I~j~ )   I~j~   = the intensity of the jth observation of reflection i  <I~i~> = the mean of the intensities of all observations of           reflection i  N~i~   = the redundancy (the number of times reflection i           has been measured).   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection.   Ref: Diederichs, K. & Karplus, P. A. (1997). Nature Struct.       Biol. 4, 269-275.       Weiss, M. S. & Hilgenfeld, R. (1997). J. Appl. Cryst.       30, 203-205.       Weiss, M. S. (2001). J. Appl. Cryst. 34, 130-135.'),
+        ('pdbx_Rrim_I_all', None, False, 'The redundancy-independent merging R factor value Rrim,               also denoted Rmeas, for merging all intensities in a               given shell.                       sum~i~ [N~i~ /( N~i~ - 1)]1/2^ sum~j~ | I~j~ - <I~i~> |               Rrim = --------------------------------------------------------                                    sum~i~ ( sum~j~ I~j~ )                I~j~   = the intensity of the jth observation of reflection i               <I~i~> = the mean of the intensities of all observations of                        reflection i \t      N~i~   = the redundancy (the number of times reflection i                        has been measured).                sum~i~ is taken over all reflections               sum~j~ is taken over all observations of each reflection.                Ref: Diederichs, K. & Karplus, P. A. (1997). Nature Struct.                    Biol. 4, 269-275.                    Weiss, M. S. & Hilgenfeld, R. (1997). J. Appl. Cryst.                    30, 203-205.                    Weiss, M. S. (2001). J. Appl. Cryst. 34, 130-135.'),
+        ('pdbx_Rsym_value', None, False, 'R sym value in percent.'),
+        ('pdbx_chi_squared', None, False, 'Chi-squared statistic for this resolution shell.'),
+        ('pdbx_diffrn_id', None, False, 'An identifier for the diffraction data set corresponding to this resolution shell.   Multiple diffraction data sets specified as a comma separated list.'),
+        ('pdbx_netI_over_sigmaI_all', None, False, 'The mean of the ratio of the intensities to their  standard uncertainties of all reflections in the  resolution shell.   _reflns_shell.pdbx_netI_over_sigmaI_all =  <I/sigma(I)>'),
+        ('pdbx_netI_over_sigmaI_obs', None, False, 'The mean of the ratio of the intensities to their  standard uncertainties of observed reflections  (see _reflns.observed_criterion) in the resolution shell.   _reflns_shell.pdbx_netI_over_sigmaI_obs =  <I/sigma(I)>'),
+        ('pdbx_ordinal', None, False, 'An ordinal identifier for this resolution shell.'),
+        ('pdbx_redundancy', None, False, 'Redundancy for the current shell.'),
+        ('pdbx_rejects', None, False, 'The number of rejected reflections in the resolution  shell.  Reflections may be rejected from scaling  by setting the observation criterion,  _reflns.observed_criterion.'),
+        ('percent_possible_all', None, False, 'The percentage of geometrically possible reflections represented  by all reflections measured for this shell.'),
+        ('percent_possible_obs', None, False, "The percentage of geometrically possible reflections represented  by reflections classified as 'observed' (see  _reflns.observed_criterion) for this shell."),
+    )),
+    'Software': ('', (
+        ('citation_id', None, False, 'This data item is a pointer to _citation.id in the CITATION  category.'),
+        ('classification', None, False, 'The classification of the program according to its  major function.  Examples: data collection, data reduction, phasing, model building, refinement, validation, other '),
+        ('contact_author', None, False, 'The recognized contact author of the software. This could be  the original author, someone who has modified the code or  someone who maintains the code.  It should be the person  most commonly associated with the code.  Examples: T. Alwyn Jones, Axel Brunger '),
+        ('contact_author_email', None, False, 'The e-mail address of the person specified in  _software.contact_author.  Examples: bourne@sdsc.edu '),
+        ('date', None, False, 'The date the software was released.  Examples: 1991-10-01, 1990-04-30 '),
+        ('description', None, False, 'Description of the software.  Examples: Uses method of restrained least squares '),
+        ('language', None, False, 'The major computing language in which the software is  coded.  Allowable values: Ada, Awk, Basic, C, C++, C/C++, Fortran, Fortran 77, Fortran 90, Fortran_77, Java, Java & Fortran, Other, Pascal, Perl, Python, Python/C++, Tcl, assembler, csh, ksh, sh '),
+        ('location', None, False, 'The URL for an Internet address at which  details of the software can be found.  Examples: http://rosebud.sdsc.edu/projects/pb/IUCr/software.html, ftp://ftp.sdsc.edu/pub/sdsc/biology/ '),
+        ('name', None, False, 'The name of the software.  Examples: Merlot, O, Xengen, X-plor '),
+        ('os', None, False, 'The name of the operating system under which the software  runs.  Examples: Ultrix, OpenVMS, DOS, Windows 95, Windows NT, Irix, HPUX, DEC Unix '),
+        ('pdbx_ordinal', None, False, 'An ordinal index for this category'),
+        ('type', None, False, 'The classification of the software according to the most  common types.  Allowable values: filter, jiffy, library, other, package, program '),
+        ('version', None, False, 'The version of the software.  Examples: v1.0, beta, 3.1-2, unknown '),
+    )),
+    'Struct': ('', (
+        ('pdbx_CASP_flag', None, False, 'The item indicates whether the entry is a CASP target, a CASD-NMR target,  or similar target participating in methods development experiments.  Allowable values: N, Y '),
+        ('pdbx_descriptor', None, False, 'An automatically generated descriptor for an NDB structure or  the unstructured content of the PDB COMPND record.  Examples: Cytochrome b5, Regulatory protein RecX, Uridine kinase (E.C.2.7.1.48) '),
+        ('pdbx_model_details', None, False, 'Text description of the methodology which produced this  model structure.  Examples: This model was produced from a 10 nanosecond Amber/MD simulation starting from PDB structure ID 1ABC. '),
+        ('pdbx_model_type_details', None, False, 'A description of the type of structure model.  Examples: MINIMIZED AVERAGE '),
+        ('title', None, False, 'A title for the data block. The author should attempt to convey  the essence of the structure archived in the CIF in the title,  and to distinguish this structural result from others.  Examples: T4 lysozyme mutant - S32A, Rhinovirus 16 polymerase elongation complex (r1_form), Crystal structure of the OXA-10 W154A mutant at pH 9.0, Mutant structure of Thermus thermophilus HB8 uridine-cytidine kinase, Crystal structure of xylanase from Trichoderma longibrachiatum '),
+    )),
+    'StructAsym': ('', (
+        ('pdbx_PDB_id', None, False, 'This data item is a pointer to _atom_site.pdbx_PDB_strand_id the  ATOM_SITE category.  Examples: 1ABC '),
+        ('pdbx_alt_id', None, False, 'This data item is a pointer to _atom_site.ndb_alias_strand_id the  ATOM_SITE category.'),
+        ('pdbx_order', None, False, 'This data item gives the order of the structural elements in the  ATOM_SITE category.'),
+        ('pdbx_type', None, False, 'This data item describes the general type of the structural elements  in the ATOM_SITE category.  Allowable values: ATOMN, ATOMP, ATOMS, HETAC, HETAD, HETAI, HETAIN, HETAS, HETIC '),
+    )),
+    'StructKeywords': ('', (
+        ('pdbx_keywords', None, False, 'Terms characterizing the macromolecular structure.  Examples: DNA, RNA, T-RNA, DNA/RNA, RIBOZYME, PROTEIN/DNA, PROTEIN/RNA, PEPTIDE NUCLEIC ACID, PEPTIDE NUCLEIC ACID/DNA, DNA-BINDING PROTEIN, RNA-BINDING PROTEIN '),
+        ('text', None, False, 'Keywords describing this structure.  Examples: Inhibitor, Complex, Isomerase..., serine protease, inhibited complex, high-resolution refinement '),
+    )),
+    'Symmetry': ('', (
+        ('Int_Tables_number', None, False, 'Space-group number from International Tables for Crystallography  Vol. A (2002).'),
+        ('cell_setting', None, False, 'The cell settings for this space-group symmetry.  Allowable values: cubic, hexagonal, monoclinic, orthorhombic, rhombohedral, tetragonal, triclinic, trigonal '),
+        ('pdbx_full_space_group_name_H_M', None, False, "Used for PDB space group:   Example: 'C 1 2 1'  (instead of C 2)           'P 1 2 1'  (instead of P 2)           'P 1 21 1' (instead of P 21)           'P 1 1 21' (instead of P 21 -unique C axis)           'H 3'      (instead of R 3   -hexagonal)           'H 3 2'    (instead of R 3 2 -hexagonal)  Examples: Example: 'C 1 2 1'  (instead of C 2)            'P 1 2 1'  (instead of P 2)            'P 1 21 1' (instead of P 21)            'P 1 1 21' (instead of P 21 -unique C axis)            'H 3'      (instead of R 3   -hexagonal)            'H 3 2'    (instead of R 3 2 -hexagonal) "),
+        ('space_group_name_H_M', None, False, 'Hermann-Mauguin space-group symbol. Note that the  Hermann-Mauguin symbol does not necessarily contain complete  information about the symmetry and the space-group origin. If  used, always supply the FULL symbol from International Tables  for Crystallography Vol. A (2002) and indicate the origin and  the setting if it is not implicit. If there is any doubt that  the equivalent positions can be uniquely deduced from this  symbol, specify the  _symmetry_equiv.pos_as_xyz or  _symmetry.space_group_name_Hall  data items as well. Leave  spaces between symbols referring to  different axes.  Examples: A 1, A 1 2 1, A 2, B 1 1 2, B 2, B 2 21 2, C 2, C 1 2 1, C 21, C 1 21 1, C 2(A 112), C 2 2 2, C 2 2 21, C 4 21 2, F 2 2 2, F 2 3, F 4 2 2, F 4 3 2, F 41 3 2, I 1 2 1, I 1 21 1, I 2, I 2 2 2, I 2 3, I 21, I 21 3, I 21 21 21, I 4, I 4 2 2, I 4 3 2, I 41, I 41/a, I 41 2 2, I 41 3 2, P 1, P 1-, P 2, P 1 2 1, P 1 1 2, P 2 2 2, P 2 3, P 2 2 21, P 2 21 21, P 21, P 1 21 1, P 1 21/c 1, P 1 1 21, P 21(C), P 21 2 21, P 21 3, P 21 21 2, P 21 21 2 A, P 21 21 21, P 3, P 3 1 2, P 3 2 1, P 31, P 31 1 2, P 31 2 1, P 32, P 32 1 2, P 32 2 1, P 4, P 4 2 2, P 4 3 2, P 4 21 2, P 41, P 41 2 2, P 41 3 2, P 41 21 2, P 42, P 42 2 2, P 42 3 2, P 42 21 2, P 43, P 43 2 2, P 43 3 2, P 43 21 2, P 6, P 6 2 2, P 61, P 61 2 2, P 62, P 62 2 2, P 63, P 63 2 2, P 64, P 64 2 2, P 65, P 65 2 2, H 3, R 3, H 3 2, R 3 2 '),
+        ('space_group_name_Hall', None, False, "Space-group symbol as described by Hall (1981). This symbol  gives the space-group setting explicitly. Leave spaces between  the separate components of the symbol.   Ref: Hall, S. R. (1981). Acta Cryst. A37, 517-525; erratum  (1981) A37, 921.  Examples: -P 2ac 2n, -R 3 2', P 61 2 2 (0 0 -1) "),
+    )),
+}
+
+ARGUMENTS = {
+    'Query': {
+        'polymer_entity_instance': {'asym_id': ('String!', True), 'entry_id': ('String!', True)},
+        'chem_comps': {'comp_ids': ('[String]!', True)},
+        'nonpolymer_entity_groups': {'group_ids': ('[String]!', True)},
+        'polymer_entity_groups': {'group_ids': ('[String]!', True)},
+        'interface': {'assembly_id': ('String!', True), 'interface_id': ('String!', True), 'entry_id': ('String!', True)},
+        'nonpolymer_entities': {'entity_ids': ('[String!]!', True)},
+        'polymer_entities': {'entity_ids': ('[String!]!', True)},
+        'polymer_entity': {'entity_id': ('String!', True), 'entry_id': ('String!', True)},
+        'entry_group': {'group_id': ('String!', True)},
+        'pubmed': {'pubmed_id': ('Int!', True)},
+        'assembly': {'assembly_id': ('String!', True), 'entry_id': ('String!', True)},
+        'branched_entity_instances': {'instance_ids': ('[String]!', True)},
+        'group_provenance': {'group_provenance_id': ('String!', True)},
+        'polymer_entity_instances': {'instance_ids': ('[String]!', True)},
+        'interfaces': {'interface_ids': ('[String!]!', True)},
+        'nonpolymer_entity_group': {'group_id': ('String!', True)},
+        'assemblies': {'assembly_ids': ('[String]!', True)},
+        'branched_entity': {'entity_id': ('String!', True), 'entry_id': ('String!', True)},
+        'polymer_entity_group': {'group_id': ('String!', True)},
+        'branched_entity_instance': {'asym_id': ('String!', True), 'entry_id': ('String!', True)},
+        'nonpolymer_entity_instance': {'asym_id': ('String!', True), 'entry_id': ('String!', True)},
+        'chem_comp': {'comp_id': ('String!', True)},
+        'entry': {'entry_id': ('String!', True)},
+        'entries': {'entry_ids': ('[String!]!', True)},
+        'entry_groups': {'group_ids': ('[String]!', True)},
+        'branched_entities': {'entity_ids': ('[String!]!', True)},
+        'uniprot': {'uniprot_id': ('String!', True)},
+        'nonpolymer_entity_instances': {'instance_ids': ('[String]!', True)},
+        'nonpolymer_entity': {'entity_id': ('String!', True), 'entry_id': ('String!', True)},
+    },
+}
+
+LIST_FIELDS = {
+    'ChemComp': ('mon_nstd_parent_comp_id',),
+    'Citation': ('rcsb_authors',),
+    'ClustersMembers': ('pdbx_struct_oper_list_ids',),
+    'CoreAssembly': ('branched_entity_instances', 'interfaces', 'nonpolymer_entity_instances', 'pdbx_struct_assembly_auth_evidence', 'pdbx_struct_assembly_gen', 'pdbx_struct_assembly_prop', 'pdbx_struct_oper_list', 'polymer_entity_instances', 'rcsb_assembly_annotation', 'rcsb_assembly_feature', 'rcsb_struct_symmetry', 'rcsb_struct_symmetry_lineage'),
+    'CoreBranchedEntity': ('branched_entity_instances', 'chem_comp_monomers', 'pdbx_entity_branch_descriptor', 'rcsb_branched_entity_annotation', 'rcsb_branched_entity_feature', 'rcsb_branched_entity_feature_summary', 'rcsb_branched_entity_name_sys'),
+    'CoreBranchedEntityInstance': ('pdbx_struct_special_symmetry', 'rcsb_branched_instance_annotation', 'rcsb_branched_instance_feature', 'rcsb_branched_instance_feature_summary', 'rcsb_branched_struct_conn', 'rcsb_ligand_neighbors'),
+    'CoreChemComp': ('pdbx_chem_comp_audit', 'pdbx_chem_comp_descriptor', 'pdbx_chem_comp_feature', 'pdbx_chem_comp_identifier', 'pdbx_family_prd_audit', 'pdbx_prd_audit', 'pdbx_reference_entity_list', 'pdbx_reference_entity_poly', 'pdbx_reference_entity_poly_link', 'pdbx_reference_entity_poly_seq', 'pdbx_reference_entity_sequence', 'pdbx_reference_entity_src_nat', 'pdbx_reference_molecule_annotation', 'pdbx_reference_molecule_details', 'pdbx_reference_molecule_features', 'pdbx_reference_molecule_list', 'pdbx_reference_molecule_related_structures', 'pdbx_reference_molecule_synonyms', 'rcsb_bird_citation', 'rcsb_chem_comp_annotation', 'rcsb_chem_comp_related', 'rcsb_chem_comp_synonyms', 'rcsb_chem_comp_target', 'rcsb_schema_container_identifiers'),
+    'CoreDrugbank': ('drugbank_target',),
+    'CoreEntry': ('assemblies', 'audit_author', 'branched_entities', 'citation', 'database_2', 'diffrn', 'diffrn_detector', 'diffrn_radiation', 'diffrn_source', 'em_2d_crystal_entity', 'em_3d_crystal_entity', 'em_3d_fitting', 'em_3d_fitting_list', 'em_3d_reconstruction', 'em_ctf_correction', 'em_diffraction', 'em_diffraction_shell', 'em_diffraction_stats', 'em_embedding', 'em_entity_assembly', 'em_helical_entity', 'em_image_recording', 'em_imaging', 'em_particle_selection', 'em_single_particle_entity', 'em_software', 'em_specimen', 'em_staining', 'em_vitrification', 'entry_groups', 'exptl', 'exptl_crystal', 'exptl_crystal_grow', 'ihm_entry_collection_mapping', 'ihm_external_reference_info', 'ma_data', 'nonpolymer_entities', 'pdbx_SG_project', 'pdbx_audit_revision_category', 'pdbx_audit_revision_details', 'pdbx_audit_revision_group', 'pdbx_audit_revision_history', 'pdbx_audit_revision_item', 'pdbx_audit_support', 'pdbx_database_PDB_obs_spr', 'pdbx_database_related', 'pdbx_deposit_group', 'pdbx_initial_refinement_model', 'pdbx_molecule_features', 'pdbx_nmr_exptl', 'pdbx_nmr_exptl_sample_conditions', 'pdbx_nmr_refine', 'pdbx_nmr_sample_details', 'pdbx_nmr_software', 'pdbx_nmr_spectrometer', 'pdbx_reflns_twin', 'pdbx_related_exp_data_set', 'pdbx_serial_crystallography_data_reduction', 'pdbx_serial_crystallography_measurement', 'pdbx_serial_crystallography_sample_delivery', 'pdbx_serial_crystallography_sample_delivery_fixed_target', 'pdbx_serial_crystallography_sample_delivery_injection', 'pdbx_soln_scatter', 'pdbx_soln_scatter_model', 'pdbx_vrpt_summary_diffraction', 'pdbx_vrpt_summary_em', 'pdbx_vrpt_summary_geometry', 'pdbx_vrpt_summary_nmr', 'polymer_entities', 'rcsb_binding_affinity', 'rcsb_entry_group_membership', 'rcsb_external_references', 'rcsb_ihm_dataset_list', 'rcsb_ihm_dataset_source_db_reference', 'rcsb_ma_qa_metric_global', 'refine', 'refine_analyze', 'refine_hist', 'refine_ls_restr', 'reflns', 'reflns_shell', 'software'),
+    'CoreInterface': ('rcsb_interface_operator', 'rcsb_interface_partner'),
+    'CoreNonpolymerEntity': ('nonpolymer_entity_instances', 'rcsb_nonpolymer_entity_annotation', 'rcsb_nonpolymer_entity_feature', 'rcsb_nonpolymer_entity_feature_summary', 'rcsb_nonpolymer_entity_name_com'),
+    'CoreNonpolymerEntityInstance': ('pdbx_struct_special_symmetry', 'pdbx_vrpt_summary_entity_fit_to_map', 'pdbx_vrpt_summary_entity_geometry', 'rcsb_nonpolymer_instance_annotation', 'rcsb_nonpolymer_instance_feature', 'rcsb_nonpolymer_instance_feature_summary', 'rcsb_nonpolymer_instance_validation_score', 'rcsb_nonpolymer_struct_conn', 'rcsb_target_neighbors'),
+    'CorePolymerEntity': ('chem_comp_monomers', 'chem_comp_nstd_monomers', 'entity_src_gen', 'entity_src_nat', 'pdbx_entity_src_syn', 'pfams', 'polymer_entity_groups', 'polymer_entity_instances', 'rcsb_cluster_membership', 'rcsb_entity_host_organism', 'rcsb_entity_source_organism', 'rcsb_genomic_lineage', 'rcsb_membrane_lineage', 'rcsb_polymer_entity_align', 'rcsb_polymer_entity_annotation', 'rcsb_polymer_entity_feature', 'rcsb_polymer_entity_feature_summary', 'rcsb_polymer_entity_group_membership', 'rcsb_polymer_entity_name_com', 'rcsb_polymer_entity_name_sys', 'rcsb_related_target_references', 'rcsb_target_cofactors', 'uniprots'),
+    'CorePolymerEntityInstance': ('pdbx_struct_special_symmetry', 'pdbx_vrpt_summary_entity_fit_to_map', 'pdbx_vrpt_summary_entity_geometry', 'rcsb_ligand_neighbors', 'rcsb_polymer_instance_annotation', 'rcsb_polymer_instance_feature', 'rcsb_polymer_instance_feature_summary', 'rcsb_polymer_struct_conn'),
+    'CorePubmed': ('rcsb_pubmed_affiliation_info', 'rcsb_pubmed_mesh_descriptors', 'rcsb_pubmed_mesh_descriptors_lineage'),
+    'CoreUniprot': ('rcsb_uniprot_accession', 'rcsb_uniprot_annotation', 'rcsb_uniprot_entry_name', 'rcsb_uniprot_external_reference', 'rcsb_uniprot_feature', 'rcsb_uniprot_keyword'),
+    'DrugbankInfo': ('affected_organisms', 'atc_codes', 'brand_names', 'drug_categories', 'drug_groups', 'drug_products', 'synonyms'),
+    'DrugbankTarget': ('target_actions',),
+    'EmEntityAssembly': ('entity_id_list',),
+    'EntityPoly': ('rcsb_non_std_monomers',),
+    'GroupEntry': ('rcsb_group_related',),
+    'GroupNonPolymerEntity': ('rcsb_group_related',),
+    'GroupPolymerEntity': ('rcsb_group_related', 'rcsb_polymer_entity_group_members_rankings'),
+    'InterfacePartnerFeatureAdditionalProperties': ('values',),
+    'InterfacePartnerFeatureFeaturePositions': ('values',),
+    'PdbxInitialRefinementModel': ('entity_id_list',),
+    'PdbxStructAssemblyGen': ('asym_id_list',),
+    'PdbxVrptSummary': ('restypes_notchecked_for_bond_angle_geometry',),
+    'Query': ('chem_comps', 'nonpolymer_entity_groups', 'polymer_entity_groups', 'nonpolymer_entities', 'polymer_entities', 'branched_entity_instances', 'polymer_entity_instances', 'interfaces', 'assemblies', 'entries', 'entry_groups', 'branched_entities', 'nonpolymer_entity_instances'),
+    'RcsbAssemblyAnnotation': ('additional_properties',),
+    'RcsbAssemblyAnnotationAdditionalProperties': ('values',),
+    'RcsbAssemblyContainerIdentifiers': ('interface_ids',),
+    'RcsbAssemblyFeature': ('additional_properties', 'feature_positions'),
+    'RcsbAssemblyFeatureAdditionalProperties': ('values',),
+    'RcsbAssemblyFeatureFeaturePositions': ('struct_oper_list', 'values'),
+    'RcsbBirdCitation': ('rcsb_authors',),
+    'RcsbBranchedEntityAnnotation': ('annotation_lineage',),
+    'RcsbBranchedEntityContainerIdentifiers': ('asym_ids', 'auth_asym_ids', 'chem_comp_monomers', 'reference_identifiers'),
+    'RcsbBranchedEntityFeature': ('additional_properties', 'feature_positions'),
+    'RcsbBranchedEntityFeatureAdditionalProperties': ('values',),
+    'RcsbBranchedInstanceAnnotation': ('annotation_lineage',),
+    'RcsbBranchedInstanceFeature': ('additional_properties', 'feature_positions', 'feature_value'),
+    'RcsbBranchedInstanceFeatureAdditionalProperties': ('values',),
+    'RcsbBranchedInstanceFeatureFeaturePositions': ('values',),
+    'RcsbChemCompAnnotation': ('annotation_lineage',),
+    'RcsbChemCompContainerIdentifiers': ('atc_codes', 'subcomponent_ids'),
+    'RcsbChemCompTarget': ('target_actions',),
+    'RcsbEntityHostOrganism': ('ncbi_common_names', 'taxonomy_lineage'),
+    'RcsbEntitySourceOrganism': ('ncbi_common_names', 'rcsb_gene_name', 'taxonomy_lineage'),
+    'RcsbEntryContainerIdentifiers': ('assembly_ids', 'branched_entity_ids', 'emdb_ids', 'entity_ids', 'model_ids', 'non_polymer_entity_ids', 'polymer_entity_ids', 'related_emdb_ids', 'water_entity_ids'),
+    'RcsbEntryInfo': ('ndb_struct_conf_na_feature_combined', 'nonpolymer_bound_components', 'resolution_combined', 'software_programs_combined'),
+    'RcsbGroupAggregationMethodMethod': ('details',),
+    'RcsbGroupContainerIdentifiers': ('group_member_ids', 'parent_member_ids'),
+    'RcsbInterfacePartner': ('interface_partner_feature',),
+    'RcsbInterfacePartnerInterfacePartnerFeature': ('additional_properties', 'feature_positions'),
+    'RcsbMaQaMetricGlobal': ('ma_qa_metric_global',),
+    'RcsbNonpolymerEntityAnnotation': ('annotation_lineage',),
+    'RcsbNonpolymerEntityContainerIdentifiers': ('asym_ids', 'auth_asym_ids', 'reference_chemical_identifiers_provenance_source', 'reference_chemical_identifiers_resource_accession', 'reference_chemical_identifiers_resource_name'),
+    'RcsbNonpolymerEntityFeature': ('additional_properties',),
+    'RcsbNonpolymerEntityFeatureAdditionalProperties': ('values',),
+    'RcsbNonpolymerInstanceAnnotation': ('annotation_lineage',),
+    'RcsbNonpolymerInstanceFeature': ('additional_properties', 'feature_value'),
+    'RcsbNonpolymerInstanceFeatureAdditionalProperties': ('values',),
+    'RcsbPolymerEntity': ('rcsb_ec_lineage', 'rcsb_enzyme_class_combined', 'rcsb_macromolecular_names_combined'),
+    'RcsbPolymerEntityAlign': ('aligned_regions',),
+    'RcsbPolymerEntityAnnotation': ('additional_properties', 'annotation_lineage'),
+    'RcsbPolymerEntityAnnotationAdditionalProperties': ('values',),
+    'RcsbPolymerEntityContainerIdentifiers': ('asym_ids', 'auth_asym_ids', 'chem_comp_monomers', 'chem_comp_nstd_monomers', 'reference_sequence_identifiers', 'uniprot_ids'),
+    'RcsbPolymerEntityFeature': ('additional_properties', 'feature_positions'),
+    'RcsbPolymerEntityFeatureAdditionalProperties': ('values',),
+    'RcsbPolymerEntityFeatureFeaturePositions': ('values',),
+    'RcsbPolymerEntityGroupMembersRankings': ('group_members',),
+    'RcsbPolymerEntityGroupMembership': ('aligned_regions',),
+    'RcsbPolymerEntityGroupSequenceAlignment': ('group_members_alignment',),
+    'RcsbPolymerEntityGroupSequenceAlignmentGroupMembersAlignment': ('aligned_regions',),
+    'RcsbPolymerEntityInstanceContainerIdentifiers': ('auth_to_entity_poly_seq_mapping',),
+    'RcsbPolymerEntityRcsbPolymerNameCombined': ('names',),
+    'RcsbPolymerInstanceAnnotation': ('annotation_lineage',),
+    'RcsbPolymerInstanceFeature': ('additional_properties', 'feature_positions'),
+    'RcsbPolymerInstanceFeatureAdditionalProperties': ('values',),
+    'RcsbPolymerInstanceFeatureFeaturePositions': ('values',),
+    'RcsbPrimaryCitation': ('rcsb_ORCID_identifiers', 'rcsb_authors'),
+    'RcsbRelatedTargetReferences': ('aligned_target',),
+    'RcsbRepositoryHoldingsCurrent': ('repository_content_types',),
+    'RcsbRepositoryHoldingsCurrentEntryContainerIdentifiers': ('assembly_ids',),
+    'RcsbStructSymmetry': ('clusters', 'rotation_axes', 'stoichiometry'),
+    'RcsbStructSymmetryClusters': ('members',),
+    'RcsbStructSymmetryRotationAxes': ('end', 'start'),
+    'RcsbTargetCofactors': ('patent_nos', 'pubmed_ids'),
+    'RcsbUniprotAlignments': ('core_entity_alignments',),
+    'RcsbUniprotAlignmentsCoreEntityAlignments': ('aligned_regions',),
+    'RcsbUniprotAnnotation': ('additional_properties', 'annotation_lineage'),
+    'RcsbUniprotAnnotationAdditionalProperties': ('values',),
+    'RcsbUniprotContainerIdentifiers': ('reference_sequence_identifiers',),
+    'RcsbUniprotFeature': ('feature_positions',),
+    'RcsbUniprotFeatureFeaturePositions': ('values',),
+    'RcsbUniprotProtein': ('ec', 'gene'),
+    'RcsbUniprotProteinGene': ('name',),
+    'Refine': ('pdbx_diffrn_id',),
+    'Reflns': ('pdbx_diffrn_id',),
+    'ReflnsShell': ('pdbx_diffrn_id',),
+}
@@ -0,0 +1,275 @@
+import json
+import math
+import os
+import threading
+from typing import Optional, Union
+
+from ._batching import MAX_RESPONSE_BYTES
+
+SCALAR_BYTES = 24 # typical `"field":value,` for a scalar in a compact JSON response
+OBJECT_BYTES = 8 # `"field":{},`
+LIST_FANOUT = 4 # items assumed per list field when nothing has been observed
+MAX_BATCH_SIZE = 200 # `process` default cap
+SAMPLE_ENTRIES = 3 # entries per response measured field by field
+MIN_SPLIT_BATCH = 50 # `process` splits selections that would force smaller batches
+
+
+def _digest(*parts) -> str:
+    import hashlib
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def _without_rcsb_id(selection: dict) -> dict:
+    # `process` always adds rcsb_id; key sizes the same with or without it
+    return {name: value for name, value in selection.items() if name != "rcsb_id"}
+
+
+class SizeHistory:
+    """Observed response sizes, as moving averages of bytes per entry.
+
+    Kept per root field and selection, and per top-level field of that root
+    with its subselection, so queries that reuse fields of earlier queries
+    get informed estimates too. `process` records into the shared history
+    (see `get_size_history`) and saves it when it finishes. The shared history
+    lives in memory only; to keep sizes across runs, install one with a file:
+    `set_size_history(SizeHistory("~/.cache/rcsb/sizes.json"))`.
+
+    Args:
+        - path: JSON file to load from and save to. `None` keeps the history in memory.
+        - smoothing: Weight of the newest observation in the moving averages (0-1].
+    """
+    def __init__(self, path: Union[str, os.PathLike, None] = None, smoothing: float = 0.3):
+        from pathlib import Path
+        self.path = Path(path).expanduser() if path is not None else None
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._sizes = {}
+        if self.path is not None:
+            try:
+                self._sizes = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                pass
+
+    @staticmethod
+    def query_key(root_name: str, selection: dict) -> str:
+        return _digest("query", root_name, _without_rcsb_id(selection))
+
+    @staticmethod
+    def field_key(root_name: str, field: str, subselection) -> str:
+        return _digest("field", root_name, field, subselection)
+
+    def get(self, key: str) -> Optional[float]:
+        """Average bytes per entry observed under `key`, or `None`."""
+        with self._lock:
+            observed = self._sizes.get(key)
+        return observed[0] if observed else None
+
+    def _update(self, key: str, value: float):
+        current = self._sizes.get(key)
+        if current is None:
+            self._sizes[key] = [value, 1]
+        else:
+            current[0] = self.smoothing * value + (1 - self.smoothing) * current[0]
+            current[1] += 1
+        self._dirty = True
+
+    def record(self, root_name: str, selection: dict, entries: list, nbytes: int, n_entries: Optional[int] = None):
+        """Fold one response of `nbytes` holding `entries` into the history.
+        When only a sample of the entries is passed, `n_entries` is their total number."""
+        entries = [entry for entry in entries if isinstance(entry, dict)]
+        if not entries:
+            return
+        if n_entries is None:
+            n_entries = len(entries)
+        fields = {}
+        for entry in entries[:SAMPLE_ENTRIES]:
+            for name, value in entry.items():
+                size = len(name) + 4 + len(json.dumps(value, separators=(",", ":")))
+                fields.setdefault(name, []).append(size)
+        with self._lock:
+            self._update(self.query_key(root_name, selection), nbytes / n_entries)
+            for name, sizes in fields.items():
+                if name in selection:
+                    self._update(self.field_key(root_name, name, selection[name]), sum(sizes) / len(sizes))
+
+    def save(self):
+        """Write the history to `path` if anything changed. Failures (e.g. read-only home) are ignored."""
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = json.dumps(self._sizes)
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(payload)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    def clear(self):
+        with self._lock:
+            self._sizes = {}
+            self._dirty = True
+
+
+_default_history = None
+_history_lock = threading.Lock()
+_history_disabled = False
+
+
+def get_size_history() -> Optional[SizeHistory]:
+    """Return the shared, in-memory `SizeHistory`, creating it on first use. `None` if disabled."""
+    global _default_history
+    if _history_disabled:
+        return None
+    if _default_history is None:
+        with _history_lock:
+            if _default_history is None:
+                _default_history = SizeHistory()
+    return _default_history
+
+
+def set_size_history(history: Optional[SizeHistory]):
+    """Replace the shared history; `None` stops `process` from recording sizes."""
+    global _default_history, _history_disabled
+    _default_history = history
+    _history_disabled = history is None
+
+
+def schema_bytes(type_name: str, selection: dict, list_fanout: float = LIST_FANOUT) -> float:
+    """Prior estimate of the JSON size of `selection` on one object of `type_name`,
+    from the schema alone: a fixed size per scalar and `list_fanout` items per list."""
+    from ._data_schema import LIST_FIELDS
+    from ._validation import _fields
+
+    fields = _fields(type_name)
+    lists = LIST_FIELDS.get(type_name, ())
+    total = 0.0
+    for name, (_, children) in selection.items():
+        target = fields.get(name)
+        if children is None or target is None:
+            size = SCALAR_BYTES
+        else:
+            size = OBJECT_BYTES + schema_bytes(target, children, list_fanout)
+        if name in lists:
+            size *= list_fanout
+        total += size
+    return total
+
+
+def suggest_batch_size(bytes_per_id: float, max_bytes: float = MAX_RESPONSE_BYTES, max_size: int = MAX_BATCH_SIZE) -> int:
+    """Largest batch, up to `max_size`, whose response should stay under `max_bytes`."""
+    if bytes_per_id <= 0:
+        return max_size
+    return max(1, min(max_size, int(max_bytes // bytes_per_id)))
+
+
+class QueryEstimate:
+    """Predicted response size of a query, from `QueryNode.estimate`.
+
+    Attributes:
+        - n_ids: Number of IDs the estimate is for.
+        - bytes_per_id: Expected response bytes per ID.
+        - total_bytes: Expected bytes for all IDs.
+        - fields: Expected bytes per ID of each top-level field.
+        - source: `"history"` when the whole selection was seen before, `"mixed"`
+            when some fields were, `"schema"` when nothing was.
+        - batch_size: Suggested batch size keeping responses under `max_bytes`.
+        - requests: Requests `process` would send with `batch_size`.
+    """
+    def __init__(self, n_ids: int, bytes_per_id: float, fields: dict, source: str, batch_size: int):
+        self.n_ids = n_ids
+        self.bytes_per_id = bytes_per_id
+        self.total_bytes = bytes_per_id * n_ids
+        self.fields = fields
+        self.source = source
+        self.batch_size = batch_size
+        self.requests = math.ceil(n_ids / batch_size) if n_ids else 0
+
+    def __repr__(self):
+        return (
+            f"QueryEstimate({self.n_ids} ids, {_human(self.bytes_per_id)}/id, "
+            f"{_human(self.total_bytes)} total, {self.requests} requests of {self.batch_size}, "
+            f"source={self.source!r})"
+        )
+
+
+def _human(nbytes: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if nbytes < 1000 or unit == "GB":
+            return f"{nbytes:.0f} {unit}" if unit == "B" else f"{nbytes:.1f} {unit}"
+        nbytes /= 1000
+
+
+def estimate_selection(
+    root_name: str,
+    selection: dict,
+    n_ids: int,
+    history: Optional[SizeHistory] = None,
+    list_fanout: float = LIST_FANOUT,
+    max_bytes: float = MAX_RESPONSE_BYTES,
+) -> QueryEstimate:
+    """Estimate the response size of `selection` below root field `root_name` for `n_ids` IDs."""
+    from ._validation import ROOT_TYPE, _fields
+
+    target = _fields(ROOT_TYPE).get(root_name)
+    fields = {}
+    observed = 0
+    for name, (args, children) in _without_rcsb_id(selection).items():
+        size = history.get(SizeHistory.field_key(root_name, name, [args, children])) if history else None
+        if size is None:
+            size = schema_bytes(target, {name: [args, children]}, list_fanout) if target else SCALAR_BYTES
+        else:
+            observed += 1
+        fields[name] = size
+
+    whole = history.get(SizeHistory.query_key(root_name, selection)) if history else None
+    if whole is not None:
+        bytes_per_id, source = whole, "history"
+    else:
+        bytes_per_id = OBJECT_BYTES + SCALAR_BYTES + sum(fields.values()) # object braces and rcsb_id
+        source = "schema" if not observed else "mixed"
+    return QueryEstimate(n_ids, bytes_per_id, fields, source, suggest_batch_size(bytes_per_id, max_bytes))
+
+
+def split_selection(
+    selection: dict,
+    estimate: QueryEstimate,
+    min_batch: int = MIN_SPLIT_BATCH,
+    max_bytes: float = MAX_RESPONSE_BYTES,
+) -> list:
+    """Partition the top-level fields of `selection` into disjoint parts small enough
+    that `min_batch` IDs of each part stay under `max_bytes`.
+
+    Fields are packed largest first, using the per-field sizes of `estimate`; a field
+    too heavy on its own gets a part to itself. Returns `[(bytes_per_id, part), ...]`
+    in the order of `selection`, with a single item when no split is needed.
+    """
+    capacity = max_bytes / max(1, min_batch)
+    fields = _without_rcsb_id(selection)
+    if estimate.bytes_per_id <= capacity or len(fields) < 2:
+        return [(estimate.bytes_per_id, selection)]
+
+    sizes = {name: estimate.fields.get(name, SCALAR_BYTES) for name in fields}
+    bins = [] # [bytes_per_id, field names]
+    for name in sorted(fields, key=sizes.get, reverse=True):
+        for part in bins:
+            if part[0] + sizes[name] <= capacity:
+                part[0] += sizes[name]
+                part[1].add(name)
+                break
+        else:
+            bins.append([OBJECT_BYTES + SCALAR_BYTES + sizes[name], {name}])
+    if len(bins) == 1:
+        return [(estimate.bytes_per_id, selection)]
+    order = {name: i for i, name in enumerate(fields)}
+    bins.sort(key=lambda part: min(order[name] for name in part[1]))
+    return [
+        (nbytes, {name: value for name, value in fields.items() if name in names})
+        for nbytes, names in bins
+    ]
@@ -0,0 +1,393 @@
+import json
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import requests
+
+from ._cache import CachedResponse, ResponseCache, request_key
+from ._json import JSONDecoder
+from ._ratelimit import RateLimiter
+from ._retry import NO_RETRY, RetryPolicy
+from ._singleflight import AsyncSingleFlight, SingleFlight
+
+DATA_API_URL = "https://data.rcsb.org/graphql"
+DEFAULT_POOL_SIZE = 10
+STREAM_CHUNK_BYTES = 1 << 16
+DEFAULT_TIMEOUT = (10, 120) # (connect, read) seconds; without one a hung connection blocks forever
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _encode(rendered_query: str, variables: Optional[dict]) -> bytes:
+    return json.dumps({"query": rendered_query, "variables": variables or {}}).encode()
+
+
+class Client:
+    """Pooled, keep-alive HTTP client for the RCSB Data API.
+
+    Wraps a single `requests.Session` so every request reuses open TCP/TLS
+    connections instead of paying a fresh handshake. A `Client` is safe to
+    share between the worker threads of `QueryNode.process`.
+
+    Args:
+        - session: An existing `requests.Session` to use. The client will not
+            remount adapters on an injected session.
+        - pool_size: Max number of keep-alive connections kept per host.
+        - timeout: Request timeout in seconds, or a `(connect, read)` tuple.
+            `None` waits forever.
+        - retry: `RetryPolicy` for transient failures. Defaults to `RetryPolicy()`.
+        - rate_limiter: `RateLimiter` shared by every request sent through this client.
+        - cache: `ResponseCache` consulted before, and filled after, every request.
+        - coalesce: Share one network call between threads that send the same
+            rendered query and variables at the same time.
+        - url: GraphQL endpoint.
+        - decoder: `JSONDecoder` for response bodies. Defaults to the fastest installed backend.
+    """
+    def __init__(
+        self,
+        session: Optional["requests.Session"] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout=DEFAULT_TIMEOUT,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = True,
+        url: str = DATA_API_URL,
+        decoder: Optional[JSONDecoder] = None,
+    ):
+        self.url = url
+        self.timeout = timeout
+        self.decoder = decoder if decoder is not None else JSONDecoder()
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self._inflight = SingleFlight() if coalesce else None
+        self._lock = threading.Lock()
+        self._owns_session = session is None
+        self.pool_size = 0
+        self._wanted_pool_size = pool_size
+        self._in_flight = 0 # requests using the mounted adapter
+        if session is None:
+            import requests # deferred: importing requests dominates `import rcsb`
+            session = requests.Session()
+        self.session = session
+        if self._owns_session:
+            self._mount(pool_size)
+        else:
+            self.pool_size = pool_size
+
+    def _mount(self, pool_size: int):
+        from requests.adapters import HTTPAdapter
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.pool_size = pool_size
+
+    def ensure_pool_size(self, pool_size: int):
+        """Grow the connection pool so `pool_size` threads can each hold a connection.
+
+        Swapping adapters would drop the pool under requests still using it, so
+        the larger adapter is mounted right away only if the client is idle, and
+        otherwise by the first request sent once no other request is in flight.
+        """
+        if not self._owns_session or pool_size <= self.pool_size:
+            return
+        with self._lock:
+            self._wanted_pool_size = max(self._wanted_pool_size, pool_size)
+            self._grow_pool()
+
+    def _grow_pool(self):
+        # Caller holds `self._lock`.
+        if self._in_flight == 0 and self._wanted_pool_size > self.pool_size:
+            self._mount(self._wanted_pool_size)
+
+    def _acquire(self):
+        with self._lock:
+            if self._owns_session:
+                self._grow_pool()
+            self._in_flight += 1
+
+    def _release(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    def post(
+        self,
+        rendered_query: str,
+        variables: Optional[dict] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        use_cache: bool = True,
+        body: Optional[bytes] = None,
+    ) -> "requests.Response":
+        """POST a rendered GraphQL query and return the raw response.
+        `retry` and `rate_limiter` override the client's settings for this call.
+        Cache hits return a `CachedResponse` without touching the network;
+        `use_cache=False` bypasses the response cache for this call.
+        `body` is a pre-encoded JSON request body (see `CompiledQuery.body`)
+        sent instead of encoding `rendered_query` and `variables` again."""
+        use_cache = use_cache and self.cache is not None
+        if use_cache or self._inflight is not None:
+            key = request_key(rendered_query, variables)
+        if use_cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return CachedResponse(cached)
+
+        limiter = rate_limiter or self.rate_limiter
+
+        def send():
+            if limiter is None:
+                return self._send(rendered_query, variables, body)
+            with limiter.limit():
+                return self._send(rendered_query, variables, body)
+
+        def fetch():
+            response = (retry or self.retry).call(send)
+            if use_cache:
+                _store(self.cache, key, response.content)
+            return response
+
+        if self._inflight is None:
+            return fetch()
+        return self._inflight.do(key, fetch)
+
+    def post_stream(
+        self,
+        rendered_query: str,
+        variables: Optional[dict] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        body: Optional[bytes] = None,
+    ) -> "requests.Response":
+        """Like `post`, but return once the response headers arrive and leave the
+        body to be read with `iter_entries`. The response cache and request
+        coalescing are bypassed, and retries only cover failures up to the headers.
+        The response holds a pooled connection until `iter_entries` has finished with it."""
+        limiter = rate_limiter or self.rate_limiter
+
+        def send():
+            if limiter is None:
+                return self._send(rendered_query, variables, body, stream=True)
+            with limiter.limit():
+                return self._send(rendered_query, variables, body, stream=True)
+
+        return (retry or self.retry).call(send)
+
+    def iter_entries(self, response, result_key: str):
+        """Yield the elements of `data.<result_key>` from a `post_stream` response
+        as their bytes arrive, then close the response. Parse time is added to
+        `self.decoder`; `response.stream_bytes` and `response.stream_wait_seconds`
+        (time spent waiting on the network) are updated as the body is read."""
+        response.stream_bytes = 0
+        response.stream_wait_seconds = 0.0
+
+        def chunks():
+            content = response.iter_content(STREAM_CHUNK_BYTES)
+            while True:
+                started = time.perf_counter()
+                chunk = next(content, None)
+                response.stream_wait_seconds += time.perf_counter() - started
+                if chunk is None:
+                    return
+                response.stream_bytes += len(chunk)
+                yield chunk
+
+        try:
+            yield from self.decoder.iter_array(chunks(), ("data", result_key))
+        finally:
+            response.close()
+            self._release()
+
+    def _send(self, rendered_query: str, variables: Optional[dict], body: Optional[bytes] = None, stream: bool = False) -> "requests.Response":
+        started = time.perf_counter()
+        if body is None:
+            body = _encode(rendered_query, variables)
+        self._acquire()
+        streaming = False
+        try:
+            response = self.session.post(self.url, data=body, headers=JSON_HEADERS, timeout=self.timeout, stream=stream)
+            # Wall time of the request itself, excluding rate limiter and retry waits.
+            response.request_seconds = time.perf_counter() - started
+            response.raise_for_status()
+            streaming = stream # released by `iter_entries` once the body is read
+            return response
+        finally:
+            if not streaming:
+                self._release()
+
+    def decode(self, response):
+        """Decoded JSON body of a response from `post`, timed by `self.decoder`."""
+        return self.decoder.decode(response.content)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_default_client: Optional[Client] = None
+_default_lock = threading.Lock()
+
+
+def get_client() -> Client:
+    """Return the shared module-level client, creating it on first use."""
+    global _default_client
+    if _default_client is None:
+        with _default_lock:
+            if _default_client is None:
+                _default_client = Client()
+    return _default_client
+
+
+def set_client(client: Optional[Client]):
+    """Replace the shared client used by `execute`, `submit` and `process` by default."""
+    global _default_client
+    with _default_lock:
+        _default_client = client
+
+
+class AsyncClient:
+    """Asyncio client for the RCSB Data API with a bounded number of in-flight requests.
+
+    Uses `httpx.AsyncClient` when httpx is installed (`pip install rcsb[async]`),
+    so requests are multiplexed on the running event loop without a thread each.
+    Without httpx, requests fall back to a pooled `Client` run in worker threads,
+    still bounded by the same semaphore.
+
+    Args:
+        - max_concurrency: Max number of requests in flight at once.
+        - session: An existing `httpx.AsyncClient` to use.
+        - timeout: Request timeout in seconds, or a `(connect, read)` tuple.
+            `None` waits forever.
+        - retry: `RetryPolicy` for transient failures. Defaults to `RetryPolicy()`.
+        - rate_limiter: `RateLimiter` shared by every request sent through this client.
+        - cache: `ResponseCache` consulted before, and filled after, every request.
+        - coalesce: Share one network call between tasks that send the same
+            rendered query and variables at the same time.
+        - url: GraphQL endpoint.
+        - decoder: `JSONDecoder` for response bodies. Defaults to the fastest installed backend.
+    """
+    def __init__(
+        self,
+        max_concurrency: int = 100,
+        session=None,
+        timeout=DEFAULT_TIMEOUT,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = True,
+        url: str = DATA_API_URL,
+        decoder: Optional[JSONDecoder] = None,
+    ):
+        self.url = url
+        self.timeout = timeout
+        self.decoder = decoder if decoder is not None else JSONDecoder()
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self._inflight = AsyncSingleFlight() if coalesce else None
+        self._transient_errors = ()
+        self.max_concurrency = max_concurrency
+        import asyncio # deferred like requests; only async users pay for it
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._owns_session = session is None
+        self._sync_client = None
+        if session is None:
+            try:
+                import httpx
+            except ImportError:
+                self._sync_client = Client(pool_size=max_concurrency, timeout=timeout, url=url)
+            else:
+                limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+                session = httpx.AsyncClient(limits=limits, timeout=_httpx_timeout(timeout))
+        if self._sync_client is None:
+            import httpx
+            self._transient_errors = (httpx.TransportError,)
+        self.session = session
+
+    async def post(
+        self,
+        rendered_query: str,
+        variables: Optional[dict] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        body: Optional[bytes] = None,
+    ):
+        """POST a rendered GraphQL query and return the raw response.
+        `retry`, `rate_limiter` and `body` are as in `Client.post`.
+        Cache hits return a `CachedResponse` without touching the network."""
+        if self.cache is not None or self._inflight is not None:
+            key = request_key(rendered_query, variables)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return CachedResponse(cached)
+
+        limiter = rate_limiter or self.rate_limiter
+
+        async def send():
+            async with self._semaphore:
+                if limiter is None:
+                    return await self._send(rendered_query, variables, body)
+                async with limiter.limit_async():
+                    return await self._send(rendered_query, variables, body)
+
+        async def fetch():
+            # Backoff sleeps happen outside the semaphore so waiting retries don't hold a slot.
+            response = await (retry or self.retry).call_async(send, self._transient_errors)
+            if self.cache is not None:
+                _store(self.cache, key, response.content)
+            return response
+
+        if self._inflight is None:
+            return await fetch()
+        return await self._inflight.do(key, fetch)
+
+    async def _send(self, rendered_query: str, variables: Optional[dict], body: Optional[bytes] = None):
+        if self._sync_client is not None:
+            import asyncio
+            return await asyncio.to_thread(self._sync_client.post, rendered_query, variables, NO_RETRY, body=body)
+        started = time.perf_counter()
+        if body is None:
+            body = _encode(rendered_query, variables)
+        response = await self.session.post(self.url, content=body, headers=JSON_HEADERS, timeout=_httpx_timeout(self.timeout))
+        response.request_seconds = time.perf_counter() - started
+        response.raise_for_status()
+        return response
+
+    def decode(self, response):
+        """Decoded JSON body of a response from `post`, timed by `self.decoder`."""
+        return self.decoder.decode(response.content)
+
+    async def aclose(self):
+        if self._sync_client is not None:
+            self._sync_client.close()
+        elif self._owns_session:
+            await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+
+def _httpx_timeout(timeout):
+    # httpx reads a 2-tuple differently from requests; spell out (connect, read).
+    if isinstance(timeout, tuple) and len(timeout) == 2:
+        import httpx
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return timeout
+
+
+def _store(cache: ResponseCache, key: str, body: bytes):
+    # GraphQL reports partial failures in a 200 body; don't pin those in the cache.
+    if b'"errors"' not in body:
+        cache.set(key, body)
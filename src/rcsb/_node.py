@@ -0,0 +1,958 @@
+import copy
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from types import MappingProxyType
+from typing import Union
+
+from ._batching import MAX_RESPONSE_BYTES, AdaptiveBatchSize, failure_kind, is_split_error, make_batch_sizer
+from ._cache import entity_key
+from ._estimate import LIST_FANOUT, MIN_SPLIT_BATCH, SAMPLE_ENTRIES, QueryEstimate, SizeHistory, estimate_selection, get_size_history, split_selection
+from ._compiled import CompiledQuery
+from ._http import AsyncClient, Client, get_client
+from ._ratelimit import RateLimiter
+from ._retry import NO_RETRY, RetryPolicy
+from ._selection import build_node, merge_by_id, merge_selection, merge_values, missing_selection, project, selection_key, selection_of
+from ._validation import validate_query
+
+RCSB_ARGUMENT_TYPES = {
+    "polymer_entity_instance": {"asym_id": "String!", "entry_id": "String!"},
+    "chem_comps": {"comp_ids": "[String]!"},
+    "nonpolymer_entity_groups": {"group_ids": "[String]!"},
+    "polymer_entity_groups": {"group_ids": "[String]!"},
+    "interface": {"assembly_id": "String!", "interface_id": "String!", "entry_id": "String!"},
+    "nonpolymer_entities": {"entity_ids": "[String!]!"},
+    "polymer_entities": {"entity_ids": "[String!]!"},
+    "polymer_entity": {"entity_id": "String!", "entry_id": "String!"},
+    "entry_group": {"group_id": "String!"},
+    "pubmed": {"pubmed_id": "Int!"},
+    "assembly": {"assembly_id": "String!", "entry_id": "String!"},
+    "branched_entity_instances": {"instance_ids": "[String]!"},
+    "group_provenance": {"group_provenance_id": "String!"},
+    "polymer_entity_instances": {"instance_ids": "[String]!"},
+    "interfaces": {"interface_ids": "[String!]!"},
+    "nonpolymer_entity_group": {"group_id": "String!"},
+    "assemblies": {"assembly_ids": "[String]!"},
+    "branched_entity": {"entity_id": "String!", "entry_id": "String!"},
+    "polymer_entity_group": {"group_id": "String!"},
+    "branched_entity_instance": {"asym_id": "String!", "entry_id": "String!"},
+    "nonpolymer_entity_instance": {"asym_id": "String!", "entry_id": "String!"},
+    "chem_comp": {"comp_id": "String!"},
+    "entry": {"entry_id": "String!"},
+    "entries": {"entry_ids": "[String!]!"},
+    "entry_groups": {"group_ids": "[String]!"},
+    "branched_entities": {"entity_ids": "[String!]!"},
+    "uniprot": {"uniprot_id": "String!"},
+    "nonpolymer_entity_instances": {"instance_ids": "[String]!"},
+    "nonpolymer_entity": {"entity_id": "String!", "entry_id": "String!"}
+}
+
+
+# --- Query Logic ---
+
+def _apply_func(func: callable, items: list) -> list:
+    """Run `func` over prepared `(entry, kwargs)` pairs. Module level so it pickles."""
+    return [func(entry, **item_kwargs) for entry, item_kwargs in items]
+
+
+def _render_field(name: str, arguments) -> str:
+    """Field name with its GraphQL arguments, e.g. `entries(entry_ids: $ids)`."""
+    if not arguments:
+        return name
+    args = []
+    for k, v in arguments.items():
+        if isinstance(v, str) and v.startswith("$"):
+            args.append(f'{k}: {v}')
+        elif isinstance(v, str):
+            args.append(f'{k}: "{v}"')
+        else:
+            args.append(f"{k}: {v}")
+    return f"{name}({', '.join(args)})"
+
+
+_NO_ARGUMENTS = MappingProxyType({})
+
+
+class ScalarNode:
+    """Compact leaf for a selected scalar field.
+
+    Holds only the (interned) field name, its parent and its arguments; it has no
+    children and no render caches, so wide selections stay small and cheap to build.
+    """
+    __slots__ = ("_name", "_parent", "_arguments")
+    _children = ()
+
+    def __init__(self, name, parent=None, arguments=None):
+        self._name = sys.intern(name)
+        self._parent = parent
+        self._arguments = arguments or _NO_ARGUMENTS
+
+    def __getstate__(self):
+        # A mappingproxy can't be pickled or deep-copied; the shared one is restored on load.
+        return self._name, self._parent, dict(self._arguments)
+
+    def __setstate__(self, state):
+        name, self._parent, arguments = state
+        self._name = sys.intern(name)
+        self._arguments = arguments or _NO_ARGUMENTS
+
+    def _render_node(self, indent=0):
+        return " " * indent + _render_field(self._name, self._arguments)
+
+
+class QueryNode:
+    __slots__ = (
+        "_name", "_parent", "_children", "_child_index", "_arguments",
+        "_root", "_version", "_render_cache", "_variables_cache", "_compile_cache", "_aligned_cache",
+    )
+
+    def __init__(self, name=None, parent=None, arguments=None):
+        self._name = name
+        self._parent = parent
+        self._children = []
+        self._child_index = {} # name -> first child of that name, for O(1) dedup in _enter
+        self._arguments = arguments or {}
+        # The root counts mutations of its tree; render results are cached per version.
+        self._root = parent._root if parent is not None else self
+        self._version = 0
+        self._render_cache = None
+        self._variables_cache = None
+        self._compile_cache = None
+        self._aligned_cache = None
+
+    def _enter(self, name, node_class, **kwargs):
+        # Deduplication: Return existing node if already requested
+        child = self._child_index.get(name)
+        if child is not None and not isinstance(child, node_class):
+            # Same name under a different node type; rare, fall back to a scan
+            child = next((c for c in self._children if c._name == name and isinstance(c, node_class)), None)
+        if child is not None:
+            if kwargs:
+                child._arguments = {**child._arguments, **kwargs}
+                self._root._version += 1
+            return child
+
+        # Create new typed node
+        new_node = node_class(name=name, parent=self, arguments=kwargs)
+        self._children.append(new_node)
+        self._child_index.setdefault(name, new_node)
+        self._root._version += 1
+        return new_node
+
+    @property
+    def end(self):
+        """Navigates back to the parent node."""
+        return self._parent if self._parent else self
+
+    def render(self, query_name="structure"):
+        """Render the whole query tree. Cached on the root until the tree changes.
+        The tree is first validated against the bundled Data API schema; a
+        `ValueError` lists every unknown field or argument, argument type mismatch,
+        missing required argument and object field without subfields."""
+        root = self._root
+        version = root._version
+        cached = root._render_cache
+        if cached is not None and cached[:2] == (version, query_name):
+            return cached[2]
+
+        variable_map = root._variables()
+        validate_query(root, variable_map)
+        var_header = ""
+        if variable_map:
+            defs = [f"${name}: {type_def}" for name, type_def in sorted(variable_map.items())]
+            var_header = f"({', '.join(defs)})"
+
+        fields = root._render_node(indent=2)
+        rendered = f"query {query_name}{var_header} {{\n{fields}\n}}"
+        root._render_cache = (version, query_name, rendered)
+        return rendered
+
+    def _variables(self) -> dict:
+        """Map of GraphQL variable name to type used by the root fields. Cached per version."""
+        root = self._root
+        version = root._version
+        cached = root._variables_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        variable_map = {}
+        
+        for child in root._children:
+            # Skip if it's just a string/scalar leaf
+            if not hasattr(child, "_name"): 
+                continue
+
+            known_args = RCSB_ARGUMENT_TYPES.get(child._name, {})
+
+            for arg_name, arg_value in child._arguments.items():
+                if isinstance(arg_value, str) and arg_value.startswith("$"):
+                    clean_var_name = arg_value[1:] # remove $
+                    gql_type = known_args.get(arg_name, "String!")
+                    variable_map[clean_var_name] = gql_type
+
+        root._variables_cache = (version, variable_map)
+        return variable_map
+
+    def _render_node(self, indent=0):
+        pad = " " * indent
+        if self._name is None: # Root
+            parts = [c._render_node(indent) for c in self._children]
+            return "\n".join(filter(None, parts))
+
+        name_part = _render_field(self._name, self._arguments)
+
+        if not self._children:
+            # Leaf node (Scalar)
+            return f"{pad}{name_part}"
+        
+        # Object node
+        inner = [c._render_node(indent + 2) for c in self._children]
+        # Filter empty blocks (Ghost nodes)
+        inner = list(filter(None, inner))
+        if not inner:
+            return "" 
+            
+        return f"{pad}{name_part} {{\n" + "\n".join(inner) + f"\n{pad}}}"
+
+    def compile(self, query_name="structure") -> CompiledQuery:
+        """Freeze the query tree into an immutable, picklable `CompiledQuery`.
+        Cached on the root until the tree changes."""
+        root = self._root
+        version = root._version
+        cached = root._compile_cache
+        if cached is not None and cached[:2] == (version, query_name):
+            return cached[2]
+
+        result_key = batch_var = root_signature = None
+        selection = {}
+        if root._children:
+            try:
+                result_key, batch_vars = root._batch_target()
+                batch_var = batch_vars[0]
+            except ValueError:
+                result_key = root._children[0]._name
+            root_signature = root._root_signature()
+            selection = selection_of(root._children[0])
+
+        compiled = CompiledQuery(
+            root.render(query_name),
+            root._variables(),
+            result_key=result_key,
+            batch_var=batch_var,
+            root_signature=root_signature,
+            selection_json=selection_key(selection),
+        )
+        root._compile_cache = (version, query_name, compiled)
+        return compiled
+
+    @staticmethod
+    def execute(rendered_query: Union[str, CompiledQuery], *, client: Client = None, retry: RetryPolicy = None, rate_limiter: RateLimiter = None, **variables):
+        """Executes a rendered GraphQL query (or a `CompiledQuery`) against the RCSB Data API.
+        Uses the shared pooled `Client` unless `client` is given. Transient failures
+        are retried with `retry`, defaulting to the client's `RetryPolicy`, and
+        requests are paced by `rate_limiter` (or the client's limiter, if any)."""
+        client = client or get_client()
+        if isinstance(rendered_query, CompiledQuery):
+            body = rendered_query.body(variables)
+            response = client.post(rendered_query.query, variables, retry=retry, rate_limiter=rate_limiter, body=body)
+        else:
+            response = client.post(rendered_query, variables, retry=retry, rate_limiter=rate_limiter)
+        return client.decode(response).get("data", {})
+
+    def submit(self, *, client: Client = None, retry: RetryPolicy = None, rate_limiter: RateLimiter = None, **variables):
+        """Compiles and executes the stored query.
+        The compiled query is cached, so repeated submissions don't re-render the tree."""
+        return self.execute(self.compile(), client=client, retry=retry, rate_limiter=rate_limiter, **variables)
+
+    def process(self, inputs: list, func: callable, batch_size: Union[int, str, AdaptiveBatchSize] = None, max_workers: int = None, const_kwargs: dict = {}, iter_kwargs: dict = {}, client: Client = None, retry: RetryPolicy = None, rate_limiter: RateLimiter = None, on_error: callable = None, on_missing: callable = None, ordered: bool = True, cpu_workers: int = None, split: bool = True, stream: bool = False, keep_missing: bool = True):
+        """Execute batched GraphQL queries with parallelized Network I/O and parsing.
+
+            This function chunks inputs into batches, submits them concurrently to the 
+            GraphQL endpoint, and parses the results using a thread pool. It supports 
+            both single-argument queries and multi-argument (e.g., interface) queries.
+
+            Args:
+                - query: The GraphQL query
+                - inputs: Data to batch. Can be `List[str]` for single variables or 
+                    `List[Dict[str, str]]` for multiple variables (e.g., interface IDs).
+                - func: Callback function to parse each entry. Signature: `func(entry, **kwargs)`.
+                - batch_size: Number of inputs per API request. If None, a fixed size is derived
+                    from `estimate`: `min(len(inputs), 200, 50 MB // bytes per input)`.
+                    Pass "auto" or an `AdaptiveBatchSize` to resize batches while running,
+                    based on observed latency, response bytes and error rate.
+                - max_workers: Max concurrent threads for I/O and parsing.
+                - const_kwargs: Fixed arguments passed to `func` for every entry.
+                - iter_kwargs: Mapping of names to iterables of size `len(inputs)` for entry-specific metadata.
+                - client: `Client` to send requests with. Defaults to the shared client,
+                    whose connection pool is grown to `max_workers`.
+                - retry: `RetryPolicy` for each batch request. Defaults to the client's policy.
+                    A batch is only dropped (and reported) once its retries are exhausted.
+                - rate_limiter: `RateLimiter` shared by all worker threads (requests/sec and
+                    concurrent request cap). Defaults to the client's limiter, if any.
+                - on_error: Called as `on_error(failed_inputs, exception)` for inputs that could
+                    not be fetched. Batches failing with a timeout, 5xx (but 503) or 413 are
+                    split in half and retried recursively, so only the offending inputs are
+                    reported. When both halves fail the same way, the failure doesn't depend
+                    on the inputs and the whole batch is reported. Defaults to printing the error.
+                - on_missing: Called as `on_missing(missing_inputs)` for inputs the API returned no
+                    entry for (e.g. obsolete IDs). Defaults to printing them.
+                - keep_missing: Also call `func(None, **kwargs)` for those inputs, so results stay
+                    aligned with `inputs` as when `func` received the API's null entries. Pass
+                    `False` to leave them out of the results.
+                - ordered: Return results in input order. Entries are matched to their input on
+                    `rcsb_id` (requested if the query doesn't select it, and then left out of
+                    the entries `func` sees; the query itself is not changed), so gaps in the
+                    response never shift later items.
+                - cpu_workers: Run `func` in a pool of this many worker processes instead of the
+                    I/O threads, so heavy parsing doesn't hold the GIL while requests are in
+                    flight. `func` and its kwargs must be picklable; workers are started with
+                    forkserver (or spawn), never forked from the threaded process. Fetched
+                    batches waiting for the pool count against the in-flight window.
+                - split: When the selection is too heavy to send in batches of a useful size
+                    (at least `batch_size` IDs if given, else 50), split its top-level fields
+                    into several narrower queries over the same IDs. The parts are fetched
+                    concurrently and deep-merged per `rcsb_id` before `func` sees them.
+                - stream: Parse each response incrementally and run `func` on every entry as
+                    soon as it has arrived, instead of after the whole batch is downloaded.
+                    Peak memory per batch drops to about one entry. Applies to requests sent
+                    without an entity cache, split parts or `cpu_workers`. A connection that
+                    breaks mid-stream is retried like a failed request, by re-sending the whole
+                    batch under `retry`; entries `func` already ran on are skipped. Once the
+                    retries are exhausted, the batch goes to `on_error`.
+
+            Returns:
+                A list of results returned by `func`. Use `process_iter` to stream results instead.
+        """
+        return list(self.process_iter(
+            inputs, func, batch_size=batch_size, max_workers=max_workers,
+            const_kwargs=const_kwargs, iter_kwargs=iter_kwargs, client=client,
+            retry=retry, rate_limiter=rate_limiter, on_error=on_error,
+            on_missing=on_missing, ordered=ordered, cpu_workers=cpu_workers, split=split,
+            stream=stream, keep_missing=keep_missing,
+        ))
+
+    def process_iter(self, inputs: list, func: callable, batch_size: Union[int, str, AdaptiveBatchSize] = None, max_workers: int = None, const_kwargs: dict = {}, iter_kwargs: dict = {}, client: Client = None, retry: RetryPolicy = None, rate_limiter: RateLimiter = None, on_error: callable = None, on_missing: callable = None, ordered: bool = True, cpu_workers: int = None, split: bool = True, stream: bool = False, keep_missing: bool = True, max_in_flight: int = None):
+        """Streaming variant of `process` that yields results as batches complete.
+
+            At most `max_in_flight` batches (default `max_workers`) are requested or
+            waiting to be consumed at any time, so memory stays flat regardless of
+            `len(inputs)`. With `ordered=True`, finished batches wait in a reorder buffer
+            (counted against the window) until all earlier batches are yielded; otherwise
+            results are yielded in completion order. If the consumer stops early,
+            batches that have not started are cancelled.
+
+            Args:
+                - max_in_flight: Max batches submitted but not yet yielded.
+                - All other arguments: See `process`.
+
+            Yields:
+                Results returned by `func`
+        """
+        n_inputs = len(inputs)
+        self._batch_target()
+        self._check_iter_kwargs(n_inputs, iter_kwargs)
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be >= 1, got {max_in_flight}")
+
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4) # ThreadPoolExecutor default
+        owns_client = client is None
+        if owns_client:
+            client = get_client()
+            client.ensure_pool_size(max_workers)
+
+        # Workers only see the compiled snapshot, never the (mutable) tree.
+        compiled, strip_id = self._compile_aligned()
+        result_key, batch_vars = compiled.result_key, [compiled.batch_var]
+        root_name, root_arguments = self._children[0]._name, dict(self._children[0]._arguments)
+
+        # Size batches from the expected response size, so fan-out heavy queries
+        # don't ask for hundreds of MB at once; observed sizes refine later estimates.
+        # Selections too heavy for that are split into narrower queries over the
+        # same IDs, and batches are sized for the heaviest part.
+        history = get_size_history()
+        bytes_per_input = None
+        parts = []
+        estimate_needed = batch_size is None or batch_size == "auto"
+        if estimate_needed or split:
+            estimate = estimate_selection(root_name, compiled.selection, n_inputs, history)
+            bytes_per_input = estimate.bytes_per_id
+            if split:
+                min_batch = batch_size if isinstance(batch_size, int) else MIN_SPLIT_BATCH
+                parts = split_selection(compiled.selection, estimate, min(min_batch, n_inputs))
+                if len(parts) > 1:
+                    bytes_per_input = max(nbytes for nbytes, _ in parts)
+                else:
+                    parts = []
+        sizer = make_batch_sizer(batch_size, n_inputs, bytes_per_input if estimate_needed else None)
+
+        if on_error is None:
+            def on_error(failed_inputs, e):
+                print(f"Error in batch of {len(failed_inputs)} starting with {failed_inputs[:1]}: {e}")
+        if on_missing is None:
+            on_missing = self._print_missing
+
+        # With a cache, entries are cached one by one under (root field, rcsb_id) along
+        # with the selection they were fetched with. Entries whose cached selection
+        # covers this query are served locally, partially covered ones are completed
+        # with a delta query for the missing fields, and only the rest is fetched.
+        entity_cache = client.cache
+        root_signature = compiled.root_signature
+        need = compiled.selection
+        delta_queries = {}
+
+        def fetch_entries(batch_slice: list, query: CompiledQuery = compiled) -> tuple:
+            # Returns (entries, whether the response reported GraphQL errors). Fields
+            # that errored come back null, so such entries must not be cached.
+            if query is compiled and part_queries:
+                return fetch_parts(batch_slice)
+            submit_kwargs = self._batch_variables(batch_vars, batch_slice)
+            try:
+                response = client.post(
+                    query.query, submit_kwargs, retry=retry, rate_limiter=rate_limiter,
+                    use_cache=entity_cache is None, body=query.body(submit_kwargs),
+                )
+            except Exception:
+                sizer.record(len(batch_slice), error=True)
+                raise
+            body = client.decode(response)
+            entries = (body.get("data") or {}).get(result_key) or []
+            if not getattr(response, "from_cache", False):
+                sizer.record(len(batch_slice), getattr(response, "request_seconds", None), len(response.content))
+                if history is not None and isinstance(entries, list):
+                    history.record(root_name, need if query is compiled else query.selection, entries, len(response.content))
+            return entries, bool(body.get("errors"))
+
+        def delta_query(delta: dict) -> CompiledQuery:
+            key = selection_key(delta)
+            if key not in delta_queries:
+                root = QueryNode()
+                child = root._enter(root_name, QueryNode, **root_arguments)
+                build_node(child, delta, leaf_class=ScalarNode)
+                child._enter("rcsb_id", ScalarNode)
+                delta_queries[key] = root.compile()
+            return delta_queries[key]
+
+        def fetch_parts(batch_slice: list) -> tuple:
+            # The first part runs on this worker thread, the others on `part_pool`.
+            futures = [part_pool.submit(fetch_entries, batch_slice, query) for query in part_queries[1:]]
+            try:
+                responses = [fetch_entries(batch_slice, part_queries[0])]
+                responses.extend(future.result() for future in futures)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+            return merge_by_id([entries for entries, _ in responses]), any(errored for _, errored in responses)
+
+        part_queries = [delta_query(part) for _, part in parts]
+        part_pool = None
+        if part_queries:
+            part_pool = ThreadPoolExecutor(max_workers=max_workers * (len(part_queries) - 1))
+            if owns_client:
+                client.ensure_pool_size(max_workers * len(part_queries))
+
+        def store(records: dict):
+            entity_cache.set_many({
+                entity_key(root_signature, rcsb_id): json.dumps(record).encode()
+                for rcsb_id, record in records.items()
+            })
+
+        def fetch_cached_entries(batch_slice: list) -> list:
+            keys = {entity_key(root_signature, item): item for item in batch_slice}
+            known_missing = entity_cache.get_missing(list(keys))
+            keys = {key: item for key, item in keys.items() if key not in known_missing}
+            cached = {str(keys[key]).upper(): client.decoder.decode(body) for key, body in entity_cache.get_many(list(keys)).items()}
+
+            entries = []
+            partial = {} # delta selection key -> (delta, [items])
+            for rcsb_id, record in cached.items():
+                delta = missing_selection(record["selection"], need)
+                if not delta:
+                    entries.append(project(record["entry"], need))
+                else:
+                    partial.setdefault(selection_key(delta), (delta, []))[1].append(rcsb_id)
+
+            for delta, ids in partial.values():
+                fetched, errored = fetch_entries(ids, delta_query(delta))
+                updated = {}
+                for entry in fetched if isinstance(fetched, list) else []:
+                    if not isinstance(entry, dict) or not entry.get("rcsb_id"):
+                        continue
+                    record = cached.get(str(entry["rcsb_id"]).upper())
+                    if record is None:
+                        continue
+                    merged = {
+                        "selection": merge_selection(record["selection"], delta),
+                        "entry": merge_values(record["entry"], entry),
+                    }
+                    updated[entry["rcsb_id"]] = merged
+                    entries.append(project(merged["entry"], need))
+                if not errored: # errored delta fields came back null; keep asking for them
+                    store(updated)
+
+            uncached = [item for item in keys.values() if str(item).upper() not in cached]
+            if uncached:
+                fetched, errored = fetch_entries(uncached)
+                if isinstance(fetched, list):
+                    records = {
+                        str(entry["rcsb_id"]).upper(): {"selection": need, "entry": entry}
+                        for entry in fetched if isinstance(entry, dict) and entry.get("rcsb_id")
+                    }
+                    if not errored: # a null entry may be an error, not a missing ID
+                        store(records)
+                        entity_cache.add_missing([
+                            entity_key(root_signature, item) for item in uncached
+                            if str(item).upper() not in records
+                        ])
+                    entries.extend(fetched)
+            return entries
+
+        def stream_batch(batch_slice: list, start_idx: int):
+            submit_kwargs = self._batch_variables(batch_vars, batch_slice)
+            # Entries are matched to inputs as they arrive, like `_align_entries` does.
+            positions = None
+            if all(isinstance(item, (str, int)) for item in batch_slice):
+                positions = {str(item).upper(): idx for idx, item in enumerate(batch_slice)}
+            # `results` outlives failed attempts, so a retried stream skips the entries
+            # `func` has already seen.
+            results = {}
+            sample = []
+            headers_received = False
+
+            def attempt():
+                nonlocal headers_received
+                headers_received = False
+                response = client.post_stream(
+                    compiled.query, submit_kwargs, retry=NO_RETRY, rate_limiter=rate_limiter,
+                    body=compiled.body(submit_kwargs),
+                )
+                headers_received = True
+                n_entries = 0
+                for n, entry in enumerate(client.iter_entries(response, result_key)):
+                    if entry is None:
+                        continue
+                    n_entries += 1
+                    if len(sample) < SAMPLE_ENTRIES:
+                        sample.append(entry)
+                    if positions is None:
+                        idx = n if n < len(batch_slice) else None
+                    else:
+                        idx = positions.get(str(entry.get("rcsb_id")).upper()) if isinstance(entry, dict) else None
+                    if idx is None or idx in results:
+                        continue
+                    if strip_id:
+                        entry = self._strip_id(entry)
+                    results[idx] = func(entry, **self._item_kwargs(start_idx + idx, const_kwargs, iter_kwargs))
+                return response, n_entries
+
+            # Failures up to the headers and while reading the body are retried
+            # alike, by re-sending the whole request.
+            try:
+                response, n_entries = (retry or client.retry).call(attempt)
+            except Exception as e:
+                if not headers_received or is_split_error(e):
+                    sizer.record(len(batch_slice), error=True)
+                raise
+
+            seconds = response.request_seconds + response.stream_wait_seconds
+            sizer.record(len(batch_slice), seconds, response.stream_bytes)
+            if history is not None and n_entries:
+                history.record(root_name, need, sample, response.stream_bytes, n_entries)
+            missing = [item for idx, item in enumerate(batch_slice) if idx not in results]
+            if keep_missing:
+                for idx in range(len(batch_slice)):
+                    if idx not in results:
+                        results[idx] = func(None, **self._item_kwargs(start_idx + idx, const_kwargs, iter_kwargs))
+            return [results[idx] for idx in sorted(results)], missing
+
+        streaming = stream and entity_cache is None and not part_queries and not cpu_workers
+
+        def handle_batch(start_idx: int, size: int):
+            batch_slice = inputs[start_idx:start_idx + size]
+            if streaming:
+                return stream_batch(batch_slice, start_idx)
+            if entity_cache is not None:
+                entries = fetch_cached_entries(batch_slice)
+            else:
+                entries, _ = fetch_entries(batch_slice)
+            items, missing = self._prepare_entries(entries, batch_slice, start_idx, const_kwargs, iter_kwargs, keep_missing, strip_id)
+            if cpu_pool is not None:
+                return items, missing # func runs in the CPU stage
+            return _apply_func(func, items), missing
+
+        if max_in_flight is None:
+            max_in_flight = max_workers
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        cpu_pool = None
+        if cpu_workers:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            # Never fork: the I/O threads already hold connection, cache and limiter locks.
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            cpu_pool = ProcessPoolExecutor(max_workers=cpu_workers, mp_context=multiprocessing.get_context(method))
+        try:
+            # Batches are cut one at a time so each picks up the sizer's latest size.
+            # Halves of failed batches are queued in `retry_halves` and sent first;
+            # they are never held back by the window, since the reorder buffer may be
+            # waiting on them. `split_parent` maps a half to the batch it came from and
+            # `splits` collects the outcomes of each split batch's halves (error or
+            # None). `cpu_futures` holds fetched batches running `func` in the process
+            # pool. `reorder` maps a batch's start index to (size, results).
+            future_to_batch = {}
+            cpu_futures = {}
+            retry_halves = deque()
+            split_parent = {}
+            splits = {}
+            reorder = {}
+            next_idx = 0
+            next_emit = 0
+
+            def split_or_report(start_idx: int, size: int, e: Exception) -> list:
+                # Returns the (start, size) ranges given up on.
+                if size > 1 and is_split_error(e):
+                    half = size // 2
+                    splits[(start_idx, size)] = {}
+                    for part in ((start_idx, half), (start_idx + half, size - half)):
+                        split_parent[part] = (start_idx, size)
+                        retry_halves.append(part)
+                    return []
+                on_error(inputs[start_idx:start_idx + size], e)
+                return [(start_idx, size)]
+
+            def settle(start_idx: int, size: int, e: Exception = None) -> list:
+                # A half is only split further once its sibling has finished too: if both
+                # failed the same way, the failure doesn't depend on the inputs and the
+                # whole batch is reported. Returns the ranges given up on.
+                parent = split_parent.pop((start_idx, size), None)
+                if parent is None:
+                    return [] if e is None else split_or_report(start_idx, size, e)
+                outcomes = splits[parent]
+                outcomes[(start_idx, size)] = e
+                if len(outcomes) < 2:
+                    return []
+                del splits[parent]
+                errors = [error for error in outcomes.values() if error is not None]
+                if len(errors) == 2 and failure_kind(errors[0]) == failure_kind(errors[1]):
+                    on_error(inputs[parent[0]:parent[0] + parent[1]], errors[1])
+                    return [parent]
+                given_up = []
+                for (half_start, half_size), error in sorted(outcomes.items()):
+                    if error is not None:
+                        given_up.extend(split_or_report(half_start, half_size, error))
+                return given_up
+
+            def emit(start_idx: int, size: int, batch_out: list):
+                nonlocal next_emit
+                if not ordered:
+                    yield from batch_out
+                    return
+                reorder[start_idx] = (size, batch_out)
+                while next_emit in reorder:
+                    size, batch_out = reorder.pop(next_emit)
+                    next_emit += size
+                    yield from batch_out
+
+            while next_idx < n_inputs or retry_halves or future_to_batch or cpu_futures:
+                while retry_halves and len(future_to_batch) < max_in_flight:
+                    start_idx, size = retry_halves.popleft()
+                    future_to_batch[executor.submit(handle_batch, start_idx, size)] = (start_idx, size)
+                while next_idx < n_inputs and len(future_to_batch) + len(cpu_futures) + len(reorder) < max_in_flight:
+                    start_idx, size = next_idx, min(sizer.next_size(), n_inputs - next_idx)
+                    next_idx += size
+                    future_to_batch[executor.submit(handle_batch, start_idx, size)] = (start_idx, size)
+
+                done, _ = wait([*future_to_batch, *cpu_futures], return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in cpu_futures:
+                        start_idx, size = cpu_futures.pop(future)
+                        try:
+                            batch_out = future.result()
+                        except Exception as e:
+                            on_error(inputs[start_idx:start_idx + size], e)
+                            batch_out = []
+                        yield from emit(start_idx, size, batch_out)
+                        continue
+
+                    start_idx, size = future_to_batch.pop(future)
+                    try:
+                        batch_out, missing = future.result()
+                    except Exception as e:
+                        for failed_start, failed_size in settle(start_idx, size, e):
+                            yield from emit(failed_start, failed_size, [])
+                        continue
+                    for failed_start, failed_size in settle(start_idx, size):
+                        yield from emit(failed_start, failed_size, [])
+                    if missing:
+                        on_missing(missing)
+                    if cpu_pool is not None and batch_out:
+                        cpu_futures[cpu_pool.submit(_apply_func, func, batch_out)] = (start_idx, size)
+                        continue
+                    yield from emit(start_idx, size, batch_out)
+        finally:
+            # Runs on normal exit and when the consumer stops iterating early.
+            executor.shutdown(wait=True, cancel_futures=True)
+            if part_pool is not None:
+                part_pool.shutdown(wait=True, cancel_futures=True)
+            if cpu_pool is not None:
+                cpu_pool.shutdown(wait=True, cancel_futures=True)
+            if history is not None:
+                history.save()
+
+    @staticmethod
+    async def execute_async(rendered_query: Union[str, CompiledQuery], *, client: AsyncClient = None, retry: RetryPolicy = None, rate_limiter: RateLimiter = None, **variables):
+        """Asyncio counterpart of `execute`. Runs on the caller's event loop.
+        A temporary `AsyncClient` is created if `client` is not given."""
+        body = None
+        if isinstance(rendered_query, CompiledQuery):
+            body = rendered_query.body(variables)
+            rendered_query = rendered_query.query
+        if client is None:
+            async with AsyncClient() as client:
+                response = await client.post(rendered_query, variables, retry=retry, rate_limiter=rate_limiter, body=body)
+        else:
+            response = await client.post(rendered_query, variables, retry=retry, rate_limiter=rate_limiter, body=body)
+        return client.decode(response).get("data", {})
+
+    async def submit_async(self, *, client: AsyncClient = None, retry: RetryPolicy = None, rate_limiter: RateLimiter = None, **variables):
+        """Asyncio counterpart of `submit`."""
+        return await self.execute_async(self.compile(), client=client, retry=retry, rate_limiter=rate_limiter, **variables)
+
+    async def process_async(self, inputs: list, func: callable, batch_size: int = None, max_concurrency: int = None, const_kwargs: dict = {}, iter_kwargs: dict = {}, client: AsyncClient = None, retry: RetryPolicy = None, rate_limiter: RateLimiter = None, on_error: callable = None, on_missing: callable = None, keep_missing: bool = True):
+        """Asyncio counterpart of `process`.
+
+            Batches are sent concurrently on the running event loop, with at most
+            `max_concurrency` requests in flight (bounded by the client's semaphore).
+            `func` runs on the event loop, so it should be cheap or offload its own work.
+
+            Args:
+                - inputs, func, batch_size, const_kwargs, iter_kwargs, retry, rate_limiter: See `process`.
+                - on_error: See `process`. Batches failing with a timeout, 5xx or 413 are split
+                    in half and retried recursively, so only the offending inputs are reported.
+                - on_missing, keep_missing: See `process`. Results are returned in input order.
+                - max_concurrency: Max in-flight requests when `client` is not given. Defaults to 100.
+                - client: `AsyncClient` to send requests with. A temporary one is created if not given.
+
+            Returns:
+                A list of results returned by `func`
+        """
+        import asyncio
+
+        n_inputs = len(inputs)
+        result_key, batch_vars = self._batch_target()
+        self._check_iter_kwargs(n_inputs, iter_kwargs)
+
+        compiled, strip_id = self._compile_aligned()
+        if batch_size is None:
+            estimate = estimate_selection(result_key, compiled.selection, n_inputs, get_size_history())
+            batch_size = make_batch_sizer(None, n_inputs, estimate.bytes_per_id).next_size()
+
+        owns_client = client is None
+        if owns_client:
+            client = AsyncClient(max_concurrency=max_concurrency or 100)
+
+        if on_error is None:
+            def on_error(failed_inputs, e):
+                print(f"Error in batch of {len(failed_inputs)} starting with {failed_inputs[:1]}: {e}")
+        if on_missing is None:
+            on_missing = self._print_missing
+
+        async def handle_batch(start_idx: int, size: int):
+            batch_slice = inputs[start_idx:start_idx + size]
+            submit_kwargs = self._batch_variables(batch_vars, batch_slice)
+            response = await self.execute_async(compiled, client=client, retry=retry, rate_limiter=rate_limiter, **submit_kwargs)
+            entries = response.get(result_key) or []
+            items, missing = self._prepare_entries(entries, batch_slice, start_idx, const_kwargs, iter_kwargs, keep_missing, strip_id)
+            batch_out = _apply_func(func, items)
+            if missing:
+                on_missing(missing)
+            return batch_out
+
+        async def run_batch(start_idx: int, size: int):
+            try:
+                return await handle_batch(start_idx, size)
+            except Exception as e:
+                return await recover(start_idx, size, e)
+
+        async def recover(start_idx: int, size: int, e: Exception):
+            # Send both halves once; if they fail the same way, the failure doesn't
+            # depend on the inputs and the whole batch is reported.
+            if size <= 1 or not is_split_error(e):
+                on_error(inputs[start_idx:start_idx + size], e)
+                return []
+            half = size // 2
+            parts = ((start_idx, half), (start_idx + half, size - half))
+            outcomes = await asyncio.gather(*(handle_batch(*part) for part in parts), return_exceptions=True)
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+                    raise outcome
+            errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+            if len(errors) == 2 and failure_kind(errors[0]) == failure_kind(errors[1]):
+                on_error(inputs[start_idx:start_idx + size], errors[1])
+                return []
+            recovered = await asyncio.gather(*(
+                recover(*part, outcome) if isinstance(outcome, Exception) else asyncio.sleep(0, outcome)
+                for part, outcome in zip(parts, outcomes)
+            ))
+            return [item for batch_out in recovered for item in batch_out]
+
+        try:
+            final_results = []
+            batches = await asyncio.gather(*(
+                run_batch(i, min(batch_size, n_inputs - i)) for i in range(0, n_inputs, batch_size)
+            ))
+            for batch_out in batches:
+                final_results.extend(batch_out)
+        finally:
+            if owns_client:
+                await client.aclose()
+
+        return final_results
+
+    def estimate(self, ids, history: SizeHistory = None, list_fanout: float = LIST_FANOUT, max_bytes: float = MAX_RESPONSE_BYTES) -> QueryEstimate:
+        """Predict the response size of this query for `ids`, without sending anything.
+
+            Selections seen before by `process` use the observed sizes in `history`;
+            other fields are estimated from the schema, assuming `list_fanout` items
+            per list field.
+
+            Args:
+                - ids: Inputs (or their number) the query would be run for.
+                - history: `SizeHistory` to consult. Defaults to `get_size_history()`.
+                - list_fanout: Items assumed per list field with no observations.
+                - max_bytes: Response size the suggested batch size should stay under.
+
+            Returns:
+                A `QueryEstimate` with bytes per ID, total bytes and a suggested batch size.
+        """
+        n_ids = ids if isinstance(ids, int) else len(ids)
+        compiled = self.compile()
+        if history is None:
+            history = get_size_history()
+        return estimate_selection(self._root._children[0]._name, compiled.selection, n_ids, history, list_fanout, max_bytes)
+
+    def _batch_target(self):
+        """Return the result key and batching variable names of a plural root query."""
+        child = self._children[0]
+        result_key = child._name
+        if result_key not in RCSB_ARGUMENT_TYPES.keys():
+            raise ValueError("""Result key could not be determined.
+                             Child is {child._name}. Ensure the query is ".end"ed properly.""")
+
+        batch_vars = []
+        for arg_value in child._arguments.values():
+            if isinstance(arg_value, str) and arg_value.startswith("$"):
+                batch_vars.append(arg_value[1:])  # Strip "$"
+                break
+    
+        if not batch_vars:
+            raise ValueError(
+                f"No GraphQL variable (starting with '$') found in arguments for '{child._name}'. "
+                "Cannot determine which variable to use for batching."
+            )
+        return result_key, batch_vars
+
+    @staticmethod
+    def _check_iter_kwargs(n_inputs: int, iter_kwargs: dict):
+        for k, v in iter_kwargs.items():
+            if len(v) != n_inputs:
+                raise ValueError(f"List argument '{k}' len {len(v)} != inputs len {n_inputs}")
+
+    @staticmethod
+    def _batch_variables(batch_vars: list, batch_slice: list) -> dict:
+        submit_kwargs = {}
+        if len(batch_vars) == 1:
+            submit_kwargs[batch_vars[0]] = batch_slice
+        else:
+            for var in batch_vars:
+                submit_kwargs[var] = [item[var] for item in batch_slice]
+        return submit_kwargs
+
+    def _root_signature(self) -> str:
+        """Identify the root field and its literal arguments, ignoring the selection."""
+        child = self._children[0]
+        literal_args = {
+            k: v for k, v in child._arguments.items()
+            if not (isinstance(v, str) and v.startswith("$"))
+        }
+        return json.dumps([child._name, literal_args], sort_keys=True)
+
+    def _compile_aligned(self) -> tuple:
+        """`compile()` with `rcsb_id` selected on the root field, which results are aligned on.
+        If the tree doesn't select it, it is added to a copy, never to this tree.
+        Returns (compiled query, whether `rcsb_id` was added). Cached on the root until the tree changes."""
+        root = self._root
+        cached = root._aligned_cache
+        if cached is not None and cached[0] == root._version:
+            return cached[1], cached[2]
+        root_field = root._children[0]
+        if any(child._name == "rcsb_id" for child in root_field._children):
+            compiled, added = self.compile(), False
+        else:
+            aligned = copy.deepcopy(root)
+            aligned._children[0]._enter("rcsb_id", ScalarNode)
+            compiled, added = aligned.compile(), True
+        root._aligned_cache = (root._version, compiled, added)
+        return compiled, added
+
+    @staticmethod
+    def _print_missing(missing_inputs: list):
+        print(f"No entry returned for {len(missing_inputs)} inputs: {missing_inputs}")
+
+    @staticmethod
+    def _align_entries(entries: list, batch_slice: list) -> list:
+        """Match response entries to `batch_slice` on `rcsb_id`.
+
+        Returns a list the length of `batch_slice` with `None` for inputs that got no
+        entry. Falls back to response order when inputs are not plain IDs or entries
+        carry no `rcsb_id`.
+        """
+        by_id = {}
+        for entry in entries:
+            rcsb_id = entry.get("rcsb_id") if isinstance(entry, dict) else None
+            if rcsb_id is None:
+                if entry is not None:
+                    by_id = None
+                    break
+                continue
+            by_id[str(rcsb_id).upper()] = entry
+
+        if by_id is None or not all(isinstance(item, (str, int)) for item in batch_slice):
+            aligned = list(entries[:len(batch_slice)])
+            return aligned + [None] * (len(batch_slice) - len(aligned))
+        return [by_id.get(str(item).upper()) for item in batch_slice]
+
+    @classmethod
+    def _prepare_entries(cls, entries: list, batch_slice: list, start_idx: int, const_kwargs: dict, iter_kwargs: dict, keep_missing: bool = True, strip_id: bool = False):
+        """Pair each entry with its input's kwargs. Returns (`(entry, kwargs)` pairs, missing inputs).
+        Missing inputs are paired with a `None` entry when `keep_missing` is set. With
+        `strip_id`, the `rcsb_id` added only for alignment is removed from the entries."""
+        items = []
+        missing = []
+        for idx, entry in enumerate(cls._align_entries(entries, batch_slice)):
+            if entry is None:
+                missing.append(batch_slice[idx])
+                if not keep_missing:
+                    continue
+            elif strip_id:
+                entry = cls._strip_id(entry)
+            items.append((entry, cls._item_kwargs(start_idx + idx, const_kwargs, iter_kwargs)))
+        return items, missing
+
+    @staticmethod
+    def _strip_id(entry):
+        """Copy of `entry` without `rcsb_id` (entries may be shared with the cache)."""
+        if not isinstance(entry, dict):
+            return entry
+        return {k: v for k, v in entry.items() if k != "rcsb_id"}
+
+    @staticmethod
+    def _item_kwargs(index: int, const_kwargs: dict, iter_kwargs: dict) -> dict:
+        """Keyword arguments of `func` for the input at `index`."""
+        item_kwargs = {**const_kwargs}
+        for k, v in iter_kwargs.items():
+            item_kwargs[k] = v[index]
+        return item_kwargs
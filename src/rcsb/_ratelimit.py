@@ -0,0 +1,71 @@
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Optional
+
+
+class RateLimiter:
+    """Thread-safe token bucket with an optional cap on concurrent requests.
+
+    One limiter is meant to be shared by every worker that talks to the same
+    server, so the combined request rate stays at `rate` instead of each thread
+    firing as fast as it can. Tokens are reserved in arrival order, so waiting
+    callers are served fairly and the rate holds even under contention.
+
+    Args:
+        - rate: Sustained requests per second.
+        - burst: Bucket capacity, i.e. requests allowed back-to-back after idling.
+            Defaults to `max(1, rate)`.
+        - max_concurrent: Max requests in flight at once. `None` for no cap.
+    """
+    def __init__(self, rate: float, burst: Optional[float] = None, max_concurrent: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate}")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.max_concurrent = max_concurrent
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    @contextmanager
+    def limit(self):
+        """Block until a request may be sent; hold a concurrency slot while inside."""
+        if self._slots is not None:
+            self._slots.acquire()
+        try:
+            wait = self._reserve()
+            if wait > 0:
+                time.sleep(wait)
+            yield
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+
+    @asynccontextmanager
+    async def limit_async(self):
+        """Asyncio counterpart of `limit` that never blocks the event loop."""
+        import asyncio
+        if self._slots is not None:
+            while not self._slots.acquire(blocking=False):
+                await asyncio.sleep(0.005)
+        try:
+            wait = self._reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            yield
+        finally:
+            if self._slots is not None:
+                self._slots.release()
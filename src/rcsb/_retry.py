@@ -0,0 +1,125 @@
+import random
+import time
+from functools import lru_cache
+from typing import Optional
+
+RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+RETRY_AFTER_STATUSES = (429, 503)
+
+
+@lru_cache(maxsize=None)
+def retry_exceptions() -> tuple:
+    """Transient `requests` errors. Imported on first failure to keep `import rcsb` light."""
+    import requests
+    return (
+        requests.ConnectionError,
+        requests.Timeout,
+        requests.exceptions.ChunkedEncodingError,
+    )
+
+
+class RetryPolicy:
+    """Retry transient request failures with exponential backoff and jitter.
+
+    Only failures that are safe to repeat are retried: connection resets,
+    timeouts and the HTTP statuses in `retry_statuses`. On 429/503 a
+    `Retry-After` header, if present, overrides the computed backoff.
+
+    Args:
+        - max_attempts: Total attempts including the first. `1` disables retries.
+        - backoff: Base delay in seconds; attempt `n` waits up to `backoff * 2**(n-1)`.
+        - max_backoff: Upper bound on the computed backoff.
+        - jitter: Use "full jitter" (uniform in `[0, delay]`) to spread out retries.
+        - retry_statuses: HTTP status codes considered transient.
+        - max_retry_after: Upper bound on a server supplied `Retry-After`.
+    """
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: tuple = RETRY_STATUSES,
+        max_retry_after: float = 300.0,
+    ):
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be >= 1, got {max_attempts}")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = tuple(retry_statuses)
+        self.max_retry_after = max_retry_after
+
+    def is_retryable(self, exc: BaseException, extra_exceptions: tuple = ()) -> bool:
+        """Whether `exc` is a transient failure worth another attempt."""
+        status = _status_of(exc)
+        if status is not None:
+            return status in self.retry_statuses
+        return isinstance(exc, retry_exceptions() + tuple(extra_exceptions))
+
+    def delay(self, attempt: int, exc: Optional[BaseException] = None) -> float:
+        """Seconds to wait after failed attempt number `attempt` (1-based)."""
+        if exc is not None and _status_of(exc) in RETRY_AFTER_STATUSES:
+            retry_after = _retry_after(exc)
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def call(self, send, extra_exceptions: tuple = ()):
+        """Call `send()` until it succeeds, fails permanently, or attempts run out."""
+        attempt = 1
+        while True:
+            try:
+                return send()
+            except Exception as e:
+                if attempt >= self.max_attempts or not self.is_retryable(e, extra_exceptions):
+                    raise
+                time.sleep(self.delay(attempt, e))
+                attempt += 1
+
+    async def call_async(self, send, extra_exceptions: tuple = ()):
+        """Asyncio counterpart of `call`; `send` is a coroutine function."""
+        import asyncio
+        attempt = 1
+        while True:
+            try:
+                return await send()
+            except Exception as e:
+                if attempt >= self.max_attempts or not self.is_retryable(e, extra_exceptions):
+                    raise
+                await asyncio.sleep(self.delay(attempt, e))
+                attempt += 1
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def _status_of(exc: BaseException) -> Optional[int]:
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    """Parse a `Retry-After` header given either in seconds or as an HTTP date."""
+    headers = getattr(exc.response, "headers", None) or {}
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from datetime import datetime, timezone
+    from email.utils import parsedate_to_datetime # deferred: pulls in most of the email package
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
@@ -1,4 +1,3 @@
-# NOTE: This file is auto-generated. Do not edit directly.
 from typing import Any, List, Union, Dict, Optional, Literal
 
 class SearchNode:
@@ -52,6 +51,22 @@ class TerminalNode(SearchNode):
     def in_set(self, val_list: List[Any]): return self._op("in", val_list)
     def exists(self): return self._op("exists")
 
+class Attribute(TerminalNode):
+    """A searchable attribute, e.g. `attrs.rcsb_entry_info.resolution_combined`.
+    The comparison methods return a new `text` service node for this attribute."""
+    def __init__(self, path: str):
+        super().__init__("text", {"attribute": path})
+        self.path = path
+
+    def _op(self, operator: str, val: Any = None) -> TerminalNode:
+        params = {"attribute": self.path, "operator": operator}
+        if val is not None:
+            params["value"] = val
+        return TerminalNode("text", params)
+
+    def __repr__(self):
+        return f"Attribute({self.path!r})"
+
 def FullTextQuery(value: str) -> TerminalNode:
     """
     Global keyword search across all indexed text fields.
@@ -139,5 +154,33 @@ class SearchRequest:
             payload["request_options"] = self.options
         return payload
 
-# --- Generated Classes ---
-
+class AttributeGroup:
+    """An object in the search attribute tree; its fields are `Attribute`s or nested groups.
+    Children are created on first access and cached, so repeated access allocates nothing."""
+    __slots__ = ("_path", "_children")
+
+    def __init__(self, path: str = ""):
+        self._path = path
+        self._children = {}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._path!r})"
+
+class AttributeField:
+    """Descriptor for one field of an `AttributeGroup` class, shared by all its instances.
+    `name` is the field's JSON key, which the Python attribute may differ from (`class_`).
+    `shape` builds the child group class, or is `None` for a leaf `Attribute`."""
+    def __init__(self, name: str, shape: Optional[callable] = None, doc: str = ""):
+        self.name = name
+        self.shape = shape
+        self.__doc__ = doc
+
+    def __get__(self, group: Optional[AttributeGroup], owner=None):
+        if group is None:
+            return self
+        child = group._children.get(self.name)
+        if child is None:
+            path = f"{group._path}.{self.name}" if group._path else self.name
+            child = Attribute(path) if self.shape is None else self.shape()(path)
+            child = group._children.setdefault(self.name, child)
+        return child
@@ -0,0 +1,2656 @@
+# NOTE: This file is auto-generated by _code_generation/rcsb_search_classes.py. Do not edit directly.
+# Shape: (class name, doc, ((attribute, JSON key, child shape index or None for attributes, doc), ...))
+
+ROOT = 254
+
+SHAPES = (
+    ('Attr_PdbxEntityNonpoly', '', (
+        ('comp_id', 'comp_id', None, 'This data item is a pointer to _chem_comp.id in the CHEM_COMP category.'),
+        ('entity_id', 'entity_id', None, 'This data item is a pointer to _entity.id in the ENTITY category.'),
+        ('name', 'name', None, 'A name for the non-polymer entity'),
+        ('rcsb_prd_id', 'rcsb_prd_id', None, 'For non-polymer BIRD molecules the BIRD identifier for the entity.'),
+    )),
+    ('Attr_RcsbLatestRevision', '', (
+        ('major_revision', 'major_revision', None, 'The major version number of the latest revision.'),
+        ('minor_revision', 'minor_revision', None, 'The minor version number of the latest revision.'),
+        ('revision_date', 'revision_date', None, 'The release date of the latest revision item.'),
+    )),
+    ('Attr_RcsbNonpolymerEntity', '', (
+        ('details', 'details', None, 'A description of special aspects of the entity.'),
+        ('formula_weight', 'formula_weight', None, 'Formula mass (KDa) of the entity.'),
+        ('pdbx_description', 'pdbx_description', None, 'A description of the nonpolymer entity.'),
+        ('pdbx_number_of_molecules', 'pdbx_number_of_molecules', None, 'The number of molecules of the nonpolymer entity in the entry.'),
+    )),
+    ('Attr_AnnotationLineage', '', (
+        ('depth', 'depth', None, 'Members of the annotation lineage as parent lineage depth (1-N)'),
+        ('id', 'id', None, 'Members of the annotation lineage as parent class identifiers.'),
+        ('name', 'name', None, 'Members of the annotation lineage as parent class names.'),
+    )),
+    ('Attr_RcsbNonpolymerEntityAnnotation', '', (
+        ('annotation_id', 'annotation_id', None, 'An identifier for the annotation.'),
+        ('assignment_version', 'assignment_version', None, 'Identifies the version of the annotation assignment.'),
+        ('comp_id', 'comp_id', None, 'Non-polymer(ligand) chemical component identifier for the entity.'),
+        ('description', 'description', None, 'A description for the annotation.'),
+        ('name', 'name', None, 'A name for the annotation.'),
+        ('provenance_source', 'provenance_source', None, 'Code identifying the individual, organization or program that  assigned the annotation.'),
+        ('type', 'type', None, 'A type or category of the annotation.'),
+        ('annotation_lineage', 'annotation_lineage', 3, ''),
+    )),
+    ('Attr_RcsbNonpolymerEntityContainerIdentifiers', '', (
+        ('asym_ids', 'asym_ids', None, ''),
+        ('auth_asym_ids', 'auth_asym_ids', None, ''),
+        ('chem_ref_def_id', 'chem_ref_def_id', None, 'The chemical reference definition identifier for the entity in this container.'),
+        ('entity_id', 'entity_id', None, 'Entity identifier for the container.'),
+        ('entry_id', 'entry_id', None, 'Entry identifier for the container.'),
+        ('nonpolymer_comp_id', 'nonpolymer_comp_id', None, 'Non-polymer(ligand) chemical component identifier for the entity in this container.'),
+        ('prd_id', 'prd_id', None, 'The BIRD identifier for the entity in this container.'),
+        ('rcsb_id', 'rcsb_id', None, 'A unique identifier for each object in this entity container formed by  an underscore separated concatenation of entry and entity identifiers.'),
+        ('reference_chemical_identifiers_provenance_source', 'reference_chemical_identifiers_provenance_source', None, ''),
+        ('reference_chemical_identifiers_resource_accession', 'reference_chemical_identifiers_resource_accession', None, ''),
+        ('reference_chemical_identifiers_resource_name', 'reference_chemical_identifiers_resource_name', None, ''),
+    )),
+    ('Attr_AdditionalProperties', '', (
+        ('name', 'name', None, 'The additional property name.'),
+        ('values', 'values', None, ''),
+    )),
+    ('Attr_RcsbNonpolymerEntityFeature', '', (
+        ('assignment_version', 'assignment_version', None, 'Identifies the version of the feature assignment.'),
+        ('comp_id', 'comp_id', None, 'Non-polymer(ligand) chemical component identifier for the entity.'),
+        ('description', 'description', None, 'A description for the feature.'),
+        ('feature_id', 'feature_id', None, 'An identifier for the feature.'),
+        ('name', 'name', None, 'A name for the feature.'),
+        ('provenance_source', 'provenance_source', None, 'Code identifying the individual, organization or program that  assigned the feature.'),
+        ('type', 'type', None, 'A type or category of the feature.'),
+        ('value', 'value', None, 'The feature value.'),
+        ('additional_properties', 'additional_properties', 6, ''),
+    )),
+    ('Attr_RcsbNonpolymerEntityFeatureSummary', '', (
+        ('comp_id', 'comp_id', None, 'Non-polymer(ligand) chemical component identifier for the entity.'),
+        ('count', 'count', None, 'The feature count.'),
+        ('maximum_length', 'maximum_length', None, 'The maximum feature length.'),
+        ('maximum_value', 'maximum_value', None, 'The maximum feature value.'),
+        ('minimum_length', 'minimum_length', None, 'The minimum feature length.'),
+        ('minimum_value', 'minimum_value', None, 'The minimum feature value.'),
+        ('type', 'type', None, 'Type or category of the feature.'),
+    )),
+    ('Attr_RcsbNonpolymerEntityKeywords', '', (
+        ('text', 'text', None, 'Keywords describing this non-polymer entity.'),
+    )),
+    ('Attr_RcsbNonpolymerEntityNameCom', '', (
+        ('name', 'name', None, 'A common name for the nonpolymer entity.'),
+    )),
+    ('Attr_ChemComp', '', (
+        ('formula', 'formula', None, "The formula for the chemical component. Formulae are written  according to the following rules:   (1) Only recognized element symbols may be used.   (2) Each element symbol is followed by a 'count' number. A count     of '1' may be omitted.   (3) A space or parenthesis must separate each cluster of     (element symbol + count), but in general parentheses are     not used.   (4) The order of elements depends on whether carbon is     present or not. If carbon is present, the order should be:     C, then H, then the other elements in alphabetical order     of their symbol. If carbon is not present, the elements     are listed purely in alphabetic order of their symbol. This     is the 'Hill' system used by Chemical Abstracts."),
+        ('formula_weight', 'formula_weight', None, 'Formula mass of the chemical component.'),
+        ('id', 'id', None, 'The value of _chem_comp.id must uniquely identify each item in  the CHEM_COMP list.   For protein polymer entities, this is the three-letter code for  the amino acid.   For nucleic acid polymer entities, this is the one-letter code  for the base.'),
+        ('mon_nstd_parent_comp_id', 'mon_nstd_parent_comp_id', None, ''),
+        ('name', 'name', None, 'The full name of the component.'),
+        ('one_letter_code', 'one_letter_code', None, "For standard polymer components, the one-letter code for  the component.   For non-standard polymer components, the  one-letter code for parent component if this exists;  otherwise, the one-letter code should be given as 'X'.   Components that derived from multiple parents components  are described by a sequence of one-letter-codes."),
+        ('pdbx_ambiguous_flag', 'pdbx_ambiguous_flag', None, 'A preliminary classification used by PDB to indicate  that the chemistry of this component while described  as clearly as possible is still ambiguous.  Software  tools may not be able to process this component  definition.'),
+        ('pdbx_formal_charge', 'pdbx_formal_charge', None, 'The net integer charge assigned to this component. This is the  formal charge assignment normally found in chemical diagrams.'),
+        ('pdbx_initial_date', 'pdbx_initial_date', None, 'Date component was added to database.'),
+        ('pdbx_modified_date', 'pdbx_modified_date', None, 'Date component was last modified.'),
+        ('pdbx_processing_site', 'pdbx_processing_site', None, 'This data item identifies the deposition site that processed  this chemical component defintion.'),
+        ('pdbx_release_status', 'pdbx_release_status', None, 'This data item holds the current release status for the component.'),
+        ('pdbx_replaced_by', 'pdbx_replaced_by', None, 'Identifies the _chem_comp.id of the component that  has replaced this component.'),
+        ('pdbx_replaces', 'pdbx_replaces', None, "Identifies the _chem_comp.id's of the components  which have been replaced by this component.  Multiple id codes should be separated by commas."),
+        ('pdbx_subcomponent_list', 'pdbx_subcomponent_list', None, 'The list of subcomponents contained in this component.'),
+        ('three_letter_code', 'three_letter_code', None, "For standard polymer components, the common three-letter code for  the component.   Non-standard polymer components and non-polymer  components are also assigned three-letter-codes.   For ambiguous polymer components three-letter code should  be given as 'UNK'.  Ambiguous ions are assigned the code 'UNX'.  Ambiguous non-polymer components are assigned the code 'UNL'."),
+        ('type', 'type', None, "For standard polymer components, the type of the monomer.  Note that monomers that will form polymers are of three types:  linking monomers, monomers with some type of N-terminal (or 5')  cap and monomers with some type of C-terminal (or 3') cap."),
+    )),
+    ('Attr_PdbxChemCompAudit', '', (
+        ('action_type', 'action_type', None, 'The action associated with this audit record.'),
+        ('comp_id', 'comp_id', None, 'This data item is a pointer to _chem_comp.id in the CHEM_COMP  category.'),
+        ('date', 'date', None, 'The date associated with this audit record.'),
+        ('details', 'details', None, 'Additional details decribing this change.'),
+        ('ordinal', 'ordinal', None, 'This data item is an ordinal index for the  PDBX_CHEM_COMP_AUDIT category.'),
+    )),
+    ('Attr_PdbxChemCompDescriptor', '', (
+        ('comp_id', 'comp_id', None, 'This data item is a pointer to _chem_comp.id in the CHEM_COMP  category.'),
+        ('descriptor', 'descriptor', None, 'This data item contains the descriptor value for this  component.'),
+        ('program', 'program', None, 'This data item contains the name of the program  or library used to compute the descriptor.'),
+        ('program_version', 'program_version', None, 'This data item contains the version of the program  or library used to compute the descriptor.'),
+        ('type', 'type', None, 'This data item contains the descriptor type.'),
+    )),
+    ('Attr_PdbxChemCompFeature', '', (
+        ('comp_id', 'comp_id', None, 'The component identifier for this feature.'),
+        ('source', 'source', None, 'The information source for the component feature.'),
+        ('type', 'type', None, 'The component feature type.'),
+        ('value', 'value', None, 'The component feature value.'),
+    )),
+    ('Attr_PdbxChemCompIdentifier', '', (
+        ('comp_id', 'comp_id', None, 'This data item is a pointer to _chem_comp.id in the CHEM_COMP  category.'),
+        ('identifier', 'identifier', None, 'This data item contains the identifier value for this  component.'),
+        ('program', 'program', None, 'This data item contains the name of the program  or library used to compute the identifier.'),
+        ('program_version', 'program_version', None, 'This data item contains the version of the program  or library used to compute the identifier.'),
+        ('type', 'type', None, 'This data item contains the identifier type.'),
+    )),
+    ('Attr_PdbxFamilyPrdAudit', '', (
+        ('action_type', 'action_type', None, 'The action associated with this audit record.'),
+        ('annotator', 'annotator', None, 'The initials of the annotator creating of modifying the family.'),
+        ('date', 'date', None, 'The date associated with this audit record.'),
+        ('details', 'details', None, 'Additional details decribing this change.'),
+        ('family_prd_id', 'family_prd_id', None, 'This data item is a pointer to _pdbx_reference_molecule_family.family_prd_id in the \t       pdbx_reference_molecule category.'),
+        ('processing_site', 'processing_site', None, 'An identifier for the wwPDB site creating or modifying the family.'),
+    )),
+    ('Attr_PdbxPrdAudit', '', (
+        ('action_type', 'action_type', None, 'The action associated with this audit record.'),
+        ('annotator', 'annotator', None, 'The initials of the annotator creating of modifying the molecule.'),
+        ('date', 'date', None, 'The date associated with this audit record.'),
+        ('details', 'details', None, 'Additional details decribing this change.'),
+        ('prd_id', 'prd_id', None, 'This data item is a pointer to _pdbx_reference_molecule.prd_id in the \t       pdbx_reference_molecule category.'),
+        ('processing_site', 'processing_site', None, 'An identifier for the wwPDB site creating or modifying the molecule.'),
+    )),
+    ('Attr_PdbxReferenceEntityList', '', (
+        ('component_id', 'component_id', None, 'The component number of this entity within the molecule.'),
+        ('details', 'details', None, 'Additional details about this entity.'),
+        ('prd_id', 'prd_id', None, 'The value of _pdbx_reference_entity_list.prd_id is a reference  _pdbx_reference_molecule.prd_id in the PDBX_REFERENCE_MOLECULE category.'),
+        ('ref_entity_id', 'ref_entity_id', None, 'The value of _pdbx_reference_entity_list.ref_entity_id is a unique identifier  the a constituent entity within this reference molecule.'),
+        ('type', 'type', None, 'Defines the polymer characteristic of the entity.'),
+    )),
+    ('Attr_PdbxReferenceEntityPoly', '', (
+        ('db_code', 'db_code', None, 'The database code for this source information'),
+        ('db_name', 'db_name', None, 'The database name for this source information'),
+        ('prd_id', 'prd_id', None, 'The value of _pdbx_reference_entity_poly.prd_id is a reference \t       _pdbx_reference_entity_list.prd_id in the  PDBX_REFERENCE_ENTITY_LIST category.'),
+        ('ref_entity_id', 'ref_entity_id', None, 'The value of _pdbx_reference_entity_poly.ref_entity_id is a reference  to _pdbx_reference_entity_list.ref_entity_id in PDBX_REFERENCE_ENTITY_LIST category.'),
+        ('type', 'type', None, 'The type of the polymer.'),
+    )),
+    ('Attr_PdbxReferenceEntityPolyLink', '', (
+        ('atom_id_1', 'atom_id_1', None, 'The atom identifier/name in the first of the two components making  the linkage.'),
+        ('atom_id_2', 'atom_id_2', None, 'The atom identifier/name in the second of the two components making  the linkage.'),
+        ('comp_id_1', 'comp_id_1', None, 'The component identifier in the first of the two components making the  linkage.   This data item is a pointer to _pdbx_reference_entity_poly_seq.mon_id  in the PDBX_REFERENCE_ENTITY_POLY_SEQ category.'),
+        ('comp_id_2', 'comp_id_2', None, 'The component identifier in the second of the two components making the  linkage.   This data item is a pointer to _pdbx_reference_entity_poly_seq.mon_id  in the PDBX_REFERENCE_ENTITY_POLY_SEQ category.'),
+        ('component_id', 'component_id', None, 'The entity component identifier entity containing the linkage.'),
+        ('entity_seq_num_1', 'entity_seq_num_1', None, 'For a polymer entity, the sequence number in the first of  the two components making the linkage.   This data item is a pointer to _pdbx_reference_entity_poly_seq.num  in the PDBX_REFERENCE_ENTITY_POLY_SEQ category.'),
+        ('entity_seq_num_2', 'entity_seq_num_2', None, 'For a polymer entity, the sequence number in the second of  the two components making the linkage.   This data item is a pointer to _pdbx_reference_entity_poly_seq.num  in the PDBX_REFERENCE_ENTITY_POLY_SEQ category.'),
+        ('link_id', 'link_id', None, 'The value of _pdbx_reference_entity_poly_link.link_id uniquely identifies  a linkage within a polymer entity.'),
+        ('prd_id', 'prd_id', None, 'The value of _pdbx_reference_entity_poly_link.prd_id is a reference  _pdbx_reference_entity_list.prd_id in the PDBX_REFERENCE_ENTITY_POLY category.'),
+        ('ref_entity_id', 'ref_entity_id', None, 'The reference entity id of the polymer entity containing the linkage.   This data item is a pointer to _pdbx_reference_entity_poly.ref_entity_id  in the PDBX_REFERENCE_ENTITY_POLY category.'),
+        ('value_order', 'value_order', None, 'The bond order target for the non-standard linkage.'),
+    )),
+    ('Attr_PdbxReferenceEntityPolySeq', '', (
+        ('hetero', 'hetero', None, 'A flag to indicate that sequence heterogeneity at this monomer position.'),
+        ('mon_id', 'mon_id', None, 'This data item is the chemical component identifier of monomer.'),
+        ('num', 'num', None, 'The value of _pdbx_reference_entity_poly_seq.num must uniquely and sequentially  identify a record in the PDBX_REFERENCE_ENTITY_POLY_SEQ list.   This value is conforms to author numbering conventions and does not map directly  to the numbering conventions used for _entity_poly_seq.num.'),
+        ('observed', 'observed', None, 'A flag to indicate that this monomer is observed in the instance example.'),
+        ('parent_mon_id', 'parent_mon_id', None, 'This data item is the chemical component identifier for the parent component corresponding to this monomer.'),
+        ('prd_id', 'prd_id', None, 'The value of _pdbx_reference_entity_poly_seq.prd_id is a reference \t       _pdbx_reference_entity_poly.prd_id in the  PDBX_REFERENCE_ENTITY_POLY category.'),
+        ('ref_entity_id', 'ref_entity_id', None, 'The value of _pdbx_reference_entity_poly_seq.ref_entity_id is a reference  to _pdbx_reference_entity_poly.ref_entity_id in PDBX_REFERENCE_ENTITY_POLY category.'),
+    )),
+    ('Attr_PdbxReferenceEntitySequence', '', (
+        ('NRP_flag', 'NRP_flag', None, 'A flag to indicate a non-ribosomal entity.'),
+        ('one_letter_codes', 'one_letter_codes', None, "The one-letter-code sequence for this entity.  Non-standard monomers are represented as 'X'."),
+        ('prd_id', 'prd_id', None, 'The value of _pdbx_reference_entity_sequence.prd_id is a reference \t       _pdbx_reference_entity_list.prd_id in the  PDBX_REFERENCE_ENTITY_LIST category.'),
+        ('ref_entity_id', 'ref_entity_id', None, 'The value of _pdbx_reference_entity_sequence.ref_entity_id is a reference  to _pdbx_reference_entity_list.ref_entity_id in PDBX_REFERENCE_ENTITY_LIST category.'),
+        ('type', 'type', None, 'The monomer type for the sequence.'),
+    )),
+    ('Attr_PdbxReferenceEntitySrcNat', '', (
+        ('atcc', 'atcc', None, 'The Americal Tissue Culture Collection code for organism from which the entity was isolated.'),
+        ('db_code', 'db_code', None, 'The database code for this source information'),
+        ('db_name', 'db_name', None, 'The database name for this source information'),
+        ('ordinal', 'ordinal', None, 'The value of _pdbx_reference_entity_src_nat.ordinal distinguishes \t       source details for this entity.'),
+        ('organism_scientific', 'organism_scientific', None, 'The scientific name of the organism from which the entity was isolated.'),
+        ('prd_id', 'prd_id', None, 'The value of _pdbx_reference_entity_src_nat.prd_id is a reference \t       _pdbx_reference_entity_list.prd_id in the  PDBX_REFERENCE_ENTITY_LIST category.'),
+        ('ref_entity_id', 'ref_entity_id', None, 'The value of _pdbx_reference_entity_src_nat.ref_entity_id is a reference  to _pdbx_reference_entity_list.ref_entity_id in PDBX_REFERENCE_ENTITY_LIST category.'),
+        ('source', 'source', None, 'The data source for this information.'),
+        ('source_id', 'source_id', None, 'A identifier within the data source for this information.'),
+        ('taxid', 'taxid', None, 'The NCBI TaxId of the organism from which the entity was isolated.'),
+    )),
+    ('Attr_PdbxReferenceMolecule', '', (
+        ('chem_comp_id', 'chem_comp_id', None, 'For entities represented as single molecules, the identifier  corresponding to the chemical definition for the molecule.'),
+        ('class_', 'class', None, 'Broadly defines the function of the entity.'),
+        ('class_evidence_code', 'class_evidence_code', None, 'Evidence for the assignment of _pdbx_reference_molecule.class'),
+        ('compound_details', 'compound_details', None, 'Special details about this molecule.'),
+        ('description', 'description', None, 'Description of this molecule.'),
+        ('formula', 'formula', None, "The formula for the reference entity. Formulae are written  according to the rules:   1. Only recognised element symbols may be used.   2. Each element symbol is followed by a 'count' number. A count     of '1' may be omitted.   3. A space or parenthesis must separate each element symbol and     its count, but in general parentheses are not used.   4. The order of elements depends on whether or not carbon is     present. If carbon is present, the order should be: C, then     H, then the other elements in alphabetical order of their     symbol. If carbon is not present, the elements are listed     purely in alphabetic order of their symbol. This is the     'Hill' system used by Chemical Abstracts."),
+        ('formula_weight', 'formula_weight', None, 'Formula mass in daltons of the entity.'),
+        ('name', 'name', None, 'A name of the entity.'),
+        ('prd_id', 'prd_id', None, 'The value of _pdbx_reference_molecule.prd_id is the unique identifier  for the reference molecule in this family.   By convention this ID uniquely identifies the reference molecule in  in the PDB reference dictionary.   The ID has the template form PRD_dddddd (e.g. PRD_000001)'),
+        ('release_status', 'release_status', None, 'Defines the current PDB release status for this molecule definition.'),
+        ('replaced_by', 'replaced_by', None, 'Assigns the identifier of the reference molecule that has replaced this molecule.'),
+        ('replaces', 'replaces', None, 'Assigns the identifier for the reference molecule which have been replaced  by this reference molecule.  Multiple molecule identifier codes should be separated by commas.'),
+        ('represent_as', 'represent_as', None, 'Defines how this entity is represented in PDB data files.'),
+        ('representative_PDB_id_code', 'representative_PDB_id_code', None, 'The PDB accession code for the entry containing a representative example of this molecule.'),
+        ('type', 'type', None, 'Defines the structural classification of the entity.'),
+        ('type_evidence_code', 'type_evidence_code', None, 'Evidence for the assignment of _pdbx_reference_molecule.type'),
+    )),
+    ('Attr_PdbxReferenceMoleculeAnnotation', '', (
+        ('family_prd_id', 'family_prd_id', None, 'The value of _pdbx_reference_molecule_annotation.family_prd_id is a reference to  _pdbx_reference_molecule_list.family_prd_id in category PDBX_REFERENCE_MOLECULE_FAMILY_LIST.'),
+        ('ordinal', 'ordinal', None, 'This data item distinguishes anotations for this entity.'),
+        ('prd_id', 'prd_id', None, 'This data item is a pointer to _pdbx_reference_molecule.prd_id in the  PDB_REFERENCE_MOLECULE category.'),
+        ('source', 'source', None, 'The source of the annoation for this entity.'),
+        ('text', 'text', None, 'Text describing the annotation for this entity.'),
+        ('type', 'type', None, 'Type of annotation for this entity.'),
+    )),
+    ('Attr_PdbxReferenceMoleculeDetails', '', (
+        ('family_prd_id', 'family_prd_id', None, "The value of _pdbx_reference_molecule_details.family_prd_id is a reference to  _pdbx_reference_molecule_list.family_prd_id' in category PDBX_REFERENCE_MOLECULE_FAMILY."),
+        ('ordinal', 'ordinal', None, 'The value of _pdbx_reference_molecule_details.ordinal is an ordinal that  distinguishes each descriptive text for this entity.'),
+        ('source', 'source', None, 'A data source of this information (e.g. PubMed, Merck Index)'),
+        ('source_id', 'source_id', None, 'A identifier within the data source for this information.'),
+        ('text', 'text', None, 'The text of the description of special aspects of the entity.'),
+    )),
+    ('Attr_PdbxReferenceMoleculeFamily', '', (
+        ('family_prd_id', 'family_prd_id', None, 'The value of _pdbx_reference_entity.family_prd_id must uniquely identify a record in the  PDBX_REFERENCE_MOLECULE_FAMILY list.   By convention this ID uniquely identifies the reference family in  in the PDB reference dictionary.   The ID has the template form FAM_dddddd (e.g. FAM_000001)'),
+        ('name', 'name', None, 'The entity family name.'),
+        ('release_status', 'release_status', None, 'Assigns the current PDB release status for this family.'),
+        ('replaced_by', 'replaced_by', None, 'Assigns the identifier of the family that has replaced this component.'),
+        ('replaces', 'replaces', None, 'Assigns the identifier for the family which have been replaced by this family.  Multiple family identifier codes should be separated by commas.'),
+    )),
+    ('Attr_PdbxReferenceMoleculeFeatures', '', (
+        ('family_prd_id', 'family_prd_id', None, 'The value of _pdbx_reference_molecule_features.family_prd_id is a reference to  _pdbx_reference_molecule_list.family_prd_id in category PDBX_REFERENCE_MOLECULE_FAMILY_LIST.'),
+        ('ordinal', 'ordinal', None, 'The value of _pdbx_reference_molecule_features.ordinal distinguishes \t       each feature for this entity.'),
+        ('prd_id', 'prd_id', None, 'The value of _pdbx_reference_molecule_features.prd_id is a reference \t       _pdbx_reference_molecule.prd_id in the  PDBX_REFERENCE_MOLECULE category.'),
+        ('source', 'source', None, 'The information source for the component feature.'),
+        ('source_ordinal', 'source_ordinal', None, 'The value of _pdbx_reference_molecule_features.source_ordinal provides \t       the priority order of features from a particular source or database.'),
+        ('type', 'type', None, 'The entity feature type.'),
+        ('value', 'value', None, 'The entity feature value.'),
+    )),
+    ('Attr_PdbxReferenceMoleculeList', '', (
+        ('family_prd_id', 'family_prd_id', None, "The value of _pdbx_reference_molecule_list.family_prd_id is a reference to  _pdbx_reference_molecule_family.family_prd_id' in category PDBX_REFERENCE_MOLECULE_FAMILY."),
+        ('prd_id', 'prd_id', None, 'The value of _pdbx_reference_molecule_list.prd_id is the unique identifier  for the reference molecule in this family.   By convention this ID uniquely identifies the reference molecule in  in the PDB reference dictionary.   The ID has the template form PRD_dddddd (e.g. PRD_000001)'),
+    )),
+    ('Attr_PdbxReferenceMoleculeRelatedStructures', '', (
+        ('citation_id', 'citation_id', None, 'A link to related reference information in the citation category.'),
+        ('db_accession', 'db_accession', None, 'The database accession code for the related structure reference.'),
+        ('db_code', 'db_code', None, 'The database identifier code for the related structure reference.'),
+        ('db_name', 'db_name', None, 'The database name for the related structure reference.'),
+        ('family_prd_id', 'family_prd_id', None, 'The value of _pdbx_reference_molecule_related_structures.family_prd_id is a reference to  _pdbx_reference_molecule_list.family_prd_id in category PDBX_REFERENCE_MOLECULE_FAMILY_LIST.'),
+        ('formula', 'formula', None, "The formula for the reference entity. Formulae are written  according to the rules:   1. Only recognised element symbols may be used.   2. Each element symbol is followed by a 'count' number. A count     of '1' may be omitted.   3. A space or parenthesis must separate each element symbol and     its count, but in general parentheses are not used.   4. The order of elements depends on whether or not carbon is     present. If carbon is present, the order should be: C, then     H, then the other elements in alphabetical order of their     symbol. If carbon is not present, the elements are listed     purely in alphabetic order of their symbol. This is the     'Hill' system used by Chemical Abstracts."),
+        ('name', 'name', None, 'The chemical name for the structure entry in the related database'),
+        ('ordinal', 'ordinal', None, 'The value of _pdbx_reference_molecule_related_structures.ordinal distinguishes  related structural data for each entity.'),
+    )),
+    ('Attr_PdbxReferenceMoleculeSynonyms', '', (
+        ('family_prd_id', 'family_prd_id', None, 'The value of _pdbx_reference_molecule_synonyms.family_prd_id is a reference to  _pdbx_reference_molecule_list.family_prd_id in category PDBX_REFERENCE_MOLECULE_FAMILY_LIST.'),
+        ('name', 'name', None, 'A synonym name for the entity.'),
+        ('ordinal', 'ordinal', None, 'The value of _pdbx_reference_molecule_synonyms.ordinal is an ordinal \t       to distinguish synonyms for this entity.'),
+        ('prd_id', 'prd_id', None, 'The value of _pdbx_reference_molecule_synonyms.prd_id is a reference \t       _pdbx_reference_molecule.prd_id in the  PDBX_REFERENCE_MOLECULE category.'),
+        ('source', 'source', None, 'The source of this synonym name for the entity.'),
+    )),
+    ('Attr_RcsbBirdCitation', '', (
+        ('id', 'id', None, 'The value of _rcsb_bird_citation.id must uniquely identify a record in the  rcsb_bird_citation list.'),
+        ('journal_abbrev', 'journal_abbrev', None, 'Abbreviated name of the cited journal as given in the  Chemical Abstracts Service Source Index.'),
+        ('journal_volume', 'journal_volume', None, 'Volume number of the journal cited; relevant for journal  articles.'),
+        ('page_first', 'page_first', None, 'The first page of the rcsb_bird_citation; relevant for journal  articles, books and book chapters.'),
+        ('page_last', 'page_last', None, 'The last page of the rcsb_bird_citation; relevant for journal  articles, books and book chapters.'),
+        ('pdbx_database_id_DOI', 'pdbx_database_id_DOI', None, 'Document Object Identifier used by doi.org to uniquely  specify bibliographic entry.'),
+        ('pdbx_database_id_PubMed', 'pdbx_database_id_PubMed', None, 'Ascession number used by PubMed to categorize a specific  bibliographic entry.'),
+        ('rcsb_authors', 'rcsb_authors', None, ''),
+        ('title', 'title', None, 'The title of the rcsb_bird_citation; relevant for journal articles, books  and book chapters.'),
+        ('year', 'year', None, 'The year of the rcsb_bird_citation; relevant for journal articles, books  and book chapters.'),
+    )),
+    ('Attr_RcsbChemCompAnnotation', '', (
+        ('annotation_id', 'annotation_id', None, 'An identifier for the annotation.'),
+        ('assignment_version', 'assignment_version', None, 'Identifies the version of the annotation assignment.'),
+        ('description', 'description', None, 'A description for the annotation.'),
+        ('name', 'name', None, 'A name for the annotation.'),
+        ('provenance_source', 'provenance_source', None, 'Code identifying the individual, organization or program that  assigned the annotation.'),
+        ('type', 'type', None, 'A type or category of the annotation.'),
+        ('annotation_lineage', 'annotation_lineage', 3, ''),
+    )),
+    ('Attr_RcsbChemCompContainerIdentifiers', '', (
+        ('atc_codes', 'atc_codes', None, ''),
+        ('comp_id', 'comp_id', None, 'The chemical component identifier.'),
+        ('drugbank_id', 'drugbank_id', None, 'The DrugBank identifier corresponding to the chemical component.'),
+        ('prd_id', 'prd_id', None, 'The BIRD definition identifier.'),
+        ('rcsb_id', 'rcsb_id', None, 'A unique identifier for the chemical definition in this container.'),
+        ('subcomponent_ids', 'subcomponent_ids', None, ''),
+    )),
+    ('Attr_RcsbChemCompDescriptor', '', (
+        ('InChI', 'InChI', None, 'Standard IUPAC International Chemical Identifier (InChI) descriptor for the chemical component.     InChI, the IUPAC International Chemical Identifier,    by Stephen R Heller, Alan McNaught, Igor Pletnev, Stephen Stein and Dmitrii Tchekhovskoi,    Journal of Cheminformatics, 2015, 7:23;'),
+        ('InChIKey', 'InChIKey', None, 'Standard IUPAC International Chemical Identifier (InChI) descriptor key  for the chemical component   InChI, the IUPAC International Chemical Identifier,  by Stephen R Heller, Alan McNaught, Igor Pletnev, Stephen Stein and Dmitrii Tchekhovskoi,  Journal of Cheminformatics, 2015, 7:23'),
+        ('SMILES', 'SMILES', None, "Simplified molecular-input line-entry system (SMILES) descriptor for the chemical component.     Weininger D (February 1988). 'SMILES, a chemical language and information system. 1.    Introduction to methodology and encoding rules'. Journal of Chemical Information and Modeling. 28 (1): 31-6.     Weininger D, Weininger A, Weininger JL (May 1989).    'SMILES. 2. Algorithm for generation of unique SMILES notation',    Journal of Chemical Information and Modeling. 29 (2): 97-101."),
+        ('SMILES_stereo', 'SMILES_stereo', None, "Simplified molecular-input line-entry system (SMILES) descriptor for the chemical  component including stereochemical features.   Weininger D (February 1988). 'SMILES, a chemical language and information system. 1.  Introduction to methodology and encoding rules'.  Journal of Chemical Information and Modeling. 28 (1): 31-6.   Weininger D, Weininger A, Weininger JL (May 1989).  'SMILES. 2. Algorithm for generation of unique SMILES notation'.  Journal of Chemical Information and Modeling. 29 (2): 97-101."),
+        ('comp_id', 'comp_id', None, 'The chemical component identifier.'),
+    )),
+    ('Attr_RcsbChemCompInfo', '', (
+        ('atom_count', 'atom_count', None, 'Chemical component total atom count'),
+        ('atom_count_chiral', 'atom_count_chiral', None, 'Chemical component chiral atom count'),
+        ('atom_count_heavy', 'atom_count_heavy', None, 'Chemical component heavy atom count'),
+        ('bond_count', 'bond_count', None, 'Chemical component total bond count'),
+        ('bond_count_aromatic', 'bond_count_aromatic', None, 'Chemical component aromatic bond count'),
+        ('comp_id', 'comp_id', None, 'The chemical component identifier.'),
+        ('initial_deposition_date', 'initial_deposition_date', None, 'The date the chemical definition was first deposited in the PDB repository.'),
+        ('initial_release_date', 'initial_release_date', None, 'The initial date the chemical definition was released in the PDB repository.'),
+        ('release_status', 'release_status', None, 'The release status of the chemical definition.'),
+        ('revision_date', 'revision_date', None, 'The date of last revision of the chemical definition.'),
+    )),
+    ('Attr_RcsbChemCompRelated', '', (
+        ('comp_id', 'comp_id', None, 'The value of _rcsb_chem_comp_related.comp_id is a reference to  a chemical component definition.'),
+        ('ordinal', 'ordinal', None, 'The value of _rcsb_chem_comp_related.ordinal distinguishes  related examples for each chemical component.'),
+        ('related_mapping_method', 'related_mapping_method', None, 'The method used to establish the resource correspondence.'),
+        ('resource_accession_code', 'resource_accession_code', None, 'The resource identifier code for the related chemical reference.'),
+        ('resource_name', 'resource_name', None, 'The resource name for the related chemical reference.'),
+    )),
+    ('Attr_RcsbChemCompSynonyms', '', (
+        ('comp_id', 'comp_id', None, 'The chemical component to which this synonym applies.'),
+        ('name', 'name', None, 'The synonym of this particular chemical component.'),
+        ('ordinal', 'ordinal', None, 'This data item is an ordinal index for the  RCSB_CHEM_COMP_SYNONYMS category.'),
+        ('provenance_source', 'provenance_source', None, 'The provenance of this synonym.'),
+        ('type', 'type', None, 'This data item contains the synonym type.'),
+    )),
+    ('Attr_RcsbChemCompTarget', '', (
+        ('comp_id', 'comp_id', None, 'The value of _rcsb_chem_comp_target.comp_id is a reference to  a chemical component definition.'),
+        ('interaction_type', 'interaction_type', None, 'The type of target interaction.'),
+        ('name', 'name', None, 'The chemical component target name.'),
+        ('ordinal', 'ordinal', None, 'The value of _rcsb_chem_comp_target.ordinal distinguishes  related examples for each chemical component.'),
+        ('provenance_source', 'provenance_source', None, 'A code indicating the provenance of the target interaction assignment'),
+        ('reference_database_accession_code', 'reference_database_accession_code', None, 'The reference identifier code for the target interaction reference.'),
+        ('reference_database_name', 'reference_database_name', None, 'The reference database name for the target interaction.'),
+        ('target_actions', 'target_actions', None, ''),
+    )),
+    ('Attr_RcsbSchemaContainerIdentifiers', '', (
+        ('collection_name', 'collection_name', None, 'Collection name associated with the data in the container.'),
+        ('collection_schema_version', 'collection_schema_version', None, 'Version string for the schema and collection.'),
+        ('schema_name', 'schema_name', None, 'Schema name associated with the data in the container.'),
+    )),
+    ('Attr_PdbxStructAssembly', '', (
+        ('details', 'details', None, "A description of special aspects of the macromolecular assembly.                 In the PDB, 'representative helical assembly', 'complete point assembly', \t       'complete icosahedral assembly', 'software_defined_assembly', 'author_defined_assembly', \t       and 'author_and_software_defined_assembly' are considered 'biologically relevant assemblies."),
+        ('id', 'id', None, 'The value of _pdbx_struct_assembly.id must uniquely identify a record in  the PDBX_STRUCT_ASSEMBLY list.'),
+        ('method_details', 'method_details', None, 'Provides details of the method used to determine or  compute the assembly.'),
+        ('oligomeric_count', 'oligomeric_count', None, 'The number of polymer molecules in the assembly.'),
+        ('oligomeric_details', 'oligomeric_details', None, 'Provides the details of the oligomeric state of the assembly.'),
+        ('rcsb_candidate_assembly', 'rcsb_candidate_assembly', None, "Candidate macromolecular assembly.   Excludes the following cases classified in pdbx_struct_asembly.details:   'crystal asymmetric unit', 'crystal asymmetric unit, crystal frame', 'helical asymmetric unit',  'helical asymmetric unit, std helical frame','icosahedral 23 hexamer', 'icosahedral asymmetric unit',  'icosahedral asymmetric unit, std point frame','icosahedral pentamer', 'pentasymmetron capsid unit',  'point asymmetric unit', 'point asymmetric unit, std point frame','trisymmetron capsid unit',   and 'deposited_coordinates'."),
+        ('rcsb_details', 'rcsb_details', None, 'A filtered description of the macromolecular assembly.'),
+    )),
+    ('Attr_PdbxStructAssemblyAuthEvidence', '', (
+        ('assembly_id', 'assembly_id', None, 'This item references an assembly in pdbx_struct_assembly'),
+        ('details', 'details', None, 'Provides any additional information regarding the evidence of this assembly'),
+        ('experimental_support', 'experimental_support', None, 'Provides the experimental method to determine the state of this assembly'),
+        ('id', 'id', None, 'Identifies a unique record in pdbx_struct_assembly_auth_evidence.'),
+    )),
+    ('Attr_PdbxStructAssemblyGen', '', (
+        ('assembly_id', 'assembly_id', None, 'This data item is a pointer to _pdbx_struct_assembly.id in the  PDBX_STRUCT_ASSEMBLY category.'),
+        ('asym_id_list', 'asym_id_list', None, ''),
+        ('oper_expression', 'oper_expression', None, 'Identifies the operation of collection of operations  from category PDBX_STRUCT_OPER_LIST.   Operation expressions may have the forms:    (1)        the single operation 1   (1,2,5)    the operations 1, 2, 5   (1-4)      the operations 1,2,3 and 4   (1,2)(3,4) the combinations of operations              3 and 4 followed by 1 and 2 (i.e.              the cartesian product of parenthetical              groups applied from right to left)'),
+        ('ordinal', 'ordinal', None, 'This data item is an ordinal index for the  PDBX_STRUCT_ASSEMBLY category.'),
+    )),
+    ('Attr_PdbxStructAssemblyProp', '', (
+        ('assembly_id', 'assembly_id', None, 'The identifier for the assembly used in category PDBX_STRUCT_ASSEMBLY.'),
+        ('biol_id', 'biol_id', None, 'The identifier for the assembly used in category PDBX_STRUCT_ASSEMBLY.'),
+        ('type', 'type', None, 'The property type for the assembly.'),
+        ('value', 'value', None, 'The value of the assembly property.'),
+    )),
+    ('Attr_PdbxStructOperList', '', (
+        ('id', 'id', None, 'This identifier code must uniquely identify a  record in the PDBX_STRUCT_OPER_LIST list.'),
+        ('matrix_1_1', 'matrix_1_1', None, 'The [1][1] element of the 3x3 matrix component of the  transformation operation.'),
+        ('matrix_1_2', 'matrix_1_2', None, 'The [1][2] element of the 3x3 matrix component of the  transformation operation.'),
+        ('matrix_1_3', 'matrix_1_3', None, 'The [1][3] element of the 3x3 matrix component of the  transformation operation.'),
+        ('matrix_2_1', 'matrix_2_1', None, 'The [2][1] element of the 3x3 matrix component of the  transformation operation.'),
+        ('matrix_2_2', 'matrix_2_2', None, 'The [2][2] element of the 3x3 matrix component of the  transformation operation.'),
+        ('matrix_2_3', 'matrix_2_3', None, 'The [2][3] element of the 3x3 matrix component of the  transformation operation.'),
+        ('matrix_3_1', 'matrix_3_1', None, 'The [3][1] element of the 3x3 matrix component of the  transformation operation.'),
+        ('matrix_3_2', 'matrix_3_2', None, 'The [3][2] element of the 3x3 matrix component of the  transformation operation.'),
+        ('matrix_3_3', 'matrix_3_3', None, 'The [3][3] element of the 3x3 matrix component of the  transformation operation.'),
+        ('name', 'name', None, 'A descriptive name for the transformation operation.'),
+        ('symmetry_operation', 'symmetry_operation', None, 'The symmetry operation corresponding to the transformation operation.'),
+        ('type', 'type', None, 'A code to indicate the type of operator.'),
+        ('vector_1', 'vector_1', None, 'The [1] element of the three-element vector component of the  transformation operation.'),
+        ('vector_2', 'vector_2', None, 'The [2] element of the three-element vector component of the  transformation operation.'),
+        ('vector_3', 'vector_3', None, 'The [3] element of the three-element vector component of the  transformation operation.'),
+    )),
+    ('Attr_RcsbAssemblyAnnotation', '', (
+        ('annotation_id', 'annotation_id', None, 'An identifier for the annotation.'),
+        ('assignment_version', 'assignment_version', None, 'Identifies the version of the annotation assignment.'),
+        ('description', 'description', None, 'A description for the annotation.'),
+        ('name', 'name', None, 'A name for the annotation.'),
+        ('provenance_source', 'provenance_source', None, 'Code identifying the individual, organization or program that assigned the annotation.'),
+        ('type', 'type', None, 'A type or category of the annotation.'),
+        ('additional_properties', 'additional_properties', 6, ''),
+    )),
+    ('Attr_RcsbAssemblyContainerIdentifiers', '', (
+        ('assembly_id', 'assembly_id', None, 'Assembly identifier for the container.'),
+        ('entry_id', 'entry_id', None, 'Entry identifier for the container.'),
+        ('interface_ids', 'interface_ids', None, ''),
+        ('rcsb_id', 'rcsb_id', None, 'A unique identifier for each object in this assembly container formed by  a dash separated concatenation of entry and assembly identifiers.'),
+    )),
+    ('Attr_FeaturePositions', '', (
+        ('asym_id', 'asym_id', None, 'An identifier of polymer chain (label_asym_id) corresponding to the feature assignment.'),
+        ('beg_seq_id', 'beg_seq_id', None, 'An identifier for the monomer at which this segment of the feature begins.'),
+        ('end_seq_id', 'end_seq_id', None, 'An identifier for the monomer at which this segment of the feature ends.'),
+        ('struct_oper_list', 'struct_oper_list', None, ''),
+        ('values', 'values', None, ''),
+    )),
+    ('Attr_RcsbAssemblyFeature', '', (
+        ('assignment_version', 'assignment_version', None, 'Identifies the version of the feature assignment.'),
+        ('description', 'description', None, 'A description for the feature.'),
+        ('feature_id', 'feature_id', None, 'An identifier for the feature.'),
+        ('name', 'name', None, 'A name for the feature.'),
+        ('provenance_source', 'provenance_source', None, 'Code identifying the individual, organization or program that assigned the feature.'),
+        ('type', 'type', None, 'A type or category of the feature.'),
+        ('additional_properties', 'additional_properties', 6, ''),
+        ('feature_positions', 'feature_positions', 48, ''),
+    )),
+    ('Attr_RcsbAssemblyInfo', '', (
+        ('assembly_id', 'assembly_id', None, 'Entity identifier for the container.'),
+        ('atom_count', 'atom_count', None, 'The assembly non-hydrogen atomic coordinate count.'),
+        ('branched_atom_count', 'branched_atom_count', None, 'The assembly non-hydrogen branched entity atomic coordinate count.'),
+        ('branched_entity_count', 'branched_entity_count', None, 'The number of distinct branched entities in the generated assembly.'),
+        ('branched_entity_instance_count', 'branched_entity_instance_count', None, 'The number of branched instances in the generated assembly data set.  This is the total count of branched entity instances generated in the assembly coordinate data.'),
+        ('deuterated_water_count', 'deuterated_water_count', None, 'The assembly deuterated water molecule count.'),
+        ('entry_id', 'entry_id', None, 'The PDB entry accession code.'),
+        ('hydrogen_atom_count', 'hydrogen_atom_count', None, 'The assembly hydrogen atomic coordinate count.'),
+        ('modeled_polymer_monomer_count', 'modeled_polymer_monomer_count', None, 'The number of modeled polymer monomers in the assembly coordinate data.  This is the total count of monomers with reported coordinate data for all polymer  entity instances in the generated assembly coordinate data.'),
+        ('na_polymer_entity_types', 'na_polymer_entity_types', None, 'Nucleic acid polymer entity type categories describing the generated assembly.'),
+        ('nonpolymer_atom_count', 'nonpolymer_atom_count', None, 'The assembly non-hydrogen non-polymer entity atomic coordinate count.'),
+        ('nonpolymer_entity_count', 'nonpolymer_entity_count', None, 'The number of distinct non-polymer entities in the generated assembly exclusive of solvent.'),
+        ('nonpolymer_entity_instance_count', 'nonpolymer_entity_instance_count', None, 'The number of non-polymer instances in the generated assembly data set exclusive of solvent.  This is the total count of non-polymer entity instances generated in the assembly coordinate data.'),
+        ('num_heterologous_interface_entities', 'num_heterologous_interface_entities', None, 'Number of heterologous (both binding sites are different) interface entities'),
+        ('num_heteromeric_interface_entities', 'num_heteromeric_interface_entities', None, 'Number of heteromeric (both partners are different polymeric entities) interface entities'),
+        ('num_homomeric_interface_entities', 'num_homomeric_interface_entities', None, 'Number of homomeric (both partners are the same polymeric entity) interface entities'),
+        ('num_interface_entities', 'num_interface_entities', None, 'Number of polymer-polymer interface entities, grouping equivalent interfaces at the entity level (i.e. same entity_ids on either side, with similar but not identical binding sites)'),
+        ('num_interfaces', 'num_interfaces', None, 'Number of geometrically equivalent (i.e. same asym_ids on either side) polymer-polymer interfaces in the assembly'),
+        ('num_isologous_interface_entities', 'num_isologous_interface_entities', None, 'Number of isologous (both binding sites are same, i.e. interface is symmetric) interface entities'),
+        ('num_na_interface_entities', 'num_na_interface_entities', None, 'Number of nucleic acid-nucleic acid interface entities'),
+        ('num_prot_na_interface_entities', 'num_prot_na_interface_entities', None, 'Number of protein-nucleic acid interface entities'),
+        ('num_protein_interface_entities', 'num_protein_interface_entities', None, 'Number of protein-protein interface entities'),
+        ('polymer_atom_count', 'polymer_atom_count', None, 'The assembly non-hydrogen polymer entity atomic coordinate count.'),
+        ('polymer_composition', 'polymer_composition', None, 'Categories describing the polymer entity composition for the generated assembly.'),
+        ('polymer_entity_count', 'polymer_entity_count', None, 'The number of distinct polymer entities in the generated assembly.'),
+        ('polymer_entity_count_DNA', 'polymer_entity_count_DNA', None, 'The number of distinct DNA polymer entities in the generated assembly.'),
+        ('polymer_entity_count_RNA', 'polymer_entity_count_RNA', None, 'The number of distinct RNA polymer entities in the generated assembly.'),
+        ('polymer_entity_count_nucleic_acid', 'polymer_entity_count_nucleic_acid', None, 'The number of distinct nucleic acid polymer entities (DNA or RNA) in the generated assembly.'),
+        ('polymer_entity_count_nucleic_acid_hybrid', 'polymer_entity_count_nucleic_acid_hybrid', None, 'The number of distinct hybrid nucleic acid polymer entities in the generated assembly.'),
+        ('polymer_entity_count_protein', 'polymer_entity_count_protein', None, 'The number of distinct protein polymer entities in the generated assembly.'),
+        ('polymer_entity_instance_count', 'polymer_entity_instance_count', None, 'The number of polymer instances in the generated assembly data set.  This is the total count of polymer entity instances generated in the assembly coordinate data.'),
+        ('polymer_entity_instance_count_DNA', 'polymer_entity_instance_count_DNA', None, 'The number of DNA polymer instances in the generated assembly data set.  This is the total count of DNA polymer entity instances generated in the assembly coordinate data.'),
+        ('polymer_entity_instance_count_RNA', 'polymer_entity_instance_count_RNA', None, 'The number of RNA polymer instances in the generated assembly data set.  This is the total count of RNA polymer entity instances generated in the assembly coordinate data.'),
+        ('polymer_entity_instance_count_nucleic_acid', 'polymer_entity_instance_count_nucleic_acid', None, 'The number of nucleic acid polymer instances in the generated assembly data set.  This is the total count of nucleic acid polymer entity instances generated in the assembly coordinate data.'),
+        ('polymer_entity_instance_count_nucleic_acid_hybrid', 'polymer_entity_instance_count_nucleic_acid_hybrid', None, 'The number of hybrid nucleic acide polymer instances in the generated assembly data set.  This is the total count of hybrid nucleic acid polymer entity instances generated in the assembly coordinate data.'),
+        ('polymer_entity_instance_count_protein', 'polymer_entity_instance_count_protein', None, 'The number of protein polymer instances in the generated assembly data set.  This is the total count of protein polymer entity instances generated in the assembly coordinate data.'),
+        ('polymer_monomer_count', 'polymer_monomer_count', None, 'The number of polymer monomers in sample entity instances comprising the assembly data set.  This is the total count of monomers for all polymer entity instances  in the generated assembly coordinate data.'),
+        ('selected_polymer_entity_types', 'selected_polymer_entity_types', None, 'Selected polymer entity type categories describing the generated assembly.'),
+        ('solvent_atom_count', 'solvent_atom_count', None, 'The assembly non-hydrogen solvent atomic coordinate count.'),
+        ('solvent_entity_count', 'solvent_entity_count', None, 'The number of distinct solvent entities in the generated assembly.'),
+        ('solvent_entity_instance_count', 'solvent_entity_instance_count', None, 'The number of solvent instances in the generated assembly data set.  This is the total count of solvent entity instances generated in the assembly coordinate data.'),
+        ('total_assembly_buried_surface_area', 'total_assembly_buried_surface_area', None, 'Total buried surface area calculated as the sum of buried surface areas over all interfaces'),
+        ('total_number_interface_residues', 'total_number_interface_residues', None, 'Total number of interfacing residues in the assembly, calculated as the sum of interfacing residues over all interfaces'),
+        ('unmodeled_polymer_monomer_count', 'unmodeled_polymer_monomer_count', None, 'The number of unmodeled polymer monomers in the assembly coordinate data. This is  the total count of monomers with unreported coordinate data for all polymer  entity instances in the generated assembly coordinate data.'),
+    )),
+    ('Attr_RotationAxes', 'Specifies a single or multiple rotation axes through the same point.', (
+        ('end', 'end', None, 'Describes x,y,z coordinates of the end point of the symmetry axis.'),
+        ('order', 'order', None, 'The number of times (order of rotation) that a subunit can be repeated by a rotation operation,  being transformed into a new state indistinguishable from its starting state.'),
+        ('start', 'start', None, 'Describes x,y,z coordinates of the start point of the symmetry axis.'),
+    )),
+    ('Attr_Members', '', (
+        ('asym_id', 'asym_id', None, 'Internal chain ID used in mmCIF files to uniquely identify structural elements in the asymmetric unit.'),
+        ('pdbx_struct_oper_list_ids', 'pdbx_struct_oper_list_ids', None, 'Optional list of operator ids (pdbx_struct_oper_list.id) as appears in pdbx_struct_assembly_gen.oper_expression.'),
+    )),
+    ('Attr_Clusters', 'Clusters describe grouping of identical subunits.', (
+        ('members', 'members', 52, ''),
+        ('avg_rmsd', 'avg_rmsd', None, 'Average RMSD between members of a given cluster.'),
+    )),
+    ('Attr_RcsbStructSymmetry', '', (
+        ('kind', 'kind', None, "The granularity at which the symmetry calculation is performed. In 'Global Symmetry' all polymeric  subunits in assembly are used. In 'Local Symmetry' only a subset of polymeric subunits is considered.  In 'Pseudo Symmetry' the threshold for subunits similarity is relaxed."),
+        ('oligomeric_state', 'oligomeric_state', None, "Oligomeric state refers to a composition of polymeric subunits in quaternary structure.  Quaternary structure may be composed either exclusively of several copies of identical subunits,  in which case they are termed homo-oligomers, or alternatively by at least one copy of different  subunits (hetero-oligomers). Quaternary structure composed of a single subunit is denoted as 'Monomer'."),
+        ('stoichiometry', 'stoichiometry', None, ''),
+        ('symbol', 'symbol', None, 'Symmetry symbol refers to point group or helical symmetry of identical polymeric subunits in Schoenflies notation.  Contains point group symbol (e.g., C2, C5, D2, T, O, I) or H for helical symmetry.'),
+        ('type', 'type', None, 'Symmetry type refers to point group or helical symmetry of identical polymeric subunits.  Contains point group types (e.g. Cyclic, Dihedral) or Helical for helical symmetry.'),
+        ('rotation_axes', 'rotation_axes', 51, 'Specifies a single or multiple rotation axes through the same point.'),
+        ('clusters', 'clusters', 53, 'Clusters describe grouping of identical subunits.'),
+    )),
+    ('Attr_RcsbStructSymmetryLineage', '', (
+        ('depth', 'depth', None, 'Hierarchy depth.'),
+        ('id', 'id', None, 'Automatically assigned ID to uniquely identify the symmetry term in the Protein Symmetry Browser.'),
+        ('name', 'name', None, 'A human-readable term describing protein symmetry.'),
+    )),
+    ('Attr_RcsbRepositoryHoldingsCurrent', '', (
+        ('repository_content_types', 'repository_content_types', None, ''),
+    )),
+    ('Attr_RcsbRepositoryHoldingsCurrentEntryContainerIdentifiers', '', (
+        ('assembly_ids', 'assembly_ids', None, ''),
+        ('entry_id', 'entry_id', None, 'The PDB entry accession code.'),
+        ('rcsb_id', 'rcsb_id', None, 'The RCSB entry identifier.'),
+        ('update_id', 'update_id', None, 'Identifier for the current data exchange status record.'),
+    )),
+    ('Attr_PdbxStructSpecialSymmetry', '', (
+        ('PDB_model_num', 'PDB_model_num', None, 'Part of the identifier for the molecular component.  This data item is a pointer to _atom_site.pdbx_PDB_model_num in the ATOM_SITE category.'),
+        ('auth_seq_id', 'auth_seq_id', None, 'Part of the identifier for the molecular component.   This data item is a pointer to _atom_site.auth_seq_id in the  ATOM_SITE category.'),
+        ('id', 'id', None, 'The value of _pdbx_struct_special_symmetry.id must uniquely identify  each item in the PDBX_STRUCT_SPECIAL_SYMMETRY list.   This is an integer serial number.'),
+        ('label_asym_id', 'label_asym_id', None, 'Part of the identifier for the molecular component.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category.'),
+        ('label_comp_id', 'label_comp_id', None, 'Part of the identifier for the molecular component.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category.'),
+    )),
+    ('Attr_PdbxVrptSummaryEntityFitToMap', '', (
+        ('PDB_model_num', 'PDB_model_num', None, 'The unique model number from _atom_site.pdbx_PDB_model_num.'),
+        ('Q_score', 'Q_score', None, 'The calculated average Q-score.'),
+        ('average_residue_inclusion', 'average_residue_inclusion', None, 'The average of the residue inclusions for all residues in this instance'),
+    )),
+    ('Attr_PdbxVrptSummaryEntityGeometry', '', (
+        ('PDB_model_num', 'PDB_model_num', None, 'The unique model number from _atom_site.pdbx_PDB_model_num.'),
+        ('angles_RMSZ', 'angles_RMSZ', None, "The overall root mean square of the Z-score for deviations of bond angles in comparison to  'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996)."),
+        ('average_residue_inclusion', 'average_residue_inclusion', None, 'The average of the residue inclusions for all residues in this instance'),
+        ('bonds_RMSZ', 'bonds_RMSZ', None, "The overall root mean square of the Z-score for deviations of bond lengths in comparison to  'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996)."),
+        ('num_angles_RMSZ', 'num_angles_RMSZ', None, "The number of bond angles compared to 'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996)."),
+        ('num_bonds_RMSZ', 'num_bonds_RMSZ', None, "The number of bond lengths compared to 'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996)."),
+    )),
+    ('Attr_RcsbNonpolymerEntityInstanceContainerIdentifiers', '', (
+        ('asym_id', 'asym_id', None, 'Instance identifier for this container.'),
+        ('auth_asym_id', 'auth_asym_id', None, 'Author instance identifier for this container.'),
+        ('auth_seq_id', 'auth_seq_id', None, 'Residue number for non-polymer entity instance.'),
+        ('comp_id', 'comp_id', None, 'Component identifier for non-polymer entity instance.'),
+        ('entity_id', 'entity_id', None, 'Entity identifier for the container.'),
+        ('entry_id', 'entry_id', None, 'Entry identifier for the container.'),
+        ('rcsb_id', 'rcsb_id', None, "A unique identifier for each object in this entity instance container formed by  an 'dot' (.) separated concatenation of entry and entity instance identifiers."),
+    )),
+    ('Attr_RcsbNonpolymerInstanceAnnotation', '', (
+        ('annotation_id', 'annotation_id', None, 'An identifier for the annotation.'),
+        ('assignment_version', 'assignment_version', None, 'Identifies the version of the annotation assignment.'),
+        ('comp_id', 'comp_id', None, 'Non-polymer (ligand) chemical component identifier.'),
+        ('description', 'description', None, 'A description for the annotation.'),
+        ('name', 'name', None, 'A name for the annotation.'),
+        ('ordinal', 'ordinal', None, 'Ordinal identifier for this category'),
+        ('provenance_source', 'provenance_source', None, 'Code identifying the individual, organization or program that  assigned the annotation.'),
+        ('type', 'type', None, 'A type or category of the annotation.'),
+        ('annotation_lineage', 'annotation_lineage', 3, ''),
+    )),
+    ('Attr_FeatureValue', '', (
+        ('comp_id', 'comp_id', None, 'The chemical component identifier for the instance of the feature value.'),
+        ('details', 'details', None, 'Specific details about the feature.'),
+        ('reference', 'reference', None, 'The reference value of the feature.'),
+        ('reported', 'reported', None, 'The reported value of the feature.'),
+        ('uncertainty_estimate', 'uncertainty_estimate', None, 'The estimated uncertainty of the reported feature value.'),
+        ('uncertainty_estimate_type', 'uncertainty_estimate_type', None, 'The type of estimated uncertainty for the reported feature value.'),
+    )),
+    ('Attr_RcsbNonpolymerInstanceFeature', '', (
+        ('assignment_version', 'assignment_version', None, 'Identifies the version of the feature assignment.'),
+        ('comp_id', 'comp_id', None, 'Component identifier for non-polymer entity instance.'),
+        ('description', 'description', None, 'A description for the feature.'),
+        ('feature_id', 'feature_id', None, 'An identifier for the feature.'),
+        ('name', 'name', None, 'A name for the feature.'),
+        ('ordinal', 'ordinal', None, 'Ordinal identifier for this category'),
+        ('provenance_source', 'provenance_source', None, 'Code identifying the individual, organization or program that  assigned the feature.'),
+        ('type', 'type', None, 'A type or category of the feature.'),
+        ('feature_value', 'feature_value', 63, ''),
+        ('additional_properties', 'additional_properties', 6, ''),
+    )),
+    ('Attr_RcsbNonpolymerInstanceFeatureSummary', '', (
+        ('comp_id', 'comp_id', None, 'Component identifier for non-polymer entity instance.'),
+        ('count', 'count', None, 'The feature count.'),
+        ('coverage', 'coverage', None, 'The fractional feature coverage relative to the full entity sequence.'),
+        ('maximum_length', 'maximum_length', None, 'The maximum feature length.'),
+        ('maximum_value', 'maximum_value', None, 'The maximum feature value.'),
+        ('minimum_length', 'minimum_length', None, 'The minimum feature length.'),
+        ('minimum_value', 'minimum_value', None, 'The minimum feature value.'),
+        ('type', 'type', None, 'Type or category of the feature.'),
+    )),
+    ('Attr_RcsbNonpolymerInstanceValidationScore', '', (
+        ('RSCC', 'RSCC', None, 'The real space correlation coefficient (RSCC) for the non-polymer entity instance.'),
+        ('RSR', 'RSR', None, 'The real space R-value (RSR) for the non-polymer entity instance.'),
+        ('alt_id', 'alt_id', None, 'Alternate conformer identifier for the non-polymer entity instance.'),
+        ('average_occupancy', 'average_occupancy', None, 'The average heavy atom occupancy for coordinate records for the non-polymer entity instance.'),
+        ('completeness', 'completeness', None, 'The reported fraction of atomic coordinate records for the non-polymer entity instance.'),
+        ('intermolecular_clashes', 'intermolecular_clashes', None, 'The number of intermolecular MolProbity clashes cacluated for reported atomic coordinate records.'),
+        ('is_best_instance', 'is_best_instance', None, 'This molecular instance is ranked as the best quality instance of this nonpolymer entity.'),
+        ('is_subject_of_investigation', 'is_subject_of_investigation', None, 'This molecular entity is identified as the subject of the current study.'),
+        ('is_subject_of_investigation_provenance', 'is_subject_of_investigation_provenance', None, 'The provenance for the selection of the molecular entity identified as the subject of the current study.'),
+        ('mogul_angle_outliers', 'mogul_angle_outliers', None, 'Number of bond angle outliers obtained from a CCDC Mogul survey of bond angles  in the CSD small    molecule crystal structure database. Outliers are defined as bond angles that have a Z-score    less than -2 or greater than 2.'),
+        ('mogul_angles_RMSZ', 'mogul_angles_RMSZ', None, 'The root-mean-square value of the Z-scores of bond angles for the non-polymer instance in degrees obtained from a CCDC Mogul survey of bond angles in the CSD small molecule crystal structure database.'),
+        ('mogul_bond_outliers', 'mogul_bond_outliers', None, 'Number of bond distance outliers obtained from a CCDC Mogul survey of bond lengths in the CSD small    molecule crystal structure database.  Outliers are defined as bond distances that have a Z-score    less than -2 or greater than 2.'),
+        ('mogul_bonds_RMSZ', 'mogul_bonds_RMSZ', None, 'The root-mean-square value of the Z-scores of bond lengths for the nonpolymer instance in Angstroms obtained from a CCDC Mogul survey of bond lengths in the CSD small molecule crystal structure database.'),
+        ('natoms_eds', 'natoms_eds', None, 'The number of atoms in the non-polymer instance returned by the EDS software.'),
+        ('num_mogul_angles_RMSZ', 'num_mogul_angles_RMSZ', None, "The number of bond angles compared to 'standard geometry' made using the Mogul program."),
+        ('num_mogul_bonds_RMSZ', 'num_mogul_bonds_RMSZ', None, "The number of bond lengths compared to 'standard geometry' made using the Mogul program."),
+        ('ranking_model_fit', 'ranking_model_fit', None, 'The ranking of the model fit score component.'),
+        ('ranking_model_geometry', 'ranking_model_geometry', None, 'The ranking of the model geometry score component.'),
+        ('score_model_fit', 'score_model_fit', None, 'The value of the model fit score component.'),
+        ('score_model_geometry', 'score_model_geometry', None, 'The value of the model geometry score component.'),
+        ('stereo_outliers', 'stereo_outliers', None, 'Number of stereochemical/chirality errors.'),
+        ('type', 'type', None, 'Score type.'),
+    )),
+    ('Attr_ConnectTarget', '', (
+        ('auth_asym_id', 'auth_asym_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_asym_id in the  ATOM_SITE category.'),
+        ('auth_seq_id', 'auth_seq_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_seq_id in the  ATOM_SITE category.'),
+        ('label_alt_id', 'label_alt_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category.'),
+        ('label_asym_id', 'label_asym_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category.'),
+        ('label_atom_id', 'label_atom_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_atom_id in the  ATOM_SITE category.'),
+        ('label_comp_id', 'label_comp_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category.'),
+        ('label_seq_id', 'label_seq_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.connect_target_label_seq_id in the  ATOM_SITE category.'),
+        ('symmetry', 'symmetry', None, 'Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_nonpolymer_struct_conn.label* to generate the  target of the structure connection.'),
+    )),
+    ('Attr_ConnectPartner', '', (
+        ('label_alt_id', 'label_alt_id', None, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category.'),
+        ('label_asym_id', 'label_asym_id', None, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category.'),
+        ('label_atom_id', 'label_atom_id', None, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _chem_comp_atom.atom_id in the  CHEM_COMP_ATOM category.'),
+        ('label_comp_id', 'label_comp_id', None, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category.'),
+        ('label_seq_id', 'label_seq_id', None, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_seq_id in the  ATOM_SITE category.'),
+        ('symmetry', 'symmetry', None, 'Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_nonpolymer_struct_conn.connect_partner_label* to generate the  partner in the structure connection.'),
+    )),
+    ('Attr_RcsbNonpolymerStructConn', '', (
+        ('connect_type', 'connect_type', None, 'The connection type.'),
+        ('description', 'description', None, 'A description of special details of the connection.'),
+        ('dist_value', 'dist_value', None, 'Distance value for this contact.'),
+        ('id', 'id', None, 'The value of _rcsb_nonpolymer_struct_conn.id is an identifier for connection.   Note that this item need not be a number; it can be any unique  identifier.'),
+        ('ordinal_id', 'ordinal_id', None, 'The value of _rcsb_nonpolymer_struct_conn.id must uniquely identify a record in  the rcsb_nonpolymer_struct_conn list.'),
+        ('role', 'role', None, 'The chemical or structural role of the interaction'),
+        ('value_order', 'value_order', None, 'The chemical bond order associated with the specified atoms in  this contact.'),
+        ('connect_target', 'connect_target', 67, ''),
+        ('connect_partner', 'connect_partner', 68, ''),
+    )),
+    ('Attr_RcsbTargetNeighbors', '', (
+        ('alt_id', 'alt_id', None, 'Alternate conformer identifier for the non-polymer entity instance.'),
+        ('atom_id', 'atom_id', None, 'The atom identifier for the non-polymer entity instance.'),
+        ('comp_id', 'comp_id', None, 'Component identifier for the non-polymer entity instance.'),
+        ('distance', 'distance', None, 'Distance value for this target interaction.'),
+        ('target_asym_id', 'target_asym_id', None, 'The entity instance identifier for the target of interaction.'),
+        ('target_atom_id', 'target_atom_id', None, 'The atom identifier for the target of interaction.'),
+        ('target_auth_seq_id', 'target_auth_seq_id', None, 'The author residue index for the target of interaction.'),
+        ('target_comp_id', 'target_comp_id', None, 'The chemical component identifier for the target of interaction.'),
+        ('target_entity_id', 'target_entity_id', None, 'The entity identifier for the target of interaction.'),
+        ('target_is_bound', 'target_is_bound', None, 'A flag to indicate the nature of the target interaction is covalent or metal-coordination.'),
+        ('target_model_id', 'target_model_id', None, 'Model identifier for the target of interaction.'),
+        ('target_seq_id', 'target_seq_id', None, 'The sequence position for the target of interaction.'),
+    )),
+    ('Attr_StructAsym', '', (
+        ('pdbx_PDB_id', 'pdbx_PDB_id', None, 'This data item is a pointer to _atom_site.pdbx_PDB_strand_id the  ATOM_SITE category.'),
+        ('pdbx_alt_id', 'pdbx_alt_id', None, 'This data item is a pointer to _atom_site.ndb_alias_strand_id the  ATOM_SITE category.'),
+        ('pdbx_order', 'pdbx_order', None, 'This data item gives the order of the structural elements in the  ATOM_SITE category.'),
+        ('pdbx_type', 'pdbx_type', None, 'This data item describes the general type of the structural elements  in the ATOM_SITE category.'),
+    )),
+    ('Attr_ReferenceSequenceIdentifiers', '', (
+        ('database_accession', 'database_accession', None, 'Reference database accession code'),
+        ('database_isoform', 'database_isoform', None, 'Reference database identifier for the sequence isoform'),
+        ('database_name', 'database_name', None, 'Reference database name'),
+        ('provenance_source', 'provenance_source', None, 'Source of the reference database assignment'),
+    )),
+    ('Attr_RcsbUniprotContainerIdentifiers', '', (
+        ('uniprot_id', 'uniprot_id', None, 'Primary accession number of a given UniProtKB entry.'),
+        ('reference_sequence_identifiers', 'reference_sequence_identifiers', 72, ''),
+    )),
+    ('Attr_RcsbUniprotKeyword', 'Keywords constitute a controlled vocabulary that summarises the content of a UniProtKB entry.', (
+        ('id', 'id', None, 'A unique keyword identifier.'),
+        ('value', 'value', None, 'Human-readable keyword term.'),
+    )),
+    ('Attr_Name', '', (
+        ('value', 'value', None, 'Name that allows to unambiguously identify a protein.'),
+        ('provenance_code', 'provenance_code', None, 'Historical record of the data attribute.'),
+    )),
+    ('Attr_Function', '', (
+        ('details', 'details', None, 'General function(s) of a protein.'),
+        ('provenance_code', 'provenance_code', None, 'Historical record of the data attribute.'),
+    )),
+    ('Attr_Name_2', '', (
+        ('type', 'type', None, ''),
+        ('value', 'value', None, ''),
+    )),
+    ('Attr_Gene', '', (
+        ('name', 'name', 77, ''),
+    )),
+    ('Attr_SourceOrganism', 'Taxonomy information on the organism that is the source of the protein sequence.', (
+        ('scientific_name', 'scientific_name', None, 'The scientific name of the organism in which a protein occurs.'),
+        ('taxonomy_id', 'taxonomy_id', None, 'NCBI Taxonomy identifier for the organism in which a protein occurs.'),
+        ('provenance_code', 'provenance_code', None, 'Historical record of the data attribute.'),
+    )),
+    ('Attr_Ec', '', (
+        ('number', 'number', None, ''),
+        ('provenance_code', 'provenance_code', None, 'Historical record of the data attribute.'),
+    )),
+    ('Attr_RcsbUniprotProtein', '', (
+        ('sequence', 'sequence', None, 'Protein sequence data for canonical protein sequence.'),
+        ('name', 'name', 75, ''),
+        ('function', 'function', 76, ''),
+        ('gene', 'gene', 78, ''),
+        ('source_organism', 'source_organism', 79, 'Taxonomy information on the organism that is the source of the protein sequence.'),
+        ('ec', 'ec', 80, ''),
+    )),
+    ('Attr_FeaturePositions_2', '', (
+        ('beg_comp_id', 'beg_comp_id', None, 'An identifier for the monomer(s) corresponding to the feature assignment.'),
+        ('beg_seq_id', 'beg_seq_id', None, 'An identifier for the monomer at which this segment of the feature begins.'),
+        ('end_seq_id', 'end_seq_id', None, 'An identifier for the monomer at which this segment of the feature ends.'),
+        ('value', 'value', None, 'The value for the feature over this monomer segment.'),
+        ('values', 'values', None, ''),
+    )),
+    ('Attr_RcsbUniprotFeature', '', (
+        ('assignment_version', 'assignment_version', None, 'Identifies the version of the feature assignment.'),
+        ('description', 'description', None, 'A description for the feature.'),
+        ('feature_id', 'feature_id', None, 'An identifier for the feature.'),
+        ('name', 'name', None, 'A name for the feature.'),
+        ('provenance_source', 'provenance_source', None, 'Code identifying the individual, organization or program that  assigned the feature.'),
+        ('reference_scheme', 'reference_scheme', None, 'Code residue coordinate system for the assigned feature.'),
+        ('type', 'type', None, 'A type or category of the feature.'),
+        ('feature_positions', 'feature_positions', 82, ''),
+    )),
+    ('Attr_AdditionalProperties_2', '', (
+        ('name', 'name', None, 'The additional property name'),
+        ('values', 'values', None, ''),
+    )),
+    ('Attr_RcsbUniprotAnnotation', '', (
+        ('annotation_id', 'annotation_id', None, 'An identifier for the annotation.'),
+        ('assignment_version', 'assignment_version', None, 'Identifies the version of the annotation assignment.'),
+        ('description', 'description', None, 'A description for the annotation.'),
+        ('name', 'name', None, 'A name for the annotation.'),
+        ('provenance_source', 'provenance_source', None, 'Code identifying the individual, organization or program that  assigned the annotation.'),
+        ('type', 'type', None, 'A type or category of the annotation.'),
+        ('annotation_lineage', 'annotation_lineage', 3, ''),
+        ('additional_properties', 'additional_properties', 84, ''),
+    )),
+    ('Attr_RcsbUniprotExternalReference', '', (
+        ('reference_id', 'reference_id', None, ''),
+        ('reference_name', 'reference_name', None, ''),
+        ('provenance_source', 'provenance_source', None, ''),
+    )),
+    ('Attr_Scores', 'Alignment scores', (
+        ('target_coverage', 'target_coverage', None, ''),
+        ('query_coverage', 'query_coverage', None, ''),
+        ('target_length', 'target_length', None, ''),
+        ('query_length', 'query_length', None, ''),
+    )),
+    ('Attr_AlignedRegions', 'Aligned sequence regions', (
+        ('target_begin', 'target_begin', None, 'NCBI sequence start position'),
+        ('query_begin', 'query_begin', None, 'Entity seqeunce start position'),
+        ('length', 'length', None, 'Aligned region length'),
+    )),
+    ('Attr_CoreEntityIdentifiers', 'core_entity identifiers', (
+        ('entry_id', 'entry_id', None, ''),
+        ('entity_id', 'entity_id', None, ''),
+    )),
+    ('Attr_CoreEntityAlignments', 'List of alignments with core_entity canonical sequences', (
+        ('scores', 'scores', 87, 'Alignment scores'),
+        ('aligned_regions', 'aligned_regions', 88, 'Aligned sequence regions'),
+        ('core_entity_identifiers', 'core_entity_identifiers', 89, 'core_entity identifiers'),
+    )),
+    ('Attr_RcsbUniprotAlignments', 'UniProt pairwise sequence alignments.', (
+        ('core_entity_alignments', 'core_entity_alignments', 90, 'List of alignments with core_entity canonical sequences'),
+    )),
+    ('Attr_RcsbBranchedEntityInstanceContainerIdentifiers', '', (
+        ('asym_id', 'asym_id', None, 'Instance identifier for this container.'),
+        ('auth_asym_id', 'auth_asym_id', None, 'Author instance identifier for this container.'),
+        ('entity_id', 'entity_id', None, 'Entity identifier for the container.'),
+        ('entry_id', 'entry_id', None, 'Entry identifier for the container.'),
+        ('rcsb_id', 'rcsb_id', None, "A unique identifier for each object in this entity instance container formed by  an 'dot' (.) separated concatenation of entry and entity instance identifiers."),
+    )),
+    ('Attr_RcsbBranchedInstanceAnnotation', '', (
+        ('annotation_id', 'annotation_id', None, 'An identifier for the annotation.'),
+        ('assignment_version', 'assignment_version', None, 'Identifies the version of the annotation assignment.'),
+        ('comp_id', 'comp_id', None, 'Chemical component identifier.'),
+        ('description', 'description', None, 'A description for the annotation.'),
+        ('name', 'name', None, 'A name for the annotation.'),
+        ('ordinal', 'ordinal', None, 'Ordinal identifier for this category'),
+        ('provenance_source', 'provenance_source', None, 'Code identifying the individual, organization or program that  assigned the annotation.'),
+        ('type', 'type', None, 'A type or category of the annotation.'),
+        ('annotation_lineage', 'annotation_lineage', 3, ''),
+    )),
+    ('Attr_FeaturePositions_3', '', (
+        ('beg_comp_id', 'beg_comp_id', None, 'An identifier for the monomer(s) corresponding to the feature assignment.'),
+        ('beg_seq_id', 'beg_seq_id', None, 'An identifier for the leading monomer feature position.'),
+        ('end_seq_id', 'end_seq_id', None, 'An identifier for the terminal monomer feature position.'),
+        ('value', 'value', None, 'The value of the feature at the monomer position.'),
+        ('values', 'values', None, ''),
+    )),
+    ('Attr_RcsbBranchedInstanceFeature', '', (
+        ('assignment_version', 'assignment_version', None, 'Identifies the version of the feature assignment.'),
+        ('description', 'description', None, 'A description for the feature.'),
+        ('feature_id', 'feature_id', None, 'An identifier for the feature.'),
+        ('name', 'name', None, 'A name for the feature.'),
+        ('ordinal', 'ordinal', None, 'Ordinal identifier for this category'),
+        ('provenance_source', 'provenance_source', None, 'Code identifying the individual, organization or program that  assigned the feature.'),
+        ('reference_scheme', 'reference_scheme', None, 'Code residue coordinate system for the assigned feature.'),
+        ('type', 'type', None, 'A type or category of the feature.'),
+        ('feature_positions', 'feature_positions', 94, ''),
+        ('feature_value', 'feature_value', 63, ''),
+        ('additional_properties', 'additional_properties', 6, ''),
+    )),
+    ('Attr_RcsbBranchedInstanceFeatureSummary', '', (
+        ('count', 'count', None, 'The feature count.'),
+        ('coverage', 'coverage', None, 'The fractional feature coverage relative to the full branched entity.'),
+        ('maximum_length', 'maximum_length', None, 'The maximum feature length.'),
+        ('maximum_value', 'maximum_value', None, 'The maximum feature value.'),
+        ('minimum_length', 'minimum_length', None, 'The minimum feature length.'),
+        ('minimum_value', 'minimum_value', None, 'The minimum feature value.'),
+        ('type', 'type', None, 'Type or category of the feature.'),
+    )),
+    ('Attr_ConnectTarget_2', '', (
+        ('auth_asym_id', 'auth_asym_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_asym_id in the  ATOM_SITE category.'),
+        ('auth_seq_id', 'auth_seq_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_seq_id in the  ATOM_SITE category.'),
+        ('label_alt_id', 'label_alt_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category.'),
+        ('label_asym_id', 'label_asym_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category.'),
+        ('label_atom_id', 'label_atom_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_atom_id in the  ATOM_SITE category.'),
+        ('label_comp_id', 'label_comp_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category.'),
+        ('label_seq_id', 'label_seq_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.connect_target_label_seq_id in the  ATOM_SITE category.'),
+        ('symmetry', 'symmetry', None, 'Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_branched_struct_conn.label* to generate the  target of the structure connection.'),
+    )),
+    ('Attr_ConnectPartner_2', '', (
+        ('label_alt_id', 'label_alt_id', None, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category.'),
+        ('label_asym_id', 'label_asym_id', None, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category.'),
+        ('label_atom_id', 'label_atom_id', None, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _chem_comp_atom.atom_id in the  CHEM_COMP_ATOM category.'),
+        ('label_comp_id', 'label_comp_id', None, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category.'),
+        ('label_seq_id', 'label_seq_id', None, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_seq_id in the  ATOM_SITE category.'),
+        ('symmetry', 'symmetry', None, 'Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_branched_struct_conn.connect_partner_label* to generate the  partner in the structure connection.'),
+    )),
+    ('Attr_RcsbBranchedStructConn', '', (
+        ('connect_type', 'connect_type', None, 'The connection type.'),
+        ('description', 'description', None, 'A description of special details of the connection.'),
+        ('dist_value', 'dist_value', None, 'Distance value for this contact.'),
+        ('id', 'id', None, 'The value of _rcsb_branched_struct_conn.id is an identifier for connection.'),
+        ('ordinal_id', 'ordinal_id', None, 'The value of _rcsb_branched_struct_conn.id must uniquely identify a record in  the rcsb_branched_struct_conn list.'),
+        ('role', 'role', None, 'The chemical or structural role of the interaction'),
+        ('value_order', 'value_order', None, 'The chemical bond order associated with the specified atoms in  this contact.'),
+        ('connect_target', 'connect_target', 97, ''),
+        ('connect_partner', 'connect_partner', 98, ''),
+    )),
+    ('Attr_RcsbLigandNeighbors', '', (
+        ('alt_id', 'alt_id', None, 'Alternate conformer identifier for the target instance.'),
+        ('atom_id', 'atom_id', None, 'The atom identifier for the target instance.'),
+        ('auth_seq_id', 'auth_seq_id', None, 'The author residue index for the target instance.'),
+        ('comp_id', 'comp_id', None, 'Component identifier for the target instance.'),
+        ('distance', 'distance', None, 'Distance value for this ligand interaction.'),
+        ('ligand_alt_id', 'ligand_alt_id', None, 'Alternate conformer identifier for the ligand interaction.'),
+        ('ligand_asym_id', 'ligand_asym_id', None, 'The entity instance identifier for the ligand interaction.'),
+        ('ligand_atom_id', 'ligand_atom_id', None, 'The atom identifier for the ligand interaction.'),
+        ('ligand_comp_id', 'ligand_comp_id', None, 'The chemical component identifier for the ligand interaction.'),
+        ('ligand_entity_id', 'ligand_entity_id', None, 'The entity identifier for the ligand of interaction.'),
+        ('ligand_is_bound', 'ligand_is_bound', None, 'A flag to indicate the nature of the ligand interaction is covalent or metal-coordination.'),
+        ('ligand_model_id', 'ligand_model_id', None, 'Model identifier for the ligand interaction.'),
+        ('seq_id', 'seq_id', None, 'The sequence position for the target instance.'),
+    )),
+    ('Attr_PdbxEntityBranch', '', (
+        ('rcsb_branched_component_count', 'rcsb_branched_component_count', None, 'Number of constituent chemical components in the branched entity.'),
+        ('type', 'type', None, 'The type of this branched oligosaccharide.'),
+    )),
+    ('Attr_PdbxEntityBranchDescriptor', '', (
+        ('descriptor', 'descriptor', None, 'This data item contains the descriptor value for this  entity.'),
+        ('program', 'program', None, 'This data item contains the name of the program  or library used to compute the descriptor.'),
+        ('program_version', 'program_version', None, 'This data item contains the version of the program  or library used to compute the descriptor.'),
+        ('type', 'type', None, 'This data item contains the descriptor type.'),
+    )),
+    ('Attr_RcsbBranchedEntity', '', (
+        ('details', 'details', None, 'A description of special aspects of the branched entity.'),
+        ('formula_weight', 'formula_weight', None, 'Formula mass (KDa) of the branched entity.'),
+        ('pdbx_description', 'pdbx_description', None, 'A description of the branched entity.'),
+        ('pdbx_number_of_molecules', 'pdbx_number_of_molecules', None, 'The number of molecules of the branched entity in the entry.'),
+    )),
+    ('Attr_ReferenceIdentifiers', '', (
+        ('provenance_source', 'provenance_source', None, 'Source of the reference resource assignment'),
+        ('resource_accession', 'resource_accession', None, 'Reference resource accession code'),
+        ('resource_name', 'resource_name', None, 'Reference resource name'),
+    )),
+    ('Attr_RcsbBranchedEntityContainerIdentifiers', '', (
+        ('asym_ids', 'asym_ids', None, ''),
+        ('auth_asym_ids', 'auth_asym_ids', None, ''),
+        ('chem_comp_monomers', 'chem_comp_monomers', None, ''),
+        ('chem_ref_def_id', 'chem_ref_def_id', None, 'The chemical reference definition identifier for the entity in this container.'),
+        ('entity_id', 'entity_id', None, 'Entity identifier for the container.'),
+        ('entry_id', 'entry_id', None, 'Entry identifier for the container.'),
+        ('prd_id', 'prd_id', None, 'The BIRD identifier for the entity in this container.'),
+        ('rcsb_id', 'rcsb_id', None, 'A unique identifier for each object in this entity container formed by  an underscore separated concatenation of entry and entity identifiers.'),
+        ('reference_identifiers', 'reference_identifiers', 104, ''),
+    )),
+    ('Attr_FeaturePositions_4', '', (
+        ('beg_comp_id', 'beg_comp_id', None, 'An identifier for the leading monomer corresponding to the feature assignment.'),
+        ('beg_seq_id', 'beg_seq_id', None, 'An identifier for the leading monomer position of the feature.'),
+        ('end_seq_id', 'end_seq_id', None, 'An identifier for the leading monomer position of the feature.'),
+        ('value', 'value', None, 'The value for the feature at this monomer.'),
+    )),
+    ('Attr_RcsbBranchedEntityFeature', '', (
+        ('assignment_version', 'assignment_version', None, 'Identifies the version of the feature assignment.'),
+        ('description', 'description', None, 'A description for the feature.'),
+        ('feature_id', 'feature_id', None, 'An identifier for the feature.'),
+        ('name', 'name', None, 'A name for the feature.'),
+        ('provenance_source', 'provenance_source', None, 'Code identifying the individual, organization or program that  assigned the feature.'),
+        ('reference_scheme', 'reference_scheme', None, 'Code residue coordinate system for the assigned feature.'),
+        ('type', 'type', None, 'A type or category of the feature.'),
+        ('feature_positions', 'feature_positions', 106, ''),
+        ('additional_properties', 'additional_properties', 6, ''),
+    )),
+    ('Attr_RcsbBranchedEntityKeywords', '', (
+        ('text', 'text', None, 'Keywords describing this branched entity.'),
+    )),
+    ('Attr_RcsbBranchedEntityNameCom', '', (
+        ('name', 'name', None, 'A common name for the branched entity.'),
+    )),
+    ('Attr_RcsbBranchedEntityNameSys', '', (
+        ('name', 'name', None, 'The systematic name for the branched entity.'),
+        ('system', 'system', None, 'The system used to generate the systematic name of the branched entity.'),
+    )),
+    ('Attr_RcsbPolymerEntityInstanceContainerIdentifiers', '', (
+        ('asym_id', 'asym_id', None, 'Instance identifier for this container.'),
+        ('auth_asym_id', 'auth_asym_id', None, 'Author instance identifier for this container.'),
+        ('auth_to_entity_poly_seq_mapping', 'auth_to_entity_poly_seq_mapping', None, ''),
+        ('entity_id', 'entity_id', None, 'Entity identifier for the container.'),
+        ('entry_id', 'entry_id', None, 'Entry identifier for the container.'),
+        ('rcsb_id', 'rcsb_id', None, "A unique identifier for each object in this entity instance container formed by  an 'dot' (.) separated concatenation of entry and entity instance identifiers."),
+    )),
+    ('Attr_RcsbPolymerInstanceAnnotation', '', (
+        ('annotation_id', 'annotation_id', None, 'An identifier for the annotation.'),
+        ('assignment_version', 'assignment_version', None, 'Identifies the version of the annotation assignment.'),
+        ('description', 'description', None, 'A description for the annotation.'),
+        ('name', 'name', None, 'A name for the annotation.'),
+        ('ordinal', 'ordinal', None, 'Ordinal identifier for this category'),
+        ('provenance_source', 'provenance_source', None, 'Code identifying the individual, organization or program that  assigned the annotation.'),
+        ('type', 'type', None, 'A type or category of the annotation.'),
+        ('annotation_lineage', 'annotation_lineage', 3, ''),
+    )),
+    ('Attr_FeaturePositions_5', '', (
+        ('beg_comp_id', 'beg_comp_id', None, 'An identifier for the monomer(s) corresponding to the feature assignment.'),
+        ('beg_seq_id', 'beg_seq_id', None, 'An identifier for the monomer at which this segment of the feature begins.'),
+        ('end_seq_id', 'end_seq_id', None, 'An identifier for the monomer at which this segment of the feature ends.'),
+        ('value', 'value', None, 'The value of the feature over the monomer segment.'),
+        ('values', 'values', None, ''),
+    )),
+    ('Attr_RcsbPolymerInstanceFeature', '', (
+        ('assignment_version', 'assignment_version', None, 'Identifies the version of the feature assignment.'),
+        ('description', 'description', None, 'A description for the feature.'),
+        ('feature_id', 'feature_id', None, 'An identifier for the feature.'),
+        ('name', 'name', None, 'A name for the feature.'),
+        ('ordinal', 'ordinal', None, 'Ordinal identifier for this category'),
+        ('provenance_source', 'provenance_source', None, 'Code identifying the individual, organization or program that  assigned the feature.'),
+        ('reference_scheme', 'reference_scheme', None, 'Code residue coordinate system for the assigned feature.'),
+        ('type', 'type', None, 'A type or category of the feature.'),
+        ('feature_positions', 'feature_positions', 113, ''),
+        ('additional_properties', 'additional_properties', 6, ''),
+    )),
+    ('Attr_RcsbPolymerInstanceFeatureSummary', '', (
+        ('count', 'count', None, 'The feature count per polymer chain.'),
+        ('coverage', 'coverage', None, 'The fractional feature coverage relative to the full entity sequence.'),
+        ('maximum_length', 'maximum_length', None, 'The maximum feature length.'),
+        ('maximum_value', 'maximum_value', None, 'The maximum feature value.'),
+        ('minimum_length', 'minimum_length', None, 'The minimum feature length.'),
+        ('minimum_value', 'minimum_value', None, 'The minimum feature value.'),
+        ('type', 'type', None, 'Type or category of the feature.'),
+    )),
+    ('Attr_RcsbPolymerInstanceInfo', '', (
+        ('modeled_residue_count', 'modeled_residue_count', None, 'The number of modeled residues in the polymer instance.'),
+    )),
+    ('Attr_ConnectTarget_3', '', (
+        ('auth_asym_id', 'auth_asym_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_asym_id in the  ATOM_SITE category.'),
+        ('auth_seq_id', 'auth_seq_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_seq_id in the  ATOM_SITE category.'),
+        ('label_alt_id', 'label_alt_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category.'),
+        ('label_asym_id', 'label_asym_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category.'),
+        ('label_atom_id', 'label_atom_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_atom_id in the  ATOM_SITE category.'),
+        ('label_comp_id', 'label_comp_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category.'),
+        ('label_seq_id', 'label_seq_id', None, 'A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.connect_target_label_seq_id in the  ATOM_SITE category.'),
+        ('symmetry', 'symmetry', None, 'Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_polymer_struct_conn.label* to generate the  target of the structure connection.'),
+    )),
+    ('Attr_ConnectPartner_3', '', (
+        ('label_alt_id', 'label_alt_id', None, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category.'),
+        ('label_asym_id', 'label_asym_id', None, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category.'),
+        ('label_atom_id', 'label_atom_id', None, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _chem_comp_atom.atom_id in the  CHEM_COMP_ATOM category.'),
+        ('label_comp_id', 'label_comp_id', None, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category.'),
+        ('label_seq_id', 'label_seq_id', None, 'A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_seq_id in the  ATOM_SITE category.'),
+        ('symmetry', 'symmetry', None, 'Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_polymer_struct_conn.connect_partner_label* to generate the  partner in the structure connection.'),
+    )),
+    ('Attr_RcsbPolymerStructConn', '', (
+        ('connect_type', 'connect_type', None, 'The connection type.'),
+        ('description', 'description', None, 'A description of special details of the connection.'),
+        ('dist_value', 'dist_value', None, 'Distance value for this contact.'),
+        ('id', 'id', None, 'The value of _rcsb_polymer_struct_conn.id is an identifier for connection.   Note that this item need not be a number; it can be any unique  identifier.'),
+        ('ordinal_id', 'ordinal_id', None, 'The value of _rcsb_polymer_struct_conn.id must uniquely identify a record in  the rcsb_polymer_struct_conn list.'),
+        ('role', 'role', None, 'The chemical or structural role of the interaction'),
+        ('value_order', 'value_order', None, 'The chemical bond order associated with the specified atoms in  this contact.'),
+        ('connect_target', 'connect_target', 117, ''),
+        ('connect_partner', 'connect_partner', 118, ''),
+    )),
+    ('Attr_AuditAuthor', '', (
+        ('identifier_ORCID', 'identifier_ORCID', None, 'The Open Researcher and Contributor ID (ORCID).'),
+        ('name', 'name', None, 'The name of an author of this data block. If there are multiple  authors, _audit_author.name is looped with _audit_author.address.  The family name(s), followed by a comma and including any  dynastic components, precedes the first name(s) or initial(s).'),
+        ('pdbx_ordinal', 'pdbx_ordinal', None, "This data item defines the order of the author's name in the  list of audit authors."),
+    )),
+    ('Attr_Cell', '', (
+        ('Z_PDB', 'Z_PDB', None, 'The number of the polymeric chains in a unit cell. In the case  of heteropolymers, Z is the number of occurrences of the most  populous chain.   This data item is provided for compatibility with the original  Protein Data Bank format, and only for that purpose.'),
+        ('angle_alpha', 'angle_alpha', None, 'Unit-cell angle alpha of the reported structure in degrees.'),
+        ('angle_beta', 'angle_beta', None, 'Unit-cell angle beta of the reported structure in degrees.'),
+        ('angle_gamma', 'angle_gamma', None, 'Unit-cell angle gamma of the reported structure in degrees.'),
+        ('formula_units_Z', 'formula_units_Z', None, 'The number of the formula units in the unit cell as specified  by _chemical_formula.structural, _chemical_formula.moiety or  _chemical_formula.sum.'),
+        ('length_a', 'length_a', None, 'Unit-cell length a corresponding to the structure reported in angstroms.'),
+        ('length_b', 'length_b', None, 'Unit-cell length b corresponding to the structure reported in  angstroms.'),
+        ('length_c', 'length_c', None, 'Unit-cell length c corresponding to the structure reported in angstroms.'),
+        ('pdbx_unique_axis', 'pdbx_unique_axis', None, "To further identify unique axis if necessary.  E.g., P 21 with  an unique C axis will have 'C' in this field."),
+        ('volume', 'volume', None, 'Cell volume V in angstroms cubed.   V = a b c (1 - cos^2^~alpha~ - cos^2^~beta~ - cos^2^~gamma~             + 2 cos~alpha~ cos~beta~ cos~gamma~)^1/2^   a     = _cell.length_a  b     = _cell.length_b  c     = _cell.length_c  alpha = _cell.angle_alpha  beta  = _cell.angle_beta  gamma = _cell.angle_gamma'),
+    )),
+    ('Attr_Citation', '', (
+        ('book_id_ISBN', 'book_id_ISBN', None, 'The International Standard Book Number (ISBN) code assigned to  the book cited; relevant for books or book chapters.'),
+        ('book_publisher', 'book_publisher', None, 'The name of the publisher of the citation; relevant  for books or book chapters.'),
+        ('book_publisher_city', 'book_publisher_city', None, 'The location of the publisher of the citation; relevant  for books or book chapters.'),
+        ('book_title', 'book_title', None, 'The title of the book in which the citation appeared; relevant  for books or book chapters.'),
+        ('coordinate_linkage', 'coordinate_linkage', None, "_citation.coordinate_linkage states whether this citation  is concerned with precisely the set of coordinates given in the  data block. If, for instance, the publication described the same  structure, but the coordinates had undergone further refinement  prior to the creation of the data block, the value of this data  item would be 'no'."),
+        ('country', 'country', None, 'The country/region of publication; relevant for books  and book chapters.'),
+        ('id', 'id', None, "The value of _citation.id must uniquely identify a record in the  CITATION list.   The _citation.id 'primary' should be used to indicate the  citation that the author(s) consider to be the most pertinent to  the contents of the data block.   Note that this item need not be a number; it can be any unique  identifier."),
+        ('journal_abbrev', 'journal_abbrev', None, 'Abbreviated name of the cited journal as given in the  Chemical Abstracts Service Source Index.'),
+        ('journal_full', 'journal_full', None, 'Full name of the cited journal; relevant for journal articles.'),
+        ('journal_id_ASTM', 'journal_id_ASTM', None, 'The American Society for Testing and Materials (ASTM) code  assigned to the journal cited (also referred to as the CODEN  designator of the Chemical Abstracts Service); relevant for  journal articles.'),
+        ('journal_id_CSD', 'journal_id_CSD', None, 'The Cambridge Structural Database (CSD) code assigned to the  journal cited; relevant for journal articles. This is also the  system used at the Protein Data Bank (PDB).'),
+        ('journal_id_ISSN', 'journal_id_ISSN', None, 'The International Standard Serial Number (ISSN) code assigned to  the journal cited; relevant for journal articles.'),
+        ('journal_issue', 'journal_issue', None, 'Issue number of the journal cited; relevant for journal  articles.'),
+        ('journal_volume', 'journal_volume', None, 'Volume number of the journal cited; relevant for journal  articles.'),
+        ('language', 'language', None, 'Language in which the cited article is written.'),
+        ('page_first', 'page_first', None, 'The first page of the citation; relevant for journal  articles, books and book chapters.'),
+        ('page_last', 'page_last', None, 'The last page of the citation; relevant for journal  articles, books and book chapters.'),
+        ('pdbx_database_id_DOI', 'pdbx_database_id_DOI', None, 'Document Object Identifier used by doi.org to uniquely  specify bibliographic entry.'),
+        ('pdbx_database_id_PubMed', 'pdbx_database_id_PubMed', None, 'Ascession number used by PubMed to categorize a specific  bibliographic entry.'),
+        ('rcsb_authors', 'rcsb_authors', None, ''),
+        ('rcsb_is_primary', 'rcsb_is_primary', None, 'Flag to indicate a primary citation.'),
+        ('rcsb_journal_abbrev', 'rcsb_journal_abbrev', None, 'Normalized journal abbreviation.'),
+        ('title', 'title', None, 'The title of the citation; relevant for journal articles, books  and book chapters.'),
+        ('unpublished_flag', 'unpublished_flag', None, 'Flag to indicate that this citation will not be published.'),
+        ('year', 'year', None, 'The year of the citation; relevant for journal articles, books  and book chapters.'),
+    )),
+    ('Attr_Database2', '', (
+        ('database_code', 'database_code', None, 'The code assigned by the database identified in  _database_2.database_id.'),
+        ('database_id', 'database_id', None, 'An abbreviation that identifies the database.'),
+        ('pdbx_DOI', 'pdbx_DOI', None, 'Document Object Identifier (DOI) for this entry registered with http://crossref.org.'),
+        ('pdbx_database_accession', 'pdbx_database_accession', None, 'Extended accession code issued for for _database_2.database_code assigned by the database identified in  _database_2.database_id.'),
+    )),
+    ('Attr_Diffrn', '', (
+        ('ambient_pressure', 'ambient_pressure', None, 'The mean hydrostatic pressure in kilopascals at which the  intensities were measured.'),
+        ('ambient_temp', 'ambient_temp', None, 'The mean temperature in kelvins at which the intensities were  measured.'),
+        ('ambient_temp_details', 'ambient_temp_details', None, 'A description of special aspects of temperature control during  data collection.'),
+        ('crystal_id', 'crystal_id', None, 'This data item is a pointer to _exptl_crystal.id in the  EXPTL_CRYSTAL category.'),
+        ('crystal_support', 'crystal_support', None, 'The physical device used to support the crystal during data  collection.'),
+        ('details', 'details', None, 'Special details of the diffraction measurement process. Should  include information about source instability, crystal motion,  degradation and so on.'),
+        ('id', 'id', None, 'This data item uniquely identifies a set of diffraction  data.'),
+        ('pdbx_serial_crystal_experiment', 'pdbx_serial_crystal_experiment', None, 'Y/N if using serial crystallography experiment in which multiple crystals contribute to each diffraction frame in the experiment.'),
+    )),
+    ('Attr_DiffrnDetector', '', (
+        ('details', 'details', None, 'A description of special aspects of the radiation detector.'),
+        ('detector', 'detector', None, 'The general class of the radiation detector.'),
+        ('diffrn_id', 'diffrn_id', None, 'This data item is a pointer to _diffrn.id in the DIFFRN  category.'),
+        ('pdbx_collection_date', 'pdbx_collection_date', None, 'The date of data collection.'),
+        ('pdbx_frequency', 'pdbx_frequency', None, 'The operating frequency of the detector (Hz) used in data collection.'),
+        ('type', 'type', None, 'The make, model or name of the detector device used.'),
+    )),
+    ('Attr_DiffrnRadiation', '', (
+        ('collimation', 'collimation', None, 'The collimation or focusing applied to the radiation.'),
+        ('diffrn_id', 'diffrn_id', None, 'This data item is a pointer to _diffrn.id in the DIFFRN  category.'),
+        ('monochromator', 'monochromator', None, 'The method used to obtain monochromatic radiation. If a mono-  chromator crystal is used, the material and the indices of the  Bragg reflection are specified.'),
+        ('pdbx_diffrn_protocol', 'pdbx_diffrn_protocol', None, 'SINGLE WAVELENGTH, LAUE, or MAD.'),
+        ('pdbx_monochromatic_or_laue_m_l', 'pdbx_monochromatic_or_laue_m_l', None, 'Monochromatic or Laue.'),
+        ('pdbx_scattering_type', 'pdbx_scattering_type', None, 'The radiation scattering type for this diffraction data set.'),
+        ('pdbx_wavelength', 'pdbx_wavelength', None, 'Wavelength of radiation.'),
+        ('pdbx_wavelength_list', 'pdbx_wavelength_list', None, 'Comma separated list of wavelengths or wavelength range.'),
+        ('type', 'type', None, 'The nature of the radiation. This is typically a description  of the X-ray wavelength in Siegbahn notation.'),
+        ('wavelength_id', 'wavelength_id', None, 'This data item is a pointer to _diffrn_radiation_wavelength.id  in the DIFFRN_RADIATION_WAVELENGTH category.'),
+    )),
+    ('Attr_DiffrnSource', '', (
+        ('details', 'details', None, 'A description of special aspects of the radiation source used.'),
+        ('diffrn_id', 'diffrn_id', None, 'This data item is a pointer to _diffrn.id in the DIFFRN  category.'),
+        ('pdbx_synchrotron_beamline', 'pdbx_synchrotron_beamline', None, 'Synchrotron beamline.'),
+        ('pdbx_synchrotron_site', 'pdbx_synchrotron_site', None, 'Synchrotron site.'),
+        ('pdbx_wavelength', 'pdbx_wavelength', None, 'Wavelength of radiation.'),
+        ('pdbx_wavelength_list', 'pdbx_wavelength_list', None, 'Comma separated list of wavelengths or wavelength range.'),
+        ('source', 'source', None, 'The general class of the radiation source.'),
+        ('type', 'type', None, 'The make, model or name of the source of radiation.'),
+    )),
+    ('Attr_Em2dCrystalEntity', '', (
+        ('angle_gamma', 'angle_gamma', None, 'Unit-cell angle gamma in degrees.'),
+        ('c_sampling_length', 'c_sampling_length', None, 'Length used to sample the reciprocal lattice lines in the c-direction.'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('image_processing_id', 'image_processing_id', None, 'pointer to _em_image_processing.id in the EM_IMAGE_PROCESSING category.'),
+        ('length_a', 'length_a', None, 'Unit-cell length a in angstroms.'),
+        ('length_b', 'length_b', None, 'Unit-cell length b in angstroms.'),
+        ('length_c', 'length_c', None, 'Thickness of 2D crystal'),
+        ('space_group_name_H_M', 'space_group_name_H_M', None, "There are 17 plane groups classified as oblique, rectangular, square, and hexagonal.  To describe the symmetry of 2D crystals of biological molecules,  plane groups are expanded to equivalent noncentrosymmetric space groups.  The 2D crystal plane corresponds to the 'ab' plane of the space group.   Enumerated space group descriptions include the plane group number in parentheses,  the H-M plane group symbol, and the plane group class."),
+    )),
+    ('Attr_Em3dCrystalEntity', '', (
+        ('angle_alpha', 'angle_alpha', None, 'Unit-cell angle alpha in degrees.'),
+        ('angle_beta', 'angle_beta', None, 'Unit-cell angle beta in degrees.'),
+        ('angle_gamma', 'angle_gamma', None, 'Unit-cell angle gamma in degrees.'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('image_processing_id', 'image_processing_id', None, 'pointer to _em_image_processing.id in the EM_IMAGE_PROCESSING category.'),
+        ('length_a', 'length_a', None, 'Unit-cell length a in angstroms.'),
+        ('length_b', 'length_b', None, 'Unit-cell length b in angstroms.'),
+        ('length_c', 'length_c', None, 'Unit-cell length c in angstroms.'),
+        ('space_group_name', 'space_group_name', None, 'Space group name.'),
+        ('space_group_num', 'space_group_num', None, 'Space group number.'),
+    )),
+    ('Attr_Em3dFitting', '', (
+        ('details', 'details', None, 'Any additional details regarding fitting of atomic coordinates into  the 3DEM volume, including data and considerations from other  methods used in computation of the model.'),
+        ('id', 'id', None, 'The value of _em_3d_fitting.id must uniquely identify  a fitting procedure of atomic coordinates  into 3dem reconstructed map volume.'),
+        ('method', 'method', None, 'The method used to fit atomic coordinates  into the 3dem reconstructed map.'),
+        ('overall_b_value', 'overall_b_value', None, 'The overall B (temperature factor) value for the 3d-em volume.'),
+        ('ref_protocol', 'ref_protocol', None, 'The refinement protocol used.'),
+        ('ref_space', 'ref_space', None, 'A flag to indicate whether fitting was carried out in real  or reciprocal refinement space.'),
+        ('target_criteria', 'target_criteria', None, 'The measure used to assess quality of fit of the atomic coordinates in the  3DEM map volume.'),
+    )),
+    ('Attr_Em3dFittingList', '', (
+        ('em_3d_fitting_id', '3d_fitting_id', None, 'The value of _em_3d_fitting_list.3d_fitting_id is a pointer  to  _em_3d_fitting.id in the 3d_fitting category'),
+        ('details', 'details', None, 'Details about the model used in fitting.'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('pdb_chain_id', 'pdb_chain_id', None, 'The ID of the biopolymer chain used for fitting, e.g., A.  Please note that only one chain can be specified per instance.  If all chains of a particular structure have been used for fitting, this field can be left blank.'),
+        ('pdb_chain_residue_range', 'pdb_chain_residue_range', None, 'Residue range for the identified chain.'),
+        ('pdb_entry_id', 'pdb_entry_id', None, 'The PDB code for the entry used in fitting.'),
+    )),
+    ('Attr_Em3dReconstruction', '', (
+        ('actual_pixel_size', 'actual_pixel_size', None, 'The actual pixel size of the projection set of images in Angstroms.'),
+        ('algorithm', 'algorithm', None, 'The reconstruction algorithm/technique used to generate the map.'),
+        ('details', 'details', None, 'Any additional details used in the 3d reconstruction.'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('image_processing_id', 'image_processing_id', None, 'Foreign key to the EM_IMAGE_PROCESSING category'),
+        ('magnification_calibration', 'magnification_calibration', None, 'The magnification calibration method for the 3d reconstruction.'),
+        ('method', 'method', None, 'The algorithm method used for the 3d-reconstruction.'),
+        ('nominal_pixel_size', 'nominal_pixel_size', None, 'The nominal pixel size of the projection set of images in Angstroms.'),
+        ('num_class_averages', 'num_class_averages', None, 'The number of classes used in the final 3d reconstruction'),
+        ('num_particles', 'num_particles', None, 'The number of 2D projections or 3D subtomograms used in the 3d reconstruction'),
+        ('refinement_type', 'refinement_type', None, 'Indicates details on how the half-map used for resolution determination (usually by FSC) have been generated.'),
+        ('resolution', 'resolution', None, 'The final resolution (in angstroms) of the 3D reconstruction.'),
+        ('resolution_method', 'resolution_method', None, 'The  method used to determine the final resolution  of the 3d reconstruction.  The Fourier Shell Correlation criterion as a measure of  resolution is based on the concept of splitting the (2D)  data set into two halves; averaging each and comparing them  using the Fourier Ring Correlation (FRC) technique.'),
+        ('symmetry_type', 'symmetry_type', None, 'The type of symmetry applied to the reconstruction'),
+    )),
+    ('Attr_EmCtfCorrection', '', (
+        ('details', 'details', None, 'Any additional details about CTF correction'),
+        ('em_image_processing_id', 'em_image_processing_id', None, 'Foreign key to the EM_IMAGE_PROCESSING category'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('type', 'type', None, 'Type of CTF correction applied'),
+    )),
+    ('Attr_EmDiffraction', '', (
+        ('camera_length', 'camera_length', None, 'The camera length (in millimeters). The camera length is the  product of the objective focal length and the combined magnification  of the intermediate and projector lenses when the microscope is  operated in the diffraction mode.'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('imaging_id', 'imaging_id', None, 'Foreign key to the EM_IMAGING category'),
+        ('tilt_angle_list', 'tilt_angle_list', None, 'Comma-separated list of tilt angles (in degrees) used in the electron diffraction experiment.'),
+    )),
+    ('Attr_EmDiffractionShell', '', (
+        ('em_diffraction_stats_id', 'em_diffraction_stats_id', None, 'Pointer to EM CRYSTALLOGRAPHY STATS'),
+        ('fourier_space_coverage', 'fourier_space_coverage', None, 'Completeness of the structure factor data within this resolution shell, in percent'),
+        ('high_resolution', 'high_resolution', None, 'High resolution limit for this shell (angstroms)'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('low_resolution', 'low_resolution', None, 'Low resolution limit for this shell (angstroms)'),
+        ('multiplicity', 'multiplicity', None, 'Multiplicity (average number of measurements) for the structure factors in this resolution shell'),
+        ('num_structure_factors', 'num_structure_factors', None, 'Number of measured structure factors in this resolution shell'),
+        ('phase_residual', 'phase_residual', None, 'Phase residual for this resolution shell, in degrees'),
+    )),
+    ('Attr_EmDiffractionStats', '', (
+        ('details', 'details', None, 'Any addition details about the structure factor measurements'),
+        ('fourier_space_coverage', 'fourier_space_coverage', None, 'Completeness of the structure factor data within the defined space group  at the reported resolution (percent).'),
+        ('high_resolution', 'high_resolution', None, 'High resolution limit of the structure factor data, in angstroms'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('image_processing_id', 'image_processing_id', None, 'Pointer to _em_image_processing.id'),
+        ('num_intensities_measured', 'num_intensities_measured', None, 'Total number of diffraction intensities measured (before averaging)'),
+        ('num_structure_factors', 'num_structure_factors', None, 'Number of structure factors obtained (merged amplitudes + phases)'),
+        ('overall_phase_error', 'overall_phase_error', None, 'Overall phase error in degrees'),
+        ('overall_phase_residual', 'overall_phase_residual', None, 'Overall phase residual in degrees'),
+        ('phase_error_rejection_criteria', 'phase_error_rejection_criteria', None, 'Criteria used to reject phases'),
+        ('r_merge', 'r_merge', None, 'Rmerge value (percent)'),
+        ('r_sym', 'r_sym', None, 'Rsym value (percent)'),
+    )),
+    ('Attr_EmEmbedding', '', (
+        ('details', 'details', None, 'Staining procedure used in the specimen preparation.'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('material', 'material', None, 'The embedding  material.'),
+        ('specimen_id', 'specimen_id', None, 'Foreign key relationship to the EM SPECIMEN category'),
+    )),
+    ('Attr_EmEntityAssembly', '', (
+        ('details', 'details', None, 'Additional details about the sample or sample subcomponent.'),
+        ('entity_id_list', 'entity_id_list', None, ''),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('name', 'name', None, 'The name of the sample or sample subcomponent.'),
+        ('oligomeric_details', 'oligomeric_details', None, 'oligomeric details'),
+        ('parent_id', 'parent_id', None, 'The parent of this assembly.  This data item is an internal category pointer to _em_entity_assembly.id.  By convention, the full assembly (top of hierarchy) is assigned parent id 0 (zero).'),
+        ('source', 'source', None, 'The type of source (e.g., natural source) for the component (sample or sample subcomponent)'),
+        ('synonym', 'synonym', None, 'Alternative name of the component.'),
+        ('type', 'type', None, 'The general type of the sample or sample subcomponent.'),
+    )),
+    ('Attr_EmExperiment', '', (
+        ('aggregation_state', 'aggregation_state', None, 'The aggregation/assembly state of the imaged specimen.'),
+        ('entity_assembly_id', 'entity_assembly_id', None, 'Foreign key to the EM_ENTITY_ASSEMBLY category'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('reconstruction_method', 'reconstruction_method', None, 'The reconstruction method used in the EM experiment.'),
+    )),
+    ('Attr_EmHelicalEntity', '', (
+        ('angular_rotation_per_subunit', 'angular_rotation_per_subunit', None, 'The angular rotation per helical subunit in degrees. Negative values indicate left-handed helices; positive values indicate right handed helices.'),
+        ('axial_rise_per_subunit', 'axial_rise_per_subunit', None, 'The axial rise per subunit in the helical assembly.'),
+        ('axial_symmetry', 'axial_symmetry', None, 'Symmetry of the helical axis, either cyclic (Cn) or dihedral (Dn), where n>=1.'),
+        ('details', 'details', None, 'Any other details regarding the helical assembly'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('image_processing_id', 'image_processing_id', None, 'This data item is a pointer to _em_image_processing.id.'),
+    )),
+    ('Attr_EmImageRecording', '', (
+        ('average_exposure_time', 'average_exposure_time', None, 'The average exposure time for each image.'),
+        ('avg_electron_dose_per_image', 'avg_electron_dose_per_image', None, 'The electron dose received by the specimen per image (electrons per square angstrom).'),
+        ('details', 'details', None, 'Any additional details about image recording.'),
+        ('detector_mode', 'detector_mode', None, 'The detector mode used during image recording.'),
+        ('film_or_detector_model', 'film_or_detector_model', None, 'The detector type used for recording images.  Usually film , CCD camera or direct electron detector.'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('imaging_id', 'imaging_id', None, 'This data item the id of the microscopy settings used in the imaging.'),
+        ('num_diffraction_images', 'num_diffraction_images', None, 'The number of diffraction images collected.'),
+        ('num_grids_imaged', 'num_grids_imaged', None, 'Number of grids in the microscopy session'),
+        ('num_real_images', 'num_real_images', None, 'The number of micrograph images collected.'),
+    )),
+    ('Attr_EmImaging', '', (
+        ('accelerating_voltage', 'accelerating_voltage', None, 'A value of accelerating voltage (in kV) used for imaging.'),
+        ('alignment_procedure', 'alignment_procedure', None, 'The type of procedure used to align the microscope electron beam.'),
+        ('astigmatism', 'astigmatism', None, 'astigmatism'),
+        ('c2_aperture_diameter', 'c2_aperture_diameter', None, 'The open diameter of the c2 condenser lens,  in microns.'),
+        ('calibrated_defocus_max', 'calibrated_defocus_max', None, 'The maximum calibrated defocus value of the objective lens (in nanometers) used  to obtain the recorded images. Negative values refer to overfocus.'),
+        ('calibrated_defocus_min', 'calibrated_defocus_min', None, 'The minimum calibrated defocus value of the objective lens (in nanometers) used  to obtain the recorded images. Negative values refer to overfocus.'),
+        ('calibrated_magnification', 'calibrated_magnification', None, 'The magnification value obtained for a known standard just  prior to, during or just after the imaging experiment.'),
+        ('cryogen', 'cryogen', None, 'Cryogen type used to maintain the specimen stage temperature during imaging  in the microscope.'),
+        ('date', 'date', None, 'Date (YYYY-MM-DD) of imaging experiment or the date at which  a series of experiments began.'),
+        ('details', 'details', None, 'Any additional imaging details.'),
+        ('detector_distance', 'detector_distance', None, 'The camera length (in millimeters). The camera length is the  product of the objective focal length and the combined magnification  of the intermediate and projector lenses when the microscope is  operated in the diffraction mode.'),
+        ('electron_beam_tilt_params', 'electron_beam_tilt_params', None, 'electron beam tilt params'),
+        ('electron_source', 'electron_source', None, 'The source of electrons. The electron gun.'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('illumination_mode', 'illumination_mode', None, 'The mode of illumination.'),
+        ('microscope_model', 'microscope_model', None, 'The name of the model of microscope.'),
+        ('mode', 'mode', None, 'The mode of imaging.'),
+        ('nominal_cs', 'nominal_cs', None, 'The spherical aberration coefficient (Cs) in millimeters,  of the objective lens.'),
+        ('nominal_defocus_max', 'nominal_defocus_max', None, 'The maximum defocus value of the objective lens (in nanometers) used  to obtain the recorded images. Negative values refer to overfocus.'),
+        ('nominal_defocus_min', 'nominal_defocus_min', None, 'The minimum defocus value of the objective lens (in nanometers) used  to obtain the recorded images. Negative values refer to overfocus.'),
+        ('nominal_magnification', 'nominal_magnification', None, 'The magnification indicated by the microscope readout.'),
+        ('recording_temperature_maximum', 'recording_temperature_maximum', None, 'The specimen temperature maximum (kelvin) for the duration  of imaging.'),
+        ('recording_temperature_minimum', 'recording_temperature_minimum', None, 'The specimen temperature minimum (kelvin) for the duration  of imaging.'),
+        ('residual_tilt', 'residual_tilt', None, 'Residual tilt of the electron beam (in miliradians)'),
+        ('specimen_holder_model', 'specimen_holder_model', None, 'The name of the model of specimen holder used during imaging.'),
+        ('specimen_holder_type', 'specimen_holder_type', None, 'The type of specimen holder used during imaging.'),
+        ('specimen_id', 'specimen_id', None, 'Foreign key to the EM_SPECIMEN category'),
+        ('temperature', 'temperature', None, 'The mean specimen stage temperature (in kelvin) during imaging  in the microscope.'),
+        ('tilt_angle_max', 'tilt_angle_max', None, 'The maximum angle at which the specimen was tilted to obtain  recorded images.'),
+        ('tilt_angle_min', 'tilt_angle_min', None, 'The minimum angle at which the specimen was tilted to obtain  recorded images.'),
+    )),
+    ('Attr_EmParticleSelection', '', (
+        ('details', 'details', None, 'Additional detail such as description of filters used, if selection was manual or automated, and/or template details.'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('image_processing_id', 'image_processing_id', None, 'The value of _em_particle_selection.image_processing_id points to  the EM_IMAGE_PROCESSING category.'),
+        ('num_particles_selected', 'num_particles_selected', None, 'The number of particles selected from the projection set of images.'),
+    )),
+    ('Attr_EmSingleParticleEntity', '', (
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('image_processing_id', 'image_processing_id', None, 'pointer to _em_image_processing.id.'),
+        ('point_symmetry', 'point_symmetry', None, 'Point symmetry symbol, either Cn, Dn, T, O, or I'),
+    )),
+    ('Attr_EmSoftware', '', (
+        ('category', 'category', None, 'The purpose of the software.'),
+        ('details', 'details', None, 'Details about the software used.'),
+        ('fitting_id', 'fitting_id', None, 'pointer to _em_3d_fitting.id in the EM_3D_FITTING category.'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('image_processing_id', 'image_processing_id', None, 'pointer to _em_image_processing.id in the EM_IMAGE_PROCESSING category.'),
+        ('imaging_id', 'imaging_id', None, 'pointer to _em_imaging.id in the EM_IMAGING category.'),
+        ('name', 'name', None, 'The name of the software package used, e.g., RELION.  Depositors are strongly   encouraged to provide a value in this field.'),
+        ('version', 'version', None, 'The version of the software.'),
+    )),
+    ('Attr_EmSpecimen', '', (
+        ('concentration', 'concentration', None, 'The concentration (in milligrams per milliliter, mg/ml)  of the complex in the sample.'),
+        ('details', 'details', None, 'A description of any additional details of the specimen preparation.'),
+        ('embedding_applied', 'embedding_applied', None, "'YES' indicates that the specimen has been embedded."),
+        ('experiment_id', 'experiment_id', None, 'Pointer to _em_experiment.id.'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('shadowing_applied', 'shadowing_applied', None, "'YES' indicates that the specimen has been shadowed."),
+        ('staining_applied', 'staining_applied', None, "'YES' indicates that the specimen has been stained."),
+        ('vitrification_applied', 'vitrification_applied', None, "'YES' indicates that the specimen was vitrified by cryopreservation."),
+    )),
+    ('Attr_EmStaining', '', (
+        ('details', 'details', None, 'Staining procedure used in the specimen preparation.'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('material', 'material', None, 'The staining  material.'),
+        ('specimen_id', 'specimen_id', None, 'Foreign key relationship to the EM SPECIMEN category'),
+        ('type', 'type', None, 'type of staining'),
+    )),
+    ('Attr_EmVitrification', '', (
+        ('chamber_temperature', 'chamber_temperature', None, 'The temperature (in kelvin) of the sample just prior to vitrification.'),
+        ('cryogen_name', 'cryogen_name', None, 'This is the name of the cryogen.'),
+        ('details', 'details', None, 'Any additional details relating to vitrification.'),
+        ('humidity', 'humidity', None, 'Relative humidity (%) of air surrounding the specimen just prior to vitrification.'),
+        ('id', 'id', None, 'PRIMARY KEY'),
+        ('instrument', 'instrument', None, 'The type of instrument used in the vitrification process.'),
+        ('method', 'method', None, 'The procedure for vitrification.'),
+        ('specimen_id', 'specimen_id', None, 'This data item is a pointer to _em_specimen.id'),
+        ('temp', 'temp', None, 'The vitrification temperature (in kelvin), e.g.,   temperature of the plunge instrument cryogen bath.'),
+        ('time_resolved_state', 'time_resolved_state', None, 'The length of time after an event effecting the sample that  vitrification was induced and a description of the event.'),
+    )),
+    ('Attr_Entry', '', (
+        ('id', 'id', None, 'The value of _entry.id identifies the data block.   Note that this item need not be a number; it can be any unique  identifier.'),
+        ('ma_collection_id', 'ma_collection_id', None, 'An identifier for the model collection associated with the entry.'),
+    )),
+    ('Attr_Exptl', '', (
+        ('crystals_number', 'crystals_number', None, 'The total number of crystals used in the  measurement of  intensities.'),
+        ('details', 'details', None, 'Any special information about the experimental work prior to the  intensity measurement. See also _exptl_crystal.preparation.'),
+        ('method', 'method', None, 'The method used in the experiment.'),
+        ('method_details', 'method_details', None, 'A description of special aspects of the experimental method.'),
+    )),
+    ('Attr_ExptlCrystal', '', (
+        ('colour', 'colour', None, 'The colour of the crystal.'),
+        ('density_Matthews', 'density_Matthews', None, 'The density of the crystal, expressed as the ratio of the  volume of the asymmetric unit to the molecular mass of a  monomer of the structure, in units of angstroms^3^ per dalton.   Ref: Matthews, B. W. (1968). J. Mol. Biol. 33, 491-497.'),
+        ('density_meas', 'density_meas', None, 'Density values measured using standard chemical and physical  methods. The units are megagrams per cubic metre (grams per  cubic centimetre).'),
+        ('density_percent_sol', 'density_percent_sol', None, 'Density value P calculated from the crystal cell and contents,  expressed as per cent solvent.   P = 1 - (1.23 N MMass) / V   N     = the number of molecules in the unit cell  MMass = the molecular mass of each molecule (gm/mole)  V     = the volume of the unit cell (A^3^)  1.23  = a conversion factor evaluated as:           (0.74 cm^3^/g) (10^24^ A^3^/cm^3^)          --------------------------------------               (6.02*10^23^) molecules/mole           where 0.74 is an assumed value for the partial specific          volume of the molecule'),
+        ('description', 'description', None, 'A description of the quality and habit of the crystal.  The crystal dimensions should not normally be reported here;  use instead the specific items in the EXPTL_CRYSTAL category  relating to size for the gross dimensions of the crystal and  data items in the EXPTL_CRYSTAL_FACE category to describe the  relationship between individual faces.'),
+        ('id', 'id', None, 'The value of _exptl_crystal.id must uniquely identify a record in  the EXPTL_CRYSTAL list.   Note that this item need not be a number; it can be any unique  identifier.'),
+        ('pdbx_mosaicity', 'pdbx_mosaicity', None, 'Isotropic approximation of the distribution of mis-orientation angles specified in degrees of all the mosaic domain blocks in the crystal, represented as a standard deviation. Here, a mosaic block is a set of contiguous unit cells assumed to be perfectly aligned. Lower mosaicity indicates better ordered crystals. See for example:  Nave, C. (1998). Acta Cryst. D54, 848-853.  Note that many software packages estimate the mosaic rotation distribution differently and may combine several physical properties of the experiment into a single mosaic term. This term will help fit the modeled spots to the observed spots without necessarily being directly related to the physics of the crystal itself.'),
+        ('pdbx_mosaicity_esd', 'pdbx_mosaicity_esd', None, 'The uncertainty in the mosaicity estimate for the crystal.'),
+        ('preparation', 'preparation', None, 'Details of crystal growth and preparation of the crystal (e.g.  mounting) prior to the intensity measurements.'),
+    )),
+    ('Attr_ExptlCrystalGrow', '', (
+        ('crystal_id', 'crystal_id', None, 'This data item is a pointer to _exptl_crystal.id in the  EXPTL_CRYSTAL category.'),
+        ('details', 'details', None, 'A description of special aspects of the crystal growth.'),
+        ('method', 'method', None, 'The method used to grow the crystals.'),
+        ('pH', 'pH', None, 'The pH at which the crystal was grown. If more than one pH was  employed during the crystallization process, the final pH should  be noted here and the protocol involving multiple pH values  should be described in _exptl_crystal_grow.details.'),
+        ('pdbx_details', 'pdbx_details', None, 'Text description of crystal growth procedure.'),
+        ('pdbx_pH_range', 'pdbx_pH_range', None, 'The range of pH values at which the crystal was grown.   Used when  a point estimate of pH is not appropriate.'),
+        ('temp', 'temp', None, 'The temperature in kelvins at which the crystal was grown.  If more than one temperature was employed during the  crystallization process, the final temperature should be noted  here and the protocol  involving multiple temperatures should be  described in _exptl_crystal_grow.details.'),
+        ('temp_details', 'temp_details', None, 'A description of special aspects of temperature control during  crystal growth.'),
+    )),
+    ('Attr_IhmEntryCollectionMapping', '', (
+        ('collection_id', 'collection_id', None, 'Identifier for the entry collection.   This data item is a pointer to _ihm_entry_collection.id in the   IHM_ENTRY_COLLECTION category.'),
+    )),
+    ('Attr_IhmExternalReferenceInfo', '', (
+        ('associated_url', 'associated_url', None, 'The Uniform Resource Locator (URL) corresponding to the external reference (DOI).   This URL should link to the corresponding downloadable file or archive and is provided   to enable automated software to download the referenced file or archive.'),
+        ('reference', 'reference', None, 'The external reference or the Digital Object Identifier (DOI).  This field is not relevant for local files.'),
+        ('reference_provider', 'reference_provider', None, 'The name of the reference provider.'),
+    )),
+    ('Attr_MaData', '', (
+        ('content_type', 'content_type', None, 'The type of data held in the dataset.'),
+        ('content_type_other_details', 'content_type_other_details', None, 'Details for other content types.'),
+        ('id', 'id', None, 'A unique identifier for the data.'),
+        ('name', 'name', None, 'An author-given name for the content held in the dataset.'),
+    )),
+    ('Attr_PdbxSgProject', '', (
+        ('full_name_of_center', 'full_name_of_center', None, 'The value identifies the full name of center.'),
+        ('id', 'id', None, 'A unique integer identifier for this center'),
+        ('initial_of_center', 'initial_of_center', None, 'The value identifies the full name of center.'),
+        ('project_name', 'project_name', None, 'The value identifies the Structural Genomics project.'),
+    )),
+    ('Attr_PdbxAuditRevisionCategory', '', (
+        ('category', 'category', None, 'The category updated in the pdbx_audit_revision_category record.'),
+        ('data_content_type', 'data_content_type', None, 'The type of file that the pdbx_audit_revision_history record refers to.'),
+        ('ordinal', 'ordinal', None, 'A unique identifier for the pdbx_audit_revision_category record.'),
+        ('revision_ordinal', 'revision_ordinal', None, 'A pointer to  _pdbx_audit_revision_history.ordinal'),
+    )),
+    ('Attr_PdbxAuditRevisionDetails', '', (
+        ('data_content_type', 'data_content_type', None, 'The type of file that the pdbx_audit_revision_history record refers to.'),
+        ('description', 'description', None, 'Additional details describing the revision.'),
+        ('details', 'details', None, 'Further details describing the revision.'),
+        ('ordinal', 'ordinal', None, 'A unique identifier for the pdbx_audit_revision_details record.'),
+        ('provider', 'provider', None, 'The provider of the revision.'),
+        ('revision_ordinal', 'revision_ordinal', None, 'A pointer to  _pdbx_audit_revision_history.ordinal'),
+        ('type', 'type', None, 'A type classification of the revision'),
+    )),
+    ('Attr_PdbxAuditRevisionGroup', '', (
+        ('data_content_type', 'data_content_type', None, 'The type of file that the pdbx_audit_revision_history record refers to.'),
+        ('group', 'group', None, 'The collection of categories updated with this revision.'),
+        ('ordinal', 'ordinal', None, 'A unique identifier for the pdbx_audit_revision_group record.'),
+        ('revision_ordinal', 'revision_ordinal', None, 'A pointer to  _pdbx_audit_revision_history.ordinal'),
+    )),
+    ('Attr_PdbxAuditRevisionHistory', '', (
+        ('data_content_type', 'data_content_type', None, 'The type of file that the pdbx_audit_revision_history record refers to.'),
+        ('major_revision', 'major_revision', None, 'The major version number of deposition release.'),
+        ('minor_revision', 'minor_revision', None, 'The minor version number of deposition release.'),
+        ('ordinal', 'ordinal', None, 'A unique identifier for the pdbx_audit_revision_history record.'),
+        ('revision_date', 'revision_date', None, 'The release date of the revision'),
+    )),
+    ('Attr_PdbxAuditRevisionItem', '', (
+        ('data_content_type', 'data_content_type', None, 'The type of file that the pdbx_audit_revision_history record refers to.'),
+        ('item', 'item', None, 'A high level explanation the author has provided for submitting a revision.'),
+        ('ordinal', 'ordinal', None, 'A unique identifier for the pdbx_audit_revision_item record.'),
+        ('revision_ordinal', 'revision_ordinal', None, 'A pointer to  _pdbx_audit_revision_history.ordinal'),
+    )),
+    ('Attr_PdbxAuditSupport', '', (
+        ('country', 'country', None, 'The country/region providing the funding support for the entry.  Funding information is optionally provided for entries after June 2016.'),
+        ('funding_organization', 'funding_organization', None, 'The name of the organization providing funding support for the  entry. Funding information is optionally provided for entries  after June 2016.'),
+        ('grant_number', 'grant_number', None, 'The grant number associated with this source of support.'),
+        ('ordinal', 'ordinal', None, 'A unique sequential integer identifier for each source of support for this entry.'),
+    )),
+    ('Attr_PdbxDatabasePdbObsSpr', '', (
+        ('date', 'date', None, 'The date of replacement.'),
+        ('details', 'details', None, 'Details related to the replaced or replacing entry.'),
+        ('id', 'id', None, 'Identifier for the type of obsolete entry to be added to this entry.'),
+        ('pdb_id', 'pdb_id', None, 'The new PDB identifier for the replaced entry.'),
+        ('replace_pdb_id', 'replace_pdb_id', None, 'The PDB identifier for the replaced (OLD) entry/entries.'),
+    )),
+    ('Attr_PdbxDatabaseRelated', '', (
+        ('content_type', 'content_type', None, 'The identifying content type of the related entry.'),
+        ('db_id', 'db_id', None, 'The identifying code in the related database.'),
+        ('db_name', 'db_name', None, 'The name of the database containing the related entry.'),
+        ('details', 'details', None, 'A description of the related entry.'),
+    )),
+    ('Attr_PdbxDatabaseStatus', '', (
+        ('SG_entry', 'SG_entry', None, 'This code indicates whether the entry belongs to  Structural Genomics Project.'),
+        ('deposit_site', 'deposit_site', None, 'The site where the file was deposited.'),
+        ('methods_development_category', 'methods_development_category', None, 'The methods development category in which this  entry has been placed.'),
+        ('pdb_format_compatible', 'pdb_format_compatible', None, "A flag indicating that the entry is compatible with the PDB format.   A value of 'N' indicates that the no PDB format data file is  corresponding to this entry is available in the PDB archive."),
+        ('process_site', 'process_site', None, 'The site where the file was deposited.'),
+        ('recvd_initial_deposition_date', 'recvd_initial_deposition_date', None, 'The date of initial deposition.  (The first message for  deposition has been received.)'),
+        ('status_code', 'status_code', None, 'Code for status of file.'),
+        ('status_code_cs', 'status_code_cs', None, 'Code for status of chemical shift data file.'),
+        ('status_code_mr', 'status_code_mr', None, 'Code for status of NMR constraints file.'),
+        ('status_code_sf', 'status_code_sf', None, 'Code for status of structure factor file.'),
+    )),
+    ('Attr_PdbxDepositGroup', '', (
+        ('group_description', 'group_description', None, 'A description of the contents of entries in the collection.'),
+        ('group_id', 'group_id', None, 'A unique identifier for a group of entries deposited as a collection.'),
+        ('group_title', 'group_title', None, 'A title to describe the group of entries deposited in the collection.'),
+        ('group_type', 'group_type', None, 'Text to describe a grouping of entries in multiple collections'),
+    )),
+    ('Attr_PdbxInitialRefinementModel', '', (
+        ('accession_code', 'accession_code', None, 'This item identifies an accession code of the resource where the initial model  is used'),
+        ('details', 'details', None, 'A description of special aspects of the initial model'),
+        ('entity_id_list', 'entity_id_list', None, ''),
+        ('id', 'id', None, 'A unique identifier for the starting model record.'),
+        ('source_name', 'source_name', None, 'This item identifies the resource of initial model used for refinement'),
+        ('type', 'type', None, 'This item describes the type of the initial model was generated'),
+    )),
+    ('Attr_PdbxMoleculeFeatures', '', (
+        ('class_', 'class', None, 'Broadly defines the function of the molecule.'),
+        ('details', 'details', None, 'Additional details describing the molecule.'),
+        ('name', 'name', None, 'A name of the molecule.'),
+        ('prd_id', 'prd_id', None, 'The value of _pdbx_molecule_features.prd_id is the accession code for this  reference molecule.'),
+        ('type', 'type', None, 'Defines the structural classification of the molecule.'),
+    )),
+    ('Attr_PdbxNmrDetails', '', (
+        ('text', 'text', None, 'Additional details describing the NMR experiment.'),
+    )),
+    ('Attr_PdbxNmrEnsemble', '', (
+        ('average_constraint_violations_per_residue', 'average_constraint_violations_per_residue', None, 'The average number of constraint violations on a per residue basis for  the ensemble.'),
+        ('average_constraints_per_residue', 'average_constraints_per_residue', None, 'The average number of constraints per residue for the ensemble'),
+        ('average_distance_constraint_violation', 'average_distance_constraint_violation', None, 'The average distance restraint violation for the ensemble.'),
+        ('average_torsion_angle_constraint_violation', 'average_torsion_angle_constraint_violation', None, 'The average torsion angle constraint violation for the ensemble.'),
+        ('conformer_selection_criteria', 'conformer_selection_criteria', None, 'By highlighting the appropriate choice(s), describe how the submitted conformer (models) were selected.'),
+        ('conformers_calculated_total_number', 'conformers_calculated_total_number', None, 'The total number of conformer (models) that were calculated in the final round.'),
+        ('conformers_submitted_total_number', 'conformers_submitted_total_number', None, 'The number of conformer (models) that are submitted for the ensemble.'),
+        ('distance_constraint_violation_method', 'distance_constraint_violation_method', None, 'Describe the method used to calculate the distance constraint violation statistics,  i.e. are they calculated over all the distance constraints or calculated for  violations only?'),
+        ('maximum_distance_constraint_violation', 'maximum_distance_constraint_violation', None, 'The maximum distance constraint violation for the ensemble.'),
+        ('maximum_lower_distance_constraint_violation', 'maximum_lower_distance_constraint_violation', None, 'The maximum lower distance constraint violation for the ensemble.'),
+        ('maximum_torsion_angle_constraint_violation', 'maximum_torsion_angle_constraint_violation', None, 'The maximum torsion angle constraint violation for the ensemble.'),
+        ('maximum_upper_distance_constraint_violation', 'maximum_upper_distance_constraint_violation', None, 'The maximum upper distance constraint violation for the ensemble.'),
+        ('representative_conformer', 'representative_conformer', None, 'The number of the conformer identified as most representative.'),
+        ('torsion_angle_constraint_violation_method', 'torsion_angle_constraint_violation_method', None, 'This item describes the method used to calculate the torsion angle constraint violation statistics. i.e. are the entered values based on all torsion angle or calculated for violations only?'),
+    )),
+    ('Attr_PdbxNmrExptl', '', (
+        ('conditions_id', 'conditions_id', None, 'The number to identify the set of sample conditions.'),
+        ('experiment_id', 'experiment_id', None, 'A numerical ID for each experiment.'),
+        ('sample_state', 'sample_state', None, 'Physical state of the sample either anisotropic or isotropic.'),
+        ('solution_id', 'solution_id', None, 'The solution_id from the Experimental Sample to identify the sample  that these conditions refer to.   [Remember to save the entries here before returning to the   Experimental Sample form]'),
+        ('spectrometer_id', 'spectrometer_id', None, "Pointer to '_pdbx_nmr_spectrometer.spectrometer_id'"),
+        ('type', 'type', None, 'The type of NMR experiment.'),
+    )),
+    ('Attr_PdbxNmrExptlSampleConditions', '', (
+        ('conditions_id', 'conditions_id', None, 'The condition number as defined above.'),
+        ('details', 'details', None, 'General details describing conditions of both the sample and the environment during measurements.'),
+        ('ionic_strength', 'ionic_strength', None, 'The ionic strength at which the NMR data were collected -in lieu of  this enter the concentration and identity of the salt in the sample.'),
+        ('ionic_strength_err', 'ionic_strength_err', None, 'Estimate of the standard error for the value for the sample ionic strength.'),
+        ('ionic_strength_units', 'ionic_strength_units', None, 'Units for the value of the sample condition ionic strength..'),
+        ('label', 'label', None, 'A descriptive label that uniquely identifies this set of sample conditions.'),
+        ('pH', 'pH', None, 'The pH at which the NMR data were collected.'),
+        ('pH_err', 'pH_err', None, 'Estimate of the standard error for the value for the sample pH.'),
+        ('pH_units', 'pH_units', None, 'Units for the value of the sample condition pH.'),
+        ('pressure', 'pressure', None, 'The pressure at which NMR data were collected.'),
+        ('pressure_err', 'pressure_err', None, 'Estimate of the standard error for the value for the sample pressure.'),
+        ('pressure_units', 'pressure_units', None, 'The units of pressure at which NMR data were collected.'),
+        ('temperature', 'temperature', None, 'The temperature (in kelvin) at which NMR data were  collected.'),
+        ('temperature_err', 'temperature_err', None, 'Estimate of the standard error for the value for the sample temperature.'),
+        ('temperature_units', 'temperature_units', None, 'Units for the value of the sample condition temperature.'),
+    )),
+    ('Attr_PdbxNmrRefine', '', (
+        ('details', 'details', None, 'Additional details about the NMR refinement.'),
+        ('method', 'method', None, 'The method used to determine the structure.'),
+        ('software_ordinal', 'software_ordinal', None, 'Pointer to _software.ordinal'),
+    )),
+    ('Attr_PdbxNmrRepresentative', '', (
+        ('conformer_id', 'conformer_id', None, 'If a member of the ensemble has been selected as a representative  structure, identify it by its model number.'),
+        ('selection_criteria', 'selection_criteria', None, 'By highlighting the appropriate choice(s), describe the criteria used to select this structure as a representative structure, or if an average structure has been calculated describe how this was done.'),
+    )),
+    ('Attr_PdbxNmrSampleDetails', '', (
+        ('contents', 'contents', None, 'A complete description of each NMR sample. Include the concentration and concentration units for each component (include buffers, etc.). For each component describe the isotopic composition, including the % labeling level, if known.  For example: 1. Uniform (random) labeling with 15N: U-15N 2. Uniform (random) labeling with 13C, 15N at known labeling    levels: U-95% 13C;U-98% 15N 3. Residue selective labeling: U-95% 15N-Thymine 4. Site specific labeling: 95% 13C-Ala18, 5. Natural abundance labeling in an otherwise uniformly labeled    biomolecule is designated by NA: U-13C; NA-K,H'),
+        ('details', 'details', None, 'Brief description of the sample providing additional information not captured by other items in the category.'),
+        ('label', 'label', None, 'A value that uniquely identifies this sample from the other samples listed in the entry.'),
+        ('solution_id', 'solution_id', None, 'The name (number) of the sample.'),
+        ('solvent_system', 'solvent_system', None, 'The solvent system used for this sample.'),
+        ('type', 'type', None, 'A descriptive term for the sample that defines the general physical properties of the sample.'),
+    )),
+    ('Attr_PdbxNmrSoftware', '', (
+        ('authors', 'authors', None, 'The name of the authors of the software used in this  procedure.'),
+        ('classification', 'classification', None, 'The purpose of the software.'),
+        ('name', 'name', None, 'The name of the software used for the task.'),
+        ('ordinal', 'ordinal', None, 'An ordinal index for this category'),
+        ('version', 'version', None, 'The version of the software.'),
+    )),
+    ('Attr_PdbxNmrSpectrometer', '', (
+        ('details', 'details', None, 'A text description of the NMR spectrometer.'),
+        ('field_strength', 'field_strength', None, 'The field strength in MHz of the spectrometer'),
+        ('manufacturer', 'manufacturer', None, 'The name of the manufacturer of the spectrometer.'),
+        ('model', 'model', None, 'The model of the NMR spectrometer.'),
+        ('spectrometer_id', 'spectrometer_id', None, 'Assign a numerical ID to each instrument.'),
+        ('type', 'type', None, 'Select the instrument manufacturer(s) and the model(s) of the NMR(s) used for this work.'),
+    )),
+    ('Attr_PdbxReflnsTwin', '', (
+        ('crystal_id', 'crystal_id', None, 'The crystal identifier.  A reference to  _exptl_crystal.id in category EXPTL_CRYSTAL.'),
+        ('diffrn_id', 'diffrn_id', None, 'The diffraction data set identifier.  A reference to  _diffrn.id in category DIFFRN.'),
+        ('domain_id', 'domain_id', None, 'An identifier for the twin domain.'),
+        ('fraction', 'fraction', None, 'The twin fraction or twin factor represents a quantitative parameter for the crystal twinning.  The value 0 represents no twinning, < 0.5 partial twinning,  = 0.5 for perfect twinning.'),
+        ('operator', 'operator', None, 'The possible merohedral or hemihedral twinning operators for different point groups are:  True point group  \tTwin operation  \thkl related to 3                      \t2 along a,b             h,-h-k,-l                        \t2 along a*,b*           h+k,-k,-l                         2 along c               -h,-k,l 4                       2 along a,b,a*,b*       h,-k,-l 6                       2 along a,b,a*,b*       h,-h-k,-l 321                     2 along a*,b*,c         -h,-k,l 312                     2 along a,b,c           -h,-k,l 23                      4 along a,b,c            k,-h,l  References:  Yeates, T.O. (1997) Methods in Enzymology 276, 344-358. Detecting and  Overcoming Crystal Twinning.   and information from the following on-line sites:     CNS site http://cns.csb.yale.edu/v1.1/    CCP4 site http://www.ccp4.ac.uk/dist/html/detwin.html    SHELX site http://shelx.uni-ac.gwdg.de/~rherbst/twin.html'),
+        ('type', 'type', None, 'There are two types of twinning: merohedral or hemihedral                                  non-merohedral or epitaxial  For merohedral twinning the diffraction patterns from the different domains are completely superimposable.   Hemihedral twinning is a special case of merohedral twinning. It only involves two distinct domains.  Pseudo-merohedral twinning is a subclass merohedral twinning in which lattice is coincidentally superimposable.  In the case of non-merohedral or epitaxial twinning  the reciprocal lattices do not superimpose exactly. In this case the  diffraction pattern consists of two (or more) interpenetrating lattices, which can in principle be separated.'),
+    )),
+    ('Attr_PdbxRelatedExpDataSet', '', (
+        ('data_reference', 'data_reference', None, 'A DOI reference to the related data set.'),
+        ('data_set_type', 'data_set_type', None, 'The type of the experimenatal data set.'),
+        ('details', 'details', None, 'Additional details describing the content of the related data set and its application to  the current investigation.'),
+        ('metadata_reference', 'metadata_reference', None, 'A DOI reference to the metadata decribing the related data set.'),
+    )),
+    ('Attr_PdbxSerialCrystallographyDataReduction', '', (
+        ('crystal_hits', 'crystal_hits', None, 'For experiments in which samples are provided in a  continuous stream, the total number of frames collected  in which the crystal was hit.'),
+        ('diffrn_id', 'diffrn_id', None, 'The data item is a pointer to _diffrn.id in the DIFFRN  category.'),
+        ('droplet_hits', 'droplet_hits', None, 'For experiments in which samples are provided in a  continuous stream, the total number of frames collected  in which a droplet was hit.'),
+        ('frame_hits', 'frame_hits', None, 'For experiments in which samples are provided in a  continuous stream, the total number of data frames collected  in which the sample was hit.'),
+        ('frames_failed_index', 'frames_failed_index', None, "For experiments in which samples are provided in a  continuous stream, the total number of data frames collected  that contained a 'hit' but failed to index."),
+        ('frames_indexed', 'frames_indexed', None, 'For experiments in which samples are provided in a  continuous stream, the total number of data frames collected  that were indexed.'),
+        ('frames_total', 'frames_total', None, 'The total number of data frames collected for this  data set.'),
+        ('lattices_indexed', 'lattices_indexed', None, 'For experiments in which samples are provided in a  continuous stream, the total number of lattices indexed.'),
+        ('lattices_merged', 'lattices_merged', None, 'For experiments in which samples are provided in a             continuous stream, the total number of crystal lattices             that were merged in the final dataset.  Can be             less than frames_indexed depending on filtering during merging or \t    can be more than frames_indexed if there are multiple lattices. \t    per frame.'),
+        ('xfel_pulse_events', 'xfel_pulse_events', None, 'For FEL experiments, the number of pulse events in the dataset.'),
+        ('xfel_run_numbers', 'xfel_run_numbers', None, 'For FEL experiments, in which data collection was performed \t       in batches, indicates which subset of the data collected                were used in producing this dataset.'),
+    )),
+    ('Attr_PdbxSerialCrystallographyMeasurement', '', (
+        ('collection_time_total', 'collection_time_total', None, 'The total number of hours required to measure this data set.'),
+        ('collimation', 'collimation', None, 'The collimation or type of focusing optics applied to the radiation.'),
+        ('diffrn_id', 'diffrn_id', None, 'The data item is a pointer to _diffrn.id in the DIFFRN  category.'),
+        ('focal_spot_size', 'focal_spot_size', None, 'The focal spot size of the beam  impinging on the sample (micrometres squared).'),
+        ('photons_per_pulse', 'photons_per_pulse', None, 'The photons per pulse measured in  (tera photons (10^(12)^)/pulse units).'),
+        ('pulse_duration', 'pulse_duration', None, 'The average duration (femtoseconds) \t       of the pulse energy measured at the sample.'),
+        ('pulse_energy', 'pulse_energy', None, 'The energy/pulse of the X-ray pulse impacting the sample measured in microjoules.'),
+        ('pulse_photon_energy', 'pulse_photon_energy', None, 'The photon energy of the X-ray pulse measured in KeV.'),
+        ('source_distance', 'source_distance', None, 'The distance from source to the sample along the optical axis (metres).'),
+        ('source_size', 'source_size', None, 'The dimension of the source beam measured at the source (micrometres squared).'),
+        ('xfel_pulse_repetition_rate', 'xfel_pulse_repetition_rate', None, 'For FEL experiments, the pulse repetition rate measured in cycles per seconds.'),
+    )),
+    ('Attr_PdbxSerialCrystallographySampleDelivery', '', (
+        ('description', 'description', None, 'The description of the mechanism by which the specimen in placed in the path  of the source.'),
+        ('diffrn_id', 'diffrn_id', None, 'The data item is a pointer to _diffrn.id in the DIFFRN  category.'),
+        ('method', 'method', None, 'The description of the mechanism by which the specimen in placed in the path  of the source.'),
+    )),
+    ('Attr_PdbxSerialCrystallographySampleDeliveryFixedTarget', '', (
+        ('crystals_per_unit', 'crystals_per_unit', None, 'The number of crystals per dropplet or pore in fixed target'),
+        ('description', 'description', None, 'For a fixed target sample, a description of sample preparation'),
+        ('details', 'details', None, 'Any details pertinent to the fixed sample target'),
+        ('diffrn_id', 'diffrn_id', None, 'The data item is a pointer to _diffrn.id in the DIFFRN  category.'),
+        ('motion_control', 'motion_control', None, 'Device used to control movement of the fixed sample'),
+        ('sample_dehydration_prevention', 'sample_dehydration_prevention', None, 'Method to prevent dehydration of sample'),
+        ('sample_holding', 'sample_holding', None, 'For a fixed target sample, mechanism to hold sample in the beam'),
+        ('sample_solvent', 'sample_solvent', None, 'The sample solution content and concentration'),
+        ('sample_unit_size', 'sample_unit_size', None, 'Size of pore in grid supporting sample. Diameter or length in micrometres,  e.g. pore diameter'),
+        ('support_base', 'support_base', None, 'Type of base holding the support'),
+        ('velocity_horizontal', 'velocity_horizontal', None, 'Velocity of sample horizontally relative to a perpendicular beam in millimetres/second'),
+        ('velocity_vertical', 'velocity_vertical', None, 'Velocity of sample vertically relative to a perpendicular beam in millimetres/second'),
+    )),
+    ('Attr_PdbxSerialCrystallographySampleDeliveryInjection', '', (
+        ('carrier_solvent', 'carrier_solvent', None, 'For continuous sample flow experiments, the carrier buffer used  to move the sample into the beam. Should include protein  concentration.'),
+        ('crystal_concentration', 'crystal_concentration', None, 'For continuous sample flow experiments, the concentration of  crystals in the solution being injected.   The concentration is measured in million crystals/ml.'),
+        ('description', 'description', None, 'For continuous sample flow experiments, a description of the injector used  to move the sample into the beam.'),
+        ('diffrn_id', 'diffrn_id', None, 'The data item is a pointer to _diffrn.id in the DIFFRN  category.'),
+        ('filter_size', 'filter_size', None, 'The size of filter in micrometres in filtering crystals'),
+        ('flow_rate', 'flow_rate', None, 'For continuous sample flow experiments, the flow rate of  solution being injected  measured in ul/min.'),
+        ('injector_diameter', 'injector_diameter', None, 'For continuous sample flow experiments, the diameter of the  injector in micrometres.'),
+        ('injector_nozzle', 'injector_nozzle', None, 'The type of nozzle to deliver and focus sample jet'),
+        ('injector_pressure', 'injector_pressure', None, 'For continuous sample flow experiments, the mean pressure  in kilopascals at which the sample is injected into the beam.'),
+        ('injector_temperature', 'injector_temperature', None, 'For continuous sample flow experiments, the temperature in  Kelvins of the speciman injected. This may be different from  the temperature of the sample.'),
+        ('jet_diameter', 'jet_diameter', None, 'Diameter in micrometres of jet stream of sample delivery'),
+        ('power_by', 'power_by', None, 'Sample deliver driving force, e.g. Gas, Electronic Potential'),
+        ('preparation', 'preparation', None, 'Details of crystal growth and preparation of the crystals'),
+    )),
+    ('Attr_PdbxSolnScatter', '', (
+        ('buffer_name', 'buffer_name', None, 'The name of the buffer used for the sample in the solution scattering  experiment.'),
+        ('concentration_range', 'concentration_range', None, 'The concentration range (mg/mL) of the complex in the  sample used in the solution scattering experiment to  determine the mean radius of structural elongation.'),
+        ('data_analysis_software_list', 'data_analysis_software_list', None, 'A list of the software used in the data analysis'),
+        ('data_reduction_software_list', 'data_reduction_software_list', None, 'A list of the software used in the data reduction'),
+        ('detector_specific', 'detector_specific', None, 'The particular radiation detector. In general this will be a   manufacturer, description, model number or some combination of   these.'),
+        ('detector_type', 'detector_type', None, 'The general class of the radiation detector.'),
+        ('id', 'id', None, 'The value of _pdbx_soln_scatter.id must  uniquely identify the sample in the category PDBX_SOLN_SCATTER'),
+        ('max_mean_cross_sectional_radii_gyration', 'max_mean_cross_sectional_radii_gyration', None, "The maximum mean radius of structural elongation of the sample.  In a given solute-solvent contrast, the radius of gyration  R_G is a measure of structural elongation if the internal  inhomogeneity of scattering densities has no effect. Guiner  analysis at low Q give the R_G and the forward scattering at  zero angle I(0).      lnl(Q) = lnl(0) - R_G^2Q^2/3   where        Q = 4(pi)sin(theta/lamda)        2theta = scattering angle        lamda = wavelength   The above expression is valid in a QR_G range for extended  rod-like particles. The relative I(0)/c values ( where   c = sample concentration) for sample measurements in a  constant buffer for a single sample data session, gives the  relative masses of the protein(s) studied when referenced  against a standard.   see:      O.Glatter & O.Kratky, (1982). Editors of 'Small angle       X-ray Scattering, Academic Press, New York.      O.Kratky. (1963). X-ray small angle scattering with       substances of biological interest in diluted solutions.       Prog. Biophys. Chem., 13, 105-173.      G.D.Wignall & F.S.Bates, (1987). The small-angle approximation       of X-ray and neutron scatter from rigid rods of non-uniform       cross section and finite length. J.Appl. Crystallog., 18, 452-460.   If the structure is elongated, the mean radius of gyration  of the cross-sectional structure R_XS  and the mean cross sectional  intensity at zero angle [I(Q).Q]_Q->0 is obtained from     ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"),
+        ('max_mean_cross_sectional_radii_gyration_esd', 'max_mean_cross_sectional_radii_gyration_esd', None, "The estimated standard deviation for the minimum mean radius of structural elongation of the sample. In a given solute-solvent contrast, the radius of gyration R_G is a measure of structural elongation if the internal inhomogeneity of scattering densities has no effect. Guiner analysis at low Q give the R_G and the forward scattering at zero angle I(0).      lnl(Q) = lnl(0) - R_G^2Q^2/3  where       Q = 4(pi)sin(theta/lamda)       2theta = scattering angle       lamda = wavelength  The above expression is valid in a QR_G range for extended rod-like particles. The relative I(0)/c values ( where  c = sample concentration) for sample measurements in a constant buffer for a single sample data session, gives the relative masses of the protein(s) studied when referenced against a standard.  see:     O.Glatter & O.Kratky, (1982). Editors of 'Small angle      X-ray Scattering, Academic Press, New York.     O.Kratky. (1963). X-ray small angle scattering with      substances of biological interest in diluted solutions.      Prog. Biophys. Chem., 13, 105-173.     G.D.Wignall & F.S.Bates, (1987). The small-angle approximation      of X-ray and neutron scatter from rigid rods of non-uniform      cross section and finite length. J.Appl. Crystallog., 18, 452-460.  If the structure is elongated, the mean radius of gyration of the cross-sectional structure R_XS  and the mean cross sectional intensity at zero angle [I(Q).Q]_Q->0 is obtained from    ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"),
+        ('mean_guiner_radius', 'mean_guiner_radius', None, "The mean radius of structural elongation of the sample.  In a given solute-solvent contrast, the radius of gyration  R_G is a measure of structural elongation if the internal  inhomogeneity of scattering densities has no effect. Guiner  analysis at low Q gives the R_G and the forward scattering at  zero angle I(0).       lnl(Q) = lnl(0) - R_G^2Q^2/3   where        Q = 4(pi)sin(theta/lamda)        2theta = scattering angle        lamda = wavelength   The above expression is valid in a QR_G range for extended  rod-like particles. The relative I(0)/c values ( where   c = sample concentration) for sample measurements in a  constant buffer for a single sample data session, gives the  relative masses of the protein(s) studied when referenced  against a standard.   see: O.Glatter & O.Kratky, (1982). Editors of 'Small angle       X-ray Scattering, Academic Press, New York.       O.Kratky. (1963). X-ray small angle scattering with       substances of biological interest in diluted solutions.       Prog. Biophys. Chem., 13, 105-173.        G.D.Wignall & F.S.Bates, (1987). The small-angle approximation       of X-ray and neutron scatter from rigid rods of non-uniform       cross section and finite length. J.Appl. Crystallog., 18, 452-460.   If the structure is elongated, the mean radius of gyration  of the cross-sectional structure R_XS  and the mean cross sectional  intensity at zero angle [I(Q).Q]_Q->0 is obtained from      ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"),
+        ('mean_guiner_radius_esd', 'mean_guiner_radius_esd', None, "The estimated standard deviation for the  mean radius of structural elongation of the sample.  In a given solute-solvent contrast, the radius of gyration  R_G is a measure of structural elongation if the internal  inhomogeneity of scattering densities has no effect. Guiner  analysis at low Q give the R_G and the forward scattering at  zero angle I(0).       lnl(Q) = lnl(0) - R_G^2Q^2/3   where        Q = 4(pi)sin(theta/lamda)        2theta = scattering angle        lamda = wavelength   The above expression is valid in a QR_G range for extended  rod-like particles. The relative I(0)/c values ( where   c = sample concentration) for sample measurements in a  constant buffer for a single sample data session, gives the  relative masses of the protein(s) studied when referenced  against a standard.   see:      O.Glatter & O.Kratky, (1982). Editors of 'Small angle       X-ray Scattering, Academic Press, New York.      O.Kratky. (1963). X-ray small angle scattering with       substances of biological interest in diluted solutions.       Prog. Biophys. Chem., 13, 105-173.      G.D.Wignall & F.S.Bates, (1987). The small-angle approximation       of X-ray and neutron scatter from rigid rods of non-uniform       cross section and finite length. J.Appl. Crystallog., 18, 452-460.   If the structure is elongated, the mean radius of gyration  of the cross-sectional structure R_XS  and the mean cross sectional  intensity at zero angle [I(Q).Q]_Q->0 is obtained from     ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"),
+        ('min_mean_cross_sectional_radii_gyration', 'min_mean_cross_sectional_radii_gyration', None, "The minimum mean radius of structural elongation of the sample. In a given solute-solvent contrast, the radius of gyration R_G is a measure of structural elongation if the internal inhomogeneity of scattering densities has no effect. Guiner analysis at low Q give the R_G and the forward scattering at zero angle I(0).      lnl(Q) = lnl(0) - R_G^2Q^2/3  where       Q = 4(pi)sin(theta/lamda)       2theta = scattering angle       lamda = wavelength  The above expression is valid in a QR_G range for extended rod-like particles. The relative I(0)/c values ( where  c = sample concentration) for sample measurements in a constant buffer for a single sample data session, gives the relative masses of the protein(s) studied when referenced against a standard.  see:     O.Glatter & O.Kratky, (1982). Editors of 'Small angle      X-ray Scattering, Academic Press, New York.     O.Kratky. (1963). X-ray small angle scattering with      substances of biological interest in diluted solutions.      Prog. Biophys. Chem., 13, 105-173.     G.D.Wignall & F.S.Bates, (1987). The small-angle approximation      of X-ray and neutron scatter from rigid rods of non-uniform      cross section and finite length. J.Appl. Crystallog., 18, 452-460.  If the structure is elongated, the mean radius of gyration of the cross-sectional structure R_XS  and the mean cross sectional intensity at zero angle [I(Q).Q]_Q->0 is obtained from    ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"),
+        ('min_mean_cross_sectional_radii_gyration_esd', 'min_mean_cross_sectional_radii_gyration_esd', None, "The estimated standard deviation for the minimum mean radius of structural elongation of the sample. In a given solute-solvent contrast, the radius of gyration R_G is a measure of structural elongation if the internal inhomogeneity of scattering densities has no effect. Guiner analysis at low Q give the R_G and the forward scattering at zero angle I(0).     lnl(Q) = lnl(0) - R_G^2Q^2/3  where       Q = 4(pi)sin(theta/lamda)       2theta = scattering angle       lamda = wavelength  The above expression is valid in a QR_G range for extended rod-like particles. The relative I(0)/c values ( where  c = sample concentration) for sample measurements in a constant buffer for a single sample data session, gives the relative masses of the protein(s) studied when referenced against a standard.  see:     O.Glatter & O.Kratky, (1982). Editors of 'Small angle      X-ray Scattering, Academic Press, New York.     O.Kratky. (1963). X-ray small angle scattering with      substances of biological interest in diluted solutions.      Prog. Biophys. Chem., 13, 105-173.     G.D.Wignall & F.S.Bates, (1987). The small-angle approximation      of X-ray and neutron scatter from rigid rods of non-uniform      cross section and finite length. J.Appl. Crystallog., 18, 452-460.  If the structure is elongated, the mean radius of gyration of the cross-sectional structure R_XS  and the mean cross sectional intensity at zero angle [I(Q).Q]_Q->0 is obtained from     ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"),
+        ('num_time_frames', 'num_time_frames', None, 'The number of time frame solution scattering images used.'),
+        ('protein_length', 'protein_length', None, 'The length (or range) of the protein sample under study. If the solution structure is approximated as an elongated elliptical cyclinder the length L is determined from,    L = sqrt [12( (R_G)^2  -  (R_XS)^2 ) ]  The length should also be given by    L = pi I(0) / [ I(Q).Q]_Q->0'),
+        ('sample_pH', 'sample_pH', None, 'The pH value of the buffered sample.'),
+        ('source_beamline', 'source_beamline', None, 'The beamline name used for the experiment'),
+        ('source_beamline_instrument', 'source_beamline_instrument', None, 'The instrumentation used on the beamline'),
+        ('source_class', 'source_class', None, 'The general class of the radiation source.'),
+        ('source_type', 'source_type', None, 'The make, model, name or beamline of the source of radiation.'),
+        ('temperature', 'temperature', None, 'The temperature in kelvins at which the experiment  was conducted'),
+        ('type', 'type', None, 'The type of solution scattering experiment carried out'),
+    )),
+    ('Attr_PdbxSolnScatterModel', '', (
+        ('conformer_selection_criteria', 'conformer_selection_criteria', None, 'A description of the conformer selection criteria  used.'),
+        ('details', 'details', None, 'A description of any additional details concerning the experiment.'),
+        ('entry_fitting_list', 'entry_fitting_list', None, 'A list of the entries used to fit the model  to the scattering data'),
+        ('id', 'id', None, 'The value of _pdbx_soln_scatter_model.id must  uniquely identify the sample in the category PDBX_SOLN_SCATTER_MODEL'),
+        ('method', 'method', None, 'A description of the methods used in the modelling'),
+        ('num_conformers_calculated', 'num_conformers_calculated', None, 'The number of model conformers calculated.'),
+        ('num_conformers_submitted', 'num_conformers_submitted', None, 'The number of model conformers submitted in the entry'),
+        ('representative_conformer', 'representative_conformer', None, 'The index of the representative conformer among the submitted conformers for the entry'),
+        ('scatter_id', 'scatter_id', None, 'This data item is a pointer to  _pdbx_soln_scatter.id in the  PDBX_SOLN_SCATTER category.'),
+        ('software_author_list', 'software_author_list', None, 'A list of the software authors'),
+        ('software_list', 'software_list', None, 'A list of the software used in the modeeling'),
+    )),
+    ('Attr_PdbxVrptSummary', '', (
+        ('RNA_suiteness', 'RNA_suiteness', None, 'The MolProbity conformer-match quality parameter for RNA structures. Low values are worse. Specific to structures that contain RNA polymers.'),
+        ('attempted_validation_steps', 'attempted_validation_steps', None, "The steps that were attempted by the validation pipeline software.  A step typically involves running a 3rd party validation tool, for instance 'mogul' Each step will be enumerated in _pdbx_vrpt_software category."),
+        ('ligands_for_buster_report', 'ligands_for_buster_report', None, 'A flag indicating if there are ligands in the model used for detailed Buster analysis.'),
+        ('report_creation_date', 'report_creation_date', None, 'The date, time and time-zone that the validation report  was created.  The string will be formatted like yyyy-mm-dd:hh:mm in GMT time.'),
+        ('restypes_notchecked_for_bond_angle_geometry', 'restypes_notchecked_for_bond_angle_geometry', None, ''),
+    )),
+    ('Attr_PdbxVrptSummaryDiffraction', '', (
+        ('B_factor_type', 'B_factor_type', None, 'An indicator if isotropic B factors are partial or full values.'),
+        ('Babinet_b', 'Babinet_b', None, "REFMAC scaling parameter as reported in log output line starting 'bulk solvent: scale'. X-ray entry specific, obtained in the EDS step from REFMAC calculation."),
+        ('Babinet_k', 'Babinet_k', None, "REFMAC scaling parameter as reported in log output line starting 'bulk solvent: scale'. X-ray entry specific, obtained in the EDS step from REFMAC calculation."),
+        ('CCP4_version', 'CCP4_version', None, 'The version of CCP4 suite used in the analysis.'),
+        ('DCC_R', 'DCC_R', None, 'The overall R-factor from a DCC recalculation of an electron density map. Currently value is rounded to 2 decimal places. X-ray entry specific, obtained from the DCC program.'),
+        ('DCC_Rfree', 'DCC_Rfree', None, 'Rfree as calculated by DCC.'),
+        ('EDS_R', 'EDS_R', None, 'The overall R factor from the EDS REFMAC calculation (no free set is used in this). Currently value is rounded to 2 decimal places. X-ray entry specific, obtained in the eds step from REFMAC calculation.'),
+        ('EDS_R_warning', 'EDS_R_warning', None, 'Warning message when EDS calculated R vs reported R is higher than a threshold'),
+        ('EDS_res_high', 'EDS_res_high', None, 'The data high resolution diffraction limit, in Angstroms, found in the input structure factor file. X-ray entry specific, obtained in the EDS step.'),
+        ('EDS_res_low', 'EDS_res_low', None, 'The data low resolution diffraction limit, in Angstroms, found in the input structure factor file. X-ray entry specific, obtained in the EDS step.'),
+        ('Fo_Fc_correlation', 'Fo_Fc_correlation', None, 'Fo,Fc correlation: The difference between the observed structure factors (Fo) and the  calculated structure factors (Fc) measures the correlation between the model and the experimental data.  X-ray entry specific, obtained in the eds step from REFMAC calculation.'),
+        ('I_over_sigma', 'I_over_sigma', None, 'Each reflection has an intensity (I) and an uncertainty in measurement  (sigma(I)), so I/sigma(I) is the signal-to-noise ratio. This ratio decreases at higher resolution. <I/sigma(I)> is the mean of individual I/sigma(I) values. Value for outer resolution shell is given in parentheses. In case structure factor amplitudes are deposited, Xtriage estimates the intensities first and then calculates this metric. When intensities are available in the deposited file, these are converted to amplitudes and then back to intensity estimate before calculating the metric.   X-ray entry specific, calculated by Phenix Xtriage program.'),
+        ('Padilla_Yeates_L2_mean', 'Padilla_Yeates_L2_mean', None, 'Padilla and Yeates twinning parameter <|L**2|>. Theoretical values is 0.333 in the untwinned case, and 0.2 in the perfectly twinned case. X-ray entry specific, obtained from the Xtriage program.'),
+        ('Padilla_Yeates_L_mean', 'Padilla_Yeates_L_mean', None, 'Padilla and Yeates twinning parameter <|L|>. Theoretical values is 0.5 in the untwinned case, and 0.375 in the perfectly twinned case. X-ray entry specific, obtained from the Xtriage program.'),
+        ('Q_score', 'Q_score', None, 'The overall Q-score of the fit of coordinates to the electron map. The Q-score is defined in Pintilie, GH. et al., Nature Methods, 17, 328-334 (2020)'),
+        ('Wilson_B_aniso', 'Wilson_B_aniso', None, 'Result of absolute likelihood based Wilson scaling,  The anisotropic B value of the data is determined using a likelihood based approach.  The resulting B tensor is reported, the 3 diagonal values are given first, followed by the 3 off diagonal values. A large spread in (especially the diagonal) values indicates anisotropy.  X-ray entry specific, calculated by Phenix Xtriage program.'),
+        ('Wilson_B_estimate', 'Wilson_B_estimate', None, 'An estimate of the overall B-value of the structure, calculated from the diffraction data.  Units Angstroms squared. It serves as an indicator of the degree of order in the crystal and the value is usually  not hugely different from the average B-value calculated from the model. X-ray entry specific, calculated by Phenix Xtriage program.'),
+        ('acentric_outliers', 'acentric_outliers', None, "The number of acentric reflections that Xtriage identifies as outliers on the basis  of Wilson statistics. Note that if pseudo translational symmetry is present,  a large number of 'outliers' will be present. X-ray entry specific, calculated by Phenix Xtriage program."),
+        ('bulk_solvent_b', 'bulk_solvent_b', None, 'REFMAC scaling parameter as reported in log output file. X-ray entry specific, obtained in the EDS step from REFMAC calculation.'),
+        ('bulk_solvent_k', 'bulk_solvent_k', None, 'REFMAC reported scaling parameter. X-ray entry specific, obtained in the EDS step from REFMAC calculation.'),
+        ('centric_outliers', 'centric_outliers', None, 'The number of centric reflections that Xtriage identifies as outliers. X-ray entry specific, calculated by Phenix Xtriage program.'),
+        ('data_anisotropy', 'data_anisotropy', None, 'The ratio (Bmax - Bmin) / Bmean where Bmax, Bmin and Bmean are computed from the B-values  associated with the principal axes of the anisotropic thermal ellipsoid.  This ratio is usually less than 0.5; for only 1% of PDB entries it is more than 1.0 (Read et al., 2011). X-ray entry specific, obtained from the Xtriage program.'),
+        ('data_completeness', 'data_completeness', None, 'The percent completeness of diffraction data.'),
+        ('density_fitness_version', 'density_fitness_version', None, 'The version of density-fitness suite programs used in the analysis.'),
+        ('exp_method', 'exp_method', None, 'Experimental method for statistics'),
+        ('num_miller_indices', 'num_miller_indices', None, 'The number of Miller Indices reported by the Xtriage program. This should be the same as the number of _refln in the input structure factor file. X-ray entry specific, calculated by Phenix Xtriage program.'),
+        ('number_reflns_R_free', 'number_reflns_R_free', None, 'The number of reflections in the free set as defined in the input structure factor file supplied to the validation pipeline.  X-ray entry specific, obtained from the DCC program.'),
+        ('percent_RSRZ_outliers', 'percent_RSRZ_outliers', None, 'The percent of RSRZ outliers.'),
+        ('percent_free_reflections', 'percent_free_reflections', None, 'A percentage, Normally percent proportion of the total number. Between 0% and 100%.'),
+        ('servalcat_version', 'servalcat_version', None, 'The version of Servalcat program used in the analysis.'),
+        ('trans_NCS_details', 'trans_NCS_details', None, "A sentence giving the result of Xtriage's analysis on translational NCS. X-ray entry specific, obtained from the Xtriage program."),
+        ('twin_fraction', 'twin_fraction', None, 'Estimated twinning fraction for operators as identified by Xtriage. A semicolon separated list of operators with fractions is givens  X-ray entry specific, obtained from the Xtriage program.'),
+    )),
+    ('Attr_PdbxVrptSummaryEm', '', (
+        ('Q_score', 'Q_score', None, 'The overall Q-score of the fit of coordinates to the electron map. The Q-score is defined in Pintilie, GH. et al., Nature Methods, 17, 328-334 (2020)'),
+        ('atom_inclusion_all_atoms', 'atom_inclusion_all_atoms', None, 'The proportion of all non hydrogen atoms within density.'),
+        ('atom_inclusion_backbone', 'atom_inclusion_backbone', None, 'The proportion of backbone atoms within density.'),
+        ('author_provided_fsc_resolution_by_cutoff_halfbit', 'author_provided_fsc_resolution_by_cutoff_halfbit', None, 'The resolution from the intersection of the author provided fsc and the indicator curve halfbit.'),
+        ('author_provided_fsc_resolution_by_cutoff_onebit', 'author_provided_fsc_resolution_by_cutoff_onebit', None, 'The resolution from the intersection of the author provided fsc and the indicator curve onebit.'),
+        ('author_provided_fsc_resolution_by_cutoff_pt_143', 'author_provided_fsc_resolution_by_cutoff_pt_143', None, 'The resolution from the intersection of the author provided fsc and the indicator curve 0.143.'),
+        ('author_provided_fsc_resolution_by_cutoff_pt_333', 'author_provided_fsc_resolution_by_cutoff_pt_333', None, 'The resolution from the intersection of the author provided fsc and the indicator curve 0.333.'),
+        ('author_provided_fsc_resolution_by_cutoff_pt_5', 'author_provided_fsc_resolution_by_cutoff_pt_5', None, 'The resolution from the intersection of the author provided fsc and the indicator curve 0.5.'),
+        ('author_provided_fsc_resolution_by_cutoff_threesigma', 'author_provided_fsc_resolution_by_cutoff_threesigma', None, 'The resolution from the intersection of the author provided fsc and the indicator curve threesigma.'),
+        ('calculated_fsc_resolution_by_cutoff_halfbit', 'calculated_fsc_resolution_by_cutoff_halfbit', None, 'The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve halfbit.'),
+        ('calculated_fsc_resolution_by_cutoff_onebit', 'calculated_fsc_resolution_by_cutoff_onebit', None, 'The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve onebit.'),
+        ('calculated_fsc_resolution_by_cutoff_pt_143', 'calculated_fsc_resolution_by_cutoff_pt_143', None, 'The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve 0.143.'),
+        ('calculated_fsc_resolution_by_cutoff_pt_333', 'calculated_fsc_resolution_by_cutoff_pt_333', None, 'The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve 0.333.'),
+        ('calculated_fsc_resolution_by_cutoff_pt_5', 'calculated_fsc_resolution_by_cutoff_pt_5', None, 'The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve 0.5.'),
+        ('calculated_fsc_resolution_by_cutoff_threesigma', 'calculated_fsc_resolution_by_cutoff_threesigma', None, 'The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve threesigma.'),
+        ('contour_level_primary_map', 'contour_level_primary_map', None, 'The recommended contour level for the primary map of this deposition.'),
+        ('exp_method', 'exp_method', None, 'Experimental method for statistics'),
+    )),
+    ('Attr_PdbxVrptSummaryGeometry', '', (
+        ('angles_RMSZ', 'angles_RMSZ', None, "The overall root mean square of the Z-score for deviations of bond angles in comparison to  'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996). This value is for all chains in the structure."),
+        ('bonds_RMSZ', 'bonds_RMSZ', None, "The overall root mean square of the Z-score for deviations of bond lengths in comparison to  'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996). This value is for all chains in the structure."),
+        ('clashscore', 'clashscore', None, 'This score is derived from the number of pairs of atoms in the PDB_model_num that are unusually close to each other.  It is calculated by the MolProbity pdbx_vrpt_software and expressed as the number or such clashes per thousand atoms. For structures determined by NMR the clashscore value here will only consider label_atom_id pairs in the  well-defined (core) residues from ensemble analysis.'),
+        ('clashscore_full_length', 'clashscore_full_length', None, 'Only given for structures determined by NMR. The MolProbity pdbx_vrpt_instance_clashes score for all label_atom_id pairs.'),
+        ('num_H_reduce', 'num_H_reduce', None, 'This is the number of hydrogen atoms added and optimized by the MolProbity reduce pdbx_vrpt_software as part of the all-atom clashscore.'),
+        ('num_angles_RMSZ', 'num_angles_RMSZ', None, "The number of bond angles compared to 'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996). This value is for all chains in the structure."),
+        ('num_bonds_RMSZ', 'num_bonds_RMSZ', None, "The number of bond lengths compared to 'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996). This value is for all chains in the structure."),
+        ('percent_ramachandran_outliers', 'percent_ramachandran_outliers', None, 'The percentage of residues with Ramachandran outliers.'),
+        ('percent_ramachandran_outliers_full_length', 'percent_ramachandran_outliers_full_length', None, 'Only given for structures determined by NMR. The MolProbity Ramachandran outlier score for all atoms in the structure rather than just the well-defined (core) residues.'),
+        ('percent_rotamer_outliers', 'percent_rotamer_outliers', None, "The MolProbity sidechain outlier score (a percentage). Protein sidechains mostly adopt certain (combinations of) preferred torsion angle values  (called rotamers or rotameric conformers), much like their backbone torsion angles  (as assessed in the Ramachandran analysis). MolProbity considers the sidechain conformation  of a residue to be an outlier if its set of torsion angles is not similar to any preferred  combination. The sidechain outlier score is calculated as the percentage of residues  with an unusual sidechain conformation with respect to the total number of residues for  which the assessment is available. Example: percent-rota-outliers='2.44'. Specific to structure that contain protein chains and have sidechains modelled. For NMR structures only the  well-defined (core) residues from ensemble analysis will be considered. The percentage of residues with rotamer outliers."),
+        ('percent_rotamer_outliers_full_length', 'percent_rotamer_outliers_full_length', None, 'Only given for structures determined by NMR. The MolProbity sidechain outlier score for all atoms in the structure rather than just the well-defined (core) residues.'),
+    )),
+    ('Attr_PdbxVrptSummaryNmr', '', (
+        ('chemical_shift_completeness', 'chemical_shift_completeness', None, 'Overall completeness of the chemical shift assignments for the well-defined  regions of the structure.'),
+        ('chemical_shift_completeness_full_length', 'chemical_shift_completeness_full_length', None, 'Overall completeness of the chemical shift assignments for the full  macromolecule or complex as suggested by the molecular description of an entry (whether some portion of it is modelled or not).'),
+        ('cyrange_error', 'cyrange_error', None, 'Diagnostic message from the wrapper of Cyrange software which identifies the  well-defined cores (domains) of NMR protein structures.'),
+        ('cyrange_number_of_domains', 'cyrange_number_of_domains', None, 'Total number of well-defined cores (domains) identified by Cyrange'),
+        ('exp_method', 'exp_method', None, 'Experimental method for statistics'),
+        ('medoid_model', 'medoid_model', None, "For each Cyrange well-defined core ('cyrange_domain') the id of the PDB_model_num which is most  similar to other models as measured by pairwise RMSDs over the domain.  For the whole entry ('Entry'), the medoid PDB_model_num of the largest core is taken as an overall representative of the structure."),
+        ('nmr_models_consistency_flag', 'nmr_models_consistency_flag', None, "A flag indicating if all models in the NMR ensemble contain the exact  same atoms ('True') or if the models differ in this respect ('False')."),
+        ('nmrclust_error', 'nmrclust_error', None, 'Diagnostic message from the wrapper of NMRClust software which clusters NMR models.'),
+        ('nmrclust_number_of_clusters', 'nmrclust_number_of_clusters', None, 'Total number of clusters in the NMR ensemble identified by NMRClust.'),
+        ('nmrclust_number_of_models', 'nmrclust_number_of_models', None, 'Number of models analysed by NMRClust - should in almost all cases be the same as the number of models in the NMR ensemble.'),
+        ('nmrclust_number_of_outliers', 'nmrclust_number_of_outliers', None, 'Number of models that do not belong to any cluster as deemed by NMRClust.'),
+        ('nmrclust_representative_model', 'nmrclust_representative_model', None, 'Overall representative PDB_model_num of the NMR ensemble as identified by NMRClust.'),
+    )),
+    ('Attr_RcsbAccessionInfo', '', (
+        ('deposit_date', 'deposit_date', None, 'The entry deposition date.'),
+        ('has_released_experimental_data', 'has_released_experimental_data', None, 'A code indicating the current availibility of experimental data in the repository.'),
+        ('initial_release_date', 'initial_release_date', None, 'The entry initial release date.'),
+        ('major_revision', 'major_revision', None, 'The latest entry major revision number.'),
+        ('minor_revision', 'minor_revision', None, 'The latest entry minor revision number.'),
+        ('revision_date', 'revision_date', None, 'The latest entry revision date.'),
+        ('status_code', 'status_code', None, 'The release status for the entry.'),
+    )),
+    ('Attr_RcsbBindingAffinity', '', (
+        ('comp_id', 'comp_id', None, 'Ligand identifier.'),
+        ('link', 'link', None, 'Link to external resource referencing the data.'),
+        ('provenance_code', 'provenance_code', None, 'The resource name for the related binding affinity reference.'),
+        ('reference_sequence_identity', 'reference_sequence_identity', None, 'Data point provided by BindingDB. Percent identity between PDB sequence and reference sequence.'),
+        ('symbol', 'symbol', None, 'Binding affinity symbol indicating approximate or precise strength of the binding.'),
+        ('type', 'type', None, 'Binding affinity measurement given in one of the following types:  The concentration constants: IC50: the concentration of ligand that reduces enzyme activity by 50%;  EC50: the concentration of compound that generates a half-maximal response;  The binding constant:  Kd: dissociation constant;  Ka: association constant;  Ki: enzyme inhibition constant;  The thermodynamic parameters:  delta G: Gibbs free energy of binding (for association reaction);  delta H: change in enthalpy associated with a chemical reaction;  delta S: change in entropy associated with a chemical reaction.'),
+        ('unit', 'unit', None, 'Binding affinity unit.  Dissociation constant Kd is normally in molar units (or millimolar , micromolar, nanomolar, etc).  Association constant Ka is normally expressed in inverse molar units (e.g. M-1).'),
+        ('value', 'value', None, 'Binding affinity value between a ligand and its target molecule.'),
+    )),
+    ('Attr_RcsbCompModelProvenance', '', (
+        ('entry_id', 'entry_id', None, 'Entry identifier corresponding to the computed structure model.'),
+        ('source_db', 'source_db', None, 'Source database for the computed structure model.'),
+        ('source_filename', 'source_filename', None, 'Source filename for the computed structure model.'),
+        ('source_pae_url', 'source_pae_url', None, 'Source URL for computed structure model predicted aligned error (PAE) json file.'),
+        ('source_url', 'source_url', None, 'Source URL for computed structure model file.'),
+    )),
+    ('Attr_RcsbEntryContainerIdentifiers', '', (
+        ('assembly_ids', 'assembly_ids', None, ''),
+        ('branched_entity_ids', 'branched_entity_ids', None, ''),
+        ('emdb_ids', 'emdb_ids', None, ''),
+        ('entity_ids', 'entity_ids', None, ''),
+        ('entry_id', 'entry_id', None, 'Entry identifier for the container.'),
+        ('model_ids', 'model_ids', None, ''),
+        ('non_polymer_entity_ids', 'non_polymer_entity_ids', None, ''),
+        ('polymer_entity_ids', 'polymer_entity_ids', None, ''),
+        ('pubmed_id', 'pubmed_id', None, 'Unique integer value assigned to each PubMed record.'),
+        ('rcsb_id', 'rcsb_id', None, 'A unique identifier for each object in this entry container.'),
+        ('related_emdb_ids', 'related_emdb_ids', None, ''),
+        ('water_entity_ids', 'water_entity_ids', None, ''),
+    )),
+    ('Attr_RcsbEntryGroupMembership', '', (
+        ('aggregation_method', 'aggregation_method', None, 'Method used to establish group membership'),
+        ('group_id', 'group_id', None, 'A unique identifier for a group of entries'),
+    )),
+    ('Attr_DiffrnResolutionHigh', '', (
+        ('provenance_source', 'provenance_source', None, 'The provenence source for the high resolution limit of data collection.'),
+        ('value', 'value', None, 'The high resolution limit of data collection.'),
+    )),
+    ('Attr_RcsbEntryInfo', '', (
+        ('assembly_count', 'assembly_count', None, 'The number of assemblies defined for this entry including the deposited assembly.'),
+        ('branched_entity_count', 'branched_entity_count', None, 'The number of distinct branched entities in the structure entry.'),
+        ('branched_molecular_weight_maximum', 'branched_molecular_weight_maximum', None, 'The maximum molecular mass (KDa) of a branched entity in the deposited structure entry.'),
+        ('branched_molecular_weight_minimum', 'branched_molecular_weight_minimum', None, 'The minimum molecular mass (KDa) of a branched entity in the deposited structure entry.'),
+        ('cis_peptide_count', 'cis_peptide_count', None, 'The number of cis-peptide linkages per deposited structure model.'),
+        ('deposited_atom_count', 'deposited_atom_count', None, 'The number of heavy atom coordinates records per deposited structure model.'),
+        ('deposited_deuterated_water_count', 'deposited_deuterated_water_count', None, 'The number of deuterated water molecules per deposited structure model.'),
+        ('deposited_hydrogen_atom_count', 'deposited_hydrogen_atom_count', None, 'The number of hydrogen atom coordinates records per deposited structure model.'),
+        ('deposited_model_count', 'deposited_model_count', None, 'The number of model structures deposited.'),
+        ('deposited_modeled_polymer_monomer_count', 'deposited_modeled_polymer_monomer_count', None, 'The number of modeled polymer monomers in the deposited coordinate data.  This is the total count of monomers with reported coordinate data for all polymer  entity instances in the deposited coordinate data.'),
+        ('deposited_nonpolymer_entity_instance_count', 'deposited_nonpolymer_entity_instance_count', None, 'The number of non-polymer instances in the deposited data set.  This is the total count of non-polymer entity instances reported  per deposited structure model.'),
+        ('deposited_polymer_entity_instance_count', 'deposited_polymer_entity_instance_count', None, 'The number of polymer instances in the deposited data set.  This is the total count of polymer entity instances reported  per deposited structure model.'),
+        ('deposited_polymer_monomer_count', 'deposited_polymer_monomer_count', None, 'The number of polymer monomers in sample entity instances in the deposited data set.  This is the total count of monomers for all polymer entity instances reported  per deposited structure model.'),
+        ('deposited_solvent_atom_count', 'deposited_solvent_atom_count', None, 'The number of heavy solvent atom coordinates records per deposited structure model.'),
+        ('deposited_unmodeled_polymer_monomer_count', 'deposited_unmodeled_polymer_monomer_count', None, 'The number of unmodeled polymer monomers in the deposited coordinate data. This is  the total count of monomers with unreported coordinate data for all polymer  entity instances per deposited structure model.'),
+        ('diffrn_radiation_wavelength_maximum', 'diffrn_radiation_wavelength_maximum', None, 'The maximum radiation wavelength in angstroms.'),
+        ('diffrn_radiation_wavelength_minimum', 'diffrn_radiation_wavelength_minimum', None, 'The minimum radiation wavelength in angstroms.'),
+        ('disulfide_bond_count', 'disulfide_bond_count', None, 'The number of disulfide bonds per deposited structure model.'),
+        ('entity_count', 'entity_count', None, 'The number of distinct polymer, non-polymer, branched molecular, and solvent entities per deposited structure model.'),
+        ('experimental_method', 'experimental_method', None, 'The category of experimental method(s) used to determine the structure entry.'),
+        ('experimental_method_count', 'experimental_method_count', None, 'The number of experimental methods contributing data to the structure determination.'),
+        ('ihm_multi_scale_flag', 'ihm_multi_scale_flag', None, 'Multi-scale modeling flag for integrative structures.'),
+        ('ihm_multi_state_flag', 'ihm_multi_state_flag', None, 'Multi-state modeling flag for integrative structures.'),
+        ('ihm_ordered_state_flag', 'ihm_ordered_state_flag', None, 'Ordered-state modeling flag for integrative structures.'),
+        ('ihm_structure_description', 'ihm_structure_description', None, 'Description of the integrative structure.'),
+        ('inter_mol_covalent_bond_count', 'inter_mol_covalent_bond_count', None, 'The number of intermolecular covalent bonds.'),
+        ('inter_mol_metalic_bond_count', 'inter_mol_metalic_bond_count', None, 'The number of intermolecular metalic bonds.'),
+        ('molecular_weight', 'molecular_weight', None, 'The molecular mass (KDa) of polymer and non-polymer entities (exclusive of solvent) in the deposited structure entry.'),
+        ('na_polymer_entity_types', 'na_polymer_entity_types', None, 'Nucleic acid polymer entity type categories describing the entry.'),
+        ('ndb_struct_conf_na_feature_combined', 'ndb_struct_conf_na_feature_combined', None, ''),
+        ('nonpolymer_bound_components', 'nonpolymer_bound_components', None, ''),
+        ('nonpolymer_entity_count', 'nonpolymer_entity_count', None, 'The number of distinct non-polymer entities in the structure entry exclusive of solvent.'),
+        ('nonpolymer_molecular_weight_maximum', 'nonpolymer_molecular_weight_maximum', None, 'The maximum molecular mass (KDa) of a non-polymer entity in the deposited structure entry.'),
+        ('nonpolymer_molecular_weight_minimum', 'nonpolymer_molecular_weight_minimum', None, 'The minimum molecular mass (KDa) of a non-polymer entity in the deposited structure entry.'),
+        ('polymer_composition', 'polymer_composition', None, 'Categories describing the polymer entity composition for the entry.'),
+        ('polymer_entity_count', 'polymer_entity_count', None, 'The number of distinct polymer entities in the structure entry.'),
+        ('polymer_entity_count_DNA', 'polymer_entity_count_DNA', None, 'The number of distinct DNA polymer entities.'),
+        ('polymer_entity_count_RNA', 'polymer_entity_count_RNA', None, 'The number of distinct RNA polymer entities.'),
+        ('polymer_entity_count_nucleic_acid', 'polymer_entity_count_nucleic_acid', None, 'The number of distinct nucleic acid polymer entities (DNA or RNA).'),
+        ('polymer_entity_count_nucleic_acid_hybrid', 'polymer_entity_count_nucleic_acid_hybrid', None, 'The number of distinct hybrid nucleic acid polymer entities.'),
+        ('polymer_entity_count_protein', 'polymer_entity_count_protein', None, 'The number of distinct protein polymer entities.'),
+        ('polymer_entity_taxonomy_count', 'polymer_entity_taxonomy_count', None, 'The number of distinct taxonomies represented among the polymer entities in the entry.'),
+        ('polymer_molecular_weight_maximum', 'polymer_molecular_weight_maximum', None, 'The maximum molecular mass (KDa) of a polymer entity in the deposited structure entry.'),
+        ('polymer_molecular_weight_minimum', 'polymer_molecular_weight_minimum', None, 'The minimum molecular mass (KDa) of a polymer entity in the deposited structure entry.'),
+        ('polymer_monomer_count_maximum', 'polymer_monomer_count_maximum', None, 'The maximum monomer count of a polymer entity per deposited structure model.'),
+        ('polymer_monomer_count_minimum', 'polymer_monomer_count_minimum', None, 'The minimum monomer count of a polymer entity per deposited structure model.'),
+        ('representative_model', 'representative_model', None, 'The chosen representative model.'),
+        ('resolution_combined', 'resolution_combined', None, ''),
+        ('selected_polymer_entity_types', 'selected_polymer_entity_types', None, 'Selected polymer entity type categories describing the entry.'),
+        ('software_programs_combined', 'software_programs_combined', None, ''),
+        ('solvent_entity_count', 'solvent_entity_count', None, 'The number of distinct solvent entities per deposited structure model.'),
+        ('structure_determination_methodology', 'structure_determination_methodology', None, 'Indicates if the structure was determined using experimental or computational methods.'),
+        ('structure_determination_methodology_priority', 'structure_determination_methodology_priority', None, "Indicates the priority of the value in _rcsb_entry_info.structure_determination_methodology.  The lower the number the higher the priority.  Priority values for 'experimental' structures is currently set to 10 and  the values for 'computational' structures is set to 100."),
+        ('diffrn_resolution_high', 'diffrn_resolution_high', 197, ''),
+    )),
+    ('Attr_RcsbExternalReferences', '', (
+        ('id', 'id', None, 'ID (accession) from external resource linked to this entry.'),
+        ('link', 'link', None, 'Link to this entry in external resource'),
+        ('type', 'type', None, 'Internal identifier for external resources'),
+    )),
+    ('Attr_RcsbIhmDatasetList', '', (
+        ('count', 'count', None, 'Number of input datasets used in integrative modeling.'),
+        ('name', 'name', None, 'Name of input dataset used in integrative modeling.'),
+        ('type', 'type', None, 'Type of input dataset used in integrative modeling.'),
+    )),
+    ('Attr_RcsbIhmDatasetSourceDbReference', '', (
+        ('accession_code', 'accession_code', None, 'Accession code for the input dataset.'),
+        ('db_name', 'db_name', None, 'Name of the source database for the input dataset.'),
+    )),
+    ('Attr_MaQaMetricGlobal', '', (
+        ('description', 'description', None, 'Description of the global QA metric.'),
+        ('name', 'name', None, 'Name of the global QA metric.'),
+        ('type', 'type', None, 'The type of global QA metric.'),
+        ('type_other_details', 'type_other_details', None, 'Details for other type of global QA metric.'),
+        ('value', 'value', None, 'Value of the global QA metric.'),
+    )),
+    ('Attr_RcsbMaQaMetricGlobal', '', (
+        ('model_id', 'model_id', None, 'The model identifier.'),
+        ('ma_qa_metric_global', 'ma_qa_metric_global', 202, ''),
+    )),
+    ('Attr_RcsbPrimaryCitation', '', (
+        ('book_id_ISBN', 'book_id_ISBN', None, 'The International Standard Book Number (ISBN) code assigned to  the book cited; relevant for books or book chapters.'),
+        ('book_publisher', 'book_publisher', None, 'The name of the publisher of the citation; relevant  for books or book chapters.'),
+        ('book_publisher_city', 'book_publisher_city', None, 'The location of the publisher of the citation; relevant  for books or book chapters.'),
+        ('book_title', 'book_title', None, 'The title of the book in which the citation appeared; relevant  for books or book chapters.'),
+        ('coordinate_linkage', 'coordinate_linkage', None, "_rcsb_primary_citation.coordinate_linkage states whether this citation  is concerned with precisely the set of coordinates given in the  data block. If, for instance, the publication described the same  structure, but the coordinates had undergone further refinement  prior to the creation of the data block, the value of this data  item would be 'no'."),
+        ('country', 'country', None, 'The country/region of publication; relevant for books  and book chapters.'),
+        ('id', 'id', None, "The value of _rcsb_primary_citation.id must uniquely identify a record in the  CITATION list.   The _rcsb_primary_citation.id 'primary' should be used to indicate the  citation that the author(s) consider to be the most pertinent to  the contents of the data block.   Note that this item need not be a number; it can be any unique  identifier."),
+        ('journal_abbrev', 'journal_abbrev', None, 'Abbreviated name of the cited journal as given in the  Chemical Abstracts Service Source Index.'),
+        ('journal_id_ASTM', 'journal_id_ASTM', None, 'The American Society for Testing and Materials (ASTM) code  assigned to the journal cited (also referred to as the CODEN  designator of the Chemical Abstracts Service); relevant for  journal articles.'),
+        ('journal_id_CSD', 'journal_id_CSD', None, 'The Cambridge Structural Database (CSD) code assigned to the  journal cited; relevant for journal articles. This is also the  system used at the Protein Data Bank (PDB).'),
+        ('journal_id_ISSN', 'journal_id_ISSN', None, 'The International Standard Serial Number (ISSN) code assigned to  the journal cited; relevant for journal articles.'),
+        ('journal_issue', 'journal_issue', None, 'Issue number of the journal cited; relevant for journal  articles.'),
+        ('journal_volume', 'journal_volume', None, 'Volume number of the journal cited; relevant for journal  articles.'),
+        ('language', 'language', None, 'Language in which the cited article is written.'),
+        ('page_first', 'page_first', None, 'The first page of the citation; relevant for journal  articles, books and book chapters.'),
+        ('page_last', 'page_last', None, 'The last page of the citation; relevant for journal  articles, books and book chapters.'),
+        ('pdbx_database_id_DOI', 'pdbx_database_id_DOI', None, 'Document Object Identifier used by doi.org to uniquely  specify bibliographic entry.'),
+        ('pdbx_database_id_PubMed', 'pdbx_database_id_PubMed', None, 'Ascession number used by PubMed to categorize a specific  bibliographic entry.'),
+        ('rcsb_ORCID_identifiers', 'rcsb_ORCID_identifiers', None, ''),
+        ('rcsb_authors', 'rcsb_authors', None, ''),
+        ('rcsb_journal_abbrev', 'rcsb_journal_abbrev', None, 'Normalized journal abbreviation.'),
+        ('title', 'title', None, 'The title of the citation; relevant for journal articles, books  and book chapters.'),
+        ('year', 'year', None, 'The year of the citation; relevant for journal articles, books  and book chapters.'),
+    )),
+    ('Attr_Refine', '', (
+        ('B_iso_max', 'B_iso_max', None, 'The maximum isotropic displacement parameter (B value)  found in the coordinate set.'),
+        ('B_iso_mean', 'B_iso_mean', None, 'The mean isotropic displacement parameter (B value)  for the coordinate set.'),
+        ('B_iso_min', 'B_iso_min', None, 'The minimum isotropic displacement parameter (B value)  found in the coordinate set.'),
+        ('aniso_B_1_1', 'aniso_B_1_1', None, 'The [1][1] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure.'),
+        ('aniso_B_1_2', 'aniso_B_1_2', None, 'The [1][2] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure.'),
+        ('aniso_B_1_3', 'aniso_B_1_3', None, 'The [1][3] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure.'),
+        ('aniso_B_2_2', 'aniso_B_2_2', None, 'The [2][2] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure.'),
+        ('aniso_B_2_3', 'aniso_B_2_3', None, 'The [2][3] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure.'),
+        ('aniso_B_3_3', 'aniso_B_3_3', None, 'The [3][3] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure.'),
+        ('correlation_coeff_Fo_to_Fc', 'correlation_coeff_Fo_to_Fc', None, 'The correlation coefficient between the observed and              calculated structure factors for reflections included in              the refinement.               The correlation coefficient is scale-independent and gives              an idea of the quality of the refined model.                            sum~i~(Fo~i~ Fc~i~ - <Fo><Fc>) R~corr~ = ------------------------------------------------------------           SQRT{sum~i~(Fo~i~)^2^-<Fo>^2^} SQRT{sum~i~(Fc~i~)^2^-<Fc>^2^}               Fo = observed structure factors              Fc = calculated structure factors              <>   denotes average value               summation is over reflections included in the refinement'),
+        ('correlation_coeff_Fo_to_Fc_free', 'correlation_coeff_Fo_to_Fc_free', None, 'The correlation coefficient between the observed and              calculated structure factors for reflections not included              in the refinement (free reflections).                The correlation coefficient is scale-independent and gives               an idea of the quality of the refined model.                            sum~i~(Fo~i~ Fc~i~ - <Fo><Fc>) R~corr~ = ------------------------------------------------------------           SQRT{sum~i~(Fo~i~)^2^-<Fo>^2^} SQRT{sum~i~(Fc~i~)^2^-<Fc>^2^}                Fo  = observed structure factors               Fc  = calculated structure factors               <>    denotes average value                summation is over reflections not included               in the refinement (free reflections)'),
+        ('details', 'details', None, 'Description of special aspects of the refinement process.'),
+        ('ls_R_factor_R_free', 'ls_R_factor_R_free', None, "Residual factor R for reflections that satisfy the resolution  limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low and the observation limit established by  _reflns.observed_criterion, and that were used as the test  reflections (i.e. were excluded from the refinement) when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details.       sum|F~obs~ - F~calc~|  R = ---------------------           sum|F~obs~|   F~obs~  = the observed structure-factor amplitudes  F~calc~ = the calculated structure-factor amplitudes   sum is taken over the specified reflections"),
+        ('ls_R_factor_R_free_error', 'ls_R_factor_R_free_error', None, 'The estimated error in _refine.ls_R_factor_R_free.  The method used to estimate the error is described in the  item _refine.ls_R_factor_R_free_error_details.'),
+        ('ls_R_factor_R_free_error_details', 'ls_R_factor_R_free_error_details', None, 'Special aspects of the method used to estimated the error in  _refine.ls_R_factor_R_free.'),
+        ('ls_R_factor_R_work', 'ls_R_factor_R_work', None, "Residual factor R for reflections that satisfy the resolution  limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low and the observation limit established by  _reflns.observed_criterion, and that were used as the working  reflections (i.e. were included in the refinement)  when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details.   _refine.ls_R_factor_obs should not be confused with  _refine.ls_R_factor_R_work; the former reports the results of a  refinement in which all observed reflections were used, the  latter a refinement in which a subset of the observed  reflections were excluded from refinement for the calculation  of a 'free' R factor. However, it would be meaningful to quote  both values if a 'free' R factor were calculated for most of  the refinement, but all of the observed reflections were used  in the final rounds of refinement; such a protocol should be  explained in _refine.details.       sum|F~obs~ - F~calc~|  R = ---------------------           sum|F~obs~|   F~obs~  = the observed structure-factor amplitudes  F~calc~ = the calculated structure-factor amplitudes   sum is taken over the specified reflections"),
+        ('ls_R_factor_all', 'ls_R_factor_all', None, 'Residual factor R for all reflections that satisfy the resolution  limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low.       sum|F~obs~ - F~calc~|  R = ---------------------           sum|F~obs~|   F~obs~  = the observed structure-factor amplitudes  F~calc~ = the calculated structure-factor amplitudes   sum is taken over the specified reflections'),
+        ('ls_R_factor_obs', 'ls_R_factor_obs', None, "Residual factor R for reflections that satisfy the resolution  limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low and the observation limit established by  _reflns.observed_criterion.   _refine.ls_R_factor_obs should not be confused with  _refine.ls_R_factor_R_work; the former reports the results of a  refinement in which all observed reflections were used, the  latter a refinement in which a subset of the observed  reflections were excluded from refinement for the calculation  of a 'free' R factor. However, it would be meaningful to quote  both values if a 'free' R factor were calculated for most of  the refinement, but all of the observed reflections were used  in the final rounds of refinement; such a protocol should be  explained in _refine.details.       sum|F~obs~ - F~calc~|  R = ---------------------           sum|F~obs~|   F~obs~  = the observed structure-factor amplitudes  F~calc~ = the calculated structure-factor amplitudes   sum is taken over the specified reflections"),
+        ('ls_d_res_high', 'ls_d_res_high', None, 'The smallest value for the interplanar spacings for the  reflection data used in the refinement in angstroms. This is  called the highest resolution.'),
+        ('ls_d_res_low', 'ls_d_res_low', None, 'The largest value for the interplanar spacings for  the reflection data used in the refinement in angstroms.  This is called the lowest resolution.'),
+        ('ls_matrix_type', 'ls_matrix_type', None, 'Type of matrix used to accumulate the least-squares derivatives.'),
+        ('ls_number_parameters', 'ls_number_parameters', None, 'The number of parameters refined in the least-squares process.  If possible, this number should include some contribution from  the restrained parameters. The restrained parameters are  distinct from the constrained parameters (where one or more  parameters are linearly dependent on the refined value of  another). Least-squares restraints often depend on geometry or  energy considerations and this makes their direct contribution  to this number, and to the goodness-of-fit calculation,  difficult to assess.'),
+        ('ls_number_reflns_R_free', 'ls_number_reflns_R_free', None, "The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low  and the observation limit established by  _reflns.observed_criterion, and that were used as the test  reflections (i.e. were excluded from the refinement) when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details."),
+        ('ls_number_reflns_R_work', 'ls_number_reflns_R_work', None, "The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low  and the observation limit established by  _reflns.observed_criterion, and that were used as the working  reflections (i.e. were included in the refinement) when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details."),
+        ('ls_number_reflns_all', 'ls_number_reflns_all', None, 'The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low.'),
+        ('ls_number_reflns_obs', 'ls_number_reflns_obs', None, 'The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low  and the observation limit established by  _reflns.observed_criterion.'),
+        ('ls_number_restraints', 'ls_number_restraints', None, 'The number of restrained parameters. These are parameters which  are not directly dependent on another refined parameter.  Restrained parameters often involve geometry or energy  dependencies.  See also _atom_site.constraints and _atom_site.refinement_flags.  A general description of refinement constraints may appear in  _refine.details.'),
+        ('ls_percent_reflns_R_free', 'ls_percent_reflns_R_free', None, "The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low  and the observation limit established by  _reflns.observed_criterion, and that were used as the test  reflections (i.e. were excluded from the refinement) when the  refinement included the calculation of a 'free' R factor,  expressed as a percentage of the number of geometrically  observable reflections that satisfy the resolution limits."),
+        ('ls_percent_reflns_obs', 'ls_percent_reflns_obs', None, 'The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low  and the observation limit established by  _reflns.observed_criterion, expressed as a percentage of the  number of geometrically observable reflections that satisfy  the resolution limits.'),
+        ('ls_redundancy_reflns_all', 'ls_redundancy_reflns_all', None, 'The ratio of the total number of observations of the  reflections that satisfy the resolution limits established by  _refine.ls_d_res_high and _refine.ls_d_res_low to the number  of crystallographically unique reflections that satisfy the  same limits.'),
+        ('ls_redundancy_reflns_obs', 'ls_redundancy_reflns_obs', None, 'The ratio of the total number of observations of the  reflections that satisfy the resolution limits established by  _refine.ls_d_res_high and _refine.ls_d_res_low and the  observation limit established by _reflns.observed_criterion to  the number of crystallographically unique reflections that  satisfy the same limits.'),
+        ('ls_wR_factor_R_free', 'ls_wR_factor_R_free', None, "Weighted residual factor wR for reflections that satisfy the  resolution limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low and the observation limit established by  _reflns.observed_criterion, and that were used as the test  reflections (i.e. were excluded from the refinement) when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details.        ( sum|w |Y~obs~ - Y~calc~|^2^| )^1/2^  wR = ( ---------------------------- )       (        sum|w Y~obs~^2^|      )   Y~obs~  = the observed amplitude specified by            _refine.ls_structure_factor_coef  Y~calc~ = the calculated amplitude specified by            _refine.ls_structure_factor_coef  w       = the least-squares weight   sum is taken over the specified reflections"),
+        ('ls_wR_factor_R_work', 'ls_wR_factor_R_work', None, "Weighted residual factor wR for reflections that satisfy the  resolution limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low and the observation limit established by  _reflns.observed_criterion, and that were used as the working  reflections (i.e. were included in the refinement) when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details.        ( sum|w |Y~obs~ - Y~calc~|^2^| )^1/2^  wR = ( ---------------------------- )       (        sum|w Y~obs~^2^|      )   Y~obs~  = the observed amplitude specified by            _refine.ls_structure_factor_coef  Y~calc~ = the calculated amplitude specified by            _refine.ls_structure_factor_coef  w       = the least-squares weight   sum is taken over the specified reflections"),
+        ('occupancy_max', 'occupancy_max', None, 'The maximum value for occupancy found in the coordinate set.'),
+        ('occupancy_min', 'occupancy_min', None, 'The minimum value for occupancy found in the coordinate set.'),
+        ('overall_FOM_free_R_set', 'overall_FOM_free_R_set', None, 'Average figure of merit of phases of reflections not included  in the refinement.   This value is derived from the likelihood function.   FOM           = I~1~(X)/I~0~(X)   I~0~, I~1~     = zero- and first-order modified Bessel functions                  of the first kind  X              = sigma~A~ |E~o~| |E~c~|/SIGMA  E~o~, E~c~     = normalized observed and calculated structure                  factors  sigma~A~       = <cos 2 pi s delta~x~> SQRT(Sigma~P~/Sigma~N~)                  estimated using maximum likelihood  Sigma~P~       = sum~{atoms in model}~ f^2^  Sigma~N~       = sum~{atoms in crystal}~ f^2^  f              = form factor of atoms  delta~x~       = expected error  SIGMA          = (sigma~{E;exp}~)^2^ + epsilon [1-(sigma~A~)^2^]  sigma~{E;exp}~ = uncertainties of normalized observed                  structure factors  epsilon       = multiplicity of the diffracting plane   Ref: Murshudov, G. N., Vagin, A. A. & Dodson, E. J. (1997).       Acta Cryst. D53, 240-255.'),
+        ('overall_FOM_work_R_set', 'overall_FOM_work_R_set', None, 'Average figure of merit of phases of reflections included in  the refinement.   This value is derived from the likelihood function.   FOM           = I~1~(X)/I~0~(X)   I~0~, I~1~     = zero- and first-order modified Bessel functions                  of the first kind  X              = sigma~A~ |E~o~| |E~c~|/SIGMA  E~o~, E~c~     = normalized observed and calculated structure                  factors  sigma~A~       = <cos 2 pi s delta~x~> SQRT(Sigma~P~/Sigma~N~)                  estimated using maximum likelihood  Sigma~P~       = sum~{atoms in model}~ f^2^  Sigma~N~       = sum~{atoms in crystal}~ f^2^  f              = form factor of atoms  delta~x~       = expected error  SIGMA          = (sigma~{E;exp}~)^2^ + epsilon [1-(sigma~A~)^2^]  sigma~{E;exp}~ = uncertainties of normalized observed                  structure factors  epsilon       = multiplicity of the diffracting plane   Ref: Murshudov, G. N., Vagin, A. A. & Dodson, E. J. (1997).       Acta Cryst. D53, 240-255.'),
+        ('overall_SU_B', 'overall_SU_B', None, "The overall standard uncertainty (estimated standard deviation)            of the displacement parameters based on a maximum-likelihood            residual.             The overall standard uncertainty (sigma~B~)^2^ gives an idea            of the uncertainty in the B values of averagely defined            atoms (atoms with B values equal to the average B value).                                           N~a~ (sigma~B~)^2^ = 8 ----------------------------------------------                   sum~i~ {[1/Sigma - (E~o~)^2^ (1-m^2^)](SUM_AS)s^4^}             N~a~           = number of atoms            E~o~           = normalized structure factors            m              = figure of merit of phases of reflections                             included in the summation            s              = reciprocal-space vector             SUM_AS         = (sigma~A~)^2^/Sigma^2^            Sigma          = (sigma~{E;exp}~)^2^ + epsilon [1-(sigma~A~)^2^]            sigma~{E;exp}~  = experimental uncertainties of normalized                             structure factors            sigma~A~        = <cos 2 pi s delta~x~> SQRT(Sigma~P~/Sigma~N~)                             estimated using maximum likelihood            Sigma~P~        = sum~{atoms in model}~ f^2^            Sigma~N~        = sum~{atoms in crystal}~ f^2^            f               = atom form factor            delta~x~        = expected error            epsilon         = multiplicity of diffracting plane             summation is over all reflections included in refinement             Ref: (sigma~A~ estimation) 'Refinement of macromolecular                 structures by the maximum-likelihood method',                 Murshudov, G. N., Vagin, A. A. & Dodson, E. J. (1997).                 Acta Cryst. D53, 240-255.                  (SU B estimation) Murshudov, G. N. & Dodson,                 E. J. (1997). Simplified error estimation a la                 Cruickshank in macromolecular crystallography.                 CCP4 Newsletter on Protein Crystallography, No. 33,                 January 1997, pp. 31-39.                 http://www.ccp4.ac.uk/newsletters/newsletter33/murshudov.html"),
+        ('overall_SU_ML', 'overall_SU_ML', None, "The overall standard uncertainty (estimated standard deviation)            of the positional parameters based on a maximum likelihood            residual.             The overall standard uncertainty (sigma~X~)^2^ gives an            idea of the uncertainty in the position of averagely            defined atoms (atoms with B values equal to average B value)                   3                         N~a~ (sigma~X~)^2^  = ---------------------------------------------------------                  8 pi^2^ sum~i~ {[1/Sigma - (E~o~)^2^ (1-m^2^)](SUM_AS)s^2^}             N~a~           = number of atoms            E~o~           = normalized structure factors            m              = figure of merit of phases of reflections                             included in the summation            s              = reciprocal-space vector             SUM_AS         = (sigma~A~)^2^/Sigma^2^            Sigma          = (sigma~{E;exp}~)^2^ + epsilon [1-(sigma~A~)^2^]            sigma~{E;exp}~  = experimental uncertainties of normalized                             structure factors            sigma~A~        = <cos 2 pi s delta~x~> SQRT(Sigma~P~/Sigma~N~)                             estimated using maximum likelihood            Sigma~P~        = sum~{atoms in model}~ f^2^            Sigma~N~        = sum~{atoms in crystal}~ f^2^            f               = atom form factor            delta~x~        = expected error            epsilon         = multiplicity of diffracting plane             summation is over all reflections included in refinement             Ref: (sigma_A estimation) 'Refinement of macromolecular                 structures by the maximum-likelihood method',                 Murshudov, G. N., Vagin, A. A. & Dodson, E. J. (1997).                 Acta Cryst. D53, 240-255.                  (SU ML estimation) Murshudov, G. N. & Dodson,                 E. J. (1997). Simplified error estimation a la                 Cruickshank in macromolecular crystallography.                 CCP4 Newsletter on Protein Crystallography, No. 33,                 January 1997, pp. 31-39.                 http://www.ccp4.ac.uk/newsletters/newsletter33/murshudov.html"),
+        ('overall_SU_R_Cruickshank_DPI', 'overall_SU_R_Cruickshank_DPI', None, 'The overall standard uncertainty (estimated standard deviation)  of the displacement parameters based on the crystallographic  R value, expressed in a formalism known as the dispersion  precision indicator (DPI).   The overall standard uncertainty (sigma~B~) gives an idea  of the uncertainty in the B values of averagely defined  atoms (atoms with B values equal to the average B value).                          N~a~  (sigma~B~)^2^ = 0.65 ---------- (R~value~)^2^ (D~min~)^2^ C^-2/3^                       (N~o~-N~p~)    N~a~     = number of atoms included in refinement  N~o~     = number of observations  N~p~     = number of parameters refined  R~value~ = conventional crystallographic R value  D~min~   = maximum resolution  C        = completeness of data   Ref: Cruickshank, D. W. J. (1999). Acta Cryst. D55, 583-601.        Murshudov, G. N. & Dodson,       E. J. (1997). Simplified error estimation a la       Cruickshank in macromolecular crystallography.       CCP4 Newsletter on Protein Crystallography, No. 33,       January 1997, pp. 31-39.       http://www.ccp4.ac.uk/newsletters/newsletter33/murshudov.html'),
+        ('overall_SU_R_free', 'overall_SU_R_free', None, 'The overall standard uncertainty (estimated standard deviation)  of the displacement parameters based on the free R value.   The overall standard uncertainty (sigma~B~) gives an idea  of the uncertainty in the B values of averagely defined  atoms (atoms with B values equal to the average B value).                          N~a~  (sigma~B~)^2^ = 0.65 ---------- (R~free~)^2^ (D~min~)^2^ C^-2/3^                       (N~o~-N~p~)    N~a~     = number of atoms included in refinement  N~o~     = number of observations  N~p~     = number of parameters refined  R~free~  = conventional free crystallographic R value calculated           using reflections not included in refinement  D~min~   = maximum resolution  C        = completeness of data   Ref: Cruickshank, D. W. J. (1999). Acta Cryst. D55, 583-601.        Murshudov, G. N. & Dodson,       E. J. (1997). Simplified error estimation a la       Cruickshank in macromolecular crystallography.       CCP4 Newsletter on Protein Crystallography, No. 33,       January 1997, pp. 31-39.       http://www.ccp4.ac.uk/newsletters/newsletter33/murshudov.html'),
+        ('pdbx_R_Free_selection_details', 'pdbx_R_Free_selection_details', None, 'Details of the manner in which the cross validation  reflections were selected.'),
+        ('pdbx_TLS_residual_ADP_flag', 'pdbx_TLS_residual_ADP_flag', None, 'A flag for TLS refinements identifying the type of atomic displacement parameters stored  in _atom_site.B_iso_or_equiv.'),
+        ('pdbx_average_fsc_free', 'pdbx_average_fsc_free', None, "Average Fourier Shell Correlation (avgFSC) between model and  observed structure factors for reflections not included in refinement.   The average FSC is a measure of the agreement between observed  and calculated structure factors.                    sum(N~i~ FSC~free-i~)  avgFSC~free~   = ---------------------                   sum(N~i~)    N~i~          = the number of free reflections in the resolution shell i  FSC~free-i~   = FSC for free reflections in the i-th resolution shell calculated as:                  (sum(|F~o~| |F~c~| fom cos(phi~c~-phi~o~)))  FSC~free-i~  = -------------------------------------------                 (sum(|F~o~|^2^) (sum(|F~c~|^2^)))^1/2^   |F~o~|   = amplitude of observed structure factor  |F~c~|   = amplitude of calculated structure factor  phi~o~   = phase of observed structure factor  phi~c~   = phase of calculated structure factor  fom      = figure of merit of the experimental phases.   Summation of FSC~free-i~ is carried over all free reflections in the resolution shell.   Summation of avgFSC~free~ is carried over all resolution shells.    Ref:  Rosenthal P.B., Henderson R.        'Optimal determination of particle orientation, absolute hand,        and contrast loss in single-particle electron cryomicroscopy.        Journal of Molecular Biology. 2003;333(4):721-745, equation (A6)."),
+        ('pdbx_average_fsc_overall', 'pdbx_average_fsc_overall', None, "Overall average Fourier Shell Correlation (avgFSC) between model and  observed structure factors for all reflections.   The average FSC is a measure of the agreement between observed  and calculated structure factors.              sum(N~i~ FSC~i~)  avgFSC   = ----------------             sum(N~i~)    N~i~     = the number of all reflections in the resolution shell i  FSC~i~   = FSC for all reflections in the i-th resolution shell calculated as:             (sum(|F~o~| |F~c~| fom cos(phi~c~-phi~o~)))  FSC~i~  = -------------------------------------------            (sum(|F~o~|^2^) (sum(|F~c~|^2^)))^1/2^   |F~o~|   = amplitude of observed structure factor  |F~c~|   = amplitude of calculated structure factor  phi~o~   = phase of observed structure factor  phi~c~   = phase of calculated structure factor  fom      = figure of merit of the experimental phases.   Summation of FSC~i~ is carried over all reflections in the resolution shell.   Summation of avgFSC is carried over all resolution shells.    Ref:  Rosenthal P.B., Henderson R.        'Optimal determination of particle orientation, absolute hand,        and contrast loss in single-particle electron cryomicroscopy.        Journal of Molecular Biology. 2003;333(4):721-745, equation (A6)."),
+        ('pdbx_average_fsc_work', 'pdbx_average_fsc_work', None, "Average Fourier Shell Correlation (avgFSC) between model and  observed structure factors for reflections included in refinement.   The average FSC is a measure of the agreement between observed  and calculated structure factors.                    sum(N~i~ FSC~work-i~)  avgFSC~work~   = ---------------------                   sum(N~i~)    N~i~          = the number of working reflections in the resolution shell i  FSC~work-i~   = FSC for working reflections in the i-th resolution shell calculated as:                  (sum(|F~o~| |F~c~| fom cos(phi~c~-phi~o~)))  FSC~work-i~  = -------------------------------------------                 (sum(|F~o~|^2^) (sum(|F~c~|^2^)))^1/2^   |F~o~|   = amplitude of observed structure factor  |F~c~|   = amplitude of calculated structure factor  phi~o~   = phase of observed structure factor  phi~c~   = phase of calculated structure factor  fom      = figure of merit of the experimental phases.   Summation of FSC~work-i~ is carried over all working reflections in the resolution shell.   Summation of avgFSC~work~ is carried over all resolution shells.    Ref:  Rosenthal P.B., Henderson R.        'Optimal determination of particle orientation, absolute hand,        and contrast loss in single-particle electron cryomicroscopy.        Journal of Molecular Biology. 2003;333(4):721-745, equation (A6)."),
+        ('pdbx_data_cutoff_high_absF', 'pdbx_data_cutoff_high_absF', None, "Value of F at 'high end' of data cutoff."),
+        ('pdbx_data_cutoff_high_rms_absF', 'pdbx_data_cutoff_high_rms_absF', None, 'Value of RMS |F| used as high data cutoff.'),
+        ('pdbx_data_cutoff_low_absF', 'pdbx_data_cutoff_low_absF', None, "Value of F at 'low end' of data cutoff."),
+        ('pdbx_diffrn_id', 'pdbx_diffrn_id', None, ''),
+        ('pdbx_isotropic_thermal_model', 'pdbx_isotropic_thermal_model', None, 'Whether the structure was refined with indvidual isotropic, anisotropic or overall temperature factor.'),
+        ('pdbx_ls_cross_valid_method', 'pdbx_ls_cross_valid_method', None, 'Whether the cross validataion method was used through out or only at the end.'),
+        ('pdbx_ls_sigma_F', 'pdbx_ls_sigma_F', None, 'Data cutoff (SIGMA(F))'),
+        ('pdbx_ls_sigma_Fsqd', 'pdbx_ls_sigma_Fsqd', None, 'Data cutoff (SIGMA(F^2))'),
+        ('pdbx_ls_sigma_I', 'pdbx_ls_sigma_I', None, 'Data cutoff (SIGMA(I))'),
+        ('pdbx_method_to_determine_struct', 'pdbx_method_to_determine_struct', None, 'Method(s) used to determine the structure.'),
+        ('pdbx_overall_ESU_R', 'pdbx_overall_ESU_R', None, 'Overall estimated standard uncertainties of positional  parameters based on R value.'),
+        ('pdbx_overall_ESU_R_Free', 'pdbx_overall_ESU_R_Free', None, 'Overall estimated standard uncertainties of positional parameters based on R free value.'),
+        ('pdbx_overall_SU_R_Blow_DPI', 'pdbx_overall_SU_R_Blow_DPI', None, 'The overall standard uncertainty (estimated standard deviation)  of the displacement parameters based on the crystallographic  R value, expressed in a formalism known as the dispersion  precision indicator (DPI).   Ref: Blow, D (2002) Acta Cryst. D58, 792-797'),
+        ('pdbx_overall_SU_R_free_Blow_DPI', 'pdbx_overall_SU_R_free_Blow_DPI', None, 'The overall standard uncertainty (estimated standard deviation)  of the displacement parameters based on the crystallographic  R-free value, expressed in a formalism known as the dispersion  precision indicator (DPI).   Ref: Blow, D (2002) Acta Cryst. D58, 792-797'),
+        ('pdbx_overall_SU_R_free_Cruickshank_DPI', 'pdbx_overall_SU_R_free_Cruickshank_DPI', None, 'The overall standard uncertainty (estimated standard deviation)  of the displacement parameters based on the crystallographic  R-free value, expressed in a formalism known as the dispersion  precision indicator (DPI).   Ref: Cruickshank, D. W. J. (1999). Acta Cryst. D55, 583-601.'),
+        ('pdbx_overall_phase_error', 'pdbx_overall_phase_error', None, 'The overall phase error for all reflections after refinement using  the current refinement target.'),
+        ('pdbx_refine_id', 'pdbx_refine_id', None, 'This data item uniquely identifies a refinement within an entry.  _refine.pdbx_refine_id can be used to distinguish the results of  joint refinements.'),
+        ('pdbx_solvent_ion_probe_radii', 'pdbx_solvent_ion_probe_radii', None, 'For bulk solvent mask calculation, the amount that the ionic radii of atoms, which can be ions, are increased used.'),
+        ('pdbx_solvent_shrinkage_radii', 'pdbx_solvent_shrinkage_radii', None, 'For bulk solvent mask calculation, amount mask is shrunk after taking away atoms with new radii and a constant value assigned to this new region.'),
+        ('pdbx_solvent_vdw_probe_radii', 'pdbx_solvent_vdw_probe_radii', None, 'For bulk solvent mask calculation, the value by which the vdw radii of non-ion atoms (like carbon) are increased and used.'),
+        ('pdbx_starting_model', 'pdbx_starting_model', None, 'Starting model for refinement.  Starting model for  molecular replacement should refer to a previous  structure or experiment.'),
+        ('pdbx_stereochem_target_val_spec_case', 'pdbx_stereochem_target_val_spec_case', None, 'Special case of stereochemistry target values used in SHELXL refinement.'),
+        ('pdbx_stereochemistry_target_values', 'pdbx_stereochemistry_target_values', None, 'Stereochemistry target values used in refinement.'),
+        ('solvent_model_details', 'solvent_model_details', None, 'Special aspects of the solvent model used during refinement.'),
+        ('solvent_model_param_bsol', 'solvent_model_param_bsol', None, "The value of the BSOL solvent-model parameter describing  the average isotropic displacement parameter of disordered  solvent atoms.   This is one of the two parameters (the other is  _refine.solvent_model_param_ksol) in Tronrud's method of  modelling the contribution of bulk solvent to the  scattering. The standard scale factor is modified according  to the expression       k0 exp(-B0 * s^2^)[1-KSOL * exp(-BSOL * s^2^)]   where k0 and B0 are the scale factors for the protein.   Ref: Tronrud, D. E. (1997). Methods Enzymol. 277, 243-268."),
+        ('solvent_model_param_ksol', 'solvent_model_param_ksol', None, "The value of the KSOL solvent-model parameter describing  the ratio of the electron density in the bulk solvent to the  electron density in the molecular solute.   This is one of the two parameters (the other is  _refine.solvent_model_param_bsol) in Tronrud's method of  modelling the contribution of bulk solvent to the  scattering. The standard scale factor is modified according  to the expression       k0 exp(-B0 * s^2^)[1-KSOL * exp(-BSOL * s^2^)]   where k0 and B0 are the scale factors for the protein.   Ref: Tronrud, D. E. (1997). Methods Enzymol. 277, 243-268."),
+    )),
+    ('Attr_RefineAnalyze', '', (
+        ('Luzzati_coordinate_error_free', 'Luzzati_coordinate_error_free', None, 'The estimated coordinate error obtained from the plot of  the R value versus sin(theta)/lambda for the reflections  treated as a test set during refinement.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810.'),
+        ('Luzzati_coordinate_error_obs', 'Luzzati_coordinate_error_obs', None, 'The estimated coordinate error obtained from the plot of  the R value versus sin(theta)/lambda for reflections classified  as observed.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810.'),
+        ('Luzzati_d_res_low_free', 'Luzzati_d_res_low_free', None, 'The value of the low-resolution cutoff used in constructing the  Luzzati plot for reflections treated as a test set during  refinement.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810.'),
+        ('Luzzati_d_res_low_obs', 'Luzzati_d_res_low_obs', None, 'The value of the low-resolution cutoff used in  constructing the Luzzati plot for reflections classified as  observed.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810.'),
+        ('Luzzati_sigma_a_free', 'Luzzati_sigma_a_free', None, 'The value of sigma~a~ used in constructing the Luzzati plot for  the reflections treated as a test set during refinement.  Details of the estimation of sigma~a~ can be specified  in _refine_analyze.Luzzati_sigma_a_free_details.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810.'),
+        ('Luzzati_sigma_a_obs', 'Luzzati_sigma_a_obs', None, 'The value of sigma~a~ used in constructing the Luzzati plot for  reflections classified as observed. Details of the  estimation of sigma~a~ can be specified in  _refine_analyze.Luzzati_sigma_a_obs_details.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810.'),
+        ('number_disordered_residues', 'number_disordered_residues', None, 'The number of discretely disordered residues in the refined  model.'),
+        ('occupancy_sum_hydrogen', 'occupancy_sum_hydrogen', None, 'The sum of the occupancies of the hydrogen atoms in the refined  model.'),
+        ('occupancy_sum_non_hydrogen', 'occupancy_sum_non_hydrogen', None, 'The sum of the occupancies of the non-hydrogen atoms in the   refined model.'),
+        ('pdbx_Luzzati_d_res_high_obs', 'pdbx_Luzzati_d_res_high_obs', None, 'record the high resolution for calculating Luzzati statistics.'),
+        ('pdbx_refine_id', 'pdbx_refine_id', None, 'This data item uniquely identifies a refinement within an entry.  _refine_analyze.pdbx_refine_id can be used to distinguish the results  of joint refinements.'),
+    )),
+    ('Attr_RefineHist', '', (
+        ('cycle_id', 'cycle_id', None, 'The value of _refine_hist.cycle_id must uniquely identify a  record in the REFINE_HIST list.   Note that this item need not be a number; it can be any unique  identifier.'),
+        ('d_res_high', 'd_res_high', None, 'The lowest value for the interplanar spacings for the  reflection data for this cycle of refinement. This is called  the highest resolution.'),
+        ('d_res_low', 'd_res_low', None, 'The highest value for the interplanar spacings for the  reflection data for this cycle of refinement. This is  called the lowest resolution.'),
+        ('number_atoms_solvent', 'number_atoms_solvent', None, 'The number of solvent atoms that were included in the model at  this cycle of the refinement.'),
+        ('number_atoms_total', 'number_atoms_total', None, 'The total number of atoms that were included in the model at  this cycle of the refinement.'),
+        ('pdbx_B_iso_mean_ligand', 'pdbx_B_iso_mean_ligand', None, 'Mean isotropic B-value for ligand molecules included in refinement.'),
+        ('pdbx_B_iso_mean_solvent', 'pdbx_B_iso_mean_solvent', None, 'Mean isotropic B-value for solvent molecules included in refinement.'),
+        ('pdbx_number_atoms_ligand', 'pdbx_number_atoms_ligand', None, 'Number of ligand atoms included in refinement'),
+        ('pdbx_number_atoms_nucleic_acid', 'pdbx_number_atoms_nucleic_acid', None, 'Number of nucleic atoms included in refinement'),
+        ('pdbx_number_atoms_protein', 'pdbx_number_atoms_protein', None, 'Number of protein atoms included in refinement'),
+        ('pdbx_number_residues_total', 'pdbx_number_residues_total', None, 'Total number of polymer residues included in refinement.'),
+        ('pdbx_refine_id', 'pdbx_refine_id', None, 'This data item uniquely identifies a refinement within an entry.  _refine_hist.pdbx_refine_id can be used to distinguish the results  of joint refinements.'),
+    )),
+    ('Attr_RefineLsRestr', '', (
+        ('dev_ideal', 'dev_ideal', None, 'For the given parameter type, the root-mean-square deviation  between the ideal values used as restraints in the least-squares  refinement and the values obtained by refinement. For instance,  bond distances may deviate by 0.018 /%A (r.m.s.) from ideal  values in the current model.'),
+        ('dev_ideal_target', 'dev_ideal_target', None, 'For the given parameter type, the target root-mean-square  deviation between the ideal values used as restraints in the  least-squares refinement and the values obtained by refinement.'),
+        ('number', 'number', None, 'The number of parameters of this type subjected to restraint in  least-squares refinement.'),
+        ('pdbx_refine_id', 'pdbx_refine_id', None, 'This data item uniquely identifies a refinement within an entry.  _refine_ls_restr.pdbx_refine_id can be used to distinguish the results  of joint refinements.'),
+        ('pdbx_restraint_function', 'pdbx_restraint_function', None, 'The functional form of the restraint function used in the least-squares  refinement.'),
+        ('type', 'type', None, 'The type of the parameter being restrained.  Explicit sets of data values are provided for the programs  PROTIN/PROLSQ (beginning with p_) and RESTRAIN (beginning with  RESTRAIN_). As computer programs change, these data values  are given as examples, not as an enumeration list. Computer  programs that convert a data block to a refinement table will  expect the exact form of the data values given here to be used.'),
+        ('weight', 'weight', None, 'The weighting value applied to this type of restraint in  the least-squares refinement.'),
+    )),
+    ('Attr_Reflns', '', (
+        ('B_iso_Wilson_estimate', 'B_iso_Wilson_estimate', None, 'The value of the overall isotropic displacement parameter  estimated from the slope of the Wilson plot.'),
+        ('R_free_details', 'R_free_details', None, "A description of the method by which a subset of reflections was  selected for exclusion from refinement so as to be used in the  calculation of a 'free' R factor."),
+        ('Rmerge_F_all', 'Rmerge_F_all', None, 'Residual factor Rmerge for all reflections that satisfy the  resolution limits established by _reflns.d_resolution_high  and _reflns.d_resolution_low.               sum~i~(sum~j~|F~j~ - <F>|)  Rmerge(F) = --------------------------                   sum~i~(sum~j~<F>)   F~j~ = the amplitude of the jth observation of reflection i  <F>  = the mean of the amplitudes of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection'),
+        ('Rmerge_F_obs', 'Rmerge_F_obs', None, 'Residual factor Rmerge for reflections that satisfy the  resolution limits established by _reflns.d_resolution_high  and _reflns.d_resolution_low and the observation limit  established by _reflns.observed_criterion.               sum~i~(sum~j~|F~j~ - <F>|)  Rmerge(F) = --------------------------                   sum~i~(sum~j~<F>)   F~j~ = the amplitude of the jth observation of reflection i  <F>  = the mean of the amplitudes of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection'),
+        ('d_resolution_high', 'd_resolution_high', None, 'The smallest value in angstroms for the interplanar spacings  for the reflection data. This is called the highest resolution.'),
+        ('d_resolution_low', 'd_resolution_low', None, 'The largest value in angstroms for the interplanar spacings  for the reflection data. This is called the lowest resolution.'),
+        ('data_reduction_details', 'data_reduction_details', None, 'A description of special aspects of the data-reduction  procedures.'),
+        ('data_reduction_method', 'data_reduction_method', None, 'The method used for data reduction.   Note that this is not the computer program used, which is  described in the SOFTWARE category, but the method  itself.   This data item should be used to describe significant  methodological options used within the data-reduction programs.'),
+        ('details', 'details', None, 'A description of reflection data not covered by other data  names. This should include details of the Friedel pairs.'),
+        ('limit_h_max', 'limit_h_max', None, 'Maximum value of the Miller index h for the reflection data. This  need not have the same value as _diffrn_reflns.limit_h_max.'),
+        ('limit_h_min', 'limit_h_min', None, 'Minimum value of the Miller index h for the reflection data. This  need not have the same value as _diffrn_reflns.limit_h_min.'),
+        ('limit_k_max', 'limit_k_max', None, 'Maximum value of the Miller index k for the reflection data. This  need not have the same value as _diffrn_reflns.limit_k_max.'),
+        ('limit_k_min', 'limit_k_min', None, 'Minimum value of the Miller index k for the reflection data. This  need not have the same value as _diffrn_reflns.limit_k_min.'),
+        ('limit_l_max', 'limit_l_max', None, 'Maximum value of the Miller index l for the reflection data. This  need not have the same value as _diffrn_reflns.limit_l_max.'),
+        ('limit_l_min', 'limit_l_min', None, 'Minimum value of the Miller index l for the reflection data. This  need not have the same value as _diffrn_reflns.limit_l_min.'),
+        ('number_all', 'number_all', None, 'The total number of reflections in the REFLN list (not the  DIFFRN_REFLN list). This number may contain Friedel-equivalent  reflections according to the nature of the structure and the  procedures used. The item _reflns.details describes the  reflection data.'),
+        ('number_obs', 'number_obs', None, 'The number of reflections in the REFLN list (not the DIFFRN_REFLN  list) classified as observed (see _reflns.observed_criterion).  This number may contain Friedel-equivalent reflections according  to the nature of the structure and the procedures used.'),
+        ('observed_criterion', 'observed_criterion', None, "The criterion used to classify a reflection as 'observed'. This  criterion is usually expressed in terms of a sigma(I) or  sigma(F) threshold."),
+        ('observed_criterion_F_max', 'observed_criterion_F_max', None, "The criterion used to classify a reflection as 'observed'  expressed as an upper limit for the value of F."),
+        ('observed_criterion_F_min', 'observed_criterion_F_min', None, "The criterion used to classify a reflection as 'observed'  expressed as a lower limit for the value of F."),
+        ('observed_criterion_I_max', 'observed_criterion_I_max', None, "The criterion used to classify a reflection as 'observed'  expressed as an upper limit for the value of I."),
+        ('observed_criterion_I_min', 'observed_criterion_I_min', None, "The criterion used to classify a reflection as 'observed'  expressed as a lower limit for the value of I."),
+        ('observed_criterion_sigma_F', 'observed_criterion_sigma_F', None, "The criterion used to classify a reflection as 'observed'  expressed as a multiple of the value of sigma(F)."),
+        ('observed_criterion_sigma_I', 'observed_criterion_sigma_I', None, "The criterion used to classify a reflection as 'observed'  expressed as a multiple of the value of sigma(I)."),
+        ('pdbx_CC_half', 'pdbx_CC_half', None, "The Pearson's correlation coefficient expressed as a decimal value               between the average intensities from randomly selected               half-datasets.  \t      Ref: Karplus & Diederichs (2012), Science 336, 1030-33"),
+        ('pdbx_R_split', 'pdbx_R_split', None, 'R split measures the agreement between the sets of intensities created by merging               odd- and even-numbered images  from the overall data.  \t      Ref: T. A. White, R. A. Kirian, A. V. Martin, A. Aquila, K. Nass, A. Barty               and H. N. Chapman (2012), J. Appl. Cryst. 45, 335-341'),
+        ('pdbx_Rmerge_I_obs', 'pdbx_Rmerge_I_obs', None, 'The R value for merging intensities satisfying the observed  criteria in this data set.'),
+        ('pdbx_Rpim_I_all', 'pdbx_Rpim_I_all', None, 'The precision-indicating merging R factor value Rpim,  for merging all intensities in this data set.          sum~i~ [1/(N~i~ - 1)]1/2^ sum~j~ | I~j~ - <I~i~> |  Rpim = --------------------------------------------------                       sum~i~ ( sum~j~ I~j~ )   I~j~   = the intensity of the jth observation of reflection i  <I~i~> = the mean of the intensities of all observations           of reflection i  N~i~   = the redundancy (the number of times reflection i           has been measured).   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection.   Ref: Diederichs, K. & Karplus, P. A. (1997). Nature Struct.       Biol. 4, 269-275.       Weiss, M. S. & Hilgenfeld, R. (1997). J. Appl. Cryst.       30, 203-205.       Weiss, M. S. (2001). J. Appl. Cryst. 34, 130-135.'),
+        ('pdbx_Rrim_I_all', 'pdbx_Rrim_I_all', None, 'The redundancy-independent merging R factor value Rrim,               also denoted Rmeas, for merging all intensities in this               data set.                       sum~i~ [N~i~/(N~i~ - 1)]1/2^ sum~j~ | I~j~ - <I~i~> |               Rrim = ----------------------------------------------------                                   sum~i~ ( sum~j~ I~j~ )                I~j~   = the intensity of the jth observation of reflection i               <I~i~> = the mean of the intensities of all observations of                        reflection i \t       N~i~   = the redundancy (the number of times reflection i                        has been measured).                sum~i~ is taken over all reflections               sum~j~ is taken over all observations of each reflection.                Ref: Diederichs, K. & Karplus, P. A. (1997). Nature Struct.                    Biol. 4, 269-275.                    Weiss, M. S. & Hilgenfeld, R. (1997). J. Appl. Cryst.                    30, 203-205.                    Weiss, M. S. (2001). J. Appl. Cryst. 34, 130-135.'),
+        ('pdbx_Rsym_value', 'pdbx_Rsym_value', None, 'The R sym value as a decimal number.'),
+        ('pdbx_chi_squared', 'pdbx_chi_squared', None, 'Overall  Chi-squared statistic.'),
+        ('pdbx_diffrn_id', 'pdbx_diffrn_id', None, ''),
+        ('pdbx_netI_over_av_sigmaI', 'pdbx_netI_over_av_sigmaI', None, 'The ratio of the average intensity to the average uncertainty,  <I>/<sigma(I)>.'),
+        ('pdbx_netI_over_sigmaI', 'pdbx_netI_over_sigmaI', None, 'The mean of the ratio of the intensities to their  standard uncertainties, <I/sigma(I)>.'),
+        ('pdbx_number_measured_all', 'pdbx_number_measured_all', None, 'Total number of measured reflections.'),
+        ('pdbx_ordinal', 'pdbx_ordinal', None, 'An ordinal identifier for this set of reflection statistics.'),
+        ('pdbx_redundancy', 'pdbx_redundancy', None, 'Overall redundancy for this data set.'),
+        ('pdbx_scaling_rejects', 'pdbx_scaling_rejects', None, 'Number of reflections rejected in scaling operations.'),
+        ('percent_possible_obs', 'percent_possible_obs', None, 'The percentage of geometrically possible reflections represented  by reflections that satisfy the resolution limits established  by _reflns.d_resolution_high and _reflns.d_resolution_low and  the observation limit established by  _reflns.observed_criterion.'),
+        ('phase_calculation_details', 'phase_calculation_details', None, 'The value of _reflns.phase_calculation_details describes a  special details about calculation of phases in _refln.phase_calc.'),
+    )),
+    ('Attr_ReflnsShell', '', (
+        ('Rmerge_F_all', 'Rmerge_F_all', None, 'Residual factor Rmerge for all reflections that satisfy the  resolution limits established by _reflns_shell.d_res_high and  _reflns_shell.d_res_low.               sum~i~(sum~j~|F~j~ - <F>|)  Rmerge(F) = --------------------------                   sum~i~(sum~j~<F>)   F~j~ = the amplitude of the jth observation of reflection i  <F>  = the mean of the amplitudes of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection'),
+        ('Rmerge_F_obs', 'Rmerge_F_obs', None, 'Residual factor Rmerge for reflections that satisfy the  resolution limits established by _reflns_shell.d_res_high and  _reflns_shell.d_res_low and the observation criterion  established by _reflns.observed_criterion.               sum~i~(sum~j~|F~j~ - <F>|)  Rmerge(F) = --------------------------                   sum~i~(sum~j~<F>)   F~j~ = the amplitude of the jth observation of reflection i  <F>  = the mean of the amplitudes of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection'),
+        ('Rmerge_I_all', 'Rmerge_I_all', None, 'The value of Rmerge(I) for all reflections in a given shell.               sum~i~(sum~j~|I~j~ - <I>|)  Rmerge(I) = --------------------------                  sum~i~(sum~j~<I>)   I~j~ = the intensity of the jth observation of reflection i  <I>  = the mean of the intensities of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection'),
+        ('Rmerge_I_obs', 'Rmerge_I_obs', None, "The value of Rmerge(I) for reflections classified as 'observed'  (see _reflns.observed_criterion) in a given shell.               sum~i~(sum~j~|I~j~ - <I>|)  Rmerge(I) = --------------------------                  sum~i~(sum~j~<I>)   I~j~ = the intensity of the jth observation of reflection i  <I>  = the mean of the intensities of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection"),
+        ('d_res_high', 'd_res_high', None, 'The smallest value in angstroms for the interplanar spacings  for the reflections in this shell. This is called the highest  resolution.'),
+        ('d_res_low', 'd_res_low', None, 'The highest value in angstroms for the interplanar spacings  for the reflections in this shell. This is called the lowest  resolution.'),
+        ('meanI_over_sigI_all', 'meanI_over_sigI_all', None, 'The ratio of the mean of the intensities of all reflections  in this shell to the mean of the standard uncertainties of the  intensities of all reflections in this shell.'),
+        ('meanI_over_sigI_obs', 'meanI_over_sigI_obs', None, "The ratio of the mean of the intensities of the reflections  classified as 'observed' (see _reflns.observed_criterion) in  this shell to the mean of the standard uncertainties of the  intensities of the 'observed' reflections in this  shell."),
+        ('meanI_over_uI_all', 'meanI_over_uI_all', None, 'The ratio of the mean of the intensities of all reflections  in this shell to the mean of the standard uncertainties of the  intensities of all reflections in this shell.'),
+        ('number_measured_all', 'number_measured_all', None, 'The total number of reflections measured for this  shell.'),
+        ('number_measured_obs', 'number_measured_obs', None, "The number of reflections classified as 'observed'  (see _reflns.observed_criterion) for this  shell."),
+        ('number_possible', 'number_possible', None, 'The number of unique reflections it is possible to measure in  this shell.'),
+        ('number_unique_all', 'number_unique_all', None, 'The total number of measured reflections which are symmetry-  unique after merging for this shell.'),
+        ('number_unique_obs', 'number_unique_obs', None, "The total number of measured reflections classified as 'observed'  (see _reflns.observed_criterion) which are symmetry-unique  after merging for this shell."),
+        ('pdbx_CC_half', 'pdbx_CC_half', None, "The Pearson's correlation coefficient expressed as a decimal value               between the average intensities from randomly selected               half-datasets within the resolution shell.  \t      Ref: Karplus & Diederichs (2012), Science 336, 1030-33"),
+        ('pdbx_R_split', 'pdbx_R_split', None, 'R split measures the agreement between the sets of intensities created by merging               odd- and even-numbered images from the data within the resolution shell.  \t      Ref: T. A. White, R. A. Kirian, A. V. Martin, A. Aquila, K. Nass, \t      A. Barty and H. N. Chapman (2012), J. Appl. Cryst. 45, 335-341'),
+        ('pdbx_Rpim_I_all', 'pdbx_Rpim_I_all', None, 'The precision-indicating merging R factor value Rpim,  for merging all intensities in a given shell.          sum~i~ [1/(N~i~ - 1)]1/2^ sum~j~ | I~j~ - <I~i~> |  Rpim = --------------------------------------------------                       sum~i~ ( sum~j~ I~j~ )   I~j~   = the intensity of the jth observation of reflection i  <I~i~> = the mean of the intensities of all observations of           reflection i  N~i~   = the redundancy (the number of times reflection i           has been measured).   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection.   Ref: Diederichs, K. & Karplus, P. A. (1997). Nature Struct.       Biol. 4, 269-275.       Weiss, M. S. & Hilgenfeld, R. (1997). J. Appl. Cryst.       30, 203-205.       Weiss, M. S. (2001). J. Appl. Cryst. 34, 130-135.'),
+        ('pdbx_Rrim_I_all', 'pdbx_Rrim_I_all', None, 'The redundancy-independent merging R factor value Rrim,               also denoted Rmeas, for merging all intensities in a               given shell.                       sum~i~ [N~i~ /( N~i~ - 1)]1/2^ sum~j~ | I~j~ - <I~i~> |               Rrim = --------------------------------------------------------                                    sum~i~ ( sum~j~ I~j~ )                I~j~   = the intensity of the jth observation of reflection i               <I~i~> = the mean of the intensities of all observations of                        reflection i \t      N~i~   = the redundancy (the number of times reflection i                        has been measured).                sum~i~ is taken over all reflections               sum~j~ is taken over all observations of each reflection.                Ref: Diederichs, K. & Karplus, P. A. (1997). Nature Struct.                    Biol. 4, 269-275.                    Weiss, M. S. & Hilgenfeld, R. (1997). J. Appl. Cryst.                    30, 203-205.                    Weiss, M. S. (2001). J. Appl. Cryst. 34, 130-135.'),
+        ('pdbx_Rsym_value', 'pdbx_Rsym_value', None, 'R sym value in percent.'),
+        ('pdbx_chi_squared', 'pdbx_chi_squared', None, 'Chi-squared statistic for this resolution shell.'),
+        ('pdbx_diffrn_id', 'pdbx_diffrn_id', None, ''),
+        ('pdbx_netI_over_sigmaI_all', 'pdbx_netI_over_sigmaI_all', None, 'The mean of the ratio of the intensities to their  standard uncertainties of all reflections in the  resolution shell.   _reflns_shell.pdbx_netI_over_sigmaI_all =  <I/sigma(I)>'),
+        ('pdbx_netI_over_sigmaI_obs', 'pdbx_netI_over_sigmaI_obs', None, 'The mean of the ratio of the intensities to their  standard uncertainties of observed reflections  (see _reflns.observed_criterion) in the resolution shell.   _reflns_shell.pdbx_netI_over_sigmaI_obs =  <I/sigma(I)>'),
+        ('pdbx_ordinal', 'pdbx_ordinal', None, 'An ordinal identifier for this resolution shell.'),
+        ('pdbx_redundancy', 'pdbx_redundancy', None, 'Redundancy for the current shell.'),
+        ('pdbx_rejects', 'pdbx_rejects', None, 'The number of rejected reflections in the resolution  shell.  Reflections may be rejected from scaling  by setting the observation criterion,  _reflns.observed_criterion.'),
+        ('percent_possible_all', 'percent_possible_all', None, 'The percentage of geometrically possible reflections represented  by all reflections measured for this shell.'),
+        ('percent_possible_obs', 'percent_possible_obs', None, "The percentage of geometrically possible reflections represented  by reflections classified as 'observed' (see  _reflns.observed_criterion) for this shell."),
+    )),
+    ('Attr_Software', '', (
+        ('citation_id', 'citation_id', None, 'This data item is a pointer to _citation.id in the CITATION  category.'),
+        ('classification', 'classification', None, 'The classification of the program according to its  major function.'),
+        ('contact_author', 'contact_author', None, 'The recognized contact author of the software. This could be  the original author, someone who has modified the code or  someone who maintains the code.  It should be the person  most commonly associated with the code.'),
+        ('contact_author_email', 'contact_author_email', None, 'The e-mail address of the person specified in  _software.contact_author.'),
+        ('date', 'date', None, 'The date the software was released.'),
+        ('description', 'description', None, 'Description of the software.'),
+        ('language', 'language', None, 'The major computing language in which the software is  coded.'),
+        ('location', 'location', None, 'The URL for an Internet address at which  details of the software can be found.'),
+        ('name', 'name', None, 'The name of the software.'),
+        ('os', 'os', None, 'The name of the operating system under which the software  runs.'),
+        ('pdbx_ordinal', 'pdbx_ordinal', None, 'An ordinal index for this category'),
+        ('type', 'type', None, 'The classification of the software according to the most  common types.'),
+        ('version', 'version', None, 'The version of the software.'),
+    )),
+    ('Attr_Struct', '', (
+        ('pdbx_CASP_flag', 'pdbx_CASP_flag', None, 'The item indicates whether the entry is a CASP target, a CASD-NMR target,  or similar target participating in methods development experiments.'),
+        ('pdbx_descriptor', 'pdbx_descriptor', None, 'An automatically generated descriptor for an NDB structure or  the unstructured content of the PDB COMPND record.'),
+        ('pdbx_model_details', 'pdbx_model_details', None, 'Text description of the methodology which produced this  model structure.'),
+        ('pdbx_model_type_details', 'pdbx_model_type_details', None, 'A description of the type of structure model.'),
+        ('title', 'title', None, 'A title for the data block. The author should attempt to convey  the essence of the structure archived in the CIF in the title,  and to distinguish this structural result from others.'),
+    )),
+    ('Attr_StructKeywords', '', (
+        ('pdbx_keywords', 'pdbx_keywords', None, 'Terms characterizing the macromolecular structure.'),
+        ('text', 'text', None, 'Keywords describing this structure.'),
+    )),
+    ('Attr_Symmetry', '', (
+        ('Int_Tables_number', 'Int_Tables_number', None, 'Space-group number from International Tables for Crystallography  Vol. A (2002).'),
+        ('cell_setting', 'cell_setting', None, 'The cell settings for this space-group symmetry.'),
+        ('pdbx_full_space_group_name_H_M', 'pdbx_full_space_group_name_H_M', None, "Used for PDB space group:   Example: 'C 1 2 1'  (instead of C 2)           'P 1 2 1'  (instead of P 2)           'P 1 21 1' (instead of P 21)           'P 1 1 21' (instead of P 21 -unique C axis)           'H 3'      (instead of R 3   -hexagonal)           'H 3 2'    (instead of R 3 2 -hexagonal)"),
+        ('space_group_name_H_M', 'space_group_name_H_M', None, 'Hermann-Mauguin space-group symbol. Note that the  Hermann-Mauguin symbol does not necessarily contain complete  information about the symmetry and the space-group origin. If  used, always supply the FULL symbol from International Tables  for Crystallography Vol. A (2002) and indicate the origin and  the setting if it is not implicit. If there is any doubt that  the equivalent positions can be uniquely deduced from this  symbol, specify the  _symmetry_equiv.pos_as_xyz or  _symmetry.space_group_name_Hall  data items as well. Leave  spaces between symbols referring to  different axes.'),
+        ('space_group_name_Hall', 'space_group_name_Hall', None, 'Space-group symbol as described by Hall (1981). This symbol  gives the space-group setting explicitly. Leave spaces between  the separate components of the symbol.   Ref: Hall, S. R. (1981). Acta Cryst. A37, 517-525; erratum  (1981) A37, 921.'),
+    )),
+    ('Attr_RcsbPubmedContainerIdentifiers', '', (
+        ('pubmed_id', 'pubmed_id', None, 'UID assigned to each PubMed record.'),
+    )),
+    ('Attr_RcsbPubmedMeshDescriptorsLineage', 'Members of the MeSH classification lineage.', (
+        ('id', 'id', None, 'Identifier for MeSH classification term.'),
+        ('name', 'name', None, 'MeSH classification term.'),
+        ('depth', 'depth', None, 'Hierarchy depth.'),
+    )),
+    ('Attr_EntityPoly', '', (
+        ('nstd_linkage', 'nstd_linkage', None, 'A flag to indicate whether the polymer contains at least  one monomer-to-monomer link different from that implied by  _entity_poly.type.'),
+        ('nstd_monomer', 'nstd_monomer', None, 'A flag to indicate whether the polymer contains at least  one monomer that is not considered standard.'),
+        ('pdbx_seq_one_letter_code', 'pdbx_seq_one_letter_code', None, "Sequence of protein or nucleic acid polymer in standard one-letter                codes of amino acids or nucleotides. Non-standard amino                acids/nucleotides are represented by their Chemical                Component Dictionary (CCD) codes in                parenthesis. Deoxynucleotides are represented by the                specially-assigned 2-letter CCD codes in parenthesis,                with 'D' prefix added to their ribonucleotide                counterparts. For hybrid polymer, each residue is                represented by the code of its individual type. A                cyclic polymer is represented in linear sequence from                the chosen start to end.  A for Alanine or Adenosine-5'-monophosphate C for Cysteine or Cytidine-5'-monophosphate D for Aspartic acid E for Glutamic acid F for Phenylalanine G for Glycine or Guanosine-5'-monophosphate H for Histidine I for Isoleucine or Inosinic Acid L for Leucine K for Lysine M for Methionine N for Asparagine  or Unknown ribonucleotide O for Pyrrolysine P for Proline Q for Glutamine R for Arginine S for Serine T for Threonine U for Selenocysteine or Uridine-5'-monophosphate V for Valine W for Tryptophan Y for Tyrosine (DA) for 2'-deoxyadenosine-5'-monophosphate (DC) for 2'-deoxycytidine-5'-monophosphate (DG) for 2'-deoxyguanosine-5'-monophosphate (DT) for Thymidine-5'-monophosphate (MSE) for Selenomethionine (SEP) for Phosphoserine (TPO) for Phosphothreonine (PTR) for Phosphotyrosine (PCA) for Pyroglutamic acid (UNK) for Unknown amino acid (ACE) for Acetylation cap (NH2) for Amidation cap"),
+        ('pdbx_seq_one_letter_code_can', 'pdbx_seq_one_letter_code_can', None, "Canonical sequence of protein or nucleic acid polymer in standard                one-letter codes of amino acids or nucleotides,                corresponding to the sequence in                _entity_poly.pdbx_seq_one_letter_code. Non-standard                amino acids/nucleotides are represented by the codes of                their parents if parent is specified in                _chem_comp.mon_nstd_parent_comp_id, or by letter 'X' if                parent is not specified. Deoxynucleotides are                represented by their canonical one-letter codes of A,                C, G, or T.                 For modifications with several parent amino acids, \t       all corresponding parent amino acid codes will be listed \t       (ex. chromophores)."),
+        ('pdbx_sequence_evidence_code', 'pdbx_sequence_evidence_code', None, 'Evidence for the assignment of the polymer sequence.'),
+        ('pdbx_strand_id', 'pdbx_strand_id', None, 'The PDB strand/chain id(s) corresponding to this polymer entity.'),
+        ('pdbx_target_identifier', 'pdbx_target_identifier', None, "For Structural Genomics entries, the sequence's target identifier registered at the TargetTrack database."),
+        ('rcsb_artifact_monomer_count', 'rcsb_artifact_monomer_count', None, 'Number of regions in the sample sequence identified as expression tags, linkers, or  cloning artifacts.'),
+        ('rcsb_conflict_count', 'rcsb_conflict_count', None, 'Number of monomer conflicts relative to the reference sequence.'),
+        ('rcsb_deletion_count', 'rcsb_deletion_count', None, 'Number of monomer deletions relative to the reference sequence.'),
+        ('rcsb_entity_polymer_type', 'rcsb_entity_polymer_type', None, 'A coarse-grained polymer entity type.'),
+        ('rcsb_insertion_count', 'rcsb_insertion_count', None, 'Number of monomer insertions relative to the reference sequence.'),
+        ('rcsb_mutation_count', 'rcsb_mutation_count', None, 'Number of engineered mutations engineered in the sample sequence.'),
+        ('rcsb_non_std_monomer_count', 'rcsb_non_std_monomer_count', None, 'Number of non-standard monomers in the sample sequence.'),
+        ('rcsb_non_std_monomers', 'rcsb_non_std_monomers', None, ''),
+        ('rcsb_prd_id', 'rcsb_prd_id', None, 'For polymer BIRD molecules the BIRD identifier for the entity.'),
+        ('rcsb_sample_sequence_length', 'rcsb_sample_sequence_length', None, 'The monomer length of the sample sequence.'),
+        ('type', 'type', None, 'The type of the polymer.'),
+    )),
+    ('Attr_EntitySrcGen', '', (
+        ('expression_system_id', 'expression_system_id', None, 'A unique identifier for the expression system. This  should be extracted from a local list of expression  systems.'),
+        ('gene_src_common_name', 'gene_src_common_name', None, 'The common name of the natural organism from which the gene was  obtained.'),
+        ('gene_src_details', 'gene_src_details', None, 'A description of special aspects of the natural organism from  which the gene was obtained.'),
+        ('gene_src_genus', 'gene_src_genus', None, 'The genus of the natural organism from which the gene was  obtained.'),
+        ('gene_src_species', 'gene_src_species', None, 'The species of the natural organism from which the gene was  obtained.'),
+        ('gene_src_strain', 'gene_src_strain', None, 'The strain of the natural organism from which the gene was  obtained, if relevant.'),
+        ('gene_src_tissue', 'gene_src_tissue', None, 'The tissue of the natural organism from which the gene was  obtained.'),
+        ('gene_src_tissue_fraction', 'gene_src_tissue_fraction', None, 'The subcellular fraction of the tissue of the natural organism  from which the gene was obtained.'),
+        ('host_org_common_name', 'host_org_common_name', None, 'The common name of the organism that served as host for the  production of the entity.  Where full details of the protein  production are available it would be expected that this item  be derived from _entity_src_gen_express.host_org_common_name  or via _entity_src_gen_express.host_org_tax_id'),
+        ('host_org_details', 'host_org_details', None, 'A description of special aspects of the organism that served as  host for the production of the entity. Where full details of  the protein production are available it would be expected that  this item would derived from _entity_src_gen_express.host_org_details'),
+        ('host_org_genus', 'host_org_genus', None, 'The genus of the organism that served as host for the production  of the entity.'),
+        ('host_org_species', 'host_org_species', None, 'The species of the organism that served as host for the  production of the entity.'),
+        ('pdbx_alt_source_flag', 'pdbx_alt_source_flag', None, 'This data item identifies cases in which an alternative source  modeled.'),
+        ('pdbx_beg_seq_num', 'pdbx_beg_seq_num', None, 'The beginning polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category.'),
+        ('pdbx_description', 'pdbx_description', None, 'Information on the source which is not given elsewhere.'),
+        ('pdbx_end_seq_num', 'pdbx_end_seq_num', None, 'The ending polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category.'),
+        ('pdbx_gene_src_atcc', 'pdbx_gene_src_atcc', None, 'American Type Culture Collection tissue culture number.'),
+        ('pdbx_gene_src_cell', 'pdbx_gene_src_cell', None, 'Cell type.'),
+        ('pdbx_gene_src_cell_line', 'pdbx_gene_src_cell_line', None, 'The specific line of cells.'),
+        ('pdbx_gene_src_cellular_location', 'pdbx_gene_src_cellular_location', None, 'Identifies the location inside (or outside) the cell.'),
+        ('pdbx_gene_src_fragment', 'pdbx_gene_src_fragment', None, 'A domain or fragment of the molecule.'),
+        ('pdbx_gene_src_gene', 'pdbx_gene_src_gene', None, 'Identifies the gene.'),
+        ('pdbx_gene_src_ncbi_taxonomy_id', 'pdbx_gene_src_ncbi_taxonomy_id', None, 'NCBI Taxonomy identifier for the gene source organism.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18.'),
+        ('pdbx_gene_src_organ', 'pdbx_gene_src_organ', None, 'Organized group of tissues that carries on a specialized function.'),
+        ('pdbx_gene_src_organelle', 'pdbx_gene_src_organelle', None, 'Organized structure within cell.'),
+        ('pdbx_gene_src_scientific_name', 'pdbx_gene_src_scientific_name', None, 'Scientific name of the organism.'),
+        ('pdbx_gene_src_variant', 'pdbx_gene_src_variant', None, 'Identifies the variant.'),
+        ('pdbx_host_org_atcc', 'pdbx_host_org_atcc', None, 'Americal Tissue Culture Collection of the expression system. Where  full details of the protein production are available it would  be expected that this item  would be derived from  _entity_src_gen_express.host_org_culture_collection'),
+        ('pdbx_host_org_cell', 'pdbx_host_org_cell', None, 'Cell type from which the gene is derived. Where  entity.target_id is provided this should be derived from  details of the target.'),
+        ('pdbx_host_org_cell_line', 'pdbx_host_org_cell_line', None, 'A specific line of cells used as the expression system. Where  full details of the protein production are available it would  be expected that this item would be derived from  entity_src_gen_express.host_org_cell_line'),
+        ('pdbx_host_org_cellular_location', 'pdbx_host_org_cellular_location', None, 'Identifies the location inside (or outside) the cell which  expressed the molecule.'),
+        ('pdbx_host_org_culture_collection', 'pdbx_host_org_culture_collection', None, 'Culture collection of the expression system. Where  full details of the protein production are available it would  be expected that this item  would be derived somehwere, but  exactly where is not clear.'),
+        ('pdbx_host_org_gene', 'pdbx_host_org_gene', None, 'Specific gene which expressed the molecule.'),
+        ('pdbx_host_org_ncbi_taxonomy_id', 'pdbx_host_org_ncbi_taxonomy_id', None, 'NCBI Taxonomy identifier for the expression system organism.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18.'),
+        ('pdbx_host_org_organ', 'pdbx_host_org_organ', None, 'Specific organ which expressed the molecule.'),
+        ('pdbx_host_org_organelle', 'pdbx_host_org_organelle', None, 'Specific organelle which expressed the molecule.'),
+        ('pdbx_host_org_scientific_name', 'pdbx_host_org_scientific_name', None, 'The scientific name of the organism that served as host for the  production of the entity. Where full details of the protein  production are available it would be expected that this item  would be derived from _entity_src_gen_express.host_org_scientific_name  or via _entity_src_gen_express.host_org_tax_id'),
+        ('pdbx_host_org_strain', 'pdbx_host_org_strain', None, 'The strain of the organism in which the entity was expressed.'),
+        ('pdbx_host_org_tissue', 'pdbx_host_org_tissue', None, 'The specific tissue which expressed the molecule. Where full details  of the protein production are available it would be expected that this  item would be derived from _entity_src_gen_express.host_org_tissue'),
+        ('pdbx_host_org_tissue_fraction', 'pdbx_host_org_tissue_fraction', None, 'The fraction of the tissue which expressed the molecule.'),
+        ('pdbx_host_org_variant', 'pdbx_host_org_variant', None, 'Variant of the organism used as the expression system. Where  full details of the protein production are available it would  be expected that this item be derived from  entity_src_gen_express.host_org_variant or via  _entity_src_gen_express.host_org_tax_id'),
+        ('pdbx_host_org_vector', 'pdbx_host_org_vector', None, 'Identifies the vector used. Where full details of the protein  production are available it would be expected that this item  would be derived from _entity_src_gen_clone.vector_name.'),
+        ('pdbx_host_org_vector_type', 'pdbx_host_org_vector_type', None, 'Identifies the type of vector used (plasmid, virus, or cosmid).  Where full details of the protein production are available it  would be expected that this item would be derived from  _entity_src_gen_express.vector_type.'),
+        ('pdbx_seq_type', 'pdbx_seq_type', None, 'This data item povides additional information about the sequence type.'),
+        ('pdbx_src_id', 'pdbx_src_id', None, 'This data item is an ordinal identifier for entity_src_gen data records.'),
+        ('plasmid_details', 'plasmid_details', None, 'A description of special aspects of the plasmid that produced the  entity in the host organism. Where full details of the protein  production are available it would be expected that this item  would be derived from _pdbx_construct.details of the construct  pointed to from _entity_src_gen_express.plasmid_id.'),
+        ('plasmid_name', 'plasmid_name', None, 'The name of the plasmid that produced the entity in the host  organism. Where full details of the protein production are available  it would be expected that this item would be derived from  _pdbx_construct.name of the construct pointed to from  _entity_src_gen_express.plasmid_id.'),
+    )),
+    ('Attr_EntitySrcNat', '', (
+        ('common_name', 'common_name', None, 'The common name of the organism from which the entity  was isolated.'),
+        ('details', 'details', None, 'A description of special aspects of the organism from which the  entity was isolated.'),
+        ('genus', 'genus', None, 'The genus of the organism from which the entity was isolated.'),
+        ('pdbx_alt_source_flag', 'pdbx_alt_source_flag', None, 'This data item identifies cases in which an alternative source  modeled.'),
+        ('pdbx_atcc', 'pdbx_atcc', None, 'Americal Tissue Culture Collection number.'),
+        ('pdbx_beg_seq_num', 'pdbx_beg_seq_num', None, 'The beginning polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category.'),
+        ('pdbx_cell', 'pdbx_cell', None, 'A particular cell type.'),
+        ('pdbx_cell_line', 'pdbx_cell_line', None, 'The specific line of cells.'),
+        ('pdbx_cellular_location', 'pdbx_cellular_location', None, 'Identifies the location inside (or outside) the cell.'),
+        ('pdbx_end_seq_num', 'pdbx_end_seq_num', None, 'The ending polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category.'),
+        ('pdbx_fragment', 'pdbx_fragment', None, 'A domain or fragment of the molecule.'),
+        ('pdbx_ncbi_taxonomy_id', 'pdbx_ncbi_taxonomy_id', None, 'NCBI Taxonomy identifier for the source organism.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18.'),
+        ('pdbx_organ', 'pdbx_organ', None, 'Organized group of tissues that carries on a specialized function.'),
+        ('pdbx_organelle', 'pdbx_organelle', None, 'Organized structure within cell.'),
+        ('pdbx_organism_scientific', 'pdbx_organism_scientific', None, 'Scientific name of the organism of the natural source.'),
+        ('pdbx_plasmid_details', 'pdbx_plasmid_details', None, 'Details about the plasmid.'),
+        ('pdbx_plasmid_name', 'pdbx_plasmid_name', None, 'The plasmid containing the gene.'),
+        ('pdbx_secretion', 'pdbx_secretion', None, 'Identifies the secretion from which the molecule was isolated.'),
+        ('pdbx_src_id', 'pdbx_src_id', None, 'This data item is an ordinal identifier for entity_src_nat data records.'),
+        ('pdbx_variant', 'pdbx_variant', None, 'Identifies the variant.'),
+        ('species', 'species', None, 'The species of the organism from which the entity was isolated.'),
+        ('strain', 'strain', None, 'The strain of the organism from which the entity was isolated.'),
+        ('tissue', 'tissue', None, 'The tissue of the organism from which the entity was isolated.'),
+        ('tissue_fraction', 'tissue_fraction', None, 'The subcellular fraction of the tissue of the organism from  which the entity was isolated.'),
+    )),
+    ('Attr_PdbxEntitySrcSyn', '', (
+        ('details', 'details', None, 'A description of special aspects of the source for the  synthetic entity.'),
+        ('ncbi_taxonomy_id', 'ncbi_taxonomy_id', None, 'NCBI Taxonomy identifier of the organism from which the sequence of  the synthetic entity was derived.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18.'),
+        ('organism_common_name', 'organism_common_name', None, 'The common name of the organism from which the sequence of  the synthetic entity was derived.'),
+        ('organism_scientific', 'organism_scientific', None, 'The scientific name of the organism from which the sequence of  the synthetic entity was derived.'),
+        ('pdbx_alt_source_flag', 'pdbx_alt_source_flag', None, 'This data item identifies cases in which an alternative source  modeled.'),
+        ('pdbx_beg_seq_num', 'pdbx_beg_seq_num', None, 'The beginning polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category.'),
+        ('pdbx_end_seq_num', 'pdbx_end_seq_num', None, 'The ending polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category.'),
+        ('pdbx_src_id', 'pdbx_src_id', None, 'This data item is an ordinal identifier for pdbx_entity_src_syn data records.'),
+    )),
+    ('Attr_RcsbClusterFlexibility', '', (
+        ('avg_rmsd', 'avg_rmsd', None, 'Average RMSD refer to average pairwise RMSD (Root Mean Square Deviation of C-alpha atoms) between structures in the cluster (95% sequence identity) where a given entity belongs.'),
+        ('label', 'label', None, 'Structural flexibility in the cluster (95% sequence identity) where a given entity belongs.'),
+        ('link', 'link', None, 'Link to the associated PDBFlex database entry.'),
+        ('max_rmsd', 'max_rmsd', None, 'Maximal RMSD refer to maximal pairwise RMSD (Root Mean Square Deviation of C-alpha atoms) between structures in the cluster (95% sequence identity) where a given entity belongs.'),
+        ('provenance_code', 'provenance_code', None, 'Provenance code indicating the origin of the flexibility data.'),
+    )),
+    ('Attr_RcsbClusterMembership', '', (
+        ('cluster_id', 'cluster_id', None, 'Identifier for a cluster at the specified level of sequence identity within the cluster data set.'),
+        ('identity', 'identity', None, 'Sequence identity expressed as an integer percent value.'),
+    )),
+    ('Attr_TaxonomyLineage', '', (
+        ('depth', 'depth', None, 'Members of the NCBI Taxonomy lineage as parent taxonomy lineage depth (1-N)'),
+        ('id', 'id', None, 'Members of the NCBI Taxonomy lineage as parent taxonomy idcodes.'),
+        ('name', 'name', None, 'Members of the NCBI Taxonomy lineage as parent taxonomy names.'),
+    )),
+    ('Attr_RcsbEntityHostOrganism', '', (
+        ('beg_seq_num', 'beg_seq_num', None, 'The beginning polymer sequence position for the polymer section corresponding  to this host organism.   A reference to the sequence position in the entity_poly category.'),
+        ('common_name', 'common_name', None, 'The common name of the host organism'),
+        ('end_seq_num', 'end_seq_num', None, 'The ending polymer sequence position for the polymer section corresponding  to this host organism.   A reference to the sequence position in the entity_poly category.'),
+        ('ncbi_common_names', 'ncbi_common_names', None, ''),
+        ('ncbi_parent_scientific_name', 'ncbi_parent_scientific_name', None, 'The parent scientific name in the NCBI taxonomy hierarchy (depth=1) associated with this taxonomy code.  References:  Sayers EW, Barrett T, Benson DA, Bryant SH, Canese K, Chetvernin V, Church DM, DiCuccio M, Edgar R, Federhen S, Feolo M, Geer LY, Helmberg W, Kapustin Y, Landsman D, Lipman DJ, Madden TL, Maglott DR, Miller V, Mizrachi I, Ostell J, Pruitt KD, Schuler GD, Sequeira E, Sherry ST, Shumway M, Sirotkin K, Souvorov A, Starchenko G, Tatusova TA, Wagner L, Yaschenko E, Ye J (2009). Database resources of the National Center for Biotechnology Information. Nucleic Acids Res. 2009 Jan;37(Database issue):D5-15. Epub 2008 Oct 21.  Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Sayers EW (2009). GenBank. Nucleic Acids Res. 2009 Jan;37(Database issue):D26-31. Epub 2008 Oct 21.'),
+        ('ncbi_scientific_name', 'ncbi_scientific_name', None, 'The scientific name associated with this taxonomy code aggregated by the NCBI Taxonomy Database.    This name corresponds to the taxonomy identifier assigned by the PDB depositor.   References:  Sayers EW, Barrett T, Benson DA, Bryant SH, Canese K, Chetvernin V, Church DM, DiCuccio M, Edgar R, Federhen S, Feolo M, Geer LY, Helmberg W, Kapustin Y, Landsman D, Lipman DJ, Madden TL, Maglott DR, Miller V, Mizrachi I, Ostell J, Pruitt KD, Schuler GD, Sequeira E, Sherry ST, Shumway M, Sirotkin K, Souvorov A, Starchenko G, Tatusova TA, Wagner L, Yaschenko E, Ye J (2009). Database resources of the National Center for Biotechnology Information. Nucleic Acids Res. 2009 Jan;37(Database issue):D5-15. Epub 2008 Oct 21.  Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Sayers EW (2009). GenBank. Nucleic Acids Res. 2009 Jan;37(Database issue):D26-31. Epub 2008 Oct 21.'),
+        ('ncbi_taxonomy_id', 'ncbi_taxonomy_id', None, 'NCBI Taxonomy identifier for the host organism.    Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18.'),
+        ('pdbx_src_id', 'pdbx_src_id', None, 'An identifier for an entity segment.'),
+        ('provenance_source', 'provenance_source', None, 'A code indicating the provenance of the host organism.'),
+        ('scientific_name', 'scientific_name', None, 'The scientific name of the host organism'),
+        ('taxonomy_lineage', 'taxonomy_lineage', 223, ''),
+    )),
+    ('Attr_TaxonomyLineage_2', '', (
+        ('depth', 'depth', None, 'Members of the NCBI Taxonomy lineage as parent taxonomy lineage depth (1-N)'),
+        ('id', 'id', None, 'Members of the NCBI Taxonomy lineage as parent taxonomy idcodes.'),
+        ('name', 'name', None, 'Memebers of the NCBI Taxonomy lineage as parent taxonomy names.'),
+    )),
+    ('Attr_RcsbGeneName', '', (
+        ('provenance_source', 'provenance_source', None, 'A code indicating the provenance of the source organism details for the entity'),
+        ('value', 'value', None, 'Gene name.'),
+    )),
+    ('Attr_RcsbEntitySourceOrganism', '', (
+        ('beg_seq_num', 'beg_seq_num', None, 'The beginning polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category.'),
+        ('common_name', 'common_name', None, 'The common name for the source organism assigned by the PDB depositor.'),
+        ('end_seq_num', 'end_seq_num', None, 'The ending polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category.'),
+        ('ncbi_common_names', 'ncbi_common_names', None, ''),
+        ('ncbi_parent_scientific_name', 'ncbi_parent_scientific_name', None, 'A parent scientific name in the NCBI taxonomy hierarchy of the source organism assigned by the PDB depositor.   For cellular organism this corresponds to a superkingdom (e.g., Archaea, Bacteria, Eukaryota).  For viruses this   corresponds to a clade (e.g.  Adnaviria, Bicaudaviridae, Clavaviridae). For other and unclassified entries this   corresponds to the first level of any taxonomic rank below the root level.  References:  Sayers EW, Barrett T, Benson DA, Bryant SH, Canese K, Chetvernin V, Church DM, DiCuccio M, Edgar R, Federhen S, Feolo M, Geer LY, Helmberg W, Kapustin Y, Landsman D, Lipman DJ, Madden TL, Maglott DR, Miller V, Mizrachi I, Ostell J, Pruitt KD, Schuler GD, Sequeira E, Sherry ST, Shumway M, Sirotkin K, Souvorov A, Starchenko G, Tatusova TA, Wagner L, Yaschenko E, Ye J (2009). Database resources of the National Center for Biotechnology Information. Nucleic Acids Res. 2009 Jan;37(Database issue):D5-15. Epub 2008 Oct 21.  Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Sayers EW (2009). GenBank. Nucleic Acids Res. 2009 Jan;37(Database issue):D26-31. Epub 2008 Oct 21.'),
+        ('ncbi_scientific_name', 'ncbi_scientific_name', None, 'The scientific name associated with this taxonomy code aggregated by the NCBI Taxonomy Database.    This name corresponds to the taxonomy identifier assigned by the PDB depositor.   References:  Sayers EW, Barrett T, Benson DA, Bryant SH, Canese K, Chetvernin V, Church DM, DiCuccio M, Edgar R, Federhen S, Feolo M, Geer LY, Helmberg W, Kapustin Y, Landsman D, Lipman DJ, Madden TL, Maglott DR, Miller V, Mizrachi I, Ostell J, Pruitt KD, Schuler GD, Sequeira E, Sherry ST, Shumway M, Sirotkin K, Souvorov A, Starchenko G, Tatusova TA, Wagner L, Yaschenko E, Ye J (2009). Database resources of the National Center for Biotechnology Information. Nucleic Acids Res. 2009 Jan;37(Database issue):D5-15. Epub 2008 Oct 21.  Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Sayers EW (2009). GenBank. Nucleic Acids Res. 2009 Jan;37(Database issue):D26-31. Epub 2008 Oct 21.'),
+        ('ncbi_taxonomy_id', 'ncbi_taxonomy_id', None, 'NCBI Taxonomy identifier for the gene source organism assigned by the PDB depositor.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18.'),
+        ('pdbx_src_id', 'pdbx_src_id', None, 'An identifier for the entity segment.'),
+        ('provenance_source', 'provenance_source', None, 'Reference to the provenance of the source organism details for the entity.   Primary data indicates information obtained from the same source as the structural model.  UniProt and NCBI are provided as alternate sources of provenance for organism details.'),
+        ('scientific_name', 'scientific_name', None, 'The scientific name of the source organism assigned by the PDB depositor.'),
+        ('source_type', 'source_type', None, 'The source type for the entity'),
+        ('taxonomy_lineage', 'taxonomy_lineage', 225, ''),
+        ('rcsb_gene_name', 'rcsb_gene_name', 226, ''),
+    )),
+    ('Attr_RcsbGenomicLineage', '', (
+        ('depth', 'depth', None, 'Classification hierarchy depth.'),
+        ('id', 'id', None, 'Automatically assigned ID that uniquely identifies taxonomy, chromosome or gene in the Genome Location Browser.'),
+        ('name', 'name', None, 'A human-readable term name.'),
+    )),
+    ('Attr_RcsbMembraneLineage', '', (
+        ('depth', 'depth', None, 'Hierarchy depth.'),
+        ('id', 'id', None, 'Automatically assigned ID for membrane classification term in the Membrane Protein Browser.'),
+        ('name', 'name', None, 'Membrane protein classification term.'),
+    )),
+    ('Attr_RcsbEcLineage', '', (
+        ('depth', 'depth', None, 'Members of the enzyme classification lineage as parent classification hierarchy depth (1-N).'),
+        ('id', 'id', None, 'Members of the enzyme classification lineage as parent classification codes.'),
+        ('name', 'name', None, 'Members of the enzyme classification lineage as parent classification names.'),
+    )),
+    ('Attr_RcsbMacromolecularNamesCombined', '', (
+        ('name', 'name', None, 'Combined list of macromolecular names.'),
+        ('provenance_code', 'provenance_code', None, 'Combined list of macromolecular names associated provenance code.   ECO (https://github.com/evidenceontology/evidenceontology)'),
+        ('provenance_source', 'provenance_source', None, 'Combined list of macromolecular names associated name source.'),
+    )),
+    ('Attr_RcsbEnzymeClassCombined', '', (
+        ('depth', 'depth', None, 'The enzyme classification hierarchy depth (1-N).'),
+        ('ec', 'ec', None, 'Combined list of enzyme class assignments.'),
+        ('provenance_source', 'provenance_source', None, 'Combined list of enzyme class associated provenance sources.'),
+    )),
+    ('Attr_RcsbPolymerNameCombined', '', (
+        ('names', 'names', None, ''),
+        ('provenance_source', 'provenance_source', None, 'Provenance source for the combined protein names.'),
+    )),
+    ('Attr_RcsbPolymerEntity', '', (
+        ('details', 'details', None, 'A description of special aspects of the entity.'),
+        ('formula_weight', 'formula_weight', None, 'Formula mass (KDa) of the entity.'),
+        ('pdbx_description', 'pdbx_description', None, 'A description of the polymer entity.'),
+        ('pdbx_ec', 'pdbx_ec', None, 'Enzyme Commission (EC) number(s)'),
+        ('pdbx_fragment', 'pdbx_fragment', None, 'Polymer entity fragment description(s).'),
+        ('pdbx_mutation', 'pdbx_mutation', None, 'Details about any polymer entity mutation(s).'),
+        ('pdbx_number_of_molecules', 'pdbx_number_of_molecules', None, 'The number of molecules of the entity in the entry.'),
+        ('rcsb_multiple_source_flag', 'rcsb_multiple_source_flag', None, 'A code indicating the entity has multiple biological sources.'),
+        ('rcsb_source_part_count', 'rcsb_source_part_count', None, 'The number of biological sources for the polymer entity. Multiple source contributions  may come from the same organism (taxonomy).'),
+        ('rcsb_source_taxonomy_count', 'rcsb_source_taxonomy_count', None, 'The number of distinct source taxonomies for the polymer entity. Commonly used to identify chimeric polymers.'),
+        ('src_method', 'src_method', None, 'The method by which the sample for the polymer entity was produced.  Entities isolated directly from natural sources (tissues, soil  samples etc.) are expected to have further information in the  ENTITY_SRC_NAT category. Entities isolated from genetically  manipulated sources are expected to have further information in  the ENTITY_SRC_GEN category.'),
+        ('rcsb_ec_lineage', 'rcsb_ec_lineage', 230, ''),
+        ('rcsb_macromolecular_names_combined', 'rcsb_macromolecular_names_combined', 231, ''),
+        ('rcsb_enzyme_class_combined', 'rcsb_enzyme_class_combined', 232, ''),
+        ('rcsb_polymer_name_combined', 'rcsb_polymer_name_combined', 233, ''),
+    )),
+    ('Attr_AlignedRegions_2', '', (
+        ('entity_beg_seq_id', 'entity_beg_seq_id', None, 'An identifier for the monomer in the entity sequence at which this segment of the alignment begins.'),
+        ('length', 'length', None, 'The length of this segment of the alignment.'),
+        ('ref_beg_seq_id', 'ref_beg_seq_id', None, 'An identifier for the monomer in the reference sequence at which this segment of the alignment begins.'),
+    )),
+    ('Attr_RcsbPolymerEntityAlign', '', (
+        ('provenance_source', 'provenance_source', None, 'Code identifying the individual, organization or program that  assigned the reference sequence.'),
+        ('reference_database_accession', 'reference_database_accession', None, 'Reference sequence accession code.'),
+        ('reference_database_isoform', 'reference_database_isoform', None, 'Reference sequence isoform identifier.'),
+        ('reference_database_name', 'reference_database_name', None, 'Reference sequence database name.'),
+        ('aligned_regions', 'aligned_regions', 235, ''),
+    )),
+    ('Attr_RcsbPolymerEntityAnnotation', '', (
+        ('annotation_id', 'annotation_id', None, 'An identifier for the annotation.'),
+        ('assignment_version', 'assignment_version', None, 'Identifies the version of the annotation assignment.'),
+        ('description', 'description', None, 'A description for the annotation.'),
+        ('name', 'name', None, 'A name for the annotation.'),
+        ('provenance_source', 'provenance_source', None, 'Code identifying the individual, organization or program that  assigned the annotation.'),
+        ('type', 'type', None, 'A type or category of the annotation.'),
+        ('annotation_lineage', 'annotation_lineage', 3, ''),
+        ('additional_properties', 'additional_properties', 6, ''),
+    )),
+    ('Attr_ReferenceSequenceIdentifiers_2', '', (
+        ('database_accession', 'database_accession', None, 'Reference database accession code'),
+        ('database_isoform', 'database_isoform', None, 'Reference database identifier for the sequence isoform'),
+        ('database_name', 'database_name', None, 'Reference database name'),
+        ('entity_sequence_coverage', 'entity_sequence_coverage', None, 'Indicates what fraction of this polymer entity sequence is covered by the reference sequence.'),
+        ('provenance_source', 'provenance_source', None, 'Source of the reference database assignment'),
+        ('reference_sequence_coverage', 'reference_sequence_coverage', None, 'Indicates what fraction of the reference sequence is covered by this polymer entity sequence.'),
+    )),
+    ('Attr_RcsbPolymerEntityContainerIdentifiers', '', (
+        ('asym_ids', 'asym_ids', None, ''),
+        ('auth_asym_ids', 'auth_asym_ids', None, ''),
+        ('chem_comp_monomers', 'chem_comp_monomers', None, ''),
+        ('chem_comp_nstd_monomers', 'chem_comp_nstd_monomers', None, ''),
+        ('chem_ref_def_id', 'chem_ref_def_id', None, 'The chemical reference definition identifier for the entity in this container.'),
+        ('entity_id', 'entity_id', None, 'Entity identifier for the container.'),
+        ('entry_id', 'entry_id', None, 'Entry identifier for the container.'),
+        ('prd_id', 'prd_id', None, 'The BIRD identifier for the entity in this container.'),
+        ('rcsb_id', 'rcsb_id', None, 'A unique identifier for each object in this entity container formed by  an underscore separated concatenation of entry and entity identifiers.'),
+        ('uniprot_ids', 'uniprot_ids', None, ''),
+        ('reference_sequence_identifiers', 'reference_sequence_identifiers', 238, ''),
+    )),
+    ('Attr_FeaturePositions_6', '', (
+        ('beg_comp_id', 'beg_comp_id', None, 'An identifier for the leading monomer corresponding to the feature assignment.'),
+        ('beg_seq_id', 'beg_seq_id', None, 'An identifier for the monomer at which this segment of the feature begins.'),
+        ('end_seq_id', 'end_seq_id', None, 'An identifier for the monomer at which this segment of the feature ends.'),
+        ('value', 'value', None, 'The value for the feature over this monomer segment.'),
+        ('values', 'values', None, ''),
+    )),
+    ('Attr_RcsbPolymerEntityFeature', '', (
+        ('assignment_version', 'assignment_version', None, 'Identifies the version of the feature assignment.'),
+        ('description', 'description', None, 'A description for the feature.'),
+        ('feature_id', 'feature_id', None, 'An identifier for the feature.'),
+        ('name', 'name', None, 'A name for the feature.'),
+        ('provenance_source', 'provenance_source', None, 'Code identifying the individual, organization or program that  assigned the feature.'),
+        ('reference_scheme', 'reference_scheme', None, 'Code residue coordinate system for the assigned feature.'),
+        ('type', 'type', None, 'A type or category of the feature.'),
+        ('feature_positions', 'feature_positions', 240, ''),
+        ('additional_properties', 'additional_properties', 6, ''),
+    )),
+    ('Attr_RcsbPolymerEntityFeatureSummary', '', (
+        ('count', 'count', None, 'The feature count.'),
+        ('coverage', 'coverage', None, 'The fractional feature coverage relative to the full entity sequence.  For instance, the fraction of features such as mutations, artifacts or modified monomers  relative to the length of the entity sequence.'),
+        ('maximum_length', 'maximum_length', None, 'The maximum feature length.'),
+        ('maximum_value', 'maximum_value', None, 'The maximum feature value.'),
+        ('minimum_length', 'minimum_length', None, 'The minimum feature length.'),
+        ('minimum_value', 'minimum_value', None, 'The minimum feature value.'),
+        ('type', 'type', None, 'Type or category of the feature.'),
+    )),
+    ('Attr_RcsbPolymerEntityGroupMembership', '', (
+        ('aggregation_method', 'aggregation_method', None, 'Method used to establish group membership'),
+        ('group_id', 'group_id', None, 'A unique identifier for a group of entities'),
+        ('similarity_cutoff', 'similarity_cutoff', None, 'Degree of similarity expressed as a floating-point number'),
+        ('aligned_regions', 'aligned_regions', 235, ''),
+    )),
+    ('Attr_RcsbPolymerEntityKeywords', '', (
+        ('text', 'text', None, 'Keywords describing this polymer entity.'),
+    )),
+    ('Attr_RcsbPolymerEntityNameCom', '', (
+        ('name', 'name', None, 'A common name for the polymer entity.'),
+    )),
+    ('Attr_RcsbPolymerEntityNameSys', '', (
+        ('name', 'name', None, 'The systematic name for the polymer entity.'),
+        ('system', 'system', None, 'The system used to generate the systematic name of the polymer entity.'),
+    )),
+    ('Attr_AlignedTarget', '', (
+        ('entity_beg_seq_id', 'entity_beg_seq_id', None, 'The position of the monomer in the entity sequence at which the alignment begins.'),
+        ('length', 'length', None, 'The length of the alignment.'),
+        ('target_beg_seq_id', 'target_beg_seq_id', None, 'The position of the monomer in the target sequence at which the alignment begins.'),
+    )),
+    ('Attr_RcsbRelatedTargetReferences', '', (
+        ('related_resource_name', 'related_resource_name', None, 'The related target data resource name.'),
+        ('related_resource_version', 'related_resource_version', None, 'The version of the target data resource.'),
+        ('related_target_id', 'related_target_id', None, 'An identifier for the target sequence in the related data resource.'),
+        ('target_taxonomy_id', 'target_taxonomy_id', None, 'NCBI Taxonomy identifier for the target organism.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18.'),
+        ('aligned_target', 'aligned_target', 247, ''),
+    )),
+    ('Attr_RcsbTargetCofactors', '', (
+        ('binding_assay_value', 'binding_assay_value', None, 'The value measured or determined by the assay.'),
+        ('binding_assay_value_type', 'binding_assay_value_type', None, 'The type of measurement or value determined by the assay.'),
+        ('cofactor_InChIKey', 'cofactor_InChIKey', None, 'Standard IUPAC International Chemical Identifier (InChI) descriptor key  for the cofactor.   InChI, the IUPAC International Chemical Identifier,  by Stephen R Heller, Alan McNaught, Igor Pletnev, Stephen Stein and Dmitrii Tchekhovskoi,  Journal of Cheminformatics, 2015, 7:23'),
+        ('cofactor_SMILES', 'cofactor_SMILES', None, "Simplified molecular-input line-entry system (SMILES) descriptor for the cofactor.     Weininger D (February 1988). 'SMILES, a chemical language and information system. 1.    Introduction to methodology and encoding rules'. Journal of Chemical Information and Modeling. 28 (1): 31-6.     Weininger D, Weininger A, Weininger JL (May 1989).    'SMILES. 2. Algorithm for generation of unique SMILES notation',    Journal of Chemical Information and Modeling. 29 (2): 97-101."),
+        ('cofactor_chem_comp_id', 'cofactor_chem_comp_id', None, 'The chemical component definition identifier for the cofactor.'),
+        ('cofactor_description', 'cofactor_description', None, 'The cofactor description.'),
+        ('cofactor_name', 'cofactor_name', None, 'The cofactor name.'),
+        ('cofactor_prd_id', 'cofactor_prd_id', None, 'The BIRD definition identifier for the cofactor.'),
+        ('cofactor_resource_id', 'cofactor_resource_id', None, 'Identifier for the cofactor assigned by the resource.'),
+        ('mechanism_of_action', 'mechanism_of_action', None, 'Mechanism of action describes the biochemical interaction through which the  cofactor produces a pharmacological effect.'),
+        ('neighbor_flag', 'neighbor_flag', None, 'A flag to indicate the cofactor is a structural neighbor of this  entity.'),
+        ('patent_nos', 'patent_nos', None, ''),
+        ('pubmed_ids', 'pubmed_ids', None, ''),
+        ('resource_name', 'resource_name', None, 'Resource providing target and cofactor data.'),
+        ('resource_version', 'resource_version', None, 'Version of the information distributed by the data resource.'),
+        ('target_resource_id', 'target_resource_id', None, 'Identifier for the target assigned by the resource.'),
+    )),
+    ('Attr_DrugbankContainerIdentifiers', '', (
+        ('drugbank_id', 'drugbank_id', None, 'The DrugBank accession code'),
+    )),
+    ('Attr_DrugProducts', '', (
+        ('approved', 'approved', None, 'Indicates whether this drug has been approved by the regulating government.'),
+        ('country', 'country', None, 'The country where this commercially available drug has been approved.'),
+        ('ended_marketing_on', 'ended_marketing_on', None, 'The ending date for market approval.'),
+        ('name', 'name', None, 'The proprietary name(s) provided by the manufacturer for any commercially available products containing this drug.'),
+        ('source', 'source', None, 'Source of this product information. For example, a value of DPD indicates this information was retrieved from the Canadian Drug Product Database.'),
+        ('started_marketing_on', 'started_marketing_on', None, 'The starting date for market approval.'),
+    )),
+    ('Attr_DrugbankInfo', '', (
+        ('affected_organisms', 'affected_organisms', None, ''),
+        ('atc_codes', 'atc_codes', None, ''),
+        ('brand_names', 'brand_names', None, ''),
+        ('cas_number', 'cas_number', None, 'The DrugBank assigned Chemical Abstracts Service identifier.'),
+        ('description', 'description', None, 'The DrugBank drug description.'),
+        ('drug_categories', 'drug_categories', None, ''),
+        ('drug_groups', 'drug_groups', None, ''),
+        ('drugbank_id', 'drugbank_id', None, 'The DrugBank accession code'),
+        ('indication', 'indication', None, 'The DrugBank drug indication.'),
+        ('mechanism_of_action', 'mechanism_of_action', None, 'The DrugBank drug mechanism of actions.'),
+        ('name', 'name', None, 'The DrugBank drug name.'),
+        ('pharmacology', 'pharmacology', None, 'The DrugBank drug pharmacology.'),
+        ('synonyms', 'synonyms', None, ''),
+        ('drug_products', 'drug_products', 251, ''),
+    )),
+    ('Attr_DrugbankTarget', '', (
+        ('interaction_type', 'interaction_type', None, 'The type of target interaction.'),
+        ('name', 'name', None, 'The target name.'),
+        ('ordinal', 'ordinal', None, 'The value of _drugbank_target.ordinal distinguishes  related examples for each chemical component.'),
+        ('organism_common_name', 'organism_common_name', None, 'The organism common name.'),
+        ('reference_database_accession_code', 'reference_database_accession_code', None, 'The reference identifier code for the target interaction reference.'),
+        ('reference_database_name', 'reference_database_name', None, 'The reference database name for the target interaction.'),
+        ('seq_one_letter_code', 'seq_one_letter_code', None, 'Target sequence expressed as string of one-letter amino acid codes.'),
+        ('target_actions', 'target_actions', None, ''),
+    )),
+    ('AttributesRoot', '', (
+        ('pdbx_entity_nonpoly', 'pdbx_entity_nonpoly', 0, ''),
+        ('rcsb_latest_revision', 'rcsb_latest_revision', 1, ''),
+        ('rcsb_nonpolymer_entity', 'rcsb_nonpolymer_entity', 2, ''),
+        ('rcsb_nonpolymer_entity_annotation', 'rcsb_nonpolymer_entity_annotation', 4, ''),
+        ('rcsb_nonpolymer_entity_container_identifiers', 'rcsb_nonpolymer_entity_container_identifiers', 5, ''),
+        ('rcsb_nonpolymer_entity_feature', 'rcsb_nonpolymer_entity_feature', 7, ''),
+        ('rcsb_nonpolymer_entity_feature_summary', 'rcsb_nonpolymer_entity_feature_summary', 8, ''),
+        ('rcsb_nonpolymer_entity_keywords', 'rcsb_nonpolymer_entity_keywords', 9, ''),
+        ('rcsb_nonpolymer_entity_name_com', 'rcsb_nonpolymer_entity_name_com', 10, ''),
+        ('rcsb_id', 'rcsb_id', None, 'A unique identifier for each object in this entity container formed by  an underscore separated concatenation of entry and entity identifiers.'),
+        ('chem_comp', 'chem_comp', 11, ''),
+        ('pdbx_chem_comp_audit', 'pdbx_chem_comp_audit', 12, ''),
+        ('pdbx_chem_comp_descriptor', 'pdbx_chem_comp_descriptor', 13, ''),
+        ('pdbx_chem_comp_feature', 'pdbx_chem_comp_feature', 14, ''),
+        ('pdbx_chem_comp_identifier', 'pdbx_chem_comp_identifier', 15, ''),
+        ('pdbx_family_prd_audit', 'pdbx_family_prd_audit', 16, ''),
+        ('pdbx_prd_audit', 'pdbx_prd_audit', 17, ''),
+        ('pdbx_reference_entity_list', 'pdbx_reference_entity_list', 18, ''),
+        ('pdbx_reference_entity_poly', 'pdbx_reference_entity_poly', 19, ''),
+        ('pdbx_reference_entity_poly_link', 'pdbx_reference_entity_poly_link', 20, ''),
+        ('pdbx_reference_entity_poly_seq', 'pdbx_reference_entity_poly_seq', 21, ''),
+        ('pdbx_reference_entity_sequence', 'pdbx_reference_entity_sequence', 22, ''),
+        ('pdbx_reference_entity_src_nat', 'pdbx_reference_entity_src_nat', 23, ''),
+        ('pdbx_reference_molecule', 'pdbx_reference_molecule', 24, ''),
+        ('pdbx_reference_molecule_annotation', 'pdbx_reference_molecule_annotation', 25, ''),
+        ('pdbx_reference_molecule_details', 'pdbx_reference_molecule_details', 26, ''),
+        ('pdbx_reference_molecule_family', 'pdbx_reference_molecule_family', 27, ''),
+        ('pdbx_reference_molecule_features', 'pdbx_reference_molecule_features', 28, ''),
+        ('pdbx_reference_molecule_list', 'pdbx_reference_molecule_list', 29, ''),
+        ('pdbx_reference_molecule_related_structures', 'pdbx_reference_molecule_related_structures', 30, ''),
+        ('pdbx_reference_molecule_synonyms', 'pdbx_reference_molecule_synonyms', 31, ''),
+        ('rcsb_bird_citation', 'rcsb_bird_citation', 32, ''),
+        ('rcsb_chem_comp_annotation', 'rcsb_chem_comp_annotation', 33, ''),
+        ('rcsb_chem_comp_container_identifiers', 'rcsb_chem_comp_container_identifiers', 34, ''),
+        ('rcsb_chem_comp_descriptor', 'rcsb_chem_comp_descriptor', 35, ''),
+        ('rcsb_chem_comp_info', 'rcsb_chem_comp_info', 36, ''),
+        ('rcsb_chem_comp_related', 'rcsb_chem_comp_related', 37, ''),
+        ('rcsb_chem_comp_synonyms', 'rcsb_chem_comp_synonyms', 38, ''),
+        ('rcsb_chem_comp_target', 'rcsb_chem_comp_target', 39, ''),
+        ('rcsb_schema_container_identifiers', 'rcsb_schema_container_identifiers', 40, ''),
+        ('pdbx_struct_assembly', 'pdbx_struct_assembly', 41, ''),
+        ('pdbx_struct_assembly_auth_evidence', 'pdbx_struct_assembly_auth_evidence', 42, ''),
+        ('pdbx_struct_assembly_gen', 'pdbx_struct_assembly_gen', 43, ''),
+        ('pdbx_struct_assembly_prop', 'pdbx_struct_assembly_prop', 44, ''),
+        ('pdbx_struct_oper_list', 'pdbx_struct_oper_list', 45, ''),
+        ('rcsb_assembly_annotation', 'rcsb_assembly_annotation', 46, ''),
+        ('rcsb_assembly_container_identifiers', 'rcsb_assembly_container_identifiers', 47, ''),
+        ('rcsb_assembly_feature', 'rcsb_assembly_feature', 49, ''),
+        ('rcsb_assembly_info', 'rcsb_assembly_info', 50, ''),
+        ('rcsb_struct_symmetry', 'rcsb_struct_symmetry', 54, ''),
+        ('rcsb_struct_symmetry_lineage', 'rcsb_struct_symmetry_lineage', 55, ''),
+        ('rcsb_struct_symmetry_provenance_code', 'rcsb_struct_symmetry_provenance_code', None, 'The title and version of software package used for symmetry calculations.'),
+        ('rcsb_repository_holdings_current', 'rcsb_repository_holdings_current', 56, ''),
+        ('rcsb_repository_holdings_current_entry_container_identifiers', 'rcsb_repository_holdings_current_entry_container_identifiers', 57, ''),
+        ('pdbx_struct_special_symmetry', 'pdbx_struct_special_symmetry', 58, ''),
+        ('pdbx_vrpt_summary_entity_fit_to_map', 'pdbx_vrpt_summary_entity_fit_to_map', 59, ''),
+        ('pdbx_vrpt_summary_entity_geometry', 'pdbx_vrpt_summary_entity_geometry', 60, ''),
+        ('rcsb_nonpolymer_entity_instance_container_identifiers', 'rcsb_nonpolymer_entity_instance_container_identifiers', 61, ''),
+        ('rcsb_nonpolymer_instance_annotation', 'rcsb_nonpolymer_instance_annotation', 62, ''),
+        ('rcsb_nonpolymer_instance_feature', 'rcsb_nonpolymer_instance_feature', 64, ''),
+        ('rcsb_nonpolymer_instance_feature_summary', 'rcsb_nonpolymer_instance_feature_summary', 65, ''),
+        ('rcsb_nonpolymer_instance_validation_score', 'rcsb_nonpolymer_instance_validation_score', 66, ''),
+        ('rcsb_nonpolymer_struct_conn', 'rcsb_nonpolymer_struct_conn', 69, ''),
+        ('rcsb_target_neighbors', 'rcsb_target_neighbors', 70, ''),
+        ('struct_asym', 'struct_asym', 71, ''),
+        ('rcsb_uniprot_container_identifiers', 'rcsb_uniprot_container_identifiers', 73, ''),
+        ('rcsb_uniprot_accession', 'rcsb_uniprot_accession', None, 'List of UniProtKB accession numbers where original accession numbers are retained as ‘secondary’ accession numbers.'),
+        ('rcsb_uniprot_entry_name', 'rcsb_uniprot_entry_name', None, 'A list of unique identifiers (former IDs), often containing biologically relevant information.'),
+        ('rcsb_uniprot_keyword', 'rcsb_uniprot_keyword', 74, 'Keywords constitute a controlled vocabulary that summarises the content of a UniProtKB entry.'),
+        ('rcsb_uniprot_protein', 'rcsb_uniprot_protein', 81, ''),
+        ('rcsb_uniprot_feature', 'rcsb_uniprot_feature', 83, ''),
+        ('rcsb_uniprot_annotation', 'rcsb_uniprot_annotation', 85, ''),
+        ('rcsb_uniprot_external_reference', 'rcsb_uniprot_external_reference', 86, ''),
+        ('rcsb_uniprot_alignments', 'rcsb_uniprot_alignments', 91, 'UniProt pairwise sequence alignments.'),
+        ('rcsb_branched_entity_instance_container_identifiers', 'rcsb_branched_entity_instance_container_identifiers', 92, ''),
+        ('rcsb_branched_instance_annotation', 'rcsb_branched_instance_annotation', 93, ''),
+        ('rcsb_branched_instance_feature', 'rcsb_branched_instance_feature', 95, ''),
+        ('rcsb_branched_instance_feature_summary', 'rcsb_branched_instance_feature_summary', 96, ''),
+        ('rcsb_branched_struct_conn', 'rcsb_branched_struct_conn', 99, ''),
+        ('rcsb_ligand_neighbors', 'rcsb_ligand_neighbors', 100, ''),
+        ('pdbx_entity_branch', 'pdbx_entity_branch', 101, ''),
+        ('pdbx_entity_branch_descriptor', 'pdbx_entity_branch_descriptor', 102, ''),
+        ('rcsb_branched_entity', 'rcsb_branched_entity', 103, ''),
+        ('rcsb_branched_entity_annotation', 'rcsb_branched_entity_annotation', 33, ''),
+        ('rcsb_branched_entity_container_identifiers', 'rcsb_branched_entity_container_identifiers', 105, ''),
+        ('rcsb_branched_entity_feature', 'rcsb_branched_entity_feature', 107, ''),
+        ('rcsb_branched_entity_feature_summary', 'rcsb_branched_entity_feature_summary', 96, ''),
+        ('rcsb_branched_entity_keywords', 'rcsb_branched_entity_keywords', 108, ''),
+        ('rcsb_branched_entity_name_com', 'rcsb_branched_entity_name_com', 109, ''),
+        ('rcsb_branched_entity_name_sys', 'rcsb_branched_entity_name_sys', 110, ''),
+        ('rcsb_polymer_entity_instance_container_identifiers', 'rcsb_polymer_entity_instance_container_identifiers', 111, ''),
+        ('rcsb_polymer_instance_annotation', 'rcsb_polymer_instance_annotation', 112, ''),
+        ('rcsb_polymer_instance_feature', 'rcsb_polymer_instance_feature', 114, ''),
+        ('rcsb_polymer_instance_feature_summary', 'rcsb_polymer_instance_feature_summary', 115, ''),
+        ('rcsb_polymer_instance_info', 'rcsb_polymer_instance_info', 116, ''),
+        ('rcsb_polymer_struct_conn', 'rcsb_polymer_struct_conn', 119, ''),
+        ('audit_author', 'audit_author', 120, ''),
+        ('cell', 'cell', 121, ''),
+        ('citation', 'citation', 122, ''),
+        ('database_2', 'database_2', 123, ''),
+        ('diffrn', 'diffrn', 124, ''),
+        ('diffrn_detector', 'diffrn_detector', 125, ''),
+        ('diffrn_radiation', 'diffrn_radiation', 126, ''),
+        ('diffrn_source', 'diffrn_source', 127, ''),
+        ('em_2d_crystal_entity', 'em_2d_crystal_entity', 128, ''),
+        ('em_3d_crystal_entity', 'em_3d_crystal_entity', 129, ''),
+        ('em_3d_fitting', 'em_3d_fitting', 130, ''),
+        ('em_3d_fitting_list', 'em_3d_fitting_list', 131, ''),
+        ('em_3d_reconstruction', 'em_3d_reconstruction', 132, ''),
+        ('em_ctf_correction', 'em_ctf_correction', 133, ''),
+        ('em_diffraction', 'em_diffraction', 134, ''),
+        ('em_diffraction_shell', 'em_diffraction_shell', 135, ''),
+        ('em_diffraction_stats', 'em_diffraction_stats', 136, ''),
+        ('em_embedding', 'em_embedding', 137, ''),
+        ('em_entity_assembly', 'em_entity_assembly', 138, ''),
+        ('em_experiment', 'em_experiment', 139, ''),
+        ('em_helical_entity', 'em_helical_entity', 140, ''),
+        ('em_image_recording', 'em_image_recording', 141, ''),
+        ('em_imaging', 'em_imaging', 142, ''),
+        ('em_particle_selection', 'em_particle_selection', 143, ''),
+        ('em_single_particle_entity', 'em_single_particle_entity', 144, ''),
+        ('em_software', 'em_software', 145, ''),
+        ('em_specimen', 'em_specimen', 146, ''),
+        ('em_staining', 'em_staining', 147, ''),
+        ('em_vitrification', 'em_vitrification', 148, ''),
+        ('entry', 'entry', 149, ''),
+        ('exptl', 'exptl', 150, ''),
+        ('exptl_crystal', 'exptl_crystal', 151, ''),
+        ('exptl_crystal_grow', 'exptl_crystal_grow', 152, ''),
+        ('ihm_entry_collection_mapping', 'ihm_entry_collection_mapping', 153, ''),
+        ('ihm_external_reference_info', 'ihm_external_reference_info', 154, ''),
+        ('ma_data', 'ma_data', 155, ''),
+        ('pdbx_SG_project', 'pdbx_SG_project', 156, ''),
+        ('pdbx_audit_revision_category', 'pdbx_audit_revision_category', 157, ''),
+        ('pdbx_audit_revision_details', 'pdbx_audit_revision_details', 158, ''),
+        ('pdbx_audit_revision_group', 'pdbx_audit_revision_group', 159, ''),
+        ('pdbx_audit_revision_history', 'pdbx_audit_revision_history', 160, ''),
+        ('pdbx_audit_revision_item', 'pdbx_audit_revision_item', 161, ''),
+        ('pdbx_audit_support', 'pdbx_audit_support', 162, ''),
+        ('pdbx_database_PDB_obs_spr', 'pdbx_database_PDB_obs_spr', 163, ''),
+        ('pdbx_database_related', 'pdbx_database_related', 164, ''),
+        ('pdbx_database_status', 'pdbx_database_status', 165, ''),
+        ('pdbx_deposit_group', 'pdbx_deposit_group', 166, ''),
+        ('pdbx_initial_refinement_model', 'pdbx_initial_refinement_model', 167, ''),
+        ('pdbx_molecule_features', 'pdbx_molecule_features', 168, ''),
+        ('pdbx_nmr_details', 'pdbx_nmr_details', 169, ''),
+        ('pdbx_nmr_ensemble', 'pdbx_nmr_ensemble', 170, ''),
+        ('pdbx_nmr_exptl', 'pdbx_nmr_exptl', 171, ''),
+        ('pdbx_nmr_exptl_sample_conditions', 'pdbx_nmr_exptl_sample_conditions', 172, ''),
+        ('pdbx_nmr_refine', 'pdbx_nmr_refine', 173, ''),
+        ('pdbx_nmr_representative', 'pdbx_nmr_representative', 174, ''),
+        ('pdbx_nmr_sample_details', 'pdbx_nmr_sample_details', 175, ''),
+        ('pdbx_nmr_software', 'pdbx_nmr_software', 176, ''),
+        ('pdbx_nmr_spectrometer', 'pdbx_nmr_spectrometer', 177, ''),
+        ('pdbx_reflns_twin', 'pdbx_reflns_twin', 178, ''),
+        ('pdbx_related_exp_data_set', 'pdbx_related_exp_data_set', 179, ''),
+        ('pdbx_serial_crystallography_data_reduction', 'pdbx_serial_crystallography_data_reduction', 180, ''),
+        ('pdbx_serial_crystallography_measurement', 'pdbx_serial_crystallography_measurement', 181, ''),
+        ('pdbx_serial_crystallography_sample_delivery', 'pdbx_serial_crystallography_sample_delivery', 182, ''),
+        ('pdbx_serial_crystallography_sample_delivery_fixed_target', 'pdbx_serial_crystallography_sample_delivery_fixed_target', 183, ''),
+        ('pdbx_serial_crystallography_sample_delivery_injection', 'pdbx_serial_crystallography_sample_delivery_injection', 184, ''),
+        ('pdbx_soln_scatter', 'pdbx_soln_scatter', 185, ''),
+        ('pdbx_soln_scatter_model', 'pdbx_soln_scatter_model', 186, ''),
+        ('pdbx_vrpt_summary', 'pdbx_vrpt_summary', 187, ''),
+        ('pdbx_vrpt_summary_diffraction', 'pdbx_vrpt_summary_diffraction', 188, ''),
+        ('pdbx_vrpt_summary_em', 'pdbx_vrpt_summary_em', 189, ''),
+        ('pdbx_vrpt_summary_geometry', 'pdbx_vrpt_summary_geometry', 190, ''),
+        ('pdbx_vrpt_summary_nmr', 'pdbx_vrpt_summary_nmr', 191, ''),
+        ('rcsb_accession_info', 'rcsb_accession_info', 192, ''),
+        ('rcsb_binding_affinity', 'rcsb_binding_affinity', 193, ''),
+        ('rcsb_comp_model_provenance', 'rcsb_comp_model_provenance', 194, ''),
+        ('rcsb_entry_container_identifiers', 'rcsb_entry_container_identifiers', 195, ''),
+        ('rcsb_entry_group_membership', 'rcsb_entry_group_membership', 196, ''),
+        ('rcsb_entry_info', 'rcsb_entry_info', 198, ''),
+        ('rcsb_external_references', 'rcsb_external_references', 199, ''),
+        ('rcsb_ihm_dataset_list', 'rcsb_ihm_dataset_list', 200, ''),
+        ('rcsb_ihm_dataset_source_db_reference', 'rcsb_ihm_dataset_source_db_reference', 201, ''),
+        ('rcsb_ma_qa_metric_global', 'rcsb_ma_qa_metric_global', 203, ''),
+        ('rcsb_primary_citation', 'rcsb_primary_citation', 204, ''),
+        ('refine', 'refine', 205, ''),
+        ('refine_analyze', 'refine_analyze', 206, ''),
+        ('refine_hist', 'refine_hist', 207, ''),
+        ('refine_ls_restr', 'refine_ls_restr', 208, ''),
+        ('reflns', 'reflns', 209, ''),
+        ('reflns_shell', 'reflns_shell', 210, ''),
+        ('software', 'software', 211, ''),
+        ('struct', 'struct', 212, ''),
+        ('struct_keywords', 'struct_keywords', 213, ''),
+        ('symmetry', 'symmetry', 214, ''),
+        ('rcsb_pubmed_container_identifiers', 'rcsb_pubmed_container_identifiers', 215, ''),
+        ('rcsb_pubmed_central_id', 'rcsb_pubmed_central_id', None, 'Unique integer value assigned to each PubMed Central record.'),
+        ('rcsb_pubmed_doi', 'rcsb_pubmed_doi', None, 'Persistent identifier used to provide a link to an article location on the Internet.'),
+        ('rcsb_pubmed_abstract_text', 'rcsb_pubmed_abstract_text', None, 'A concise, accurate and factual mini-version of the paper contents.'),
+        ('rcsb_pubmed_affiliation_info', 'rcsb_pubmed_affiliation_info', None, 'The institution(s) that the author is affiliated with. Multiple affiliations per author are allowed.'),
+        ('rcsb_pubmed_mesh_descriptors', 'rcsb_pubmed_mesh_descriptors', None, 'NLM controlled vocabulary, Medical Subject Headings (MeSH), is used to characterize the content of the articles represented by MEDLINE citations.'),
+        ('rcsb_pubmed_mesh_descriptors_lineage', 'rcsb_pubmed_mesh_descriptors_lineage', 216, 'Members of the MeSH classification lineage.'),
+        ('entity_poly', 'entity_poly', 217, ''),
+        ('entity_src_gen', 'entity_src_gen', 218, ''),
+        ('entity_src_nat', 'entity_src_nat', 219, ''),
+        ('pdbx_entity_src_syn', 'pdbx_entity_src_syn', 220, ''),
+        ('rcsb_cluster_flexibility', 'rcsb_cluster_flexibility', 221, ''),
+        ('rcsb_cluster_membership', 'rcsb_cluster_membership', 222, ''),
+        ('rcsb_entity_host_organism', 'rcsb_entity_host_organism', 224, ''),
+        ('rcsb_entity_source_organism', 'rcsb_entity_source_organism', 227, ''),
+        ('rcsb_genomic_lineage', 'rcsb_genomic_lineage', 228, ''),
+        ('rcsb_membrane_lineage', 'rcsb_membrane_lineage', 229, ''),
+        ('rcsb_polymer_entity', 'rcsb_polymer_entity', 234, ''),
+        ('rcsb_polymer_entity_align', 'rcsb_polymer_entity_align', 236, ''),
+        ('rcsb_polymer_entity_annotation', 'rcsb_polymer_entity_annotation', 237, ''),
+        ('rcsb_polymer_entity_container_identifiers', 'rcsb_polymer_entity_container_identifiers', 239, ''),
+        ('rcsb_polymer_entity_feature', 'rcsb_polymer_entity_feature', 241, ''),
+        ('rcsb_polymer_entity_feature_summary', 'rcsb_polymer_entity_feature_summary', 242, ''),
+        ('rcsb_polymer_entity_group_membership', 'rcsb_polymer_entity_group_membership', 243, ''),
+        ('rcsb_polymer_entity_keywords', 'rcsb_polymer_entity_keywords', 244, ''),
+        ('rcsb_polymer_entity_name_com', 'rcsb_polymer_entity_name_com', 245, ''),
+        ('rcsb_polymer_entity_name_sys', 'rcsb_polymer_entity_name_sys', 246, ''),
+        ('rcsb_related_target_references', 'rcsb_related_target_references', 248, ''),
+        ('rcsb_target_cofactors', 'rcsb_target_cofactors', 249, ''),
+        ('rcsb_membrane_lineage_provenance_code', 'rcsb_membrane_lineage_provenance_code', None, 'Mpstruc keyword denotes original annotation, Homology keyword denotes annotation inferred by homology.'),
+        ('drugbank_container_identifiers', 'drugbank_container_identifiers', 250, ''),
+        ('drugbank_info', 'drugbank_info', 252, ''),
+        ('drugbank_target', 'drugbank_target', 253, ''),
+    )),
+)
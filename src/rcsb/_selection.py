@@ -0,0 +1,102 @@
+import json
+
+
+def selection_of(node) -> dict:
+    """Selection set below a `QueryNode`.
+
+    A selection is a JSON-serializable dict mapping a field name to
+    `[arguments, children]`, where `arguments` is a dict (or `None`) and
+    `children` is a nested selection (or `None` for scalar fields).
+    """
+    selection = {}
+    for child in node._children:
+        children = selection_of(child) if child._children else None
+        if children == {}: # ghost object node, not rendered
+            continue
+        selection[child._name] = [dict(child._arguments) or None, children]
+    return selection
+
+
+def missing_selection(have: dict, need: dict) -> dict:
+    """Part of `need` not covered by `have`. Empty when `have` is a superset."""
+    missing = {}
+    for name, (args, children) in need.items():
+        if name not in have or have[name][0] != args:
+            missing[name] = [args, children]
+            continue
+        have_children = have[name][1]
+        if children is None or have_children is None:
+            if (children is None) != (have_children is None):
+                missing[name] = [args, children]
+            continue
+        sub = missing_selection(have_children, children)
+        if sub:
+            missing[name] = [args, sub]
+    return missing
+
+
+def merge_selection(a: dict, b: dict) -> dict:
+    """Union of two selections; `b` wins where arguments disagree."""
+    merged = dict(a)
+    for name, (args, children) in b.items():
+        if name in merged and merged[name][0] == args and merged[name][1] is not None and children is not None:
+            merged[name] = [args, merge_selection(merged[name][1], children)]
+        else:
+            merged[name] = [args, children]
+    return merged
+
+
+def project(value, selection: dict):
+    """Keep only the fields of `selection` in a response value."""
+    if isinstance(value, list):
+        return [project(item, selection) for item in value]
+    if not isinstance(value, dict):
+        return value
+    projected = {}
+    for name, (_, children) in selection.items():
+        if name not in value:
+            continue
+        projected[name] = value[name] if children is None else project(value[name], children)
+    return projected
+
+
+def merge_values(a, b):
+    """Deep merge response `b` into `a`. Lists of objects are merged by position."""
+    if isinstance(a, dict) and isinstance(b, dict):
+        merged = dict(a)
+        for key, value in b.items():
+            merged[key] = merge_values(a[key], value) if key in a else value
+        return merged
+    if isinstance(a, list) and isinstance(b, list) and len(a) == len(b):
+        return [merge_values(x, y) for x, y in zip(a, b)]
+    return b
+
+
+def merge_by_id(responses: list) -> list:
+    """Deep merge the entry lists of queries covering disjoint parts of one selection,
+    matching entries on `rcsb_id`. Entries are returned in first-seen order."""
+    merged = {}
+    for entries in responses:
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict) or entry.get("rcsb_id") is None:
+                continue
+            key = str(entry["rcsb_id"]).upper()
+            merged[key] = merge_values(merged[key], entry) if key in merged else entry
+    return list(merged.values())
+
+
+def build_node(node, selection: dict, leaf_class=None):
+    """Add `selection` below `node` using children of `node`'s type.
+    Scalar fields use `leaf_class` when given."""
+    for name, (args, children) in selection.items():
+        if children is None and leaf_class is not None:
+            node._enter(name, leaf_class, **(args or {}))
+            continue
+        child = node._enter(name, type(node), **(args or {}))
+        if children:
+            build_node(child, children, leaf_class)
+    return node
+
+
+def selection_key(selection: dict) -> str:
+    return json.dumps(selection, sort_keys=True, separators=(",", ":"))
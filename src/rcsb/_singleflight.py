@@ -0,0 +1,66 @@
+import threading
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one call.
+
+    The first caller for a key runs `fn`; callers arriving while it is still
+    running wait for it and receive the same result (or exception).
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key: str, fn):
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                from concurrent.futures import Future # deferred like requests and asyncio
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """Asyncio counterpart of `SingleFlight` for tasks on one event loop.
+
+    The shared call runs as its own task, which every caller awaits through
+    `asyncio.shield`, so cancelling one caller (e.g. an `asyncio.wait_for`
+    timeout) never cancels the others. The task is only cancelled once no
+    caller is waiting for it any more.
+    """
+    def __init__(self):
+        self._calls = {} # key -> [task, number of waiting callers]
+
+    async def do(self, key: str, coro_fn):
+        import asyncio
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = [asyncio.ensure_future(coro_fn()), 0]
+
+            def forget(_, call=call):
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+
+            call[0].add_done_callback(forget)
+        task = call[0]
+        call[1] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            call[1] -= 1
+            if call[1] == 0 and not task.done():
+                task.cancel() # every caller was cancelled
@@ -0,0 +1,116 @@
+import difflib
+
+ROOT_TYPE = "Query"
+
+# Python types accepted for literal arguments of the built-in GraphQL scalars.
+# Custom scalars and enums are not checked.
+LITERAL_TYPES = {
+    "String": str,
+    "ID": (str, int),
+    "Int": int,
+    "Float": (int, float),
+    "Boolean": bool,
+}
+
+_field_index = {} # type name -> {field name: target type, or None for scalars}
+
+
+def _fields(type_name: str) -> dict:
+    index = _field_index.get(type_name)
+    if index is None:
+        from ._data_schema import TYPES
+        index = _field_index[type_name] = {f_name: f_target for f_name, f_target, _, _ in TYPES[type_name][1]}
+    return index
+
+
+def _arguments(type_name: str, field: str) -> dict:
+    from ._data_schema import ARGUMENTS
+    return ARGUMENTS.get(type_name, {}).get(field, {})
+
+
+def literal_matches(value, gql_type: str) -> bool:
+    """Whether a Python literal can be sent as an argument of `gql_type`."""
+    non_null = gql_type.endswith("!")
+    base = gql_type[:-1] if non_null else gql_type
+    if value is None:
+        return not non_null
+    if base.startswith("["):
+        inner = base[1:-1]
+        if not isinstance(value, (list, tuple)):
+            return literal_matches(value, inner) # GraphQL coerces a single value to a list
+        return all(literal_matches(v, inner) for v in value)
+    expected = LITERAL_TYPES.get(base)
+    if expected is None:
+        return True
+    if isinstance(value, bool) and base != "Boolean":
+        return False
+    return isinstance(value, expected)
+
+
+def _suggest(name: str, options) -> str:
+    close = difflib.get_close_matches(name, list(options), n=1)
+    return f" (did you mean '{close[0]}'?)" if close else ""
+
+
+def _has_selection(node) -> bool:
+    """Whether an object node renders at least one field (ghost nodes render nothing)."""
+    return any(not child._children or _has_selection(child) for child in node._children)
+
+
+def query_errors(root, variables: dict) -> list:
+    """Problems with the query tree under `root`, checked against the bundled
+    schema: unknown fields and arguments, argument types, missing required
+    arguments, undeclared variables and variable types, and object fields
+    without a subselection.
+
+    Args:
+        - root: Root `QueryNode` of the tree.
+        - variables: Declared GraphQL variable types, as returned by `QueryNode._variables()`.
+    """
+    errors = []
+
+    def walk(node, type_name: str, path: str):
+        fields = _fields(type_name)
+        for child in node._children:
+            name = child._name
+            where = f"{path}.{name}" if path else name
+            if name not in fields:
+                errors.append(f"{where}: unknown field on {type_name}{_suggest(name, fields)}")
+                continue
+
+            expected = _arguments(type_name, name)
+            for arg, value in child._arguments.items():
+                if arg not in expected:
+                    errors.append(f"{where}: unknown argument '{arg}'{_suggest(arg, expected)}")
+                    continue
+                gql_type = expected[arg][0]
+                if isinstance(value, str) and value.startswith("$"):
+                    declared = variables.get(value[1:])
+                    if declared is None: # only arguments of root fields declare variables
+                        errors.append(f"{where}: variable {value} is not declared; pass '{arg}' as a literal")
+                    elif declared.replace(" ", "") != gql_type:
+                        errors.append(f"{where}: variable {value} is declared as {declared} but '{arg}' expects {gql_type}")
+                elif not literal_matches(value, gql_type):
+                    errors.append(f"{where}: argument '{arg}' expects {gql_type}, got {value!r}")
+            for arg, (gql_type, required) in expected.items():
+                if required and arg not in child._arguments:
+                    errors.append(f"{where}: missing required argument '{arg}: {gql_type}'")
+
+            target = fields[name]
+            if target is None:
+                if child._children:
+                    errors.append(f"{where}: scalar field cannot have subfields")
+            elif not _has_selection(child):
+                errors.append(f"{where}: object field {target} needs at least one subfield")
+            else:
+                walk(child, target, where)
+
+    walk(root, ROOT_TYPE, "")
+    return errors
+
+
+def validate_query(root, variables: dict):
+    """Raise `ValueError` listing every problem `query_errors` finds."""
+    errors = query_errors(root, variables)
+    if errors:
+        raise ValueError("Invalid query:\n  - " + "\n  - ".join(errors))
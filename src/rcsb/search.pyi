@@ -0,0 +1,7203 @@
+# NOTE: This file is auto-generated by _code_generation/rcsb_search_classes.py. Do not edit directly.
+# Type stub for `rcsb.search`: the attribute tree is built lazily at runtime from `_search_schema.SHAPES`.
+from ._search import (
+    Attribute as Attribute,
+    AttributeField as AttributeField,
+    AttributeGroup as AttributeGroup,
+    ChemicalQuery as ChemicalQuery,
+    FullTextQuery as FullTextQuery,
+    GroupNode as GroupNode,
+    MotifQuery as MotifQuery,
+    SearchNode as SearchNode,
+    SearchRequest as SearchRequest,
+    SequenceQuery as SequenceQuery,
+    StructureMotifQuery as StructureMotifQuery,
+    TerminalNode as TerminalNode,
+)
+
+# --- Generated Classes ---
+
+
+class Attr_PdbxEntityNonpoly(AttributeGroup):
+    """"""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """This data item is a pointer to _chem_comp.id in the CHEM_COMP category."""
+    @property
+    def entity_id(self) -> 'Attribute':
+        """This data item is a pointer to _entity.id in the ENTITY category."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name for the non-polymer entity"""
+    @property
+    def rcsb_prd_id(self) -> 'Attribute':
+        """For non-polymer BIRD molecules the BIRD identifier for the entity."""
+
+class Attr_RcsbLatestRevision(AttributeGroup):
+    """"""
+    @property
+    def major_revision(self) -> 'Attribute':
+        """The major version number of the latest revision."""
+    @property
+    def minor_revision(self) -> 'Attribute':
+        """The minor version number of the latest revision."""
+    @property
+    def revision_date(self) -> 'Attribute':
+        """The release date of the latest revision item."""
+
+class Attr_RcsbNonpolymerEntity(AttributeGroup):
+    """"""
+    @property
+    def details(self) -> 'Attribute':
+        """A description of special aspects of the entity."""
+    @property
+    def formula_weight(self) -> 'Attribute':
+        """Formula mass (KDa) of the entity."""
+    @property
+    def pdbx_description(self) -> 'Attribute':
+        """A description of the nonpolymer entity."""
+    @property
+    def pdbx_number_of_molecules(self) -> 'Attribute':
+        """The number of molecules of the nonpolymer entity in the entry."""
+
+class Attr_AnnotationLineage(AttributeGroup):
+    """"""
+    @property
+    def depth(self) -> 'Attribute':
+        """Members of the annotation lineage as parent lineage depth (1-N)"""
+    @property
+    def id(self) -> 'Attribute':
+        """Members of the annotation lineage as parent class identifiers."""
+    @property
+    def name(self) -> 'Attribute':
+        """Members of the annotation lineage as parent class names."""
+
+class Attr_RcsbNonpolymerEntityAnnotation(AttributeGroup):
+    """"""
+    @property
+    def annotation_id(self) -> 'Attribute':
+        """An identifier for the annotation."""
+    @property
+    def assignment_version(self) -> 'Attribute':
+        """Identifies the version of the annotation assignment."""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """Non-polymer(ligand) chemical component identifier for the entity."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description for the annotation."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name for the annotation."""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Code identifying the individual, organization or program that  assigned the annotation."""
+    @property
+    def type(self) -> 'Attribute':
+        """A type or category of the annotation."""
+    @property
+    def annotation_lineage(self) -> 'Attr_AnnotationLineage':
+        """"""
+
+class Attr_RcsbNonpolymerEntityContainerIdentifiers(AttributeGroup):
+    """"""
+    @property
+    def asym_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def auth_asym_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def chem_ref_def_id(self) -> 'Attribute':
+        """The chemical reference definition identifier for the entity in this container."""
+    @property
+    def entity_id(self) -> 'Attribute':
+        """Entity identifier for the container."""
+    @property
+    def entry_id(self) -> 'Attribute':
+        """Entry identifier for the container."""
+    @property
+    def nonpolymer_comp_id(self) -> 'Attribute':
+        """Non-polymer(ligand) chemical component identifier for the entity in this container."""
+    @property
+    def prd_id(self) -> 'Attribute':
+        """The BIRD identifier for the entity in this container."""
+    @property
+    def rcsb_id(self) -> 'Attribute':
+        """A unique identifier for each object in this entity container formed by  an underscore separated concatenation of entry and entity identifiers."""
+    @property
+    def reference_chemical_identifiers_provenance_source(self) -> 'Attribute':
+        """"""
+    @property
+    def reference_chemical_identifiers_resource_accession(self) -> 'Attribute':
+        """"""
+    @property
+    def reference_chemical_identifiers_resource_name(self) -> 'Attribute':
+        """"""
+
+class Attr_AdditionalProperties(AttributeGroup):
+    """"""
+    @property
+    def name(self) -> 'Attribute':
+        """The additional property name."""
+    @property
+    def values(self) -> 'Attribute':
+        """"""
+
+class Attr_RcsbNonpolymerEntityFeature(AttributeGroup):
+    """"""
+    @property
+    def assignment_version(self) -> 'Attribute':
+        """Identifies the version of the feature assignment."""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """Non-polymer(ligand) chemical component identifier for the entity."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description for the feature."""
+    @property
+    def feature_id(self) -> 'Attribute':
+        """An identifier for the feature."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name for the feature."""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Code identifying the individual, organization or program that  assigned the feature."""
+    @property
+    def type(self) -> 'Attribute':
+        """A type or category of the feature."""
+    @property
+    def value(self) -> 'Attribute':
+        """The feature value."""
+    @property
+    def additional_properties(self) -> 'Attr_AdditionalProperties':
+        """"""
+
+class Attr_RcsbNonpolymerEntityFeatureSummary(AttributeGroup):
+    """"""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """Non-polymer(ligand) chemical component identifier for the entity."""
+    @property
+    def count(self) -> 'Attribute':
+        """The feature count."""
+    @property
+    def maximum_length(self) -> 'Attribute':
+        """The maximum feature length."""
+    @property
+    def maximum_value(self) -> 'Attribute':
+        """The maximum feature value."""
+    @property
+    def minimum_length(self) -> 'Attribute':
+        """The minimum feature length."""
+    @property
+    def minimum_value(self) -> 'Attribute':
+        """The minimum feature value."""
+    @property
+    def type(self) -> 'Attribute':
+        """Type or category of the feature."""
+
+class Attr_RcsbNonpolymerEntityKeywords(AttributeGroup):
+    """"""
+    @property
+    def text(self) -> 'Attribute':
+        """Keywords describing this non-polymer entity."""
+
+class Attr_RcsbNonpolymerEntityNameCom(AttributeGroup):
+    """"""
+    @property
+    def name(self) -> 'Attribute':
+        """A common name for the nonpolymer entity."""
+
+class Attr_ChemComp(AttributeGroup):
+    """"""
+    @property
+    def formula(self) -> 'Attribute':
+        """The formula for the chemical component. Formulae are written  according to the following rules:   (1) Only recognized element symbols may be used.   (2) Each element symbol is followed by a 'count' number. A count     of '1' may be omitted.   (3) A space or parenthesis must separate each cluster of     (element symbol + count), but in general parentheses are     not used.   (4) The order of elements depends on whether carbon is     present or not. If carbon is present, the order should be:     C, then H, then the other elements in alphabetical order     of their symbol. If carbon is not present, the elements     are listed purely in alphabetic order of their symbol. This     is the 'Hill' system used by Chemical Abstracts."""
+    @property
+    def formula_weight(self) -> 'Attribute':
+        """Formula mass of the chemical component."""
+    @property
+    def id(self) -> 'Attribute':
+        """The value of _chem_comp.id must uniquely identify each item in  the CHEM_COMP list.   For protein polymer entities, this is the three-letter code for  the amino acid.   For nucleic acid polymer entities, this is the one-letter code  for the base."""
+    @property
+    def mon_nstd_parent_comp_id(self) -> 'Attribute':
+        """"""
+    @property
+    def name(self) -> 'Attribute':
+        """The full name of the component."""
+    @property
+    def one_letter_code(self) -> 'Attribute':
+        """For standard polymer components, the one-letter code for  the component.   For non-standard polymer components, the  one-letter code for parent component if this exists;  otherwise, the one-letter code should be given as 'X'.   Components that derived from multiple parents components  are described by a sequence of one-letter-codes."""
+    @property
+    def pdbx_ambiguous_flag(self) -> 'Attribute':
+        """A preliminary classification used by PDB to indicate  that the chemistry of this component while described  as clearly as possible is still ambiguous.  Software  tools may not be able to process this component  definition."""
+    @property
+    def pdbx_formal_charge(self) -> 'Attribute':
+        """The net integer charge assigned to this component. This is the  formal charge assignment normally found in chemical diagrams."""
+    @property
+    def pdbx_initial_date(self) -> 'Attribute':
+        """Date component was added to database."""
+    @property
+    def pdbx_modified_date(self) -> 'Attribute':
+        """Date component was last modified."""
+    @property
+    def pdbx_processing_site(self) -> 'Attribute':
+        """This data item identifies the deposition site that processed  this chemical component defintion."""
+    @property
+    def pdbx_release_status(self) -> 'Attribute':
+        """This data item holds the current release status for the component."""
+    @property
+    def pdbx_replaced_by(self) -> 'Attribute':
+        """Identifies the _chem_comp.id of the component that  has replaced this component."""
+    @property
+    def pdbx_replaces(self) -> 'Attribute':
+        """Identifies the _chem_comp.id's of the components  which have been replaced by this component.  Multiple id codes should be separated by commas."""
+    @property
+    def pdbx_subcomponent_list(self) -> 'Attribute':
+        """The list of subcomponents contained in this component."""
+    @property
+    def three_letter_code(self) -> 'Attribute':
+        """For standard polymer components, the common three-letter code for  the component.   Non-standard polymer components and non-polymer  components are also assigned three-letter-codes.   For ambiguous polymer components three-letter code should  be given as 'UNK'.  Ambiguous ions are assigned the code 'UNX'.  Ambiguous non-polymer components are assigned the code 'UNL'."""
+    @property
+    def type(self) -> 'Attribute':
+        """For standard polymer components, the type of the monomer.  Note that monomers that will form polymers are of three types:  linking monomers, monomers with some type of N-terminal (or 5')  cap and monomers with some type of C-terminal (or 3') cap."""
+
+class Attr_PdbxChemCompAudit(AttributeGroup):
+    """"""
+    @property
+    def action_type(self) -> 'Attribute':
+        """The action associated with this audit record."""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """This data item is a pointer to _chem_comp.id in the CHEM_COMP  category."""
+    @property
+    def date(self) -> 'Attribute':
+        """The date associated with this audit record."""
+    @property
+    def details(self) -> 'Attribute':
+        """Additional details decribing this change."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """This data item is an ordinal index for the  PDBX_CHEM_COMP_AUDIT category."""
+
+class Attr_PdbxChemCompDescriptor(AttributeGroup):
+    """"""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """This data item is a pointer to _chem_comp.id in the CHEM_COMP  category."""
+    @property
+    def descriptor(self) -> 'Attribute':
+        """This data item contains the descriptor value for this  component."""
+    @property
+    def program(self) -> 'Attribute':
+        """This data item contains the name of the program  or library used to compute the descriptor."""
+    @property
+    def program_version(self) -> 'Attribute':
+        """This data item contains the version of the program  or library used to compute the descriptor."""
+    @property
+    def type(self) -> 'Attribute':
+        """This data item contains the descriptor type."""
+
+class Attr_PdbxChemCompFeature(AttributeGroup):
+    """"""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """The component identifier for this feature."""
+    @property
+    def source(self) -> 'Attribute':
+        """The information source for the component feature."""
+    @property
+    def type(self) -> 'Attribute':
+        """The component feature type."""
+    @property
+    def value(self) -> 'Attribute':
+        """The component feature value."""
+
+class Attr_PdbxChemCompIdentifier(AttributeGroup):
+    """"""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """This data item is a pointer to _chem_comp.id in the CHEM_COMP  category."""
+    @property
+    def identifier(self) -> 'Attribute':
+        """This data item contains the identifier value for this  component."""
+    @property
+    def program(self) -> 'Attribute':
+        """This data item contains the name of the program  or library used to compute the identifier."""
+    @property
+    def program_version(self) -> 'Attribute':
+        """This data item contains the version of the program  or library used to compute the identifier."""
+    @property
+    def type(self) -> 'Attribute':
+        """This data item contains the identifier type."""
+
+class Attr_PdbxFamilyPrdAudit(AttributeGroup):
+    """"""
+    @property
+    def action_type(self) -> 'Attribute':
+        """The action associated with this audit record."""
+    @property
+    def annotator(self) -> 'Attribute':
+        """The initials of the annotator creating of modifying the family."""
+    @property
+    def date(self) -> 'Attribute':
+        """The date associated with this audit record."""
+    @property
+    def details(self) -> 'Attribute':
+        """Additional details decribing this change."""
+    @property
+    def family_prd_id(self) -> 'Attribute':
+        """This data item is a pointer to _pdbx_reference_molecule_family.family_prd_id in the 	       pdbx_reference_molecule category."""
+    @property
+    def processing_site(self) -> 'Attribute':
+        """An identifier for the wwPDB site creating or modifying the family."""
+
+class Attr_PdbxPrdAudit(AttributeGroup):
+    """"""
+    @property
+    def action_type(self) -> 'Attribute':
+        """The action associated with this audit record."""
+    @property
+    def annotator(self) -> 'Attribute':
+        """The initials of the annotator creating of modifying the molecule."""
+    @property
+    def date(self) -> 'Attribute':
+        """The date associated with this audit record."""
+    @property
+    def details(self) -> 'Attribute':
+        """Additional details decribing this change."""
+    @property
+    def prd_id(self) -> 'Attribute':
+        """This data item is a pointer to _pdbx_reference_molecule.prd_id in the 	       pdbx_reference_molecule category."""
+    @property
+    def processing_site(self) -> 'Attribute':
+        """An identifier for the wwPDB site creating or modifying the molecule."""
+
+class Attr_PdbxReferenceEntityList(AttributeGroup):
+    """"""
+    @property
+    def component_id(self) -> 'Attribute':
+        """The component number of this entity within the molecule."""
+    @property
+    def details(self) -> 'Attribute':
+        """Additional details about this entity."""
+    @property
+    def prd_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_entity_list.prd_id is a reference  _pdbx_reference_molecule.prd_id in the PDBX_REFERENCE_MOLECULE category."""
+    @property
+    def ref_entity_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_entity_list.ref_entity_id is a unique identifier  the a constituent entity within this reference molecule."""
+    @property
+    def type(self) -> 'Attribute':
+        """Defines the polymer characteristic of the entity."""
+
+class Attr_PdbxReferenceEntityPoly(AttributeGroup):
+    """"""
+    @property
+    def db_code(self) -> 'Attribute':
+        """The database code for this source information"""
+    @property
+    def db_name(self) -> 'Attribute':
+        """The database name for this source information"""
+    @property
+    def prd_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_entity_poly.prd_id is a reference 	       _pdbx_reference_entity_list.prd_id in the  PDBX_REFERENCE_ENTITY_LIST category."""
+    @property
+    def ref_entity_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_entity_poly.ref_entity_id is a reference  to _pdbx_reference_entity_list.ref_entity_id in PDBX_REFERENCE_ENTITY_LIST category."""
+    @property
+    def type(self) -> 'Attribute':
+        """The type of the polymer."""
+
+class Attr_PdbxReferenceEntityPolyLink(AttributeGroup):
+    """"""
+    @property
+    def atom_id_1(self) -> 'Attribute':
+        """The atom identifier/name in the first of the two components making  the linkage."""
+    @property
+    def atom_id_2(self) -> 'Attribute':
+        """The atom identifier/name in the second of the two components making  the linkage."""
+    @property
+    def comp_id_1(self) -> 'Attribute':
+        """The component identifier in the first of the two components making the  linkage.   This data item is a pointer to _pdbx_reference_entity_poly_seq.mon_id  in the PDBX_REFERENCE_ENTITY_POLY_SEQ category."""
+    @property
+    def comp_id_2(self) -> 'Attribute':
+        """The component identifier in the second of the two components making the  linkage.   This data item is a pointer to _pdbx_reference_entity_poly_seq.mon_id  in the PDBX_REFERENCE_ENTITY_POLY_SEQ category."""
+    @property
+    def component_id(self) -> 'Attribute':
+        """The entity component identifier entity containing the linkage."""
+    @property
+    def entity_seq_num_1(self) -> 'Attribute':
+        """For a polymer entity, the sequence number in the first of  the two components making the linkage.   This data item is a pointer to _pdbx_reference_entity_poly_seq.num  in the PDBX_REFERENCE_ENTITY_POLY_SEQ category."""
+    @property
+    def entity_seq_num_2(self) -> 'Attribute':
+        """For a polymer entity, the sequence number in the second of  the two components making the linkage.   This data item is a pointer to _pdbx_reference_entity_poly_seq.num  in the PDBX_REFERENCE_ENTITY_POLY_SEQ category."""
+    @property
+    def link_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_entity_poly_link.link_id uniquely identifies  a linkage within a polymer entity."""
+    @property
+    def prd_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_entity_poly_link.prd_id is a reference  _pdbx_reference_entity_list.prd_id in the PDBX_REFERENCE_ENTITY_POLY category."""
+    @property
+    def ref_entity_id(self) -> 'Attribute':
+        """The reference entity id of the polymer entity containing the linkage.   This data item is a pointer to _pdbx_reference_entity_poly.ref_entity_id  in the PDBX_REFERENCE_ENTITY_POLY category."""
+    @property
+    def value_order(self) -> 'Attribute':
+        """The bond order target for the non-standard linkage."""
+
+class Attr_PdbxReferenceEntityPolySeq(AttributeGroup):
+    """"""
+    @property
+    def hetero(self) -> 'Attribute':
+        """A flag to indicate that sequence heterogeneity at this monomer position."""
+    @property
+    def mon_id(self) -> 'Attribute':
+        """This data item is the chemical component identifier of monomer."""
+    @property
+    def num(self) -> 'Attribute':
+        """The value of _pdbx_reference_entity_poly_seq.num must uniquely and sequentially  identify a record in the PDBX_REFERENCE_ENTITY_POLY_SEQ list.   This value is conforms to author numbering conventions and does not map directly  to the numbering conventions used for _entity_poly_seq.num."""
+    @property
+    def observed(self) -> 'Attribute':
+        """A flag to indicate that this monomer is observed in the instance example."""
+    @property
+    def parent_mon_id(self) -> 'Attribute':
+        """This data item is the chemical component identifier for the parent component corresponding to this monomer."""
+    @property
+    def prd_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_entity_poly_seq.prd_id is a reference 	       _pdbx_reference_entity_poly.prd_id in the  PDBX_REFERENCE_ENTITY_POLY category."""
+    @property
+    def ref_entity_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_entity_poly_seq.ref_entity_id is a reference  to _pdbx_reference_entity_poly.ref_entity_id in PDBX_REFERENCE_ENTITY_POLY category."""
+
+class Attr_PdbxReferenceEntitySequence(AttributeGroup):
+    """"""
+    @property
+    def NRP_flag(self) -> 'Attribute':
+        """A flag to indicate a non-ribosomal entity."""
+    @property
+    def one_letter_codes(self) -> 'Attribute':
+        """The one-letter-code sequence for this entity.  Non-standard monomers are represented as 'X'."""
+    @property
+    def prd_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_entity_sequence.prd_id is a reference 	       _pdbx_reference_entity_list.prd_id in the  PDBX_REFERENCE_ENTITY_LIST category."""
+    @property
+    def ref_entity_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_entity_sequence.ref_entity_id is a reference  to _pdbx_reference_entity_list.ref_entity_id in PDBX_REFERENCE_ENTITY_LIST category."""
+    @property
+    def type(self) -> 'Attribute':
+        """The monomer type for the sequence."""
+
+class Attr_PdbxReferenceEntitySrcNat(AttributeGroup):
+    """"""
+    @property
+    def atcc(self) -> 'Attribute':
+        """The Americal Tissue Culture Collection code for organism from which the entity was isolated."""
+    @property
+    def db_code(self) -> 'Attribute':
+        """The database code for this source information"""
+    @property
+    def db_name(self) -> 'Attribute':
+        """The database name for this source information"""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """The value of _pdbx_reference_entity_src_nat.ordinal distinguishes 	       source details for this entity."""
+    @property
+    def organism_scientific(self) -> 'Attribute':
+        """The scientific name of the organism from which the entity was isolated."""
+    @property
+    def prd_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_entity_src_nat.prd_id is a reference 	       _pdbx_reference_entity_list.prd_id in the  PDBX_REFERENCE_ENTITY_LIST category."""
+    @property
+    def ref_entity_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_entity_src_nat.ref_entity_id is a reference  to _pdbx_reference_entity_list.ref_entity_id in PDBX_REFERENCE_ENTITY_LIST category."""
+    @property
+    def source(self) -> 'Attribute':
+        """The data source for this information."""
+    @property
+    def source_id(self) -> 'Attribute':
+        """A identifier within the data source for this information."""
+    @property
+    def taxid(self) -> 'Attribute':
+        """The NCBI TaxId of the organism from which the entity was isolated."""
+
+class Attr_PdbxReferenceMolecule(AttributeGroup):
+    """"""
+    @property
+    def chem_comp_id(self) -> 'Attribute':
+        """For entities represented as single molecules, the identifier  corresponding to the chemical definition for the molecule."""
+    @property
+    def class_(self) -> 'Attribute':
+        """Broadly defines the function of the entity."""
+    @property
+    def class_evidence_code(self) -> 'Attribute':
+        """Evidence for the assignment of _pdbx_reference_molecule.class"""
+    @property
+    def compound_details(self) -> 'Attribute':
+        """Special details about this molecule."""
+    @property
+    def description(self) -> 'Attribute':
+        """Description of this molecule."""
+    @property
+    def formula(self) -> 'Attribute':
+        """The formula for the reference entity. Formulae are written  according to the rules:   1. Only recognised element symbols may be used.   2. Each element symbol is followed by a 'count' number. A count     of '1' may be omitted.   3. A space or parenthesis must separate each element symbol and     its count, but in general parentheses are not used.   4. The order of elements depends on whether or not carbon is     present. If carbon is present, the order should be: C, then     H, then the other elements in alphabetical order of their     symbol. If carbon is not present, the elements are listed     purely in alphabetic order of their symbol. This is the     'Hill' system used by Chemical Abstracts."""
+    @property
+    def formula_weight(self) -> 'Attribute':
+        """Formula mass in daltons of the entity."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name of the entity."""
+    @property
+    def prd_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_molecule.prd_id is the unique identifier  for the reference molecule in this family.   By convention this ID uniquely identifies the reference molecule in  in the PDB reference dictionary.   The ID has the template form PRD_dddddd (e.g. PRD_000001)"""
+    @property
+    def release_status(self) -> 'Attribute':
+        """Defines the current PDB release status for this molecule definition."""
+    @property
+    def replaced_by(self) -> 'Attribute':
+        """Assigns the identifier of the reference molecule that has replaced this molecule."""
+    @property
+    def replaces(self) -> 'Attribute':
+        """Assigns the identifier for the reference molecule which have been replaced  by this reference molecule.  Multiple molecule identifier codes should be separated by commas."""
+    @property
+    def represent_as(self) -> 'Attribute':
+        """Defines how this entity is represented in PDB data files."""
+    @property
+    def representative_PDB_id_code(self) -> 'Attribute':
+        """The PDB accession code for the entry containing a representative example of this molecule."""
+    @property
+    def type(self) -> 'Attribute':
+        """Defines the structural classification of the entity."""
+    @property
+    def type_evidence_code(self) -> 'Attribute':
+        """Evidence for the assignment of _pdbx_reference_molecule.type"""
+
+class Attr_PdbxReferenceMoleculeAnnotation(AttributeGroup):
+    """"""
+    @property
+    def family_prd_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_molecule_annotation.family_prd_id is a reference to  _pdbx_reference_molecule_list.family_prd_id in category PDBX_REFERENCE_MOLECULE_FAMILY_LIST."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """This data item distinguishes anotations for this entity."""
+    @property
+    def prd_id(self) -> 'Attribute':
+        """This data item is a pointer to _pdbx_reference_molecule.prd_id in the  PDB_REFERENCE_MOLECULE category."""
+    @property
+    def source(self) -> 'Attribute':
+        """The source of the annoation for this entity."""
+    @property
+    def text(self) -> 'Attribute':
+        """Text describing the annotation for this entity."""
+    @property
+    def type(self) -> 'Attribute':
+        """Type of annotation for this entity."""
+
+class Attr_PdbxReferenceMoleculeDetails(AttributeGroup):
+    """"""
+    @property
+    def family_prd_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_molecule_details.family_prd_id is a reference to  _pdbx_reference_molecule_list.family_prd_id' in category PDBX_REFERENCE_MOLECULE_FAMILY."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """The value of _pdbx_reference_molecule_details.ordinal is an ordinal that  distinguishes each descriptive text for this entity."""
+    @property
+    def source(self) -> 'Attribute':
+        """A data source of this information (e.g. PubMed, Merck Index)"""
+    @property
+    def source_id(self) -> 'Attribute':
+        """A identifier within the data source for this information."""
+    @property
+    def text(self) -> 'Attribute':
+        """The text of the description of special aspects of the entity."""
+
+class Attr_PdbxReferenceMoleculeFamily(AttributeGroup):
+    """"""
+    @property
+    def family_prd_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_entity.family_prd_id must uniquely identify a record in the  PDBX_REFERENCE_MOLECULE_FAMILY list.   By convention this ID uniquely identifies the reference family in  in the PDB reference dictionary.   The ID has the template form FAM_dddddd (e.g. FAM_000001)"""
+    @property
+    def name(self) -> 'Attribute':
+        """The entity family name."""
+    @property
+    def release_status(self) -> 'Attribute':
+        """Assigns the current PDB release status for this family."""
+    @property
+    def replaced_by(self) -> 'Attribute':
+        """Assigns the identifier of the family that has replaced this component."""
+    @property
+    def replaces(self) -> 'Attribute':
+        """Assigns the identifier for the family which have been replaced by this family.  Multiple family identifier codes should be separated by commas."""
+
+class Attr_PdbxReferenceMoleculeFeatures(AttributeGroup):
+    """"""
+    @property
+    def family_prd_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_molecule_features.family_prd_id is a reference to  _pdbx_reference_molecule_list.family_prd_id in category PDBX_REFERENCE_MOLECULE_FAMILY_LIST."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """The value of _pdbx_reference_molecule_features.ordinal distinguishes 	       each feature for this entity."""
+    @property
+    def prd_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_molecule_features.prd_id is a reference 	       _pdbx_reference_molecule.prd_id in the  PDBX_REFERENCE_MOLECULE category."""
+    @property
+    def source(self) -> 'Attribute':
+        """The information source for the component feature."""
+    @property
+    def source_ordinal(self) -> 'Attribute':
+        """The value of _pdbx_reference_molecule_features.source_ordinal provides 	       the priority order of features from a particular source or database."""
+    @property
+    def type(self) -> 'Attribute':
+        """The entity feature type."""
+    @property
+    def value(self) -> 'Attribute':
+        """The entity feature value."""
+
+class Attr_PdbxReferenceMoleculeList(AttributeGroup):
+    """"""
+    @property
+    def family_prd_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_molecule_list.family_prd_id is a reference to  _pdbx_reference_molecule_family.family_prd_id' in category PDBX_REFERENCE_MOLECULE_FAMILY."""
+    @property
+    def prd_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_molecule_list.prd_id is the unique identifier  for the reference molecule in this family.   By convention this ID uniquely identifies the reference molecule in  in the PDB reference dictionary.   The ID has the template form PRD_dddddd (e.g. PRD_000001)"""
+
+class Attr_PdbxReferenceMoleculeRelatedStructures(AttributeGroup):
+    """"""
+    @property
+    def citation_id(self) -> 'Attribute':
+        """A link to related reference information in the citation category."""
+    @property
+    def db_accession(self) -> 'Attribute':
+        """The database accession code for the related structure reference."""
+    @property
+    def db_code(self) -> 'Attribute':
+        """The database identifier code for the related structure reference."""
+    @property
+    def db_name(self) -> 'Attribute':
+        """The database name for the related structure reference."""
+    @property
+    def family_prd_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_molecule_related_structures.family_prd_id is a reference to  _pdbx_reference_molecule_list.family_prd_id in category PDBX_REFERENCE_MOLECULE_FAMILY_LIST."""
+    @property
+    def formula(self) -> 'Attribute':
+        """The formula for the reference entity. Formulae are written  according to the rules:   1. Only recognised element symbols may be used.   2. Each element symbol is followed by a 'count' number. A count     of '1' may be omitted.   3. A space or parenthesis must separate each element symbol and     its count, but in general parentheses are not used.   4. The order of elements depends on whether or not carbon is     present. If carbon is present, the order should be: C, then     H, then the other elements in alphabetical order of their     symbol. If carbon is not present, the elements are listed     purely in alphabetic order of their symbol. This is the     'Hill' system used by Chemical Abstracts."""
+    @property
+    def name(self) -> 'Attribute':
+        """The chemical name for the structure entry in the related database"""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """The value of _pdbx_reference_molecule_related_structures.ordinal distinguishes  related structural data for each entity."""
+
+class Attr_PdbxReferenceMoleculeSynonyms(AttributeGroup):
+    """"""
+    @property
+    def family_prd_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_molecule_synonyms.family_prd_id is a reference to  _pdbx_reference_molecule_list.family_prd_id in category PDBX_REFERENCE_MOLECULE_FAMILY_LIST."""
+    @property
+    def name(self) -> 'Attribute':
+        """A synonym name for the entity."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """The value of _pdbx_reference_molecule_synonyms.ordinal is an ordinal 	       to distinguish synonyms for this entity."""
+    @property
+    def prd_id(self) -> 'Attribute':
+        """The value of _pdbx_reference_molecule_synonyms.prd_id is a reference 	       _pdbx_reference_molecule.prd_id in the  PDBX_REFERENCE_MOLECULE category."""
+    @property
+    def source(self) -> 'Attribute':
+        """The source of this synonym name for the entity."""
+
+class Attr_RcsbBirdCitation(AttributeGroup):
+    """"""
+    @property
+    def id(self) -> 'Attribute':
+        """The value of _rcsb_bird_citation.id must uniquely identify a record in the  rcsb_bird_citation list."""
+    @property
+    def journal_abbrev(self) -> 'Attribute':
+        """Abbreviated name of the cited journal as given in the  Chemical Abstracts Service Source Index."""
+    @property
+    def journal_volume(self) -> 'Attribute':
+        """Volume number of the journal cited; relevant for journal  articles."""
+    @property
+    def page_first(self) -> 'Attribute':
+        """The first page of the rcsb_bird_citation; relevant for journal  articles, books and book chapters."""
+    @property
+    def page_last(self) -> 'Attribute':
+        """The last page of the rcsb_bird_citation; relevant for journal  articles, books and book chapters."""
+    @property
+    def pdbx_database_id_DOI(self) -> 'Attribute':
+        """Document Object Identifier used by doi.org to uniquely  specify bibliographic entry."""
+    @property
+    def pdbx_database_id_PubMed(self) -> 'Attribute':
+        """Ascession number used by PubMed to categorize a specific  bibliographic entry."""
+    @property
+    def rcsb_authors(self) -> 'Attribute':
+        """"""
+    @property
+    def title(self) -> 'Attribute':
+        """The title of the rcsb_bird_citation; relevant for journal articles, books  and book chapters."""
+    @property
+    def year(self) -> 'Attribute':
+        """The year of the rcsb_bird_citation; relevant for journal articles, books  and book chapters."""
+
+class Attr_RcsbChemCompAnnotation(AttributeGroup):
+    """"""
+    @property
+    def annotation_id(self) -> 'Attribute':
+        """An identifier for the annotation."""
+    @property
+    def assignment_version(self) -> 'Attribute':
+        """Identifies the version of the annotation assignment."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description for the annotation."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name for the annotation."""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Code identifying the individual, organization or program that  assigned the annotation."""
+    @property
+    def type(self) -> 'Attribute':
+        """A type or category of the annotation."""
+    @property
+    def annotation_lineage(self) -> 'Attr_AnnotationLineage':
+        """"""
+
+class Attr_RcsbChemCompContainerIdentifiers(AttributeGroup):
+    """"""
+    @property
+    def atc_codes(self) -> 'Attribute':
+        """"""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """The chemical component identifier."""
+    @property
+    def drugbank_id(self) -> 'Attribute':
+        """The DrugBank identifier corresponding to the chemical component."""
+    @property
+    def prd_id(self) -> 'Attribute':
+        """The BIRD definition identifier."""
+    @property
+    def rcsb_id(self) -> 'Attribute':
+        """A unique identifier for the chemical definition in this container."""
+    @property
+    def subcomponent_ids(self) -> 'Attribute':
+        """"""
+
+class Attr_RcsbChemCompDescriptor(AttributeGroup):
+    """"""
+    @property
+    def InChI(self) -> 'Attribute':
+        """Standard IUPAC International Chemical Identifier (InChI) descriptor for the chemical component.     InChI, the IUPAC International Chemical Identifier,    by Stephen R Heller, Alan McNaught, Igor Pletnev, Stephen Stein and Dmitrii Tchekhovskoi,    Journal of Cheminformatics, 2015, 7:23;"""
+    @property
+    def InChIKey(self) -> 'Attribute':
+        """Standard IUPAC International Chemical Identifier (InChI) descriptor key  for the chemical component   InChI, the IUPAC International Chemical Identifier,  by Stephen R Heller, Alan McNaught, Igor Pletnev, Stephen Stein and Dmitrii Tchekhovskoi,  Journal of Cheminformatics, 2015, 7:23"""
+    @property
+    def SMILES(self) -> 'Attribute':
+        """Simplified molecular-input line-entry system (SMILES) descriptor for the chemical component.     Weininger D (February 1988). 'SMILES, a chemical language and information system. 1.    Introduction to methodology and encoding rules'. Journal of Chemical Information and Modeling. 28 (1): 31-6.     Weininger D, Weininger A, Weininger JL (May 1989).    'SMILES. 2. Algorithm for generation of unique SMILES notation',    Journal of Chemical Information and Modeling. 29 (2): 97-101."""
+    @property
+    def SMILES_stereo(self) -> 'Attribute':
+        """Simplified molecular-input line-entry system (SMILES) descriptor for the chemical  component including stereochemical features.   Weininger D (February 1988). 'SMILES, a chemical language and information system. 1.  Introduction to methodology and encoding rules'.  Journal of Chemical Information and Modeling. 28 (1): 31-6.   Weininger D, Weininger A, Weininger JL (May 1989).  'SMILES. 2. Algorithm for generation of unique SMILES notation'.  Journal of Chemical Information and Modeling. 29 (2): 97-101."""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """The chemical component identifier."""
+
+class Attr_RcsbChemCompInfo(AttributeGroup):
+    """"""
+    @property
+    def atom_count(self) -> 'Attribute':
+        """Chemical component total atom count"""
+    @property
+    def atom_count_chiral(self) -> 'Attribute':
+        """Chemical component chiral atom count"""
+    @property
+    def atom_count_heavy(self) -> 'Attribute':
+        """Chemical component heavy atom count"""
+    @property
+    def bond_count(self) -> 'Attribute':
+        """Chemical component total bond count"""
+    @property
+    def bond_count_aromatic(self) -> 'Attribute':
+        """Chemical component aromatic bond count"""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """The chemical component identifier."""
+    @property
+    def initial_deposition_date(self) -> 'Attribute':
+        """The date the chemical definition was first deposited in the PDB repository."""
+    @property
+    def initial_release_date(self) -> 'Attribute':
+        """The initial date the chemical definition was released in the PDB repository."""
+    @property
+    def release_status(self) -> 'Attribute':
+        """The release status of the chemical definition."""
+    @property
+    def revision_date(self) -> 'Attribute':
+        """The date of last revision of the chemical definition."""
+
+class Attr_RcsbChemCompRelated(AttributeGroup):
+    """"""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """The value of _rcsb_chem_comp_related.comp_id is a reference to  a chemical component definition."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """The value of _rcsb_chem_comp_related.ordinal distinguishes  related examples for each chemical component."""
+    @property
+    def related_mapping_method(self) -> 'Attribute':
+        """The method used to establish the resource correspondence."""
+    @property
+    def resource_accession_code(self) -> 'Attribute':
+        """The resource identifier code for the related chemical reference."""
+    @property
+    def resource_name(self) -> 'Attribute':
+        """The resource name for the related chemical reference."""
+
+class Attr_RcsbChemCompSynonyms(AttributeGroup):
+    """"""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """The chemical component to which this synonym applies."""
+    @property
+    def name(self) -> 'Attribute':
+        """The synonym of this particular chemical component."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """This data item is an ordinal index for the  RCSB_CHEM_COMP_SYNONYMS category."""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """The provenance of this synonym."""
+    @property
+    def type(self) -> 'Attribute':
+        """This data item contains the synonym type."""
+
+class Attr_RcsbChemCompTarget(AttributeGroup):
+    """"""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """The value of _rcsb_chem_comp_target.comp_id is a reference to  a chemical component definition."""
+    @property
+    def interaction_type(self) -> 'Attribute':
+        """The type of target interaction."""
+    @property
+    def name(self) -> 'Attribute':
+        """The chemical component target name."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """The value of _rcsb_chem_comp_target.ordinal distinguishes  related examples for each chemical component."""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """A code indicating the provenance of the target interaction assignment"""
+    @property
+    def reference_database_accession_code(self) -> 'Attribute':
+        """The reference identifier code for the target interaction reference."""
+    @property
+    def reference_database_name(self) -> 'Attribute':
+        """The reference database name for the target interaction."""
+    @property
+    def target_actions(self) -> 'Attribute':
+        """"""
+
+class Attr_RcsbSchemaContainerIdentifiers(AttributeGroup):
+    """"""
+    @property
+    def collection_name(self) -> 'Attribute':
+        """Collection name associated with the data in the container."""
+    @property
+    def collection_schema_version(self) -> 'Attribute':
+        """Version string for the schema and collection."""
+    @property
+    def schema_name(self) -> 'Attribute':
+        """Schema name associated with the data in the container."""
+
+class Attr_PdbxStructAssembly(AttributeGroup):
+    """"""
+    @property
+    def details(self) -> 'Attribute':
+        """A description of special aspects of the macromolecular assembly.                 In the PDB, 'representative helical assembly', 'complete point assembly', 	       'complete icosahedral assembly', 'software_defined_assembly', 'author_defined_assembly', 	       and 'author_and_software_defined_assembly' are considered 'biologically relevant assemblies."""
+    @property
+    def id(self) -> 'Attribute':
+        """The value of _pdbx_struct_assembly.id must uniquely identify a record in  the PDBX_STRUCT_ASSEMBLY list."""
+    @property
+    def method_details(self) -> 'Attribute':
+        """Provides details of the method used to determine or  compute the assembly."""
+    @property
+    def oligomeric_count(self) -> 'Attribute':
+        """The number of polymer molecules in the assembly."""
+    @property
+    def oligomeric_details(self) -> 'Attribute':
+        """Provides the details of the oligomeric state of the assembly."""
+    @property
+    def rcsb_candidate_assembly(self) -> 'Attribute':
+        """Candidate macromolecular assembly.   Excludes the following cases classified in pdbx_struct_asembly.details:   'crystal asymmetric unit', 'crystal asymmetric unit, crystal frame', 'helical asymmetric unit',  'helical asymmetric unit, std helical frame','icosahedral 23 hexamer', 'icosahedral asymmetric unit',  'icosahedral asymmetric unit, std point frame','icosahedral pentamer', 'pentasymmetron capsid unit',  'point asymmetric unit', 'point asymmetric unit, std point frame','trisymmetron capsid unit',   and 'deposited_coordinates'."""
+    @property
+    def rcsb_details(self) -> 'Attribute':
+        """A filtered description of the macromolecular assembly."""
+
+class Attr_PdbxStructAssemblyAuthEvidence(AttributeGroup):
+    """"""
+    @property
+    def assembly_id(self) -> 'Attribute':
+        """This item references an assembly in pdbx_struct_assembly"""
+    @property
+    def details(self) -> 'Attribute':
+        """Provides any additional information regarding the evidence of this assembly"""
+    @property
+    def experimental_support(self) -> 'Attribute':
+        """Provides the experimental method to determine the state of this assembly"""
+    @property
+    def id(self) -> 'Attribute':
+        """Identifies a unique record in pdbx_struct_assembly_auth_evidence."""
+
+class Attr_PdbxStructAssemblyGen(AttributeGroup):
+    """"""
+    @property
+    def assembly_id(self) -> 'Attribute':
+        """This data item is a pointer to _pdbx_struct_assembly.id in the  PDBX_STRUCT_ASSEMBLY category."""
+    @property
+    def asym_id_list(self) -> 'Attribute':
+        """"""
+    @property
+    def oper_expression(self) -> 'Attribute':
+        """Identifies the operation of collection of operations  from category PDBX_STRUCT_OPER_LIST.   Operation expressions may have the forms:    (1)        the single operation 1   (1,2,5)    the operations 1, 2, 5   (1-4)      the operations 1,2,3 and 4   (1,2)(3,4) the combinations of operations              3 and 4 followed by 1 and 2 (i.e.              the cartesian product of parenthetical              groups applied from right to left)"""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """This data item is an ordinal index for the  PDBX_STRUCT_ASSEMBLY category."""
+
+class Attr_PdbxStructAssemblyProp(AttributeGroup):
+    """"""
+    @property
+    def assembly_id(self) -> 'Attribute':
+        """The identifier for the assembly used in category PDBX_STRUCT_ASSEMBLY."""
+    @property
+    def biol_id(self) -> 'Attribute':
+        """The identifier for the assembly used in category PDBX_STRUCT_ASSEMBLY."""
+    @property
+    def type(self) -> 'Attribute':
+        """The property type for the assembly."""
+    @property
+    def value(self) -> 'Attribute':
+        """The value of the assembly property."""
+
+class Attr_PdbxStructOperList(AttributeGroup):
+    """"""
+    @property
+    def id(self) -> 'Attribute':
+        """This identifier code must uniquely identify a  record in the PDBX_STRUCT_OPER_LIST list."""
+    @property
+    def matrix_1_1(self) -> 'Attribute':
+        """The [1][1] element of the 3x3 matrix component of the  transformation operation."""
+    @property
+    def matrix_1_2(self) -> 'Attribute':
+        """The [1][2] element of the 3x3 matrix component of the  transformation operation."""
+    @property
+    def matrix_1_3(self) -> 'Attribute':
+        """The [1][3] element of the 3x3 matrix component of the  transformation operation."""
+    @property
+    def matrix_2_1(self) -> 'Attribute':
+        """The [2][1] element of the 3x3 matrix component of the  transformation operation."""
+    @property
+    def matrix_2_2(self) -> 'Attribute':
+        """The [2][2] element of the 3x3 matrix component of the  transformation operation."""
+    @property
+    def matrix_2_3(self) -> 'Attribute':
+        """The [2][3] element of the 3x3 matrix component of the  transformation operation."""
+    @property
+    def matrix_3_1(self) -> 'Attribute':
+        """The [3][1] element of the 3x3 matrix component of the  transformation operation."""
+    @property
+    def matrix_3_2(self) -> 'Attribute':
+        """The [3][2] element of the 3x3 matrix component of the  transformation operation."""
+    @property
+    def matrix_3_3(self) -> 'Attribute':
+        """The [3][3] element of the 3x3 matrix component of the  transformation operation."""
+    @property
+    def name(self) -> 'Attribute':
+        """A descriptive name for the transformation operation."""
+    @property
+    def symmetry_operation(self) -> 'Attribute':
+        """The symmetry operation corresponding to the transformation operation."""
+    @property
+    def type(self) -> 'Attribute':
+        """A code to indicate the type of operator."""
+    @property
+    def vector_1(self) -> 'Attribute':
+        """The [1] element of the three-element vector component of the  transformation operation."""
+    @property
+    def vector_2(self) -> 'Attribute':
+        """The [2] element of the three-element vector component of the  transformation operation."""
+    @property
+    def vector_3(self) -> 'Attribute':
+        """The [3] element of the three-element vector component of the  transformation operation."""
+
+class Attr_RcsbAssemblyAnnotation(AttributeGroup):
+    """"""
+    @property
+    def annotation_id(self) -> 'Attribute':
+        """An identifier for the annotation."""
+    @property
+    def assignment_version(self) -> 'Attribute':
+        """Identifies the version of the annotation assignment."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description for the annotation."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name for the annotation."""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Code identifying the individual, organization or program that assigned the annotation."""
+    @property
+    def type(self) -> 'Attribute':
+        """A type or category of the annotation."""
+    @property
+    def additional_properties(self) -> 'Attr_AdditionalProperties':
+        """"""
+
+class Attr_RcsbAssemblyContainerIdentifiers(AttributeGroup):
+    """"""
+    @property
+    def assembly_id(self) -> 'Attribute':
+        """Assembly identifier for the container."""
+    @property
+    def entry_id(self) -> 'Attribute':
+        """Entry identifier for the container."""
+    @property
+    def interface_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def rcsb_id(self) -> 'Attribute':
+        """A unique identifier for each object in this assembly container formed by  a dash separated concatenation of entry and assembly identifiers."""
+
+class Attr_FeaturePositions(AttributeGroup):
+    """"""
+    @property
+    def asym_id(self) -> 'Attribute':
+        """An identifier of polymer chain (label_asym_id) corresponding to the feature assignment."""
+    @property
+    def beg_seq_id(self) -> 'Attribute':
+        """An identifier for the monomer at which this segment of the feature begins."""
+    @property
+    def end_seq_id(self) -> 'Attribute':
+        """An identifier for the monomer at which this segment of the feature ends."""
+    @property
+    def struct_oper_list(self) -> 'Attribute':
+        """"""
+    @property
+    def values(self) -> 'Attribute':
+        """"""
+
+class Attr_RcsbAssemblyFeature(AttributeGroup):
+    """"""
+    @property
+    def assignment_version(self) -> 'Attribute':
+        """Identifies the version of the feature assignment."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description for the feature."""
+    @property
+    def feature_id(self) -> 'Attribute':
+        """An identifier for the feature."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name for the feature."""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Code identifying the individual, organization or program that assigned the feature."""
+    @property
+    def type(self) -> 'Attribute':
+        """A type or category of the feature."""
+    @property
+    def additional_properties(self) -> 'Attr_AdditionalProperties':
+        """"""
+    @property
+    def feature_positions(self) -> 'Attr_FeaturePositions':
+        """"""
+
+class Attr_RcsbAssemblyInfo(AttributeGroup):
+    """"""
+    @property
+    def assembly_id(self) -> 'Attribute':
+        """Entity identifier for the container."""
+    @property
+    def atom_count(self) -> 'Attribute':
+        """The assembly non-hydrogen atomic coordinate count."""
+    @property
+    def branched_atom_count(self) -> 'Attribute':
+        """The assembly non-hydrogen branched entity atomic coordinate count."""
+    @property
+    def branched_entity_count(self) -> 'Attribute':
+        """The number of distinct branched entities in the generated assembly."""
+    @property
+    def branched_entity_instance_count(self) -> 'Attribute':
+        """The number of branched instances in the generated assembly data set.  This is the total count of branched entity instances generated in the assembly coordinate data."""
+    @property
+    def deuterated_water_count(self) -> 'Attribute':
+        """The assembly deuterated water molecule count."""
+    @property
+    def entry_id(self) -> 'Attribute':
+        """The PDB entry accession code."""
+    @property
+    def hydrogen_atom_count(self) -> 'Attribute':
+        """The assembly hydrogen atomic coordinate count."""
+    @property
+    def modeled_polymer_monomer_count(self) -> 'Attribute':
+        """The number of modeled polymer monomers in the assembly coordinate data.  This is the total count of monomers with reported coordinate data for all polymer  entity instances in the generated assembly coordinate data."""
+    @property
+    def na_polymer_entity_types(self) -> 'Attribute':
+        """Nucleic acid polymer entity type categories describing the generated assembly."""
+    @property
+    def nonpolymer_atom_count(self) -> 'Attribute':
+        """The assembly non-hydrogen non-polymer entity atomic coordinate count."""
+    @property
+    def nonpolymer_entity_count(self) -> 'Attribute':
+        """The number of distinct non-polymer entities in the generated assembly exclusive of solvent."""
+    @property
+    def nonpolymer_entity_instance_count(self) -> 'Attribute':
+        """The number of non-polymer instances in the generated assembly data set exclusive of solvent.  This is the total count of non-polymer entity instances generated in the assembly coordinate data."""
+    @property
+    def num_heterologous_interface_entities(self) -> 'Attribute':
+        """Number of heterologous (both binding sites are different) interface entities"""
+    @property
+    def num_heteromeric_interface_entities(self) -> 'Attribute':
+        """Number of heteromeric (both partners are different polymeric entities) interface entities"""
+    @property
+    def num_homomeric_interface_entities(self) -> 'Attribute':
+        """Number of homomeric (both partners are the same polymeric entity) interface entities"""
+    @property
+    def num_interface_entities(self) -> 'Attribute':
+        """Number of polymer-polymer interface entities, grouping equivalent interfaces at the entity level (i.e. same entity_ids on either side, with similar but not identical binding sites)"""
+    @property
+    def num_interfaces(self) -> 'Attribute':
+        """Number of geometrically equivalent (i.e. same asym_ids on either side) polymer-polymer interfaces in the assembly"""
+    @property
+    def num_isologous_interface_entities(self) -> 'Attribute':
+        """Number of isologous (both binding sites are same, i.e. interface is symmetric) interface entities"""
+    @property
+    def num_na_interface_entities(self) -> 'Attribute':
+        """Number of nucleic acid-nucleic acid interface entities"""
+    @property
+    def num_prot_na_interface_entities(self) -> 'Attribute':
+        """Number of protein-nucleic acid interface entities"""
+    @property
+    def num_protein_interface_entities(self) -> 'Attribute':
+        """Number of protein-protein interface entities"""
+    @property
+    def polymer_atom_count(self) -> 'Attribute':
+        """The assembly non-hydrogen polymer entity atomic coordinate count."""
+    @property
+    def polymer_composition(self) -> 'Attribute':
+        """Categories describing the polymer entity composition for the generated assembly."""
+    @property
+    def polymer_entity_count(self) -> 'Attribute':
+        """The number of distinct polymer entities in the generated assembly."""
+    @property
+    def polymer_entity_count_DNA(self) -> 'Attribute':
+        """The number of distinct DNA polymer entities in the generated assembly."""
+    @property
+    def polymer_entity_count_RNA(self) -> 'Attribute':
+        """The number of distinct RNA polymer entities in the generated assembly."""
+    @property
+    def polymer_entity_count_nucleic_acid(self) -> 'Attribute':
+        """The number of distinct nucleic acid polymer entities (DNA or RNA) in the generated assembly."""
+    @property
+    def polymer_entity_count_nucleic_acid_hybrid(self) -> 'Attribute':
+        """The number of distinct hybrid nucleic acid polymer entities in the generated assembly."""
+    @property
+    def polymer_entity_count_protein(self) -> 'Attribute':
+        """The number of distinct protein polymer entities in the generated assembly."""
+    @property
+    def polymer_entity_instance_count(self) -> 'Attribute':
+        """The number of polymer instances in the generated assembly data set.  This is the total count of polymer entity instances generated in the assembly coordinate data."""
+    @property
+    def polymer_entity_instance_count_DNA(self) -> 'Attribute':
+        """The number of DNA polymer instances in the generated assembly data set.  This is the total count of DNA polymer entity instances generated in the assembly coordinate data."""
+    @property
+    def polymer_entity_instance_count_RNA(self) -> 'Attribute':
+        """The number of RNA polymer instances in the generated assembly data set.  This is the total count of RNA polymer entity instances generated in the assembly coordinate data."""
+    @property
+    def polymer_entity_instance_count_nucleic_acid(self) -> 'Attribute':
+        """The number of nucleic acid polymer instances in the generated assembly data set.  This is the total count of nucleic acid polymer entity instances generated in the assembly coordinate data."""
+    @property
+    def polymer_entity_instance_count_nucleic_acid_hybrid(self) -> 'Attribute':
+        """The number of hybrid nucleic acide polymer instances in the generated assembly data set.  This is the total count of hybrid nucleic acid polymer entity instances generated in the assembly coordinate data."""
+    @property
+    def polymer_entity_instance_count_protein(self) -> 'Attribute':
+        """The number of protein polymer instances in the generated assembly data set.  This is the total count of protein polymer entity instances generated in the assembly coordinate data."""
+    @property
+    def polymer_monomer_count(self) -> 'Attribute':
+        """The number of polymer monomers in sample entity instances comprising the assembly data set.  This is the total count of monomers for all polymer entity instances  in the generated assembly coordinate data."""
+    @property
+    def selected_polymer_entity_types(self) -> 'Attribute':
+        """Selected polymer entity type categories describing the generated assembly."""
+    @property
+    def solvent_atom_count(self) -> 'Attribute':
+        """The assembly non-hydrogen solvent atomic coordinate count."""
+    @property
+    def solvent_entity_count(self) -> 'Attribute':
+        """The number of distinct solvent entities in the generated assembly."""
+    @property
+    def solvent_entity_instance_count(self) -> 'Attribute':
+        """The number of solvent instances in the generated assembly data set.  This is the total count of solvent entity instances generated in the assembly coordinate data."""
+    @property
+    def total_assembly_buried_surface_area(self) -> 'Attribute':
+        """Total buried surface area calculated as the sum of buried surface areas over all interfaces"""
+    @property
+    def total_number_interface_residues(self) -> 'Attribute':
+        """Total number of interfacing residues in the assembly, calculated as the sum of interfacing residues over all interfaces"""
+    @property
+    def unmodeled_polymer_monomer_count(self) -> 'Attribute':
+        """The number of unmodeled polymer monomers in the assembly coordinate data. This is  the total count of monomers with unreported coordinate data for all polymer  entity instances in the generated assembly coordinate data."""
+
+class Attr_RotationAxes(AttributeGroup):
+    """Specifies a single or multiple rotation axes through the same point."""
+    @property
+    def end(self) -> 'Attribute':
+        """Describes x,y,z coordinates of the end point of the symmetry axis."""
+    @property
+    def order(self) -> 'Attribute':
+        """The number of times (order of rotation) that a subunit can be repeated by a rotation operation,  being transformed into a new state indistinguishable from its starting state."""
+    @property
+    def start(self) -> 'Attribute':
+        """Describes x,y,z coordinates of the start point of the symmetry axis."""
+
+class Attr_Members(AttributeGroup):
+    """"""
+    @property
+    def asym_id(self) -> 'Attribute':
+        """Internal chain ID used in mmCIF files to uniquely identify structural elements in the asymmetric unit."""
+    @property
+    def pdbx_struct_oper_list_ids(self) -> 'Attribute':
+        """Optional list of operator ids (pdbx_struct_oper_list.id) as appears in pdbx_struct_assembly_gen.oper_expression."""
+
+class Attr_Clusters(AttributeGroup):
+    """Clusters describe grouping of identical subunits."""
+    @property
+    def members(self) -> 'Attr_Members':
+        """"""
+    @property
+    def avg_rmsd(self) -> 'Attribute':
+        """Average RMSD between members of a given cluster."""
+
+class Attr_RcsbStructSymmetry(AttributeGroup):
+    """"""
+    @property
+    def kind(self) -> 'Attribute':
+        """The granularity at which the symmetry calculation is performed. In 'Global Symmetry' all polymeric  subunits in assembly are used. In 'Local Symmetry' only a subset of polymeric subunits is considered.  In 'Pseudo Symmetry' the threshold for subunits similarity is relaxed."""
+    @property
+    def oligomeric_state(self) -> 'Attribute':
+        """Oligomeric state refers to a composition of polymeric subunits in quaternary structure.  Quaternary structure may be composed either exclusively of several copies of identical subunits,  in which case they are termed homo-oligomers, or alternatively by at least one copy of different  subunits (hetero-oligomers). Quaternary structure composed of a single subunit is denoted as 'Monomer'."""
+    @property
+    def stoichiometry(self) -> 'Attribute':
+        """"""
+    @property
+    def symbol(self) -> 'Attribute':
+        """Symmetry symbol refers to point group or helical symmetry of identical polymeric subunits in Schoenflies notation.  Contains point group symbol (e.g., C2, C5, D2, T, O, I) or H for helical symmetry."""
+    @property
+    def type(self) -> 'Attribute':
+        """Symmetry type refers to point group or helical symmetry of identical polymeric subunits.  Contains point group types (e.g. Cyclic, Dihedral) or Helical for helical symmetry."""
+    @property
+    def rotation_axes(self) -> 'Attr_RotationAxes':
+        """Specifies a single or multiple rotation axes through the same point."""
+    @property
+    def clusters(self) -> 'Attr_Clusters':
+        """Clusters describe grouping of identical subunits."""
+
+class Attr_RcsbStructSymmetryLineage(AttributeGroup):
+    """"""
+    @property
+    def depth(self) -> 'Attribute':
+        """Hierarchy depth."""
+    @property
+    def id(self) -> 'Attribute':
+        """Automatically assigned ID to uniquely identify the symmetry term in the Protein Symmetry Browser."""
+    @property
+    def name(self) -> 'Attribute':
+        """A human-readable term describing protein symmetry."""
+
+class Attr_RcsbRepositoryHoldingsCurrent(AttributeGroup):
+    """"""
+    @property
+    def repository_content_types(self) -> 'Attribute':
+        """"""
+
+class Attr_RcsbRepositoryHoldingsCurrentEntryContainerIdentifiers(AttributeGroup):
+    """"""
+    @property
+    def assembly_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def entry_id(self) -> 'Attribute':
+        """The PDB entry accession code."""
+    @property
+    def rcsb_id(self) -> 'Attribute':
+        """The RCSB entry identifier."""
+    @property
+    def update_id(self) -> 'Attribute':
+        """Identifier for the current data exchange status record."""
+
+class Attr_PdbxStructSpecialSymmetry(AttributeGroup):
+    """"""
+    @property
+    def PDB_model_num(self) -> 'Attribute':
+        """Part of the identifier for the molecular component.  This data item is a pointer to _atom_site.pdbx_PDB_model_num in the ATOM_SITE category."""
+    @property
+    def auth_seq_id(self) -> 'Attribute':
+        """Part of the identifier for the molecular component.   This data item is a pointer to _atom_site.auth_seq_id in the  ATOM_SITE category."""
+    @property
+    def id(self) -> 'Attribute':
+        """The value of _pdbx_struct_special_symmetry.id must uniquely identify  each item in the PDBX_STRUCT_SPECIAL_SYMMETRY list.   This is an integer serial number."""
+    @property
+    def label_asym_id(self) -> 'Attribute':
+        """Part of the identifier for the molecular component.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category."""
+    @property
+    def label_comp_id(self) -> 'Attribute':
+        """Part of the identifier for the molecular component.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category."""
+
+class Attr_PdbxVrptSummaryEntityFitToMap(AttributeGroup):
+    """"""
+    @property
+    def PDB_model_num(self) -> 'Attribute':
+        """The unique model number from _atom_site.pdbx_PDB_model_num."""
+    @property
+    def Q_score(self) -> 'Attribute':
+        """The calculated average Q-score."""
+    @property
+    def average_residue_inclusion(self) -> 'Attribute':
+        """The average of the residue inclusions for all residues in this instance"""
+
+class Attr_PdbxVrptSummaryEntityGeometry(AttributeGroup):
+    """"""
+    @property
+    def PDB_model_num(self) -> 'Attribute':
+        """The unique model number from _atom_site.pdbx_PDB_model_num."""
+    @property
+    def angles_RMSZ(self) -> 'Attribute':
+        """The overall root mean square of the Z-score for deviations of bond angles in comparison to  'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996)."""
+    @property
+    def average_residue_inclusion(self) -> 'Attribute':
+        """The average of the residue inclusions for all residues in this instance"""
+    @property
+    def bonds_RMSZ(self) -> 'Attribute':
+        """The overall root mean square of the Z-score for deviations of bond lengths in comparison to  'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996)."""
+    @property
+    def num_angles_RMSZ(self) -> 'Attribute':
+        """The number of bond angles compared to 'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996)."""
+    @property
+    def num_bonds_RMSZ(self) -> 'Attribute':
+        """The number of bond lengths compared to 'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996)."""
+
+class Attr_RcsbNonpolymerEntityInstanceContainerIdentifiers(AttributeGroup):
+    """"""
+    @property
+    def asym_id(self) -> 'Attribute':
+        """Instance identifier for this container."""
+    @property
+    def auth_asym_id(self) -> 'Attribute':
+        """Author instance identifier for this container."""
+    @property
+    def auth_seq_id(self) -> 'Attribute':
+        """Residue number for non-polymer entity instance."""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """Component identifier for non-polymer entity instance."""
+    @property
+    def entity_id(self) -> 'Attribute':
+        """Entity identifier for the container."""
+    @property
+    def entry_id(self) -> 'Attribute':
+        """Entry identifier for the container."""
+    @property
+    def rcsb_id(self) -> 'Attribute':
+        """A unique identifier for each object in this entity instance container formed by  an 'dot' (.) separated concatenation of entry and entity instance identifiers."""
+
+class Attr_RcsbNonpolymerInstanceAnnotation(AttributeGroup):
+    """"""
+    @property
+    def annotation_id(self) -> 'Attribute':
+        """An identifier for the annotation."""
+    @property
+    def assignment_version(self) -> 'Attribute':
+        """Identifies the version of the annotation assignment."""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """Non-polymer (ligand) chemical component identifier."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description for the annotation."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name for the annotation."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """Ordinal identifier for this category"""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Code identifying the individual, organization or program that  assigned the annotation."""
+    @property
+    def type(self) -> 'Attribute':
+        """A type or category of the annotation."""
+    @property
+    def annotation_lineage(self) -> 'Attr_AnnotationLineage':
+        """"""
+
+class Attr_FeatureValue(AttributeGroup):
+    """"""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """The chemical component identifier for the instance of the feature value."""
+    @property
+    def details(self) -> 'Attribute':
+        """Specific details about the feature."""
+    @property
+    def reference(self) -> 'Attribute':
+        """The reference value of the feature."""
+    @property
+    def reported(self) -> 'Attribute':
+        """The reported value of the feature."""
+    @property
+    def uncertainty_estimate(self) -> 'Attribute':
+        """The estimated uncertainty of the reported feature value."""
+    @property
+    def uncertainty_estimate_type(self) -> 'Attribute':
+        """The type of estimated uncertainty for the reported feature value."""
+
+class Attr_RcsbNonpolymerInstanceFeature(AttributeGroup):
+    """"""
+    @property
+    def assignment_version(self) -> 'Attribute':
+        """Identifies the version of the feature assignment."""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """Component identifier for non-polymer entity instance."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description for the feature."""
+    @property
+    def feature_id(self) -> 'Attribute':
+        """An identifier for the feature."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name for the feature."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """Ordinal identifier for this category"""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Code identifying the individual, organization or program that  assigned the feature."""
+    @property
+    def type(self) -> 'Attribute':
+        """A type or category of the feature."""
+    @property
+    def feature_value(self) -> 'Attr_FeatureValue':
+        """"""
+    @property
+    def additional_properties(self) -> 'Attr_AdditionalProperties':
+        """"""
+
+class Attr_RcsbNonpolymerInstanceFeatureSummary(AttributeGroup):
+    """"""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """Component identifier for non-polymer entity instance."""
+    @property
+    def count(self) -> 'Attribute':
+        """The feature count."""
+    @property
+    def coverage(self) -> 'Attribute':
+        """The fractional feature coverage relative to the full entity sequence."""
+    @property
+    def maximum_length(self) -> 'Attribute':
+        """The maximum feature length."""
+    @property
+    def maximum_value(self) -> 'Attribute':
+        """The maximum feature value."""
+    @property
+    def minimum_length(self) -> 'Attribute':
+        """The minimum feature length."""
+    @property
+    def minimum_value(self) -> 'Attribute':
+        """The minimum feature value."""
+    @property
+    def type(self) -> 'Attribute':
+        """Type or category of the feature."""
+
+class Attr_RcsbNonpolymerInstanceValidationScore(AttributeGroup):
+    """"""
+    @property
+    def RSCC(self) -> 'Attribute':
+        """The real space correlation coefficient (RSCC) for the non-polymer entity instance."""
+    @property
+    def RSR(self) -> 'Attribute':
+        """The real space R-value (RSR) for the non-polymer entity instance."""
+    @property
+    def alt_id(self) -> 'Attribute':
+        """Alternate conformer identifier for the non-polymer entity instance."""
+    @property
+    def average_occupancy(self) -> 'Attribute':
+        """The average heavy atom occupancy for coordinate records for the non-polymer entity instance."""
+    @property
+    def completeness(self) -> 'Attribute':
+        """The reported fraction of atomic coordinate records for the non-polymer entity instance."""
+    @property
+    def intermolecular_clashes(self) -> 'Attribute':
+        """The number of intermolecular MolProbity clashes cacluated for reported atomic coordinate records."""
+    @property
+    def is_best_instance(self) -> 'Attribute':
+        """This molecular instance is ranked as the best quality instance of this nonpolymer entity."""
+    @property
+    def is_subject_of_investigation(self) -> 'Attribute':
+        """This molecular entity is identified as the subject of the current study."""
+    @property
+    def is_subject_of_investigation_provenance(self) -> 'Attribute':
+        """The provenance for the selection of the molecular entity identified as the subject of the current study."""
+    @property
+    def mogul_angle_outliers(self) -> 'Attribute':
+        """Number of bond angle outliers obtained from a CCDC Mogul survey of bond angles  in the CSD small    molecule crystal structure database. Outliers are defined as bond angles that have a Z-score    less than -2 or greater than 2."""
+    @property
+    def mogul_angles_RMSZ(self) -> 'Attribute':
+        """The root-mean-square value of the Z-scores of bond angles for the non-polymer instance in degrees obtained from a CCDC Mogul survey of bond angles in the CSD small molecule crystal structure database."""
+    @property
+    def mogul_bond_outliers(self) -> 'Attribute':
+        """Number of bond distance outliers obtained from a CCDC Mogul survey of bond lengths in the CSD small    molecule crystal structure database.  Outliers are defined as bond distances that have a Z-score    less than -2 or greater than 2."""
+    @property
+    def mogul_bonds_RMSZ(self) -> 'Attribute':
+        """The root-mean-square value of the Z-scores of bond lengths for the nonpolymer instance in Angstroms obtained from a CCDC Mogul survey of bond lengths in the CSD small molecule crystal structure database."""
+    @property
+    def natoms_eds(self) -> 'Attribute':
+        """The number of atoms in the non-polymer instance returned by the EDS software."""
+    @property
+    def num_mogul_angles_RMSZ(self) -> 'Attribute':
+        """The number of bond angles compared to 'standard geometry' made using the Mogul program."""
+    @property
+    def num_mogul_bonds_RMSZ(self) -> 'Attribute':
+        """The number of bond lengths compared to 'standard geometry' made using the Mogul program."""
+    @property
+    def ranking_model_fit(self) -> 'Attribute':
+        """The ranking of the model fit score component."""
+    @property
+    def ranking_model_geometry(self) -> 'Attribute':
+        """The ranking of the model geometry score component."""
+    @property
+    def score_model_fit(self) -> 'Attribute':
+        """The value of the model fit score component."""
+    @property
+    def score_model_geometry(self) -> 'Attribute':
+        """The value of the model geometry score component."""
+    @property
+    def stereo_outliers(self) -> 'Attribute':
+        """Number of stereochemical/chirality errors."""
+    @property
+    def type(self) -> 'Attribute':
+        """Score type."""
+
+class Attr_ConnectTarget(AttributeGroup):
+    """"""
+    @property
+    def auth_asym_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_asym_id in the  ATOM_SITE category."""
+    @property
+    def auth_seq_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_seq_id in the  ATOM_SITE category."""
+    @property
+    def label_alt_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category."""
+    @property
+    def label_asym_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category."""
+    @property
+    def label_atom_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_atom_id in the  ATOM_SITE category."""
+    @property
+    def label_comp_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category."""
+    @property
+    def label_seq_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.connect_target_label_seq_id in the  ATOM_SITE category."""
+    @property
+    def symmetry(self) -> 'Attribute':
+        """Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_nonpolymer_struct_conn.label* to generate the  target of the structure connection."""
+
+class Attr_ConnectPartner(AttributeGroup):
+    """"""
+    @property
+    def label_alt_id(self) -> 'Attribute':
+        """A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category."""
+    @property
+    def label_asym_id(self) -> 'Attribute':
+        """A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category."""
+    @property
+    def label_atom_id(self) -> 'Attribute':
+        """A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _chem_comp_atom.atom_id in the  CHEM_COMP_ATOM category."""
+    @property
+    def label_comp_id(self) -> 'Attribute':
+        """A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category."""
+    @property
+    def label_seq_id(self) -> 'Attribute':
+        """A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_seq_id in the  ATOM_SITE category."""
+    @property
+    def symmetry(self) -> 'Attribute':
+        """Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_nonpolymer_struct_conn.connect_partner_label* to generate the  partner in the structure connection."""
+
+class Attr_RcsbNonpolymerStructConn(AttributeGroup):
+    """"""
+    @property
+    def connect_type(self) -> 'Attribute':
+        """The connection type."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description of special details of the connection."""
+    @property
+    def dist_value(self) -> 'Attribute':
+        """Distance value for this contact."""
+    @property
+    def id(self) -> 'Attribute':
+        """The value of _rcsb_nonpolymer_struct_conn.id is an identifier for connection.   Note that this item need not be a number; it can be any unique  identifier."""
+    @property
+    def ordinal_id(self) -> 'Attribute':
+        """The value of _rcsb_nonpolymer_struct_conn.id must uniquely identify a record in  the rcsb_nonpolymer_struct_conn list."""
+    @property
+    def role(self) -> 'Attribute':
+        """The chemical or structural role of the interaction"""
+    @property
+    def value_order(self) -> 'Attribute':
+        """The chemical bond order associated with the specified atoms in  this contact."""
+    @property
+    def connect_target(self) -> 'Attr_ConnectTarget':
+        """"""
+    @property
+    def connect_partner(self) -> 'Attr_ConnectPartner':
+        """"""
+
+class Attr_RcsbTargetNeighbors(AttributeGroup):
+    """"""
+    @property
+    def alt_id(self) -> 'Attribute':
+        """Alternate conformer identifier for the non-polymer entity instance."""
+    @property
+    def atom_id(self) -> 'Attribute':
+        """The atom identifier for the non-polymer entity instance."""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """Component identifier for the non-polymer entity instance."""
+    @property
+    def distance(self) -> 'Attribute':
+        """Distance value for this target interaction."""
+    @property
+    def target_asym_id(self) -> 'Attribute':
+        """The entity instance identifier for the target of interaction."""
+    @property
+    def target_atom_id(self) -> 'Attribute':
+        """The atom identifier for the target of interaction."""
+    @property
+    def target_auth_seq_id(self) -> 'Attribute':
+        """The author residue index for the target of interaction."""
+    @property
+    def target_comp_id(self) -> 'Attribute':
+        """The chemical component identifier for the target of interaction."""
+    @property
+    def target_entity_id(self) -> 'Attribute':
+        """The entity identifier for the target of interaction."""
+    @property
+    def target_is_bound(self) -> 'Attribute':
+        """A flag to indicate the nature of the target interaction is covalent or metal-coordination."""
+    @property
+    def target_model_id(self) -> 'Attribute':
+        """Model identifier for the target of interaction."""
+    @property
+    def target_seq_id(self) -> 'Attribute':
+        """The sequence position for the target of interaction."""
+
+class Attr_StructAsym(AttributeGroup):
+    """"""
+    @property
+    def pdbx_PDB_id(self) -> 'Attribute':
+        """This data item is a pointer to _atom_site.pdbx_PDB_strand_id the  ATOM_SITE category."""
+    @property
+    def pdbx_alt_id(self) -> 'Attribute':
+        """This data item is a pointer to _atom_site.ndb_alias_strand_id the  ATOM_SITE category."""
+    @property
+    def pdbx_order(self) -> 'Attribute':
+        """This data item gives the order of the structural elements in the  ATOM_SITE category."""
+    @property
+    def pdbx_type(self) -> 'Attribute':
+        """This data item describes the general type of the structural elements  in the ATOM_SITE category."""
+
+class Attr_ReferenceSequenceIdentifiers(AttributeGroup):
+    """"""
+    @property
+    def database_accession(self) -> 'Attribute':
+        """Reference database accession code"""
+    @property
+    def database_isoform(self) -> 'Attribute':
+        """Reference database identifier for the sequence isoform"""
+    @property
+    def database_name(self) -> 'Attribute':
+        """Reference database name"""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Source of the reference database assignment"""
+
+class Attr_RcsbUniprotContainerIdentifiers(AttributeGroup):
+    """"""
+    @property
+    def uniprot_id(self) -> 'Attribute':
+        """Primary accession number of a given UniProtKB entry."""
+    @property
+    def reference_sequence_identifiers(self) -> 'Attr_ReferenceSequenceIdentifiers':
+        """"""
+
+class Attr_RcsbUniprotKeyword(AttributeGroup):
+    """Keywords constitute a controlled vocabulary that summarises the content of a UniProtKB entry."""
+    @property
+    def id(self) -> 'Attribute':
+        """A unique keyword identifier."""
+    @property
+    def value(self) -> 'Attribute':
+        """Human-readable keyword term."""
+
+class Attr_Name(AttributeGroup):
+    """"""
+    @property
+    def value(self) -> 'Attribute':
+        """Name that allows to unambiguously identify a protein."""
+    @property
+    def provenance_code(self) -> 'Attribute':
+        """Historical record of the data attribute."""
+
+class Attr_Function(AttributeGroup):
+    """"""
+    @property
+    def details(self) -> 'Attribute':
+        """General function(s) of a protein."""
+    @property
+    def provenance_code(self) -> 'Attribute':
+        """Historical record of the data attribute."""
+
+class Attr_Name_2(AttributeGroup):
+    """"""
+    @property
+    def type(self) -> 'Attribute':
+        """"""
+    @property
+    def value(self) -> 'Attribute':
+        """"""
+
+class Attr_Gene(AttributeGroup):
+    """"""
+    @property
+    def name(self) -> 'Attr_Name_2':
+        """"""
+
+class Attr_SourceOrganism(AttributeGroup):
+    """Taxonomy information on the organism that is the source of the protein sequence."""
+    @property
+    def scientific_name(self) -> 'Attribute':
+        """The scientific name of the organism in which a protein occurs."""
+    @property
+    def taxonomy_id(self) -> 'Attribute':
+        """NCBI Taxonomy identifier for the organism in which a protein occurs."""
+    @property
+    def provenance_code(self) -> 'Attribute':
+        """Historical record of the data attribute."""
+
+class Attr_Ec(AttributeGroup):
+    """"""
+    @property
+    def number(self) -> 'Attribute':
+        """"""
+    @property
+    def provenance_code(self) -> 'Attribute':
+        """Historical record of the data attribute."""
+
+class Attr_RcsbUniprotProtein(AttributeGroup):
+    """"""
+    @property
+    def sequence(self) -> 'Attribute':
+        """Protein sequence data for canonical protein sequence."""
+    @property
+    def name(self) -> 'Attr_Name':
+        """"""
+    @property
+    def function(self) -> 'Attr_Function':
+        """"""
+    @property
+    def gene(self) -> 'Attr_Gene':
+        """"""
+    @property
+    def source_organism(self) -> 'Attr_SourceOrganism':
+        """Taxonomy information on the organism that is the source of the protein sequence."""
+    @property
+    def ec(self) -> 'Attr_Ec':
+        """"""
+
+class Attr_FeaturePositions_2(AttributeGroup):
+    """"""
+    @property
+    def beg_comp_id(self) -> 'Attribute':
+        """An identifier for the monomer(s) corresponding to the feature assignment."""
+    @property
+    def beg_seq_id(self) -> 'Attribute':
+        """An identifier for the monomer at which this segment of the feature begins."""
+    @property
+    def end_seq_id(self) -> 'Attribute':
+        """An identifier for the monomer at which this segment of the feature ends."""
+    @property
+    def value(self) -> 'Attribute':
+        """The value for the feature over this monomer segment."""
+    @property
+    def values(self) -> 'Attribute':
+        """"""
+
+class Attr_RcsbUniprotFeature(AttributeGroup):
+    """"""
+    @property
+    def assignment_version(self) -> 'Attribute':
+        """Identifies the version of the feature assignment."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description for the feature."""
+    @property
+    def feature_id(self) -> 'Attribute':
+        """An identifier for the feature."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name for the feature."""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Code identifying the individual, organization or program that  assigned the feature."""
+    @property
+    def reference_scheme(self) -> 'Attribute':
+        """Code residue coordinate system for the assigned feature."""
+    @property
+    def type(self) -> 'Attribute':
+        """A type or category of the feature."""
+    @property
+    def feature_positions(self) -> 'Attr_FeaturePositions_2':
+        """"""
+
+class Attr_AdditionalProperties_2(AttributeGroup):
+    """"""
+    @property
+    def name(self) -> 'Attribute':
+        """The additional property name"""
+    @property
+    def values(self) -> 'Attribute':
+        """"""
+
+class Attr_RcsbUniprotAnnotation(AttributeGroup):
+    """"""
+    @property
+    def annotation_id(self) -> 'Attribute':
+        """An identifier for the annotation."""
+    @property
+    def assignment_version(self) -> 'Attribute':
+        """Identifies the version of the annotation assignment."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description for the annotation."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name for the annotation."""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Code identifying the individual, organization or program that  assigned the annotation."""
+    @property
+    def type(self) -> 'Attribute':
+        """A type or category of the annotation."""
+    @property
+    def annotation_lineage(self) -> 'Attr_AnnotationLineage':
+        """"""
+    @property
+    def additional_properties(self) -> 'Attr_AdditionalProperties_2':
+        """"""
+
+class Attr_RcsbUniprotExternalReference(AttributeGroup):
+    """"""
+    @property
+    def reference_id(self) -> 'Attribute':
+        """"""
+    @property
+    def reference_name(self) -> 'Attribute':
+        """"""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """"""
+
+class Attr_Scores(AttributeGroup):
+    """Alignment scores"""
+    @property
+    def target_coverage(self) -> 'Attribute':
+        """"""
+    @property
+    def query_coverage(self) -> 'Attribute':
+        """"""
+    @property
+    def target_length(self) -> 'Attribute':
+        """"""
+    @property
+    def query_length(self) -> 'Attribute':
+        """"""
+
+class Attr_AlignedRegions(AttributeGroup):
+    """Aligned sequence regions"""
+    @property
+    def target_begin(self) -> 'Attribute':
+        """NCBI sequence start position"""
+    @property
+    def query_begin(self) -> 'Attribute':
+        """Entity seqeunce start position"""
+    @property
+    def length(self) -> 'Attribute':
+        """Aligned region length"""
+
+class Attr_CoreEntityIdentifiers(AttributeGroup):
+    """core_entity identifiers"""
+    @property
+    def entry_id(self) -> 'Attribute':
+        """"""
+    @property
+    def entity_id(self) -> 'Attribute':
+        """"""
+
+class Attr_CoreEntityAlignments(AttributeGroup):
+    """List of alignments with core_entity canonical sequences"""
+    @property
+    def scores(self) -> 'Attr_Scores':
+        """Alignment scores"""
+    @property
+    def aligned_regions(self) -> 'Attr_AlignedRegions':
+        """Aligned sequence regions"""
+    @property
+    def core_entity_identifiers(self) -> 'Attr_CoreEntityIdentifiers':
+        """core_entity identifiers"""
+
+class Attr_RcsbUniprotAlignments(AttributeGroup):
+    """UniProt pairwise sequence alignments."""
+    @property
+    def core_entity_alignments(self) -> 'Attr_CoreEntityAlignments':
+        """List of alignments with core_entity canonical sequences"""
+
+class Attr_RcsbBranchedEntityInstanceContainerIdentifiers(AttributeGroup):
+    """"""
+    @property
+    def asym_id(self) -> 'Attribute':
+        """Instance identifier for this container."""
+    @property
+    def auth_asym_id(self) -> 'Attribute':
+        """Author instance identifier for this container."""
+    @property
+    def entity_id(self) -> 'Attribute':
+        """Entity identifier for the container."""
+    @property
+    def entry_id(self) -> 'Attribute':
+        """Entry identifier for the container."""
+    @property
+    def rcsb_id(self) -> 'Attribute':
+        """A unique identifier for each object in this entity instance container formed by  an 'dot' (.) separated concatenation of entry and entity instance identifiers."""
+
+class Attr_RcsbBranchedInstanceAnnotation(AttributeGroup):
+    """"""
+    @property
+    def annotation_id(self) -> 'Attribute':
+        """An identifier for the annotation."""
+    @property
+    def assignment_version(self) -> 'Attribute':
+        """Identifies the version of the annotation assignment."""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """Chemical component identifier."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description for the annotation."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name for the annotation."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """Ordinal identifier for this category"""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Code identifying the individual, organization or program that  assigned the annotation."""
+    @property
+    def type(self) -> 'Attribute':
+        """A type or category of the annotation."""
+    @property
+    def annotation_lineage(self) -> 'Attr_AnnotationLineage':
+        """"""
+
+class Attr_FeaturePositions_3(AttributeGroup):
+    """"""
+    @property
+    def beg_comp_id(self) -> 'Attribute':
+        """An identifier for the monomer(s) corresponding to the feature assignment."""
+    @property
+    def beg_seq_id(self) -> 'Attribute':
+        """An identifier for the leading monomer feature position."""
+    @property
+    def end_seq_id(self) -> 'Attribute':
+        """An identifier for the terminal monomer feature position."""
+    @property
+    def value(self) -> 'Attribute':
+        """The value of the feature at the monomer position."""
+    @property
+    def values(self) -> 'Attribute':
+        """"""
+
+class Attr_RcsbBranchedInstanceFeature(AttributeGroup):
+    """"""
+    @property
+    def assignment_version(self) -> 'Attribute':
+        """Identifies the version of the feature assignment."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description for the feature."""
+    @property
+    def feature_id(self) -> 'Attribute':
+        """An identifier for the feature."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name for the feature."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """Ordinal identifier for this category"""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Code identifying the individual, organization or program that  assigned the feature."""
+    @property
+    def reference_scheme(self) -> 'Attribute':
+        """Code residue coordinate system for the assigned feature."""
+    @property
+    def type(self) -> 'Attribute':
+        """A type or category of the feature."""
+    @property
+    def feature_positions(self) -> 'Attr_FeaturePositions_3':
+        """"""
+    @property
+    def feature_value(self) -> 'Attr_FeatureValue':
+        """"""
+    @property
+    def additional_properties(self) -> 'Attr_AdditionalProperties':
+        """"""
+
+class Attr_RcsbBranchedInstanceFeatureSummary(AttributeGroup):
+    """"""
+    @property
+    def count(self) -> 'Attribute':
+        """The feature count."""
+    @property
+    def coverage(self) -> 'Attribute':
+        """The fractional feature coverage relative to the full branched entity."""
+    @property
+    def maximum_length(self) -> 'Attribute':
+        """The maximum feature length."""
+    @property
+    def maximum_value(self) -> 'Attribute':
+        """The maximum feature value."""
+    @property
+    def minimum_length(self) -> 'Attribute':
+        """The minimum feature length."""
+    @property
+    def minimum_value(self) -> 'Attribute':
+        """The minimum feature value."""
+    @property
+    def type(self) -> 'Attribute':
+        """Type or category of the feature."""
+
+class Attr_ConnectTarget_2(AttributeGroup):
+    """"""
+    @property
+    def auth_asym_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_asym_id in the  ATOM_SITE category."""
+    @property
+    def auth_seq_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_seq_id in the  ATOM_SITE category."""
+    @property
+    def label_alt_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category."""
+    @property
+    def label_asym_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category."""
+    @property
+    def label_atom_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_atom_id in the  ATOM_SITE category."""
+    @property
+    def label_comp_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category."""
+    @property
+    def label_seq_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.connect_target_label_seq_id in the  ATOM_SITE category."""
+    @property
+    def symmetry(self) -> 'Attribute':
+        """Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_branched_struct_conn.label* to generate the  target of the structure connection."""
+
+class Attr_ConnectPartner_2(AttributeGroup):
+    """"""
+    @property
+    def label_alt_id(self) -> 'Attribute':
+        """A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category."""
+    @property
+    def label_asym_id(self) -> 'Attribute':
+        """A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category."""
+    @property
+    def label_atom_id(self) -> 'Attribute':
+        """A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _chem_comp_atom.atom_id in the  CHEM_COMP_ATOM category."""
+    @property
+    def label_comp_id(self) -> 'Attribute':
+        """A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category."""
+    @property
+    def label_seq_id(self) -> 'Attribute':
+        """A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_seq_id in the  ATOM_SITE category."""
+    @property
+    def symmetry(self) -> 'Attribute':
+        """Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_branched_struct_conn.connect_partner_label* to generate the  partner in the structure connection."""
+
+class Attr_RcsbBranchedStructConn(AttributeGroup):
+    """"""
+    @property
+    def connect_type(self) -> 'Attribute':
+        """The connection type."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description of special details of the connection."""
+    @property
+    def dist_value(self) -> 'Attribute':
+        """Distance value for this contact."""
+    @property
+    def id(self) -> 'Attribute':
+        """The value of _rcsb_branched_struct_conn.id is an identifier for connection."""
+    @property
+    def ordinal_id(self) -> 'Attribute':
+        """The value of _rcsb_branched_struct_conn.id must uniquely identify a record in  the rcsb_branched_struct_conn list."""
+    @property
+    def role(self) -> 'Attribute':
+        """The chemical or structural role of the interaction"""
+    @property
+    def value_order(self) -> 'Attribute':
+        """The chemical bond order associated with the specified atoms in  this contact."""
+    @property
+    def connect_target(self) -> 'Attr_ConnectTarget_2':
+        """"""
+    @property
+    def connect_partner(self) -> 'Attr_ConnectPartner_2':
+        """"""
+
+class Attr_RcsbLigandNeighbors(AttributeGroup):
+    """"""
+    @property
+    def alt_id(self) -> 'Attribute':
+        """Alternate conformer identifier for the target instance."""
+    @property
+    def atom_id(self) -> 'Attribute':
+        """The atom identifier for the target instance."""
+    @property
+    def auth_seq_id(self) -> 'Attribute':
+        """The author residue index for the target instance."""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """Component identifier for the target instance."""
+    @property
+    def distance(self) -> 'Attribute':
+        """Distance value for this ligand interaction."""
+    @property
+    def ligand_alt_id(self) -> 'Attribute':
+        """Alternate conformer identifier for the ligand interaction."""
+    @property
+    def ligand_asym_id(self) -> 'Attribute':
+        """The entity instance identifier for the ligand interaction."""
+    @property
+    def ligand_atom_id(self) -> 'Attribute':
+        """The atom identifier for the ligand interaction."""
+    @property
+    def ligand_comp_id(self) -> 'Attribute':
+        """The chemical component identifier for the ligand interaction."""
+    @property
+    def ligand_entity_id(self) -> 'Attribute':
+        """The entity identifier for the ligand of interaction."""
+    @property
+    def ligand_is_bound(self) -> 'Attribute':
+        """A flag to indicate the nature of the ligand interaction is covalent or metal-coordination."""
+    @property
+    def ligand_model_id(self) -> 'Attribute':
+        """Model identifier for the ligand interaction."""
+    @property
+    def seq_id(self) -> 'Attribute':
+        """The sequence position for the target instance."""
+
+class Attr_PdbxEntityBranch(AttributeGroup):
+    """"""
+    @property
+    def rcsb_branched_component_count(self) -> 'Attribute':
+        """Number of constituent chemical components in the branched entity."""
+    @property
+    def type(self) -> 'Attribute':
+        """The type of this branched oligosaccharide."""
+
+class Attr_PdbxEntityBranchDescriptor(AttributeGroup):
+    """"""
+    @property
+    def descriptor(self) -> 'Attribute':
+        """This data item contains the descriptor value for this  entity."""
+    @property
+    def program(self) -> 'Attribute':
+        """This data item contains the name of the program  or library used to compute the descriptor."""
+    @property
+    def program_version(self) -> 'Attribute':
+        """This data item contains the version of the program  or library used to compute the descriptor."""
+    @property
+    def type(self) -> 'Attribute':
+        """This data item contains the descriptor type."""
+
+class Attr_RcsbBranchedEntity(AttributeGroup):
+    """"""
+    @property
+    def details(self) -> 'Attribute':
+        """A description of special aspects of the branched entity."""
+    @property
+    def formula_weight(self) -> 'Attribute':
+        """Formula mass (KDa) of the branched entity."""
+    @property
+    def pdbx_description(self) -> 'Attribute':
+        """A description of the branched entity."""
+    @property
+    def pdbx_number_of_molecules(self) -> 'Attribute':
+        """The number of molecules of the branched entity in the entry."""
+
+class Attr_ReferenceIdentifiers(AttributeGroup):
+    """"""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Source of the reference resource assignment"""
+    @property
+    def resource_accession(self) -> 'Attribute':
+        """Reference resource accession code"""
+    @property
+    def resource_name(self) -> 'Attribute':
+        """Reference resource name"""
+
+class Attr_RcsbBranchedEntityContainerIdentifiers(AttributeGroup):
+    """"""
+    @property
+    def asym_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def auth_asym_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def chem_comp_monomers(self) -> 'Attribute':
+        """"""
+    @property
+    def chem_ref_def_id(self) -> 'Attribute':
+        """The chemical reference definition identifier for the entity in this container."""
+    @property
+    def entity_id(self) -> 'Attribute':
+        """Entity identifier for the container."""
+    @property
+    def entry_id(self) -> 'Attribute':
+        """Entry identifier for the container."""
+    @property
+    def prd_id(self) -> 'Attribute':
+        """The BIRD identifier for the entity in this container."""
+    @property
+    def rcsb_id(self) -> 'Attribute':
+        """A unique identifier for each object in this entity container formed by  an underscore separated concatenation of entry and entity identifiers."""
+    @property
+    def reference_identifiers(self) -> 'Attr_ReferenceIdentifiers':
+        """"""
+
+class Attr_FeaturePositions_4(AttributeGroup):
+    """"""
+    @property
+    def beg_comp_id(self) -> 'Attribute':
+        """An identifier for the leading monomer corresponding to the feature assignment."""
+    @property
+    def beg_seq_id(self) -> 'Attribute':
+        """An identifier for the leading monomer position of the feature."""
+    @property
+    def end_seq_id(self) -> 'Attribute':
+        """An identifier for the leading monomer position of the feature."""
+    @property
+    def value(self) -> 'Attribute':
+        """The value for the feature at this monomer."""
+
+class Attr_RcsbBranchedEntityFeature(AttributeGroup):
+    """"""
+    @property
+    def assignment_version(self) -> 'Attribute':
+        """Identifies the version of the feature assignment."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description for the feature."""
+    @property
+    def feature_id(self) -> 'Attribute':
+        """An identifier for the feature."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name for the feature."""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Code identifying the individual, organization or program that  assigned the feature."""
+    @property
+    def reference_scheme(self) -> 'Attribute':
+        """Code residue coordinate system for the assigned feature."""
+    @property
+    def type(self) -> 'Attribute':
+        """A type or category of the feature."""
+    @property
+    def feature_positions(self) -> 'Attr_FeaturePositions_4':
+        """"""
+    @property
+    def additional_properties(self) -> 'Attr_AdditionalProperties':
+        """"""
+
+class Attr_RcsbBranchedEntityKeywords(AttributeGroup):
+    """"""
+    @property
+    def text(self) -> 'Attribute':
+        """Keywords describing this branched entity."""
+
+class Attr_RcsbBranchedEntityNameCom(AttributeGroup):
+    """"""
+    @property
+    def name(self) -> 'Attribute':
+        """A common name for the branched entity."""
+
+class Attr_RcsbBranchedEntityNameSys(AttributeGroup):
+    """"""
+    @property
+    def name(self) -> 'Attribute':
+        """The systematic name for the branched entity."""
+    @property
+    def system(self) -> 'Attribute':
+        """The system used to generate the systematic name of the branched entity."""
+
+class Attr_RcsbPolymerEntityInstanceContainerIdentifiers(AttributeGroup):
+    """"""
+    @property
+    def asym_id(self) -> 'Attribute':
+        """Instance identifier for this container."""
+    @property
+    def auth_asym_id(self) -> 'Attribute':
+        """Author instance identifier for this container."""
+    @property
+    def auth_to_entity_poly_seq_mapping(self) -> 'Attribute':
+        """"""
+    @property
+    def entity_id(self) -> 'Attribute':
+        """Entity identifier for the container."""
+    @property
+    def entry_id(self) -> 'Attribute':
+        """Entry identifier for the container."""
+    @property
+    def rcsb_id(self) -> 'Attribute':
+        """A unique identifier for each object in this entity instance container formed by  an 'dot' (.) separated concatenation of entry and entity instance identifiers."""
+
+class Attr_RcsbPolymerInstanceAnnotation(AttributeGroup):
+    """"""
+    @property
+    def annotation_id(self) -> 'Attribute':
+        """An identifier for the annotation."""
+    @property
+    def assignment_version(self) -> 'Attribute':
+        """Identifies the version of the annotation assignment."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description for the annotation."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name for the annotation."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """Ordinal identifier for this category"""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Code identifying the individual, organization or program that  assigned the annotation."""
+    @property
+    def type(self) -> 'Attribute':
+        """A type or category of the annotation."""
+    @property
+    def annotation_lineage(self) -> 'Attr_AnnotationLineage':
+        """"""
+
+class Attr_FeaturePositions_5(AttributeGroup):
+    """"""
+    @property
+    def beg_comp_id(self) -> 'Attribute':
+        """An identifier for the monomer(s) corresponding to the feature assignment."""
+    @property
+    def beg_seq_id(self) -> 'Attribute':
+        """An identifier for the monomer at which this segment of the feature begins."""
+    @property
+    def end_seq_id(self) -> 'Attribute':
+        """An identifier for the monomer at which this segment of the feature ends."""
+    @property
+    def value(self) -> 'Attribute':
+        """The value of the feature over the monomer segment."""
+    @property
+    def values(self) -> 'Attribute':
+        """"""
+
+class Attr_RcsbPolymerInstanceFeature(AttributeGroup):
+    """"""
+    @property
+    def assignment_version(self) -> 'Attribute':
+        """Identifies the version of the feature assignment."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description for the feature."""
+    @property
+    def feature_id(self) -> 'Attribute':
+        """An identifier for the feature."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name for the feature."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """Ordinal identifier for this category"""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Code identifying the individual, organization or program that  assigned the feature."""
+    @property
+    def reference_scheme(self) -> 'Attribute':
+        """Code residue coordinate system for the assigned feature."""
+    @property
+    def type(self) -> 'Attribute':
+        """A type or category of the feature."""
+    @property
+    def feature_positions(self) -> 'Attr_FeaturePositions_5':
+        """"""
+    @property
+    def additional_properties(self) -> 'Attr_AdditionalProperties':
+        """"""
+
+class Attr_RcsbPolymerInstanceFeatureSummary(AttributeGroup):
+    """"""
+    @property
+    def count(self) -> 'Attribute':
+        """The feature count per polymer chain."""
+    @property
+    def coverage(self) -> 'Attribute':
+        """The fractional feature coverage relative to the full entity sequence."""
+    @property
+    def maximum_length(self) -> 'Attribute':
+        """The maximum feature length."""
+    @property
+    def maximum_value(self) -> 'Attribute':
+        """The maximum feature value."""
+    @property
+    def minimum_length(self) -> 'Attribute':
+        """The minimum feature length."""
+    @property
+    def minimum_value(self) -> 'Attribute':
+        """The minimum feature value."""
+    @property
+    def type(self) -> 'Attribute':
+        """Type or category of the feature."""
+
+class Attr_RcsbPolymerInstanceInfo(AttributeGroup):
+    """"""
+    @property
+    def modeled_residue_count(self) -> 'Attribute':
+        """The number of modeled residues in the polymer instance."""
+
+class Attr_ConnectTarget_3(AttributeGroup):
+    """"""
+    @property
+    def auth_asym_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_asym_id in the  ATOM_SITE category."""
+    @property
+    def auth_seq_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.auth_seq_id in the  ATOM_SITE category."""
+    @property
+    def label_alt_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category."""
+    @property
+    def label_asym_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category."""
+    @property
+    def label_atom_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_atom_id in the  ATOM_SITE category."""
+    @property
+    def label_comp_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category."""
+    @property
+    def label_seq_id(self) -> 'Attribute':
+        """A component of the identifier for the target of the structure  connection.   This data item is a pointer to _atom_site.connect_target_label_seq_id in the  ATOM_SITE category."""
+    @property
+    def symmetry(self) -> 'Attribute':
+        """Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_polymer_struct_conn.label* to generate the  target of the structure connection."""
+
+class Attr_ConnectPartner_3(AttributeGroup):
+    """"""
+    @property
+    def label_alt_id(self) -> 'Attribute':
+        """A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_alt_id in the  ATOM_SITE category."""
+    @property
+    def label_asym_id(self) -> 'Attribute':
+        """A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_asym_id in the  ATOM_SITE category."""
+    @property
+    def label_atom_id(self) -> 'Attribute':
+        """A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _chem_comp_atom.atom_id in the  CHEM_COMP_ATOM category."""
+    @property
+    def label_comp_id(self) -> 'Attribute':
+        """A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_comp_id in the  ATOM_SITE category."""
+    @property
+    def label_seq_id(self) -> 'Attribute':
+        """A component of the identifier for the partner in the structure  connection.   This data item is a pointer to _atom_site.label_seq_id in the  ATOM_SITE category."""
+    @property
+    def symmetry(self) -> 'Attribute':
+        """Describes the symmetry operation that should be applied to the  atom set specified by _rcsb_polymer_struct_conn.connect_partner_label* to generate the  partner in the structure connection."""
+
+class Attr_RcsbPolymerStructConn(AttributeGroup):
+    """"""
+    @property
+    def connect_type(self) -> 'Attribute':
+        """The connection type."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description of special details of the connection."""
+    @property
+    def dist_value(self) -> 'Attribute':
+        """Distance value for this contact."""
+    @property
+    def id(self) -> 'Attribute':
+        """The value of _rcsb_polymer_struct_conn.id is an identifier for connection.   Note that this item need not be a number; it can be any unique  identifier."""
+    @property
+    def ordinal_id(self) -> 'Attribute':
+        """The value of _rcsb_polymer_struct_conn.id must uniquely identify a record in  the rcsb_polymer_struct_conn list."""
+    @property
+    def role(self) -> 'Attribute':
+        """The chemical or structural role of the interaction"""
+    @property
+    def value_order(self) -> 'Attribute':
+        """The chemical bond order associated with the specified atoms in  this contact."""
+    @property
+    def connect_target(self) -> 'Attr_ConnectTarget_3':
+        """"""
+    @property
+    def connect_partner(self) -> 'Attr_ConnectPartner_3':
+        """"""
+
+class Attr_AuditAuthor(AttributeGroup):
+    """"""
+    @property
+    def identifier_ORCID(self) -> 'Attribute':
+        """The Open Researcher and Contributor ID (ORCID)."""
+    @property
+    def name(self) -> 'Attribute':
+        """The name of an author of this data block. If there are multiple  authors, _audit_author.name is looped with _audit_author.address.  The family name(s), followed by a comma and including any  dynastic components, precedes the first name(s) or initial(s)."""
+    @property
+    def pdbx_ordinal(self) -> 'Attribute':
+        """This data item defines the order of the author's name in the  list of audit authors."""
+
+class Attr_Cell(AttributeGroup):
+    """"""
+    @property
+    def Z_PDB(self) -> 'Attribute':
+        """The number of the polymeric chains in a unit cell. In the case  of heteropolymers, Z is the number of occurrences of the most  populous chain.   This data item is provided for compatibility with the original  Protein Data Bank format, and only for that purpose."""
+    @property
+    def angle_alpha(self) -> 'Attribute':
+        """Unit-cell angle alpha of the reported structure in degrees."""
+    @property
+    def angle_beta(self) -> 'Attribute':
+        """Unit-cell angle beta of the reported structure in degrees."""
+    @property
+    def angle_gamma(self) -> 'Attribute':
+        """Unit-cell angle gamma of the reported structure in degrees."""
+    @property
+    def formula_units_Z(self) -> 'Attribute':
+        """The number of the formula units in the unit cell as specified  by _chemical_formula.structural, _chemical_formula.moiety or  _chemical_formula.sum."""
+    @property
+    def length_a(self) -> 'Attribute':
+        """Unit-cell length a corresponding to the structure reported in angstroms."""
+    @property
+    def length_b(self) -> 'Attribute':
+        """Unit-cell length b corresponding to the structure reported in  angstroms."""
+    @property
+    def length_c(self) -> 'Attribute':
+        """Unit-cell length c corresponding to the structure reported in angstroms."""
+    @property
+    def pdbx_unique_axis(self) -> 'Attribute':
+        """To further identify unique axis if necessary.  E.g., P 21 with  an unique C axis will have 'C' in this field."""
+    @property
+    def volume(self) -> 'Attribute':
+        """Cell volume V in angstroms cubed.   V = a b c (1 - cos^2^~alpha~ - cos^2^~beta~ - cos^2^~gamma~             + 2 cos~alpha~ cos~beta~ cos~gamma~)^1/2^   a     = _cell.length_a  b     = _cell.length_b  c     = _cell.length_c  alpha = _cell.angle_alpha  beta  = _cell.angle_beta  gamma = _cell.angle_gamma"""
+
+class Attr_Citation(AttributeGroup):
+    """"""
+    @property
+    def book_id_ISBN(self) -> 'Attribute':
+        """The International Standard Book Number (ISBN) code assigned to  the book cited; relevant for books or book chapters."""
+    @property
+    def book_publisher(self) -> 'Attribute':
+        """The name of the publisher of the citation; relevant  for books or book chapters."""
+    @property
+    def book_publisher_city(self) -> 'Attribute':
+        """The location of the publisher of the citation; relevant  for books or book chapters."""
+    @property
+    def book_title(self) -> 'Attribute':
+        """The title of the book in which the citation appeared; relevant  for books or book chapters."""
+    @property
+    def coordinate_linkage(self) -> 'Attribute':
+        """_citation.coordinate_linkage states whether this citation  is concerned with precisely the set of coordinates given in the  data block. If, for instance, the publication described the same  structure, but the coordinates had undergone further refinement  prior to the creation of the data block, the value of this data  item would be 'no'."""
+    @property
+    def country(self) -> 'Attribute':
+        """The country/region of publication; relevant for books  and book chapters."""
+    @property
+    def id(self) -> 'Attribute':
+        """The value of _citation.id must uniquely identify a record in the  CITATION list.   The _citation.id 'primary' should be used to indicate the  citation that the author(s) consider to be the most pertinent to  the contents of the data block.   Note that this item need not be a number; it can be any unique  identifier."""
+    @property
+    def journal_abbrev(self) -> 'Attribute':
+        """Abbreviated name of the cited journal as given in the  Chemical Abstracts Service Source Index."""
+    @property
+    def journal_full(self) -> 'Attribute':
+        """Full name of the cited journal; relevant for journal articles."""
+    @property
+    def journal_id_ASTM(self) -> 'Attribute':
+        """The American Society for Testing and Materials (ASTM) code  assigned to the journal cited (also referred to as the CODEN  designator of the Chemical Abstracts Service); relevant for  journal articles."""
+    @property
+    def journal_id_CSD(self) -> 'Attribute':
+        """The Cambridge Structural Database (CSD) code assigned to the  journal cited; relevant for journal articles. This is also the  system used at the Protein Data Bank (PDB)."""
+    @property
+    def journal_id_ISSN(self) -> 'Attribute':
+        """The International Standard Serial Number (ISSN) code assigned to  the journal cited; relevant for journal articles."""
+    @property
+    def journal_issue(self) -> 'Attribute':
+        """Issue number of the journal cited; relevant for journal  articles."""
+    @property
+    def journal_volume(self) -> 'Attribute':
+        """Volume number of the journal cited; relevant for journal  articles."""
+    @property
+    def language(self) -> 'Attribute':
+        """Language in which the cited article is written."""
+    @property
+    def page_first(self) -> 'Attribute':
+        """The first page of the citation; relevant for journal  articles, books and book chapters."""
+    @property
+    def page_last(self) -> 'Attribute':
+        """The last page of the citation; relevant for journal  articles, books and book chapters."""
+    @property
+    def pdbx_database_id_DOI(self) -> 'Attribute':
+        """Document Object Identifier used by doi.org to uniquely  specify bibliographic entry."""
+    @property
+    def pdbx_database_id_PubMed(self) -> 'Attribute':
+        """Ascession number used by PubMed to categorize a specific  bibliographic entry."""
+    @property
+    def rcsb_authors(self) -> 'Attribute':
+        """"""
+    @property
+    def rcsb_is_primary(self) -> 'Attribute':
+        """Flag to indicate a primary citation."""
+    @property
+    def rcsb_journal_abbrev(self) -> 'Attribute':
+        """Normalized journal abbreviation."""
+    @property
+    def title(self) -> 'Attribute':
+        """The title of the citation; relevant for journal articles, books  and book chapters."""
+    @property
+    def unpublished_flag(self) -> 'Attribute':
+        """Flag to indicate that this citation will not be published."""
+    @property
+    def year(self) -> 'Attribute':
+        """The year of the citation; relevant for journal articles, books  and book chapters."""
+
+class Attr_Database2(AttributeGroup):
+    """"""
+    @property
+    def database_code(self) -> 'Attribute':
+        """The code assigned by the database identified in  _database_2.database_id."""
+    @property
+    def database_id(self) -> 'Attribute':
+        """An abbreviation that identifies the database."""
+    @property
+    def pdbx_DOI(self) -> 'Attribute':
+        """Document Object Identifier (DOI) for this entry registered with http://crossref.org."""
+    @property
+    def pdbx_database_accession(self) -> 'Attribute':
+        """Extended accession code issued for for _database_2.database_code assigned by the database identified in  _database_2.database_id."""
+
+class Attr_Diffrn(AttributeGroup):
+    """"""
+    @property
+    def ambient_pressure(self) -> 'Attribute':
+        """The mean hydrostatic pressure in kilopascals at which the  intensities were measured."""
+    @property
+    def ambient_temp(self) -> 'Attribute':
+        """The mean temperature in kelvins at which the intensities were  measured."""
+    @property
+    def ambient_temp_details(self) -> 'Attribute':
+        """A description of special aspects of temperature control during  data collection."""
+    @property
+    def crystal_id(self) -> 'Attribute':
+        """This data item is a pointer to _exptl_crystal.id in the  EXPTL_CRYSTAL category."""
+    @property
+    def crystal_support(self) -> 'Attribute':
+        """The physical device used to support the crystal during data  collection."""
+    @property
+    def details(self) -> 'Attribute':
+        """Special details of the diffraction measurement process. Should  include information about source instability, crystal motion,  degradation and so on."""
+    @property
+    def id(self) -> 'Attribute':
+        """This data item uniquely identifies a set of diffraction  data."""
+    @property
+    def pdbx_serial_crystal_experiment(self) -> 'Attribute':
+        """Y/N if using serial crystallography experiment in which multiple crystals contribute to each diffraction frame in the experiment."""
+
+class Attr_DiffrnDetector(AttributeGroup):
+    """"""
+    @property
+    def details(self) -> 'Attribute':
+        """A description of special aspects of the radiation detector."""
+    @property
+    def detector(self) -> 'Attribute':
+        """The general class of the radiation detector."""
+    @property
+    def diffrn_id(self) -> 'Attribute':
+        """This data item is a pointer to _diffrn.id in the DIFFRN  category."""
+    @property
+    def pdbx_collection_date(self) -> 'Attribute':
+        """The date of data collection."""
+    @property
+    def pdbx_frequency(self) -> 'Attribute':
+        """The operating frequency of the detector (Hz) used in data collection."""
+    @property
+    def type(self) -> 'Attribute':
+        """The make, model or name of the detector device used."""
+
+class Attr_DiffrnRadiation(AttributeGroup):
+    """"""
+    @property
+    def collimation(self) -> 'Attribute':
+        """The collimation or focusing applied to the radiation."""
+    @property
+    def diffrn_id(self) -> 'Attribute':
+        """This data item is a pointer to _diffrn.id in the DIFFRN  category."""
+    @property
+    def monochromator(self) -> 'Attribute':
+        """The method used to obtain monochromatic radiation. If a mono-  chromator crystal is used, the material and the indices of the  Bragg reflection are specified."""
+    @property
+    def pdbx_diffrn_protocol(self) -> 'Attribute':
+        """SINGLE WAVELENGTH, LAUE, or MAD."""
+    @property
+    def pdbx_monochromatic_or_laue_m_l(self) -> 'Attribute':
+        """Monochromatic or Laue."""
+    @property
+    def pdbx_scattering_type(self) -> 'Attribute':
+        """The radiation scattering type for this diffraction data set."""
+    @property
+    def pdbx_wavelength(self) -> 'Attribute':
+        """Wavelength of radiation."""
+    @property
+    def pdbx_wavelength_list(self) -> 'Attribute':
+        """Comma separated list of wavelengths or wavelength range."""
+    @property
+    def type(self) -> 'Attribute':
+        """The nature of the radiation. This is typically a description  of the X-ray wavelength in Siegbahn notation."""
+    @property
+    def wavelength_id(self) -> 'Attribute':
+        """This data item is a pointer to _diffrn_radiation_wavelength.id  in the DIFFRN_RADIATION_WAVELENGTH category."""
+
+class Attr_DiffrnSource(AttributeGroup):
+    """"""
+    @property
+    def details(self) -> 'Attribute':
+        """A description of special aspects of the radiation source used."""
+    @property
+    def diffrn_id(self) -> 'Attribute':
+        """This data item is a pointer to _diffrn.id in the DIFFRN  category."""
+    @property
+    def pdbx_synchrotron_beamline(self) -> 'Attribute':
+        """Synchrotron beamline."""
+    @property
+    def pdbx_synchrotron_site(self) -> 'Attribute':
+        """Synchrotron site."""
+    @property
+    def pdbx_wavelength(self) -> 'Attribute':
+        """Wavelength of radiation."""
+    @property
+    def pdbx_wavelength_list(self) -> 'Attribute':
+        """Comma separated list of wavelengths or wavelength range."""
+    @property
+    def source(self) -> 'Attribute':
+        """The general class of the radiation source."""
+    @property
+    def type(self) -> 'Attribute':
+        """The make, model or name of the source of radiation."""
+
+class Attr_Em2dCrystalEntity(AttributeGroup):
+    """"""
+    @property
+    def angle_gamma(self) -> 'Attribute':
+        """Unit-cell angle gamma in degrees."""
+    @property
+    def c_sampling_length(self) -> 'Attribute':
+        """Length used to sample the reciprocal lattice lines in the c-direction."""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def image_processing_id(self) -> 'Attribute':
+        """pointer to _em_image_processing.id in the EM_IMAGE_PROCESSING category."""
+    @property
+    def length_a(self) -> 'Attribute':
+        """Unit-cell length a in angstroms."""
+    @property
+    def length_b(self) -> 'Attribute':
+        """Unit-cell length b in angstroms."""
+    @property
+    def length_c(self) -> 'Attribute':
+        """Thickness of 2D crystal"""
+    @property
+    def space_group_name_H_M(self) -> 'Attribute':
+        """There are 17 plane groups classified as oblique, rectangular, square, and hexagonal.  To describe the symmetry of 2D crystals of biological molecules,  plane groups are expanded to equivalent noncentrosymmetric space groups.  The 2D crystal plane corresponds to the 'ab' plane of the space group.   Enumerated space group descriptions include the plane group number in parentheses,  the H-M plane group symbol, and the plane group class."""
+
+class Attr_Em3dCrystalEntity(AttributeGroup):
+    """"""
+    @property
+    def angle_alpha(self) -> 'Attribute':
+        """Unit-cell angle alpha in degrees."""
+    @property
+    def angle_beta(self) -> 'Attribute':
+        """Unit-cell angle beta in degrees."""
+    @property
+    def angle_gamma(self) -> 'Attribute':
+        """Unit-cell angle gamma in degrees."""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def image_processing_id(self) -> 'Attribute':
+        """pointer to _em_image_processing.id in the EM_IMAGE_PROCESSING category."""
+    @property
+    def length_a(self) -> 'Attribute':
+        """Unit-cell length a in angstroms."""
+    @property
+    def length_b(self) -> 'Attribute':
+        """Unit-cell length b in angstroms."""
+    @property
+    def length_c(self) -> 'Attribute':
+        """Unit-cell length c in angstroms."""
+    @property
+    def space_group_name(self) -> 'Attribute':
+        """Space group name."""
+    @property
+    def space_group_num(self) -> 'Attribute':
+        """Space group number."""
+
+class Attr_Em3dFitting(AttributeGroup):
+    """"""
+    @property
+    def details(self) -> 'Attribute':
+        """Any additional details regarding fitting of atomic coordinates into  the 3DEM volume, including data and considerations from other  methods used in computation of the model."""
+    @property
+    def id(self) -> 'Attribute':
+        """The value of _em_3d_fitting.id must uniquely identify  a fitting procedure of atomic coordinates  into 3dem reconstructed map volume."""
+    @property
+    def method(self) -> 'Attribute':
+        """The method used to fit atomic coordinates  into the 3dem reconstructed map."""
+    @property
+    def overall_b_value(self) -> 'Attribute':
+        """The overall B (temperature factor) value for the 3d-em volume."""
+    @property
+    def ref_protocol(self) -> 'Attribute':
+        """The refinement protocol used."""
+    @property
+    def ref_space(self) -> 'Attribute':
+        """A flag to indicate whether fitting was carried out in real  or reciprocal refinement space."""
+    @property
+    def target_criteria(self) -> 'Attribute':
+        """The measure used to assess quality of fit of the atomic coordinates in the  3DEM map volume."""
+
+class Attr_Em3dFittingList(AttributeGroup):
+    """"""
+    @property
+    def em_3d_fitting_id(self) -> 'Attribute':
+        """The value of _em_3d_fitting_list.3d_fitting_id is a pointer  to  _em_3d_fitting.id in the 3d_fitting category"""
+    @property
+    def details(self) -> 'Attribute':
+        """Details about the model used in fitting."""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def pdb_chain_id(self) -> 'Attribute':
+        """The ID of the biopolymer chain used for fitting, e.g., A.  Please note that only one chain can be specified per instance.  If all chains of a particular structure have been used for fitting, this field can be left blank."""
+    @property
+    def pdb_chain_residue_range(self) -> 'Attribute':
+        """Residue range for the identified chain."""
+    @property
+    def pdb_entry_id(self) -> 'Attribute':
+        """The PDB code for the entry used in fitting."""
+
+class Attr_Em3dReconstruction(AttributeGroup):
+    """"""
+    @property
+    def actual_pixel_size(self) -> 'Attribute':
+        """The actual pixel size of the projection set of images in Angstroms."""
+    @property
+    def algorithm(self) -> 'Attribute':
+        """The reconstruction algorithm/technique used to generate the map."""
+    @property
+    def details(self) -> 'Attribute':
+        """Any additional details used in the 3d reconstruction."""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def image_processing_id(self) -> 'Attribute':
+        """Foreign key to the EM_IMAGE_PROCESSING category"""
+    @property
+    def magnification_calibration(self) -> 'Attribute':
+        """The magnification calibration method for the 3d reconstruction."""
+    @property
+    def method(self) -> 'Attribute':
+        """The algorithm method used for the 3d-reconstruction."""
+    @property
+    def nominal_pixel_size(self) -> 'Attribute':
+        """The nominal pixel size of the projection set of images in Angstroms."""
+    @property
+    def num_class_averages(self) -> 'Attribute':
+        """The number of classes used in the final 3d reconstruction"""
+    @property
+    def num_particles(self) -> 'Attribute':
+        """The number of 2D projections or 3D subtomograms used in the 3d reconstruction"""
+    @property
+    def refinement_type(self) -> 'Attribute':
+        """Indicates details on how the half-map used for resolution determination (usually by FSC) have been generated."""
+    @property
+    def resolution(self) -> 'Attribute':
+        """The final resolution (in angstroms) of the 3D reconstruction."""
+    @property
+    def resolution_method(self) -> 'Attribute':
+        """The  method used to determine the final resolution  of the 3d reconstruction.  The Fourier Shell Correlation criterion as a measure of  resolution is based on the concept of splitting the (2D)  data set into two halves; averaging each and comparing them  using the Fourier Ring Correlation (FRC) technique."""
+    @property
+    def symmetry_type(self) -> 'Attribute':
+        """The type of symmetry applied to the reconstruction"""
+
+class Attr_EmCtfCorrection(AttributeGroup):
+    """"""
+    @property
+    def details(self) -> 'Attribute':
+        """Any additional details about CTF correction"""
+    @property
+    def em_image_processing_id(self) -> 'Attribute':
+        """Foreign key to the EM_IMAGE_PROCESSING category"""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def type(self) -> 'Attribute':
+        """Type of CTF correction applied"""
+
+class Attr_EmDiffraction(AttributeGroup):
+    """"""
+    @property
+    def camera_length(self) -> 'Attribute':
+        """The camera length (in millimeters). The camera length is the  product of the objective focal length and the combined magnification  of the intermediate and projector lenses when the microscope is  operated in the diffraction mode."""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def imaging_id(self) -> 'Attribute':
+        """Foreign key to the EM_IMAGING category"""
+    @property
+    def tilt_angle_list(self) -> 'Attribute':
+        """Comma-separated list of tilt angles (in degrees) used in the electron diffraction experiment."""
+
+class Attr_EmDiffractionShell(AttributeGroup):
+    """"""
+    @property
+    def em_diffraction_stats_id(self) -> 'Attribute':
+        """Pointer to EM CRYSTALLOGRAPHY STATS"""
+    @property
+    def fourier_space_coverage(self) -> 'Attribute':
+        """Completeness of the structure factor data within this resolution shell, in percent"""
+    @property
+    def high_resolution(self) -> 'Attribute':
+        """High resolution limit for this shell (angstroms)"""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def low_resolution(self) -> 'Attribute':
+        """Low resolution limit for this shell (angstroms)"""
+    @property
+    def multiplicity(self) -> 'Attribute':
+        """Multiplicity (average number of measurements) for the structure factors in this resolution shell"""
+    @property
+    def num_structure_factors(self) -> 'Attribute':
+        """Number of measured structure factors in this resolution shell"""
+    @property
+    def phase_residual(self) -> 'Attribute':
+        """Phase residual for this resolution shell, in degrees"""
+
+class Attr_EmDiffractionStats(AttributeGroup):
+    """"""
+    @property
+    def details(self) -> 'Attribute':
+        """Any addition details about the structure factor measurements"""
+    @property
+    def fourier_space_coverage(self) -> 'Attribute':
+        """Completeness of the structure factor data within the defined space group  at the reported resolution (percent)."""
+    @property
+    def high_resolution(self) -> 'Attribute':
+        """High resolution limit of the structure factor data, in angstroms"""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def image_processing_id(self) -> 'Attribute':
+        """Pointer to _em_image_processing.id"""
+    @property
+    def num_intensities_measured(self) -> 'Attribute':
+        """Total number of diffraction intensities measured (before averaging)"""
+    @property
+    def num_structure_factors(self) -> 'Attribute':
+        """Number of structure factors obtained (merged amplitudes + phases)"""
+    @property
+    def overall_phase_error(self) -> 'Attribute':
+        """Overall phase error in degrees"""
+    @property
+    def overall_phase_residual(self) -> 'Attribute':
+        """Overall phase residual in degrees"""
+    @property
+    def phase_error_rejection_criteria(self) -> 'Attribute':
+        """Criteria used to reject phases"""
+    @property
+    def r_merge(self) -> 'Attribute':
+        """Rmerge value (percent)"""
+    @property
+    def r_sym(self) -> 'Attribute':
+        """Rsym value (percent)"""
+
+class Attr_EmEmbedding(AttributeGroup):
+    """"""
+    @property
+    def details(self) -> 'Attribute':
+        """Staining procedure used in the specimen preparation."""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def material(self) -> 'Attribute':
+        """The embedding  material."""
+    @property
+    def specimen_id(self) -> 'Attribute':
+        """Foreign key relationship to the EM SPECIMEN category"""
+
+class Attr_EmEntityAssembly(AttributeGroup):
+    """"""
+    @property
+    def details(self) -> 'Attribute':
+        """Additional details about the sample or sample subcomponent."""
+    @property
+    def entity_id_list(self) -> 'Attribute':
+        """"""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def name(self) -> 'Attribute':
+        """The name of the sample or sample subcomponent."""
+    @property
+    def oligomeric_details(self) -> 'Attribute':
+        """oligomeric details"""
+    @property
+    def parent_id(self) -> 'Attribute':
+        """The parent of this assembly.  This data item is an internal category pointer to _em_entity_assembly.id.  By convention, the full assembly (top of hierarchy) is assigned parent id 0 (zero)."""
+    @property
+    def source(self) -> 'Attribute':
+        """The type of source (e.g., natural source) for the component (sample or sample subcomponent)"""
+    @property
+    def synonym(self) -> 'Attribute':
+        """Alternative name of the component."""
+    @property
+    def type(self) -> 'Attribute':
+        """The general type of the sample or sample subcomponent."""
+
+class Attr_EmExperiment(AttributeGroup):
+    """"""
+    @property
+    def aggregation_state(self) -> 'Attribute':
+        """The aggregation/assembly state of the imaged specimen."""
+    @property
+    def entity_assembly_id(self) -> 'Attribute':
+        """Foreign key to the EM_ENTITY_ASSEMBLY category"""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def reconstruction_method(self) -> 'Attribute':
+        """The reconstruction method used in the EM experiment."""
+
+class Attr_EmHelicalEntity(AttributeGroup):
+    """"""
+    @property
+    def angular_rotation_per_subunit(self) -> 'Attribute':
+        """The angular rotation per helical subunit in degrees. Negative values indicate left-handed helices; positive values indicate right handed helices."""
+    @property
+    def axial_rise_per_subunit(self) -> 'Attribute':
+        """The axial rise per subunit in the helical assembly."""
+    @property
+    def axial_symmetry(self) -> 'Attribute':
+        """Symmetry of the helical axis, either cyclic (Cn) or dihedral (Dn), where n>=1."""
+    @property
+    def details(self) -> 'Attribute':
+        """Any other details regarding the helical assembly"""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def image_processing_id(self) -> 'Attribute':
+        """This data item is a pointer to _em_image_processing.id."""
+
+class Attr_EmImageRecording(AttributeGroup):
+    """"""
+    @property
+    def average_exposure_time(self) -> 'Attribute':
+        """The average exposure time for each image."""
+    @property
+    def avg_electron_dose_per_image(self) -> 'Attribute':
+        """The electron dose received by the specimen per image (electrons per square angstrom)."""
+    @property
+    def details(self) -> 'Attribute':
+        """Any additional details about image recording."""
+    @property
+    def detector_mode(self) -> 'Attribute':
+        """The detector mode used during image recording."""
+    @property
+    def film_or_detector_model(self) -> 'Attribute':
+        """The detector type used for recording images.  Usually film , CCD camera or direct electron detector."""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def imaging_id(self) -> 'Attribute':
+        """This data item the id of the microscopy settings used in the imaging."""
+    @property
+    def num_diffraction_images(self) -> 'Attribute':
+        """The number of diffraction images collected."""
+    @property
+    def num_grids_imaged(self) -> 'Attribute':
+        """Number of grids in the microscopy session"""
+    @property
+    def num_real_images(self) -> 'Attribute':
+        """The number of micrograph images collected."""
+
+class Attr_EmImaging(AttributeGroup):
+    """"""
+    @property
+    def accelerating_voltage(self) -> 'Attribute':
+        """A value of accelerating voltage (in kV) used for imaging."""
+    @property
+    def alignment_procedure(self) -> 'Attribute':
+        """The type of procedure used to align the microscope electron beam."""
+    @property
+    def astigmatism(self) -> 'Attribute':
+        """astigmatism"""
+    @property
+    def c2_aperture_diameter(self) -> 'Attribute':
+        """The open diameter of the c2 condenser lens,  in microns."""
+    @property
+    def calibrated_defocus_max(self) -> 'Attribute':
+        """The maximum calibrated defocus value of the objective lens (in nanometers) used  to obtain the recorded images. Negative values refer to overfocus."""
+    @property
+    def calibrated_defocus_min(self) -> 'Attribute':
+        """The minimum calibrated defocus value of the objective lens (in nanometers) used  to obtain the recorded images. Negative values refer to overfocus."""
+    @property
+    def calibrated_magnification(self) -> 'Attribute':
+        """The magnification value obtained for a known standard just  prior to, during or just after the imaging experiment."""
+    @property
+    def cryogen(self) -> 'Attribute':
+        """Cryogen type used to maintain the specimen stage temperature during imaging  in the microscope."""
+    @property
+    def date(self) -> 'Attribute':
+        """Date (YYYY-MM-DD) of imaging experiment or the date at which  a series of experiments began."""
+    @property
+    def details(self) -> 'Attribute':
+        """Any additional imaging details."""
+    @property
+    def detector_distance(self) -> 'Attribute':
+        """The camera length (in millimeters). The camera length is the  product of the objective focal length and the combined magnification  of the intermediate and projector lenses when the microscope is  operated in the diffraction mode."""
+    @property
+    def electron_beam_tilt_params(self) -> 'Attribute':
+        """electron beam tilt params"""
+    @property
+    def electron_source(self) -> 'Attribute':
+        """The source of electrons. The electron gun."""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def illumination_mode(self) -> 'Attribute':
+        """The mode of illumination."""
+    @property
+    def microscope_model(self) -> 'Attribute':
+        """The name of the model of microscope."""
+    @property
+    def mode(self) -> 'Attribute':
+        """The mode of imaging."""
+    @property
+    def nominal_cs(self) -> 'Attribute':
+        """The spherical aberration coefficient (Cs) in millimeters,  of the objective lens."""
+    @property
+    def nominal_defocus_max(self) -> 'Attribute':
+        """The maximum defocus value of the objective lens (in nanometers) used  to obtain the recorded images. Negative values refer to overfocus."""
+    @property
+    def nominal_defocus_min(self) -> 'Attribute':
+        """The minimum defocus value of the objective lens (in nanometers) used  to obtain the recorded images. Negative values refer to overfocus."""
+    @property
+    def nominal_magnification(self) -> 'Attribute':
+        """The magnification indicated by the microscope readout."""
+    @property
+    def recording_temperature_maximum(self) -> 'Attribute':
+        """The specimen temperature maximum (kelvin) for the duration  of imaging."""
+    @property
+    def recording_temperature_minimum(self) -> 'Attribute':
+        """The specimen temperature minimum (kelvin) for the duration  of imaging."""
+    @property
+    def residual_tilt(self) -> 'Attribute':
+        """Residual tilt of the electron beam (in miliradians)"""
+    @property
+    def specimen_holder_model(self) -> 'Attribute':
+        """The name of the model of specimen holder used during imaging."""
+    @property
+    def specimen_holder_type(self) -> 'Attribute':
+        """The type of specimen holder used during imaging."""
+    @property
+    def specimen_id(self) -> 'Attribute':
+        """Foreign key to the EM_SPECIMEN category"""
+    @property
+    def temperature(self) -> 'Attribute':
+        """The mean specimen stage temperature (in kelvin) during imaging  in the microscope."""
+    @property
+    def tilt_angle_max(self) -> 'Attribute':
+        """The maximum angle at which the specimen was tilted to obtain  recorded images."""
+    @property
+    def tilt_angle_min(self) -> 'Attribute':
+        """The minimum angle at which the specimen was tilted to obtain  recorded images."""
+
+class Attr_EmParticleSelection(AttributeGroup):
+    """"""
+    @property
+    def details(self) -> 'Attribute':
+        """Additional detail such as description of filters used, if selection was manual or automated, and/or template details."""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def image_processing_id(self) -> 'Attribute':
+        """The value of _em_particle_selection.image_processing_id points to  the EM_IMAGE_PROCESSING category."""
+    @property
+    def num_particles_selected(self) -> 'Attribute':
+        """The number of particles selected from the projection set of images."""
+
+class Attr_EmSingleParticleEntity(AttributeGroup):
+    """"""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def image_processing_id(self) -> 'Attribute':
+        """pointer to _em_image_processing.id."""
+    @property
+    def point_symmetry(self) -> 'Attribute':
+        """Point symmetry symbol, either Cn, Dn, T, O, or I"""
+
+class Attr_EmSoftware(AttributeGroup):
+    """"""
+    @property
+    def category(self) -> 'Attribute':
+        """The purpose of the software."""
+    @property
+    def details(self) -> 'Attribute':
+        """Details about the software used."""
+    @property
+    def fitting_id(self) -> 'Attribute':
+        """pointer to _em_3d_fitting.id in the EM_3D_FITTING category."""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def image_processing_id(self) -> 'Attribute':
+        """pointer to _em_image_processing.id in the EM_IMAGE_PROCESSING category."""
+    @property
+    def imaging_id(self) -> 'Attribute':
+        """pointer to _em_imaging.id in the EM_IMAGING category."""
+    @property
+    def name(self) -> 'Attribute':
+        """The name of the software package used, e.g., RELION.  Depositors are strongly   encouraged to provide a value in this field."""
+    @property
+    def version(self) -> 'Attribute':
+        """The version of the software."""
+
+class Attr_EmSpecimen(AttributeGroup):
+    """"""
+    @property
+    def concentration(self) -> 'Attribute':
+        """The concentration (in milligrams per milliliter, mg/ml)  of the complex in the sample."""
+    @property
+    def details(self) -> 'Attribute':
+        """A description of any additional details of the specimen preparation."""
+    @property
+    def embedding_applied(self) -> 'Attribute':
+        """'YES' indicates that the specimen has been embedded."""
+    @property
+    def experiment_id(self) -> 'Attribute':
+        """Pointer to _em_experiment.id."""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def shadowing_applied(self) -> 'Attribute':
+        """'YES' indicates that the specimen has been shadowed."""
+    @property
+    def staining_applied(self) -> 'Attribute':
+        """'YES' indicates that the specimen has been stained."""
+    @property
+    def vitrification_applied(self) -> 'Attribute':
+        """'YES' indicates that the specimen was vitrified by cryopreservation."""
+
+class Attr_EmStaining(AttributeGroup):
+    """"""
+    @property
+    def details(self) -> 'Attribute':
+        """Staining procedure used in the specimen preparation."""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def material(self) -> 'Attribute':
+        """The staining  material."""
+    @property
+    def specimen_id(self) -> 'Attribute':
+        """Foreign key relationship to the EM SPECIMEN category"""
+    @property
+    def type(self) -> 'Attribute':
+        """type of staining"""
+
+class Attr_EmVitrification(AttributeGroup):
+    """"""
+    @property
+    def chamber_temperature(self) -> 'Attribute':
+        """The temperature (in kelvin) of the sample just prior to vitrification."""
+    @property
+    def cryogen_name(self) -> 'Attribute':
+        """This is the name of the cryogen."""
+    @property
+    def details(self) -> 'Attribute':
+        """Any additional details relating to vitrification."""
+    @property
+    def humidity(self) -> 'Attribute':
+        """Relative humidity (%) of air surrounding the specimen just prior to vitrification."""
+    @property
+    def id(self) -> 'Attribute':
+        """PRIMARY KEY"""
+    @property
+    def instrument(self) -> 'Attribute':
+        """The type of instrument used in the vitrification process."""
+    @property
+    def method(self) -> 'Attribute':
+        """The procedure for vitrification."""
+    @property
+    def specimen_id(self) -> 'Attribute':
+        """This data item is a pointer to _em_specimen.id"""
+    @property
+    def temp(self) -> 'Attribute':
+        """The vitrification temperature (in kelvin), e.g.,   temperature of the plunge instrument cryogen bath."""
+    @property
+    def time_resolved_state(self) -> 'Attribute':
+        """The length of time after an event effecting the sample that  vitrification was induced and a description of the event."""
+
+class Attr_Entry(AttributeGroup):
+    """"""
+    @property
+    def id(self) -> 'Attribute':
+        """The value of _entry.id identifies the data block.   Note that this item need not be a number; it can be any unique  identifier."""
+    @property
+    def ma_collection_id(self) -> 'Attribute':
+        """An identifier for the model collection associated with the entry."""
+
+class Attr_Exptl(AttributeGroup):
+    """"""
+    @property
+    def crystals_number(self) -> 'Attribute':
+        """The total number of crystals used in the  measurement of  intensities."""
+    @property
+    def details(self) -> 'Attribute':
+        """Any special information about the experimental work prior to the  intensity measurement. See also _exptl_crystal.preparation."""
+    @property
+    def method(self) -> 'Attribute':
+        """The method used in the experiment."""
+    @property
+    def method_details(self) -> 'Attribute':
+        """A description of special aspects of the experimental method."""
+
+class Attr_ExptlCrystal(AttributeGroup):
+    """"""
+    @property
+    def colour(self) -> 'Attribute':
+        """The colour of the crystal."""
+    @property
+    def density_Matthews(self) -> 'Attribute':
+        """The density of the crystal, expressed as the ratio of the  volume of the asymmetric unit to the molecular mass of a  monomer of the structure, in units of angstroms^3^ per dalton.   Ref: Matthews, B. W. (1968). J. Mol. Biol. 33, 491-497."""
+    @property
+    def density_meas(self) -> 'Attribute':
+        """Density values measured using standard chemical and physical  methods. The units are megagrams per cubic metre (grams per  cubic centimetre)."""
+    @property
+    def density_percent_sol(self) -> 'Attribute':
+        """Density value P calculated from the crystal cell and contents,  expressed as per cent solvent.   P = 1 - (1.23 N MMass) / V   N     = the number of molecules in the unit cell  MMass = the molecular mass of each molecule (gm/mole)  V     = the volume of the unit cell (A^3^)  1.23  = a conversion factor evaluated as:           (0.74 cm^3^/g) (10^24^ A^3^/cm^3^)          --------------------------------------               (6.02*10^23^) molecules/mole           where 0.74 is an assumed value for the partial specific          volume of the molecule"""
+    @property
+    def description(self) -> 'Attribute':
+        """A description of the quality and habit of the crystal.  The crystal dimensions should not normally be reported here;  use instead the specific items in the EXPTL_CRYSTAL category  relating to size for the gross dimensions of the crystal and  data items in the EXPTL_CRYSTAL_FACE category to describe the  relationship between individual faces."""
+    @property
+    def id(self) -> 'Attribute':
+        """The value of _exptl_crystal.id must uniquely identify a record in  the EXPTL_CRYSTAL list.   Note that this item need not be a number; it can be any unique  identifier."""
+    @property
+    def pdbx_mosaicity(self) -> 'Attribute':
+        """Isotropic approximation of the distribution of mis-orientation angles specified in degrees of all the mosaic domain blocks in the crystal, represented as a standard deviation. Here, a mosaic block is a set of contiguous unit cells assumed to be perfectly aligned. Lower mosaicity indicates better ordered crystals. See for example:  Nave, C. (1998). Acta Cryst. D54, 848-853.  Note that many software packages estimate the mosaic rotation distribution differently and may combine several physical properties of the experiment into a single mosaic term. This term will help fit the modeled spots to the observed spots without necessarily being directly related to the physics of the crystal itself."""
+    @property
+    def pdbx_mosaicity_esd(self) -> 'Attribute':
+        """The uncertainty in the mosaicity estimate for the crystal."""
+    @property
+    def preparation(self) -> 'Attribute':
+        """Details of crystal growth and preparation of the crystal (e.g.  mounting) prior to the intensity measurements."""
+
+class Attr_ExptlCrystalGrow(AttributeGroup):
+    """"""
+    @property
+    def crystal_id(self) -> 'Attribute':
+        """This data item is a pointer to _exptl_crystal.id in the  EXPTL_CRYSTAL category."""
+    @property
+    def details(self) -> 'Attribute':
+        """A description of special aspects of the crystal growth."""
+    @property
+    def method(self) -> 'Attribute':
+        """The method used to grow the crystals."""
+    @property
+    def pH(self) -> 'Attribute':
+        """The pH at which the crystal was grown. If more than one pH was  employed during the crystallization process, the final pH should  be noted here and the protocol involving multiple pH values  should be described in _exptl_crystal_grow.details."""
+    @property
+    def pdbx_details(self) -> 'Attribute':
+        """Text description of crystal growth procedure."""
+    @property
+    def pdbx_pH_range(self) -> 'Attribute':
+        """The range of pH values at which the crystal was grown.   Used when  a point estimate of pH is not appropriate."""
+    @property
+    def temp(self) -> 'Attribute':
+        """The temperature in kelvins at which the crystal was grown.  If more than one temperature was employed during the  crystallization process, the final temperature should be noted  here and the protocol  involving multiple temperatures should be  described in _exptl_crystal_grow.details."""
+    @property
+    def temp_details(self) -> 'Attribute':
+        """A description of special aspects of temperature control during  crystal growth."""
+
+class Attr_IhmEntryCollectionMapping(AttributeGroup):
+    """"""
+    @property
+    def collection_id(self) -> 'Attribute':
+        """Identifier for the entry collection.   This data item is a pointer to _ihm_entry_collection.id in the   IHM_ENTRY_COLLECTION category."""
+
+class Attr_IhmExternalReferenceInfo(AttributeGroup):
+    """"""
+    @property
+    def associated_url(self) -> 'Attribute':
+        """The Uniform Resource Locator (URL) corresponding to the external reference (DOI).   This URL should link to the corresponding downloadable file or archive and is provided   to enable automated software to download the referenced file or archive."""
+    @property
+    def reference(self) -> 'Attribute':
+        """The external reference or the Digital Object Identifier (DOI).  This field is not relevant for local files."""
+    @property
+    def reference_provider(self) -> 'Attribute':
+        """The name of the reference provider."""
+
+class Attr_MaData(AttributeGroup):
+    """"""
+    @property
+    def content_type(self) -> 'Attribute':
+        """The type of data held in the dataset."""
+    @property
+    def content_type_other_details(self) -> 'Attribute':
+        """Details for other content types."""
+    @property
+    def id(self) -> 'Attribute':
+        """A unique identifier for the data."""
+    @property
+    def name(self) -> 'Attribute':
+        """An author-given name for the content held in the dataset."""
+
+class Attr_PdbxSgProject(AttributeGroup):
+    """"""
+    @property
+    def full_name_of_center(self) -> 'Attribute':
+        """The value identifies the full name of center."""
+    @property
+    def id(self) -> 'Attribute':
+        """A unique integer identifier for this center"""
+    @property
+    def initial_of_center(self) -> 'Attribute':
+        """The value identifies the full name of center."""
+    @property
+    def project_name(self) -> 'Attribute':
+        """The value identifies the Structural Genomics project."""
+
+class Attr_PdbxAuditRevisionCategory(AttributeGroup):
+    """"""
+    @property
+    def category(self) -> 'Attribute':
+        """The category updated in the pdbx_audit_revision_category record."""
+    @property
+    def data_content_type(self) -> 'Attribute':
+        """The type of file that the pdbx_audit_revision_history record refers to."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """A unique identifier for the pdbx_audit_revision_category record."""
+    @property
+    def revision_ordinal(self) -> 'Attribute':
+        """A pointer to  _pdbx_audit_revision_history.ordinal"""
+
+class Attr_PdbxAuditRevisionDetails(AttributeGroup):
+    """"""
+    @property
+    def data_content_type(self) -> 'Attribute':
+        """The type of file that the pdbx_audit_revision_history record refers to."""
+    @property
+    def description(self) -> 'Attribute':
+        """Additional details describing the revision."""
+    @property
+    def details(self) -> 'Attribute':
+        """Further details describing the revision."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """A unique identifier for the pdbx_audit_revision_details record."""
+    @property
+    def provider(self) -> 'Attribute':
+        """The provider of the revision."""
+    @property
+    def revision_ordinal(self) -> 'Attribute':
+        """A pointer to  _pdbx_audit_revision_history.ordinal"""
+    @property
+    def type(self) -> 'Attribute':
+        """A type classification of the revision"""
+
+class Attr_PdbxAuditRevisionGroup(AttributeGroup):
+    """"""
+    @property
+    def data_content_type(self) -> 'Attribute':
+        """The type of file that the pdbx_audit_revision_history record refers to."""
+    @property
+    def group(self) -> 'Attribute':
+        """The collection of categories updated with this revision."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """A unique identifier for the pdbx_audit_revision_group record."""
+    @property
+    def revision_ordinal(self) -> 'Attribute':
+        """A pointer to  _pdbx_audit_revision_history.ordinal"""
+
+class Attr_PdbxAuditRevisionHistory(AttributeGroup):
+    """"""
+    @property
+    def data_content_type(self) -> 'Attribute':
+        """The type of file that the pdbx_audit_revision_history record refers to."""
+    @property
+    def major_revision(self) -> 'Attribute':
+        """The major version number of deposition release."""
+    @property
+    def minor_revision(self) -> 'Attribute':
+        """The minor version number of deposition release."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """A unique identifier for the pdbx_audit_revision_history record."""
+    @property
+    def revision_date(self) -> 'Attribute':
+        """The release date of the revision"""
+
+class Attr_PdbxAuditRevisionItem(AttributeGroup):
+    """"""
+    @property
+    def data_content_type(self) -> 'Attribute':
+        """The type of file that the pdbx_audit_revision_history record refers to."""
+    @property
+    def item(self) -> 'Attribute':
+        """A high level explanation the author has provided for submitting a revision."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """A unique identifier for the pdbx_audit_revision_item record."""
+    @property
+    def revision_ordinal(self) -> 'Attribute':
+        """A pointer to  _pdbx_audit_revision_history.ordinal"""
+
+class Attr_PdbxAuditSupport(AttributeGroup):
+    """"""
+    @property
+    def country(self) -> 'Attribute':
+        """The country/region providing the funding support for the entry.  Funding information is optionally provided for entries after June 2016."""
+    @property
+    def funding_organization(self) -> 'Attribute':
+        """The name of the organization providing funding support for the  entry. Funding information is optionally provided for entries  after June 2016."""
+    @property
+    def grant_number(self) -> 'Attribute':
+        """The grant number associated with this source of support."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """A unique sequential integer identifier for each source of support for this entry."""
+
+class Attr_PdbxDatabasePdbObsSpr(AttributeGroup):
+    """"""
+    @property
+    def date(self) -> 'Attribute':
+        """The date of replacement."""
+    @property
+    def details(self) -> 'Attribute':
+        """Details related to the replaced or replacing entry."""
+    @property
+    def id(self) -> 'Attribute':
+        """Identifier for the type of obsolete entry to be added to this entry."""
+    @property
+    def pdb_id(self) -> 'Attribute':
+        """The new PDB identifier for the replaced entry."""
+    @property
+    def replace_pdb_id(self) -> 'Attribute':
+        """The PDB identifier for the replaced (OLD) entry/entries."""
+
+class Attr_PdbxDatabaseRelated(AttributeGroup):
+    """"""
+    @property
+    def content_type(self) -> 'Attribute':
+        """The identifying content type of the related entry."""
+    @property
+    def db_id(self) -> 'Attribute':
+        """The identifying code in the related database."""
+    @property
+    def db_name(self) -> 'Attribute':
+        """The name of the database containing the related entry."""
+    @property
+    def details(self) -> 'Attribute':
+        """A description of the related entry."""
+
+class Attr_PdbxDatabaseStatus(AttributeGroup):
+    """"""
+    @property
+    def SG_entry(self) -> 'Attribute':
+        """This code indicates whether the entry belongs to  Structural Genomics Project."""
+    @property
+    def deposit_site(self) -> 'Attribute':
+        """The site where the file was deposited."""
+    @property
+    def methods_development_category(self) -> 'Attribute':
+        """The methods development category in which this  entry has been placed."""
+    @property
+    def pdb_format_compatible(self) -> 'Attribute':
+        """A flag indicating that the entry is compatible with the PDB format.   A value of 'N' indicates that the no PDB format data file is  corresponding to this entry is available in the PDB archive."""
+    @property
+    def process_site(self) -> 'Attribute':
+        """The site where the file was deposited."""
+    @property
+    def recvd_initial_deposition_date(self) -> 'Attribute':
+        """The date of initial deposition.  (The first message for  deposition has been received.)"""
+    @property
+    def status_code(self) -> 'Attribute':
+        """Code for status of file."""
+    @property
+    def status_code_cs(self) -> 'Attribute':
+        """Code for status of chemical shift data file."""
+    @property
+    def status_code_mr(self) -> 'Attribute':
+        """Code for status of NMR constraints file."""
+    @property
+    def status_code_sf(self) -> 'Attribute':
+        """Code for status of structure factor file."""
+
+class Attr_PdbxDepositGroup(AttributeGroup):
+    """"""
+    @property
+    def group_description(self) -> 'Attribute':
+        """A description of the contents of entries in the collection."""
+    @property
+    def group_id(self) -> 'Attribute':
+        """A unique identifier for a group of entries deposited as a collection."""
+    @property
+    def group_title(self) -> 'Attribute':
+        """A title to describe the group of entries deposited in the collection."""
+    @property
+    def group_type(self) -> 'Attribute':
+        """Text to describe a grouping of entries in multiple collections"""
+
+class Attr_PdbxInitialRefinementModel(AttributeGroup):
+    """"""
+    @property
+    def accession_code(self) -> 'Attribute':
+        """This item identifies an accession code of the resource where the initial model  is used"""
+    @property
+    def details(self) -> 'Attribute':
+        """A description of special aspects of the initial model"""
+    @property
+    def entity_id_list(self) -> 'Attribute':
+        """"""
+    @property
+    def id(self) -> 'Attribute':
+        """A unique identifier for the starting model record."""
+    @property
+    def source_name(self) -> 'Attribute':
+        """This item identifies the resource of initial model used for refinement"""
+    @property
+    def type(self) -> 'Attribute':
+        """This item describes the type of the initial model was generated"""
+
+class Attr_PdbxMoleculeFeatures(AttributeGroup):
+    """"""
+    @property
+    def class_(self) -> 'Attribute':
+        """Broadly defines the function of the molecule."""
+    @property
+    def details(self) -> 'Attribute':
+        """Additional details describing the molecule."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name of the molecule."""
+    @property
+    def prd_id(self) -> 'Attribute':
+        """The value of _pdbx_molecule_features.prd_id is the accession code for this  reference molecule."""
+    @property
+    def type(self) -> 'Attribute':
+        """Defines the structural classification of the molecule."""
+
+class Attr_PdbxNmrDetails(AttributeGroup):
+    """"""
+    @property
+    def text(self) -> 'Attribute':
+        """Additional details describing the NMR experiment."""
+
+class Attr_PdbxNmrEnsemble(AttributeGroup):
+    """"""
+    @property
+    def average_constraint_violations_per_residue(self) -> 'Attribute':
+        """The average number of constraint violations on a per residue basis for  the ensemble."""
+    @property
+    def average_constraints_per_residue(self) -> 'Attribute':
+        """The average number of constraints per residue for the ensemble"""
+    @property
+    def average_distance_constraint_violation(self) -> 'Attribute':
+        """The average distance restraint violation for the ensemble."""
+    @property
+    def average_torsion_angle_constraint_violation(self) -> 'Attribute':
+        """The average torsion angle constraint violation for the ensemble."""
+    @property
+    def conformer_selection_criteria(self) -> 'Attribute':
+        """By highlighting the appropriate choice(s), describe how the submitted conformer (models) were selected."""
+    @property
+    def conformers_calculated_total_number(self) -> 'Attribute':
+        """The total number of conformer (models) that were calculated in the final round."""
+    @property
+    def conformers_submitted_total_number(self) -> 'Attribute':
+        """The number of conformer (models) that are submitted for the ensemble."""
+    @property
+    def distance_constraint_violation_method(self) -> 'Attribute':
+        """Describe the method used to calculate the distance constraint violation statistics,  i.e. are they calculated over all the distance constraints or calculated for  violations only?"""
+    @property
+    def maximum_distance_constraint_violation(self) -> 'Attribute':
+        """The maximum distance constraint violation for the ensemble."""
+    @property
+    def maximum_lower_distance_constraint_violation(self) -> 'Attribute':
+        """The maximum lower distance constraint violation for the ensemble."""
+    @property
+    def maximum_torsion_angle_constraint_violation(self) -> 'Attribute':
+        """The maximum torsion angle constraint violation for the ensemble."""
+    @property
+    def maximum_upper_distance_constraint_violation(self) -> 'Attribute':
+        """The maximum upper distance constraint violation for the ensemble."""
+    @property
+    def representative_conformer(self) -> 'Attribute':
+        """The number of the conformer identified as most representative."""
+    @property
+    def torsion_angle_constraint_violation_method(self) -> 'Attribute':
+        """This item describes the method used to calculate the torsion angle constraint violation statistics. i.e. are the entered values based on all torsion angle or calculated for violations only?"""
+
+class Attr_PdbxNmrExptl(AttributeGroup):
+    """"""
+    @property
+    def conditions_id(self) -> 'Attribute':
+        """The number to identify the set of sample conditions."""
+    @property
+    def experiment_id(self) -> 'Attribute':
+        """A numerical ID for each experiment."""
+    @property
+    def sample_state(self) -> 'Attribute':
+        """Physical state of the sample either anisotropic or isotropic."""
+    @property
+    def solution_id(self) -> 'Attribute':
+        """The solution_id from the Experimental Sample to identify the sample  that these conditions refer to.   [Remember to save the entries here before returning to the   Experimental Sample form]"""
+    @property
+    def spectrometer_id(self) -> 'Attribute':
+        """Pointer to '_pdbx_nmr_spectrometer.spectrometer_id'"""
+    @property
+    def type(self) -> 'Attribute':
+        """The type of NMR experiment."""
+
+class Attr_PdbxNmrExptlSampleConditions(AttributeGroup):
+    """"""
+    @property
+    def conditions_id(self) -> 'Attribute':
+        """The condition number as defined above."""
+    @property
+    def details(self) -> 'Attribute':
+        """General details describing conditions of both the sample and the environment during measurements."""
+    @property
+    def ionic_strength(self) -> 'Attribute':
+        """The ionic strength at which the NMR data were collected -in lieu of  this enter the concentration and identity of the salt in the sample."""
+    @property
+    def ionic_strength_err(self) -> 'Attribute':
+        """Estimate of the standard error for the value for the sample ionic strength."""
+    @property
+    def ionic_strength_units(self) -> 'Attribute':
+        """Units for the value of the sample condition ionic strength.."""
+    @property
+    def label(self) -> 'Attribute':
+        """A descriptive label that uniquely identifies this set of sample conditions."""
+    @property
+    def pH(self) -> 'Attribute':
+        """The pH at which the NMR data were collected."""
+    @property
+    def pH_err(self) -> 'Attribute':
+        """Estimate of the standard error for the value for the sample pH."""
+    @property
+    def pH_units(self) -> 'Attribute':
+        """Units for the value of the sample condition pH."""
+    @property
+    def pressure(self) -> 'Attribute':
+        """The pressure at which NMR data were collected."""
+    @property
+    def pressure_err(self) -> 'Attribute':
+        """Estimate of the standard error for the value for the sample pressure."""
+    @property
+    def pressure_units(self) -> 'Attribute':
+        """The units of pressure at which NMR data were collected."""
+    @property
+    def temperature(self) -> 'Attribute':
+        """The temperature (in kelvin) at which NMR data were  collected."""
+    @property
+    def temperature_err(self) -> 'Attribute':
+        """Estimate of the standard error for the value for the sample temperature."""
+    @property
+    def temperature_units(self) -> 'Attribute':
+        """Units for the value of the sample condition temperature."""
+
+class Attr_PdbxNmrRefine(AttributeGroup):
+    """"""
+    @property
+    def details(self) -> 'Attribute':
+        """Additional details about the NMR refinement."""
+    @property
+    def method(self) -> 'Attribute':
+        """The method used to determine the structure."""
+    @property
+    def software_ordinal(self) -> 'Attribute':
+        """Pointer to _software.ordinal"""
+
+class Attr_PdbxNmrRepresentative(AttributeGroup):
+    """"""
+    @property
+    def conformer_id(self) -> 'Attribute':
+        """If a member of the ensemble has been selected as a representative  structure, identify it by its model number."""
+    @property
+    def selection_criteria(self) -> 'Attribute':
+        """By highlighting the appropriate choice(s), describe the criteria used to select this structure as a representative structure, or if an average structure has been calculated describe how this was done."""
+
+class Attr_PdbxNmrSampleDetails(AttributeGroup):
+    """"""
+    @property
+    def contents(self) -> 'Attribute':
+        """A complete description of each NMR sample. Include the concentration and concentration units for each component (include buffers, etc.). For each component describe the isotopic composition, including the % labeling level, if known.  For example: 1. Uniform (random) labeling with 15N: U-15N 2. Uniform (random) labeling with 13C, 15N at known labeling    levels: U-95% 13C;U-98% 15N 3. Residue selective labeling: U-95% 15N-Thymine 4. Site specific labeling: 95% 13C-Ala18, 5. Natural abundance labeling in an otherwise uniformly labeled    biomolecule is designated by NA: U-13C; NA-K,H"""
+    @property
+    def details(self) -> 'Attribute':
+        """Brief description of the sample providing additional information not captured by other items in the category."""
+    @property
+    def label(self) -> 'Attribute':
+        """A value that uniquely identifies this sample from the other samples listed in the entry."""
+    @property
+    def solution_id(self) -> 'Attribute':
+        """The name (number) of the sample."""
+    @property
+    def solvent_system(self) -> 'Attribute':
+        """The solvent system used for this sample."""
+    @property
+    def type(self) -> 'Attribute':
+        """A descriptive term for the sample that defines the general physical properties of the sample."""
+
+class Attr_PdbxNmrSoftware(AttributeGroup):
+    """"""
+    @property
+    def authors(self) -> 'Attribute':
+        """The name of the authors of the software used in this  procedure."""
+    @property
+    def classification(self) -> 'Attribute':
+        """The purpose of the software."""
+    @property
+    def name(self) -> 'Attribute':
+        """The name of the software used for the task."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """An ordinal index for this category"""
+    @property
+    def version(self) -> 'Attribute':
+        """The version of the software."""
+
+class Attr_PdbxNmrSpectrometer(AttributeGroup):
+    """"""
+    @property
+    def details(self) -> 'Attribute':
+        """A text description of the NMR spectrometer."""
+    @property
+    def field_strength(self) -> 'Attribute':
+        """The field strength in MHz of the spectrometer"""
+    @property
+    def manufacturer(self) -> 'Attribute':
+        """The name of the manufacturer of the spectrometer."""
+    @property
+    def model(self) -> 'Attribute':
+        """The model of the NMR spectrometer."""
+    @property
+    def spectrometer_id(self) -> 'Attribute':
+        """Assign a numerical ID to each instrument."""
+    @property
+    def type(self) -> 'Attribute':
+        """Select the instrument manufacturer(s) and the model(s) of the NMR(s) used for this work."""
+
+class Attr_PdbxReflnsTwin(AttributeGroup):
+    """"""
+    @property
+    def crystal_id(self) -> 'Attribute':
+        """The crystal identifier.  A reference to  _exptl_crystal.id in category EXPTL_CRYSTAL."""
+    @property
+    def diffrn_id(self) -> 'Attribute':
+        """The diffraction data set identifier.  A reference to  _diffrn.id in category DIFFRN."""
+    @property
+    def domain_id(self) -> 'Attribute':
+        """An identifier for the twin domain."""
+    @property
+    def fraction(self) -> 'Attribute':
+        """The twin fraction or twin factor represents a quantitative parameter for the crystal twinning.  The value 0 represents no twinning, < 0.5 partial twinning,  = 0.5 for perfect twinning."""
+    @property
+    def operator(self) -> 'Attribute':
+        """The possible merohedral or hemihedral twinning operators for different point groups are:  True point group  	Twin operation  	hkl related to 3                      	2 along a,b             h,-h-k,-l                        	2 along a*,b*           h+k,-k,-l                         2 along c               -h,-k,l 4                       2 along a,b,a*,b*       h,-k,-l 6                       2 along a,b,a*,b*       h,-h-k,-l 321                     2 along a*,b*,c         -h,-k,l 312                     2 along a,b,c           -h,-k,l 23                      4 along a,b,c            k,-h,l  References:  Yeates, T.O. (1997) Methods in Enzymology 276, 344-358. Detecting and  Overcoming Crystal Twinning.   and information from the following on-line sites:     CNS site http://cns.csb.yale.edu/v1.1/    CCP4 site http://www.ccp4.ac.uk/dist/html/detwin.html    SHELX site http://shelx.uni-ac.gwdg.de/~rherbst/twin.html"""
+    @property
+    def type(self) -> 'Attribute':
+        """There are two types of twinning: merohedral or hemihedral                                  non-merohedral or epitaxial  For merohedral twinning the diffraction patterns from the different domains are completely superimposable.   Hemihedral twinning is a special case of merohedral twinning. It only involves two distinct domains.  Pseudo-merohedral twinning is a subclass merohedral twinning in which lattice is coincidentally superimposable.  In the case of non-merohedral or epitaxial twinning  the reciprocal lattices do not superimpose exactly. In this case the  diffraction pattern consists of two (or more) interpenetrating lattices, which can in principle be separated."""
+
+class Attr_PdbxRelatedExpDataSet(AttributeGroup):
+    """"""
+    @property
+    def data_reference(self) -> 'Attribute':
+        """A DOI reference to the related data set."""
+    @property
+    def data_set_type(self) -> 'Attribute':
+        """The type of the experimenatal data set."""
+    @property
+    def details(self) -> 'Attribute':
+        """Additional details describing the content of the related data set and its application to  the current investigation."""
+    @property
+    def metadata_reference(self) -> 'Attribute':
+        """A DOI reference to the metadata decribing the related data set."""
+
+class Attr_PdbxSerialCrystallographyDataReduction(AttributeGroup):
+    """"""
+    @property
+    def crystal_hits(self) -> 'Attribute':
+        """For experiments in which samples are provided in a  continuous stream, the total number of frames collected  in which the crystal was hit."""
+    @property
+    def diffrn_id(self) -> 'Attribute':
+        """The data item is a pointer to _diffrn.id in the DIFFRN  category."""
+    @property
+    def droplet_hits(self) -> 'Attribute':
+        """For experiments in which samples are provided in a  continuous stream, the total number of frames collected  in which a droplet was hit."""
+    @property
+    def frame_hits(self) -> 'Attribute':
+        """For experiments in which samples are provided in a  continuous stream, the total number of data frames collected  in which the sample was hit."""
+    @property
+    def frames_failed_index(self) -> 'Attribute':
+        """For experiments in which samples are provided in a  continuous stream, the total number of data frames collected  that contained a 'hit' but failed to index."""
+    @property
+    def frames_indexed(self) -> 'Attribute':
+        """For experiments in which samples are provided in a  continuous stream, the total number of data frames collected  that were indexed."""
+    @property
+    def frames_total(self) -> 'Attribute':
+        """The total number of data frames collected for this  data set."""
+    @property
+    def lattices_indexed(self) -> 'Attribute':
+        """For experiments in which samples are provided in a  continuous stream, the total number of lattices indexed."""
+    @property
+    def lattices_merged(self) -> 'Attribute':
+        """For experiments in which samples are provided in a             continuous stream, the total number of crystal lattices             that were merged in the final dataset.  Can be             less than frames_indexed depending on filtering during merging or 	    can be more than frames_indexed if there are multiple lattices. 	    per frame."""
+    @property
+    def xfel_pulse_events(self) -> 'Attribute':
+        """For FEL experiments, the number of pulse events in the dataset."""
+    @property
+    def xfel_run_numbers(self) -> 'Attribute':
+        """For FEL experiments, in which data collection was performed 	       in batches, indicates which subset of the data collected                were used in producing this dataset."""
+
+class Attr_PdbxSerialCrystallographyMeasurement(AttributeGroup):
+    """"""
+    @property
+    def collection_time_total(self) -> 'Attribute':
+        """The total number of hours required to measure this data set."""
+    @property
+    def collimation(self) -> 'Attribute':
+        """The collimation or type of focusing optics applied to the radiation."""
+    @property
+    def diffrn_id(self) -> 'Attribute':
+        """The data item is a pointer to _diffrn.id in the DIFFRN  category."""
+    @property
+    def focal_spot_size(self) -> 'Attribute':
+        """The focal spot size of the beam  impinging on the sample (micrometres squared)."""
+    @property
+    def photons_per_pulse(self) -> 'Attribute':
+        """The photons per pulse measured in  (tera photons (10^(12)^)/pulse units)."""
+    @property
+    def pulse_duration(self) -> 'Attribute':
+        """The average duration (femtoseconds) 	       of the pulse energy measured at the sample."""
+    @property
+    def pulse_energy(self) -> 'Attribute':
+        """The energy/pulse of the X-ray pulse impacting the sample measured in microjoules."""
+    @property
+    def pulse_photon_energy(self) -> 'Attribute':
+        """The photon energy of the X-ray pulse measured in KeV."""
+    @property
+    def source_distance(self) -> 'Attribute':
+        """The distance from source to the sample along the optical axis (metres)."""
+    @property
+    def source_size(self) -> 'Attribute':
+        """The dimension of the source beam measured at the source (micrometres squared)."""
+    @property
+    def xfel_pulse_repetition_rate(self) -> 'Attribute':
+        """For FEL experiments, the pulse repetition rate measured in cycles per seconds."""
+
+class Attr_PdbxSerialCrystallographySampleDelivery(AttributeGroup):
+    """"""
+    @property
+    def description(self) -> 'Attribute':
+        """The description of the mechanism by which the specimen in placed in the path  of the source."""
+    @property
+    def diffrn_id(self) -> 'Attribute':
+        """The data item is a pointer to _diffrn.id in the DIFFRN  category."""
+    @property
+    def method(self) -> 'Attribute':
+        """The description of the mechanism by which the specimen in placed in the path  of the source."""
+
+class Attr_PdbxSerialCrystallographySampleDeliveryFixedTarget(AttributeGroup):
+    """"""
+    @property
+    def crystals_per_unit(self) -> 'Attribute':
+        """The number of crystals per dropplet or pore in fixed target"""
+    @property
+    def description(self) -> 'Attribute':
+        """For a fixed target sample, a description of sample preparation"""
+    @property
+    def details(self) -> 'Attribute':
+        """Any details pertinent to the fixed sample target"""
+    @property
+    def diffrn_id(self) -> 'Attribute':
+        """The data item is a pointer to _diffrn.id in the DIFFRN  category."""
+    @property
+    def motion_control(self) -> 'Attribute':
+        """Device used to control movement of the fixed sample"""
+    @property
+    def sample_dehydration_prevention(self) -> 'Attribute':
+        """Method to prevent dehydration of sample"""
+    @property
+    def sample_holding(self) -> 'Attribute':
+        """For a fixed target sample, mechanism to hold sample in the beam"""
+    @property
+    def sample_solvent(self) -> 'Attribute':
+        """The sample solution content and concentration"""
+    @property
+    def sample_unit_size(self) -> 'Attribute':
+        """Size of pore in grid supporting sample. Diameter or length in micrometres,  e.g. pore diameter"""
+    @property
+    def support_base(self) -> 'Attribute':
+        """Type of base holding the support"""
+    @property
+    def velocity_horizontal(self) -> 'Attribute':
+        """Velocity of sample horizontally relative to a perpendicular beam in millimetres/second"""
+    @property
+    def velocity_vertical(self) -> 'Attribute':
+        """Velocity of sample vertically relative to a perpendicular beam in millimetres/second"""
+
+class Attr_PdbxSerialCrystallographySampleDeliveryInjection(AttributeGroup):
+    """"""
+    @property
+    def carrier_solvent(self) -> 'Attribute':
+        """For continuous sample flow experiments, the carrier buffer used  to move the sample into the beam. Should include protein  concentration."""
+    @property
+    def crystal_concentration(self) -> 'Attribute':
+        """For continuous sample flow experiments, the concentration of  crystals in the solution being injected.   The concentration is measured in million crystals/ml."""
+    @property
+    def description(self) -> 'Attribute':
+        """For continuous sample flow experiments, a description of the injector used  to move the sample into the beam."""
+    @property
+    def diffrn_id(self) -> 'Attribute':
+        """The data item is a pointer to _diffrn.id in the DIFFRN  category."""
+    @property
+    def filter_size(self) -> 'Attribute':
+        """The size of filter in micrometres in filtering crystals"""
+    @property
+    def flow_rate(self) -> 'Attribute':
+        """For continuous sample flow experiments, the flow rate of  solution being injected  measured in ul/min."""
+    @property
+    def injector_diameter(self) -> 'Attribute':
+        """For continuous sample flow experiments, the diameter of the  injector in micrometres."""
+    @property
+    def injector_nozzle(self) -> 'Attribute':
+        """The type of nozzle to deliver and focus sample jet"""
+    @property
+    def injector_pressure(self) -> 'Attribute':
+        """For continuous sample flow experiments, the mean pressure  in kilopascals at which the sample is injected into the beam."""
+    @property
+    def injector_temperature(self) -> 'Attribute':
+        """For continuous sample flow experiments, the temperature in  Kelvins of the speciman injected. This may be different from  the temperature of the sample."""
+    @property
+    def jet_diameter(self) -> 'Attribute':
+        """Diameter in micrometres of jet stream of sample delivery"""
+    @property
+    def power_by(self) -> 'Attribute':
+        """Sample deliver driving force, e.g. Gas, Electronic Potential"""
+    @property
+    def preparation(self) -> 'Attribute':
+        """Details of crystal growth and preparation of the crystals"""
+
+class Attr_PdbxSolnScatter(AttributeGroup):
+    """"""
+    @property
+    def buffer_name(self) -> 'Attribute':
+        """The name of the buffer used for the sample in the solution scattering  experiment."""
+    @property
+    def concentration_range(self) -> 'Attribute':
+        """The concentration range (mg/mL) of the complex in the  sample used in the solution scattering experiment to  determine the mean radius of structural elongation."""
+    @property
+    def data_analysis_software_list(self) -> 'Attribute':
+        """A list of the software used in the data analysis"""
+    @property
+    def data_reduction_software_list(self) -> 'Attribute':
+        """A list of the software used in the data reduction"""
+    @property
+    def detector_specific(self) -> 'Attribute':
+        """The particular radiation detector. In general this will be a   manufacturer, description, model number or some combination of   these."""
+    @property
+    def detector_type(self) -> 'Attribute':
+        """The general class of the radiation detector."""
+    @property
+    def id(self) -> 'Attribute':
+        """The value of _pdbx_soln_scatter.id must  uniquely identify the sample in the category PDBX_SOLN_SCATTER"""
+    @property
+    def max_mean_cross_sectional_radii_gyration(self) -> 'Attribute':
+        """The maximum mean radius of structural elongation of the sample.  In a given solute-solvent contrast, the radius of gyration  R_G is a measure of structural elongation if the internal  inhomogeneity of scattering densities has no effect. Guiner  analysis at low Q give the R_G and the forward scattering at  zero angle I(0).      lnl(Q) = lnl(0) - R_G^2Q^2/3   where        Q = 4(pi)sin(theta/lamda)        2theta = scattering angle        lamda = wavelength   The above expression is valid in a QR_G range for extended  rod-like particles. The relative I(0)/c values ( where   c = sample concentration) for sample measurements in a  constant buffer for a single sample data session, gives the  relative masses of the protein(s) studied when referenced  against a standard.   see:      O.Glatter & O.Kratky, (1982). Editors of 'Small angle       X-ray Scattering, Academic Press, New York.      O.Kratky. (1963). X-ray small angle scattering with       substances of biological interest in diluted solutions.       Prog. Biophys. Chem., 13, 105-173.      G.D.Wignall & F.S.Bates, (1987). The small-angle approximation       of X-ray and neutron scatter from rigid rods of non-uniform       cross section and finite length. J.Appl. Crystallog., 18, 452-460.   If the structure is elongated, the mean radius of gyration  of the cross-sectional structure R_XS  and the mean cross sectional  intensity at zero angle [I(Q).Q]_Q->0 is obtained from     ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"""
+    @property
+    def max_mean_cross_sectional_radii_gyration_esd(self) -> 'Attribute':
+        """The estimated standard deviation for the minimum mean radius of structural elongation of the sample. In a given solute-solvent contrast, the radius of gyration R_G is a measure of structural elongation if the internal inhomogeneity of scattering densities has no effect. Guiner analysis at low Q give the R_G and the forward scattering at zero angle I(0).      lnl(Q) = lnl(0) - R_G^2Q^2/3  where       Q = 4(pi)sin(theta/lamda)       2theta = scattering angle       lamda = wavelength  The above expression is valid in a QR_G range for extended rod-like particles. The relative I(0)/c values ( where  c = sample concentration) for sample measurements in a constant buffer for a single sample data session, gives the relative masses of the protein(s) studied when referenced against a standard.  see:     O.Glatter & O.Kratky, (1982). Editors of 'Small angle      X-ray Scattering, Academic Press, New York.     O.Kratky. (1963). X-ray small angle scattering with      substances of biological interest in diluted solutions.      Prog. Biophys. Chem., 13, 105-173.     G.D.Wignall & F.S.Bates, (1987). The small-angle approximation      of X-ray and neutron scatter from rigid rods of non-uniform      cross section and finite length. J.Appl. Crystallog., 18, 452-460.  If the structure is elongated, the mean radius of gyration of the cross-sectional structure R_XS  and the mean cross sectional intensity at zero angle [I(Q).Q]_Q->0 is obtained from    ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"""
+    @property
+    def mean_guiner_radius(self) -> 'Attribute':
+        """The mean radius of structural elongation of the sample.  In a given solute-solvent contrast, the radius of gyration  R_G is a measure of structural elongation if the internal  inhomogeneity of scattering densities has no effect. Guiner  analysis at low Q gives the R_G and the forward scattering at  zero angle I(0).       lnl(Q) = lnl(0) - R_G^2Q^2/3   where        Q = 4(pi)sin(theta/lamda)        2theta = scattering angle        lamda = wavelength   The above expression is valid in a QR_G range for extended  rod-like particles. The relative I(0)/c values ( where   c = sample concentration) for sample measurements in a  constant buffer for a single sample data session, gives the  relative masses of the protein(s) studied when referenced  against a standard.   see: O.Glatter & O.Kratky, (1982). Editors of 'Small angle       X-ray Scattering, Academic Press, New York.       O.Kratky. (1963). X-ray small angle scattering with       substances of biological interest in diluted solutions.       Prog. Biophys. Chem., 13, 105-173.        G.D.Wignall & F.S.Bates, (1987). The small-angle approximation       of X-ray and neutron scatter from rigid rods of non-uniform       cross section and finite length. J.Appl. Crystallog., 18, 452-460.   If the structure is elongated, the mean radius of gyration  of the cross-sectional structure R_XS  and the mean cross sectional  intensity at zero angle [I(Q).Q]_Q->0 is obtained from      ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"""
+    @property
+    def mean_guiner_radius_esd(self) -> 'Attribute':
+        """The estimated standard deviation for the  mean radius of structural elongation of the sample.  In a given solute-solvent contrast, the radius of gyration  R_G is a measure of structural elongation if the internal  inhomogeneity of scattering densities has no effect. Guiner  analysis at low Q give the R_G and the forward scattering at  zero angle I(0).       lnl(Q) = lnl(0) - R_G^2Q^2/3   where        Q = 4(pi)sin(theta/lamda)        2theta = scattering angle        lamda = wavelength   The above expression is valid in a QR_G range for extended  rod-like particles. The relative I(0)/c values ( where   c = sample concentration) for sample measurements in a  constant buffer for a single sample data session, gives the  relative masses of the protein(s) studied when referenced  against a standard.   see:      O.Glatter & O.Kratky, (1982). Editors of 'Small angle       X-ray Scattering, Academic Press, New York.      O.Kratky. (1963). X-ray small angle scattering with       substances of biological interest in diluted solutions.       Prog. Biophys. Chem., 13, 105-173.      G.D.Wignall & F.S.Bates, (1987). The small-angle approximation       of X-ray and neutron scatter from rigid rods of non-uniform       cross section and finite length. J.Appl. Crystallog., 18, 452-460.   If the structure is elongated, the mean radius of gyration  of the cross-sectional structure R_XS  and the mean cross sectional  intensity at zero angle [I(Q).Q]_Q->0 is obtained from     ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"""
+    @property
+    def min_mean_cross_sectional_radii_gyration(self) -> 'Attribute':
+        """The minimum mean radius of structural elongation of the sample. In a given solute-solvent contrast, the radius of gyration R_G is a measure of structural elongation if the internal inhomogeneity of scattering densities has no effect. Guiner analysis at low Q give the R_G and the forward scattering at zero angle I(0).      lnl(Q) = lnl(0) - R_G^2Q^2/3  where       Q = 4(pi)sin(theta/lamda)       2theta = scattering angle       lamda = wavelength  The above expression is valid in a QR_G range for extended rod-like particles. The relative I(0)/c values ( where  c = sample concentration) for sample measurements in a constant buffer for a single sample data session, gives the relative masses of the protein(s) studied when referenced against a standard.  see:     O.Glatter & O.Kratky, (1982). Editors of 'Small angle      X-ray Scattering, Academic Press, New York.     O.Kratky. (1963). X-ray small angle scattering with      substances of biological interest in diluted solutions.      Prog. Biophys. Chem., 13, 105-173.     G.D.Wignall & F.S.Bates, (1987). The small-angle approximation      of X-ray and neutron scatter from rigid rods of non-uniform      cross section and finite length. J.Appl. Crystallog., 18, 452-460.  If the structure is elongated, the mean radius of gyration of the cross-sectional structure R_XS  and the mean cross sectional intensity at zero angle [I(Q).Q]_Q->0 is obtained from    ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"""
+    @property
+    def min_mean_cross_sectional_radii_gyration_esd(self) -> 'Attribute':
+        """The estimated standard deviation for the minimum mean radius of structural elongation of the sample. In a given solute-solvent contrast, the radius of gyration R_G is a measure of structural elongation if the internal inhomogeneity of scattering densities has no effect. Guiner analysis at low Q give the R_G and the forward scattering at zero angle I(0).     lnl(Q) = lnl(0) - R_G^2Q^2/3  where       Q = 4(pi)sin(theta/lamda)       2theta = scattering angle       lamda = wavelength  The above expression is valid in a QR_G range for extended rod-like particles. The relative I(0)/c values ( where  c = sample concentration) for sample measurements in a constant buffer for a single sample data session, gives the relative masses of the protein(s) studied when referenced against a standard.  see:     O.Glatter & O.Kratky, (1982). Editors of 'Small angle      X-ray Scattering, Academic Press, New York.     O.Kratky. (1963). X-ray small angle scattering with      substances of biological interest in diluted solutions.      Prog. Biophys. Chem., 13, 105-173.     G.D.Wignall & F.S.Bates, (1987). The small-angle approximation      of X-ray and neutron scatter from rigid rods of non-uniform      cross section and finite length. J.Appl. Crystallog., 18, 452-460.  If the structure is elongated, the mean radius of gyration of the cross-sectional structure R_XS  and the mean cross sectional intensity at zero angle [I(Q).Q]_Q->0 is obtained from     ln[I(Q).Q] = ln[l(Q).(Q)]_Q->0 - ((R_XS)^2Q^2)/2"""
+    @property
+    def num_time_frames(self) -> 'Attribute':
+        """The number of time frame solution scattering images used."""
+    @property
+    def protein_length(self) -> 'Attribute':
+        """The length (or range) of the protein sample under study. If the solution structure is approximated as an elongated elliptical cyclinder the length L is determined from,    L = sqrt [12( (R_G)^2  -  (R_XS)^2 ) ]  The length should also be given by    L = pi I(0) / [ I(Q).Q]_Q->0"""
+    @property
+    def sample_pH(self) -> 'Attribute':
+        """The pH value of the buffered sample."""
+    @property
+    def source_beamline(self) -> 'Attribute':
+        """The beamline name used for the experiment"""
+    @property
+    def source_beamline_instrument(self) -> 'Attribute':
+        """The instrumentation used on the beamline"""
+    @property
+    def source_class(self) -> 'Attribute':
+        """The general class of the radiation source."""
+    @property
+    def source_type(self) -> 'Attribute':
+        """The make, model, name or beamline of the source of radiation."""
+    @property
+    def temperature(self) -> 'Attribute':
+        """The temperature in kelvins at which the experiment  was conducted"""
+    @property
+    def type(self) -> 'Attribute':
+        """The type of solution scattering experiment carried out"""
+
+class Attr_PdbxSolnScatterModel(AttributeGroup):
+    """"""
+    @property
+    def conformer_selection_criteria(self) -> 'Attribute':
+        """A description of the conformer selection criteria  used."""
+    @property
+    def details(self) -> 'Attribute':
+        """A description of any additional details concerning the experiment."""
+    @property
+    def entry_fitting_list(self) -> 'Attribute':
+        """A list of the entries used to fit the model  to the scattering data"""
+    @property
+    def id(self) -> 'Attribute':
+        """The value of _pdbx_soln_scatter_model.id must  uniquely identify the sample in the category PDBX_SOLN_SCATTER_MODEL"""
+    @property
+    def method(self) -> 'Attribute':
+        """A description of the methods used in the modelling"""
+    @property
+    def num_conformers_calculated(self) -> 'Attribute':
+        """The number of model conformers calculated."""
+    @property
+    def num_conformers_submitted(self) -> 'Attribute':
+        """The number of model conformers submitted in the entry"""
+    @property
+    def representative_conformer(self) -> 'Attribute':
+        """The index of the representative conformer among the submitted conformers for the entry"""
+    @property
+    def scatter_id(self) -> 'Attribute':
+        """This data item is a pointer to  _pdbx_soln_scatter.id in the  PDBX_SOLN_SCATTER category."""
+    @property
+    def software_author_list(self) -> 'Attribute':
+        """A list of the software authors"""
+    @property
+    def software_list(self) -> 'Attribute':
+        """A list of the software used in the modeeling"""
+
+class Attr_PdbxVrptSummary(AttributeGroup):
+    """"""
+    @property
+    def RNA_suiteness(self) -> 'Attribute':
+        """The MolProbity conformer-match quality parameter for RNA structures. Low values are worse. Specific to structures that contain RNA polymers."""
+    @property
+    def attempted_validation_steps(self) -> 'Attribute':
+        """The steps that were attempted by the validation pipeline software.  A step typically involves running a 3rd party validation tool, for instance 'mogul' Each step will be enumerated in _pdbx_vrpt_software category."""
+    @property
+    def ligands_for_buster_report(self) -> 'Attribute':
+        """A flag indicating if there are ligands in the model used for detailed Buster analysis."""
+    @property
+    def report_creation_date(self) -> 'Attribute':
+        """The date, time and time-zone that the validation report  was created.  The string will be formatted like yyyy-mm-dd:hh:mm in GMT time."""
+    @property
+    def restypes_notchecked_for_bond_angle_geometry(self) -> 'Attribute':
+        """"""
+
+class Attr_PdbxVrptSummaryDiffraction(AttributeGroup):
+    """"""
+    @property
+    def B_factor_type(self) -> 'Attribute':
+        """An indicator if isotropic B factors are partial or full values."""
+    @property
+    def Babinet_b(self) -> 'Attribute':
+        """REFMAC scaling parameter as reported in log output line starting 'bulk solvent: scale'. X-ray entry specific, obtained in the EDS step from REFMAC calculation."""
+    @property
+    def Babinet_k(self) -> 'Attribute':
+        """REFMAC scaling parameter as reported in log output line starting 'bulk solvent: scale'. X-ray entry specific, obtained in the EDS step from REFMAC calculation."""
+    @property
+    def CCP4_version(self) -> 'Attribute':
+        """The version of CCP4 suite used in the analysis."""
+    @property
+    def DCC_R(self) -> 'Attribute':
+        """The overall R-factor from a DCC recalculation of an electron density map. Currently value is rounded to 2 decimal places. X-ray entry specific, obtained from the DCC program."""
+    @property
+    def DCC_Rfree(self) -> 'Attribute':
+        """Rfree as calculated by DCC."""
+    @property
+    def EDS_R(self) -> 'Attribute':
+        """The overall R factor from the EDS REFMAC calculation (no free set is used in this). Currently value is rounded to 2 decimal places. X-ray entry specific, obtained in the eds step from REFMAC calculation."""
+    @property
+    def EDS_R_warning(self) -> 'Attribute':
+        """Warning message when EDS calculated R vs reported R is higher than a threshold"""
+    @property
+    def EDS_res_high(self) -> 'Attribute':
+        """The data high resolution diffraction limit, in Angstroms, found in the input structure factor file. X-ray entry specific, obtained in the EDS step."""
+    @property
+    def EDS_res_low(self) -> 'Attribute':
+        """The data low resolution diffraction limit, in Angstroms, found in the input structure factor file. X-ray entry specific, obtained in the EDS step."""
+    @property
+    def Fo_Fc_correlation(self) -> 'Attribute':
+        """Fo,Fc correlation: The difference between the observed structure factors (Fo) and the  calculated structure factors (Fc) measures the correlation between the model and the experimental data.  X-ray entry specific, obtained in the eds step from REFMAC calculation."""
+    @property
+    def I_over_sigma(self) -> 'Attribute':
+        """Each reflection has an intensity (I) and an uncertainty in measurement  (sigma(I)), so I/sigma(I) is the signal-to-noise ratio. This ratio decreases at higher resolution. <I/sigma(I)> is the mean of individual I/sigma(I) values. Value for outer resolution shell is given in parentheses. In case structure factor amplitudes are deposited, Xtriage estimates the intensities first and then calculates this metric. When intensities are available in the deposited file, these are converted to amplitudes and then back to intensity estimate before calculating the metric.   X-ray entry specific, calculated by Phenix Xtriage program."""
+    @property
+    def Padilla_Yeates_L2_mean(self) -> 'Attribute':
+        """Padilla and Yeates twinning parameter <|L**2|>. Theoretical values is 0.333 in the untwinned case, and 0.2 in the perfectly twinned case. X-ray entry specific, obtained from the Xtriage program."""
+    @property
+    def Padilla_Yeates_L_mean(self) -> 'Attribute':
+        """Padilla and Yeates twinning parameter <|L|>. Theoretical values is 0.5 in the untwinned case, and 0.375 in the perfectly twinned case. X-ray entry specific, obtained from the Xtriage program."""
+    @property
+    def Q_score(self) -> 'Attribute':
+        """The overall Q-score of the fit of coordinates to the electron map. The Q-score is defined in Pintilie, GH. et al., Nature Methods, 17, 328-334 (2020)"""
+    @property
+    def Wilson_B_aniso(self) -> 'Attribute':
+        """Result of absolute likelihood based Wilson scaling,  The anisotropic B value of the data is determined using a likelihood based approach.  The resulting B tensor is reported, the 3 diagonal values are given first, followed by the 3 off diagonal values. A large spread in (especially the diagonal) values indicates anisotropy.  X-ray entry specific, calculated by Phenix Xtriage program."""
+    @property
+    def Wilson_B_estimate(self) -> 'Attribute':
+        """An estimate of the overall B-value of the structure, calculated from the diffraction data.  Units Angstroms squared. It serves as an indicator of the degree of order in the crystal and the value is usually  not hugely different from the average B-value calculated from the model. X-ray entry specific, calculated by Phenix Xtriage program."""
+    @property
+    def acentric_outliers(self) -> 'Attribute':
+        """The number of acentric reflections that Xtriage identifies as outliers on the basis  of Wilson statistics. Note that if pseudo translational symmetry is present,  a large number of 'outliers' will be present. X-ray entry specific, calculated by Phenix Xtriage program."""
+    @property
+    def bulk_solvent_b(self) -> 'Attribute':
+        """REFMAC scaling parameter as reported in log output file. X-ray entry specific, obtained in the EDS step from REFMAC calculation."""
+    @property
+    def bulk_solvent_k(self) -> 'Attribute':
+        """REFMAC reported scaling parameter. X-ray entry specific, obtained in the EDS step from REFMAC calculation."""
+    @property
+    def centric_outliers(self) -> 'Attribute':
+        """The number of centric reflections that Xtriage identifies as outliers. X-ray entry specific, calculated by Phenix Xtriage program."""
+    @property
+    def data_anisotropy(self) -> 'Attribute':
+        """The ratio (Bmax - Bmin) / Bmean where Bmax, Bmin and Bmean are computed from the B-values  associated with the principal axes of the anisotropic thermal ellipsoid.  This ratio is usually less than 0.5; for only 1% of PDB entries it is more than 1.0 (Read et al., 2011). X-ray entry specific, obtained from the Xtriage program."""
+    @property
+    def data_completeness(self) -> 'Attribute':
+        """The percent completeness of diffraction data."""
+    @property
+    def density_fitness_version(self) -> 'Attribute':
+        """The version of density-fitness suite programs used in the analysis."""
+    @property
+    def exp_method(self) -> 'Attribute':
+        """Experimental method for statistics"""
+    @property
+    def num_miller_indices(self) -> 'Attribute':
+        """The number of Miller Indices reported by the Xtriage program. This should be the same as the number of _refln in the input structure factor file. X-ray entry specific, calculated by Phenix Xtriage program."""
+    @property
+    def number_reflns_R_free(self) -> 'Attribute':
+        """The number of reflections in the free set as defined in the input structure factor file supplied to the validation pipeline.  X-ray entry specific, obtained from the DCC program."""
+    @property
+    def percent_RSRZ_outliers(self) -> 'Attribute':
+        """The percent of RSRZ outliers."""
+    @property
+    def percent_free_reflections(self) -> 'Attribute':
+        """A percentage, Normally percent proportion of the total number. Between 0% and 100%."""
+    @property
+    def servalcat_version(self) -> 'Attribute':
+        """The version of Servalcat program used in the analysis."""
+    @property
+    def trans_NCS_details(self) -> 'Attribute':
+        """A sentence giving the result of Xtriage's analysis on translational NCS. X-ray entry specific, obtained from the Xtriage program."""
+    @property
+    def twin_fraction(self) -> 'Attribute':
+        """Estimated twinning fraction for operators as identified by Xtriage. A semicolon separated list of operators with fractions is givens  X-ray entry specific, obtained from the Xtriage program."""
+
+class Attr_PdbxVrptSummaryEm(AttributeGroup):
+    """"""
+    @property
+    def Q_score(self) -> 'Attribute':
+        """The overall Q-score of the fit of coordinates to the electron map. The Q-score is defined in Pintilie, GH. et al., Nature Methods, 17, 328-334 (2020)"""
+    @property
+    def atom_inclusion_all_atoms(self) -> 'Attribute':
+        """The proportion of all non hydrogen atoms within density."""
+    @property
+    def atom_inclusion_backbone(self) -> 'Attribute':
+        """The proportion of backbone atoms within density."""
+    @property
+    def author_provided_fsc_resolution_by_cutoff_halfbit(self) -> 'Attribute':
+        """The resolution from the intersection of the author provided fsc and the indicator curve halfbit."""
+    @property
+    def author_provided_fsc_resolution_by_cutoff_onebit(self) -> 'Attribute':
+        """The resolution from the intersection of the author provided fsc and the indicator curve onebit."""
+    @property
+    def author_provided_fsc_resolution_by_cutoff_pt_143(self) -> 'Attribute':
+        """The resolution from the intersection of the author provided fsc and the indicator curve 0.143."""
+    @property
+    def author_provided_fsc_resolution_by_cutoff_pt_333(self) -> 'Attribute':
+        """The resolution from the intersection of the author provided fsc and the indicator curve 0.333."""
+    @property
+    def author_provided_fsc_resolution_by_cutoff_pt_5(self) -> 'Attribute':
+        """The resolution from the intersection of the author provided fsc and the indicator curve 0.5."""
+    @property
+    def author_provided_fsc_resolution_by_cutoff_threesigma(self) -> 'Attribute':
+        """The resolution from the intersection of the author provided fsc and the indicator curve threesigma."""
+    @property
+    def calculated_fsc_resolution_by_cutoff_halfbit(self) -> 'Attribute':
+        """The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve halfbit."""
+    @property
+    def calculated_fsc_resolution_by_cutoff_onebit(self) -> 'Attribute':
+        """The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve onebit."""
+    @property
+    def calculated_fsc_resolution_by_cutoff_pt_143(self) -> 'Attribute':
+        """The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve 0.143."""
+    @property
+    def calculated_fsc_resolution_by_cutoff_pt_333(self) -> 'Attribute':
+        """The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve 0.333."""
+    @property
+    def calculated_fsc_resolution_by_cutoff_pt_5(self) -> 'Attribute':
+        """The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve 0.5."""
+    @property
+    def calculated_fsc_resolution_by_cutoff_threesigma(self) -> 'Attribute':
+        """The resolution from the intersection of the fsc curve generated by from the provided halfmaps and the indicator curve threesigma."""
+    @property
+    def contour_level_primary_map(self) -> 'Attribute':
+        """The recommended contour level for the primary map of this deposition."""
+    @property
+    def exp_method(self) -> 'Attribute':
+        """Experimental method for statistics"""
+
+class Attr_PdbxVrptSummaryGeometry(AttributeGroup):
+    """"""
+    @property
+    def angles_RMSZ(self) -> 'Attribute':
+        """The overall root mean square of the Z-score for deviations of bond angles in comparison to  'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996). This value is for all chains in the structure."""
+    @property
+    def bonds_RMSZ(self) -> 'Attribute':
+        """The overall root mean square of the Z-score for deviations of bond lengths in comparison to  'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996). This value is for all chains in the structure."""
+    @property
+    def clashscore(self) -> 'Attribute':
+        """This score is derived from the number of pairs of atoms in the PDB_model_num that are unusually close to each other.  It is calculated by the MolProbity pdbx_vrpt_software and expressed as the number or such clashes per thousand atoms. For structures determined by NMR the clashscore value here will only consider label_atom_id pairs in the  well-defined (core) residues from ensemble analysis."""
+    @property
+    def clashscore_full_length(self) -> 'Attribute':
+        """Only given for structures determined by NMR. The MolProbity pdbx_vrpt_instance_clashes score for all label_atom_id pairs."""
+    @property
+    def num_H_reduce(self) -> 'Attribute':
+        """This is the number of hydrogen atoms added and optimized by the MolProbity reduce pdbx_vrpt_software as part of the all-atom clashscore."""
+    @property
+    def num_angles_RMSZ(self) -> 'Attribute':
+        """The number of bond angles compared to 'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996). This value is for all chains in the structure."""
+    @property
+    def num_bonds_RMSZ(self) -> 'Attribute':
+        """The number of bond lengths compared to 'standard geometry' made using the MolProbity dangle program. Standard geometry parameters are taken from Engh and Huber (2001) and Parkinson et al. (1996). This value is for all chains in the structure."""
+    @property
+    def percent_ramachandran_outliers(self) -> 'Attribute':
+        """The percentage of residues with Ramachandran outliers."""
+    @property
+    def percent_ramachandran_outliers_full_length(self) -> 'Attribute':
+        """Only given for structures determined by NMR. The MolProbity Ramachandran outlier score for all atoms in the structure rather than just the well-defined (core) residues."""
+    @property
+    def percent_rotamer_outliers(self) -> 'Attribute':
+        """The MolProbity sidechain outlier score (a percentage). Protein sidechains mostly adopt certain (combinations of) preferred torsion angle values  (called rotamers or rotameric conformers), much like their backbone torsion angles  (as assessed in the Ramachandran analysis). MolProbity considers the sidechain conformation  of a residue to be an outlier if its set of torsion angles is not similar to any preferred  combination. The sidechain outlier score is calculated as the percentage of residues  with an unusual sidechain conformation with respect to the total number of residues for  which the assessment is available. Example: percent-rota-outliers='2.44'. Specific to structure that contain protein chains and have sidechains modelled. For NMR structures only the  well-defined (core) residues from ensemble analysis will be considered. The percentage of residues with rotamer outliers."""
+    @property
+    def percent_rotamer_outliers_full_length(self) -> 'Attribute':
+        """Only given for structures determined by NMR. The MolProbity sidechain outlier score for all atoms in the structure rather than just the well-defined (core) residues."""
+
+class Attr_PdbxVrptSummaryNmr(AttributeGroup):
+    """"""
+    @property
+    def chemical_shift_completeness(self) -> 'Attribute':
+        """Overall completeness of the chemical shift assignments for the well-defined  regions of the structure."""
+    @property
+    def chemical_shift_completeness_full_length(self) -> 'Attribute':
+        """Overall completeness of the chemical shift assignments for the full  macromolecule or complex as suggested by the molecular description of an entry (whether some portion of it is modelled or not)."""
+    @property
+    def cyrange_error(self) -> 'Attribute':
+        """Diagnostic message from the wrapper of Cyrange software which identifies the  well-defined cores (domains) of NMR protein structures."""
+    @property
+    def cyrange_number_of_domains(self) -> 'Attribute':
+        """Total number of well-defined cores (domains) identified by Cyrange"""
+    @property
+    def exp_method(self) -> 'Attribute':
+        """Experimental method for statistics"""
+    @property
+    def medoid_model(self) -> 'Attribute':
+        """For each Cyrange well-defined core ('cyrange_domain') the id of the PDB_model_num which is most  similar to other models as measured by pairwise RMSDs over the domain.  For the whole entry ('Entry'), the medoid PDB_model_num of the largest core is taken as an overall representative of the structure."""
+    @property
+    def nmr_models_consistency_flag(self) -> 'Attribute':
+        """A flag indicating if all models in the NMR ensemble contain the exact  same atoms ('True') or if the models differ in this respect ('False')."""
+    @property
+    def nmrclust_error(self) -> 'Attribute':
+        """Diagnostic message from the wrapper of NMRClust software which clusters NMR models."""
+    @property
+    def nmrclust_number_of_clusters(self) -> 'Attribute':
+        """Total number of clusters in the NMR ensemble identified by NMRClust."""
+    @property
+    def nmrclust_number_of_models(self) -> 'Attribute':
+        """Number of models analysed by NMRClust - should in almost all cases be the same as the number of models in the NMR ensemble."""
+    @property
+    def nmrclust_number_of_outliers(self) -> 'Attribute':
+        """Number of models that do not belong to any cluster as deemed by NMRClust."""
+    @property
+    def nmrclust_representative_model(self) -> 'Attribute':
+        """Overall representative PDB_model_num of the NMR ensemble as identified by NMRClust."""
+
+class Attr_RcsbAccessionInfo(AttributeGroup):
+    """"""
+    @property
+    def deposit_date(self) -> 'Attribute':
+        """The entry deposition date."""
+    @property
+    def has_released_experimental_data(self) -> 'Attribute':
+        """A code indicating the current availibility of experimental data in the repository."""
+    @property
+    def initial_release_date(self) -> 'Attribute':
+        """The entry initial release date."""
+    @property
+    def major_revision(self) -> 'Attribute':
+        """The latest entry major revision number."""
+    @property
+    def minor_revision(self) -> 'Attribute':
+        """The latest entry minor revision number."""
+    @property
+    def revision_date(self) -> 'Attribute':
+        """The latest entry revision date."""
+    @property
+    def status_code(self) -> 'Attribute':
+        """The release status for the entry."""
+
+class Attr_RcsbBindingAffinity(AttributeGroup):
+    """"""
+    @property
+    def comp_id(self) -> 'Attribute':
+        """Ligand identifier."""
+    @property
+    def link(self) -> 'Attribute':
+        """Link to external resource referencing the data."""
+    @property
+    def provenance_code(self) -> 'Attribute':
+        """The resource name for the related binding affinity reference."""
+    @property
+    def reference_sequence_identity(self) -> 'Attribute':
+        """Data point provided by BindingDB. Percent identity between PDB sequence and reference sequence."""
+    @property
+    def symbol(self) -> 'Attribute':
+        """Binding affinity symbol indicating approximate or precise strength of the binding."""
+    @property
+    def type(self) -> 'Attribute':
+        """Binding affinity measurement given in one of the following types:  The concentration constants: IC50: the concentration of ligand that reduces enzyme activity by 50%;  EC50: the concentration of compound that generates a half-maximal response;  The binding constant:  Kd: dissociation constant;  Ka: association constant;  Ki: enzyme inhibition constant;  The thermodynamic parameters:  delta G: Gibbs free energy of binding (for association reaction);  delta H: change in enthalpy associated with a chemical reaction;  delta S: change in entropy associated with a chemical reaction."""
+    @property
+    def unit(self) -> 'Attribute':
+        """Binding affinity unit.  Dissociation constant Kd is normally in molar units (or millimolar , micromolar, nanomolar, etc).  Association constant Ka is normally expressed in inverse molar units (e.g. M-1)."""
+    @property
+    def value(self) -> 'Attribute':
+        """Binding affinity value between a ligand and its target molecule."""
+
+class Attr_RcsbCompModelProvenance(AttributeGroup):
+    """"""
+    @property
+    def entry_id(self) -> 'Attribute':
+        """Entry identifier corresponding to the computed structure model."""
+    @property
+    def source_db(self) -> 'Attribute':
+        """Source database for the computed structure model."""
+    @property
+    def source_filename(self) -> 'Attribute':
+        """Source filename for the computed structure model."""
+    @property
+    def source_pae_url(self) -> 'Attribute':
+        """Source URL for computed structure model predicted aligned error (PAE) json file."""
+    @property
+    def source_url(self) -> 'Attribute':
+        """Source URL for computed structure model file."""
+
+class Attr_RcsbEntryContainerIdentifiers(AttributeGroup):
+    """"""
+    @property
+    def assembly_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def branched_entity_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def emdb_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def entity_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def entry_id(self) -> 'Attribute':
+        """Entry identifier for the container."""
+    @property
+    def model_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def non_polymer_entity_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def polymer_entity_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def pubmed_id(self) -> 'Attribute':
+        """Unique integer value assigned to each PubMed record."""
+    @property
+    def rcsb_id(self) -> 'Attribute':
+        """A unique identifier for each object in this entry container."""
+    @property
+    def related_emdb_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def water_entity_ids(self) -> 'Attribute':
+        """"""
+
+class Attr_RcsbEntryGroupMembership(AttributeGroup):
+    """"""
+    @property
+    def aggregation_method(self) -> 'Attribute':
+        """Method used to establish group membership"""
+    @property
+    def group_id(self) -> 'Attribute':
+        """A unique identifier for a group of entries"""
+
+class Attr_DiffrnResolutionHigh(AttributeGroup):
+    """"""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """The provenence source for the high resolution limit of data collection."""
+    @property
+    def value(self) -> 'Attribute':
+        """The high resolution limit of data collection."""
+
+class Attr_RcsbEntryInfo(AttributeGroup):
+    """"""
+    @property
+    def assembly_count(self) -> 'Attribute':
+        """The number of assemblies defined for this entry including the deposited assembly."""
+    @property
+    def branched_entity_count(self) -> 'Attribute':
+        """The number of distinct branched entities in the structure entry."""
+    @property
+    def branched_molecular_weight_maximum(self) -> 'Attribute':
+        """The maximum molecular mass (KDa) of a branched entity in the deposited structure entry."""
+    @property
+    def branched_molecular_weight_minimum(self) -> 'Attribute':
+        """The minimum molecular mass (KDa) of a branched entity in the deposited structure entry."""
+    @property
+    def cis_peptide_count(self) -> 'Attribute':
+        """The number of cis-peptide linkages per deposited structure model."""
+    @property
+    def deposited_atom_count(self) -> 'Attribute':
+        """The number of heavy atom coordinates records per deposited structure model."""
+    @property
+    def deposited_deuterated_water_count(self) -> 'Attribute':
+        """The number of deuterated water molecules per deposited structure model."""
+    @property
+    def deposited_hydrogen_atom_count(self) -> 'Attribute':
+        """The number of hydrogen atom coordinates records per deposited structure model."""
+    @property
+    def deposited_model_count(self) -> 'Attribute':
+        """The number of model structures deposited."""
+    @property
+    def deposited_modeled_polymer_monomer_count(self) -> 'Attribute':
+        """The number of modeled polymer monomers in the deposited coordinate data.  This is the total count of monomers with reported coordinate data for all polymer  entity instances in the deposited coordinate data."""
+    @property
+    def deposited_nonpolymer_entity_instance_count(self) -> 'Attribute':
+        """The number of non-polymer instances in the deposited data set.  This is the total count of non-polymer entity instances reported  per deposited structure model."""
+    @property
+    def deposited_polymer_entity_instance_count(self) -> 'Attribute':
+        """The number of polymer instances in the deposited data set.  This is the total count of polymer entity instances reported  per deposited structure model."""
+    @property
+    def deposited_polymer_monomer_count(self) -> 'Attribute':
+        """The number of polymer monomers in sample entity instances in the deposited data set.  This is the total count of monomers for all polymer entity instances reported  per deposited structure model."""
+    @property
+    def deposited_solvent_atom_count(self) -> 'Attribute':
+        """The number of heavy solvent atom coordinates records per deposited structure model."""
+    @property
+    def deposited_unmodeled_polymer_monomer_count(self) -> 'Attribute':
+        """The number of unmodeled polymer monomers in the deposited coordinate data. This is  the total count of monomers with unreported coordinate data for all polymer  entity instances per deposited structure model."""
+    @property
+    def diffrn_radiation_wavelength_maximum(self) -> 'Attribute':
+        """The maximum radiation wavelength in angstroms."""
+    @property
+    def diffrn_radiation_wavelength_minimum(self) -> 'Attribute':
+        """The minimum radiation wavelength in angstroms."""
+    @property
+    def disulfide_bond_count(self) -> 'Attribute':
+        """The number of disulfide bonds per deposited structure model."""
+    @property
+    def entity_count(self) -> 'Attribute':
+        """The number of distinct polymer, non-polymer, branched molecular, and solvent entities per deposited structure model."""
+    @property
+    def experimental_method(self) -> 'Attribute':
+        """The category of experimental method(s) used to determine the structure entry."""
+    @property
+    def experimental_method_count(self) -> 'Attribute':
+        """The number of experimental methods contributing data to the structure determination."""
+    @property
+    def ihm_multi_scale_flag(self) -> 'Attribute':
+        """Multi-scale modeling flag for integrative structures."""
+    @property
+    def ihm_multi_state_flag(self) -> 'Attribute':
+        """Multi-state modeling flag for integrative structures."""
+    @property
+    def ihm_ordered_state_flag(self) -> 'Attribute':
+        """Ordered-state modeling flag for integrative structures."""
+    @property
+    def ihm_structure_description(self) -> 'Attribute':
+        """Description of the integrative structure."""
+    @property
+    def inter_mol_covalent_bond_count(self) -> 'Attribute':
+        """The number of intermolecular covalent bonds."""
+    @property
+    def inter_mol_metalic_bond_count(self) -> 'Attribute':
+        """The number of intermolecular metalic bonds."""
+    @property
+    def molecular_weight(self) -> 'Attribute':
+        """The molecular mass (KDa) of polymer and non-polymer entities (exclusive of solvent) in the deposited structure entry."""
+    @property
+    def na_polymer_entity_types(self) -> 'Attribute':
+        """Nucleic acid polymer entity type categories describing the entry."""
+    @property
+    def ndb_struct_conf_na_feature_combined(self) -> 'Attribute':
+        """"""
+    @property
+    def nonpolymer_bound_components(self) -> 'Attribute':
+        """"""
+    @property
+    def nonpolymer_entity_count(self) -> 'Attribute':
+        """The number of distinct non-polymer entities in the structure entry exclusive of solvent."""
+    @property
+    def nonpolymer_molecular_weight_maximum(self) -> 'Attribute':
+        """The maximum molecular mass (KDa) of a non-polymer entity in the deposited structure entry."""
+    @property
+    def nonpolymer_molecular_weight_minimum(self) -> 'Attribute':
+        """The minimum molecular mass (KDa) of a non-polymer entity in the deposited structure entry."""
+    @property
+    def polymer_composition(self) -> 'Attribute':
+        """Categories describing the polymer entity composition for the entry."""
+    @property
+    def polymer_entity_count(self) -> 'Attribute':
+        """The number of distinct polymer entities in the structure entry."""
+    @property
+    def polymer_entity_count_DNA(self) -> 'Attribute':
+        """The number of distinct DNA polymer entities."""
+    @property
+    def polymer_entity_count_RNA(self) -> 'Attribute':
+        """The number of distinct RNA polymer entities."""
+    @property
+    def polymer_entity_count_nucleic_acid(self) -> 'Attribute':
+        """The number of distinct nucleic acid polymer entities (DNA or RNA)."""
+    @property
+    def polymer_entity_count_nucleic_acid_hybrid(self) -> 'Attribute':
+        """The number of distinct hybrid nucleic acid polymer entities."""
+    @property
+    def polymer_entity_count_protein(self) -> 'Attribute':
+        """The number of distinct protein polymer entities."""
+    @property
+    def polymer_entity_taxonomy_count(self) -> 'Attribute':
+        """The number of distinct taxonomies represented among the polymer entities in the entry."""
+    @property
+    def polymer_molecular_weight_maximum(self) -> 'Attribute':
+        """The maximum molecular mass (KDa) of a polymer entity in the deposited structure entry."""
+    @property
+    def polymer_molecular_weight_minimum(self) -> 'Attribute':
+        """The minimum molecular mass (KDa) of a polymer entity in the deposited structure entry."""
+    @property
+    def polymer_monomer_count_maximum(self) -> 'Attribute':
+        """The maximum monomer count of a polymer entity per deposited structure model."""
+    @property
+    def polymer_monomer_count_minimum(self) -> 'Attribute':
+        """The minimum monomer count of a polymer entity per deposited structure model."""
+    @property
+    def representative_model(self) -> 'Attribute':
+        """The chosen representative model."""
+    @property
+    def resolution_combined(self) -> 'Attribute':
+        """"""
+    @property
+    def selected_polymer_entity_types(self) -> 'Attribute':
+        """Selected polymer entity type categories describing the entry."""
+    @property
+    def software_programs_combined(self) -> 'Attribute':
+        """"""
+    @property
+    def solvent_entity_count(self) -> 'Attribute':
+        """The number of distinct solvent entities per deposited structure model."""
+    @property
+    def structure_determination_methodology(self) -> 'Attribute':
+        """Indicates if the structure was determined using experimental or computational methods."""
+    @property
+    def structure_determination_methodology_priority(self) -> 'Attribute':
+        """Indicates the priority of the value in _rcsb_entry_info.structure_determination_methodology.  The lower the number the higher the priority.  Priority values for 'experimental' structures is currently set to 10 and  the values for 'computational' structures is set to 100."""
+    @property
+    def diffrn_resolution_high(self) -> 'Attr_DiffrnResolutionHigh':
+        """"""
+
+class Attr_RcsbExternalReferences(AttributeGroup):
+    """"""
+    @property
+    def id(self) -> 'Attribute':
+        """ID (accession) from external resource linked to this entry."""
+    @property
+    def link(self) -> 'Attribute':
+        """Link to this entry in external resource"""
+    @property
+    def type(self) -> 'Attribute':
+        """Internal identifier for external resources"""
+
+class Attr_RcsbIhmDatasetList(AttributeGroup):
+    """"""
+    @property
+    def count(self) -> 'Attribute':
+        """Number of input datasets used in integrative modeling."""
+    @property
+    def name(self) -> 'Attribute':
+        """Name of input dataset used in integrative modeling."""
+    @property
+    def type(self) -> 'Attribute':
+        """Type of input dataset used in integrative modeling."""
+
+class Attr_RcsbIhmDatasetSourceDbReference(AttributeGroup):
+    """"""
+    @property
+    def accession_code(self) -> 'Attribute':
+        """Accession code for the input dataset."""
+    @property
+    def db_name(self) -> 'Attribute':
+        """Name of the source database for the input dataset."""
+
+class Attr_MaQaMetricGlobal(AttributeGroup):
+    """"""
+    @property
+    def description(self) -> 'Attribute':
+        """Description of the global QA metric."""
+    @property
+    def name(self) -> 'Attribute':
+        """Name of the global QA metric."""
+    @property
+    def type(self) -> 'Attribute':
+        """The type of global QA metric."""
+    @property
+    def type_other_details(self) -> 'Attribute':
+        """Details for other type of global QA metric."""
+    @property
+    def value(self) -> 'Attribute':
+        """Value of the global QA metric."""
+
+class Attr_RcsbMaQaMetricGlobal(AttributeGroup):
+    """"""
+    @property
+    def model_id(self) -> 'Attribute':
+        """The model identifier."""
+    @property
+    def ma_qa_metric_global(self) -> 'Attr_MaQaMetricGlobal':
+        """"""
+
+class Attr_RcsbPrimaryCitation(AttributeGroup):
+    """"""
+    @property
+    def book_id_ISBN(self) -> 'Attribute':
+        """The International Standard Book Number (ISBN) code assigned to  the book cited; relevant for books or book chapters."""
+    @property
+    def book_publisher(self) -> 'Attribute':
+        """The name of the publisher of the citation; relevant  for books or book chapters."""
+    @property
+    def book_publisher_city(self) -> 'Attribute':
+        """The location of the publisher of the citation; relevant  for books or book chapters."""
+    @property
+    def book_title(self) -> 'Attribute':
+        """The title of the book in which the citation appeared; relevant  for books or book chapters."""
+    @property
+    def coordinate_linkage(self) -> 'Attribute':
+        """_rcsb_primary_citation.coordinate_linkage states whether this citation  is concerned with precisely the set of coordinates given in the  data block. If, for instance, the publication described the same  structure, but the coordinates had undergone further refinement  prior to the creation of the data block, the value of this data  item would be 'no'."""
+    @property
+    def country(self) -> 'Attribute':
+        """The country/region of publication; relevant for books  and book chapters."""
+    @property
+    def id(self) -> 'Attribute':
+        """The value of _rcsb_primary_citation.id must uniquely identify a record in the  CITATION list.   The _rcsb_primary_citation.id 'primary' should be used to indicate the  citation that the author(s) consider to be the most pertinent to  the contents of the data block.   Note that this item need not be a number; it can be any unique  identifier."""
+    @property
+    def journal_abbrev(self) -> 'Attribute':
+        """Abbreviated name of the cited journal as given in the  Chemical Abstracts Service Source Index."""
+    @property
+    def journal_id_ASTM(self) -> 'Attribute':
+        """The American Society for Testing and Materials (ASTM) code  assigned to the journal cited (also referred to as the CODEN  designator of the Chemical Abstracts Service); relevant for  journal articles."""
+    @property
+    def journal_id_CSD(self) -> 'Attribute':
+        """The Cambridge Structural Database (CSD) code assigned to the  journal cited; relevant for journal articles. This is also the  system used at the Protein Data Bank (PDB)."""
+    @property
+    def journal_id_ISSN(self) -> 'Attribute':
+        """The International Standard Serial Number (ISSN) code assigned to  the journal cited; relevant for journal articles."""
+    @property
+    def journal_issue(self) -> 'Attribute':
+        """Issue number of the journal cited; relevant for journal  articles."""
+    @property
+    def journal_volume(self) -> 'Attribute':
+        """Volume number of the journal cited; relevant for journal  articles."""
+    @property
+    def language(self) -> 'Attribute':
+        """Language in which the cited article is written."""
+    @property
+    def page_first(self) -> 'Attribute':
+        """The first page of the citation; relevant for journal  articles, books and book chapters."""
+    @property
+    def page_last(self) -> 'Attribute':
+        """The last page of the citation; relevant for journal  articles, books and book chapters."""
+    @property
+    def pdbx_database_id_DOI(self) -> 'Attribute':
+        """Document Object Identifier used by doi.org to uniquely  specify bibliographic entry."""
+    @property
+    def pdbx_database_id_PubMed(self) -> 'Attribute':
+        """Ascession number used by PubMed to categorize a specific  bibliographic entry."""
+    @property
+    def rcsb_ORCID_identifiers(self) -> 'Attribute':
+        """"""
+    @property
+    def rcsb_authors(self) -> 'Attribute':
+        """"""
+    @property
+    def rcsb_journal_abbrev(self) -> 'Attribute':
+        """Normalized journal abbreviation."""
+    @property
+    def title(self) -> 'Attribute':
+        """The title of the citation; relevant for journal articles, books  and book chapters."""
+    @property
+    def year(self) -> 'Attribute':
+        """The year of the citation; relevant for journal articles, books  and book chapters."""
+
+class Attr_Refine(AttributeGroup):
+    """"""
+    @property
+    def B_iso_max(self) -> 'Attribute':
+        """The maximum isotropic displacement parameter (B value)  found in the coordinate set."""
+    @property
+    def B_iso_mean(self) -> 'Attribute':
+        """The mean isotropic displacement parameter (B value)  for the coordinate set."""
+    @property
+    def B_iso_min(self) -> 'Attribute':
+        """The minimum isotropic displacement parameter (B value)  found in the coordinate set."""
+    @property
+    def aniso_B_1_1(self) -> 'Attribute':
+        """The [1][1] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure."""
+    @property
+    def aniso_B_1_2(self) -> 'Attribute':
+        """The [1][2] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure."""
+    @property
+    def aniso_B_1_3(self) -> 'Attribute':
+        """The [1][3] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure."""
+    @property
+    def aniso_B_2_2(self) -> 'Attribute':
+        """The [2][2] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure."""
+    @property
+    def aniso_B_2_3(self) -> 'Attribute':
+        """The [2][3] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure."""
+    @property
+    def aniso_B_3_3(self) -> 'Attribute':
+        """The [3][3] element of the matrix that defines the overall  anisotropic displacement model if one was refined for this  structure."""
+    @property
+    def correlation_coeff_Fo_to_Fc(self) -> 'Attribute':
+        """The correlation coefficient between the observed and              calculated structure factors for reflections included in              the refinement.               The correlation coefficient is scale-independent and gives              an idea of the quality of the refined model.                            sum~i~(Fo~i~ Fc~i~ - <Fo><Fc>) R~corr~ = ------------------------------------------------------------           SQRT{sum~i~(Fo~i~)^2^-<Fo>^2^} SQRT{sum~i~(Fc~i~)^2^-<Fc>^2^}               Fo = observed structure factors              Fc = calculated structure factors              <>   denotes average value               summation is over reflections included in the refinement"""
+    @property
+    def correlation_coeff_Fo_to_Fc_free(self) -> 'Attribute':
+        """The correlation coefficient between the observed and              calculated structure factors for reflections not included              in the refinement (free reflections).                The correlation coefficient is scale-independent and gives               an idea of the quality of the refined model.                            sum~i~(Fo~i~ Fc~i~ - <Fo><Fc>) R~corr~ = ------------------------------------------------------------           SQRT{sum~i~(Fo~i~)^2^-<Fo>^2^} SQRT{sum~i~(Fc~i~)^2^-<Fc>^2^}                Fo  = observed structure factors               Fc  = calculated structure factors               <>    denotes average value                summation is over reflections not included               in the refinement (free reflections)"""
+    @property
+    def details(self) -> 'Attribute':
+        """Description of special aspects of the refinement process."""
+    @property
+    def ls_R_factor_R_free(self) -> 'Attribute':
+        """Residual factor R for reflections that satisfy the resolution  limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low and the observation limit established by  _reflns.observed_criterion, and that were used as the test  reflections (i.e. were excluded from the refinement) when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details.       sum|F~obs~ - F~calc~|  R = ---------------------           sum|F~obs~|   F~obs~  = the observed structure-factor amplitudes  F~calc~ = the calculated structure-factor amplitudes   sum is taken over the specified reflections"""
+    @property
+    def ls_R_factor_R_free_error(self) -> 'Attribute':
+        """The estimated error in _refine.ls_R_factor_R_free.  The method used to estimate the error is described in the  item _refine.ls_R_factor_R_free_error_details."""
+    @property
+    def ls_R_factor_R_free_error_details(self) -> 'Attribute':
+        """Special aspects of the method used to estimated the error in  _refine.ls_R_factor_R_free."""
+    @property
+    def ls_R_factor_R_work(self) -> 'Attribute':
+        """Residual factor R for reflections that satisfy the resolution  limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low and the observation limit established by  _reflns.observed_criterion, and that were used as the working  reflections (i.e. were included in the refinement)  when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details.   _refine.ls_R_factor_obs should not be confused with  _refine.ls_R_factor_R_work; the former reports the results of a  refinement in which all observed reflections were used, the  latter a refinement in which a subset of the observed  reflections were excluded from refinement for the calculation  of a 'free' R factor. However, it would be meaningful to quote  both values if a 'free' R factor were calculated for most of  the refinement, but all of the observed reflections were used  in the final rounds of refinement; such a protocol should be  explained in _refine.details.       sum|F~obs~ - F~calc~|  R = ---------------------           sum|F~obs~|   F~obs~  = the observed structure-factor amplitudes  F~calc~ = the calculated structure-factor amplitudes   sum is taken over the specified reflections"""
+    @property
+    def ls_R_factor_all(self) -> 'Attribute':
+        """Residual factor R for all reflections that satisfy the resolution  limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low.       sum|F~obs~ - F~calc~|  R = ---------------------           sum|F~obs~|   F~obs~  = the observed structure-factor amplitudes  F~calc~ = the calculated structure-factor amplitudes   sum is taken over the specified reflections"""
+    @property
+    def ls_R_factor_obs(self) -> 'Attribute':
+        """Residual factor R for reflections that satisfy the resolution  limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low and the observation limit established by  _reflns.observed_criterion.   _refine.ls_R_factor_obs should not be confused with  _refine.ls_R_factor_R_work; the former reports the results of a  refinement in which all observed reflections were used, the  latter a refinement in which a subset of the observed  reflections were excluded from refinement for the calculation  of a 'free' R factor. However, it would be meaningful to quote  both values if a 'free' R factor were calculated for most of  the refinement, but all of the observed reflections were used  in the final rounds of refinement; such a protocol should be  explained in _refine.details.       sum|F~obs~ - F~calc~|  R = ---------------------           sum|F~obs~|   F~obs~  = the observed structure-factor amplitudes  F~calc~ = the calculated structure-factor amplitudes   sum is taken over the specified reflections"""
+    @property
+    def ls_d_res_high(self) -> 'Attribute':
+        """The smallest value for the interplanar spacings for the  reflection data used in the refinement in angstroms. This is  called the highest resolution."""
+    @property
+    def ls_d_res_low(self) -> 'Attribute':
+        """The largest value for the interplanar spacings for  the reflection data used in the refinement in angstroms.  This is called the lowest resolution."""
+    @property
+    def ls_matrix_type(self) -> 'Attribute':
+        """Type of matrix used to accumulate the least-squares derivatives."""
+    @property
+    def ls_number_parameters(self) -> 'Attribute':
+        """The number of parameters refined in the least-squares process.  If possible, this number should include some contribution from  the restrained parameters. The restrained parameters are  distinct from the constrained parameters (where one or more  parameters are linearly dependent on the refined value of  another). Least-squares restraints often depend on geometry or  energy considerations and this makes their direct contribution  to this number, and to the goodness-of-fit calculation,  difficult to assess."""
+    @property
+    def ls_number_reflns_R_free(self) -> 'Attribute':
+        """The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low  and the observation limit established by  _reflns.observed_criterion, and that were used as the test  reflections (i.e. were excluded from the refinement) when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details."""
+    @property
+    def ls_number_reflns_R_work(self) -> 'Attribute':
+        """The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low  and the observation limit established by  _reflns.observed_criterion, and that were used as the working  reflections (i.e. were included in the refinement) when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details."""
+    @property
+    def ls_number_reflns_all(self) -> 'Attribute':
+        """The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low."""
+    @property
+    def ls_number_reflns_obs(self) -> 'Attribute':
+        """The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low  and the observation limit established by  _reflns.observed_criterion."""
+    @property
+    def ls_number_restraints(self) -> 'Attribute':
+        """The number of restrained parameters. These are parameters which  are not directly dependent on another refined parameter.  Restrained parameters often involve geometry or energy  dependencies.  See also _atom_site.constraints and _atom_site.refinement_flags.  A general description of refinement constraints may appear in  _refine.details."""
+    @property
+    def ls_percent_reflns_R_free(self) -> 'Attribute':
+        """The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low  and the observation limit established by  _reflns.observed_criterion, and that were used as the test  reflections (i.e. were excluded from the refinement) when the  refinement included the calculation of a 'free' R factor,  expressed as a percentage of the number of geometrically  observable reflections that satisfy the resolution limits."""
+    @property
+    def ls_percent_reflns_obs(self) -> 'Attribute':
+        """The number of reflections that satisfy the resolution limits  established by _refine.ls_d_res_high and _refine.ls_d_res_low  and the observation limit established by  _reflns.observed_criterion, expressed as a percentage of the  number of geometrically observable reflections that satisfy  the resolution limits."""
+    @property
+    def ls_redundancy_reflns_all(self) -> 'Attribute':
+        """The ratio of the total number of observations of the  reflections that satisfy the resolution limits established by  _refine.ls_d_res_high and _refine.ls_d_res_low to the number  of crystallographically unique reflections that satisfy the  same limits."""
+    @property
+    def ls_redundancy_reflns_obs(self) -> 'Attribute':
+        """The ratio of the total number of observations of the  reflections that satisfy the resolution limits established by  _refine.ls_d_res_high and _refine.ls_d_res_low and the  observation limit established by _reflns.observed_criterion to  the number of crystallographically unique reflections that  satisfy the same limits."""
+    @property
+    def ls_wR_factor_R_free(self) -> 'Attribute':
+        """Weighted residual factor wR for reflections that satisfy the  resolution limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low and the observation limit established by  _reflns.observed_criterion, and that were used as the test  reflections (i.e. were excluded from the refinement) when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details.        ( sum|w |Y~obs~ - Y~calc~|^2^| )^1/2^  wR = ( ---------------------------- )       (        sum|w Y~obs~^2^|      )   Y~obs~  = the observed amplitude specified by            _refine.ls_structure_factor_coef  Y~calc~ = the calculated amplitude specified by            _refine.ls_structure_factor_coef  w       = the least-squares weight   sum is taken over the specified reflections"""
+    @property
+    def ls_wR_factor_R_work(self) -> 'Attribute':
+        """Weighted residual factor wR for reflections that satisfy the  resolution limits established by _refine.ls_d_res_high and  _refine.ls_d_res_low and the observation limit established by  _reflns.observed_criterion, and that were used as the working  reflections (i.e. were included in the refinement) when the  refinement included the calculation of a 'free' R factor.  Details of how reflections were assigned to the working and  test sets are given in _reflns.R_free_details.        ( sum|w |Y~obs~ - Y~calc~|^2^| )^1/2^  wR = ( ---------------------------- )       (        sum|w Y~obs~^2^|      )   Y~obs~  = the observed amplitude specified by            _refine.ls_structure_factor_coef  Y~calc~ = the calculated amplitude specified by            _refine.ls_structure_factor_coef  w       = the least-squares weight   sum is taken over the specified reflections"""
+    @property
+    def occupancy_max(self) -> 'Attribute':
+        """The maximum value for occupancy found in the coordinate set."""
+    @property
+    def occupancy_min(self) -> 'Attribute':
+        """The minimum value for occupancy found in the coordinate set."""
+    @property
+    def overall_FOM_free_R_set(self) -> 'Attribute':
+        """Average figure of merit of phases of reflections not included  in the refinement.   This value is derived from the likelihood function.   FOM           = I~1~(X)/I~0~(X)   I~0~, I~1~     = zero- and first-order modified Bessel functions                  of the first kind  X              = sigma~A~ |E~o~| |E~c~|/SIGMA  E~o~, E~c~     = normalized observed and calculated structure                  factors  sigma~A~       = <cos 2 pi s delta~x~> SQRT(Sigma~P~/Sigma~N~)                  estimated using maximum likelihood  Sigma~P~       = sum~{atoms in model}~ f^2^  Sigma~N~       = sum~{atoms in crystal}~ f^2^  f              = form factor of atoms  delta~x~       = expected error  SIGMA          = (sigma~{E;exp}~)^2^ + epsilon [1-(sigma~A~)^2^]  sigma~{E;exp}~ = uncertainties of normalized observed                  structure factors  epsilon       = multiplicity of the diffracting plane   Ref: Murshudov, G. N., Vagin, A. A. & Dodson, E. J. (1997).       Acta Cryst. D53, 240-255."""
+    @property
+    def overall_FOM_work_R_set(self) -> 'Attribute':
+        """Average figure of merit of phases of reflections included in  the refinement.   This value is derived from the likelihood function.   FOM           = I~1~(X)/I~0~(X)   I~0~, I~1~     = zero- and first-order modified Bessel functions                  of the first kind  X              = sigma~A~ |E~o~| |E~c~|/SIGMA  E~o~, E~c~     = normalized observed and calculated structure                  factors  sigma~A~       = <cos 2 pi s delta~x~> SQRT(Sigma~P~/Sigma~N~)                  estimated using maximum likelihood  Sigma~P~       = sum~{atoms in model}~ f^2^  Sigma~N~       = sum~{atoms in crystal}~ f^2^  f              = form factor of atoms  delta~x~       = expected error  SIGMA          = (sigma~{E;exp}~)^2^ + epsilon [1-(sigma~A~)^2^]  sigma~{E;exp}~ = uncertainties of normalized observed                  structure factors  epsilon       = multiplicity of the diffracting plane   Ref: Murshudov, G. N., Vagin, A. A. & Dodson, E. J. (1997).       Acta Cryst. D53, 240-255."""
+    @property
+    def overall_SU_B(self) -> 'Attribute':
+        """The overall standard uncertainty (estimated standard deviation)            of the displacement parameters based on a maximum-likelihood            residual.             The overall standard uncertainty (sigma~B~)^2^ gives an idea            of the uncertainty in the B values of averagely defined            atoms (atoms with B values equal to the average B value).                                           N~a~ (sigma~B~)^2^ = 8 ----------------------------------------------                   sum~i~ {[1/Sigma - (E~o~)^2^ (1-m^2^)](SUM_AS)s^4^}             N~a~           = number of atoms            E~o~           = normalized structure factors            m              = figure of merit of phases of reflections                             included in the summation            s              = reciprocal-space vector             SUM_AS         = (sigma~A~)^2^/Sigma^2^            Sigma          = (sigma~{E;exp}~)^2^ + epsilon [1-(sigma~A~)^2^]            sigma~{E;exp}~  = experimental uncertainties of normalized                             structure factors            sigma~A~        = <cos 2 pi s delta~x~> SQRT(Sigma~P~/Sigma~N~)                             estimated using maximum likelihood            Sigma~P~        = sum~{atoms in model}~ f^2^            Sigma~N~        = sum~{atoms in crystal}~ f^2^            f               = atom form factor            delta~x~        = expected error            epsilon         = multiplicity of diffracting plane             summation is over all reflections included in refinement             Ref: (sigma~A~ estimation) 'Refinement of macromolecular                 structures by the maximum-likelihood method',                 Murshudov, G. N., Vagin, A. A. & Dodson, E. J. (1997).                 Acta Cryst. D53, 240-255.                  (SU B estimation) Murshudov, G. N. & Dodson,                 E. J. (1997). Simplified error estimation a la                 Cruickshank in macromolecular crystallography.                 CCP4 Newsletter on Protein Crystallography, No. 33,                 January 1997, pp. 31-39.                 http://www.ccp4.ac.uk/newsletters/newsletter33/murshudov.html"""
+    @property
+    def overall_SU_ML(self) -> 'Attribute':
+        """The overall standard uncertainty (estimated standard deviation)            of the positional parameters based on a maximum likelihood            residual.             The overall standard uncertainty (sigma~X~)^2^ gives an            idea of the uncertainty in the position of averagely            defined atoms (atoms with B values equal to average B value)                   3                         N~a~ (sigma~X~)^2^  = ---------------------------------------------------------                  8 pi^2^ sum~i~ {[1/Sigma - (E~o~)^2^ (1-m^2^)](SUM_AS)s^2^}             N~a~           = number of atoms            E~o~           = normalized structure factors            m              = figure of merit of phases of reflections                             included in the summation            s              = reciprocal-space vector             SUM_AS         = (sigma~A~)^2^/Sigma^2^            Sigma          = (sigma~{E;exp}~)^2^ + epsilon [1-(sigma~A~)^2^]            sigma~{E;exp}~  = experimental uncertainties of normalized                             structure factors            sigma~A~        = <cos 2 pi s delta~x~> SQRT(Sigma~P~/Sigma~N~)                             estimated using maximum likelihood            Sigma~P~        = sum~{atoms in model}~ f^2^            Sigma~N~        = sum~{atoms in crystal}~ f^2^            f               = atom form factor            delta~x~        = expected error            epsilon         = multiplicity of diffracting plane             summation is over all reflections included in refinement             Ref: (sigma_A estimation) 'Refinement of macromolecular                 structures by the maximum-likelihood method',                 Murshudov, G. N., Vagin, A. A. & Dodson, E. J. (1997).                 Acta Cryst. D53, 240-255.                  (SU ML estimation) Murshudov, G. N. & Dodson,                 E. J. (1997). Simplified error estimation a la                 Cruickshank in macromolecular crystallography.                 CCP4 Newsletter on Protein Crystallography, No. 33,                 January 1997, pp. 31-39.                 http://www.ccp4.ac.uk/newsletters/newsletter33/murshudov.html"""
+    @property
+    def overall_SU_R_Cruickshank_DPI(self) -> 'Attribute':
+        """The overall standard uncertainty (estimated standard deviation)  of the displacement parameters based on the crystallographic  R value, expressed in a formalism known as the dispersion  precision indicator (DPI).   The overall standard uncertainty (sigma~B~) gives an idea  of the uncertainty in the B values of averagely defined  atoms (atoms with B values equal to the average B value).                          N~a~  (sigma~B~)^2^ = 0.65 ---------- (R~value~)^2^ (D~min~)^2^ C^-2/3^                       (N~o~-N~p~)    N~a~     = number of atoms included in refinement  N~o~     = number of observations  N~p~     = number of parameters refined  R~value~ = conventional crystallographic R value  D~min~   = maximum resolution  C        = completeness of data   Ref: Cruickshank, D. W. J. (1999). Acta Cryst. D55, 583-601.        Murshudov, G. N. & Dodson,       E. J. (1997). Simplified error estimation a la       Cruickshank in macromolecular crystallography.       CCP4 Newsletter on Protein Crystallography, No. 33,       January 1997, pp. 31-39.       http://www.ccp4.ac.uk/newsletters/newsletter33/murshudov.html"""
+    @property
+    def overall_SU_R_free(self) -> 'Attribute':
+        """The overall standard uncertainty (estimated standard deviation)  of the displacement parameters based on the free R value.   The overall standard uncertainty (sigma~B~) gives an idea  of the uncertainty in the B values of averagely defined  atoms (atoms with B values equal to the average B value).                          N~a~  (sigma~B~)^2^ = 0.65 ---------- (R~free~)^2^ (D~min~)^2^ C^-2/3^                       (N~o~-N~p~)    N~a~     = number of atoms included in refinement  N~o~     = number of observations  N~p~     = number of parameters refined  R~free~  = conventional free crystallographic R value calculated           using reflections not included in refinement  D~min~   = maximum resolution  C        = completeness of data   Ref: Cruickshank, D. W. J. (1999). Acta Cryst. D55, 583-601.        Murshudov, G. N. & Dodson,       E. J. (1997). Simplified error estimation a la       Cruickshank in macromolecular crystallography.       CCP4 Newsletter on Protein Crystallography, No. 33,       January 1997, pp. 31-39.       http://www.ccp4.ac.uk/newsletters/newsletter33/murshudov.html"""
+    @property
+    def pdbx_R_Free_selection_details(self) -> 'Attribute':
+        """Details of the manner in which the cross validation  reflections were selected."""
+    @property
+    def pdbx_TLS_residual_ADP_flag(self) -> 'Attribute':
+        """A flag for TLS refinements identifying the type of atomic displacement parameters stored  in _atom_site.B_iso_or_equiv."""
+    @property
+    def pdbx_average_fsc_free(self) -> 'Attribute':
+        """Average Fourier Shell Correlation (avgFSC) between model and  observed structure factors for reflections not included in refinement.   The average FSC is a measure of the agreement between observed  and calculated structure factors.                    sum(N~i~ FSC~free-i~)  avgFSC~free~   = ---------------------                   sum(N~i~)    N~i~          = the number of free reflections in the resolution shell i  FSC~free-i~   = FSC for free reflections in the i-th resolution shell calculated as:                  (sum(|F~o~| |F~c~| fom cos(phi~c~-phi~o~)))  FSC~free-i~  = -------------------------------------------                 (sum(|F~o~|^2^) (sum(|F~c~|^2^)))^1/2^   |F~o~|   = amplitude of observed structure factor  |F~c~|   = amplitude of calculated structure factor  phi~o~   = phase of observed structure factor  phi~c~   = phase of calculated structure factor  fom      = figure of merit of the experimental phases.   Summation of FSC~free-i~ is carried over all free reflections in the resolution shell.   Summation of avgFSC~free~ is carried over all resolution shells.    Ref:  Rosenthal P.B., Henderson R.        'Optimal determination of particle orientation, absolute hand,        and contrast loss in single-particle electron cryomicroscopy.        Journal of Molecular Biology. 2003;333(4):721-745, equation (A6)."""
+    @property
+    def pdbx_average_fsc_overall(self) -> 'Attribute':
+        """Overall average Fourier Shell Correlation (avgFSC) between model and  observed structure factors for all reflections.   The average FSC is a measure of the agreement between observed  and calculated structure factors.              sum(N~i~ FSC~i~)  avgFSC   = ----------------             sum(N~i~)    N~i~     = the number of all reflections in the resolution shell i  FSC~i~   = FSC for all reflections in the i-th resolution shell calculated as:             (sum(|F~o~| |F~c~| fom cos(phi~c~-phi~o~)))  FSC~i~  = -------------------------------------------            (sum(|F~o~|^2^) (sum(|F~c~|^2^)))^1/2^   |F~o~|   = amplitude of observed structure factor  |F~c~|   = amplitude of calculated structure factor  phi~o~   = phase of observed structure factor  phi~c~   = phase of calculated structure factor  fom      = figure of merit of the experimental phases.   Summation of FSC~i~ is carried over all reflections in the resolution shell.   Summation of avgFSC is carried over all resolution shells.    Ref:  Rosenthal P.B., Henderson R.        'Optimal determination of particle orientation, absolute hand,        and contrast loss in single-particle electron cryomicroscopy.        Journal of Molecular Biology. 2003;333(4):721-745, equation (A6)."""
+    @property
+    def pdbx_average_fsc_work(self) -> 'Attribute':
+        """Average Fourier Shell Correlation (avgFSC) between model and  observed structure factors for reflections included in refinement.   The average FSC is a measure of the agreement between observed  and calculated structure factors.                    sum(N~i~ FSC~work-i~)  avgFSC~work~   = ---------------------                   sum(N~i~)    N~i~          = the number of working reflections in the resolution shell i  FSC~work-i~   = FSC for working reflections in the i-th resolution shell calculated as:                  (sum(|F~o~| |F~c~| fom cos(phi~c~-phi~o~)))  FSC~work-i~  = -------------------------------------------                 (sum(|F~o~|^2^) (sum(|F~c~|^2^)))^1/2^   |F~o~|   = amplitude of observed structure factor  |F~c~|   = amplitude of calculated structure factor  phi~o~   = phase of observed structure factor  phi~c~   = phase of calculated structure factor  fom      = figure of merit of the experimental phases.   Summation of FSC~work-i~ is carried over all working reflections in the resolution shell.   Summation of avgFSC~work~ is carried over all resolution shells.    Ref:  Rosenthal P.B., Henderson R.        'Optimal determination of particle orientation, absolute hand,        and contrast loss in single-particle electron cryomicroscopy.        Journal of Molecular Biology. 2003;333(4):721-745, equation (A6)."""
+    @property
+    def pdbx_data_cutoff_high_absF(self) -> 'Attribute':
+        """Value of F at 'high end' of data cutoff."""
+    @property
+    def pdbx_data_cutoff_high_rms_absF(self) -> 'Attribute':
+        """Value of RMS |F| used as high data cutoff."""
+    @property
+    def pdbx_data_cutoff_low_absF(self) -> 'Attribute':
+        """Value of F at 'low end' of data cutoff."""
+    @property
+    def pdbx_diffrn_id(self) -> 'Attribute':
+        """"""
+    @property
+    def pdbx_isotropic_thermal_model(self) -> 'Attribute':
+        """Whether the structure was refined with indvidual isotropic, anisotropic or overall temperature factor."""
+    @property
+    def pdbx_ls_cross_valid_method(self) -> 'Attribute':
+        """Whether the cross validataion method was used through out or only at the end."""
+    @property
+    def pdbx_ls_sigma_F(self) -> 'Attribute':
+        """Data cutoff (SIGMA(F))"""
+    @property
+    def pdbx_ls_sigma_Fsqd(self) -> 'Attribute':
+        """Data cutoff (SIGMA(F^2))"""
+    @property
+    def pdbx_ls_sigma_I(self) -> 'Attribute':
+        """Data cutoff (SIGMA(I))"""
+    @property
+    def pdbx_method_to_determine_struct(self) -> 'Attribute':
+        """Method(s) used to determine the structure."""
+    @property
+    def pdbx_overall_ESU_R(self) -> 'Attribute':
+        """Overall estimated standard uncertainties of positional  parameters based on R value."""
+    @property
+    def pdbx_overall_ESU_R_Free(self) -> 'Attribute':
+        """Overall estimated standard uncertainties of positional parameters based on R free value."""
+    @property
+    def pdbx_overall_SU_R_Blow_DPI(self) -> 'Attribute':
+        """The overall standard uncertainty (estimated standard deviation)  of the displacement parameters based on the crystallographic  R value, expressed in a formalism known as the dispersion  precision indicator (DPI).   Ref: Blow, D (2002) Acta Cryst. D58, 792-797"""
+    @property
+    def pdbx_overall_SU_R_free_Blow_DPI(self) -> 'Attribute':
+        """The overall standard uncertainty (estimated standard deviation)  of the displacement parameters based on the crystallographic  R-free value, expressed in a formalism known as the dispersion  precision indicator (DPI).   Ref: Blow, D (2002) Acta Cryst. D58, 792-797"""
+    @property
+    def pdbx_overall_SU_R_free_Cruickshank_DPI(self) -> 'Attribute':
+        """The overall standard uncertainty (estimated standard deviation)  of the displacement parameters based on the crystallographic  R-free value, expressed in a formalism known as the dispersion  precision indicator (DPI).   Ref: Cruickshank, D. W. J. (1999). Acta Cryst. D55, 583-601."""
+    @property
+    def pdbx_overall_phase_error(self) -> 'Attribute':
+        """The overall phase error for all reflections after refinement using  the current refinement target."""
+    @property
+    def pdbx_refine_id(self) -> 'Attribute':
+        """This data item uniquely identifies a refinement within an entry.  _refine.pdbx_refine_id can be used to distinguish the results of  joint refinements."""
+    @property
+    def pdbx_solvent_ion_probe_radii(self) -> 'Attribute':
+        """For bulk solvent mask calculation, the amount that the ionic radii of atoms, which can be ions, are increased used."""
+    @property
+    def pdbx_solvent_shrinkage_radii(self) -> 'Attribute':
+        """For bulk solvent mask calculation, amount mask is shrunk after taking away atoms with new radii and a constant value assigned to this new region."""
+    @property
+    def pdbx_solvent_vdw_probe_radii(self) -> 'Attribute':
+        """For bulk solvent mask calculation, the value by which the vdw radii of non-ion atoms (like carbon) are increased and used."""
+    @property
+    def pdbx_starting_model(self) -> 'Attribute':
+        """Starting model for refinement.  Starting model for  molecular replacement should refer to a previous  structure or experiment."""
+    @property
+    def pdbx_stereochem_target_val_spec_case(self) -> 'Attribute':
+        """Special case of stereochemistry target values used in SHELXL refinement."""
+    @property
+    def pdbx_stereochemistry_target_values(self) -> 'Attribute':
+        """Stereochemistry target values used in refinement."""
+    @property
+    def solvent_model_details(self) -> 'Attribute':
+        """Special aspects of the solvent model used during refinement."""
+    @property
+    def solvent_model_param_bsol(self) -> 'Attribute':
+        """The value of the BSOL solvent-model parameter describing  the average isotropic displacement parameter of disordered  solvent atoms.   This is one of the two parameters (the other is  _refine.solvent_model_param_ksol) in Tronrud's method of  modelling the contribution of bulk solvent to the  scattering. The standard scale factor is modified according  to the expression       k0 exp(-B0 * s^2^)[1-KSOL * exp(-BSOL * s^2^)]   where k0 and B0 are the scale factors for the protein.   Ref: Tronrud, D. E. (1997). Methods Enzymol. 277, 243-268."""
+    @property
+    def solvent_model_param_ksol(self) -> 'Attribute':
+        """The value of the KSOL solvent-model parameter describing  the ratio of the electron density in the bulk solvent to the  electron density in the molecular solute.   This is one of the two parameters (the other is  _refine.solvent_model_param_bsol) in Tronrud's method of  modelling the contribution of bulk solvent to the  scattering. The standard scale factor is modified according  to the expression       k0 exp(-B0 * s^2^)[1-KSOL * exp(-BSOL * s^2^)]   where k0 and B0 are the scale factors for the protein.   Ref: Tronrud, D. E. (1997). Methods Enzymol. 277, 243-268."""
+
+class Attr_RefineAnalyze(AttributeGroup):
+    """"""
+    @property
+    def Luzzati_coordinate_error_free(self) -> 'Attribute':
+        """The estimated coordinate error obtained from the plot of  the R value versus sin(theta)/lambda for the reflections  treated as a test set during refinement.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810."""
+    @property
+    def Luzzati_coordinate_error_obs(self) -> 'Attribute':
+        """The estimated coordinate error obtained from the plot of  the R value versus sin(theta)/lambda for reflections classified  as observed.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810."""
+    @property
+    def Luzzati_d_res_low_free(self) -> 'Attribute':
+        """The value of the low-resolution cutoff used in constructing the  Luzzati plot for reflections treated as a test set during  refinement.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810."""
+    @property
+    def Luzzati_d_res_low_obs(self) -> 'Attribute':
+        """The value of the low-resolution cutoff used in  constructing the Luzzati plot for reflections classified as  observed.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810."""
+    @property
+    def Luzzati_sigma_a_free(self) -> 'Attribute':
+        """The value of sigma~a~ used in constructing the Luzzati plot for  the reflections treated as a test set during refinement.  Details of the estimation of sigma~a~ can be specified  in _refine_analyze.Luzzati_sigma_a_free_details.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810."""
+    @property
+    def Luzzati_sigma_a_obs(self) -> 'Attribute':
+        """The value of sigma~a~ used in constructing the Luzzati plot for  reflections classified as observed. Details of the  estimation of sigma~a~ can be specified in  _refine_analyze.Luzzati_sigma_a_obs_details.   Ref:  Luzzati, V. (1952). Traitement statistique des erreurs  dans la determination des structures cristallines. Acta  Cryst. 5, 802-810."""
+    @property
+    def number_disordered_residues(self) -> 'Attribute':
+        """The number of discretely disordered residues in the refined  model."""
+    @property
+    def occupancy_sum_hydrogen(self) -> 'Attribute':
+        """The sum of the occupancies of the hydrogen atoms in the refined  model."""
+    @property
+    def occupancy_sum_non_hydrogen(self) -> 'Attribute':
+        """The sum of the occupancies of the non-hydrogen atoms in the   refined model."""
+    @property
+    def pdbx_Luzzati_d_res_high_obs(self) -> 'Attribute':
+        """record the high resolution for calculating Luzzati statistics."""
+    @property
+    def pdbx_refine_id(self) -> 'Attribute':
+        """This data item uniquely identifies a refinement within an entry.  _refine_analyze.pdbx_refine_id can be used to distinguish the results  of joint refinements."""
+
+class Attr_RefineHist(AttributeGroup):
+    """"""
+    @property
+    def cycle_id(self) -> 'Attribute':
+        """The value of _refine_hist.cycle_id must uniquely identify a  record in the REFINE_HIST list.   Note that this item need not be a number; it can be any unique  identifier."""
+    @property
+    def d_res_high(self) -> 'Attribute':
+        """The lowest value for the interplanar spacings for the  reflection data for this cycle of refinement. This is called  the highest resolution."""
+    @property
+    def d_res_low(self) -> 'Attribute':
+        """The highest value for the interplanar spacings for the  reflection data for this cycle of refinement. This is  called the lowest resolution."""
+    @property
+    def number_atoms_solvent(self) -> 'Attribute':
+        """The number of solvent atoms that were included in the model at  this cycle of the refinement."""
+    @property
+    def number_atoms_total(self) -> 'Attribute':
+        """The total number of atoms that were included in the model at  this cycle of the refinement."""
+    @property
+    def pdbx_B_iso_mean_ligand(self) -> 'Attribute':
+        """Mean isotropic B-value for ligand molecules included in refinement."""
+    @property
+    def pdbx_B_iso_mean_solvent(self) -> 'Attribute':
+        """Mean isotropic B-value for solvent molecules included in refinement."""
+    @property
+    def pdbx_number_atoms_ligand(self) -> 'Attribute':
+        """Number of ligand atoms included in refinement"""
+    @property
+    def pdbx_number_atoms_nucleic_acid(self) -> 'Attribute':
+        """Number of nucleic atoms included in refinement"""
+    @property
+    def pdbx_number_atoms_protein(self) -> 'Attribute':
+        """Number of protein atoms included in refinement"""
+    @property
+    def pdbx_number_residues_total(self) -> 'Attribute':
+        """Total number of polymer residues included in refinement."""
+    @property
+    def pdbx_refine_id(self) -> 'Attribute':
+        """This data item uniquely identifies a refinement within an entry.  _refine_hist.pdbx_refine_id can be used to distinguish the results  of joint refinements."""
+
+class Attr_RefineLsRestr(AttributeGroup):
+    """"""
+    @property
+    def dev_ideal(self) -> 'Attribute':
+        """For the given parameter type, the root-mean-square deviation  between the ideal values used as restraints in the least-squares  refinement and the values obtained by refinement. For instance,  bond distances may deviate by 0.018 /%A (r.m.s.) from ideal  values in the current model."""
+    @property
+    def dev_ideal_target(self) -> 'Attribute':
+        """For the given parameter type, the target root-mean-square  deviation between the ideal values used as restraints in the  least-squares refinement and the values obtained by refinement."""
+    @property
+    def number(self) -> 'Attribute':
+        """The number of parameters of this type subjected to restraint in  least-squares refinement."""
+    @property
+    def pdbx_refine_id(self) -> 'Attribute':
+        """This data item uniquely identifies a refinement within an entry.  _refine_ls_restr.pdbx_refine_id can be used to distinguish the results  of joint refinements."""
+    @property
+    def pdbx_restraint_function(self) -> 'Attribute':
+        """The functional form of the restraint function used in the least-squares  refinement."""
+    @property
+    def type(self) -> 'Attribute':
+        """The type of the parameter being restrained.  Explicit sets of data values are provided for the programs  PROTIN/PROLSQ (beginning with p_) and RESTRAIN (beginning with  RESTRAIN_). As computer programs change, these data values  are given as examples, not as an enumeration list. Computer  programs that convert a data block to a refinement table will  expect the exact form of the data values given here to be used."""
+    @property
+    def weight(self) -> 'Attribute':
+        """The weighting value applied to this type of restraint in  the least-squares refinement."""
+
+class Attr_Reflns(AttributeGroup):
+    """"""
+    @property
+    def B_iso_Wilson_estimate(self) -> 'Attribute':
+        """The value of the overall isotropic displacement parameter  estimated from the slope of the Wilson plot."""
+    @property
+    def R_free_details(self) -> 'Attribute':
+        """A description of the method by which a subset of reflections was  selected for exclusion from refinement so as to be used in the  calculation of a 'free' R factor."""
+    @property
+    def Rmerge_F_all(self) -> 'Attribute':
+        """Residual factor Rmerge for all reflections that satisfy the  resolution limits established by _reflns.d_resolution_high  and _reflns.d_resolution_low.               sum~i~(sum~j~|F~j~ - <F>|)  Rmerge(F) = --------------------------                   sum~i~(sum~j~<F>)   F~j~ = the amplitude of the jth observation of reflection i  <F>  = the mean of the amplitudes of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection"""
+    @property
+    def Rmerge_F_obs(self) -> 'Attribute':
+        """Residual factor Rmerge for reflections that satisfy the  resolution limits established by _reflns.d_resolution_high  and _reflns.d_resolution_low and the observation limit  established by _reflns.observed_criterion.               sum~i~(sum~j~|F~j~ - <F>|)  Rmerge(F) = --------------------------                   sum~i~(sum~j~<F>)   F~j~ = the amplitude of the jth observation of reflection i  <F>  = the mean of the amplitudes of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection"""
+    @property
+    def d_resolution_high(self) -> 'Attribute':
+        """The smallest value in angstroms for the interplanar spacings  for the reflection data. This is called the highest resolution."""
+    @property
+    def d_resolution_low(self) -> 'Attribute':
+        """The largest value in angstroms for the interplanar spacings  for the reflection data. This is called the lowest resolution."""
+    @property
+    def data_reduction_details(self) -> 'Attribute':
+        """A description of special aspects of the data-reduction  procedures."""
+    @property
+    def data_reduction_method(self) -> 'Attribute':
+        """The method used for data reduction.   Note that this is not the computer program used, which is  described in the SOFTWARE category, but the method  itself.   This data item should be used to describe significant  methodological options used within the data-reduction programs."""
+    @property
+    def details(self) -> 'Attribute':
+        """A description of reflection data not covered by other data  names. This should include details of the Friedel pairs."""
+    @property
+    def limit_h_max(self) -> 'Attribute':
+        """Maximum value of the Miller index h for the reflection data. This  need not have the same value as _diffrn_reflns.limit_h_max."""
+    @property
+    def limit_h_min(self) -> 'Attribute':
+        """Minimum value of the Miller index h for the reflection data. This  need not have the same value as _diffrn_reflns.limit_h_min."""
+    @property
+    def limit_k_max(self) -> 'Attribute':
+        """Maximum value of the Miller index k for the reflection data. This  need not have the same value as _diffrn_reflns.limit_k_max."""
+    @property
+    def limit_k_min(self) -> 'Attribute':
+        """Minimum value of the Miller index k for the reflection data. This  need not have the same value as _diffrn_reflns.limit_k_min."""
+    @property
+    def limit_l_max(self) -> 'Attribute':
+        """Maximum value of the Miller index l for the reflection data. This  need not have the same value as _diffrn_reflns.limit_l_max."""
+    @property
+    def limit_l_min(self) -> 'Attribute':
+        """Minimum value of the Miller index l for the reflection data. This  need not have the same value as _diffrn_reflns.limit_l_min."""
+    @property
+    def number_all(self) -> 'Attribute':
+        """The total number of reflections in the REFLN list (not the  DIFFRN_REFLN list). This number may contain Friedel-equivalent  reflections according to the nature of the structure and the  procedures used. The item _reflns.details describes the  reflection data."""
+    @property
+    def number_obs(self) -> 'Attribute':
+        """The number of reflections in the REFLN list (not the DIFFRN_REFLN  list) classified as observed (see _reflns.observed_criterion).  This number may contain Friedel-equivalent reflections according  to the nature of the structure and the procedures used."""
+    @property
+    def observed_criterion(self) -> 'Attribute':
+        """The criterion used to classify a reflection as 'observed'. This  criterion is usually expressed in terms of a sigma(I) or  sigma(F) threshold."""
+    @property
+    def observed_criterion_F_max(self) -> 'Attribute':
+        """The criterion used to classify a reflection as 'observed'  expressed as an upper limit for the value of F."""
+    @property
+    def observed_criterion_F_min(self) -> 'Attribute':
+        """The criterion used to classify a reflection as 'observed'  expressed as a lower limit for the value of F."""
+    @property
+    def observed_criterion_I_max(self) -> 'Attribute':
+        """The criterion used to classify a reflection as 'observed'  expressed as an upper limit for the value of I."""
+    @property
+    def observed_criterion_I_min(self) -> 'Attribute':
+        """The criterion used to classify a reflection as 'observed'  expressed as a lower limit for the value of I."""
+    @property
+    def observed_criterion_sigma_F(self) -> 'Attribute':
+        """The criterion used to classify a reflection as 'observed'  expressed as a multiple of the value of sigma(F)."""
+    @property
+    def observed_criterion_sigma_I(self) -> 'Attribute':
+        """The criterion used to classify a reflection as 'observed'  expressed as a multiple of the value of sigma(I)."""
+    @property
+    def pdbx_CC_half(self) -> 'Attribute':
+        """The Pearson's correlation coefficient expressed as a decimal value               between the average intensities from randomly selected               half-datasets.  	      Ref: Karplus & Diederichs (2012), Science 336, 1030-33"""
+    @property
+    def pdbx_R_split(self) -> 'Attribute':
+        """R split measures the agreement between the sets of intensities created by merging               odd- and even-numbered images  from the overall data.  	      Ref: T. A. White, R. A. Kirian, A. V. Martin, A. Aquila, K. Nass, A. Barty               and H. N. Chapman (2012), J. Appl. Cryst. 45, 335-341"""
+    @property
+    def pdbx_Rmerge_I_obs(self) -> 'Attribute':
+        """The R value for merging intensities satisfying the observed  criteria in this data set."""
+    @property
+    def pdbx_Rpim_I_all(self) -> 'Attribute':
+        """The precision-indicating merging R factor value Rpim,  for merging all intensities in this data set.          sum~i~ [1/(N~i~ - 1)]1/2^ sum~j~ | I~j~ - <I~i~> |  Rpim = --------------------------------------------------                       sum~i~ ( sum~j~ I~j~ )   I~j~   = the intensity of the jth observation of reflection i  <I~i~> = the mean of the intensities of all observations           of reflection i  N~i~   = the redundancy (the number of times reflection i           has been measured).   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection.   Ref: Diederichs, K. & Karplus, P. A. (1997). Nature Struct.       Biol. 4, 269-275.       Weiss, M. S. & Hilgenfeld, R. (1997). J. Appl. Cryst.       30, 203-205.       Weiss, M. S. (2001). J. Appl. Cryst. 34, 130-135."""
+    @property
+    def pdbx_Rrim_I_all(self) -> 'Attribute':
+        """The redundancy-independent merging R factor value Rrim,               also denoted Rmeas, for merging all intensities in this               data set.                       sum~i~ [N~i~/(N~i~ - 1)]1/2^ sum~j~ | I~j~ - <I~i~> |               Rrim = ----------------------------------------------------                                   sum~i~ ( sum~j~ I~j~ )                I~j~   = the intensity of the jth observation of reflection i               <I~i~> = the mean of the intensities of all observations of                        reflection i 	       N~i~   = the redundancy (the number of times reflection i                        has been measured).                sum~i~ is taken over all reflections               sum~j~ is taken over all observations of each reflection.                Ref: Diederichs, K. & Karplus, P. A. (1997). Nature Struct.                    Biol. 4, 269-275.                    Weiss, M. S. & Hilgenfeld, R. (1997). J. Appl. Cryst.                    30, 203-205.                    Weiss, M. S. (2001). J. Appl. Cryst. 34, 130-135."""
+    @property
+    def pdbx_Rsym_value(self) -> 'Attribute':
+        """The R sym value as a decimal number."""
+    @property
+    def pdbx_chi_squared(self) -> 'Attribute':
+        """Overall  Chi-squared statistic."""
+    @property
+    def pdbx_diffrn_id(self) -> 'Attribute':
+        """"""
+    @property
+    def pdbx_netI_over_av_sigmaI(self) -> 'Attribute':
+        """The ratio of the average intensity to the average uncertainty,  <I>/<sigma(I)>."""
+    @property
+    def pdbx_netI_over_sigmaI(self) -> 'Attribute':
+        """The mean of the ratio of the intensities to their  standard uncertainties, <I/sigma(I)>."""
+    @property
+    def pdbx_number_measured_all(self) -> 'Attribute':
+        """Total number of measured reflections."""
+    @property
+    def pdbx_ordinal(self) -> 'Attribute':
+        """An ordinal identifier for this set of reflection statistics."""
+    @property
+    def pdbx_redundancy(self) -> 'Attribute':
+        """Overall redundancy for this data set."""
+    @property
+    def pdbx_scaling_rejects(self) -> 'Attribute':
+        """Number of reflections rejected in scaling operations."""
+    @property
+    def percent_possible_obs(self) -> 'Attribute':
+        """The percentage of geometrically possible reflections represented  by reflections that satisfy the resolution limits established  by _reflns.d_resolution_high and _reflns.d_resolution_low and  the observation limit established by  _reflns.observed_criterion."""
+    @property
+    def phase_calculation_details(self) -> 'Attribute':
+        """The value of _reflns.phase_calculation_details describes a  special details about calculation of phases in _refln.phase_calc."""
+
+class Attr_ReflnsShell(AttributeGroup):
+    """"""
+    @property
+    def Rmerge_F_all(self) -> 'Attribute':
+        """Residual factor Rmerge for all reflections that satisfy the  resolution limits established by _reflns_shell.d_res_high and  _reflns_shell.d_res_low.               sum~i~(sum~j~|F~j~ - <F>|)  Rmerge(F) = --------------------------                   sum~i~(sum~j~<F>)   F~j~ = the amplitude of the jth observation of reflection i  <F>  = the mean of the amplitudes of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection"""
+    @property
+    def Rmerge_F_obs(self) -> 'Attribute':
+        """Residual factor Rmerge for reflections that satisfy the  resolution limits established by _reflns_shell.d_res_high and  _reflns_shell.d_res_low and the observation criterion  established by _reflns.observed_criterion.               sum~i~(sum~j~|F~j~ - <F>|)  Rmerge(F) = --------------------------                   sum~i~(sum~j~<F>)   F~j~ = the amplitude of the jth observation of reflection i  <F>  = the mean of the amplitudes of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection"""
+    @property
+    def Rmerge_I_all(self) -> 'Attribute':
+        """The value of Rmerge(I) for all reflections in a given shell.               sum~i~(sum~j~|I~j~ - <I>|)  Rmerge(I) = --------------------------                  sum~i~(sum~j~<I>)   I~j~ = the intensity of the jth observation of reflection i  <I>  = the mean of the intensities of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection"""
+    @property
+    def Rmerge_I_obs(self) -> 'Attribute':
+        """The value of Rmerge(I) for reflections classified as 'observed'  (see _reflns.observed_criterion) in a given shell.               sum~i~(sum~j~|I~j~ - <I>|)  Rmerge(I) = --------------------------                  sum~i~(sum~j~<I>)   I~j~ = the intensity of the jth observation of reflection i  <I>  = the mean of the intensities of all observations of         reflection i   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection"""
+    @property
+    def d_res_high(self) -> 'Attribute':
+        """The smallest value in angstroms for the interplanar spacings  for the reflections in this shell. This is called the highest  resolution."""
+    @property
+    def d_res_low(self) -> 'Attribute':
+        """The highest value in angstroms for the interplanar spacings  for the reflections in this shell. This is called the lowest  resolution."""
+    @property
+    def meanI_over_sigI_all(self) -> 'Attribute':
+        """The ratio of the mean of the intensities of all reflections  in this shell to the mean of the standard uncertainties of the  intensities of all reflections in this shell."""
+    @property
+    def meanI_over_sigI_obs(self) -> 'Attribute':
+        """The ratio of the mean of the intensities of the reflections  classified as 'observed' (see _reflns.observed_criterion) in  this shell to the mean of the standard uncertainties of the  intensities of the 'observed' reflections in this  shell."""
+    @property
+    def meanI_over_uI_all(self) -> 'Attribute':
+        """The ratio of the mean of the intensities of all reflections  in this shell to the mean of the standard uncertainties of the  intensities of all reflections in this shell."""
+    @property
+    def number_measured_all(self) -> 'Attribute':
+        """The total number of reflections measured for this  shell."""
+    @property
+    def number_measured_obs(self) -> 'Attribute':
+        """The number of reflections classified as 'observed'  (see _reflns.observed_criterion) for this  shell."""
+    @property
+    def number_possible(self) -> 'Attribute':
+        """The number of unique reflections it is possible to measure in  this shell."""
+    @property
+    def number_unique_all(self) -> 'Attribute':
+        """The total number of measured reflections which are symmetry-  unique after merging for this shell."""
+    @property
+    def number_unique_obs(self) -> 'Attribute':
+        """The total number of measured reflections classified as 'observed'  (see _reflns.observed_criterion) which are symmetry-unique  after merging for this shell."""
+    @property
+    def pdbx_CC_half(self) -> 'Attribute':
+        """The Pearson's correlation coefficient expressed as a decimal value               between the average intensities from randomly selected               half-datasets within the resolution shell.  	      Ref: Karplus & Diederichs (2012), Science 336, 1030-33"""
+    @property
+    def pdbx_R_split(self) -> 'Attribute':
+        """R split measures the agreement between the sets of intensities created by merging               odd- and even-numbered images from the data within the resolution shell.  	      Ref: T. A. White, R. A. Kirian, A. V. Martin, A. Aquila, K. Nass, 	      A. Barty and H. N. Chapman (2012), J. Appl. Cryst. 45, 335-341"""
+    @property
+    def pdbx_Rpim_I_all(self) -> 'Attribute':
+        """The precision-indicating merging R factor value Rpim,  for merging all intensities in a given shell.          sum~i~ [1/(N~i~ - 1)]1/2^ sum~j~ | I~j~ - <I~i~> |  Rpim = --------------------------------------------------                       sum~i~ ( sum~j~ I~j~ )   I~j~   = the intensity of the jth observation of reflection i  <I~i~> = the mean of the intensities of all observations of           reflection i  N~i~   = the redundancy (the number of times reflection i           has been measured).   sum~i~ is taken over all reflections  sum~j~ is taken over all observations of each reflection.   Ref: Diederichs, K. & Karplus, P. A. (1997). Nature Struct.       Biol. 4, 269-275.       Weiss, M. S. & Hilgenfeld, R. (1997). J. Appl. Cryst.       30, 203-205.       Weiss, M. S. (2001). J. Appl. Cryst. 34, 130-135."""
+    @property
+    def pdbx_Rrim_I_all(self) -> 'Attribute':
+        """The redundancy-independent merging R factor value Rrim,               also denoted Rmeas, for merging all intensities in a               given shell.                       sum~i~ [N~i~ /( N~i~ - 1)]1/2^ sum~j~ | I~j~ - <I~i~> |               Rrim = --------------------------------------------------------                                    sum~i~ ( sum~j~ I~j~ )                I~j~   = the intensity of the jth observation of reflection i               <I~i~> = the mean of the intensities of all observations of                        reflection i 	      N~i~   = the redundancy (the number of times reflection i                        has been measured).                sum~i~ is taken over all reflections               sum~j~ is taken over all observations of each reflection.                Ref: Diederichs, K. & Karplus, P. A. (1997). Nature Struct.                    Biol. 4, 269-275.                    Weiss, M. S. & Hilgenfeld, R. (1997). J. Appl. Cryst.                    30, 203-205.                    Weiss, M. S. (2001). J. Appl. Cryst. 34, 130-135."""
+    @property
+    def pdbx_Rsym_value(self) -> 'Attribute':
+        """R sym value in percent."""
+    @property
+    def pdbx_chi_squared(self) -> 'Attribute':
+        """Chi-squared statistic for this resolution shell."""
+    @property
+    def pdbx_diffrn_id(self) -> 'Attribute':
+        """"""
+    @property
+    def pdbx_netI_over_sigmaI_all(self) -> 'Attribute':
+        """The mean of the ratio of the intensities to their  standard uncertainties of all reflections in the  resolution shell.   _reflns_shell.pdbx_netI_over_sigmaI_all =  <I/sigma(I)>"""
+    @property
+    def pdbx_netI_over_sigmaI_obs(self) -> 'Attribute':
+        """The mean of the ratio of the intensities to their  standard uncertainties of observed reflections  (see _reflns.observed_criterion) in the resolution shell.   _reflns_shell.pdbx_netI_over_sigmaI_obs =  <I/sigma(I)>"""
+    @property
+    def pdbx_ordinal(self) -> 'Attribute':
+        """An ordinal identifier for this resolution shell."""
+    @property
+    def pdbx_redundancy(self) -> 'Attribute':
+        """Redundancy for the current shell."""
+    @property
+    def pdbx_rejects(self) -> 'Attribute':
+        """The number of rejected reflections in the resolution  shell.  Reflections may be rejected from scaling  by setting the observation criterion,  _reflns.observed_criterion."""
+    @property
+    def percent_possible_all(self) -> 'Attribute':
+        """The percentage of geometrically possible reflections represented  by all reflections measured for this shell."""
+    @property
+    def percent_possible_obs(self) -> 'Attribute':
+        """The percentage of geometrically possible reflections represented  by reflections classified as 'observed' (see  _reflns.observed_criterion) for this shell."""
+
+class Attr_Software(AttributeGroup):
+    """"""
+    @property
+    def citation_id(self) -> 'Attribute':
+        """This data item is a pointer to _citation.id in the CITATION  category."""
+    @property
+    def classification(self) -> 'Attribute':
+        """The classification of the program according to its  major function."""
+    @property
+    def contact_author(self) -> 'Attribute':
+        """The recognized contact author of the software. This could be  the original author, someone who has modified the code or  someone who maintains the code.  It should be the person  most commonly associated with the code."""
+    @property
+    def contact_author_email(self) -> 'Attribute':
+        """The e-mail address of the person specified in  _software.contact_author."""
+    @property
+    def date(self) -> 'Attribute':
+        """The date the software was released."""
+    @property
+    def description(self) -> 'Attribute':
+        """Description of the software."""
+    @property
+    def language(self) -> 'Attribute':
+        """The major computing language in which the software is  coded."""
+    @property
+    def location(self) -> 'Attribute':
+        """The URL for an Internet address at which  details of the software can be found."""
+    @property
+    def name(self) -> 'Attribute':
+        """The name of the software."""
+    @property
+    def os(self) -> 'Attribute':
+        """The name of the operating system under which the software  runs."""
+    @property
+    def pdbx_ordinal(self) -> 'Attribute':
+        """An ordinal index for this category"""
+    @property
+    def type(self) -> 'Attribute':
+        """The classification of the software according to the most  common types."""
+    @property
+    def version(self) -> 'Attribute':
+        """The version of the software."""
+
+class Attr_Struct(AttributeGroup):
+    """"""
+    @property
+    def pdbx_CASP_flag(self) -> 'Attribute':
+        """The item indicates whether the entry is a CASP target, a CASD-NMR target,  or similar target participating in methods development experiments."""
+    @property
+    def pdbx_descriptor(self) -> 'Attribute':
+        """An automatically generated descriptor for an NDB structure or  the unstructured content of the PDB COMPND record."""
+    @property
+    def pdbx_model_details(self) -> 'Attribute':
+        """Text description of the methodology which produced this  model structure."""
+    @property
+    def pdbx_model_type_details(self) -> 'Attribute':
+        """A description of the type of structure model."""
+    @property
+    def title(self) -> 'Attribute':
+        """A title for the data block. The author should attempt to convey  the essence of the structure archived in the CIF in the title,  and to distinguish this structural result from others."""
+
+class Attr_StructKeywords(AttributeGroup):
+    """"""
+    @property
+    def pdbx_keywords(self) -> 'Attribute':
+        """Terms characterizing the macromolecular structure."""
+    @property
+    def text(self) -> 'Attribute':
+        """Keywords describing this structure."""
+
+class Attr_Symmetry(AttributeGroup):
+    """"""
+    @property
+    def Int_Tables_number(self) -> 'Attribute':
+        """Space-group number from International Tables for Crystallography  Vol. A (2002)."""
+    @property
+    def cell_setting(self) -> 'Attribute':
+        """The cell settings for this space-group symmetry."""
+    @property
+    def pdbx_full_space_group_name_H_M(self) -> 'Attribute':
+        """Used for PDB space group:   Example: 'C 1 2 1'  (instead of C 2)           'P 1 2 1'  (instead of P 2)           'P 1 21 1' (instead of P 21)           'P 1 1 21' (instead of P 21 -unique C axis)           'H 3'      (instead of R 3   -hexagonal)           'H 3 2'    (instead of R 3 2 -hexagonal)"""
+    @property
+    def space_group_name_H_M(self) -> 'Attribute':
+        """Hermann-Mauguin space-group symbol. Note that the  Hermann-Mauguin symbol does not necessarily contain complete  information about the symmetry and the space-group origin. If  used, always supply the FULL symbol from International Tables  for Crystallography Vol. A (2002) and indicate the origin and  the setting if it is not implicit. If there is any doubt that  the equivalent positions can be uniquely deduced from this  symbol, specify the  _symmetry_equiv.pos_as_xyz or  _symmetry.space_group_name_Hall  data items as well. Leave  spaces between symbols referring to  different axes."""
+    @property
+    def space_group_name_Hall(self) -> 'Attribute':
+        """Space-group symbol as described by Hall (1981). This symbol  gives the space-group setting explicitly. Leave spaces between  the separate components of the symbol.   Ref: Hall, S. R. (1981). Acta Cryst. A37, 517-525; erratum  (1981) A37, 921."""
+
+class Attr_RcsbPubmedContainerIdentifiers(AttributeGroup):
+    """"""
+    @property
+    def pubmed_id(self) -> 'Attribute':
+        """UID assigned to each PubMed record."""
+
+class Attr_RcsbPubmedMeshDescriptorsLineage(AttributeGroup):
+    """Members of the MeSH classification lineage."""
+    @property
+    def id(self) -> 'Attribute':
+        """Identifier for MeSH classification term."""
+    @property
+    def name(self) -> 'Attribute':
+        """MeSH classification term."""
+    @property
+    def depth(self) -> 'Attribute':
+        """Hierarchy depth."""
+
+class Attr_EntityPoly(AttributeGroup):
+    """"""
+    @property
+    def nstd_linkage(self) -> 'Attribute':
+        """A flag to indicate whether the polymer contains at least  one monomer-to-monomer link different from that implied by  _entity_poly.type."""
+    @property
+    def nstd_monomer(self) -> 'Attribute':
+        """A flag to indicate whether the polymer contains at least  one monomer that is not considered standard."""
+    @property
+    def pdbx_seq_one_letter_code(self) -> 'Attribute':
+        """Sequence of protein or nucleic acid polymer in standard one-letter                codes of amino acids or nucleotides. Non-standard amino                acids/nucleotides are represented by their Chemical                Component Dictionary (CCD) codes in                parenthesis. Deoxynucleotides are represented by the                specially-assigned 2-letter CCD codes in parenthesis,                with 'D' prefix added to their ribonucleotide                counterparts. For hybrid polymer, each residue is                represented by the code of its individual type. A                cyclic polymer is represented in linear sequence from                the chosen start to end.  A for Alanine or Adenosine-5'-monophosphate C for Cysteine or Cytidine-5'-monophosphate D for Aspartic acid E for Glutamic acid F for Phenylalanine G for Glycine or Guanosine-5'-monophosphate H for Histidine I for Isoleucine or Inosinic Acid L for Leucine K for Lysine M for Methionine N for Asparagine  or Unknown ribonucleotide O for Pyrrolysine P for Proline Q for Glutamine R for Arginine S for Serine T for Threonine U for Selenocysteine or Uridine-5'-monophosphate V for Valine W for Tryptophan Y for Tyrosine (DA) for 2'-deoxyadenosine-5'-monophosphate (DC) for 2'-deoxycytidine-5'-monophosphate (DG) for 2'-deoxyguanosine-5'-monophosphate (DT) for Thymidine-5'-monophosphate (MSE) for Selenomethionine (SEP) for Phosphoserine (TPO) for Phosphothreonine (PTR) for Phosphotyrosine (PCA) for Pyroglutamic acid (UNK) for Unknown amino acid (ACE) for Acetylation cap (NH2) for Amidation cap"""
+    @property
+    def pdbx_seq_one_letter_code_can(self) -> 'Attribute':
+        """Canonical sequence of protein or nucleic acid polymer in standard                one-letter codes of amino acids or nucleotides,                corresponding to the sequence in                _entity_poly.pdbx_seq_one_letter_code. Non-standard                amino acids/nucleotides are represented by the codes of                their parents if parent is specified in                _chem_comp.mon_nstd_parent_comp_id, or by letter 'X' if                parent is not specified. Deoxynucleotides are                represented by their canonical one-letter codes of A,                C, G, or T.                 For modifications with several parent amino acids, 	       all corresponding parent amino acid codes will be listed 	       (ex. chromophores)."""
+    @property
+    def pdbx_sequence_evidence_code(self) -> 'Attribute':
+        """Evidence for the assignment of the polymer sequence."""
+    @property
+    def pdbx_strand_id(self) -> 'Attribute':
+        """The PDB strand/chain id(s) corresponding to this polymer entity."""
+    @property
+    def pdbx_target_identifier(self) -> 'Attribute':
+        """For Structural Genomics entries, the sequence's target identifier registered at the TargetTrack database."""
+    @property
+    def rcsb_artifact_monomer_count(self) -> 'Attribute':
+        """Number of regions in the sample sequence identified as expression tags, linkers, or  cloning artifacts."""
+    @property
+    def rcsb_conflict_count(self) -> 'Attribute':
+        """Number of monomer conflicts relative to the reference sequence."""
+    @property
+    def rcsb_deletion_count(self) -> 'Attribute':
+        """Number of monomer deletions relative to the reference sequence."""
+    @property
+    def rcsb_entity_polymer_type(self) -> 'Attribute':
+        """A coarse-grained polymer entity type."""
+    @property
+    def rcsb_insertion_count(self) -> 'Attribute':
+        """Number of monomer insertions relative to the reference sequence."""
+    @property
+    def rcsb_mutation_count(self) -> 'Attribute':
+        """Number of engineered mutations engineered in the sample sequence."""
+    @property
+    def rcsb_non_std_monomer_count(self) -> 'Attribute':
+        """Number of non-standard monomers in the sample sequence."""
+    @property
+    def rcsb_non_std_monomers(self) -> 'Attribute':
+        """"""
+    @property
+    def rcsb_prd_id(self) -> 'Attribute':
+        """For polymer BIRD molecules the BIRD identifier for the entity."""
+    @property
+    def rcsb_sample_sequence_length(self) -> 'Attribute':
+        """The monomer length of the sample sequence."""
+    @property
+    def type(self) -> 'Attribute':
+        """The type of the polymer."""
+
+class Attr_EntitySrcGen(AttributeGroup):
+    """"""
+    @property
+    def expression_system_id(self) -> 'Attribute':
+        """A unique identifier for the expression system. This  should be extracted from a local list of expression  systems."""
+    @property
+    def gene_src_common_name(self) -> 'Attribute':
+        """The common name of the natural organism from which the gene was  obtained."""
+    @property
+    def gene_src_details(self) -> 'Attribute':
+        """A description of special aspects of the natural organism from  which the gene was obtained."""
+    @property
+    def gene_src_genus(self) -> 'Attribute':
+        """The genus of the natural organism from which the gene was  obtained."""
+    @property
+    def gene_src_species(self) -> 'Attribute':
+        """The species of the natural organism from which the gene was  obtained."""
+    @property
+    def gene_src_strain(self) -> 'Attribute':
+        """The strain of the natural organism from which the gene was  obtained, if relevant."""
+    @property
+    def gene_src_tissue(self) -> 'Attribute':
+        """The tissue of the natural organism from which the gene was  obtained."""
+    @property
+    def gene_src_tissue_fraction(self) -> 'Attribute':
+        """The subcellular fraction of the tissue of the natural organism  from which the gene was obtained."""
+    @property
+    def host_org_common_name(self) -> 'Attribute':
+        """The common name of the organism that served as host for the  production of the entity.  Where full details of the protein  production are available it would be expected that this item  be derived from _entity_src_gen_express.host_org_common_name  or via _entity_src_gen_express.host_org_tax_id"""
+    @property
+    def host_org_details(self) -> 'Attribute':
+        """A description of special aspects of the organism that served as  host for the production of the entity. Where full details of  the protein production are available it would be expected that  this item would derived from _entity_src_gen_express.host_org_details"""
+    @property
+    def host_org_genus(self) -> 'Attribute':
+        """The genus of the organism that served as host for the production  of the entity."""
+    @property
+    def host_org_species(self) -> 'Attribute':
+        """The species of the organism that served as host for the  production of the entity."""
+    @property
+    def pdbx_alt_source_flag(self) -> 'Attribute':
+        """This data item identifies cases in which an alternative source  modeled."""
+    @property
+    def pdbx_beg_seq_num(self) -> 'Attribute':
+        """The beginning polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category."""
+    @property
+    def pdbx_description(self) -> 'Attribute':
+        """Information on the source which is not given elsewhere."""
+    @property
+    def pdbx_end_seq_num(self) -> 'Attribute':
+        """The ending polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category."""
+    @property
+    def pdbx_gene_src_atcc(self) -> 'Attribute':
+        """American Type Culture Collection tissue culture number."""
+    @property
+    def pdbx_gene_src_cell(self) -> 'Attribute':
+        """Cell type."""
+    @property
+    def pdbx_gene_src_cell_line(self) -> 'Attribute':
+        """The specific line of cells."""
+    @property
+    def pdbx_gene_src_cellular_location(self) -> 'Attribute':
+        """Identifies the location inside (or outside) the cell."""
+    @property
+    def pdbx_gene_src_fragment(self) -> 'Attribute':
+        """A domain or fragment of the molecule."""
+    @property
+    def pdbx_gene_src_gene(self) -> 'Attribute':
+        """Identifies the gene."""
+    @property
+    def pdbx_gene_src_ncbi_taxonomy_id(self) -> 'Attribute':
+        """NCBI Taxonomy identifier for the gene source organism.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18."""
+    @property
+    def pdbx_gene_src_organ(self) -> 'Attribute':
+        """Organized group of tissues that carries on a specialized function."""
+    @property
+    def pdbx_gene_src_organelle(self) -> 'Attribute':
+        """Organized structure within cell."""
+    @property
+    def pdbx_gene_src_scientific_name(self) -> 'Attribute':
+        """Scientific name of the organism."""
+    @property
+    def pdbx_gene_src_variant(self) -> 'Attribute':
+        """Identifies the variant."""
+    @property
+    def pdbx_host_org_atcc(self) -> 'Attribute':
+        """Americal Tissue Culture Collection of the expression system. Where  full details of the protein production are available it would  be expected that this item  would be derived from  _entity_src_gen_express.host_org_culture_collection"""
+    @property
+    def pdbx_host_org_cell(self) -> 'Attribute':
+        """Cell type from which the gene is derived. Where  entity.target_id is provided this should be derived from  details of the target."""
+    @property
+    def pdbx_host_org_cell_line(self) -> 'Attribute':
+        """A specific line of cells used as the expression system. Where  full details of the protein production are available it would  be expected that this item would be derived from  entity_src_gen_express.host_org_cell_line"""
+    @property
+    def pdbx_host_org_cellular_location(self) -> 'Attribute':
+        """Identifies the location inside (or outside) the cell which  expressed the molecule."""
+    @property
+    def pdbx_host_org_culture_collection(self) -> 'Attribute':
+        """Culture collection of the expression system. Where  full details of the protein production are available it would  be expected that this item  would be derived somehwere, but  exactly where is not clear."""
+    @property
+    def pdbx_host_org_gene(self) -> 'Attribute':
+        """Specific gene which expressed the molecule."""
+    @property
+    def pdbx_host_org_ncbi_taxonomy_id(self) -> 'Attribute':
+        """NCBI Taxonomy identifier for the expression system organism.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18."""
+    @property
+    def pdbx_host_org_organ(self) -> 'Attribute':
+        """Specific organ which expressed the molecule."""
+    @property
+    def pdbx_host_org_organelle(self) -> 'Attribute':
+        """Specific organelle which expressed the molecule."""
+    @property
+    def pdbx_host_org_scientific_name(self) -> 'Attribute':
+        """The scientific name of the organism that served as host for the  production of the entity. Where full details of the protein  production are available it would be expected that this item  would be derived from _entity_src_gen_express.host_org_scientific_name  or via _entity_src_gen_express.host_org_tax_id"""
+    @property
+    def pdbx_host_org_strain(self) -> 'Attribute':
+        """The strain of the organism in which the entity was expressed."""
+    @property
+    def pdbx_host_org_tissue(self) -> 'Attribute':
+        """The specific tissue which expressed the molecule. Where full details  of the protein production are available it would be expected that this  item would be derived from _entity_src_gen_express.host_org_tissue"""
+    @property
+    def pdbx_host_org_tissue_fraction(self) -> 'Attribute':
+        """The fraction of the tissue which expressed the molecule."""
+    @property
+    def pdbx_host_org_variant(self) -> 'Attribute':
+        """Variant of the organism used as the expression system. Where  full details of the protein production are available it would  be expected that this item be derived from  entity_src_gen_express.host_org_variant or via  _entity_src_gen_express.host_org_tax_id"""
+    @property
+    def pdbx_host_org_vector(self) -> 'Attribute':
+        """Identifies the vector used. Where full details of the protein  production are available it would be expected that this item  would be derived from _entity_src_gen_clone.vector_name."""
+    @property
+    def pdbx_host_org_vector_type(self) -> 'Attribute':
+        """Identifies the type of vector used (plasmid, virus, or cosmid).  Where full details of the protein production are available it  would be expected that this item would be derived from  _entity_src_gen_express.vector_type."""
+    @property
+    def pdbx_seq_type(self) -> 'Attribute':
+        """This data item povides additional information about the sequence type."""
+    @property
+    def pdbx_src_id(self) -> 'Attribute':
+        """This data item is an ordinal identifier for entity_src_gen data records."""
+    @property
+    def plasmid_details(self) -> 'Attribute':
+        """A description of special aspects of the plasmid that produced the  entity in the host organism. Where full details of the protein  production are available it would be expected that this item  would be derived from _pdbx_construct.details of the construct  pointed to from _entity_src_gen_express.plasmid_id."""
+    @property
+    def plasmid_name(self) -> 'Attribute':
+        """The name of the plasmid that produced the entity in the host  organism. Where full details of the protein production are available  it would be expected that this item would be derived from  _pdbx_construct.name of the construct pointed to from  _entity_src_gen_express.plasmid_id."""
+
+class Attr_EntitySrcNat(AttributeGroup):
+    """"""
+    @property
+    def common_name(self) -> 'Attribute':
+        """The common name of the organism from which the entity  was isolated."""
+    @property
+    def details(self) -> 'Attribute':
+        """A description of special aspects of the organism from which the  entity was isolated."""
+    @property
+    def genus(self) -> 'Attribute':
+        """The genus of the organism from which the entity was isolated."""
+    @property
+    def pdbx_alt_source_flag(self) -> 'Attribute':
+        """This data item identifies cases in which an alternative source  modeled."""
+    @property
+    def pdbx_atcc(self) -> 'Attribute':
+        """Americal Tissue Culture Collection number."""
+    @property
+    def pdbx_beg_seq_num(self) -> 'Attribute':
+        """The beginning polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category."""
+    @property
+    def pdbx_cell(self) -> 'Attribute':
+        """A particular cell type."""
+    @property
+    def pdbx_cell_line(self) -> 'Attribute':
+        """The specific line of cells."""
+    @property
+    def pdbx_cellular_location(self) -> 'Attribute':
+        """Identifies the location inside (or outside) the cell."""
+    @property
+    def pdbx_end_seq_num(self) -> 'Attribute':
+        """The ending polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category."""
+    @property
+    def pdbx_fragment(self) -> 'Attribute':
+        """A domain or fragment of the molecule."""
+    @property
+    def pdbx_ncbi_taxonomy_id(self) -> 'Attribute':
+        """NCBI Taxonomy identifier for the source organism.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18."""
+    @property
+    def pdbx_organ(self) -> 'Attribute':
+        """Organized group of tissues that carries on a specialized function."""
+    @property
+    def pdbx_organelle(self) -> 'Attribute':
+        """Organized structure within cell."""
+    @property
+    def pdbx_organism_scientific(self) -> 'Attribute':
+        """Scientific name of the organism of the natural source."""
+    @property
+    def pdbx_plasmid_details(self) -> 'Attribute':
+        """Details about the plasmid."""
+    @property
+    def pdbx_plasmid_name(self) -> 'Attribute':
+        """The plasmid containing the gene."""
+    @property
+    def pdbx_secretion(self) -> 'Attribute':
+        """Identifies the secretion from which the molecule was isolated."""
+    @property
+    def pdbx_src_id(self) -> 'Attribute':
+        """This data item is an ordinal identifier for entity_src_nat data records."""
+    @property
+    def pdbx_variant(self) -> 'Attribute':
+        """Identifies the variant."""
+    @property
+    def species(self) -> 'Attribute':
+        """The species of the organism from which the entity was isolated."""
+    @property
+    def strain(self) -> 'Attribute':
+        """The strain of the organism from which the entity was isolated."""
+    @property
+    def tissue(self) -> 'Attribute':
+        """The tissue of the organism from which the entity was isolated."""
+    @property
+    def tissue_fraction(self) -> 'Attribute':
+        """The subcellular fraction of the tissue of the organism from  which the entity was isolated."""
+
+class Attr_PdbxEntitySrcSyn(AttributeGroup):
+    """"""
+    @property
+    def details(self) -> 'Attribute':
+        """A description of special aspects of the source for the  synthetic entity."""
+    @property
+    def ncbi_taxonomy_id(self) -> 'Attribute':
+        """NCBI Taxonomy identifier of the organism from which the sequence of  the synthetic entity was derived.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18."""
+    @property
+    def organism_common_name(self) -> 'Attribute':
+        """The common name of the organism from which the sequence of  the synthetic entity was derived."""
+    @property
+    def organism_scientific(self) -> 'Attribute':
+        """The scientific name of the organism from which the sequence of  the synthetic entity was derived."""
+    @property
+    def pdbx_alt_source_flag(self) -> 'Attribute':
+        """This data item identifies cases in which an alternative source  modeled."""
+    @property
+    def pdbx_beg_seq_num(self) -> 'Attribute':
+        """The beginning polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category."""
+    @property
+    def pdbx_end_seq_num(self) -> 'Attribute':
+        """The ending polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category."""
+    @property
+    def pdbx_src_id(self) -> 'Attribute':
+        """This data item is an ordinal identifier for pdbx_entity_src_syn data records."""
+
+class Attr_RcsbClusterFlexibility(AttributeGroup):
+    """"""
+    @property
+    def avg_rmsd(self) -> 'Attribute':
+        """Average RMSD refer to average pairwise RMSD (Root Mean Square Deviation of C-alpha atoms) between structures in the cluster (95% sequence identity) where a given entity belongs."""
+    @property
+    def label(self) -> 'Attribute':
+        """Structural flexibility in the cluster (95% sequence identity) where a given entity belongs."""
+    @property
+    def link(self) -> 'Attribute':
+        """Link to the associated PDBFlex database entry."""
+    @property
+    def max_rmsd(self) -> 'Attribute':
+        """Maximal RMSD refer to maximal pairwise RMSD (Root Mean Square Deviation of C-alpha atoms) between structures in the cluster (95% sequence identity) where a given entity belongs."""
+    @property
+    def provenance_code(self) -> 'Attribute':
+        """Provenance code indicating the origin of the flexibility data."""
+
+class Attr_RcsbClusterMembership(AttributeGroup):
+    """"""
+    @property
+    def cluster_id(self) -> 'Attribute':
+        """Identifier for a cluster at the specified level of sequence identity within the cluster data set."""
+    @property
+    def identity(self) -> 'Attribute':
+        """Sequence identity expressed as an integer percent value."""
+
+class Attr_TaxonomyLineage(AttributeGroup):
+    """"""
+    @property
+    def depth(self) -> 'Attribute':
+        """Members of the NCBI Taxonomy lineage as parent taxonomy lineage depth (1-N)"""
+    @property
+    def id(self) -> 'Attribute':
+        """Members of the NCBI Taxonomy lineage as parent taxonomy idcodes."""
+    @property
+    def name(self) -> 'Attribute':
+        """Members of the NCBI Taxonomy lineage as parent taxonomy names."""
+
+class Attr_RcsbEntityHostOrganism(AttributeGroup):
+    """"""
+    @property
+    def beg_seq_num(self) -> 'Attribute':
+        """The beginning polymer sequence position for the polymer section corresponding  to this host organism.   A reference to the sequence position in the entity_poly category."""
+    @property
+    def common_name(self) -> 'Attribute':
+        """The common name of the host organism"""
+    @property
+    def end_seq_num(self) -> 'Attribute':
+        """The ending polymer sequence position for the polymer section corresponding  to this host organism.   A reference to the sequence position in the entity_poly category."""
+    @property
+    def ncbi_common_names(self) -> 'Attribute':
+        """"""
+    @property
+    def ncbi_parent_scientific_name(self) -> 'Attribute':
+        """The parent scientific name in the NCBI taxonomy hierarchy (depth=1) associated with this taxonomy code.  References:  Sayers EW, Barrett T, Benson DA, Bryant SH, Canese K, Chetvernin V, Church DM, DiCuccio M, Edgar R, Federhen S, Feolo M, Geer LY, Helmberg W, Kapustin Y, Landsman D, Lipman DJ, Madden TL, Maglott DR, Miller V, Mizrachi I, Ostell J, Pruitt KD, Schuler GD, Sequeira E, Sherry ST, Shumway M, Sirotkin K, Souvorov A, Starchenko G, Tatusova TA, Wagner L, Yaschenko E, Ye J (2009). Database resources of the National Center for Biotechnology Information. Nucleic Acids Res. 2009 Jan;37(Database issue):D5-15. Epub 2008 Oct 21.  Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Sayers EW (2009). GenBank. Nucleic Acids Res. 2009 Jan;37(Database issue):D26-31. Epub 2008 Oct 21."""
+    @property
+    def ncbi_scientific_name(self) -> 'Attribute':
+        """The scientific name associated with this taxonomy code aggregated by the NCBI Taxonomy Database.    This name corresponds to the taxonomy identifier assigned by the PDB depositor.   References:  Sayers EW, Barrett T, Benson DA, Bryant SH, Canese K, Chetvernin V, Church DM, DiCuccio M, Edgar R, Federhen S, Feolo M, Geer LY, Helmberg W, Kapustin Y, Landsman D, Lipman DJ, Madden TL, Maglott DR, Miller V, Mizrachi I, Ostell J, Pruitt KD, Schuler GD, Sequeira E, Sherry ST, Shumway M, Sirotkin K, Souvorov A, Starchenko G, Tatusova TA, Wagner L, Yaschenko E, Ye J (2009). Database resources of the National Center for Biotechnology Information. Nucleic Acids Res. 2009 Jan;37(Database issue):D5-15. Epub 2008 Oct 21.  Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Sayers EW (2009). GenBank. Nucleic Acids Res. 2009 Jan;37(Database issue):D26-31. Epub 2008 Oct 21."""
+    @property
+    def ncbi_taxonomy_id(self) -> 'Attribute':
+        """NCBI Taxonomy identifier for the host organism.    Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18."""
+    @property
+    def pdbx_src_id(self) -> 'Attribute':
+        """An identifier for an entity segment."""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """A code indicating the provenance of the host organism."""
+    @property
+    def scientific_name(self) -> 'Attribute':
+        """The scientific name of the host organism"""
+    @property
+    def taxonomy_lineage(self) -> 'Attr_TaxonomyLineage':
+        """"""
+
+class Attr_TaxonomyLineage_2(AttributeGroup):
+    """"""
+    @property
+    def depth(self) -> 'Attribute':
+        """Members of the NCBI Taxonomy lineage as parent taxonomy lineage depth (1-N)"""
+    @property
+    def id(self) -> 'Attribute':
+        """Members of the NCBI Taxonomy lineage as parent taxonomy idcodes."""
+    @property
+    def name(self) -> 'Attribute':
+        """Memebers of the NCBI Taxonomy lineage as parent taxonomy names."""
+
+class Attr_RcsbGeneName(AttributeGroup):
+    """"""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """A code indicating the provenance of the source organism details for the entity"""
+    @property
+    def value(self) -> 'Attribute':
+        """Gene name."""
+
+class Attr_RcsbEntitySourceOrganism(AttributeGroup):
+    """"""
+    @property
+    def beg_seq_num(self) -> 'Attribute':
+        """The beginning polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category."""
+    @property
+    def common_name(self) -> 'Attribute':
+        """The common name for the source organism assigned by the PDB depositor."""
+    @property
+    def end_seq_num(self) -> 'Attribute':
+        """The ending polymer sequence position for the polymer section corresponding  to this source.   A reference to the sequence position in the entity_poly category."""
+    @property
+    def ncbi_common_names(self) -> 'Attribute':
+        """"""
+    @property
+    def ncbi_parent_scientific_name(self) -> 'Attribute':
+        """A parent scientific name in the NCBI taxonomy hierarchy of the source organism assigned by the PDB depositor.   For cellular organism this corresponds to a superkingdom (e.g., Archaea, Bacteria, Eukaryota).  For viruses this   corresponds to a clade (e.g.  Adnaviria, Bicaudaviridae, Clavaviridae). For other and unclassified entries this   corresponds to the first level of any taxonomic rank below the root level.  References:  Sayers EW, Barrett T, Benson DA, Bryant SH, Canese K, Chetvernin V, Church DM, DiCuccio M, Edgar R, Federhen S, Feolo M, Geer LY, Helmberg W, Kapustin Y, Landsman D, Lipman DJ, Madden TL, Maglott DR, Miller V, Mizrachi I, Ostell J, Pruitt KD, Schuler GD, Sequeira E, Sherry ST, Shumway M, Sirotkin K, Souvorov A, Starchenko G, Tatusova TA, Wagner L, Yaschenko E, Ye J (2009). Database resources of the National Center for Biotechnology Information. Nucleic Acids Res. 2009 Jan;37(Database issue):D5-15. Epub 2008 Oct 21.  Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Sayers EW (2009). GenBank. Nucleic Acids Res. 2009 Jan;37(Database issue):D26-31. Epub 2008 Oct 21."""
+    @property
+    def ncbi_scientific_name(self) -> 'Attribute':
+        """The scientific name associated with this taxonomy code aggregated by the NCBI Taxonomy Database.    This name corresponds to the taxonomy identifier assigned by the PDB depositor.   References:  Sayers EW, Barrett T, Benson DA, Bryant SH, Canese K, Chetvernin V, Church DM, DiCuccio M, Edgar R, Federhen S, Feolo M, Geer LY, Helmberg W, Kapustin Y, Landsman D, Lipman DJ, Madden TL, Maglott DR, Miller V, Mizrachi I, Ostell J, Pruitt KD, Schuler GD, Sequeira E, Sherry ST, Shumway M, Sirotkin K, Souvorov A, Starchenko G, Tatusova TA, Wagner L, Yaschenko E, Ye J (2009). Database resources of the National Center for Biotechnology Information. Nucleic Acids Res. 2009 Jan;37(Database issue):D5-15. Epub 2008 Oct 21.  Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Sayers EW (2009). GenBank. Nucleic Acids Res. 2009 Jan;37(Database issue):D26-31. Epub 2008 Oct 21."""
+    @property
+    def ncbi_taxonomy_id(self) -> 'Attribute':
+        """NCBI Taxonomy identifier for the gene source organism assigned by the PDB depositor.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18."""
+    @property
+    def pdbx_src_id(self) -> 'Attribute':
+        """An identifier for the entity segment."""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Reference to the provenance of the source organism details for the entity.   Primary data indicates information obtained from the same source as the structural model.  UniProt and NCBI are provided as alternate sources of provenance for organism details."""
+    @property
+    def scientific_name(self) -> 'Attribute':
+        """The scientific name of the source organism assigned by the PDB depositor."""
+    @property
+    def source_type(self) -> 'Attribute':
+        """The source type for the entity"""
+    @property
+    def taxonomy_lineage(self) -> 'Attr_TaxonomyLineage_2':
+        """"""
+    @property
+    def rcsb_gene_name(self) -> 'Attr_RcsbGeneName':
+        """"""
+
+class Attr_RcsbGenomicLineage(AttributeGroup):
+    """"""
+    @property
+    def depth(self) -> 'Attribute':
+        """Classification hierarchy depth."""
+    @property
+    def id(self) -> 'Attribute':
+        """Automatically assigned ID that uniquely identifies taxonomy, chromosome or gene in the Genome Location Browser."""
+    @property
+    def name(self) -> 'Attribute':
+        """A human-readable term name."""
+
+class Attr_RcsbMembraneLineage(AttributeGroup):
+    """"""
+    @property
+    def depth(self) -> 'Attribute':
+        """Hierarchy depth."""
+    @property
+    def id(self) -> 'Attribute':
+        """Automatically assigned ID for membrane classification term in the Membrane Protein Browser."""
+    @property
+    def name(self) -> 'Attribute':
+        """Membrane protein classification term."""
+
+class Attr_RcsbEcLineage(AttributeGroup):
+    """"""
+    @property
+    def depth(self) -> 'Attribute':
+        """Members of the enzyme classification lineage as parent classification hierarchy depth (1-N)."""
+    @property
+    def id(self) -> 'Attribute':
+        """Members of the enzyme classification lineage as parent classification codes."""
+    @property
+    def name(self) -> 'Attribute':
+        """Members of the enzyme classification lineage as parent classification names."""
+
+class Attr_RcsbMacromolecularNamesCombined(AttributeGroup):
+    """"""
+    @property
+    def name(self) -> 'Attribute':
+        """Combined list of macromolecular names."""
+    @property
+    def provenance_code(self) -> 'Attribute':
+        """Combined list of macromolecular names associated provenance code.   ECO (https://github.com/evidenceontology/evidenceontology)"""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Combined list of macromolecular names associated name source."""
+
+class Attr_RcsbEnzymeClassCombined(AttributeGroup):
+    """"""
+    @property
+    def depth(self) -> 'Attribute':
+        """The enzyme classification hierarchy depth (1-N)."""
+    @property
+    def ec(self) -> 'Attribute':
+        """Combined list of enzyme class assignments."""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Combined list of enzyme class associated provenance sources."""
+
+class Attr_RcsbPolymerNameCombined(AttributeGroup):
+    """"""
+    @property
+    def names(self) -> 'Attribute':
+        """"""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Provenance source for the combined protein names."""
+
+class Attr_RcsbPolymerEntity(AttributeGroup):
+    """"""
+    @property
+    def details(self) -> 'Attribute':
+        """A description of special aspects of the entity."""
+    @property
+    def formula_weight(self) -> 'Attribute':
+        """Formula mass (KDa) of the entity."""
+    @property
+    def pdbx_description(self) -> 'Attribute':
+        """A description of the polymer entity."""
+    @property
+    def pdbx_ec(self) -> 'Attribute':
+        """Enzyme Commission (EC) number(s)"""
+    @property
+    def pdbx_fragment(self) -> 'Attribute':
+        """Polymer entity fragment description(s)."""
+    @property
+    def pdbx_mutation(self) -> 'Attribute':
+        """Details about any polymer entity mutation(s)."""
+    @property
+    def pdbx_number_of_molecules(self) -> 'Attribute':
+        """The number of molecules of the entity in the entry."""
+    @property
+    def rcsb_multiple_source_flag(self) -> 'Attribute':
+        """A code indicating the entity has multiple biological sources."""
+    @property
+    def rcsb_source_part_count(self) -> 'Attribute':
+        """The number of biological sources for the polymer entity. Multiple source contributions  may come from the same organism (taxonomy)."""
+    @property
+    def rcsb_source_taxonomy_count(self) -> 'Attribute':
+        """The number of distinct source taxonomies for the polymer entity. Commonly used to identify chimeric polymers."""
+    @property
+    def src_method(self) -> 'Attribute':
+        """The method by which the sample for the polymer entity was produced.  Entities isolated directly from natural sources (tissues, soil  samples etc.) are expected to have further information in the  ENTITY_SRC_NAT category. Entities isolated from genetically  manipulated sources are expected to have further information in  the ENTITY_SRC_GEN category."""
+    @property
+    def rcsb_ec_lineage(self) -> 'Attr_RcsbEcLineage':
+        """"""
+    @property
+    def rcsb_macromolecular_names_combined(self) -> 'Attr_RcsbMacromolecularNamesCombined':
+        """"""
+    @property
+    def rcsb_enzyme_class_combined(self) -> 'Attr_RcsbEnzymeClassCombined':
+        """"""
+    @property
+    def rcsb_polymer_name_combined(self) -> 'Attr_RcsbPolymerNameCombined':
+        """"""
+
+class Attr_AlignedRegions_2(AttributeGroup):
+    """"""
+    @property
+    def entity_beg_seq_id(self) -> 'Attribute':
+        """An identifier for the monomer in the entity sequence at which this segment of the alignment begins."""
+    @property
+    def length(self) -> 'Attribute':
+        """The length of this segment of the alignment."""
+    @property
+    def ref_beg_seq_id(self) -> 'Attribute':
+        """An identifier for the monomer in the reference sequence at which this segment of the alignment begins."""
+
+class Attr_RcsbPolymerEntityAlign(AttributeGroup):
+    """"""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Code identifying the individual, organization or program that  assigned the reference sequence."""
+    @property
+    def reference_database_accession(self) -> 'Attribute':
+        """Reference sequence accession code."""
+    @property
+    def reference_database_isoform(self) -> 'Attribute':
+        """Reference sequence isoform identifier."""
+    @property
+    def reference_database_name(self) -> 'Attribute':
+        """Reference sequence database name."""
+    @property
+    def aligned_regions(self) -> 'Attr_AlignedRegions_2':
+        """"""
+
+class Attr_RcsbPolymerEntityAnnotation(AttributeGroup):
+    """"""
+    @property
+    def annotation_id(self) -> 'Attribute':
+        """An identifier for the annotation."""
+    @property
+    def assignment_version(self) -> 'Attribute':
+        """Identifies the version of the annotation assignment."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description for the annotation."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name for the annotation."""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Code identifying the individual, organization or program that  assigned the annotation."""
+    @property
+    def type(self) -> 'Attribute':
+        """A type or category of the annotation."""
+    @property
+    def annotation_lineage(self) -> 'Attr_AnnotationLineage':
+        """"""
+    @property
+    def additional_properties(self) -> 'Attr_AdditionalProperties':
+        """"""
+
+class Attr_ReferenceSequenceIdentifiers_2(AttributeGroup):
+    """"""
+    @property
+    def database_accession(self) -> 'Attribute':
+        """Reference database accession code"""
+    @property
+    def database_isoform(self) -> 'Attribute':
+        """Reference database identifier for the sequence isoform"""
+    @property
+    def database_name(self) -> 'Attribute':
+        """Reference database name"""
+    @property
+    def entity_sequence_coverage(self) -> 'Attribute':
+        """Indicates what fraction of this polymer entity sequence is covered by the reference sequence."""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Source of the reference database assignment"""
+    @property
+    def reference_sequence_coverage(self) -> 'Attribute':
+        """Indicates what fraction of the reference sequence is covered by this polymer entity sequence."""
+
+class Attr_RcsbPolymerEntityContainerIdentifiers(AttributeGroup):
+    """"""
+    @property
+    def asym_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def auth_asym_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def chem_comp_monomers(self) -> 'Attribute':
+        """"""
+    @property
+    def chem_comp_nstd_monomers(self) -> 'Attribute':
+        """"""
+    @property
+    def chem_ref_def_id(self) -> 'Attribute':
+        """The chemical reference definition identifier for the entity in this container."""
+    @property
+    def entity_id(self) -> 'Attribute':
+        """Entity identifier for the container."""
+    @property
+    def entry_id(self) -> 'Attribute':
+        """Entry identifier for the container."""
+    @property
+    def prd_id(self) -> 'Attribute':
+        """The BIRD identifier for the entity in this container."""
+    @property
+    def rcsb_id(self) -> 'Attribute':
+        """A unique identifier for each object in this entity container formed by  an underscore separated concatenation of entry and entity identifiers."""
+    @property
+    def uniprot_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def reference_sequence_identifiers(self) -> 'Attr_ReferenceSequenceIdentifiers_2':
+        """"""
+
+class Attr_FeaturePositions_6(AttributeGroup):
+    """"""
+    @property
+    def beg_comp_id(self) -> 'Attribute':
+        """An identifier for the leading monomer corresponding to the feature assignment."""
+    @property
+    def beg_seq_id(self) -> 'Attribute':
+        """An identifier for the monomer at which this segment of the feature begins."""
+    @property
+    def end_seq_id(self) -> 'Attribute':
+        """An identifier for the monomer at which this segment of the feature ends."""
+    @property
+    def value(self) -> 'Attribute':
+        """The value for the feature over this monomer segment."""
+    @property
+    def values(self) -> 'Attribute':
+        """"""
+
+class Attr_RcsbPolymerEntityFeature(AttributeGroup):
+    """"""
+    @property
+    def assignment_version(self) -> 'Attribute':
+        """Identifies the version of the feature assignment."""
+    @property
+    def description(self) -> 'Attribute':
+        """A description for the feature."""
+    @property
+    def feature_id(self) -> 'Attribute':
+        """An identifier for the feature."""
+    @property
+    def name(self) -> 'Attribute':
+        """A name for the feature."""
+    @property
+    def provenance_source(self) -> 'Attribute':
+        """Code identifying the individual, organization or program that  assigned the feature."""
+    @property
+    def reference_scheme(self) -> 'Attribute':
+        """Code residue coordinate system for the assigned feature."""
+    @property
+    def type(self) -> 'Attribute':
+        """A type or category of the feature."""
+    @property
+    def feature_positions(self) -> 'Attr_FeaturePositions_6':
+        """"""
+    @property
+    def additional_properties(self) -> 'Attr_AdditionalProperties':
+        """"""
+
+class Attr_RcsbPolymerEntityFeatureSummary(AttributeGroup):
+    """"""
+    @property
+    def count(self) -> 'Attribute':
+        """The feature count."""
+    @property
+    def coverage(self) -> 'Attribute':
+        """The fractional feature coverage relative to the full entity sequence.  For instance, the fraction of features such as mutations, artifacts or modified monomers  relative to the length of the entity sequence."""
+    @property
+    def maximum_length(self) -> 'Attribute':
+        """The maximum feature length."""
+    @property
+    def maximum_value(self) -> 'Attribute':
+        """The maximum feature value."""
+    @property
+    def minimum_length(self) -> 'Attribute':
+        """The minimum feature length."""
+    @property
+    def minimum_value(self) -> 'Attribute':
+        """The minimum feature value."""
+    @property
+    def type(self) -> 'Attribute':
+        """Type or category of the feature."""
+
+class Attr_RcsbPolymerEntityGroupMembership(AttributeGroup):
+    """"""
+    @property
+    def aggregation_method(self) -> 'Attribute':
+        """Method used to establish group membership"""
+    @property
+    def group_id(self) -> 'Attribute':
+        """A unique identifier for a group of entities"""
+    @property
+    def similarity_cutoff(self) -> 'Attribute':
+        """Degree of similarity expressed as a floating-point number"""
+    @property
+    def aligned_regions(self) -> 'Attr_AlignedRegions_2':
+        """"""
+
+class Attr_RcsbPolymerEntityKeywords(AttributeGroup):
+    """"""
+    @property
+    def text(self) -> 'Attribute':
+        """Keywords describing this polymer entity."""
+
+class Attr_RcsbPolymerEntityNameCom(AttributeGroup):
+    """"""
+    @property
+    def name(self) -> 'Attribute':
+        """A common name for the polymer entity."""
+
+class Attr_RcsbPolymerEntityNameSys(AttributeGroup):
+    """"""
+    @property
+    def name(self) -> 'Attribute':
+        """The systematic name for the polymer entity."""
+    @property
+    def system(self) -> 'Attribute':
+        """The system used to generate the systematic name of the polymer entity."""
+
+class Attr_AlignedTarget(AttributeGroup):
+    """"""
+    @property
+    def entity_beg_seq_id(self) -> 'Attribute':
+        """The position of the monomer in the entity sequence at which the alignment begins."""
+    @property
+    def length(self) -> 'Attribute':
+        """The length of the alignment."""
+    @property
+    def target_beg_seq_id(self) -> 'Attribute':
+        """The position of the monomer in the target sequence at which the alignment begins."""
+
+class Attr_RcsbRelatedTargetReferences(AttributeGroup):
+    """"""
+    @property
+    def related_resource_name(self) -> 'Attribute':
+        """The related target data resource name."""
+    @property
+    def related_resource_version(self) -> 'Attribute':
+        """The version of the target data resource."""
+    @property
+    def related_target_id(self) -> 'Attribute':
+        """An identifier for the target sequence in the related data resource."""
+    @property
+    def target_taxonomy_id(self) -> 'Attribute':
+        """NCBI Taxonomy identifier for the target organism.   Reference:   Wheeler DL, Chappey C, Lash AE, Leipe DD, Madden TL, Schuler GD,  Tatusova TA, Rapp BA (2000). Database resources of the National  Center for Biotechnology Information. Nucleic Acids Res 2000 Jan  1;28(1):10-4   Benson DA, Karsch-Mizrachi I, Lipman DJ, Ostell J, Rapp BA,  Wheeler DL (2000). GenBank. Nucleic Acids Res 2000 Jan 1;28(1):15-18."""
+    @property
+    def aligned_target(self) -> 'Attr_AlignedTarget':
+        """"""
+
+class Attr_RcsbTargetCofactors(AttributeGroup):
+    """"""
+    @property
+    def binding_assay_value(self) -> 'Attribute':
+        """The value measured or determined by the assay."""
+    @property
+    def binding_assay_value_type(self) -> 'Attribute':
+        """The type of measurement or value determined by the assay."""
+    @property
+    def cofactor_InChIKey(self) -> 'Attribute':
+        """Standard IUPAC International Chemical Identifier (InChI) descriptor key  for the cofactor.   InChI, the IUPAC International Chemical Identifier,  by Stephen R Heller, Alan McNaught, Igor Pletnev, Stephen Stein and Dmitrii Tchekhovskoi,  Journal of Cheminformatics, 2015, 7:23"""
+    @property
+    def cofactor_SMILES(self) -> 'Attribute':
+        """Simplified molecular-input line-entry system (SMILES) descriptor for the cofactor.     Weininger D (February 1988). 'SMILES, a chemical language and information system. 1.    Introduction to methodology and encoding rules'. Journal of Chemical Information and Modeling. 28 (1): 31-6.     Weininger D, Weininger A, Weininger JL (May 1989).    'SMILES. 2. Algorithm for generation of unique SMILES notation',    Journal of Chemical Information and Modeling. 29 (2): 97-101."""
+    @property
+    def cofactor_chem_comp_id(self) -> 'Attribute':
+        """The chemical component definition identifier for the cofactor."""
+    @property
+    def cofactor_description(self) -> 'Attribute':
+        """The cofactor description."""
+    @property
+    def cofactor_name(self) -> 'Attribute':
+        """The cofactor name."""
+    @property
+    def cofactor_prd_id(self) -> 'Attribute':
+        """The BIRD definition identifier for the cofactor."""
+    @property
+    def cofactor_resource_id(self) -> 'Attribute':
+        """Identifier for the cofactor assigned by the resource."""
+    @property
+    def mechanism_of_action(self) -> 'Attribute':
+        """Mechanism of action describes the biochemical interaction through which the  cofactor produces a pharmacological effect."""
+    @property
+    def neighbor_flag(self) -> 'Attribute':
+        """A flag to indicate the cofactor is a structural neighbor of this  entity."""
+    @property
+    def patent_nos(self) -> 'Attribute':
+        """"""
+    @property
+    def pubmed_ids(self) -> 'Attribute':
+        """"""
+    @property
+    def resource_name(self) -> 'Attribute':
+        """Resource providing target and cofactor data."""
+    @property
+    def resource_version(self) -> 'Attribute':
+        """Version of the information distributed by the data resource."""
+    @property
+    def target_resource_id(self) -> 'Attribute':
+        """Identifier for the target assigned by the resource."""
+
+class Attr_DrugbankContainerIdentifiers(AttributeGroup):
+    """"""
+    @property
+    def drugbank_id(self) -> 'Attribute':
+        """The DrugBank accession code"""
+
+class Attr_DrugProducts(AttributeGroup):
+    """"""
+    @property
+    def approved(self) -> 'Attribute':
+        """Indicates whether this drug has been approved by the regulating government."""
+    @property
+    def country(self) -> 'Attribute':
+        """The country where this commercially available drug has been approved."""
+    @property
+    def ended_marketing_on(self) -> 'Attribute':
+        """The ending date for market approval."""
+    @property
+    def name(self) -> 'Attribute':
+        """The proprietary name(s) provided by the manufacturer for any commercially available products containing this drug."""
+    @property
+    def source(self) -> 'Attribute':
+        """Source of this product information. For example, a value of DPD indicates this information was retrieved from the Canadian Drug Product Database."""
+    @property
+    def started_marketing_on(self) -> 'Attribute':
+        """The starting date for market approval."""
+
+class Attr_DrugbankInfo(AttributeGroup):
+    """"""
+    @property
+    def affected_organisms(self) -> 'Attribute':
+        """"""
+    @property
+    def atc_codes(self) -> 'Attribute':
+        """"""
+    @property
+    def brand_names(self) -> 'Attribute':
+        """"""
+    @property
+    def cas_number(self) -> 'Attribute':
+        """The DrugBank assigned Chemical Abstracts Service identifier."""
+    @property
+    def description(self) -> 'Attribute':
+        """The DrugBank drug description."""
+    @property
+    def drug_categories(self) -> 'Attribute':
+        """"""
+    @property
+    def drug_groups(self) -> 'Attribute':
+        """"""
+    @property
+    def drugbank_id(self) -> 'Attribute':
+        """The DrugBank accession code"""
+    @property
+    def indication(self) -> 'Attribute':
+        """The DrugBank drug indication."""
+    @property
+    def mechanism_of_action(self) -> 'Attribute':
+        """The DrugBank drug mechanism of actions."""
+    @property
+    def name(self) -> 'Attribute':
+        """The DrugBank drug name."""
+    @property
+    def pharmacology(self) -> 'Attribute':
+        """The DrugBank drug pharmacology."""
+    @property
+    def synonyms(self) -> 'Attribute':
+        """"""
+    @property
+    def drug_products(self) -> 'Attr_DrugProducts':
+        """"""
+
+class Attr_DrugbankTarget(AttributeGroup):
+    """"""
+    @property
+    def interaction_type(self) -> 'Attribute':
+        """The type of target interaction."""
+    @property
+    def name(self) -> 'Attribute':
+        """The target name."""
+    @property
+    def ordinal(self) -> 'Attribute':
+        """The value of _drugbank_target.ordinal distinguishes  related examples for each chemical component."""
+    @property
+    def organism_common_name(self) -> 'Attribute':
+        """The organism common name."""
+    @property
+    def reference_database_accession_code(self) -> 'Attribute':
+        """The reference identifier code for the target interaction reference."""
+    @property
+    def reference_database_name(self) -> 'Attribute':
+        """The reference database name for the target interaction."""
+    @property
+    def seq_one_letter_code(self) -> 'Attribute':
+        """Target sequence expressed as string of one-letter amino acid codes."""
+    @property
+    def target_actions(self) -> 'Attribute':
+        """"""
+
+class AttributesRoot(AttributeGroup):
+    """"""
+    @property
+    def pdbx_entity_nonpoly(self) -> 'Attr_PdbxEntityNonpoly':
+        """"""
+    @property
+    def rcsb_latest_revision(self) -> 'Attr_RcsbLatestRevision':
+        """"""
+    @property
+    def rcsb_nonpolymer_entity(self) -> 'Attr_RcsbNonpolymerEntity':
+        """"""
+    @property
+    def rcsb_nonpolymer_entity_annotation(self) -> 'Attr_RcsbNonpolymerEntityAnnotation':
+        """"""
+    @property
+    def rcsb_nonpolymer_entity_container_identifiers(self) -> 'Attr_RcsbNonpolymerEntityContainerIdentifiers':
+        """"""
+    @property
+    def rcsb_nonpolymer_entity_feature(self) -> 'Attr_RcsbNonpolymerEntityFeature':
+        """"""
+    @property
+    def rcsb_nonpolymer_entity_feature_summary(self) -> 'Attr_RcsbNonpolymerEntityFeatureSummary':
+        """"""
+    @property
+    def rcsb_nonpolymer_entity_keywords(self) -> 'Attr_RcsbNonpolymerEntityKeywords':
+        """"""
+    @property
+    def rcsb_nonpolymer_entity_name_com(self) -> 'Attr_RcsbNonpolymerEntityNameCom':
+        """"""
+    @property
+    def rcsb_id(self) -> 'Attribute':
+        """A unique identifier for each object in this entity container formed by  an underscore separated concatenation of entry and entity identifiers."""
+    @property
+    def chem_comp(self) -> 'Attr_ChemComp':
+        """"""
+    @property
+    def pdbx_chem_comp_audit(self) -> 'Attr_PdbxChemCompAudit':
+        """"""
+    @property
+    def pdbx_chem_comp_descriptor(self) -> 'Attr_PdbxChemCompDescriptor':
+        """"""
+    @property
+    def pdbx_chem_comp_feature(self) -> 'Attr_PdbxChemCompFeature':
+        """"""
+    @property
+    def pdbx_chem_comp_identifier(self) -> 'Attr_PdbxChemCompIdentifier':
+        """"""
+    @property
+    def pdbx_family_prd_audit(self) -> 'Attr_PdbxFamilyPrdAudit':
+        """"""
+    @property
+    def pdbx_prd_audit(self) -> 'Attr_PdbxPrdAudit':
+        """"""
+    @property
+    def pdbx_reference_entity_list(self) -> 'Attr_PdbxReferenceEntityList':
+        """"""
+    @property
+    def pdbx_reference_entity_poly(self) -> 'Attr_PdbxReferenceEntityPoly':
+        """"""
+    @property
+    def pdbx_reference_entity_poly_link(self) -> 'Attr_PdbxReferenceEntityPolyLink':
+        """"""
+    @property
+    def pdbx_reference_entity_poly_seq(self) -> 'Attr_PdbxReferenceEntityPolySeq':
+        """"""
+    @property
+    def pdbx_reference_entity_sequence(self) -> 'Attr_PdbxReferenceEntitySequence':
+        """"""
+    @property
+    def pdbx_reference_entity_src_nat(self) -> 'Attr_PdbxReferenceEntitySrcNat':
+        """"""
+    @property
+    def pdbx_reference_molecule(self) -> 'Attr_PdbxReferenceMolecule':
+        """"""
+    @property
+    def pdbx_reference_molecule_annotation(self) -> 'Attr_PdbxReferenceMoleculeAnnotation':
+        """"""
+    @property
+    def pdbx_reference_molecule_details(self) -> 'Attr_PdbxReferenceMoleculeDetails':
+        """"""
+    @property
+    def pdbx_reference_molecule_family(self) -> 'Attr_PdbxReferenceMoleculeFamily':
+        """"""
+    @property
+    def pdbx_reference_molecule_features(self) -> 'Attr_PdbxReferenceMoleculeFeatures':
+        """"""
+    @property
+    def pdbx_reference_molecule_list(self) -> 'Attr_PdbxReferenceMoleculeList':
+        """"""
+    @property
+    def pdbx_reference_molecule_related_structures(self) -> 'Attr_PdbxReferenceMoleculeRelatedStructures':
+        """"""
+    @property
+    def pdbx_reference_molecule_synonyms(self) -> 'Attr_PdbxReferenceMoleculeSynonyms':
+        """"""
+    @property
+    def rcsb_bird_citation(self) -> 'Attr_RcsbBirdCitation':
+        """"""
+    @property
+    def rcsb_chem_comp_annotation(self) -> 'Attr_RcsbChemCompAnnotation':
+        """"""
+    @property
+    def rcsb_chem_comp_container_identifiers(self) -> 'Attr_RcsbChemCompContainerIdentifiers':
+        """"""
+    @property
+    def rcsb_chem_comp_descriptor(self) -> 'Attr_RcsbChemCompDescriptor':
+        """"""
+    @property
+    def rcsb_chem_comp_info(self) -> 'Attr_RcsbChemCompInfo':
+        """"""
+    @property
+    def rcsb_chem_comp_related(self) -> 'Attr_RcsbChemCompRelated':
+        """"""
+    @property
+    def rcsb_chem_comp_synonyms(self) -> 'Attr_RcsbChemCompSynonyms':
+        """"""
+    @property
+    def rcsb_chem_comp_target(self) -> 'Attr_RcsbChemCompTarget':
+        """"""
+    @property
+    def rcsb_schema_container_identifiers(self) -> 'Attr_RcsbSchemaContainerIdentifiers':
+        """"""
+    @property
+    def pdbx_struct_assembly(self) -> 'Attr_PdbxStructAssembly':
+        """"""
+    @property
+    def pdbx_struct_assembly_auth_evidence(self) -> 'Attr_PdbxStructAssemblyAuthEvidence':
+        """"""
+    @property
+    def pdbx_struct_assembly_gen(self) -> 'Attr_PdbxStructAssemblyGen':
+        """"""
+    @property
+    def pdbx_struct_assembly_prop(self) -> 'Attr_PdbxStructAssemblyProp':
+        """"""
+    @property
+    def pdbx_struct_oper_list(self) -> 'Attr_PdbxStructOperList':
+        """"""
+    @property
+    def rcsb_assembly_annotation(self) -> 'Attr_RcsbAssemblyAnnotation':
+        """"""
+    @property
+    def rcsb_assembly_container_identifiers(self) -> 'Attr_RcsbAssemblyContainerIdentifiers':
+        """"""
+    @property
+    def rcsb_assembly_feature(self) -> 'Attr_RcsbAssemblyFeature':
+        """"""
+    @property
+    def rcsb_assembly_info(self) -> 'Attr_RcsbAssemblyInfo':
+        """"""
+    @property
+    def rcsb_struct_symmetry(self) -> 'Attr_RcsbStructSymmetry':
+        """"""
+    @property
+    def rcsb_struct_symmetry_lineage(self) -> 'Attr_RcsbStructSymmetryLineage':
+        """"""
+    @property
+    def rcsb_struct_symmetry_provenance_code(self) -> 'Attribute':
+        """The title and version of software package used for symmetry calculations."""
+    @property
+    def rcsb_repository_holdings_current(self) -> 'Attr_RcsbRepositoryHoldingsCurrent':
+        """"""
+    @property
+    def rcsb_repository_holdings_current_entry_container_identifiers(self) -> 'Attr_RcsbRepositoryHoldingsCurrentEntryContainerIdentifiers':
+        """"""
+    @property
+    def pdbx_struct_special_symmetry(self) -> 'Attr_PdbxStructSpecialSymmetry':
+        """"""
+    @property
+    def pdbx_vrpt_summary_entity_fit_to_map(self) -> 'Attr_PdbxVrptSummaryEntityFitToMap':
+        """"""
+    @property
+    def pdbx_vrpt_summary_entity_geometry(self) -> 'Attr_PdbxVrptSummaryEntityGeometry':
+        """"""
+    @property
+    def rcsb_nonpolymer_entity_instance_container_identifiers(self) -> 'Attr_RcsbNonpolymerEntityInstanceContainerIdentifiers':
+        """"""
+    @property
+    def rcsb_nonpolymer_instance_annotation(self) -> 'Attr_RcsbNonpolymerInstanceAnnotation':
+        """"""
+    @property
+    def rcsb_nonpolymer_instance_feature(self) -> 'Attr_RcsbNonpolymerInstanceFeature':
+        """"""
+    @property
+    def rcsb_nonpolymer_instance_feature_summary(self) -> 'Attr_RcsbNonpolymerInstanceFeatureSummary':
+        """"""
+    @property
+    def rcsb_nonpolymer_instance_validation_score(self) -> 'Attr_RcsbNonpolymerInstanceValidationScore':
+        """"""
+    @property
+    def rcsb_nonpolymer_struct_conn(self) -> 'Attr_RcsbNonpolymerStructConn':
+        """"""
+    @property
+    def rcsb_target_neighbors(self) -> 'Attr_RcsbTargetNeighbors':
+        """"""
+    @property
+    def struct_asym(self) -> 'Attr_StructAsym':
+        """"""
+    @property
+    def rcsb_uniprot_container_identifiers(self) -> 'Attr_RcsbUniprotContainerIdentifiers':
+        """"""
+    @property
+    def rcsb_uniprot_accession(self) -> 'Attribute':
+        """List of UniProtKB accession numbers where original accession numbers are retained as ‘secondary’ accession numbers."""
+    @property
+    def rcsb_uniprot_entry_name(self) -> 'Attribute':
+        """A list of unique identifiers (former IDs), often containing biologically relevant information."""
+    @property
+    def rcsb_uniprot_keyword(self) -> 'Attr_RcsbUniprotKeyword':
+        """Keywords constitute a controlled vocabulary that summarises the content of a UniProtKB entry."""
+    @property
+    def rcsb_uniprot_protein(self) -> 'Attr_RcsbUniprotProtein':
+        """"""
+    @property
+    def rcsb_uniprot_feature(self) -> 'Attr_RcsbUniprotFeature':
+        """"""
+    @property
+    def rcsb_uniprot_annotation(self) -> 'Attr_RcsbUniprotAnnotation':
+        """"""
+    @property
+    def rcsb_uniprot_external_reference(self) -> 'Attr_RcsbUniprotExternalReference':
+        """"""
+    @property
+    def rcsb_uniprot_alignments(self) -> 'Attr_RcsbUniprotAlignments':
+        """UniProt pairwise sequence alignments."""
+    @property
+    def rcsb_branched_entity_instance_container_identifiers(self) -> 'Attr_RcsbBranchedEntityInstanceContainerIdentifiers':
+        """"""
+    @property
+    def rcsb_branched_instance_annotation(self) -> 'Attr_RcsbBranchedInstanceAnnotation':
+        """"""
+    @property
+    def rcsb_branched_instance_feature(self) -> 'Attr_RcsbBranchedInstanceFeature':
+        """"""
+    @property
+    def rcsb_branched_instance_feature_summary(self) -> 'Attr_RcsbBranchedInstanceFeatureSummary':
+        """"""
+    @property
+    def rcsb_branched_struct_conn(self) -> 'Attr_RcsbBranchedStructConn':
+        """"""
+    @property
+    def rcsb_ligand_neighbors(self) -> 'Attr_RcsbLigandNeighbors':
+        """"""
+    @property
+    def pdbx_entity_branch(self) -> 'Attr_PdbxEntityBranch':
+        """"""
+    @property
+    def pdbx_entity_branch_descriptor(self) -> 'Attr_PdbxEntityBranchDescriptor':
+        """"""
+    @property
+    def rcsb_branched_entity(self) -> 'Attr_RcsbBranchedEntity':
+        """"""
+    @property
+    def rcsb_branched_entity_annotation(self) -> 'Attr_RcsbChemCompAnnotation':
+        """"""
+    @property
+    def rcsb_branched_entity_container_identifiers(self) -> 'Attr_RcsbBranchedEntityContainerIdentifiers':
+        """"""
+    @property
+    def rcsb_branched_entity_feature(self) -> 'Attr_RcsbBranchedEntityFeature':
+        """"""
+    @property
+    def rcsb_branched_entity_feature_summary(self) -> 'Attr_RcsbBranchedInstanceFeatureSummary':
+        """"""
+    @property
+    def rcsb_branched_entity_keywords(self) -> 'Attr_RcsbBranchedEntityKeywords':
+        """"""
+    @property
+    def rcsb_branched_entity_name_com(self) -> 'Attr_RcsbBranchedEntityNameCom':
+        """"""
+    @property
+    def rcsb_branched_entity_name_sys(self) -> 'Attr_RcsbBranchedEntityNameSys':
+        """"""
+    @property
+    def rcsb_polymer_entity_instance_container_identifiers(self) -> 'Attr_RcsbPolymerEntityInstanceContainerIdentifiers':
+        """"""
+    @property
+    def rcsb_polymer_instance_annotation(self) -> 'Attr_RcsbPolymerInstanceAnnotation':
+        """"""
+    @property
+    def rcsb_polymer_instance_feature(self) -> 'Attr_RcsbPolymerInstanceFeature':
+        """"""
+    @property
+    def rcsb_polymer_instance_feature_summary(self) -> 'Attr_RcsbPolymerInstanceFeatureSummary':
+        """"""
+    @property
+    def rcsb_polymer_instance_info(self) -> 'Attr_RcsbPolymerInstanceInfo':
+        """"""
+    @property
+    def rcsb_polymer_struct_conn(self) -> 'Attr_RcsbPolymerStructConn':
+        """"""
+    @property
+    def audit_author(self) -> 'Attr_AuditAuthor':
+        """"""
+    @property
+    def cell(self) -> 'Attr_Cell':
+        """"""
+    @property
+    def citation(self) -> 'Attr_Citation':
+        """"""
+    @property
+    def database_2(self) -> 'Attr_Database2':
+        """"""
+    @property
+    def diffrn(self) -> 'Attr_Diffrn':
+        """"""
+    @property
+    def diffrn_detector(self) -> 'Attr_DiffrnDetector':
+        """"""
+    @property
+    def diffrn_radiation(self) -> 'Attr_DiffrnRadiation':
+        """"""
+    @property
+    def diffrn_source(self) -> 'Attr_DiffrnSource':
+        """"""
+    @property
+    def em_2d_crystal_entity(self) -> 'Attr_Em2dCrystalEntity':
+        """"""
+    @property
+    def em_3d_crystal_entity(self) -> 'Attr_Em3dCrystalEntity':
+        """"""
+    @property
+    def em_3d_fitting(self) -> 'Attr_Em3dFitting':
+        """"""
+    @property
+    def em_3d_fitting_list(self) -> 'Attr_Em3dFittingList':
+        """"""
+    @property
+    def em_3d_reconstruction(self) -> 'Attr_Em3dReconstruction':
+        """"""
+    @property
+    def em_ctf_correction(self) -> 'Attr_EmCtfCorrection':
+        """"""
+    @property
+    def em_diffraction(self) -> 'Attr_EmDiffraction':
+        """"""
+    @property
+    def em_diffraction_shell(self) -> 'Attr_EmDiffractionShell':
+        """"""
+    @property
+    def em_diffraction_stats(self) -> 'Attr_EmDiffractionStats':
+        """"""
+    @property
+    def em_embedding(self) -> 'Attr_EmEmbedding':
+        """"""
+    @property
+    def em_entity_assembly(self) -> 'Attr_EmEntityAssembly':
+        """"""
+    @property
+    def em_experiment(self) -> 'Attr_EmExperiment':
+        """"""
+    @property
+    def em_helical_entity(self) -> 'Attr_EmHelicalEntity':
+        """"""
+    @property
+    def em_image_recording(self) -> 'Attr_EmImageRecording':
+        """"""
+    @property
+    def em_imaging(self) -> 'Attr_EmImaging':
+        """"""
+    @property
+    def em_particle_selection(self) -> 'Attr_EmParticleSelection':
+        """"""
+    @property
+    def em_single_particle_entity(self) -> 'Attr_EmSingleParticleEntity':
+        """"""
+    @property
+    def em_software(self) -> 'Attr_EmSoftware':
+        """"""
+    @property
+    def em_specimen(self) -> 'Attr_EmSpecimen':
+        """"""
+    @property
+    def em_staining(self) -> 'Attr_EmStaining':
+        """"""
+    @property
+    def em_vitrification(self) -> 'Attr_EmVitrification':
+        """"""
+    @property
+    def entry(self) -> 'Attr_Entry':
+        """"""
+    @property
+    def exptl(self) -> 'Attr_Exptl':
+        """"""
+    @property
+    def exptl_crystal(self) -> 'Attr_ExptlCrystal':
+        """"""
+    @property
+    def exptl_crystal_grow(self) -> 'Attr_ExptlCrystalGrow':
+        """"""
+    @property
+    def ihm_entry_collection_mapping(self) -> 'Attr_IhmEntryCollectionMapping':
+        """"""
+    @property
+    def ihm_external_reference_info(self) -> 'Attr_IhmExternalReferenceInfo':
+        """"""
+    @property
+    def ma_data(self) -> 'Attr_MaData':
+        """"""
+    @property
+    def pdbx_SG_project(self) -> 'Attr_PdbxSgProject':
+        """"""
+    @property
+    def pdbx_audit_revision_category(self) -> 'Attr_PdbxAuditRevisionCategory':
+        """"""
+    @property
+    def pdbx_audit_revision_details(self) -> 'Attr_PdbxAuditRevisionDetails':
+        """"""
+    @property
+    def pdbx_audit_revision_group(self) -> 'Attr_PdbxAuditRevisionGroup':
+        """"""
+    @property
+    def pdbx_audit_revision_history(self) -> 'Attr_PdbxAuditRevisionHistory':
+        """"""
+    @property
+    def pdbx_audit_revision_item(self) -> 'Attr_PdbxAuditRevisionItem':
+        """"""
+    @property
+    def pdbx_audit_support(self) -> 'Attr_PdbxAuditSupport':
+        """"""
+    @property
+    def pdbx_database_PDB_obs_spr(self) -> 'Attr_PdbxDatabasePdbObsSpr':
+        """"""
+    @property
+    def pdbx_database_related(self) -> 'Attr_PdbxDatabaseRelated':
+        """"""
+    @property
+    def pdbx_database_status(self) -> 'Attr_PdbxDatabaseStatus':
+        """"""
+    @property
+    def pdbx_deposit_group(self) -> 'Attr_PdbxDepositGroup':
+        """"""
+    @property
+    def pdbx_initial_refinement_model(self) -> 'Attr_PdbxInitialRefinementModel':
+        """"""
+    @property
+    def pdbx_molecule_features(self) -> 'Attr_PdbxMoleculeFeatures':
+        """"""
+    @property
+    def pdbx_nmr_details(self) -> 'Attr_PdbxNmrDetails':
+        """"""
+    @property
+    def pdbx_nmr_ensemble(self) -> 'Attr_PdbxNmrEnsemble':
+        """"""
+    @property
+    def pdbx_nmr_exptl(self) -> 'Attr_PdbxNmrExptl':
+        """"""
+    @property
+    def pdbx_nmr_exptl_sample_conditions(self) -> 'Attr_PdbxNmrExptlSampleConditions':
+        """"""
+    @property
+    def pdbx_nmr_refine(self) -> 'Attr_PdbxNmrRefine':
+        """"""
+    @property
+    def pdbx_nmr_representative(self) -> 'Attr_PdbxNmrRepresentative':
+        """"""
+    @property
+    def pdbx_nmr_sample_details(self) -> 'Attr_PdbxNmrSampleDetails':
+        """"""
+    @property
+    def pdbx_nmr_software(self) -> 'Attr_PdbxNmrSoftware':
+        """"""
+    @property
+    def pdbx_nmr_spectrometer(self) -> 'Attr_PdbxNmrSpectrometer':
+        """"""
+    @property
+    def pdbx_reflns_twin(self) -> 'Attr_PdbxReflnsTwin':
+        """"""
+    @property
+    def pdbx_related_exp_data_set(self) -> 'Attr_PdbxRelatedExpDataSet':
+        """"""
+    @property
+    def pdbx_serial_crystallography_data_reduction(self) -> 'Attr_PdbxSerialCrystallographyDataReduction':
+        """"""
+    @property
+    def pdbx_serial_crystallography_measurement(self) -> 'Attr_PdbxSerialCrystallographyMeasurement':
+        """"""
+    @property
+    def pdbx_serial_crystallography_sample_delivery(self) -> 'Attr_PdbxSerialCrystallographySampleDelivery':
+        """"""
+    @property
+    def pdbx_serial_crystallography_sample_delivery_fixed_target(self) -> 'Attr_PdbxSerialCrystallographySampleDeliveryFixedTarget':
+        """"""
+    @property
+    def pdbx_serial_crystallography_sample_delivery_injection(self) -> 'Attr_PdbxSerialCrystallographySampleDeliveryInjection':
+        """"""
+    @property
+    def pdbx_soln_scatter(self) -> 'Attr_PdbxSolnScatter':
+        """"""
+    @property
+    def pdbx_soln_scatter_model(self) -> 'Attr_PdbxSolnScatterModel':
+        """"""
+    @property
+    def pdbx_vrpt_summary(self) -> 'Attr_PdbxVrptSummary':
+        """"""
+    @property
+    def pdbx_vrpt_summary_diffraction(self) -> 'Attr_PdbxVrptSummaryDiffraction':
+        """"""
+    @property
+    def pdbx_vrpt_summary_em(self) -> 'Attr_PdbxVrptSummaryEm':
+        """"""
+    @property
+    def pdbx_vrpt_summary_geometry(self) -> 'Attr_PdbxVrptSummaryGeometry':
+        """"""
+    @property
+    def pdbx_vrpt_summary_nmr(self) -> 'Attr_PdbxVrptSummaryNmr':
+        """"""
+    @property
+    def rcsb_accession_info(self) -> 'Attr_RcsbAccessionInfo':
+        """"""
+    @property
+    def rcsb_binding_affinity(self) -> 'Attr_RcsbBindingAffinity':
+        """"""
+    @property
+    def rcsb_comp_model_provenance(self) -> 'Attr_RcsbCompModelProvenance':
+        """"""
+    @property
+    def rcsb_entry_container_identifiers(self) -> 'Attr_RcsbEntryContainerIdentifiers':
+        """"""
+    @property
+    def rcsb_entry_group_membership(self) -> 'Attr_RcsbEntryGroupMembership':
+        """"""
+    @property
+    def rcsb_entry_info(self) -> 'Attr_RcsbEntryInfo':
+        """"""
+    @property
+    def rcsb_external_references(self) -> 'Attr_RcsbExternalReferences':
+        """"""
+    @property
+    def rcsb_ihm_dataset_list(self) -> 'Attr_RcsbIhmDatasetList':
+        """"""
+    @property
+    def rcsb_ihm_dataset_source_db_reference(self) -> 'Attr_RcsbIhmDatasetSourceDbReference':
+        """"""
+    @property
+    def rcsb_ma_qa_metric_global(self) -> 'Attr_RcsbMaQaMetricGlobal':
+        """"""
+    @property
+    def rcsb_primary_citation(self) -> 'Attr_RcsbPrimaryCitation':
+        """"""
+    @property
+    def refine(self) -> 'Attr_Refine':
+        """"""
+    @property
+    def refine_analyze(self) -> 'Attr_RefineAnalyze':
+        """"""
+    @property
+    def refine_hist(self) -> 'Attr_RefineHist':
+        """"""
+    @property
+    def refine_ls_restr(self) -> 'Attr_RefineLsRestr':
+        """"""
+    @property
+    def reflns(self) -> 'Attr_Reflns':
+        """"""
+    @property
+    def reflns_shell(self) -> 'Attr_ReflnsShell':
+        """"""
+    @property
+    def software(self) -> 'Attr_Software':
+        """"""
+    @property
+    def struct(self) -> 'Attr_Struct':
+        """"""
+    @property
+    def struct_keywords(self) -> 'Attr_StructKeywords':
+        """"""
+    @property
+    def symmetry(self) -> 'Attr_Symmetry':
+        """"""
+    @property
+    def rcsb_pubmed_container_identifiers(self) -> 'Attr_RcsbPubmedContainerIdentifiers':
+        """"""
+    @property
+    def rcsb_pubmed_central_id(self) -> 'Attribute':
+        """Unique integer value assigned to each PubMed Central record."""
+    @property
+    def rcsb_pubmed_doi(self) -> 'Attribute':
+        """Persistent identifier used to provide a link to an article location on the Internet."""
+    @property
+    def rcsb_pubmed_abstract_text(self) -> 'Attribute':
+        """A concise, accurate and factual mini-version of the paper contents."""
+    @property
+    def rcsb_pubmed_affiliation_info(self) -> 'Attribute':
+        """The institution(s) that the author is affiliated with. Multiple affiliations per author are allowed."""
+    @property
+    def rcsb_pubmed_mesh_descriptors(self) -> 'Attribute':
+        """NLM controlled vocabulary, Medical Subject Headings (MeSH), is used to characterize the content of the articles represented by MEDLINE citations."""
+    @property
+    def rcsb_pubmed_mesh_descriptors_lineage(self) -> 'Attr_RcsbPubmedMeshDescriptorsLineage':
+        """Members of the MeSH classification lineage."""
+    @property
+    def entity_poly(self) -> 'Attr_EntityPoly':
+        """"""
+    @property
+    def entity_src_gen(self) -> 'Attr_EntitySrcGen':
+        """"""
+    @property
+    def entity_src_nat(self) -> 'Attr_EntitySrcNat':
+        """"""
+    @property
+    def pdbx_entity_src_syn(self) -> 'Attr_PdbxEntitySrcSyn':
+        """"""
+    @property
+    def rcsb_cluster_flexibility(self) -> 'Attr_RcsbClusterFlexibility':
+        """"""
+    @property
+    def rcsb_cluster_membership(self) -> 'Attr_RcsbClusterMembership':
+        """"""
+    @property
+    def rcsb_entity_host_organism(self) -> 'Attr_RcsbEntityHostOrganism':
+        """"""
+    @property
+    def rcsb_entity_source_organism(self) -> 'Attr_RcsbEntitySourceOrganism':
+        """"""
+    @property
+    def rcsb_genomic_lineage(self) -> 'Attr_RcsbGenomicLineage':
+        """"""
+    @property
+    def rcsb_membrane_lineage(self) -> 'Attr_RcsbMembraneLineage':
+        """"""
+    @property
+    def rcsb_polymer_entity(self) -> 'Attr_RcsbPolymerEntity':
+        """"""
+    @property
+    def rcsb_polymer_entity_align(self) -> 'Attr_RcsbPolymerEntityAlign':
+        """"""
+    @property
+    def rcsb_polymer_entity_annotation(self) -> 'Attr_RcsbPolymerEntityAnnotation':
+        """"""
+    @property
+    def rcsb_polymer_entity_container_identifiers(self) -> 'Attr_RcsbPolymerEntityContainerIdentifiers':
+        """"""
+    @property
+    def rcsb_polymer_entity_feature(self) -> 'Attr_RcsbPolymerEntityFeature':
+        """"""
+    @property
+    def rcsb_polymer_entity_feature_summary(self) -> 'Attr_RcsbPolymerEntityFeatureSummary':
+        """"""
+    @property
+    def rcsb_polymer_entity_group_membership(self) -> 'Attr_RcsbPolymerEntityGroupMembership':
+        """"""
+    @property
+    def rcsb_polymer_entity_keywords(self) -> 'Attr_RcsbPolymerEntityKeywords':
+        """"""
+    @property
+    def rcsb_polymer_entity_name_com(self) -> 'Attr_RcsbPolymerEntityNameCom':
+        """"""
+    @property
+    def rcsb_polymer_entity_name_sys(self) -> 'Attr_RcsbPolymerEntityNameSys':
+        """"""
+    @property
+    def rcsb_related_target_references(self) -> 'Attr_RcsbRelatedTargetReferences':
+        """"""
+    @property
+    def rcsb_target_cofactors(self) -> 'Attr_RcsbTargetCofactors':
+        """"""
+    @property
+    def rcsb_membrane_lineage_provenance_code(self) -> 'Attribute':
+        """Mpstruc keyword denotes original annotation, Homology keyword denotes annotation inferred by homology."""
+    @property
+    def drugbank_container_identifiers(self) -> 'Attr_DrugbankContainerIdentifiers':
+        """"""
+    @property
+    def drugbank_info(self) -> 'Attr_DrugbankInfo':
+        """"""
+    @property
+    def drugbank_target(self) -> 'Attr_DrugbankTarget':
+        """"""
+
+attrs: AttributesRoot
@@ -0,0 +1,80 @@
+import json
+import re
+import threading
+
+import pytest
+
+from rcsb import set_size_history
+
+
+class FakeResponse:
+    """Stand-in for `requests.Response` serving a fixed JSON payload."""
+    def __init__(self, payload, status_code: int = 200, headers: dict = None, chunk_size: int = 7, fail_after: int = None):
+        self.content = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.chunk_size = chunk_size
+        self.fail_after = fail_after # raise after this many body bytes when streamed
+        self.closed = False
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size=None):
+        for i in range(0, len(self.content), self.chunk_size):
+            if self.fail_after is not None and i >= self.fail_after:
+                import requests
+                raise requests.exceptions.ChunkedEncodingError("connection broken mid-body")
+            yield self.content[i:i + self.chunk_size]
+
+    def close(self):
+        self.closed = True
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            import requests
+            raise requests.HTTPError(str(self.status_code), response=self)
+
+
+class FakeSession:
+    """Answers `entries(entry_ids: $ids)` queries with one entry per ID.
+
+    IDs starting with "X" get a null entry. `respond(ids, call)` may return a
+    payload or `FakeResponse` to override the default answer for a call.
+    """
+    def __init__(self, respond=None):
+        self.respond = respond
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def close(self):
+        pass
+
+    def post(self, url, data=None, headers=None, timeout=None, stream=False):
+        body = json.loads(data)
+        with self.lock:
+            self.calls.append(body)
+            call = len(self.calls)
+        ids = body["variables"].get("ids", [])
+        if self.respond is not None:
+            response = self.respond(ids, call)
+            if response is not None:
+                return response if isinstance(response, FakeResponse) else FakeResponse(response)
+        root = re.search(r"\{\s*(\w+)\(", body["query"]).group(1)
+        fields = [f for f in re.findall(r"^\s+(\w+)$", body["query"], re.M) if f != "rcsb_id"]
+        entries = [
+            None if str(i).startswith("X") else {"rcsb_id": str(i).upper(), **{f: f"{f}-{i}" for f in fields}}
+            for i in ids
+        ]
+        return FakeResponse({"data": {root: entries}})
+
+
+@pytest.fixture(autouse=True)
+def no_size_history():
+    # Keep sizes observed by one test from steering the batch sizes of the next.
+    set_size_history(None)
+    yield
+    set_size_history(None)
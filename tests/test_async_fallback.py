@@ -0,0 +1,49 @@
+import asyncio
+import sys
+
+import pytest
+import requests
+
+from rcsb import AsyncClient, RetryPolicy
+from rcsb.data import QueryBuilder
+
+from conftest import FakeResponse, FakeSession
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """Hide httpx, so `AsyncClient` falls back to a `Client` run in worker threads,
+    and serve that client's requests from a `FakeSession`."""
+    monkeypatch.setitem(sys.modules, "httpx", None)
+    fake = FakeSession()
+    monkeypatch.setattr(requests, "Session", lambda: fake)
+    return fake
+
+
+def entries_query():
+    return QueryBuilder().entries(entry_ids="$ids").rcsb_id.end
+
+
+def test_process_async_without_httpx(session):
+    async def main():
+        async with AsyncClient(max_concurrency=4) as client:
+            assert client._sync_client is not None
+            return await entries_query().process_async(["1abc", "X001", "2def"], lambda e: e and e["rcsb_id"], batch_size=2, client=client, on_missing=lambda ids: None)
+
+    assert asyncio.run(main()) == ["1ABC", None, "2DEF"]
+    assert len(session.calls) == 2
+
+
+def test_fallback_retries_transient_errors(session):
+    def flaky(ids, call):
+        if call == 1:
+            return FakeResponse({}, status_code=502)
+
+    session.respond = flaky
+
+    async def main():
+        async with AsyncClient(retry=RetryPolicy(max_attempts=2, backoff=0)) as client:
+            return await entries_query().submit_async(client=client, ids=["1abc"])
+
+    assert asyncio.run(main()) == {"entries": [{"rcsb_id": "1ABC"}]}
+    assert len(session.calls) == 2
@@ -0,0 +1,61 @@
+import pytest
+
+from rcsb import AdaptiveBatchSize
+from rcsb._batching import FixedBatchSize, make_batch_sizer
+
+
+def test_growth_is_capped_at_twice_the_size():
+    sizer = AdaptiveBatchSize(target_latency=10, initial=50, max_bytes=None)
+    sizer.record(50, seconds=0.1) # would allow 5000
+    assert sizer.next_size() == 100
+    sizer.record(100, seconds=0.1)
+    assert sizer.next_size() == 200
+
+
+def test_shrinks_toward_the_target_latency():
+    sizer = AdaptiveBatchSize(target_latency=1, initial=100, max_bytes=None, smoothing=1)
+    sizer.record(100, seconds=4) # 0.04 s per input
+    assert sizer.next_size() == 25
+
+
+def test_error_halves_the_size():
+    sizer = AdaptiveBatchSize(initial=64)
+    sizer.record(64, error=True)
+    assert sizer.next_size() == 32
+    sizer.record(10, error=True) # halves the failed batch if it was smaller
+    assert sizer.next_size() == 5
+
+
+def test_error_rate_keeps_the_size_down():
+    sizer = AdaptiveBatchSize(target_latency=1, initial=100, max_bytes=None, smoothing=0.5)
+    sizer.record(100, error=True)
+    sizer.record(50, seconds=0.5) # ideal 100, error rate 0.25
+    assert sizer.next_size() == 75
+
+
+def test_max_bytes_bounds_the_size():
+    sizer = AdaptiveBatchSize(target_latency=10, initial=100, max_bytes=1_000_000, smoothing=1)
+    sizer.record(100, seconds=0.1, nbytes=5_000_000) # 50 KB per input
+    assert sizer.next_size() == 20
+
+
+def test_min_and_max_size():
+    sizer = AdaptiveBatchSize(initial=4, min_size=2, max_size=6, max_bytes=None)
+    for _ in range(3):
+        sizer.record(4, error=True)
+    assert sizer.next_size() == 2
+    for _ in range(10):
+        sizer.record(2, seconds=0.001)
+    assert sizer.next_size() == 6
+    with pytest.raises(ValueError):
+        AdaptiveBatchSize(min_size=0)
+
+
+def test_make_batch_sizer():
+    assert make_batch_sizer(None, 10).next_size() == 10
+    assert make_batch_sizer(None, 1000).next_size() == 200
+    assert make_batch_sizer(None, 1000, bytes_per_input=1_000_000).next_size() == 50
+    assert isinstance(make_batch_sizer(30, 1000), FixedBatchSize)
+    assert isinstance(make_batch_sizer("auto", 1000), AdaptiveBatchSize)
+    with pytest.raises(ValueError):
+        make_batch_sizer(0, 10)
@@ -0,0 +1,84 @@
+import pytest
+
+from rcsb import Client, ResponseCache
+from rcsb import _cache
+from rcsb.data import QueryBuilder
+
+from conftest import FakeSession
+
+
+class Clock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(_cache, "time", clock)
+    return clock
+
+
+def test_entries_expire_after_ttl(tmp_path, clock):
+    cache = ResponseCache(tmp_path / "c.sqlite", ttl=60)
+    cache.set("k", b"body")
+    clock.now += 59
+    assert cache.get("k") == b"body"
+    assert cache.get_many(["k"]) == {"k": b"body"}
+    clock.now += 2
+    assert cache.get("k") is None
+    assert len(cache) == 0 # expired rows are deleted on read
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, clock):
+    cache = ResponseCache(tmp_path / "c.sqlite", max_bytes=30)
+    for key in "abc":
+        cache.set(key, b"x" * 10)
+        clock.now += 1
+    assert cache.get("a") is not None # a is now more recent than b
+    clock.now += 1
+    cache.set("d", b"x" * 10)
+    assert "b" not in cache
+    assert all(key in cache for key in "acd")
+
+
+def test_oversized_bodies_are_not_stored(tmp_path):
+    cache = ResponseCache(tmp_path / "c.sqlite", max_bytes=4)
+    cache.set("k", b"too large")
+    assert len(cache) == 0
+
+
+def test_missing_ids_expire_and_are_purged(tmp_path, clock):
+    cache = ResponseCache(tmp_path / "c.sqlite", missing_ttl=60)
+    cache.add_missing(["old"])
+    assert cache.get_missing(["old", "other"]) == {"old"}
+    clock.now += 61
+    assert cache.get_missing(["old"]) == set()
+    cache.add_missing(["new"])
+    keys = {key for (key,) in cache._conn.execute("SELECT key FROM missing")}
+    assert keys == {"new"}
+
+
+def test_missing_ids_expire_at_the_next_release(tmp_path, clock):
+    clock.now = 1_700_000_000.0 # Tuesday 2023-11-14 22:13 UTC
+    cache = ResponseCache(tmp_path / "c.sqlite")
+    cache.add_missing(["k"])
+    clock.now = 1_700_006_399.0 # Tuesday 23:59:59
+    assert cache.get_missing(["k"]) == {"k"}
+    clock.now = 1_700_006_400.0 # Wednesday 00:00, release
+    assert cache.get_missing(["k"]) == set()
+
+
+def test_execute_and_submit_hit_the_cache(tmp_path):
+    session = FakeSession()
+    client = Client(session=session, cache=ResponseCache(tmp_path / "c.sqlite"))
+    query = QueryBuilder().entries(entry_ids="$ids").rcsb_id.end
+    first = query.submit(client=client, ids=["1abc"])
+    assert query.submit(client=client, ids=["1abc"]) == first
+    assert query.execute(query.render(), client=client, ids=["1abc"]) == first
+    assert len(session.calls) == 1
+    query.submit(client=client, ids=["2def"])
+    assert len(session.calls) == 2
@@ -0,0 +1,83 @@
+from rcsb import Client, ResponseCache
+from rcsb.data import QueryBuilder
+
+from conftest import FakeSession
+
+
+def entries_query():
+    return QueryBuilder().entries(entry_ids="$ids").struct.title.end.end
+
+
+def titles(entry):
+    return None if entry is None else entry["struct"]["title"]
+
+
+def errored_once(ids, call):
+    # First call: GraphQL errors with the errored field nulled out.
+    if call == 1:
+        return {
+            "errors": [{"message": "resolver failed", "path": ["entries", 0, "struct"]}],
+            "data": {"entries": [{"rcsb_id": i.upper(), "struct": None} for i in ids]},
+        }
+    return {"data": {"entries": [{"rcsb_id": i.upper(), "struct": {"title": f"title-{i}"}} for i in ids]}}
+
+
+def test_entries_from_errored_responses_are_not_cached(tmp_path):
+    session = FakeSession(errored_once)
+    client = Client(session=session, cache=ResponseCache(tmp_path / "c.sqlite"))
+    ids = ["1abc", "2def"]
+
+    with_errors = entries_query().process(ids, lambda e: e, client=client)
+    assert [e["struct"] for e in with_errors] == [None, None]
+
+    assert entries_query().process(ids, titles, client=client) == ["title-1abc", "title-2def"]
+    assert len(session.calls) == 2
+
+    assert entries_query().process(ids, titles, client=client) == ["title-1abc", "title-2def"]
+    assert len(session.calls) == 2 # now served from the entity cache
+
+
+def test_errored_delta_fields_stay_missing(tmp_path):
+    cache = ResponseCache(tmp_path / "c.sqlite")
+    narrow = QueryBuilder().entries(entry_ids="$ids").struct.title.end.end
+    wide = QueryBuilder().entries(entry_ids="$ids").struct.title.end.exptl.method.end.end
+
+    def respond(ids, call):
+        entries = [{"rcsb_id": i.upper(), "struct": {"title": f"title-{i}"}} for i in ids]
+        if call == 2: # the delta query for `exptl` fails
+            return {"errors": [{"message": "boom"}], "data": {"entries": [{"rcsb_id": i.upper(), "exptl": None} for i in ids]}}
+        if call == 3:
+            return {"data": {"entries": [{"rcsb_id": i.upper(), "exptl": [{"method": "X-RAY"}]} for i in ids]}}
+        return {"data": {"entries": entries}}
+
+    session = FakeSession(respond)
+    client = Client(session=session, cache=cache)
+    narrow.process(["1abc"], titles, client=client)
+    assert wide.process(["1abc"], lambda e: e["exptl"], client=client) == [None]
+    assert wide.process(["1abc"], lambda e: e["exptl"], client=client) == [[{"method": "X-RAY"}]]
+    assert len(session.calls) == 3 # the failed delta was fetched again
+    assert wide.process(["1abc"], lambda e: e["exptl"], client=client) == [[{"method": "X-RAY"}]]
+    assert len(session.calls) == 3
+
+
+def test_errored_responses_do_not_mark_ids_missing(tmp_path):
+    def respond(ids, call):
+        if call == 1:
+            return {"errors": [{"message": "timeout"}], "data": {"entries": [None for _ in ids]}}
+        return {"data": {"entries": [{"rcsb_id": i.upper(), "struct": {"title": f"title-{i}"}} for i in ids]}}
+
+    session = FakeSession(respond)
+    client = Client(session=session, cache=ResponseCache(tmp_path / "c.sqlite"))
+    missing = []
+    assert entries_query().process(["1abc"], titles, client=client, on_missing=missing.extend) == [None]
+    assert missing == ["1abc"]
+    assert entries_query().process(["1abc"], titles, client=client) == ["title-1abc"]
+    assert len(session.calls) == 2
+
+
+def test_null_entries_without_errors_are_remembered_as_missing(tmp_path):
+    session = FakeSession()
+    client = Client(session=session, cache=ResponseCache(tmp_path / "c.sqlite"))
+    for _ in range(2):
+        entries_query().process(["X001"], titles, client=client, on_missing=lambda ids: None)
+    assert len(session.calls) == 1
@@ -0,0 +1,75 @@
+import threading
+
+from rcsb import Client
+
+from conftest import FakeResponse
+
+
+class BlockingSession:
+    """Session whose `post` waits until released, to hold a request in flight."""
+    def __init__(self):
+        self.mounted = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def mount(self, prefix, adapter):
+        self.mounted.append(adapter)
+
+    def post(self, url, data=None, headers=None, timeout=None, stream=False):
+        self.entered.set()
+        self.release.wait(5)
+        return FakeResponse({"data": {}})
+
+    def close(self):
+        pass
+
+
+def owned_client(session):
+    # A client that manages adapters on `session` as it would on its own session.
+    client = Client(coalesce=False)
+    client.session = session
+    return client
+
+
+def test_pool_grows_immediately_when_idle():
+    session = BlockingSession()
+    client = owned_client(session)
+    client.ensure_pool_size(32)
+    assert client.pool_size == 32
+    assert len(session.mounted) == 2 # http:// and https://
+
+
+def test_pool_is_not_swapped_under_in_flight_requests():
+    session = BlockingSession()
+    client = owned_client(session)
+    worker = threading.Thread(target=client.post, args=("query { x }",))
+    worker.start()
+    session.entered.wait(5)
+
+    client.ensure_pool_size(32)
+    assert client.pool_size == 10
+    assert session.mounted == []
+
+    session.release.set()
+    worker.join(5)
+    session.entered.clear()
+    client.post("query { y }") # first request once idle mounts the larger pool
+    assert client.pool_size == 32
+    assert len(session.mounted) == 2
+
+
+def test_default_timeout_is_finite():
+    session = BlockingSession()
+    session.release.set()
+    seen = {}
+    post = session.post
+
+    def recording_post(url, timeout=None, **kwargs):
+        seen["timeout"] = timeout
+        return post(url, timeout=timeout, **kwargs)
+
+    session.post = recording_post
+    client = Client(session=session)
+    client.post("query { x }")
+    connect, read = seen["timeout"]
+    assert 0 < connect < float("inf") and 0 < read < float("inf")
@@ -0,0 +1,86 @@
+import json
+import random
+
+import pytest
+
+from rcsb._json import ArrayScanner, JSONDecoder
+
+
+def scan(text: str, path=("data", "entries"), sizes=None, seed=0):
+    """Feed `text` to an `ArrayScanner` in random chunks and collect the elements."""
+    body = text.encode()
+    rng = random.Random(seed)
+    scanner = ArrayScanner(path)
+    elements = []
+    pos = 0
+    while pos < len(body):
+        size = rng.choice(sizes or [1, 2, 3, 5, 8, 64])
+        elements.extend(scanner.feed(body[pos:pos + size]))
+        pos += size
+    elements.extend(scanner.close())
+    return elements
+
+
+ENTRIES = [
+    {"rcsb_id": "1ABC", "title": "brackets ] [ } { and \"quotes\" \\ inside", "n": [1, 2.5, -3e2]},
+    None,
+    {"rcsb_id": "2DEF", "title": "unicode é中 ☃", "entries": [{"data": 1}]},
+    12345,
+    "a string, with a comma",
+]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_chunk_splits(seed):
+    text = json.dumps({"data": {"entries": ENTRIES}})
+    assert scan(text, seed=seed) == ENTRIES
+
+
+def test_ignores_arrays_outside_the_path():
+    text = json.dumps({
+        "extensions": {"entries": [0], "data": {"entries": [1]}},
+        "data": {"other": [["entries"]], "entries": [{"entries": [2]}, 3]},
+        "trailing": [4],
+    })
+    assert scan(text) == [{"entries": [2]}, 3]
+
+
+def test_keys_that_look_like_structure():
+    text = '{"a": "{\\"data\\": [", "data": {"x": "]", "entries": [1, 2]}}'
+    assert scan(text) == [1, 2]
+
+
+def test_numbers_split_across_chunks():
+    text = '{"data": {"entries": [1234567, -2.5e10, 0.125]}}'
+    assert scan(text, sizes=[1]) == [1234567, -2.5e10, 0.125]
+
+
+def test_document_without_the_array():
+    assert scan('{"errors": [{"message": "boom"}], "data": null}') == []
+
+
+def test_errors_before_data():
+    text = '{"errors": [{"message": "partial"}], "data": {"entries": [null, 1]}}'
+    assert scan(text) == [None, 1]
+
+
+def test_truncated_document_raises():
+    text = json.dumps({"data": {"entries": ENTRIES}})
+    with pytest.raises(ValueError):
+        scan(text[:-10])
+
+
+def test_stops_reading_after_the_array():
+    scanner = ArrayScanner(["data", "entries"])
+    assert scanner.feed(b'{"data": {"entries": [1]') == [1]
+    assert scanner.feed(b'], "more": ') == []
+    assert scanner.done
+    assert scanner.feed(b'not even json') == []
+
+
+def test_iter_array_counts_bytes():
+    decoder = JSONDecoder("json")
+    body = json.dumps({"data": {"entries": ENTRIES}}).encode()
+    chunks = [body[i:i + 16] for i in range(0, len(body), 16)]
+    assert list(decoder.iter_array(iter(chunks), ("data", "entries"))) == ENTRIES
+    assert decoder.calls == 1 and decoder.bytes == len(body)
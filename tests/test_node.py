@@ -0,0 +1,97 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from rcsb.data import QueryBuilder
+
+
+def entries_query():
+    return QueryBuilder().entries(entry_ids="$ids").rcsb_id.struct.title.end.end
+
+
+@pytest.mark.parametrize("clone", [lambda q: pickle.loads(pickle.dumps(q)), copy.deepcopy])
+def test_query_trees_pickle_and_copy(clone):
+    query = entries_query()
+    rendered = query.render()
+    cloned = clone(query)
+    assert cloned.render() == rendered
+    assert cloned.compile() == query.compile()
+    leaf = cloned._children[0]._children[0]
+    assert leaf._name == "rcsb_id" and not leaf._arguments
+
+
+def test_copies_are_independent():
+    query = entries_query()
+    rendered = query.render()
+    cloned = copy.deepcopy(query)
+    cloned._children[0].exptl.method
+    assert query.render() == rendered
+    assert cloned.render() != rendered
+
+
+def test_render_is_cached_until_the_tree_changes():
+    query = entries_query()
+    rendered = query.render()
+    assert query.render() is rendered
+    assert query.compile() is query.compile()
+
+
+def test_new_field_invalidates_render_and_compile():
+    query = entries_query()
+    rendered, compiled = query.render(), query.compile()
+    query._children[0].exptl.method
+    assert query.render() != rendered and "method" in query.render()
+    assert query.compile() != compiled and "method" in query.compile().query
+
+
+def test_existing_field_does_not_invalidate():
+    query = entries_query()
+    rendered = query.render()
+    query._children[0].rcsb_id
+    assert query.render() is rendered
+
+
+def test_changed_arguments_invalidate_render_and_compile():
+    query = QueryBuilder().entry(entry_id="4HHB").rcsb_id.end
+    rendered, compiled = query.render(), query.compile()
+    query.entry(entry_id="1ABC")
+    assert '"1ABC"' in query.render() and query.render() != rendered
+    assert query.compile().query == query.render() != compiled.query
+
+
+def test_render_name_is_part_of_the_cache_key():
+    query = entries_query()
+    assert query.render("a").startswith("query a") and query.render("b").startswith("query b")
+
+
+def test_compiled_query_is_immutable():
+    compiled = entries_query().compile()
+    with pytest.raises(AttributeError):
+        compiled.query = "query { }"
+    with pytest.raises(AttributeError):
+        del compiled.variables
+    with pytest.raises(AttributeError):
+        compiled.extra = 1
+
+
+def test_compiled_query_pickles():
+    compiled = entries_query().compile()
+    restored = pickle.loads(pickle.dumps(compiled))
+    assert restored == compiled and hash(restored) == hash(compiled)
+    assert restored.body({"ids": ["1ABC"]}) == compiled.body({"ids": ["1ABC"]})
+    assert restored.selection == compiled.selection
+
+
+def test_compiled_query_body_is_the_json_request():
+    compiled = entries_query().compile()
+    for variables in ({"ids": ["1ABC", "2DEF"]}, {}, None):
+        assert compiled.body(variables) == json.dumps({"query": compiled.query, "variables": variables or {}}).encode()
+
+
+def test_compiled_query_fields():
+    compiled = entries_query().compile()
+    assert compiled.result_key == "entries" and compiled.batch_var == "ids"
+    assert compiled.variables == {"ids": "[String!]!"}
+    assert compiled.selection == {"rcsb_id": [None, None], "struct": [None, {"title": [None, None]}]}
@@ -0,0 +1,137 @@
+from rcsb import Client, RetryPolicy
+from rcsb.data import QueryBuilder
+
+from conftest import FakeResponse, FakeSession
+
+
+def entries_query():
+    return QueryBuilder().entries(entry_ids="$ids").rcsb_id.struct.title.end.end
+
+
+def parse(entry, pdb_id=None):
+    return None if entry is None else (entry["rcsb_id"], pdb_id)
+
+
+INPUTS = ["1abc", "X001", "2def", "3ghi"] # IDs starting with X come back null
+
+
+def test_missing_inputs_keep_their_position():
+    client = Client(session=FakeSession())
+    missing = []
+    results = entries_query().process(
+        INPUTS, parse, batch_size=2, client=client,
+        iter_kwargs={"pdb_id": INPUTS}, on_missing=missing.extend,
+    )
+    assert results == [("1ABC", "1abc"), None, ("2DEF", "2def"), ("3GHI", "3ghi")]
+    assert missing == ["X001"]
+
+
+def test_keep_missing_false_drops_them():
+    client = Client(session=FakeSession())
+    results = entries_query().process(
+        INPUTS, parse, batch_size=2, client=client, iter_kwargs={"pdb_id": INPUTS},
+        on_missing=lambda ids: None, keep_missing=False,
+    )
+    assert results == [("1ABC", "1abc"), ("2DEF", "2def"), ("3GHI", "3ghi")]
+
+
+def test_entries_are_matched_on_rcsb_id_not_position():
+    def shuffled(ids, call):
+        return {"data": {"entries": [{"rcsb_id": i.upper(), "struct": {"title": i}} for i in reversed(ids)]}}
+
+    client = Client(session=FakeSession(shuffled))
+    results = entries_query().process(["1abc", "2def"], parse, client=client, iter_kwargs={"pdb_id": ["1abc", "2def"]})
+    assert results == [("1ABC", "1abc"), ("2DEF", "2def")]
+
+
+def title_query():
+    return QueryBuilder().entries(entry_ids="$ids").struct.title.end.end
+
+
+def reversed_titles(ids, call):
+    return {"data": {"entries": [{"rcsb_id": i.upper(), "struct": {"title": i}} for i in reversed(ids)]}}
+
+
+def test_rcsb_id_is_requested_without_changing_the_query():
+    query = title_query()
+    rendered, version = query.render(), query._version
+    session = FakeSession(reversed_titles)
+    results = query.process(["1abc", "2def"], lambda entry: entry, client=Client(session=session))
+    assert results == [{"struct": {"title": "1abc"}}, {"struct": {"title": "2def"}}]
+    assert "rcsb_id" in session.calls[0]["query"]
+    assert query.render() == rendered and query._version == version
+
+
+def test_rcsb_id_is_stripped_from_streamed_entries():
+    session = FakeSession(reversed_titles)
+    results = title_query().process(["1abc", "2def"], lambda entry: entry, client=Client(session=session), stream=True)
+    assert results == [{"struct": {"title": "1abc"}}, {"struct": {"title": "2def"}}]
+
+
+def test_size_history_stays_in_memory_by_default(tmp_path, monkeypatch):
+    from rcsb import _estimate
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(_estimate, "_history_disabled", False)
+    client = Client(session=FakeSession())
+    entries_query().process(INPUTS, parse, client=client, on_missing=lambda ids: None)
+    history = _estimate.get_size_history()
+    assert history.path is None and history._sizes
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_size_history_saves_to_a_given_path(tmp_path):
+    from rcsb import SizeHistory, set_size_history
+    path = tmp_path / "sizes.json"
+    set_size_history(SizeHistory(path))
+    client = Client(session=FakeSession())
+    entries_query().process(INPUTS, parse, client=client, on_missing=lambda ids: None)
+    assert SizeHistory(path)._sizes
+
+
+def failing(status, bad=None):
+    """`FakeSession` responder failing batches containing `bad` (every batch if `None`)."""
+    def respond(ids, call):
+        if bad is None or bad in ids:
+            return FakeResponse({"errors": [{"message": "boom"}]}, status_code=status)
+    return respond
+
+
+def run_failing(respond, n_inputs=200, batch_size=200):
+    inputs = [f"{i}id" for i in range(n_inputs)]
+    session = FakeSession(respond)
+    failed = []
+    client = Client(session=session, retry=RetryPolicy(max_attempts=4, backoff=0))
+    results = entries_query().process(
+        inputs, parse, batch_size=batch_size, client=client,
+        on_error=lambda ids, e: failed.append((ids, e.response.status_code)),
+    )
+    return results, failed, len(session.calls)
+
+
+def test_failed_batches_are_bisected_to_the_bad_input():
+    results, failed, _ = run_failing(failing(500, bad="5id"), n_inputs=16, batch_size=16)
+    assert failed == [(["5id"], 500)]
+    assert len(results) == 15
+
+
+def test_overloaded_server_is_not_bisected():
+    for status in (429, 503):
+        results, failed, calls = run_failing(failing(status))
+        assert calls == 4 # the retries of the one batch
+        assert results == [] and len(failed) == 1 and len(failed[0][0]) == 200
+
+
+def test_bisection_stops_when_both_halves_fail_alike():
+    results, failed, calls = run_failing(failing(500))
+    assert calls == 4 + 2 * 4 # the batch, then each half once with its retries
+    assert failed == [([f"{i}id" for i in range(200)], 500)]
+
+
+def test_cpu_workers_match_the_in_thread_results():
+    inputs = [f"{i}id" for i in range(40)] + ["X001"]
+    kwargs = dict(batch_size=7, iter_kwargs={"pdb_id": inputs}, on_missing=lambda ids: None)
+    in_threads = entries_query().process(inputs, parse, client=Client(session=FakeSession()), **kwargs)
+    in_processes = entries_query().process(inputs, parse, client=Client(session=FakeSession()), cpu_workers=2, **kwargs)
+    assert in_processes == in_threads
+    assert in_threads[-1] is None and in_threads[0] == ("0ID", "0id")
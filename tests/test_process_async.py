@@ -0,0 +1,78 @@
+import asyncio
+import json
+
+import pytest
+
+from rcsb import AsyncClient, RetryPolicy
+from rcsb.data import QueryBuilder
+
+httpx = pytest.importorskip("httpx") # the `async` extra
+
+
+def entries_query():
+    return QueryBuilder().entries(entry_ids="$ids").rcsb_id.end
+
+
+def mock_client(calls: list):
+    def handler(request):
+        ids = json.loads(request.content)["variables"]["ids"]
+        calls.append(ids)
+        if "BAD" in ids:
+            return httpx.Response(500, json={"errors": [{"message": "boom"}]})
+        return httpx.Response(200, json={"data": {"entries": [{"rcsb_id": i} for i in ids]}})
+
+    session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncClient(session=session, retry=RetryPolicy(max_attempts=1))
+
+
+def test_failed_batches_are_bisected_and_reported():
+    calls = []
+    failed = []
+    inputs = ["A", "B", "C", "BAD", "D", "E", "F", "G"]
+
+    async def main():
+        async with mock_client(calls) as client:
+            return await entries_query().process_async(
+                inputs, lambda e: e["rcsb_id"], batch_size=8, client=client,
+                on_error=lambda ids, e: failed.append(ids),
+            )
+
+    results = asyncio.run(main())
+    assert results == ["A", "B", "C", "D", "E", "F", "G"]
+    assert failed == [["BAD"]]
+
+
+def test_errors_go_to_on_error_not_stdout(capsys):
+    calls = []
+    failed = []
+
+    async def main():
+        async with mock_client(calls) as client:
+            return await entries_query().process_async(
+                ["BAD"], lambda e: e, client=client, on_error=lambda ids, e: failed.append((ids, e)),
+            )
+
+    assert asyncio.run(main()) == []
+    assert failed[0][0] == ["BAD"]
+    assert capsys.readouterr().out == ""
+
+
+def test_overload_is_not_bisected_and_alike_halves_stop():
+    for status, expected_calls in ((503, 1), (500, 3)):
+        calls = []
+
+        def handler(request):
+            calls.append(json.loads(request.content)["variables"]["ids"])
+            return httpx.Response(status, json={"errors": [{"message": "down"}]})
+
+        async def main():
+            session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncClient(session=session, retry=RetryPolicy(max_attempts=1)) as client:
+                return await entries_query().process_async(
+                    [f"{i}ID" for i in range(64)], lambda e: e, batch_size=64, client=client,
+                    on_error=lambda ids, e: failed.append(len(ids)),
+                )
+
+        failed = []
+        assert asyncio.run(main()) == []
+        assert len(calls) == expected_calls and failed == [64]
@@ -0,0 +1,70 @@
+import threading
+
+import pytest
+
+from rcsb import Client
+from rcsb.data import QueryBuilder
+
+from conftest import FakeSession
+
+INPUTS = [f"{i}id" for i in range(12)]
+
+
+def entries_query():
+    return QueryBuilder().entries(entry_ids="$ids").rcsb_id.end
+
+
+def rcsb_id(entry):
+    return entry["rcsb_id"]
+
+
+def test_max_in_flight_must_be_positive():
+    with pytest.raises(ValueError, match="max_in_flight"):
+        next(entries_query().process_iter(INPUTS, rcsb_id, client=Client(session=FakeSession()), max_in_flight=0))
+
+
+def test_reorder_buffer_counts_against_the_window():
+    sent_while_held = []
+
+    def hold_first(ids, call):
+        if ids == ["0id"]:
+            threading.Event().wait(0.3) # later batches finish meanwhile
+            sent_while_held.append(len(session.calls))
+
+    session = FakeSession(hold_first)
+    results = list(entries_query().process_iter(
+        INPUTS, rcsb_id, batch_size=1, max_workers=8, max_in_flight=3, client=Client(session=session),
+    ))
+    assert results == [i.upper() for i in INPUTS]
+    # Batches 1 and 2 finished and wait in the reorder buffer, which fills the window.
+    assert sent_while_held == [3]
+
+
+def test_unordered_results_come_in_completion_order():
+    release = threading.Event()
+
+    def hold_first(ids, call):
+        if ids == ["0id"]:
+            release.wait(5)
+
+    session = FakeSession(hold_first)
+    results = entries_query().process_iter(
+        INPUTS, rcsb_id, batch_size=1, max_workers=4, client=Client(session=session), ordered=False,
+    )
+    first = next(results)
+    release.set()
+    rest = list(results)
+    assert first != "0ID"
+    assert sorted([first, *rest]) == sorted(i.upper() for i in INPUTS)
+
+
+def test_closing_early_cancels_unstarted_batches():
+    session = FakeSession()
+    results = entries_query().process_iter(
+        INPUTS * 10, rcsb_id, batch_size=1, max_workers=2, max_in_flight=2, client=Client(session=session),
+    )
+    assert next(results) == "0ID"
+    results.close()
+    sent = len(session.calls)
+    assert sent <= 4
+    assert len(session.calls) == sent # nothing more is sent after close
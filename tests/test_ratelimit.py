@@ -0,0 +1,84 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from rcsb import RateLimiter
+
+
+def test_rate_is_held_after_the_burst():
+    limiter = RateLimiter(rate=20, burst=2)
+    started = time.monotonic()
+    for _ in range(2 + 6):
+        with limiter.limit():
+            pass
+    elapsed = time.monotonic() - started
+    assert 6 / 20 - 0.02 <= elapsed < 6 / 20 + 0.2
+
+
+def test_rate_is_shared_between_threads():
+    limiter = RateLimiter(rate=50, burst=1)
+    stamps = []
+
+    def worker():
+        for _ in range(5):
+            with limiter.limit():
+                stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stamps.sort()
+    assert stamps[-1] - stamps[0] >= 19 / 50 - 0.02
+
+
+def test_concurrency_cap():
+    limiter = RateLimiter(rate=1000, max_concurrent=2)
+    lock = threading.Lock()
+    active = peak = 0
+
+    def worker():
+        nonlocal active, peak
+        with limiter.limit():
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak == 2
+
+
+def test_async_limit():
+    limiter = RateLimiter(rate=20, burst=1, max_concurrent=1)
+    active = peak = 0
+
+    async def request():
+        nonlocal active, peak
+        async with limiter.limit_async():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async def main():
+        started = time.monotonic()
+        await asyncio.gather(*(request() for _ in range(5)))
+        return time.monotonic() - started
+
+    assert asyncio.run(main()) >= 4 / 20 - 0.02
+    assert peak == 1
+
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
@@ -0,0 +1,39 @@
+import ast
+from pathlib import Path
+
+import rcsb
+from rcsb.search import Attribute, AttributeGroup, attrs
+
+BASELINE = Path(__file__).parent / "data" / "search_attrs_baseline.txt"
+STUB = Path(rcsb.__file__).parent / "search.pyi"
+
+
+def walk(group, chain=""):
+    """Yield (Python attribute chain, `Attribute` path) for every leaf under `group`."""
+    for name in dir(group):
+        if name.startswith("_"):
+            continue
+        child = getattr(group, name)
+        if isinstance(child, (Attribute, AttributeGroup)):
+            here = f"{chain}.{name}" if chain else name
+            if isinstance(child, Attribute):
+                yield here, child.path
+            else:
+                yield from walk(child, here)
+
+
+def test_attribute_names_and_paths_match_the_baseline():
+    expected = dict(line.split() for line in BASELINE.read_text().splitlines())
+    assert dict(walk(attrs)) == expected
+
+
+def test_identifier_fixes():
+    assert attrs.pdbx_reference_molecule.class_.path == "pdbx_reference_molecule.class"
+    assert attrs.pdbx_molecule_features.class_.path == "pdbx_molecule_features.class"
+    assert attrs.em_3d_fitting_list.em_3d_fitting_id.path == "em_3d_fitting_list.3d_fitting_id"
+
+
+def test_stub_is_valid_python():
+    tree = ast.parse(STUB.read_text())
+    names = {node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)}
+    assert "class_" in names and "em_3d_fitting_id" in names
@@ -0,0 +1,71 @@
+from rcsb._selection import merge_by_id, merge_selection, merge_values, missing_selection, project
+
+# Selections map field -> [arguments, children]; children is None for scalars.
+STRUCT = {"struct": [None, {"title": [None, None]}]}
+EXPTL = {"exptl": [None, {"method": [None, None]}]}
+
+
+def test_missing_selection_of_superset_is_empty():
+    have = {**STRUCT, **EXPTL, "rcsb_id": [None, None]}
+    assert missing_selection(have, STRUCT) == {}
+
+
+def test_missing_selection_lists_absent_fields_and_subfields():
+    have = {"struct": [None, {"title": [None, None]}]}
+    need = {"struct": [None, {"title": [None, None], "pdbx_descriptor": [None, None]}], **EXPTL}
+    assert missing_selection(have, need) == {
+        "struct": [None, {"pdbx_descriptor": [None, None]}],
+        **EXPTL,
+    }
+
+
+def test_missing_selection_treats_other_arguments_as_missing():
+    have = {"polymer_entity": [{"entity_id": "1"}, {"rcsb_id": [None, None]}]}
+    need = {"polymer_entity": [{"entity_id": "2"}, {"rcsb_id": [None, None]}]}
+    assert missing_selection(have, need) == need
+
+
+def test_missing_selection_scalar_versus_object():
+    assert missing_selection({"struct": [None, None]}, STRUCT) == STRUCT
+
+
+def test_merge_selection_unions_nested_fields():
+    a = {"struct": [None, {"title": [None, None]}]}
+    b = {"struct": [None, {"pdbx_descriptor": [None, None]}], **EXPTL}
+    merged = merge_selection(a, b)
+    assert merged == {"struct": [None, {"title": [None, None], "pdbx_descriptor": [None, None]}], **EXPTL}
+    assert missing_selection(merged, a) == {} and missing_selection(merged, b) == {}
+
+
+def test_merge_selection_prefers_second_arguments():
+    a = {"field": [{"x": 1}, {"a": [None, None]}]}
+    b = {"field": [{"x": 2}, {"b": [None, None]}]}
+    assert merge_selection(a, b) == b
+
+
+def test_project_keeps_only_selected_fields():
+    value = {"rcsb_id": "1ABC", "struct": {"title": "t", "extra": 1}, "exptl": [{"method": "m", "extra": 2}]}
+    assert project(value, {**STRUCT, **EXPTL}) == {"struct": {"title": "t"}, "exptl": [{"method": "m"}]}
+
+
+def test_project_skips_absent_and_keeps_nulls():
+    assert project({"struct": None}, {**STRUCT, **EXPTL}) == {"struct": None}
+
+
+def test_merge_values_deep_merges_dicts_and_lists_by_position():
+    a = {"rcsb_id": "1ABC", "exptl": [{"method": "m"}], "struct": {"title": "t"}}
+    b = {"exptl": [{"details": "d"}], "struct": {"pdbx_descriptor": "p"}}
+    assert merge_values(a, b) == {
+        "rcsb_id": "1ABC",
+        "exptl": [{"method": "m", "details": "d"}],
+        "struct": {"title": "t", "pdbx_descriptor": "p"},
+    }
+
+
+def test_merge_by_id_matches_on_rcsb_id():
+    first = [{"rcsb_id": "1ABC", "a": 1}, None, {"rcsb_id": "2DEF", "a": 2}]
+    second = [{"rcsb_id": "2DEF", "b": 2}, {"rcsb_id": "1ABC", "b": 1}]
+    assert merge_by_id([first, second]) == [
+        {"rcsb_id": "1ABC", "a": 1, "b": 1},
+        {"rcsb_id": "2DEF", "a": 2, "b": 2},
+    ]
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from rcsb._singleflight import AsyncSingleFlight
+
+
+def test_followers_share_one_call():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def main():
+        return await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["result"] * 5
+    assert calls == [1]
+
+
+def test_cancelling_the_leader_does_not_cancel_followers():
+    flight = AsyncSingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        leader = asyncio.create_task(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("k", fetch))
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(leader, 0.01)
+        return await follower
+
+    assert asyncio.run(main()) == "result"
+
+
+def test_call_is_cancelled_once_every_caller_is():
+    flight = AsyncSingleFlight()
+    finished = []
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        finished.append(1)
+
+    async def main():
+        callers = [asyncio.create_task(flight.do("k", fetch)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.sleep(0.1)
+        return flight._calls
+
+    assert asyncio.run(main()) == {}
+    assert finished == []
+
+
+def test_errors_reach_every_caller():
+    flight = AsyncSingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(*(flight.do("k", fetch) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, ValueError) for r in results)
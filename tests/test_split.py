@@ -0,0 +1,91 @@
+import json
+import re
+
+from rcsb import Client, SizeHistory, set_size_history
+from rcsb._estimate import QueryEstimate, split_selection
+from rcsb.data import QueryBuilder
+
+from conftest import FakeResponse, FakeSession
+
+VALUES = {
+    "struct": lambda i: {"title": f"title {i}"},
+    "exptl": lambda i: [{"method": "X-RAY DIFFRACTION"}],
+    "rcsb_entry_info": lambda i: {"resolution_combined": [2.0]},
+}
+
+
+class SelectionSession(FakeSession):
+    """Answers `entries` queries with only the top-level fields each query selects."""
+    def post(self, url, data=None, headers=None, timeout=None, stream=False):
+        body = json.loads(data)
+        with self.lock:
+            self.calls.append(body)
+        fields = re.findall(r"^    (\w+)", body["query"], re.M)
+        entries = [
+            {name: VALUES[name](i) if name in VALUES else i.upper() for name in fields}
+            for i in body["variables"]["ids"]
+        ]
+        return FakeResponse({"data": {"entries": entries}})
+
+
+def heavy_query():
+    query = QueryBuilder().entries(entry_ids="$ids")
+    query.struct.title.end.exptl.method.end.rcsb_entry_info.resolution_combined
+    return query.end
+
+
+def seeded_history(query) -> SizeHistory:
+    # Observed sizes that make 2 IDs of struct + exptl exceed 50 MB.
+    history = SizeHistory()
+    selection = query.compile().selection
+    for name, size in (("struct", 20e6), ("exptl", 20e6), ("rcsb_entry_info", 40)):
+        history._update(SizeHistory.field_key("entries", name, selection[name]), size)
+    return history
+
+
+def estimate(fields: dict) -> QueryEstimate:
+    return QueryEstimate(1, 32 + sum(fields.values()), fields, "schema", 1)
+
+
+def test_split_selection_packs_disjoint_parts():
+    selection = {name: [None, {}] for name in ("rcsb_id", "a", "b", "c", "d")}
+    parts = split_selection(selection, estimate({"a": 30, "b": 60, "c": 10, "d": 50}), min_batch=1, max_bytes=130)
+    names = [set(part) for _, part in parts]
+    assert names == [{"a", "b"}, {"c", "d"}] # packed largest first, returned in selection order
+    assert all(nbytes <= 130 for nbytes, _ in parts)
+
+
+def test_split_selection_keeps_light_selections_whole():
+    selection = {"rcsb_id": [None, {}], "a": [None, {}], "b": [None, {}]}
+    parts = split_selection(selection, estimate({"a": 10, "b": 10}), min_batch=1, max_bytes=100)
+    assert parts == [(52, selection)]
+
+
+def test_a_field_too_heavy_alone_gets_its_own_part():
+    selection = {"a": [None, {}], "b": [None, {}]}
+    parts = split_selection(selection, estimate({"a": 500, "b": 10}), min_batch=1, max_bytes=100)
+    assert [set(part) for _, part in parts] == [{"a"}, {"b"}]
+
+
+def test_split_queries_merge_into_the_unsplit_entry():
+    inputs = ["1abc", "2def", "3ghi", "4jkl"]
+    set_size_history(seeded_history(heavy_query()))
+
+    split_session = SelectionSession()
+    split = heavy_query().process(inputs, lambda entry: entry, batch_size=2, client=Client(session=split_session))
+    whole_session = SelectionSession()
+    whole = heavy_query().process(inputs, lambda entry: entry, batch_size=2, client=Client(session=whole_session), split=False)
+
+    assert split == whole
+    assert split[0] == {"struct": {"title": "title 1abc"}, "exptl": [{"method": "X-RAY DIFFRACTION"}], "rcsb_entry_info": {"resolution_combined": [2.0]}}
+
+    per_batch = {}
+    for call in split_session.calls:
+        fields = re.findall(r"^    (\w+)", call["query"], re.M)
+        assert "rcsb_id" in fields # each part re-selects rcsb_id to merge on
+        per_batch.setdefault(tuple(call["variables"]["ids"]), []).append(set(fields) - {"rcsb_id"})
+    assert len(per_batch) == 2
+    for parts in per_batch.values():
+        assert len(parts) > 1
+        assert sum(len(part) for part in parts) == len(set().union(*parts)) == 3 # disjoint, complete
+    assert len(whole_session.calls) == 2
@@ -0,0 +1,92 @@
+from rcsb import Client, RetryPolicy
+from rcsb.data import QueryBuilder
+
+from conftest import FakeResponse, FakeSession
+
+INPUTS = ["1abc", "X001", "2def", "3ghi", "4jkl"] # IDs starting with X come back null
+
+
+def entries_query():
+    return QueryBuilder().entries(entry_ids="$ids").rcsb_id.struct.title.end.end
+
+
+def parse(entry, pdb_id=None):
+    return None if entry is None else (entry["rcsb_id"], pdb_id)
+
+
+def payload(ids):
+    return {"data": {"entries": [
+        None if i.startswith("X") else {"rcsb_id": i.upper(), "struct": {"title": i}} for i in ids
+    ]}}
+
+
+def run(session, **kwargs):
+    client = Client(session=session, retry=RetryPolicy(max_attempts=3, backoff=0))
+    kwargs.setdefault("on_missing", lambda ids: None)
+    return entries_query().process(INPUTS, parse, batch_size=2, client=client, iter_kwargs={"pdb_id": INPUTS}, **kwargs)
+
+
+def test_streamed_results_match_buffered():
+    buffered = run(FakeSession())
+    streamed = run(FakeSession(), stream=True)
+    assert streamed == buffered == [("1ABC", "1abc"), None, ("2DEF", "2def"), ("3GHI", "3ghi"), ("4JKL", "4jkl")]
+
+
+def test_streamed_entries_are_matched_on_rcsb_id():
+    def shuffled(ids, call):
+        body = payload(ids)
+        body["data"]["entries"].reverse()
+        return body
+
+    missing = []
+    results = run(FakeSession(shuffled), stream=True, on_missing=missing.extend)
+    assert results == [("1ABC", "1abc"), None, ("2DEF", "2def"), ("3GHI", "3ghi"), ("4JKL", "4jkl")]
+    assert missing == ["X001"]
+
+
+def test_streamed_keep_missing_false():
+    results = run(FakeSession(), stream=True, keep_missing=False)
+    assert results == [("1ABC", "1abc"), ("2DEF", "2def"), ("3GHI", "3ghi"), ("4JKL", "4jkl")]
+
+
+def test_broken_stream_is_retried_without_repeating_func():
+    seen = []
+
+    def parse_once(entry, pdb_id=None):
+        seen.append(pdb_id)
+        return parse(entry, pdb_id)
+
+    def break_first(ids, call):
+        if ids == ["2def", "3ghi"] and not broken:
+            broken.append(call)
+            return FakeResponse(payload(ids), chunk_size=8, fail_after=80) # after the first entry
+        if ids == ["2def", "3ghi"]:
+            retried_after.extend(seen)
+        return None
+
+    broken = []
+    retried_after = []
+    session = FakeSession(break_first)
+    client = Client(session=session, retry=RetryPolicy(max_attempts=3, backoff=0))
+    results = entries_query().process(
+        INPUTS, parse_once, batch_size=2, client=client, iter_kwargs={"pdb_id": INPUTS},
+        on_missing=lambda ids: None, stream=True,
+    )
+    assert results == [("1ABC", "1abc"), None, ("2DEF", "2def"), ("3GHI", "3ghi"), ("4JKL", "4jkl")]
+    assert len(broken) == 1 and len(session.calls) == 4
+    assert "2def" in retried_after # func ran on it during the broken attempt
+    assert sorted(seen, key=str) == sorted(INPUTS, key=str)
+
+
+def test_broken_stream_goes_to_on_error_once_retries_run_out():
+    def always_break(ids, call):
+        if ids == ["2def", "3ghi"]:
+            return FakeResponse(payload(ids), chunk_size=8, fail_after=80)
+        return None
+
+    errors = []
+    session = FakeSession(always_break)
+    results = run(session, stream=True, on_error=lambda failed, e: errors.append((failed, type(e).__name__)))
+    assert results == [("1ABC", "1abc"), None, ("4JKL", "4jkl")]
+    assert errors == [(["2def", "3ghi"], "ChunkedEncodingError")]
+    assert len(session.calls) == 2 + 3 # the broken batch is sent 3 times
@@ -0,0 +1,102 @@
+import pytest
+
+from rcsb import _data_schema
+from rcsb._node import RCSB_ARGUMENT_TYPES, QueryNode, ScalarNode
+from rcsb._validation import _fields
+from rcsb.data import QueryBuilder
+
+
+def errors_of(query) -> str:
+    with pytest.raises(ValueError) as info:
+        query.render()
+    return str(info.value)
+
+
+def test_unknown_field_with_suggestion():
+    query = QueryBuilder().entry(entry_id="4HHB")
+    query._enter("strcut", ScalarNode)
+    assert "entry.strcut: unknown field on CoreEntry (did you mean 'struct'?)" in errors_of(query)
+
+
+def test_unknown_argument_with_suggestion():
+    query = QueryBuilder().entry(entry_id="4HHB", entry_di="x").rcsb_id
+    assert "entry: unknown argument 'entry_di' (did you mean 'entry_id'?)" in errors_of(query)
+
+
+def test_wrong_literal_type():
+    query = QueryBuilder().entry(entry_id=4).rcsb_id
+    assert "entry: argument 'entry_id' expects String!, got 4" in errors_of(query)
+    query = QueryBuilder().pubmed(pubmed_id="123").rcsb_id
+    assert "pubmed: argument 'pubmed_id' expects Int!, got '123'" in errors_of(query)
+
+
+def test_missing_required_argument():
+    query = QueryBuilder().entry().rcsb_id
+    assert "entry: missing required argument 'entry_id: String!'" in errors_of(query)
+
+
+def test_mismatched_variable_type():
+    # `$id` is declared once, from the last root field that uses it.
+    root = QueryBuilder()
+    root.entries(entry_ids="$id").rcsb_id
+    root.entry(entry_id="$id").rcsb_id
+    assert "entries: variable $id is declared as String! but 'entry_ids' expects [String!]!" in errors_of(root)
+
+
+def test_object_field_without_subfields():
+    query = QueryBuilder().entry(entry_id="4HHB").struct.end
+    assert "entry.struct: object field Struct needs at least one subfield" in errors_of(query)
+
+
+def test_ghost_nodes_are_reported_where_they_are_empty():
+    query = QueryBuilder().entry(entry_id="4HHB").rcsb_id.polymer_entities.entity_poly.end.end
+    message = errors_of(query)
+    assert "entry.polymer_entities.entity_poly: object field EntityPoly needs at least one subfield" in message
+    assert message.count("\n  - ") == 1
+    query.polymer_entities.entity_poly.type
+    assert "entity_poly {" in query.render()
+
+
+def test_scalar_with_subfields():
+    query = QueryBuilder().entry(entry_id="4HHB")
+    query._enter("rcsb_id", QueryNode)._enter("x", ScalarNode)
+    assert "entry.rcsb_id: scalar field cannot have subfields" in errors_of(query)
+
+
+def test_every_problem_is_listed():
+    query = QueryBuilder().entry(entry_id=4)
+    query._enter("strcut", ScalarNode)
+    query.struct
+    message = errors_of(query)
+    assert message.count("\n  - ") == 3
+
+
+def test_nested_arguments(monkeypatch):
+    query = QueryBuilder().entry(entry_id="4HHB").struct.title.end
+    query.struct._arguments = {"lang": "en"}
+    assert "entry.struct: unknown argument 'lang'" in errors_of(query)
+
+    # The bundled schema has no nested arguments; add one to check their types.
+    nested = {**_data_schema.ARGUMENTS, "CoreEntry": {"struct": {"lang": ("String", False)}}}
+    monkeypatch.setattr(_data_schema, "ARGUMENTS", nested)
+    query.struct._arguments = {"lang": 1}
+    assert "entry.struct: argument 'lang' expects String, got 1" in errors_of(query)
+    query.struct._arguments = {"lang": "$lang"}
+    assert "entry.struct: variable $lang is not declared" in errors_of(query)
+    query.struct._arguments = {"lang": "en"}
+    query._root._version += 1
+    assert "struct(lang: \"en\")" in query.render()
+
+
+@pytest.mark.parametrize("root_name", sorted(RCSB_ARGUMENT_TYPES))
+def test_every_root_renders(root_name):
+    root = QueryNode()
+    arguments = {arg: f"${arg}" for arg in RCSB_ARGUMENT_TYPES[root_name]}
+    node = root._enter(root_name, QueryNode, **arguments)
+    target = _data_schema.TYPES["Query"][1]
+    target = next(f_target for f_name, f_target, _, _ in target if f_name == root_name)
+    scalar = next(name for name, field_target in _fields(target).items() if field_target is None)
+    node._enter(scalar, ScalarNode)
+    rendered = root.render()
+    for arg, gql_type in RCSB_ARGUMENT_TYPES[root_name].items():
+        assert f"${arg}: {gql_type}" in rendered